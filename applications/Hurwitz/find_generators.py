@@ -16,6 +16,7 @@ except (ImportError, ModuleNotFoundError):
     sys.path.append(os.path.join('..', '..', 'src'))
     import mmgroup
     from mmgroup import Xsp2_Co1, MMV, MM0, MM
+from mmgroup.structures.construct_mm import write_mm_words
   
 sys.path.append(r".")
 
@@ -27,6 +28,8 @@ NPROCESSES = os.cpu_count() - 2
 
 
 ORDER7_FILENAME = "Hurwitz_order7.txt"
+# Pairs (g3, ge) found are stored in binary format in this file
+ORDER7_WORDS_FILENAME = "Hurwitz_order7.bin"
 
 
 def find_type_3B():
@@ -71,9 +74,11 @@ def display_mm_rand_data():
 
 
 def mm_rand_collect(n = 1000):
+    from mmgroup.structures.mm_order import check_mm_order_many
     a = np.zeros(120, dtype = np.uint32)
-    for i in range(n):
-        a[mm_rand().order()] += 1
+    g_list = [MM(mm_rand()) for i in range(n)]
+    for o in check_mm_order_many(g_list, mode = 1, nthreads = 0):
+        a[o] += 1
     return a
 
 #print(mm_rand_collect().reshape((-1,10)))
@@ -107,7 +112,7 @@ def find_elem(ntrials, order = 7, quality = 6, verbose = 0):
                  print("g3 =", g3)
                  print("ge =", ge)
                  print("z * g3**ge has order", oorder)
-             data.append((str(g3), str(ge), order))
+             data.append((g3, ge, order))
     t = time.process_time() - t0
     if verbose:
         print("Run time per case is %.3f ms" % (t1 * 1000 / ntrials))
@@ -149,11 +154,9 @@ def mp_find_elem(
     print("# Time: ", now_, ", duration %.2f seconds" % t, file = f )
     print("# %d cases tested, %d cases found" % 
          (total_trials, len(results)), file= f )
-    for g3, ge, o in results:
-        print("g3 ='%s'" % g3, file = f)
-        print("ge ='%s'" % ge, file = f)
-        print("order =", o, file = f)
     f.close()
+    words = [g for g3, ge, o in results if o == 7 for g in (g3, ge)]
+    write_mm_words(ORDER7_WORDS_FILENAME, words, append = True)
     return results
 
 
@@ -1,9 +1,12 @@
 import sys
+import os
 import re
 import argparse
 
 sys.path.append(r".")
-from find_generators import ORDER7_FILENAME
+from find_generators import ORDER7_FILENAME, ORDER7_WORDS_FILENAME
+from find_generators import MM0
+from mmgroup.structures.construct_mm import iter_read_mm_words
 from check import HurwitzVerifyer
 
 HURWITZ_MONSTER_FILENAME = "hurwitz_monster_samples.py"
@@ -55,6 +58,22 @@ def parse_order7_datafile(filename, verbose = 0):
     return data, n_cases
 
 
+def read_order7_words(filename, verbose = 0):
+    """Read pairs (g3, ge) written by find_generators.py in binary format
+
+    Older versions of find_generators.py have written these pairs to
+    the text file read by function ``parse_order7_datafile``.
+    """
+    if not os.path.isfile(filename):
+        return []
+    print("Reading data from file %s..." % filename)
+    words = list(iter_read_mm_words(MM0, filename))
+    data = list(zip(words[0::2], words[1::2]))
+    if verbose:
+        print(len(data), "pairs found")
+    return data
+
+
 
 HURWITZ_MONSTER_FILENAME_HEADER = (
 """# This file has been generated automatically, do not change!
@@ -131,6 +150,12 @@ sets of generators of the Monster as a Hurwitz group to file %s.
                        default=ORDER7_FILENAME,
                        nargs='?',
                        help=help_input % ORDER7_FILENAME )
+    help_words = "Name of binary input file, default is '%s'"
+    parser.add_argument('--words',
+                       metavar='WordsFile',
+                       type=str,
+                       default=ORDER7_WORDS_FILENAME,
+                       help=help_words % ORDER7_WORDS_FILENAME )
     parser.add_argument("-v",  dest="verbose", action="store_true",
         help="Verbose operation" )
     return parser
@@ -143,6 +168,7 @@ if __name__ == "__main__":
     in_file =  args.InputFile
     #print(verbose, in_file)
     data, n_cases = parse_order7_datafile(in_file, verbose = 0)
+    data += read_order7_words(args.words, verbose = verbose)
     write_Hurwitz_Monster_datafile(data, n_cases, verbose = verbose)
 
 
@@ -54,7 +54,9 @@ and :math:`g_e` in a file for further processing.
 
 The python script ``find_generators.py`` searches for pairs
 :math:`(a, b)` as above, and stores the corresponding elements  
-:math:`g_3, g_e` in file ``Hurwitz_order7.txt``.
+:math:`g_3, g_e` in binary format in file ``Hurwitz_order7.bin``.
+Statistics about the search are written to file
+``Hurwitz_order7.txt``.
 Here for checking the order of :math:`a b` we simply check
 that :math:`v \cdot (a b)^7 = v` for a random vector :math:`v`
 in the 196883-dimensional representation of the Monster
@@ -95,9 +97,10 @@ generate the Monster then we can effectively find integers
 :math:`n_1, n_2` such that :math:`H(a, b, n_1)` has order 94
 and :math:`H(a, b, n_2)`  has order 41, 59, or 71.
 
-The script ``parse_found.py`` reads the file ``Hurwitz_order7.txt`` 
-discussed in the previous section and checks if pair of candidates 
-in that file actually generates the Monster. If this is the case 
+The script ``parse_found.py`` reads the files ``Hurwitz_order7.txt``
+and ``Hurwitz_order7.bin`` discussed in the previous section and 
+checks if pair of candidates in these files actually generates 
+the Monster. If this is the case 
 for a pair then it stores that pair plus a certificate for that
 pair in a list in file ``hurwitz_monster_samples.py``. 
 Computing such a certificate take a few minutes for a pair
@@ -74,7 +74,7 @@ SIMPLE_SKE_FILES = ["qstate12", "qstate12io", "qmatrix12"]
 PXI_SKE_FILES = [
     "bitmatrix64",  "uint_sort", "xsp2co1", 
     "leech3matrix", "xsp2co1_elem",
-    "involutions", "xsp2co1_traces",
+    "involutions", "xsp2co1_traces", "xsp2co1_array",
 ]
 SKE_FILES = SIMPLE_SKE_FILES + PXI_SKE_FILES
 
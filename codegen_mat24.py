@@ -158,6 +158,7 @@ GENERATORS_C_FILES = [
     "gen_leech3",
     "gen_leech_reduce",
     "gen_leech_reduce_n",
+    "gen_leech_array",
     "gen_random",
 ]
 
@@ -171,6 +171,7 @@ C_BASICS_SKELETONS = [
    "mm_group_word",
    "mm_tables_xi",
    "mm_crt",
+   "mm_sparse_vector",
 ]
 
 
@@ -100,6 +100,7 @@ C_REDUCE_SKELETONS = [
    "mm_suborbit",
    "mm_shorten",
    "mm_vector_v1_mod3",
+   "mm_crt_op",
  
 ]
 
@@ -262,7 +263,8 @@ def make_reduce():
     tg.generate_pxd(
         os.path.join(PXD_DIR, pxd_file), 
         h_file, 
-        PXD_DECLARATIONS
+        PXD_DECLARATIONS,
+        nogil = True
     )
     return c_files,  [ pxd_file ]
 
@@ -298,7 +300,8 @@ def generate_files():
         pxi_content = pxd_to_pyx(
             os.path.join(PXD_DIR, pxd_f),
             os.path.split(pxd_f)[0],
-            select = True
+            select = True,
+            nogil = True
         )
         print(pxi_content, file = f_pxi)
     f_pxi.close()
@@ -9,6 +9,14 @@ from collections import defaultdict
 # Set NATIVE = False for a generic version
 NATIVE = False
 
+###############################################################################
+# Set OPENMP = True for a version where the operation of the monster on
+# a vector is split into several threads using OpenMP. The number of
+# threads is set at run time by function mm_aux_set_num_threads() in
+# module mmgroup.mm. This may also be achieved with the global option
+# '--openmp' in setup.py.
+OPENMP = False
+
 ###############################################################################
 # Bit length of an integer used in the representation of the monster 
 # This should be 32 for a 32-bit and 64 for a 64-bit system.
@@ -56,11 +64,27 @@ EXTRA_LINK_ARGS = defaultdict(list)
 
 
 unix_link_args = ["-static-libgcc"]
+mingw32_link_args = []
 
 EXTRA_LINK_ARGS.update({
     'unix' : unix_link_args,
+    'mingw32' : mingw32_link_args,
 })
 
+
+def enable_openmp():
+    """Add compile and link arguments for OpenMP to the arguments above"""
+    for compiler, arg in [
+         ('mingw32', "-fopenmp"), ('unix', "-fopenmp"), ('msvc', "/openmp")
+        ]:
+        if not arg in EXTRA_COMPILE_ARGS[compiler]:
+            EXTRA_COMPILE_ARGS[compiler].append(arg)
+            if compiler != 'msvc':
+                EXTRA_LINK_ARGS[compiler].append(arg)
+
+if OPENMP:
+    enable_openmp()
+
 ###############################################################################
 # Directories
 
@@ -62,15 +62,20 @@ PRIMES = PRIMES[:]
 # Parse a global option '--stage=i" and set variable ``STAGE``
 # to the integer value i if such an option is present.
 # Parse a global option "--p=p1,p2,..." to a list PRIMES=[p1,p2,...]
+# A global option "--openmp" enables OpenMP, see variable OPENMP in
+# module config.py.
 for i, s in enumerate(sys.argv[1:]):
     if s.startswith("--stage="):
         STAGE = int(s[8:])
         sys.argv[i+1] = None
-    if s.startswith("--p="):
+    elif s.startswith("--p="):
         PRIMES = list(set(map(int, s[4:].split(","))) | set([3,15]))
         PRIMES.sort()
         sys.argv[i+1] = None
-    elif s[:1].isalpha:
+    elif s == "--openmp":
+        config.enable_openmp()
+        sys.argv[i+1] = None
+    else:
         break
 while None in sys.argv: 
     sys.argv.remove(None)
@@ -257,6 +262,7 @@ mat24_shared = SharedExtension(
         os.path.join(C_DIR, "gen_leech3.c"),
         os.path.join(C_DIR, "gen_leech_reduce.c"),
         os.path.join(C_DIR, "gen_leech_reduce_n.c"),
+        os.path.join(C_DIR, "gen_leech_array.c"),
         os.path.join(C_DIR, "gen_random.c"),
     ],
     libraries = [], 
@@ -280,7 +286,7 @@ shared_libs_before_stage1 = [
 clifford12_sources = [
     "qstate12", "qstate12io", "qmatrix12", "bitmatrix64",  "uint_sort", 
     "xsp2co1",  "leech3matrix", "xsp2co1_elem", "involutions",
-     "xsp2co1_traces",
+     "xsp2co1_traces", "xsp2co1_array",
 ]
 
 clifford12_shared = SharedExtension(
@@ -360,12 +366,14 @@ mm_shared =  SharedExtension(
     sources=[ os.path.join(C_DIR, f) for f in 
         [ "mm_aux.c",  "mm_group_word.c",
           "mm_tables.c","mm_tables_xi.c", "mm_crt.c",
+          "mm_sparse_vector.c",
         ]
     ],    
     libraries = shared_libs_stage1, 
     include_dirs = [PACKAGE_DIR, C_DIR],
     library_dirs = [PACKAGE_DIR, C_DIR],
     extra_compile_args = EXTRA_COMPILE_ARGS,
+    extra_link_args = EXTRA_LINK_ARGS,
     implib_dir = C_DIR,
     define_macros = [ ("MM_BASICS_DLL_EXPORTS", None)],
 )
@@ -385,12 +393,9 @@ mm_extension = Extension("mmgroup.mm",
     include_dirs = [ C_DIR ],
     library_dirs = [ PACKAGE_DIR, C_DIR ],
     libraries = shared_libs_stage2, 
-            # for openmp add "libgomp" 
     #runtime_library_dirs = ["."],
     extra_compile_args = EXTRA_COMPILE_ARGS, 
-            # for openmp add "-fopenmp" 
     extra_link_args = EXTRA_LINK_ARGS, 
-            # for openmp add "-fopenmp" 
 )
 
 
@@ -454,6 +459,7 @@ for p in PRIMES:
         include_dirs = [PACKAGE_DIR, C_DIR],
         library_dirs = [PACKAGE_DIR, C_DIR],
         extra_compile_args = EXTRA_COMPILE_ARGS,
+        extra_link_args = EXTRA_LINK_ARGS,
         implib_dir = C_DIR,
         define_macros = [ ("MM_OP%s_DLL_EXPORTS" % p, None)],
     )
@@ -467,12 +473,9 @@ for p in PRIMES:
             include_dirs = [ C_DIR ] , 
             library_dirs = [PACKAGE_DIR, C_DIR ],
             libraries = shared_libs_stage2 + [shared.lib_name], 
-                # for openmp add "libgomp" 
             #runtime_library_dirs = ["."],
             extra_compile_args = EXTRA_COMPILE_ARGS, 
-                # for openmp add "-fopenmp" 
             extra_link_args = EXTRA_LINK_ARGS, 
-                # for openmp add "-fopenmp" 
         )
     )
 
@@ -493,7 +496,9 @@ reduce_presteps =  CustomBuildStep("Code generation for modules mm_reduce",
 
 
 shared_libs_stage2_augmented = shared_libs_stage2 + [
-       mm_op_shared[15].lib_name,  mm_op_shared[3].lib_name
+       mm_op_shared[15].lib_name,  mm_op_shared[3].lib_name,
+       mm_op_shared[7].lib_name,  mm_op_shared[31].lib_name,
+       mm_op_shared[127].lib_name,  mm_op_shared[255].lib_name,
 ] if not on_readthedocs else []
 
 
@@ -504,6 +509,7 @@ mm_reduce =  SharedExtension(
     include_dirs = [PACKAGE_DIR, C_DIR],
     library_dirs = [PACKAGE_DIR, C_DIR],
     extra_compile_args = EXTRA_COMPILE_ARGS,
+    extra_link_args = EXTRA_LINK_ARGS,
     implib_dir = C_DIR,
     define_macros = [ ("MM_REDUCE_DLL_EXPORTS", None)],
 )
@@ -522,12 +528,9 @@ mm_reduce_extension = Extension("mmgroup.mm_reduce",
     include_dirs = [ C_DIR ],
     library_dirs = [ PACKAGE_DIR, C_DIR ],
     libraries = shared_libs_stage3, 
-            # for openmp add "libgomp" 
     #runtime_library_dirs = ["."],
     extra_compile_args = EXTRA_COMPILE_ARGS, 
-            # for openmp add "-fopenmp" 
     extra_link_args = EXTRA_LINK_ARGS, 
-            # for openmp add "-fopenmp" 
 )
 
 
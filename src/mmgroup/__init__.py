@@ -87,8 +87,15 @@ except:
     w = "Extension mmgroup.mm3 not found, package not functional!"
     warnings.warn(w, UserWarning)
 
+try:
+    from mmgroup.structures.mm_workspace import Workspace
+except:
+    w = "Module 'mmgroup.structures.mm_workspace' not found!"
+    warnings.warn(w, UserWarning)
+
 try:
     from mmgroup.structures.xsp2_co1 import Xsp2_Co1
+    from mmgroup.structures.xsp2_co1_array import Xsp2_Co1Array
 except:
     w = "Module 'mmgroup.structures.xsp2_co1' not found!"
     warnings.warn(w, UserWarning)
@@ -100,3 +107,8 @@ except:
     pass
 
 
+
+try:
+    from mmgroup.mm_sparse_space import  SparseMMVector, SparseMMV
+except:
+    pass
@@ -0,0 +1,312 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+/** @file gen_leech_array.c
+The functions in file ``gen_leech_array.c`` are array versions of
+some functions dealing with vectors in the Leech lattice modulo 2
+and modulo 3, and with elements of the group \f$Q_{x0}\f$. They
+are implemented in files ``gen_leech.c``, ``gen_leech_type.c``,
+and ``gen_leech3.c``.
+
+Each function in this file applies the corresponding function to
+all entries of an input array of length \f$n\f$ and stores the
+results in an output array of length \f$n\f$. So it performs
+the same operation as a numpy ufunc; but the caller has to provide
+the output array. The output array may be equal to (one of) the
+input array(s), provided that both arrays have the same type.
+Unless stated otherwise, the functions return \f$n\f$.
+
+We use the terminology defined in the
+document *The C interface of the mmgroup project*,
+section *Description of the mmgroup.generators extension*.
+*/
+
+
+/*************************************************************************
+** External references
+*************************************************************************/
+
+/// @cond DO_NOT_DOCUMENT
+#include <string.h>
+#include "mat24_functions.h"
+#define MMGROUP_GENERATORS_INTERN
+#include "mmgroup_generators.h"
+/// @endcond
+
+
+
+
+// %%EXPORT_KWD MAT24_API
+
+
+// %%GEN ch
+#ifdef __cplusplus
+extern "C" {
+#endif
+// %%GEN c
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+
+/*************************************************************************
+*** Types of vectors in the Leech lattice mod 2
+*************************************************************************/
+
+
+/**
+  @brief Array version of function ``gen_leech2_type``
+
+  Let \f$a\f$ be an array of \f$n\f$ vectors in the Leech lattice
+  mod 2 in Leech lattice encoding. The function stores the type
+  of the vector \f$a_i\f$ in entry \f$t_i\f$ of the array \f$t\f$,
+  as computed by function ``gen_leech2_type``.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech2_type_array(uint32_t *a, uint32_t n, uint8_t *t)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) t[i] = (uint8_t)gen_leech2_type(a[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech2_subtype``
+
+  Let \f$a\f$ be an array of \f$n\f$ vectors in the Leech lattice
+  mod 2 in Leech lattice encoding. The function stores the subtype
+  of the vector \f$a_i\f$ in entry \f$t_i\f$ of the array \f$t\f$,
+  as computed by function ``gen_leech2_subtype``.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech2_subtype_array(uint32_t *a, uint32_t n, uint8_t *t)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) t[i] = (uint8_t)gen_leech2_subtype(a[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech2_type2``
+
+  Let \f$a\f$ be an array of \f$n\f$ vectors in the Leech lattice
+  mod 2 in Leech lattice encoding. The function stores the value
+  ``gen_leech2_type2(a[i])`` in entry \f$t_i\f$ of the
+  array \f$t\f$. So \f$t_i\f$ is the subtype of \f$a_i\f$ if
+  \f$a_i\f$ is of type 2 and 0 otherwise.
+
+  The function returns the number of vectors of type 2 in the
+  array \f$a\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech2_type2_array(uint32_t *a, uint32_t n, uint8_t *t)
+{
+    uint_fast32_t i, count = 0;
+    for (i = 0; i < n; ++i) {
+        t[i] = (uint8_t)gen_leech2_type2(a[i]);
+        count += t[i] != 0;
+    }
+    return count;
+}
+
+
+
+/*************************************************************************
+*** Operations in the group Q_x0
+*************************************************************************/
+
+
+/**
+  @brief Array version of function ``gen_leech2_mul``
+
+  Let \f$a, b\f$ be arrays of \f$n\f$ elements of the group
+  \f$Q_{x0}\f$ in Leech lattice encoding. The function stores the
+  product \f$a_i \cdot b_i\f$ in entry \f$c_i\f$ of the
+  array \f$c\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech2_mul_array(uint32_t *a, uint32_t *b, uint32_t n, uint32_t *c)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) c[i] = gen_leech2_mul(a[i], b[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech2_scalprod``
+
+  Let \f$a, b\f$ be arrays of \f$n\f$ vectors in the Leech lattice
+  mod 2 in Leech lattice encoding. The function stores the scalar
+  product of \f$a_i\f$ and \f$b_i\f$ in entry \f$c_i\f$ of the
+  array \f$c\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech2_scalprod_array(uint32_t *a, uint32_t *b, uint32_t n, uint8_t *c)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) c[i] = (uint8_t)gen_leech2_scalprod(a[i], b[i]);
+    return n;
+}
+
+
+
+/*************************************************************************
+*** Conversion between the Leech lattice mod 2 and mod 3
+*************************************************************************/
+
+
+/**
+  @brief Array version of function ``gen_leech2to3_short``
+
+  Let \f$a\f$ be an array of \f$n\f$ vectors in the Leech lattice
+  mod 2 in Leech lattice encoding. The function stores the value
+  ``gen_leech2to3_short(a[i])`` in entry \f$b_i\f$ of the
+  array \f$b\f$. That value is in Leech lattice mod 3 encoding;
+  it is 0 if \f$a_i\f$ is not short.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech2to3_short_array(uint32_t *a, uint32_t n, uint64_t *b)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) b[i] = gen_leech2to3_short(a[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech3to2_short``
+
+  Let \f$a\f$ be an array of \f$n\f$ vectors in the Leech lattice
+  mod 3 in Leech lattice mod 3 encoding. The function stores the
+  value ``gen_leech3to2_short(a[i])`` in entry \f$b_i\f$ of the
+  array \f$b\f$. That value is in Leech lattice encoding; it is 0
+  if \f$a_i\f$ is not short.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech3to2_short_array(uint64_t *a, uint32_t n, uint32_t *b)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) b[i] = (uint32_t)gen_leech3to2_short(a[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech3to2_type3``
+
+  Same as function ``gen_leech3to2_short_array``, but applying
+  function ``gen_leech3to2_type3`` to the entries
+  of array \f$a\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech3to2_type3_array(uint64_t *a, uint32_t n, uint32_t *b)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) b[i] = (uint32_t)gen_leech3to2_type3(a[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech3to2_type4``
+
+  Same as function ``gen_leech3to2_short_array``, but applying
+  function ``gen_leech3to2_type4`` to the entries
+  of array \f$a\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech3to2_type4_array(uint64_t *a, uint32_t n, uint32_t *b)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) b[i] = (uint32_t)gen_leech3to2_type4(a[i]);
+    return n;
+}
+
+
+
+/*************************************************************************
+*** Operations in the Leech lattice mod 3
+*************************************************************************/
+
+
+/**
+  @brief Array version of function ``gen_leech3_add``
+
+  Let \f$a, b\f$ be arrays of \f$n\f$ vectors in the Leech lattice
+  mod 3 in Leech lattice mod 3 encoding. The function stores the
+  sum \f$a_i + b_i\f$ in entry \f$c_i\f$ of the array \f$c\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech3_add_array(uint64_t *a, uint64_t *b, uint32_t n, uint64_t *c)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) c[i] = gen_leech3_add(a[i], b[i]);
+    return n;
+}
+
+
+/**
+  @brief Array version of function ``gen_leech3_scalprod``
+
+  Let \f$a, b\f$ be arrays of \f$n\f$ vectors in the Leech lattice
+  mod 3 in Leech lattice mod 3 encoding. The function stores the
+  scalar product of \f$a_i\f$ and \f$b_i\f$ (modulo 3) in
+  entry \f$c_i\f$ of the array \f$c\f$.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech3_scalprod_array(uint64_t *a, uint64_t *b, uint32_t n, uint8_t *c)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) c[i] = (uint8_t)gen_leech3_scalprod(a[i], b[i]);
+    return n;
+}
+
+
+/**
+  @brief Operation of a word of generators on many vectors mod 3
+
+  Let \f$a\f$ be an array of \f$n\f$ vectors in the Leech lattice
+  mod 3 in Leech lattice mod 3 encoding. The function replaces each
+  entry \f$a_i\f$ of \f$a\f$ by ``gen_leech3_op_vector_word(a[i], g, len_g)``.
+  Here ``g`` is a word of generators of the group \f$G_{x0}\f$
+  of length ``len_g`` as in function ``gen_leech3_op_vector_word``.
+  This is the analogue of function ``gen_leech2_op_word_many`` for
+  the Leech lattice mod 3.
+*/
+// %%EXPORT px
+MAT24_API
+uint32_t gen_leech3_op_vector_word_many(uint64_t *a, uint32_t n, uint32_t *g, uint32_t len_g)
+{
+    uint_fast32_t i;
+    for (i = 0; i < n; ++i) a[i] = gen_leech3_op_vector_word(a[i], g, len_g);
+    return n;
+}
+
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+
+// %%GEN ch
+#ifdef __cplusplus
+}
+#endif
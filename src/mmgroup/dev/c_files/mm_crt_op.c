@@ -0,0 +1,112 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+/** @file mm_crt_op.c
+
+ File ``mm_crt_op.c`` contains functions for the operation of the
+ monster group on a tuple of vectors of the representation of the
+ monster modulo 7, 31, 127, and 255. Such a tuple of vectors
+ represents a vector in the real representation of the monster
+ via Chinese remaindering, as in class ``MMVectorCRT`` in
+ module ``mmgroup.mm_crt_space``.
+*/
+
+/// @cond DO_NOT_DOCUMENT
+#include <string.h>
+#include "mat24_functions.h"
+#include "mmgroup_generators.h"
+#include "mm_basics.h"
+#include "mm_op7.h"
+#include "mm_op31.h"
+#include "mm_op127.h"
+#include "mm_op255.h"
+#include "mm_reduce.h"
+/// @endcond
+
+
+// %%EXPORT_KWD MM_REDUCE_API
+
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+/// @cond DO_NOT_DOCUMENT
+
+// Apply the word w of generators of the monster of length n to
+// the vectors v[0],...,v[3] modulo 7, 31, 127, 255. If ``check``
+// is nonzero then check the vectors for underflow before applying
+// the first generator in the word, using function mm_crt_check_g.
+// Return 0 in case of success, -1 in case of underflow, and the
+// (positive) error code of function mm_op<p>_word in case of
+// an error in that function.
+static int32_t crt_op_word(uint_mmv_t **v, uint32_t *w, uint32_t n, uint32_t check, uint_mmv_t *work)
+{
+    int32_t res;
+    if (n == 0) return 0;
+    if (check && mm_crt_check_g(w[0], v[0], v[1], v[2], v[3])) return -1;
+    if ((res = mm_op7_word(v[0], w, n, 1, work)) != 0) return res;
+    if ((res = mm_op31_word(v[1], w, n, 1, work)) != 0) return res;
+    if ((res = mm_op127_word(v[2], w, n, 1, work)) != 0) return res;
+    return mm_op255_word(v[3], w, n, 1, work);
+}
+
+/// @endcond
+
+
+/**
+ @brief Apply a word of generators to a vector in CRT representation
+
+ Let \f$v\f$ be a vector in the real representation of the monster,
+ given by the vectors ``v7, v31, v127, v255`` of the representation
+ of the monster modulo 7, 31, 127, and 255. The function replaces
+ \f$v\f$ by \f$v \cdot g\f$, where \f$g\f$ is the element of the
+ monster given by the word ``g`` of generators of length ``len_g``.
+ Words of generators of the monster are implemented as described
+ in file ``mmgroup_generators.h``.
+
+ The word ``g`` is split into words of generators of the
+ subgroup \f$N_0\f$ and powers of the triality element \f$\xi\f$.
+ These parts are applied to all four vectors, one after the other.
+ If ``check`` is nonzero then before applying each part we check
+ that no precision is lost due to underflow, using
+ function ``mm_crt_check_g`` in file ``mm_crt.c``.
+
+ The buffer ``work`` must have the same size as a vector of the
+ representation of the monster modulo 255.
+
+ The function returns 0 in case of success and -1 in case of
+ underflow. Any other nonzero return value indicates an error in
+ one of the functions ``mm_op<p>_word``. In case of an error
+ the vectors ``v7, v31, v127, v255`` are undefined.
+*/
+// %%EXPORT px
+MM_REDUCE_API
+int32_t mm_crt_op_word(uint_mmv_t *v7, uint_mmv_t *v31, uint_mmv_t *v127, uint_mmv_t *v255, uint32_t *g, uint32_t len_g, uint32_t check, uint_mmv_t *work)
+{
+    uint_mmv_t *v[4];
+    uint32_t nn[5], nnw[5], i, length;
+    int32_t res;
+    v[0] = v7; v[1] = v31; v[2] = v127; v[3] = v255;
+    while (len_g) {
+        mm_group_n_clear(nn);
+        i = mm_group_n_mul_word_scan(nn, g, len_g);
+        length = mm_group_n_to_word(nn, nnw);
+        if ((res = crt_op_word(v, nnw, length, check, work)) != 0)
+            return res;
+        g += i; len_g -= i;
+        if (len_g) {
+            if ((res = crt_op_word(v, g, 1, check, work)) != 0)
+                return res;
+            ++g; --len_g;
+        }
+    }
+    return 0;
+}
+
+
+//  %%GEN h
+//  %%GEN c
+
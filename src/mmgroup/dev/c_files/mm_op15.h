@@ -0,0 +1,211 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C header file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+// This header has been created automatically, do not edit!
+
+#ifndef MM_OP15_H
+#define MM_OP15_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include "mm_basics.h"
+
+
+
+
+/** @file mm_op15.h
+
+ The header file ``mm_op15.h`` contains basic definitions for the
+ C files dealing with  vectors of the 198884-dimensional representation
+ of the monster group modulo 15,
+ as described in  *The C interface of the mmgroup project*,
+ section *Description of the mmgroup.mm extension*.
+
+
+ The header file also contains prototypes for the C files in
+ the ``mm15`` extension.  This  extension comprises the
+ files ``mm15_op_misc.c``, ``mm15_op_pi.c``, ``mm15_op_t.c``,
+ ``mm15_op_word.c``, ``mm15_op_xi.c``, ``mm15_op_xy.c``.
+
+ For characteristic p = 15 this includes also the files
+ ``mm15_op_rank_A.c``, 
+ ``mm15_op_eval_A.c``, ``mm15_op_eval_X.c``,
+
+*/
+
+/// @cond DO_NOT_DOCUMENT 
+
+
+#define MM_OP15_DLL  // We want a DLL!!
+
+
+// Generic helper definitions for shared library support
+#if defined _WIN32 || defined __CYGWIN__
+  #define MM_OP15_HELPER_DLL_IMPORT __declspec(dllimport)
+  #define MM_OP15_HELPER_DLL_EXPORT __declspec(dllexport)
+  #define MM_OP15_HELPER_DLL_LOCAL
+#else
+  #if __GNUC__ >= 4
+    #define MM_OP15_HELPER_DLL_IMPORT __attribute__ ((visibility ("default")))
+    #define MM_OP15_HELPER_DLL_EXPORT __attribute__ ((visibility ("default")))
+    #define MM_OP15_HELPER_DLL_LOCAL  __attribute__ ((visibility ("hidden")))
+  #else
+    #define MM_OP15_HELPER_DLL_IMPORT
+    #define MM_OP15_HELPER_DLL_EXPORT
+    #define MM_OP15_HELPER_DLL_LOCAL
+  #endif
+#endif
+
+
+// Now we use the generic helper definitions above to define MM_OP15_API 
+// and MM_OP15_LOCAL.
+// MM_OP15_API is used for the public API symbols. It either DLL imports 
+// or DLL exports (or does nothing for static build). 
+// MM_OP15_LOCAL is used for non-api symbols.
+
+#ifdef MM_OP15_DLL // defined if MM_BASICS is compiled as a DLL
+  #ifdef MM_OP15_DLL_EXPORTS // defined if we are building the MM_BASICS DLL 
+                           // (instead of using it)
+    #define MM_OP15_API MM_OP15_HELPER_DLL_EXPORT
+  #else
+    #define MM_OP15_API MM_OP15_HELPER_DLL_IMPORT
+  #endif // MM_OP15_DLL_EXPORTS
+  #define MM_OP15_LOCAL MM_OP15_HELPER_DLL_LOCAL
+#else // MM_OP15_DLL is not defined: this means MM_BASICS is a static lib.
+  #define MM_OP15_API
+  #define MM_OP15_LOCAL
+#endif // MM_OP15_DLL
+
+
+
+
+/// @endcond  
+
+
+
+/** 
+  This enumeration contains the  offsets for the tags ``A,B,C,T,X,Z,Y``
+  in a vector in the 196884-dimensional representation of the monster,
+  stored in the internal representation.
+
+  This is similar to enum MM_AUX_OFS in file ``mm_basics.h``. But 
+  here the offsets are given in units of 64-bit integers
+  for a vector of the  representation \f$\rho_{15}\f$ of the
+  monster group in characteristic  15.
+*/
+enum MM_OP15_OFS  {
+ MM_OP15_OFS_A = (MM_AUX_OFS_A >> 4), /**< Offset for tag A */
+ MM_OP15_OFS_B = (MM_AUX_OFS_B >> 4), /**< Offset for tag B */   
+ MM_OP15_OFS_C = (MM_AUX_OFS_C >> 4), /**< Offset for tag C */    
+ MM_OP15_OFS_T = (MM_AUX_OFS_T >> 4), /**< Offset for tag T */  
+ MM_OP15_OFS_X = (MM_AUX_OFS_X >> 4), /**< Offset for tag X */   
+ MM_OP15_OFS_Z = (MM_AUX_OFS_Z >> 4), /**< Offset for tag Z */   
+ MM_OP15_OFS_Y = (MM_AUX_OFS_Y >> 4), /**< Offset for tag Y */    
+ MM_OP15_LEN_V = (MM_AUX_LEN_V >> 4), /**< Total length of the internal representation */    
+};
+                                  
+
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+void mm_op15_neg_scalprod_d_i(uint_mmv_t* v);
+MM_OP15_API
+void mm_op15_pi(uint_mmv_t *v_in, uint32_t delta, uint32_t pi, uint_mmv_t * v_out);
+MM_OP15_API
+void mm_op15_pi_multi(uint_mmv_t *v_in, uint32_t k, uint32_t delta, uint32_t pi, uint_mmv_t * v_out);
+MM_OP15_API
+void mm_op15_delta(uint_mmv_t *v_in, uint32_t delta, uint_mmv_t * v_out);
+MM_OP15_API
+void mm_op15_pi_tag_ABC(uint_mmv_t *v, uint32_t delta, uint32_t pi, uint32_t mode);
+MM_OP15_API
+void mm_op15_pi_tag_ABC_hash(uint_mmv_t *v, uint32_t delta, uint32_t pi, uint32_t mode, uint64_t *hashes);
+MM_OP15_API
+void mm_op15_delta_tag_ABC(uint_mmv_t *v, uint32_t d, uint32_t mode);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+uint32_t mm_op15_copy(uint_mmv_t *mv1, uint_mmv_t *mv2);
+MM_OP15_API
+uint32_t mm_op15_compare_len(uint_mmv_t *mv1, uint_mmv_t *mv2, uint32_t len);
+MM_OP15_API
+uint32_t mm_op15_compare(uint_mmv_t *mv1, uint_mmv_t *mv2);
+MM_OP15_API
+uint32_t mm_op15_checkzero(uint_mmv_t *mv);
+MM_OP15_API
+void mm_op15_vector_add(uint_mmv_t *mv1, uint_mmv_t *mv2);
+MM_OP15_API
+void mm_op15_scalar_mul(int32_t factor, uint_mmv_t *mv1);
+MM_OP15_API
+uint32_t mm_op15_compare_mod_q(uint_mmv_t *mv1, uint_mmv_t *mv2, uint32_t q);
+MM_OP15_API
+int32_t mm_op15_store_axis(uint32_t x, uint_mmv_t *mv);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+void mm_op15_xy(uint_mmv_t *v_in, uint32_t f, uint32_t e, uint32_t eps, uint_mmv_t *v_out);
+MM_OP15_API
+void mm_op15_xy_multi(uint_mmv_t *v_in, uint32_t k, uint32_t f, uint32_t e, uint32_t eps, uint_mmv_t *v_out);
+MM_OP15_API
+void mm_op15_omega(uint_mmv_t *v, uint32_t d);
+MM_OP15_API
+void mm_op15_xy_tag_ABC(uint_mmv_t *v, uint32_t f, uint32_t e, uint32_t eps, uint32_t mode);
+MM_OP15_API
+void mm_op15_xy_tag_ABC_hash(uint_mmv_t *v, uint32_t f, uint32_t e, uint32_t eps, uint32_t mode, uint64_t *hashes);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+void mm_op15_t(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out);
+MM_OP15_API
+void mm_op15_t_A(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out);
+MM_OP15_API
+void mm_op15_t_ABC(uint_mmv_t *v,  uint32_t exp);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+void mm_op15_xi(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out);
+MM_OP15_API
+void mm_op15_xi_tag_A(uint_mmv_t *v,  uint32_t exp);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+uint32_t mm_op15_word(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e, uint_mmv_t *work);
+MM_OP15_API
+uint32_t mm_op15_word_multi(uint_mmv_t *v, uint32_t k, uint32_t *g, int32_t len_g, int32_t e, uint_mmv_t *work);
+MM_OP15_API
+int32_t mm_op15_word_tag_A(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e);
+MM_OP15_API
+int32_t mm_op15_word_tag_A_hash(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e, uint64_t *hashes);
+MM_OP15_API
+int32_t mm_op15_word_ABC(uint_mmv_t *v, uint32_t *g, int32_t len_g, uint_mmv_t *v_out);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+int32_t mm_op15_load_leech3matrix(uint_mmv_t *v, uint64_t *a);
+MM_OP15_API
+uint64_t  mm_op15_eval_A_rank_mod3(uint_mmv_t *v, uint32_t d);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+int32_t mm_op15_eval_A_aux(uint_mmv_t *v, uint32_t m_and, uint32_t m_xor, uint32_t row);
+MM_OP15_API
+int32_t mm_op15_eval_A(uint64_t *v, uint32_t v2);
+MM_OP15_API
+uint32_t mm_op15_norm_A(uint_mmv_t *v);
+MM_OP15_API
+int32_t  mm_op15_watermark_A(uint_mmv_t *v, uint32_t *w);
+MM_OP15_API
+int32_t mm_op15_watermark_A_perm_num(uint32_t *w, uint_mmv_t *v);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP15_API
+uint32_t mm_op15_eval_X_find_abs(uint_mmv_t *v, uint32_t *p_out, uint32_t n,  uint32_t y0, uint32_t y1);
+MM_OP15_API
+void mm_op15_eval_X_count_abs(uint_mmv_t *v, uint32_t *p_out);
+/// @endcond 
+#ifdef __cplusplus
+}
+#endif
+#endif  // #ifndef MM_OP15_H
+
@@ -0,0 +1,204 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C header file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+// This header has been created automatically, do not edit!
+
+#ifndef MM_OP3_H
+#define MM_OP3_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include "mm_basics.h"
+
+
+
+
+/** @file mm_op3.h
+
+ The header file ``mm_op3.h`` contains basic definitions for the
+ C files dealing with  vectors of the 198884-dimensional representation
+ of the monster group modulo 3,
+ as described in  *The C interface of the mmgroup project*,
+ section *Description of the mmgroup.mm extension*.
+
+
+ The header file also contains prototypes for the C files in
+ the ``mm3`` extension.  This  extension comprises the
+ files ``mm3_op_misc.c``, ``mm3_op_pi.c``, ``mm3_op_t.c``,
+ ``mm3_op_word.c``, ``mm3_op_xi.c``, ``mm3_op_xy.c``.
+
+ For characteristic p = 3 this includes also the files
+ ``mm15_op_rank_A.c``, 
+
+*/
+
+/// @cond DO_NOT_DOCUMENT 
+
+
+#define MM_OP3_DLL  // We want a DLL!!
+
+
+// Generic helper definitions for shared library support
+#if defined _WIN32 || defined __CYGWIN__
+  #define MM_OP3_HELPER_DLL_IMPORT __declspec(dllimport)
+  #define MM_OP3_HELPER_DLL_EXPORT __declspec(dllexport)
+  #define MM_OP3_HELPER_DLL_LOCAL
+#else
+  #if __GNUC__ >= 4
+    #define MM_OP3_HELPER_DLL_IMPORT __attribute__ ((visibility ("default")))
+    #define MM_OP3_HELPER_DLL_EXPORT __attribute__ ((visibility ("default")))
+    #define MM_OP3_HELPER_DLL_LOCAL  __attribute__ ((visibility ("hidden")))
+  #else
+    #define MM_OP3_HELPER_DLL_IMPORT
+    #define MM_OP3_HELPER_DLL_EXPORT
+    #define MM_OP3_HELPER_DLL_LOCAL
+  #endif
+#endif
+
+
+// Now we use the generic helper definitions above to define MM_OP3_API 
+// and MM_OP3_LOCAL.
+// MM_OP3_API is used for the public API symbols. It either DLL imports 
+// or DLL exports (or does nothing for static build). 
+// MM_OP3_LOCAL is used for non-api symbols.
+
+#ifdef MM_OP3_DLL // defined if MM_BASICS is compiled as a DLL
+  #ifdef MM_OP3_DLL_EXPORTS // defined if we are building the MM_BASICS DLL 
+                           // (instead of using it)
+    #define MM_OP3_API MM_OP3_HELPER_DLL_EXPORT
+  #else
+    #define MM_OP3_API MM_OP3_HELPER_DLL_IMPORT
+  #endif // MM_OP3_DLL_EXPORTS
+  #define MM_OP3_LOCAL MM_OP3_HELPER_DLL_LOCAL
+#else // MM_OP3_DLL is not defined: this means MM_BASICS is a static lib.
+  #define MM_OP3_API
+  #define MM_OP3_LOCAL
+#endif // MM_OP3_DLL
+
+
+
+
+/// @endcond  
+
+
+
+/** 
+  This enumeration contains the  offsets for the tags ``A,B,C,T,X,Z,Y``
+  in a vector in the 196884-dimensional representation of the monster,
+  stored in the internal representation.
+
+  This is similar to enum MM_AUX_OFS in file ``mm_basics.h``. But 
+  here the offsets are given in units of 64-bit integers
+  for a vector of the  representation \f$\rho_{3}\f$ of the
+  monster group in characteristic  3.
+*/
+enum MM_OP3_OFS  {
+ MM_OP3_OFS_A = (MM_AUX_OFS_A >> 5), /**< Offset for tag A */
+ MM_OP3_OFS_B = (MM_AUX_OFS_B >> 5), /**< Offset for tag B */   
+ MM_OP3_OFS_C = (MM_AUX_OFS_C >> 5), /**< Offset for tag C */    
+ MM_OP3_OFS_T = (MM_AUX_OFS_T >> 5), /**< Offset for tag T */  
+ MM_OP3_OFS_X = (MM_AUX_OFS_X >> 5), /**< Offset for tag X */   
+ MM_OP3_OFS_Z = (MM_AUX_OFS_Z >> 5), /**< Offset for tag Z */   
+ MM_OP3_OFS_Y = (MM_AUX_OFS_Y >> 5), /**< Offset for tag Y */    
+ MM_OP3_LEN_V = (MM_AUX_LEN_V >> 5), /**< Total length of the internal representation */    
+};
+                                  
+
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+void mm_op3_neg_scalprod_d_i(uint_mmv_t* v);
+MM_OP3_API
+void mm_op3_pi(uint_mmv_t *v_in, uint32_t delta, uint32_t pi, uint_mmv_t * v_out);
+MM_OP3_API
+void mm_op3_pi_multi(uint_mmv_t *v_in, uint32_t k, uint32_t delta, uint32_t pi, uint_mmv_t * v_out);
+MM_OP3_API
+void mm_op3_delta(uint_mmv_t *v_in, uint32_t delta, uint_mmv_t * v_out);
+MM_OP3_API
+void mm_op3_pi_tag_ABC(uint_mmv_t *v, uint32_t delta, uint32_t pi, uint32_t mode);
+MM_OP3_API
+void mm_op3_pi_tag_ABC_hash(uint_mmv_t *v, uint32_t delta, uint32_t pi, uint32_t mode, uint64_t *hashes);
+MM_OP3_API
+void mm_op3_delta_tag_ABC(uint_mmv_t *v, uint32_t d, uint32_t mode);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+uint32_t mm_op3_copy(uint_mmv_t *mv1, uint_mmv_t *mv2);
+MM_OP3_API
+uint32_t mm_op3_compare_len(uint_mmv_t *mv1, uint_mmv_t *mv2, uint32_t len);
+MM_OP3_API
+uint32_t mm_op3_compare(uint_mmv_t *mv1, uint_mmv_t *mv2);
+MM_OP3_API
+uint32_t mm_op3_checkzero(uint_mmv_t *mv);
+MM_OP3_API
+void mm_op3_vector_add(uint_mmv_t *mv1, uint_mmv_t *mv2);
+MM_OP3_API
+void mm_op3_scalar_mul(int32_t factor, uint_mmv_t *mv1);
+MM_OP3_API
+uint32_t mm_op3_compare_mod_q(uint_mmv_t *mv1, uint_mmv_t *mv2, uint32_t q);
+MM_OP3_API
+int32_t mm_op3_store_axis(uint32_t x, uint_mmv_t *mv);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+void mm_op3_xy(uint_mmv_t *v_in, uint32_t f, uint32_t e, uint32_t eps, uint_mmv_t *v_out);
+MM_OP3_API
+void mm_op3_xy_multi(uint_mmv_t *v_in, uint32_t k, uint32_t f, uint32_t e, uint32_t eps, uint_mmv_t *v_out);
+MM_OP3_API
+void mm_op3_omega(uint_mmv_t *v, uint32_t d);
+MM_OP3_API
+void mm_op3_xy_tag_ABC(uint_mmv_t *v, uint32_t f, uint32_t e, uint32_t eps, uint32_t mode);
+MM_OP3_API
+void mm_op3_xy_tag_ABC_hash(uint_mmv_t *v, uint32_t f, uint32_t e, uint32_t eps, uint32_t mode, uint64_t *hashes);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+void mm_op3_t(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out);
+MM_OP3_API
+void mm_op3_t_A(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out);
+MM_OP3_API
+void mm_op3_t_ABC(uint_mmv_t *v,  uint32_t exp);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+void mm_op3_xi(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out);
+MM_OP3_API
+void mm_op3_xi_tag_A(uint_mmv_t *v,  uint32_t exp);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+uint32_t mm_op3_word(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e, uint_mmv_t *work);
+MM_OP3_API
+uint32_t mm_op3_word_multi(uint_mmv_t *v, uint32_t k, uint32_t *g, int32_t len_g, int32_t e, uint_mmv_t *work);
+MM_OP3_API
+int32_t mm_op3_word_tag_A(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e);
+MM_OP3_API
+int32_t mm_op3_word_tag_A_hash(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e, uint64_t *hashes);
+MM_OP3_API
+int32_t mm_op3_word_ABC(uint_mmv_t *v, uint32_t *g, int32_t len_g, uint_mmv_t *v_out);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+int32_t mm_op3_load_leech3matrix(uint_mmv_t *v, uint64_t *a);
+MM_OP3_API
+uint64_t  mm_op3_eval_A_rank_mod3(uint_mmv_t *v, uint32_t d);
+/// @endcond
+/// @cond DO_NOT_DOCUMENT 
+MM_OP3_API
+int32_t mm_op3_eval_A_aux(uint_mmv_t *v, uint32_t m_and, uint32_t m_xor, uint32_t row);
+MM_OP3_API
+int32_t mm_op3_eval_A(uint64_t *v, uint32_t v2);
+MM_OP3_API
+uint32_t mm_op3_norm_A(uint_mmv_t *v);
+MM_OP3_API
+int32_t  mm_op3_watermark_A(uint_mmv_t *v, uint32_t *w);
+MM_OP3_API
+int32_t mm_op3_watermark_A_perm_num(uint32_t *w, uint_mmv_t *v);
+/// @endcond
+#ifdef __cplusplus
+}
+#endif
+#endif  // #ifndef MM_OP3_H
+
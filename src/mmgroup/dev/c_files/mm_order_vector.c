@@ -0,0 +1,8095 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+/** @file mm_order_vector.c
+
+ File ``mm_order_vector`` contains the precomuted ``order_vector``
+ and data related to that ``order_vector``,
+
+ It also contains functions for retrieving these data.
+
+*/
+
+/// @cond DO_NOT_DOCUMENT 
+#include <string.h>
+#include "mat24_functions.h"
+#include "clifford12.h"
+#include "mm_op15.h"   
+#include "mm_reduce.h"   
+/// @endcond
+
+   
+// %%EXPORT_KWD MM_REDUCE_API
+
+
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+/************************************************************************
+** order vector tag table
+************************************************************************/
+
+/// @cond DO_NOT_DOCUMENT 
+
+// %%EXPORT_TABLE p
+MM_REDUCE_API
+const uint32_t MM_ORDER_VECTOR_TAG_DATA[] = {
+// %%TABLE ORDER_VECTOR_TAG_DATA, uint32
+0x0000000bUL,0x00000000UL,0x0312af45UL,0x0660bb52UL,
+0x0aced355UL,0x0b820eadUL,0x0c1b6100UL,0x134a538aUL,
+0x13811d07UL,0x13f0c4d6UL,0x140f87a4UL,0x141c5b4eUL,
+0x14c61170UL,0x1bb201b7UL,0x1bdadd49UL,0x1d422ad4UL,
+0x1e743511UL,0x200a8b81UL,0x25b53cc6UL,0x25cfa543UL,
+0x26f6a6c8UL,0x27139de2UL,0x2f9de02bUL,0x2fabef93UL,
+0x30488b6cUL,0x3116a8efUL,0x02000109UL,0x02000206UL,
+0x02000301UL,0x02000406UL,0x0200060cUL,0x02000702UL,
+0x02000804UL,0x02000901UL,0x02000a01UL,0x02000c0bUL,
+0x0200100eUL,0x00000578UL,0x00000678UL,0x00000778UL,
+0x00000047UL,0x000000c0UL,0x00000080UL,0x00000039UL,
+0x00000020UL,0x00000010UL,0x0000000aUL,0x0000000cUL,
+0x0400010cUL,0x04000207UL,0x0400030dUL,0x0400040dUL,
+0x0400050aUL,0x0400060dUL,0x04000804UL,0x0400090cUL,
+0x04000a0dUL,0x04000c05UL,0x04001002UL,0x06000104UL,
+0x0a00000cUL,0x0a00400dUL,0x0a00800cUL,0x0a010009UL,
+0x0a020002UL,0x0a040004UL,0x0a080008UL,0x0a100005UL,
+0x0a200006UL,0x0a40000aUL,0x0a800007UL,0x0b000108UL,
+0x005f8bf7UL,0x006f83f7UL,0x007f83f7UL,0x000c7338UL,
+0x00080000UL,0x00040000UL,0x000393c9UL,0x00020000UL,
+0x00010000UL,0x0000a00aUL,0x0000c00cUL,0x00000c00UL,
+0x008007ffUL,0x00000001UL,0x00000002UL,0x00000004UL,
+0x00000008UL,0x00000010UL,0x00000020UL,0x00000040UL,
+0x00000080UL,0x00000100UL,0x00000200UL,0x00000400UL,
+0x0c000005UL,0x50000002UL,0x60000002UL,0x40000424UL,
+0x30000a89UL,0x100001fdUL,0x23493bd7UL,0x0803e401UL,
+0x0849b801UL,0x0a030501UL,0x0ab7d302UL,0x0b4e1601UL,
+0x60000001UL,0x10000143UL,0x2838f366UL,0x60000001UL,
+0x10000754UL,0x20164c1bUL,0x60000001UL,0x00000002UL,
+0x50000001UL,0x60000001UL,0x40000401UL,0x30001fa9UL,
+0x10000062UL,0x266cc2bbUL,0x083b9d06UL,0x086c910cUL,
+0x0b994306UL,0x0d48c806UL,0x0fbc5306UL,0x02000109UL,
+0x02000206UL,0x02000301UL,0x02000406UL,0x0200060cUL,
+0x02000702UL,0x02000804UL,0x02000901UL,0x02000a01UL,
+0x02000c0bUL,0x0200100eUL,0x0400010cUL,0x04000207UL,
+0x0400030dUL,0x0400040dUL,0x0400050aUL,0x0400060dUL,
+0x04000804UL,0x0400090cUL,0x04000a0dUL,0x04000c05UL,
+0x04001002UL,0x06000104UL,0x0a00000cUL,0x0a00400dUL,
+0x0a00800cUL,0x0a010009UL,0x0a020002UL,0x0a040004UL,
+0x0a080008UL,0x0a100005UL,0x0a200006UL,0x0a40000aUL,
+0x0a800007UL,0x0b000108UL,0x0c000005UL
+};
+
+
+// %%USE_TABLE
+static const uint16_t TAG_INDICES[] = {
+// %%TABLE ORDER_VECTOR_TAG_INDICES, uint16
+0x0000,0x0061,0x0067,0x006c,0x0073,0x0074,0x007a,0x007f,
+0x008a,0x00a2,0x00a3
+};
+
+
+/// @endcond 
+
+
+
+
+/** 
+  @brief Load data from tables to a buffer
+
+  The propose of this function is to provide the information for checking
+  the correctness of the precomuted order vector \f$v_1\f$ stored
+  in this module.
+  
+  This function stores precomputed data in a buffer ``buf`` of
+  type ``uint32_t[buf_size]``, where ``buf_size`` is the size of
+  the buffer. Parameter ``n`` specifies the value to be stored
+  in the buffer. The function returns the length of the data in
+  buffer. If the buffer is too short for that data then the
+  function returns -1. A size parameter ``buf_size = 128`` is
+  sufficient for all cases of ``n``.
+  
+  In case ``n = 0`` the function returns the array ``TAG_VECTOR``
+  of length 97. The tag vector is documented in file ``mm_order.c``.
+
+  In case ``n > 0`` the function returns data required for verifying
+  the precomputed order vector \f$v_1\f$. The order vector is discussed
+  in [Sey22].
+
+  In case ``n = 1,2,3`` the function returns the 
+  values \f$g_{71} \in \mathbb{M}, v^0_{71} \in \rho_{3}, g \in \mathbb{M} \f$,
+  respecively, in the internal sparse format. With these data we can compute:
+
+
+  \f$v_{71} = \sum_{i=0}^{70} v^0_{71} \cdot g_{71}^i g\pmod{3}\f$.
+
+  In case ``n = 4`` the function returns the integer \f$D\f$ in
+  entry 0 of the buffer.  In case ``n = 5, 6`` the function returns the
+  values \f$g_{94} \in \mathbb{M}, v^0_{94}\f$, respectively.
+  With this data we can compute:
+
+
+  \f$v_{94} = \sum_{i=0}^{93} (-1)^i \cdot v^0_{94} \cdot g_{94}^i  \pmod{5}\f$.
+
+  \f$v_1 = 10 \cdot v_{71}  + 6 \cdot v_{94} + 5 \cdot D \cdot 1_\rho  \pmod{15}\f$.
+
+   Here \f$1_\rho\f$ is defined as in [Sey22].
+   We can also check that the order vector \f$v_1\f$ satisfies the
+   properties required in [Sey22].
+
+   In case ``n = 7, 8, 9``, the function returnes the
+   parts ``TAGS_Y``, ``TAGS_X``, and  ``TAG_SIGN``, respectively,
+   of the ``TAG_VECTOR``. For a description of the ``TAG_VECTOR``
+   see the description of ``enum tag_offsets`` in
+   file ``order_vector.c``. 
+*/
+// %%EXPORT px
+MM_REDUCE_API
+int32_t mm_order_load_tag_data(uint32_t n, uint32_t *buf, uint32_t buf_size)
+{
+     uint_fast32_t data_size, start,i;
+     const uint32_t *ptr;
+     if (n >= 10) return 0;
+     start = TAG_INDICES[n];
+     data_size = TAG_INDICES[n+1] - start;
+     if (data_size > buf_size) return -1;
+     ptr = MM_ORDER_VECTOR_TAG_DATA  + start;
+     for (i = 0; i < data_size; ++i) buf[i] = ptr[i];
+     return data_size;
+}
+
+
+
+
+/************************************************************************
+** order vector table
+************************************************************************/
+
+/// @cond DO_NOT_DOCUMENT 
+
+
+// Number of entries of type uint_mmv_t in table ORDER_VECTOR_MMV
+#define LEN_ORDER_VECTOR_MMV 15468
+
+// The precomputed order vector in its internal representation
+// %%USE_TABLE
+static const uint_mmv_t ORDER_VECTOR_MMV[] = {
+// %%TABLE ORDER_VECTOR_MMV, uint64
+0xed9b41142c06169aULL,0x00000000020d7c0eULL,
+0x334e7922a8658ed9ULL,0x00000000e396591bULL,
+0xd21785b85cb086e6ULL,0x0000000012b1b6ceULL,
+0xaa520d30eeb12881ULL,0x000000001a17938aULL,
+0x7b017e4655c11056ULL,0x000000001cba2c01ULL,
+0xcdbba5a0ed3cbb60ULL,0x000000004c25d696ULL,
+0x38470ca037d5ec8cULL,0x00000000b152dc6cULL,
+0x75551337c3e5e5a2ULL,0x00000000eda263e3ULL,
+0x301b302670060824ULL,0x0000000042ee7079ULL,
+0xb17515223aa43b21ULL,0x00000000007173e4ULL,
+0x02d003503c5ed591ULL,0x000000001c18732bULL,
+0x6c02a01310a70874ULL,0x000000000710a098ULL,
+0x896d205b57b127ebULL,0x00000000834729ccULL,
+0x5d060d7154b05149ULL,0x00000000eed93cc2ULL,
+0x54d9c21058dba23dULL,0x000000008edad60aULL,
+0x755860b373c7ad3eULL,0x00000000865119c9ULL,
+0x9a2c8b493c61aebeULL,0x00000000a0425c83ULL,
+0xc0cc92e7e6908c10ULL,0x00000000cee01938ULL,
+0x96c903303c6c369cULL,0x0000000036633c9cULL,
+0x1d32a7776dd29b57ULL,0x000000002ac17315ULL,
+0x1a97081e225a716dULL,0x00000000bcd51302ULL,
+0x5dd4117ea52b1b90ULL,0x00000000b30dc6e4ULL,
+0x6ee37c02d1cca232ULL,0x00000000e73ca6e0ULL,
+0x88e80104eb4111e0ULL,0x00000000eebb23caULL,
+0xb7c53dc4ddadd7c0ULL,0x00000000766dec52ULL,
+0x9650179bd4500a0cULL,0x0000000054a322d4ULL,
+0xbc1520e9517590a7ULL,0x00000000673a5015ULL,
+0x77e9a0dcb8de090dULL,0x00000000aed87303ULL,
+0x3dce9e59a520e50dULL,0x000000009c30dd6eULL,
+0xe61c891e8e02d75aULL,0x00000000bb5812e4ULL,
+0xaa2eb8db30e5814dULL,0x00000000d9c6215bULL,
+0x30497a35038ab5ddULL,0x0000000061dc2daeULL,
+0x86342dd05be9c9b4ULL,0x000000003427e404ULL,
+0x56390a0d3d15de9cULL,0x00000000d8c2cc38ULL,
+0x621680ada89e007dULL,0x00000000a814a97aULL,
+0xa35208027b89a213ULL,0x00000000b764ce1eULL,
+0x5b3026949ece9505ULL,0x0000000062c2346cULL,
+0x28035133421ce15cULL,0x0000000079649adcULL,
+0xd08b32660a6d7c67ULL,0x00000000e2338ea5ULL,
+0x0d25a6583ae37b9bULL,0x00000000140c3d19ULL,
+0x95ccea84eb4e3542ULL,0x00000000be75c610ULL,
+0x1ad61730a5e601d5ULL,0x00000000de916a01ULL,
+0xdea4e9c4d12d302cULL,0x00000000241440a6ULL,
+0x3893cace221d752eULL,0x00000000dec9046cULL,
+0xc3424427c6808a3dULL,0x00000000b9e09415ULL,
+0x036c61c2dc53d3a6ULL,0x00000000e60ec197ULL,
+0x4292788419bce746ULL,0x000000006069e4eeULL,
+0x1e76bad36db9a657ULL,0x0000000006ebd2dbULL,
+0x58cb6c1054b35040ULL,0x00000000453ba9d9ULL,
+0x6167ba780295ac04ULL,0x0000000081b024d7ULL,
+0x40e2435da002c0c0ULL,0x0000000068711701ULL,
+0x0b906ecb2c5a0ca5ULL,0x000000000ed1628cULL,
+0x96ddbea481c0a253ULL,0x00000000cb3dd49aULL,
+0x232897e6610c509bULL,0x000000008a47ea68ULL,
+0x781034800011c024ULL,0x00000000ea2a0606ULL,
+0x17dba86b00682a05ULL,0x0000000040189b7dULL,
+0x84191be0b064bd80ULL,0x00000000ddd3b0c6ULL,
+0x015b670e68eac571ULL,0x000000005d39ba27ULL,
+0x582d007b847ee3acULL,0x00000000e1e65a02ULL,
+0x45390061a39b64b6ULL,0x00000000d7e5a803ULL,
+0x24809db9b08d027bULL,0x00000000ae4717e6ULL,
+0xa0083251d12d9e6cULL,0x00000000142aa63dULL,
+0x300458147836b018ULL,0x00000000587650d9ULL,
+0x03a2450817290465ULL,0x00000000650e0bd6ULL,
+0x69d63276d68ac179ULL,0x00000000802577e0ULL,
+0xdd3e002c706980ddULL,0x000000009462c70eULL,
+0xb0678aa0b6a42749ULL,0x000000006d8e7077ULL,
+0x05a1a5bb90ed612aULL,0x00000000c53b07c7ULL,
+0xe6a756938a7d110bULL,0x00000000d740be25ULL,
+0x0724ee3d1243d7b3ULL,0x0000000083043862ULL,
+0x584e71dd0aabe815ULL,0x00000000c0375d40ULL,
+0x651ade5d4e8c0684ULL,0x000000000c8dc698ULL,
+0x87606726a3dd7530ULL,0x22d93d3652a634c1ULL,
+0xc1b9deebc5dd86e7ULL,0xa81174ea7038a4e0ULL,
+0xbae892ca2449ec11ULL,0xead06615900da573ULL,
+0x8aaa5890d9607e99ULL,0x15a9ed6de873cd8bULL,
+0x902ec5b5cd870396ULL,0xd04bc8c751679e27ULL,
+0x1e416a16a374ddccULL,0x84340be4743a3dceULL,
+0x7517be3601a02191ULL,0x88196e4997b81d67ULL,
+0xc89b70e3c48397eaULL,0x35b01a0534b44863ULL,
+0x9a85ca6d3b58d1caULL,0x9cb89b66429a17dcULL,
+0x56b1ab3ea8273b98ULL,0x1da9a3cccc0e18beULL,
+0x3bd314856c3b1ee7ULL,0x24c8bc08ba02d5b5ULL,
+0x78dc99a150258040ULL,0xeb9dd8934b7a401eULL,
+0xec9eb572319444e8ULL,0x32e458d8ea78694bULL,
+0x667b98d15c514425ULL,0xd03d1615e5cae95cULL,
+0x66c58a8556e87b71ULL,0xb2160d31a43c06abULL,
+0xc1795aaae802ebbeULL,0x2e130b87b5c46139ULL,
+0x02e20345e7c11927ULL,0x72428bc48a375aecULL,
+0x27eace76c6670535ULL,0x0ae1e4999bd984cdULL,
+0x674734b167268348ULL,0x2c2ed46334a26482ULL,
+0xe2288ac3eecea575ULL,0x9e5c0812dac20c57ULL,
+0xb1156b5d3285ad33ULL,0xb4842aad60b32c5cULL,
+0x1cb58bbb44d52976ULL,0xb59310e1e71a8162ULL,
+0x85bc424d4b74e42eULL,0x54946ede19258643ULL,
+0x887346db7785e4b4ULL,0x2728d61db9d02ddaULL,
+0x2622958acee82422ULL,0xda9555b69857326cULL,
+0xe9c7891a5a24c788ULL,0x2090e778307701a6ULL,
+0xbe71192a5be6c757ULL,0x37a5c56654c735edULL,
+0x54054a36c4ed25b3ULL,0x20dee220625872a0ULL,
+0x4e111878e35aadc9ULL,0x1ac56caab1419048ULL,
+0x704aac8abeccaca8ULL,0x80a943a4be8648aaULL,
+0xc88b730264501444ULL,0x2dba28900a3deb42ULL,
+0x3ba118dddd0b3d46ULL,0x3a0286904eab4c54ULL,
+0xa985e8a0a4939b20ULL,0xc0ce74c64dca8d01ULL,
+0xc77ad0262e8b41cbULL,0x0cda1494628521adULL,
+0x42ade62e922e4ae0ULL,0x88cb60923025a1eeULL,
+0xb958b095461e5a3eULL,0x970316e5d0ee2e3aULL,
+0xce5e01ebbb4b0cc2ULL,0x5770256412a1384bULL,
+0x9c77d57e52d5dec3ULL,0x169b09c2c794c7dbULL,
+0xb95abcb9a9ac6614ULL,0x932e77c1c3ecac63ULL,
+0x21b86569aed4ad76ULL,0xb91b714ccac69e0bULL,
+0x6edbb1070868120bULL,0x608950d0cd5a4910ULL,
+0x5c5ad46e86b87284ULL,0x32dc44a4e5143a0eULL,
+0x7710ca8ac89aa995ULL,0x08de4cb651bb9050ULL,
+0xa2d1ceb134466b4eULL,0x885382a84095d122ULL,
+0xa8d24a184ab720c5ULL,0x3b476984c910a8e3ULL,
+0x59b8c2dc9233a6a2ULL,0x945556e38cc16a97ULL,
+0x438749b4e708c8cdULL,0xb820ab1572884176ULL,
+0xc34a9017a2db7c97ULL,0x41e53b6107cbb57eULL,
+0x9882ad47ed0d0e9eULL,0xec7dea42b8c7d9b3ULL,
+0xcde548d6b3238cd1ULL,0x694482dca544d613ULL,
+0x35db525021b9ed6eULL,0x45c51dcb0e8d56aaULL,
+0x68c87a4bc029badcULL,0x0347045522a72662ULL,
+0x77c3ce356cb97dabULL,0x7a6e3c4126c6edacULL,
+0xb98ed86315eb506cULL,0x87dc687282d37e15ULL,
+0x1823a39aaa201261ULL,0x1172d350479654ebULL,
+0x54e4a7095986b101ULL,0xc9b0b6beaac92de3ULL,
+0x5d972c5a8607abb4ULL,0xba70aba88a967a47ULL,
+0x7cacaa058b35a0caULL,0x07d110a176d39ee2ULL,
+0x9810a0623bc31082ULL,0xbb995c38a6248cdaULL,
+0x5dd53c41d6e67dc5ULL,0x6850ac3a68e4a0e3ULL,
+0xdd93ead18053e159ULL,0x6e387dda1da99277ULL,
+0x007665c2400906cdULL,0x9935c325e7da7250ULL,
+0x6871471a5b011a5dULL,0x5c671e2361c372eaULL,
+0x9199525e7ace8b47ULL,0x15dc7c72ae4a55a3ULL,
+0x4d1ca58cabda78a5ULL,0xb2e2d75dee33c6d4ULL,
+0x609cc2c947757e9bULL,0x465746b6d1c81071ULL,
+0xddc2058044d5a737ULL,0x70edaac6a4a8eb41ULL,
+0xc2eb26b9bd9bb0a7ULL,0xc43164ce041aa754ULL,
+0x73885a8ce1d077beULL,0x429d349110de1d59ULL,
+0xa8019cbe04413571ULL,0xa39605b76376a56bULL,
+0x027ba594b98042aaULL,0x978c0b0a7e9065a4ULL,
+0x55942ba8c3dd4b77ULL,0xd22c179a42ceb018ULL,
+0xeb16862dae92c175ULL,0x5e042d80a135163aULL,
+0xcca0b59dd8446332ULL,0x8564c046c6c73d28ULL,
+0x347013ccad67989bULL,0x9cedde643c7ab55bULL,
+0x92517702c2aeab5cULL,0x3b2c49241a0d5390ULL,
+0x547a71b2b405e0c4ULL,0x6670a73b91809ee6ULL,
+0xdb01585a120051aeULL,0x1de7cc7c2498b881ULL,
+0x9aa8b9276713b819ULL,0xb02766ee24ea0480ULL,
+0x540ee51d62c19857ULL,0x6cc0dba34b143020ULL,
+0x4b45e26544066e3aULL,0x03581ee874b98675ULL,
+0xa36a67640e1c66b9ULL,0x13461c44a6ecc311ULL,
+0x219c3eee4e20bb8cULL,0x3d367862a3a86ee2ULL,
+0x3bc0b690ed3d0611ULL,0x19c3a98a86c0a5e0ULL,
+0x12b97e0d23b07e02ULL,0xc0d9340e4aa59e34ULL,
+0x0827670125db0ad0ULL,0x24d3adcb683c3ddeULL,
+0x78c29490a4b8dc9bULL,0x2d5b6588d140c5ecULL,
+0x35d2b19ab6b40830ULL,0x4eeca06ce89020c9ULL,
+0xb86d0d739909e91bULL,0x835b2eeab8bd6eb0ULL,
+0x0eb4b559cd78381cULL,0x3a3a05564b6dcb38ULL,
+0xa85ee30b73564727ULL,0x9854465b591bd944ULL,
+0x65e8cb4be3ab6891ULL,0x234d9dd7d417d932ULL,
+0x8459b18845304595ULL,0x4b702ce10182c160ULL,
+0x836a4a1ce38b6d80ULL,0x0ab485cc99cbb4d5ULL,
+0x6723c70ee07d0043ULL,0x4d4d77e0e325749cULL,
+0x32e492d887c1850cULL,0xc4240d62341e3406ULL,
+0x5c8479a8ec0cc58cULL,0xd62e07aa164a67ccULL,
+0x9c6e9cedd2c997b2ULL,0x767ae7da31b60daeULL,
+0x358e55448484c46dULL,0x20639450196956d0ULL,
+0xe4a36462968d7cc4ULL,0xdbc4920b180da57cULL,
+0xb1469d7d1d10600dULL,0xdeae9db7dc3571c8ULL,
+0x79da3322ad5eac9eULL,0x212bcb7cbd78d68dULL,
+0xaa216dba1d879481ULL,0x3210963713cda01dULL,
+0x2a387c9a15a4993bULL,0x27db0a010214326eULL,
+0x745ea381d968d20eULL,0x2e5ec7ac0a3c0ed6ULL,
+0x117a5db7b364d5b9ULL,0x10176cc345bd1eb7ULL,
+0x5b8a99c9745b0a4aULL,0xd038bb0a82684d71ULL,
+0xcb8623cc5b30cd67ULL,0xcd719b98508791d1ULL,
+0xee1b842dac9e8d39ULL,0xbb6dd259d2e0e9c1ULL,
+0x4c1d06db784ec5dcULL,0x77ce4a3151045454ULL,
+0x27b9daa1cba25ec3ULL,0xe6eb8eb18579c1c4ULL,
+0x4894ec8b35668c04ULL,0xcdd009bd2a8e74c5ULL,
+0x78e6764072d7913eULL,0x4739ee3e93390a86ULL,
+0xcd71cd35d20087e7ULL,0x4024c7b5d4c9d26bULL,
+0x49e42426a9a06983ULL,0x81a638d5a44a7080ULL,
+0xb5131515e4ac3750ULL,0x540c255e4644edecULL,
+0x59d85bd41ad5792dULL,0x451d674773123e09ULL,
+0xadca86c56548cb3eULL,0x8c919d2a32ad37adULL,
+0x12d625518c2e2c75ULL,0x98d4499da7403b2aULL,
+0x0ae270dd42ac529bULL,0xd446e0054078137cULL,
+0x9e382a159c53e767ULL,0x56d7a27590da77e6ULL,
+0xee26c2a2e0b141eeULL,0xcb0324b59005141aULL,
+0xe31826be8751d027ULL,0x1e3cbe954ca5818cULL,
+0xee4403cc84746e7eULL,0x0387d17ba71b5191ULL,
+0xe6c84a4b7d3942a2ULL,0x612b6a1a5e2d7942ULL,
+0x446d943eb319a202ULL,0xebcaa90204c386e1ULL,
+0x5002113779049d00ULL,0x63cc9ad53cc38a94ULL,
+0xe322341bb5903addULL,0x980b793ab9350c8dULL,
+0x40b7d7e704bd86ddULL,0x6a4a132604b663e3ULL,
+0x98c9350a5c6d0a56ULL,0xd38ba2c49ca0abebULL,
+0xad643aa455ad6139ULL,0x02889d390aada808ULL,
+0x08071ae94066da44ULL,0x017c22c4d134d95eULL,
+0x43b93c13ea15a8b0ULL,0x865adbea38927d4dULL,
+0xdba86a0e36083284ULL,0x45d68c0d5853bb98ULL,
+0x371e7829748bc9d6ULL,0x5416d2363c0722d1ULL,
+0x850bdba2c32b5dd2ULL,0xc711e7b53e5a877aULL,
+0xd56e3e69c1b71e18ULL,0x4a2a6689e092de0eULL,
+0x7b95c37d560a2db1ULL,0x3372e26c2e921304ULL,
+0x04cbc24bb4d9a126ULL,0xa835b79b481533a7ULL,
+0xe71d308e780a342dULL,0xe20c9760302addd0ULL,
+0x538945e628992329ULL,0x6313e860ecb08e33ULL,
+0x29c04050337dd98aULL,0xd96d63e284e91763ULL,
+0x94ce5db33d45b9ceULL,0x1e840d1ba9c25ec4ULL,
+0x55dbc383586981c0ULL,0xb58bd96d401cdd0cULL,
+0x7721be41209acbd5ULL,0x7d5e5e0e99d2d2ebULL,
+0x63813ea432ed576dULL,0xdad808025921c590ULL,
+0x4a93bc7d80ec541aULL,0x309d0e31a8d390abULL,
+0x739c02038da460a7ULL,0x9967723bc841ba5eULL,
+0x5137a8d7c5488076ULL,0x2748a43a712cb115ULL,
+0x0da51b0e74949403ULL,0xbb47e6ed13167b91ULL,
+0x988db35a2e1d5457ULL,0x1a24eac2690939d5ULL,
+0x7aabbd37c2d44124ULL,0xe02231aba9c6ab46ULL,
+0x5b2471be3da1bac6ULL,0x7bcd35eb465d6042ULL,
+0xa55276c9149a9d97ULL,0xe90e9c811640a016ULL,
+0x741686dd4b5b9d8bULL,0x060d706a6b17d39cULL,
+0x24b8205b90aee6edULL,0x8c9931ea46cdbb42ULL,
+0x5e351d923169903cULL,0x011952c451a5117eULL,
+0x6d46cd8470153738ULL,0x4642e54810d71879ULL,
+0x3ceacd5c460b7472ULL,0xa0ac98491990cab4ULL,
+0xc0e852c09522e53cULL,0xc0031d3d1b60ed2cULL,
+0x4b37bc8e647aac5dULL,0xe1447a45405e0e97ULL,
+0x4c1d30491eb73d4cULL,0x04b816eed295427cULL,
+0x5881d60c458c18ceULL,0x65e4b9a7454b6a49ULL,
+0xa4688a67765e4750ULL,0x6bd56730c9a6c00bULL,
+0x3da1750de0d87374ULL,0x48a11c7e3498e7ebULL,
+0x8d251cb6124ec683ULL,0xb509cdd40430b354ULL,
+0x4a7e24e7ca12bbb1ULL,0xbc5240edc0344378ULL,
+0x073a14a1d8eb8ec9ULL,0x63aa0d33a6914bb9ULL,
+0x13426e389eed8e42ULL,0xe0431ea8cae24b36ULL,
+0x957301d9cb8251b9ULL,0x5606072b5ad65261ULL,
+0xcc78aceb1c06ba06ULL,0x538920227c513051ULL,
+0xab9bc32d43e6d7d6ULL,0x7257b645362749baULL,
+0x966866a461b301caULL,0x2442ed0170e89a03ULL,
+0xdc9bc3a6a974e008ULL,0x4bb2d2c49869ca43ULL,
+0xde39c8a05adcac18ULL,0x6a61bd2e397d10cdULL,
+0x84bd447ed1054088ULL,0xa93478c94de7da84ULL,
+0x09a2a63c9556e4ccULL,0x39a1b5c57734d186ULL,
+0x8a1a15c92855a63aULL,0x11c49905e685823bULL,
+0x7b086c68bd508d29ULL,0x2595278b498b97d4ULL,
+0xd7ee13183d3c6a47ULL,0xb04bc4a76759d72eULL,
+0x1aa09cc78526eea0ULL,0x00cdeb518c283a4dULL,
+0x1642e74a28c0b96cULL,0x9952020867a398c4ULL,
+0x257794e6515ed37dULL,0xae0e61c0187e41b1ULL,
+0xc01db44db71d047eULL,0xca1d96758e238a4eULL,
+0x0209c2c1048bb505ULL,0x3a0b33832cb1640cULL,
+0x4b1c28a2902a16e6ULL,0x1288b4702b7de7d4ULL,
+0x1616802802c86a32ULL,0xce30575571826db4ULL,
+0x91d589e10db06289ULL,0x52dd47272d6ec824ULL,
+0xa468eca84b4cd5d7ULL,0xb4916473e508bad5ULL,
+0xb76b1e215d5d5a5bULL,0x3d71a647b1e04388ULL,
+0x3bd0c66d0da18e74ULL,0xed115736cc56e142ULL,
+0x7524ad1bbbc89048ULL,0x61a209c037517d1aULL,
+0x9de37363e60d63d9ULL,0xd7197c1948a675c3ULL,
+0xc6a9e9ca5eeb0006ULL,0x95e3e5765c8ca697ULL,
+0x7de2916c5d0c19ccULL,0xed3c052903846813ULL,
+0x6c582cd1d84c8b25ULL,0x9a500166c670cac0ULL,
+0x1e83a8e9c76ad731ULL,0xea4e31bac1c5b4c7ULL,
+0x1201ac8e1cd12bceULL,0x6c09cdd5d343306dULL,
+0x5c76bbdab11b2a22ULL,0x01de8be614acc85bULL,
+0x8b78e8612997bb35ULL,0xdbc033416457c041ULL,
+0x5a744dbcad452b16ULL,0x21b084003ec0d198ULL,
+0x6588d56831dae3b5ULL,0x32337305c6c65c05ULL,
+0x405c103acb98ebc7ULL,0x5429a81974523c42ULL,
+0xee93d181d1e27e13ULL,0xb0431139b92e080eULL,
+0xe316b6b60239808aULL,0xc82c87733c9814a1ULL,
+0x6ec21256cb9cb250ULL,0x2bb2361e1ab533eaULL,
+0x85b0d1208e0d7827ULL,0x1daa01a2189b6eb2ULL,
+0xbae964d468788577ULL,0x8e99acb01761ae62ULL,
+0xa88ec6bda2d61e48ULL,0xbe67aa2379692919ULL,
+0xc9cd47796687b7b0ULL,0xdbce74a13e589a62ULL,
+0xa559b7b2d321ec6bULL,0x858c8c0be25ca6a7ULL,
+0x2a61c4b6e1b6c8a0ULL,0xa3ceb77c2d10548bULL,
+0x46699b555d62d659ULL,0x0e10846b6261d214ULL,
+0x9901de1e1e733aeeULL,0x55dae8d825ee515dULL,
+0xeecb03a397314a28ULL,0x256855677690bbddULL,
+0xe07d87bc0b5747d1ULL,0x5ae7e9e4b0793420ULL,
+0x573ea71608770c96ULL,0x7216e3c134299405ULL,
+0xa4450a4c62994745ULL,0xd55b42e449ee52ebULL,
+0x566533ba75788c60ULL,0x176d9210831b8568ULL,
+0x7c629a16055e435cULL,0xa42820d59e422a9eULL,
+0x4196e1db6582ec71ULL,0xc8e3c65cae29ac30ULL,
+0x3495d0c64a7d0a99ULL,0x71d50e04835294a9ULL,
+0x42bd37551e028871ULL,0xba17e759e6b59557ULL,
+0x8c442449b81d549cULL,0xca2911a0e6ab4e16ULL,
+0x0c6036a1bb412ebcULL,0xc86837962d6cbc86ULL,
+0xa4c843057d982aceULL,0x42c57bd35d81e349ULL,
+0x384489085db08cbcULL,0x51bed430a2ac836aULL,
+0x95ed846dbdd12534ULL,0xce9523ecd628d6eeULL,
+0xa2a2190d1cc455b9ULL,0xd0862163ca1dae79ULL,
+0x74153684047bb2ebULL,0x53130504c4a9bb13ULL,
+0xb08b19577711b167ULL,0xeee53aeea97eedaeULL,
+0x384ec2e191b18e4dULL,0xb0940300a53ad4a6ULL,
+0x1dd8724e16d45079ULL,0x3d421a8715488939ULL,
+0xeb7933ea7b11b9a3ULL,0x15a3140d973c7016ULL,
+0x148be633249cb35eULL,0x43cb93d51c6503d9ULL,
+0x0459bb0944a7eed7ULL,0x6b909e1b5b9b3304ULL,
+0x59c25e5dc177ac66ULL,0x315ae9506a73ec3dULL,
+0xec0a159cb53aa978ULL,0xc5ab3debbc369bb9ULL,
+0xa7b0499dea3627c3ULL,0x2a34c72971dbc977ULL,
+0xc79609429b394091ULL,0x5d45d22ecb720086ULL,
+0xae300137433c460aULL,0x50b03e49790b097eULL,
+0x558ac4773b2c3543ULL,0xeddca72ee3579e9eULL,
+0x3ead06b7d72c617bULL,0x0dcc65580026b8dcULL,
+0x201987db8d9e2ce6ULL,0x60d3568bc7bd0de3ULL,
+0xc0b99e15550bb60eULL,0x653228306c7788e1ULL,
+0x70727ad183c55252ULL,0x63702c923436d142ULL,
+0x3e04ba43ee635054ULL,0x67485804ae42d6d3ULL,
+0x0d6e5c2403d91756ULL,0xa78717a0b5920455ULL,
+0x62853ad97e64e921ULL,0xcc8a5a62e0629e72ULL,
+0x4d25793425a54b12ULL,0x7767825e5d11d9d3ULL,
+0xbb69ac1739300bb6ULL,0x9c7aadd26681c346ULL,
+0x27da2a14cc0ed0d1ULL,0x8a2088d9b341d118ULL,
+0xcd5dd130e462ed98ULL,0x02bceee9987e58ccULL,
+0xa7530874eb015c66ULL,0xeced4cd6a6c160beULL,
+0x9e19053a45156733ULL,0x21b1159c1277d91eULL,
+0xc1b049a42de5ed19ULL,0x9bd7c82e33e5acddULL,
+0x7622483c037198a9ULL,0xed2bb2199942304bULL,
+0xc10d6c3eb7c4d79cULL,0x741acc7c0e77d702ULL,
+0x10289b6050a9bc12ULL,0xe463d63e80d80646ULL,
+0xb5ed3eb1551adc53ULL,0xa4780784a1b8d253ULL,
+0x6337754912bbb25eULL,0x231174075ca012e2ULL,
+0xcb00222a5747a216ULL,0xcba81e71d65646bdULL,
+0x1b77d3879d3019a4ULL,0x6ccb0646595dd7bcULL,
+0x0822baa7b1791436ULL,0x4491bd4e7a1d81b6ULL,
+0x27d981a2ad048013ULL,0xb264c6a9653516bdULL,
+0xc383b2dae8031ac3ULL,0xd3577bb70e2a68eaULL,
+0xa9e6779530890361ULL,0x168456d35e37467aULL,
+0x0cd3e3dde5419094ULL,0x7458794c1b62c885ULL,
+0x98e2d80c2d545845ULL,0x378e0257c7eb24ecULL,
+0x766835ee5c3368e1ULL,0xb726547431573a5aULL,
+0x7b27cbd6e008b7caULL,0x82d6e3730161e45bULL,
+0x4a0b6005bb0617b0ULL,0x27b9bbbbb00d85b4ULL,
+0x71c73e3ad4a22998ULL,0x8587c684614e8e09ULL,
+0x8b48cd40238c0c8bULL,0x73aaee8b59d8ead2ULL,
+0x5a492c51703aad19ULL,0xa2c14c5bae14422bULL,
+0xcc4c3840574a3a55ULL,0x5178c9eac2139805ULL,
+0xed8619103a95ac38ULL,0x84c1dd0d0eb5c7b9ULL,
+0x9377833231d9d62dULL,0x350a69929817ac87ULL,
+0x89ea6c892d3a4235ULL,0xcb811b66410480a5ULL,
+0xc344ae80b6c53c1bULL,0xce686c99a40c7a43ULL,
+0xcb335cca7268ce29ULL,0xd9c819a8204e8ddaULL,
+0xe750b45ea736287cULL,0x869375810ebcbd5bULL,
+0x257e05c28d3d2436ULL,0x92c9e77ba504c3bdULL,
+0xb86ecc44de13c539ULL,0x6d6ca54a490e6a29ULL,
+0xb821ceb48baca692ULL,0x5992c5a84d54219dULL,
+0x5a8482638cc75a9bULL,0xbd8e26e115d29de3ULL,
+0x25c488c182dcce8cULL,0xe780eba7d690280cULL,
+0x04410ce7e1438ceeULL,0xce357c18d55aeb29ULL,
+0x7d8d831749e10018ULL,0x5356a93d62dd39eeULL,
+0x87a667ea6a340cd7ULL,0x5acd2d2188e13728ULL,
+0x306cc555ac7b9108ULL,0x91e864c9355589d1ULL,
+0x3903281330a5eb2dULL,0x9601699593ebaabaULL,
+0x499526b17a23e987ULL,0xa6b71a912a26ab74ULL,
+0x65d499a194c2b64dULL,0x3ccda2d25c7d2d41ULL,
+0xa896bbe1e0b9cedcULL,0x215aeb7d9b611e33ULL,
+0x60b88a6c58c8397bULL,0xd0a3694b6d9b2916ULL,
+0x49073a877360d710ULL,0x2662b6d7178a440dULL,
+0x83812cdd9dc1dc02ULL,0xeb1ddaa08747dd24ULL,
+0x717ce269d5a2395dULL,0xbc8993335b83eda8ULL,
+0xa81528406ac01d1dULL,0x8b871aca351c2881ULL,
+0xe21679b00c4a0a1aULL,0xc2049cbe9c8c12ebULL,
+0x4edd7c1ca5a12e36ULL,0xaecc123c2e0db106ULL,
+0xe1aa35370824ce8eULL,0x840710cc4d63b48bULL,
+0xa6c34e21975eb833ULL,0x48a7186b6e93ecc6ULL,
+0x35d4603991618a28ULL,0x52a7847220b963e6ULL,
+0x43e11b27a726878cULL,0x8b55b8b92b813775ULL,
+0x0d53427e996d398bULL,0xa4195e73de923eadULL,
+0x0d5a6b41c6790d7cULL,0x46b822b1a3850591ULL,
+0xb7621b27e80d6305ULL,0xa9dd124e011b3988ULL,
+0x11198c6d7c502923ULL,0xd7d8d6017056e41cULL,
+0xee8e23b2660d32e9ULL,0xe2915517c536e042ULL,
+0x99c7c46584de7bc3ULL,0x1a6342542db33a09ULL,
+0xb5269baa645c6115ULL,0x5740eb54d38aa3a4ULL,
+0x2bdd38613b171cd8ULL,0x564854652d3a29b2ULL,
+0x15d752a1701e05d3ULL,0x3441a2d795dc6eb6ULL,
+0x5de93122b657a973ULL,0xc03750cd1874de6bULL,
+0xb6ca04893d825b84ULL,0x9c6489130c89a139ULL,
+0x3dcdc15e10886536ULL,0x60d68e673b5107ddULL,
+0x112920e2cbb8a866ULL,0x1ed7dedca1c798d6ULL,
+0x2bd6dcb5cc64cc58ULL,0xd67cae9ba38636caULL,
+0x1da974309b7472e3ULL,0x6dcca556841c0756ULL,
+0x5659984e5dae93a3ULL,0x7cca4d51a6440db0ULL,
+0x3daa3d9e766a10a7ULL,0x9939ab8ce99d3b6dULL,
+0xce12517a534a7982ULL,0xde9355707d1dc1d4ULL,
+0xdbac3dbe5e37cb72ULL,0x15ad5163a07749e4ULL,
+0x60066563b762929cULL,0x26d2c58e480ebdb1ULL,
+0xc2ad6529ede61c55ULL,0x1ee876a761129d73ULL,
+0xc8343a6adaa87c9dULL,0x58647352885aa68eULL,
+0x486b7c6add110101ULL,0x7e5bccd018e36630ULL,
+0xec3d3ed9a7c880c3ULL,0x60b3e2633c8a16edULL,
+0x8430c5d3dba188b3ULL,0xeea701d529643804ULL,
+0xe972596537ac5dacULL,0x6909582594a2d662ULL,
+0x000cadb1841eb460ULL,0x3ec570447bac311aULL,
+0xd8caac9d53b182d7ULL,0x94da0a1490c3d009ULL,
+0x583735490ac040eaULL,0xb86bd4871e262b83ULL,
+0x5aa580d652b0a680ULL,0xa30047d38cb8d88cULL,
+0x0856716d33494990ULL,0x1540cb7c6d9807d4ULL,
+0xc65954899a272737ULL,0xd449e05091c68ec4ULL,
+0xa6630b314e0083a1ULL,0x9a16edb28b16b6c9ULL,
+0x6a104de140c60334ULL,0xbda4c0ea98939929ULL,
+0x39508aac553e9738ULL,0x93561c4aa0072308ULL,
+0x881c3e263ecae968ULL,0x45c58b8c30e79ba3ULL,
+0x9c56a7dec975d400ULL,0x37932557747220aaULL,
+0x5d78bd255648ae0dULL,0x91d7922287d27483ULL,
+0x7dd37dda1db751a2ULL,0x96846c658ca92c13ULL,
+0xc8cbc39d02a3be67ULL,0x65d62e1204a2c9eeULL,
+0x4b2a7503809b5753ULL,0x8cac957387ae26a6ULL,
+0xa2e7b00d6ba76ea9ULL,0x736eb0a3ce80638bULL,
+0xb707ce35ce156cd2ULL,0x255dadde58e16200ULL,
+0xdbe816d263b058cdULL,0xabda1818c14eee26ULL,
+0x2508ae599e40a11aULL,0xbe394403d2107e50ULL,
+0x8ea50c2520a8c45cULL,0xe0b2b0e21671ee72ULL,
+0xae4513332039c2a4ULL,0xb636c3823720e84aULL,
+0xb59dcbc42cb35c01ULL,0x75addd74450d54e1ULL,
+0x3b98b8e2815660c5ULL,0xa48db60618b7cde7ULL,
+0xee14cb11750c3284ULL,0x78e5e0b97247e0d8ULL,
+0x0bd5d1d327ceba12ULL,0x6562b1332b096ee8ULL,
+0xd46a46483892ade2ULL,0xbb5be4350473e0cbULL,
+0x3c8dce4315223a03ULL,0x6b3c54643087073dULL,
+0xd5b26169609e58beULL,0x444241351e85313eULL,
+0xbe3ae42e46c396adULL,0x59a08430dda92523ULL,
+0x8017244c5a01929dULL,0xe29030053ddc804aULL,
+0xd91461d82434b957ULL,0x502499c0b4bd3401ULL,
+0x8c8ae65c788b1030ULL,0xe987d81154a55b83ULL,
+0xb88eb32a064d8d6dULL,0x32ba48216631a176ULL,
+0x63d8d3d621671e48ULL,0x189e93bea72d45a8ULL,
+0xcc7a72cad37a7020ULL,0x01115aa9bc1e7361ULL,
+0xb64257a0602654adULL,0xeaccaded88a9d158ULL,
+0x18d2ab6aa5c1da06ULL,0x0647021899074870ULL,
+0x9ccb4bb9e6686e32ULL,0xc707d5396246e375ULL,
+0x1b5726e9e8c20327ULL,0x32231c318ead2097ULL,
+0x900cd4aced6472b5ULL,0xda34c34e21409d31ULL,
+0x1ea1e2d7d0db5b63ULL,0xe318045238b15442ULL,
+0x2dd18c507ad7a947ULL,0x1ca463b667b50781ULL,
+0x46ea83e289714561ULL,0x097b9993ec152ebeULL,
+0x83aa4e86cc71ececULL,0x901ac972d4761537ULL,
+0xa07c4537ce8ae657ULL,0xd16757b93e95bad5ULL,
+0x8c986e434b2324cdULL,0x805a9e2157062184ULL,
+0x8d6dd5e562755101ULL,0xc25533ca66d0dbd3ULL,
+0x62d4e499d287c995ULL,0x3113a8020416cb5eULL,
+0x6a21752a62bd1666ULL,0x6e25b7caa543d39cULL,
+0xc99db0de4b791cd1ULL,0x933242e1075e391bULL,
+0x35c9c3435d792e0eULL,0x248ad3e82a784679ULL,
+0xddd5eee0e685b4aeULL,0x408a442879c9ce86ULL,
+0x865c8d87163b0ccdULL,0x080c21c450a6eeccULL,
+0x3855317642cded89ULL,0x617390ba1276d6a6ULL,
+0xb6718722423dd314ULL,0x9037d558ced92ab5ULL,
+0x9b364c912168cbd0ULL,0x336d9e2c59313454ULL,
+0x125843c583357698ULL,0xc7a9d53b1303cd5dULL,
+0x345436b5b984db86ULL,0x73058a40b3e7be32ULL,
+0xb5e34ec7708d1d87ULL,0xea17da5304930805ULL,
+0xbed0e6beade69188ULL,0xee1a51436ada1352ULL,
+0x340c6b2265367bc1ULL,0xe592a7468646cd3aULL,
+0x501458957312ac1aULL,0x3330e0911db36788ULL,
+0x1098eaa61c0d4ac8ULL,0xb38a5e9e9c5cddcaULL,
+0x2c23e6199683676dULL,0xda79b5cade76082aULL,
+0xb4339d6a36b1d586ULL,0x34611b9886d7b032ULL,
+0x5a39592791557713ULL,0x2ca883d0d51ac70bULL,
+0x2983a272c67ba656ULL,0x722a66a21a25d621ULL,
+0x3b34e8e4bb172803ULL,0x0b10a1a3d8ed1367ULL,
+0xe3ad3d62006b5b6aULL,0xd0792a74b5275c5dULL,
+0x04d00771cee8ec96ULL,0xd589ebd640ac685dULL,
+0xbd599d1c49a66075ULL,0x4b480bdb045ca5baULL,
+0x83d5a17ae906d8c1ULL,0x4b0bcbd8b848b96eULL,
+0x76670e9e04041612ULL,0xd4e3de8455e94804ULL,
+0x76d88c0d37d1bb0bULL,0x9955a729b0dbd187ULL,
+0xadeb390141410a0eULL,0xa24de535679e468bULL,
+0x78848ce6d6c239d9ULL,0x08786ad26b849a60ULL,
+0x60441532c41e223eULL,0xe65c410061d3b867ULL,
+0x1ead55462b535d85ULL,0x29c8c1567eb13215ULL,
+0x7a5889947a9b7bd9ULL,0x64eb22d199e97e22ULL,
+0x9ce28238e03487b2ULL,0x24122493a57930dbULL,
+0xe1d7d3deb3e9ca06ULL,0xe7e055ce32b9e5ddULL,
+0xe55143d7bb93be17ULL,0x31207b6e6b005ce8ULL,
+0x33a2cc27de78aed8ULL,0xb810849a25049ae0ULL,
+0x49a6815b10a7e05dULL,0x07883b76d25328ecULL,
+0xbb857671018c673aULL,0x722c22c2babc2ce4ULL,
+0xa08498562d65b858ULL,0x8358843739c7ee39ULL,
+0x3d4480aee722bb45ULL,0x56b3ba4a79dae1eaULL,
+0x40e451edbd789151ULL,0xe76633932b8ed432ULL,
+0x2d0bd4d0b4661e44ULL,0xd251380466065db6ULL,
+0x731bd3507918a64cULL,0xe42080730aaccb13ULL,
+0x77462de05c568a7aULL,0x3942eee5058c72ccULL,
+0xca15994230478e57ULL,0x29b75995584da63bULL,
+0x588bee92119b7425ULL,0x47532da3a4899a6bULL,
+0x298e7413403c4ca8ULL,0xd5c7e441c7255a38ULL,
+0x09272089524ea20bULL,0x28a12a9a9d0e43bcULL,
+0x53e4e041b8ba6db3ULL,0x5664813c06458040ULL,
+0x3bd3ac9ee5cb62e0ULL,0xd429855255000766ULL,
+0x53085e896460bde7ULL,0x17cb700bbeabe26aULL,
+0x6029c727205735d9ULL,0x0924b5b5330deba4ULL,
+0x94598354c8665b30ULL,0xcdceea460556cda7ULL,
+0x9302ddc6082baa7dULL,0x2e1ac9a46d832b85ULL,
+0xc59a1387dc869e66ULL,0xc452ba8bbc54ead3ULL,
+0x9d4210126b50e318ULL,0x201a4eee01b939aaULL,
+0x0848e2e777647424ULL,0xc92c003a0c474a08ULL,
+0xdbb0bb6e836a28d9ULL,0x198bb1825913042cULL,
+0x3e10ae8b94b19ae7ULL,0xd9eba97a6bb5314cULL,
+0x07d2089eb36db6c9ULL,0x23a6128c87b498d7ULL,
+0xc33cdad2a5d7002dULL,0xa0b1044a0320a35aULL,
+0x8bca3e85e1a125ddULL,0xa2c0c347be141720ULL,
+0x66ce0646aa30bcd8ULL,0x9047dcbda721a80cULL,
+0xd772703870c7ba8bULL,0x440ed653ad0db8ecULL,
+0x7e92d9065be76229ULL,0x83a580039102700dULL,
+0x9569600cce400e20ULL,0x88c11bcb701c939bULL,
+0x58bda96db77042bdULL,0xa16741326bc1c3a9ULL,
+0xac1de5b12a614482ULL,0xa1c31e49d26c43e6ULL,
+0x49e2ce2955d6527dULL,0xd9771dde8053ed51ULL,
+0x281969ca17d7d707ULL,0xc905b09b0d88059bULL,
+0x99d92d2a8b5e18c8ULL,0xbbbc2da588c91525ULL,
+0xbaeed982346b6e1eULL,0x6cd708e32ba59a09ULL,
+0x06a2741dbe0834d4ULL,0xdae2cc526d93762eULL,
+0x7ed7b7ca86ca07edULL,0x3bb36e4be3d256d8ULL,
+0xc39ce0c5a5c58a4cULL,0x60763a97c2a78bd6ULL,
+0x60d41c8ab8ad9777ULL,0xe0e1168610c7d7c4ULL,
+0x3415a41218853735ULL,0x739b76184b679ea5ULL,
+0x1ddacd0ecd172903ULL,0x4db5589b0e2bddcdULL,
+0x43731a9e30214c62ULL,0xaa15e0658a2c8522ULL,
+0x8e7c3e1ea58d811aULL,0xe0058a8cb17c66c8ULL,
+0x7a4880b7a7673b5bULL,0xb454847359e4056eULL,
+0xaad65ce0a0d40d13ULL,0x7423b6aca20ad267ULL,
+0xa4b89dc30459a6c3ULL,0xd543a6759ab275cdULL,
+0x1d94391aa0aedd68ULL,0x91daa447934d096aULL,
+0x5940b006c4c2da77ULL,0xb1a2ba6a35c26d30ULL,
+0x752a7366b216415bULL,0xa781580d56a9e01dULL,
+0x1b02e8829bba8a82ULL,0xe88c440d5664b392ULL,
+0xd38e9b40d2150458ULL,0x2301401317ed0ae1ULL,
+0x918c44694bc309a9ULL,0x2d514c64e1b95c68ULL,
+0xbb3c9b6eabb042e2ULL,0x3d4807b72bed44edULL,
+0x2701cce60379dae4ULL,0x4c1025db4ec7a09eULL,
+0x05add00c03621834ULL,0x9ba476e51258a5a1ULL,
+0x7009da1c19246d58ULL,0x5196d50b1a523969ULL,
+0xd29e5d5ee4832e3aULL,0x8e9b712757b3674eULL,
+0x3a9bc4c256bddebeULL,0x6d700d7817bcaeb8ULL,
+0x1b36cec2be7b79ddULL,0x280b975541399655ULL,
+0x1c04427d0769181dULL,0x41de7ad3ba76d722ULL,
+0xe3da01e2d36b7be8ULL,0x495cea2de3893760ULL,
+0x4a1c1a124509906bULL,0x790179e6c6961512ULL,
+0x76e642a27b29517aULL,0x5b66d5bc4e6c48bbULL,
+0xee87a09227ad3a43ULL,0x12c389e727b02091ULL,
+0x41603be66dc3c6e2ULL,0x8b4a6100a9b52059ULL,
+0xcec91c497ada2da2ULL,0x47b4c17caa1e0958ULL,
+0xc7b6e91c1468195dULL,0x38517b1b209cdcbaULL,
+0xad83d2358625eb16ULL,0xaa025cd00451cbd4ULL,
+0xc38724259b5d75ebULL,0x34d3c10d644bca04ULL,
+0x14218b232c65570aULL,0x991a5ca7404115c6ULL,
+0xa96b58e38b881caeULL,0x3b22c1098bc358d0ULL,
+0xd6c9d8b7c63b73e9ULL,0x7123ea345e51a4cbULL,
+0x183632bd857762dcULL,0x03e8d4049d03c016ULL,
+0xd3a5bbc823c0c3c8ULL,0x4e6e69c96cc8562bULL,
+0x5ca5a325dd114933ULL,0xdac37c8c67e8458bULL,
+0x86a54084701cb64bULL,0x8e42e27700879b50ULL,
+0x26d1212ec609bb70ULL,0x88e0795809b74a73ULL,
+0xbcc771968556391dULL,0x4b95b76c4e8a3baeULL,
+0x7dcb30588b7ad93cULL,0x539079e73bc13569ULL,
+0xd22d63ba61819008ULL,0xb0a730a25ac7c235ULL,
+0x1b85124852ac7b18ULL,0xbc8ea7091a5b7518ULL,
+0x145a569d4e8bcca2ULL,0x3251bc43a27eb9baULL,
+0x9ac3b87c9bb44126ULL,0x29edb43c4e52b2d8ULL,
+0x12260e2e8ec138e9ULL,0xe6dec6974c038dd7ULL,
+0x387812d5c3de6eecULL,0x7206b968d0bba8aaULL,
+0x016687b6c91cc9aeULL,0x4232dc00d0683845ULL,
+0xe749588ed4b5a918ULL,0xcca0ae5b5ba54c6aULL,
+0x3006b67daa9689d9ULL,0x64c2dbb8c1050981ULL,
+0x7d076a8157c43484ULL,0x58bb0a34e8a3b31eULL,
+0xee02b28596a6c7b6ULL,0xdbe8ce66a856d1b4ULL,
+0x1c082db2380957c6ULL,0xa8ad6da6220b47a5ULL,
+0xae11b456c6834cb3ULL,0x9ac803098150a459ULL,
+0x95460021599b1ea7ULL,0x5a0811db50a0967dULL,
+0x2d3bd24e4a4b5857ULL,0x7c03cae5e571736aULL,
+0x71665078421019caULL,0xcac4e72a42e39c4dULL,
+0xc0a4aba14dd9a73eULL,0xd709a9dbed507b66ULL,
+0x92c23cb35918cb6aULL,0x441e1c761408b945ULL,
+0xc978470c48030c06ULL,0xb686b005d8c4e665ULL,
+0x4958e4922019b368ULL,0x00a785e2380cd758ULL,
+0xc1bba7c9055b9521ULL,0xbd599c9434159e01ULL,
+0x47b16919d68975c4ULL,0x4133e564911e8545ULL,
+0xc4de24b316686d6cULL,0x11c64da6d326aa05ULL,
+0x0ab9927318e60612ULL,0x96de5d8babb21c34ULL,
+0xd539b7c4aaa2a258ULL,0x859831b97ec78413ULL,
+0x4cbe8307495bc276ULL,0xe70ae6693c027eb3ULL,
+0xd8eabe6bb9b1398aULL,0x8ac770c90c454e34ULL,
+0x135a83bde417c456ULL,0x01da05e4c549605cULL,
+0x349974341754e182ULL,0xd583bd7cd6108688ULL,
+0x2c79d087c1d2590bULL,0xa4bbe7aee2bed593ULL,
+0x775cb7214ed2ba82ULL,0xbcd3151cb9009576ULL,
+0xed076b518c142502ULL,0x39d1a89e553a943dULL,
+0xd7625e28bae2469bULL,0x616bace093c8c3dcULL,
+0xee447e91371accccULL,0xaa65c3d6a1617750ULL,
+0x4159b82e61667ea8ULL,0x0549231ae0b02249ULL,
+0xeabccd8dbb7acba5ULL,0x0e7babe43cb052a8ULL,
+0x4c15aa21854009b4ULL,0x84407ca09768a726ULL,
+0x9ed0c54a55292d5bULL,0x50007e0c76b0ba47ULL,
+0x17d4809ab7766b70ULL,0x7929d8c62eac2402ULL,
+0x76131d2ad57b90c3ULL,0xa5b81b1b629197baULL,
+0xd0929d90bb7b5105ULL,0x84ee19559243346bULL,
+0x04b2e7e46a17ae82ULL,0x05a3749b788dc046ULL,
+0x619ca533d508162dULL,0x46d5499b502429a8ULL,
+0x9a6b400dee8897aaULL,0x9b34743eea68a868ULL,
+0x9b78a0a938dc0a2aULL,0x3c42bdbdc73197cbULL,
+0x8240a90b48a55c26ULL,0xdd6a737db5e323adULL,
+0x08b991335155de5bULL,0x746623d21ee8cb51ULL,
+0x5947ccde6ea0a1b7ULL,0x46ec4d22cb030377ULL,
+0x5c8b9249a04e2be2ULL,0x07ecdcd13c5eac3cULL,
+0xdb996170758a0202ULL,0x512045caad073234ULL,
+0xc7c578aa1c1e8825ULL,0x6e15010a7902e238ULL,
+0xe8ac81d61037b21bULL,0xbebc98a8391c559bULL,
+0x7355d636054e2308ULL,0x462dec56ee7664bbULL,
+0x3183984d8d3ecd84ULL,0xdc27b8bc44c7b563ULL,
+0x84b686d1cc3302a3ULL,0x7000a6a2043e82d9ULL,
+0x2a84edd640ce3363ULL,0x4c39d3cbd7232de3ULL,
+0xb9d4a06d810805bbULL,0x010e449262200da1ULL,
+0xa05761193a5d8508ULL,0x0ee3a2bc961368dcULL,
+0x6464dd1349ce65c3ULL,0x70286c43594cac27ULL,
+0x6a7d2e7e570acc84ULL,0x3a4d1c7abed1e4baULL,
+0x68ce01d152547d30ULL,0xa32bee3783eec4c6ULL,
+0xcc17d59c476e80c4ULL,0xace8bb833ed4e1a1ULL,
+0x4d11954b7d1cda28ULL,0x045285ed0ca1e815ULL,
+0xb6929366051c1ee5ULL,0x7eb8337a54440072ULL,
+0x08947642147b70a2ULL,0xabbaa2c74eba3d9cULL,
+0x73e82761581027aaULL,0x64a6747468cb608aULL,
+0x724e4ed7c2e9b59dULL,0x0eb5d0dbb20011caULL,
+0x99d914836bb02829ULL,0x3ccea95449c3c3ecULL,
+0xaa23c72d289e4185ULL,0xe533b5bb125046b2ULL,
+0x570c7e277317b900ULL,0x730683d1b17e8575ULL,
+0x58061918184a3b9cULL,0x92ebda574e2a0148ULL,
+0x84b036e142672120ULL,0x91ea634da0087ca2ULL,
+0x173850eaa4108b14ULL,0xd43155a9e136b815ULL,
+0xe228617a14cb58dbULL,0x2889914d0e838cadULL,
+0xccecba7a25c967c5ULL,0x0ccb4ee86e2b930cULL,
+0x4b2b116c857beec3ULL,0xb9db44a10714847aULL,
+0x1a9cb3dc65684880ULL,0xeca421a8188c29a7ULL,
+0x6c9ae72125477d16ULL,0x7b4bc443e9548d76ULL,
+0x5b29ab297dca2090ULL,0xaee2c192a43107eaULL,
+0x5546184acda3b4c7ULL,0x98d27a239c87cbc5ULL,
+0xa6c7deec3ec94000ULL,0xbad8add6b0cc80daULL,
+0xb7125c938a6b813cULL,0x58343727766d30e5ULL,
+0x35a85b6b5ba70b59ULL,0x0d51369e27063be1ULL,
+0xda5bde15366b053bULL,0x839e6a78beba4935ULL,
+0x21864b9b054c7dc7ULL,0xb5700ec76c874c6cULL,
+0xc7379d0321b3930cULL,0xd21a75b27132627cULL,
+0x91a1c6690359ca29ULL,0xebc5238ea2330a80ULL,
+0xb03c42c9ca220460ULL,0x8baa30997cd65bacULL,
+0x580bbc34b87823b4ULL,0x96b63ab2ce1b71e7ULL,
+0x4130a507c8798c54ULL,0xa9707d34e68ccc1eULL,
+0x414400775343769cULL,0x10102dd9a5cc8dbeULL,
+0xd0ea9d6d6b1c5ea2ULL,0x806eb9d1a2d6e87aULL,
+0x4d9d8a2bd78e3619ULL,0x61a10a32613e0467ULL,
+0x8d657450235b9acdULL,0xd97452ea52b6204cULL,
+0x42d2baa8c273b684ULL,0x2c42c8761d9959daULL,
+0x1ae68e60b8acd5beULL,0x404016ce568a65b8ULL,
+0x490a5d9eda9bd31bULL,0xd924953ce295729eULL,
+0xa1dc3c8079320b2bULL,0x574e82ccc407c308ULL,
+0xa2cb018e0ac1960cULL,0xeeaa17521ee025a0ULL,
+0x19879c6e2c8145eeULL,0xc29259433e60b7dbULL,
+0xcb27e1725147b767ULL,0xc5381221904ea292ULL,
+0x0c56881dac1953ceULL,0x4c360442eeaae441ULL,
+0x187cb736d4b2bd96ULL,0x3b0d0a11e4bb88d2ULL,
+0xb2dc13136b01c285ULL,0x38d53a3e420445baULL,
+0xe9b953228074d9b6ULL,0xacb448ad939a624dULL,
+0xdd8604e70da0ee40ULL,0x36a0a31895a92b29ULL,
+0x79598aeb6d40e57bULL,0xaea8985a30958812ULL,
+0x741db9de9d71d57dULL,0x0877b2c634de0256ULL,
+0xb74d07db2c848218ULL,0xb85211dca2de4185ULL,
+0x393991e27b117423ULL,0x0464a3d992a424b1ULL,
+0xdb77873e61ec557dULL,0xeb58b95212acacabULL,
+0x00a65786e8b01507ULL,0xe206c9e583309d33ULL,
+0x93210b665c0c9416ULL,0xa41a477614bb45d3ULL,
+0x2b6e0d4b70c26461ULL,0xdece25a9d5a47ad8ULL,
+0x37aadb97224c10b9ULL,0xdba916e2b54955cdULL,
+0x04cc14e5931e984aULL,0x792424abc233093aULL,
+0xccb75d41a927b01bULL,0x1b7e6264ae7ee79aULL,
+0x0a8b7acd7a19d257ULL,0x283ca68a5b4d921bULL,
+0x6c1d779e60c92d92ULL,0x77b937d149a8e23cULL,
+0x13be4375526ce736ULL,0xc3c27315590b3e93ULL,
+0xaa44d3b377dea452ULL,0x986bd7c5918cd89dULL,
+0x8d9d746103d600e5ULL,0x76ab257aaa48a946ULL,
+0x80ca70520d997031ULL,0xe7d69a1785335867ULL,
+0x0b801247425726cbULL,0x5cb71da203469563ULL,
+0xa616022ca6ed00d1ULL,0xb2e7452ca18ea23cULL,
+0xa9812e3338769a1bULL,0x43d7345aee70241eULL,
+0x6d6b1d495970ea91ULL,0xd952e1402eb9b21bULL,
+0x2c7c64c9c186d3beULL,0x84dab0c2a4d391ceULL,
+0x6b6a32340799ec7dULL,0x4aedd9a02813b669ULL,
+0xd5590296db82203aULL,0xd4a7026947c1292dULL,
+0x7a8788291a2930d2ULL,0xa9606e8e582b56c8ULL,
+0xa5d09b82be65bc30ULL,0xb770019c1ed9c158ULL,
+0x9cda7b2c39b7e83cULL,0x02a289256a230862ULL,
+0xbe2667b015ee9acdULL,0xd44343cdc4929583ULL,
+0xc6231381711256cdULL,0xa4e1a391e66a6a68ULL,
+0xdbd98472c229d2eaULL,0x5ab433b42ddd1a5bULL,
+0x3d7641c503c39390ULL,0xbc961ac47211b2b1ULL,
+0xb830d5a4ded43d19ULL,0x7171475d50bc6c38ULL,
+0x64216e6937241a8eULL,0x422375ba0b37030dULL,
+0x984a872bb68ec3aeULL,0x965cec96a797742cULL,
+0x401b9be6892c8835ULL,0x875d77a0c97a8541ULL,
+0x0ebe4413b139e680ULL,0xb1a44a5a36cdae4bULL,
+0x66051e96138e3cc5ULL,0x7173eeda063660c8ULL,
+0x0dd544337647b626ULL,0x8c5593de8e600eb4ULL,
+0xb8ea7d38c5c85292ULL,0x1c7007648845315cULL,
+0xcd30a0ce921da964ULL,0xcbb0963881cd919eULL,
+0x537795b0c9ecc08aULL,0x24919c23739d8c8eULL,
+0xcb44dbacb2ec5078ULL,0x7cc2343bc2038704ULL,
+0x426ca488011aa7b1ULL,0xa213ad8be5d22698ULL,
+0x14cba38dae7cd9b9ULL,0x20904563ae64ac65ULL,
+0x421b70818623a66bULL,0xbc8e9bca104b2679ULL,
+0x04518d95ba63c505ULL,0x5d172592bd517dabULL,
+0xe20cb1ba4791b149ULL,0x511615d260477d4bULL,
+0x6da25de8a720aac1ULL,0x038cd5e86b432d06ULL,
+0xe56cd6575e4bdd66ULL,0x98e4471c06d6ac64ULL,
+0x33bb8d57ea928029ULL,0x6d405d794adb4303ULL,
+0x61774953a1891dd3ULL,0x122675c912888eabULL,
+0x74a77012b979a54dULL,0x0e3c369cd6205ca4ULL,
+0x3a9436c4ba92e71bULL,0x166c9911c063d6deULL,
+0x3b4c6dad0884088dULL,0x1a1e2510ebb9d77bULL,
+0x33b2c34c4ccdd074ULL,0x8304d61606a47c48ULL,
+0x5a54dd3e0a6ddcd2ULL,0x6a0bed1680ec25ecULL,
+0x0089cbe5b8759ad9ULL,0xc1e778a82db74a7bULL,
+0x63a852e65ebc6111ULL,0x4637561c70a4e808ULL,
+0xa3c0081de58ad567ULL,0xea3bd0a2a537705aULL,
+0x042121e76a981b50ULL,0xb4073d915755912eULL,
+0x334cbe8e1eb8852dULL,0x1297de9d41c93e5eULL,
+0xbc8ea12aeb1e658eULL,0x548398ed10d6c91eULL,
+0x8825e23e56c87622ULL,0xe4e5d690c3c9dc80ULL,
+0xec76697871451eadULL,0x2c4ada47b59be1dbULL,
+0x4512c33a19ba410dULL,0x34456ca26b4e686aULL,
+0x0998d1255a414c42ULL,0x04956334d7a0cd22ULL,
+0xc41d81c73267c634ULL,0xb94297a7c8d8b392ULL,
+0xc49e80c81103b604ULL,0x1719e891c5145928ULL,
+0xb471465312ea00c2ULL,0x2e39e74576e6b52eULL,
+0xc4634b42447c2e20ULL,0x6829cc210b3567eeULL,
+0x085d9db6102c53d3ULL,0xcb1a699da421e6acULL,
+0x4ca8d50360be7019ULL,0xd6d43c6377d8e865ULL,
+0x3e9762ebee9238d5ULL,0x29674624bc360a44ULL,
+0xa8bc182289700b50ULL,0x5debb386c94e73e1ULL,
+0x6c4d437b105aebe5ULL,0xce97b2cddbc25cbcULL,
+0x64bdd7d9c46a62c5ULL,0x8b536381c55c10a0ULL,
+0xe4a358c22a257a2dULL,0xd7a34bb15b232165ULL,
+0x505ec7ee002a2d79ULL,0xb2358bd13329ee42ULL,
+0xac93deae8c8b66b0ULL,0x26aa31b9268c66e2ULL,
+0xae847bba9116ac0bULL,0xcd2662495ea7a7bdULL,
+0xe89ad29e504dcd21ULL,0x0aea57e6c2956a05ULL,
+0x5a0b10c842131a7eULL,0x450dde590e756323ULL,
+0x70a59734d6c256c6ULL,0x61b14985e9414acdULL,
+0x8ac190a42543930cULL,0xdc9ad41452421488ULL,
+0x001d44090887eb00ULL,0x9e8d31319b90b320ULL,
+0xe5995e47ebe73309ULL,0x8ec17581c1bde587ULL,
+0xa4a1e1c782a12623ULL,0xc1cb74057e7e9404ULL,
+0x8c153d38c0a1468aULL,0x73e223044735274bULL,
+0x5c72e72ceaa11598ULL,0x57a5323dc34073bdULL,
+0x2a365a0062978d90ULL,0x61a73b8e0b56c58eULL,
+0x4812163169191d89ULL,0xed4946d560494b87ULL,
+0xb1a144bb8438040dULL,0x7668613270568205ULL,
+0xda51a26e0e72d8b6ULL,0x0be396da69795322ULL,
+0x6cb3ee4e99cb4858ULL,0xb95a0db3eca25595ULL,
+0x60ee8648057b2258ULL,0xbeb2736eec001361ULL,
+0x40964784aaec1ebdULL,0xa39beb99b99e23e5ULL,
+0x6db1d88b4d0d2566ULL,0x69d963ad405c1473ULL,
+0x9528ee0757720554ULL,0x0acaa124e49acd45ULL,
+0x19d4adc2a9348d14ULL,0xe3694e2ca43ebe15ULL,
+0xb5dc277448bb6bc1ULL,0x73159659442b4e99ULL,
+0xc62a571b923b11d7ULL,0x737a4754a0d374c8ULL,
+0xb6b7392e449dd735ULL,0x50bed82d9e023581ULL,
+0xc5d80025158d008aULL,0x30e27602039c8d41ULL,
+0x8ac900356869a1c1ULL,0xdad9ae0126a88dc1ULL,
+0x7a58ab8e67ab1243ULL,0xabea23c64caa7ee6ULL,
+0x10865863069445bbULL,0x61806cc2383beca9ULL,
+0x557e991198082924ULL,0x1911de25530c8583ULL,
+0xe57adde8ebe499d5ULL,0x57ca8a4e9c38b074ULL,
+0x92a561aee4967ca4ULL,0x25039dd7dc0964baULL,
+0x897630d684211e13ULL,0x215055560537e5a2ULL,
+0x06dcc377722a98e1ULL,0x6c389bca767a0a28ULL,
+0xbb1a1e6263150531ULL,0xd7d414c1871e7ebcULL,
+0x4d512e3667c6749eULL,0xb62832316814a2ceULL,
+0x5b0e9dd4982e4b78ULL,0x92cb706e3197c25bULL,
+0xa78c797046a76a22ULL,0x86679d031dedc5c6ULL,
+0x6a47c967827268cbULL,0x71c7e6c31dd46ea2ULL,
+0xa42106509c585485ULL,0xccb67e5833b5de38ULL,
+0xdaabd46010ac4655ULL,0xa86b83e374b76b94ULL,
+0x0be9c416c0620e28ULL,0xd8e7c3922d6c72b1ULL,
+0xa81636d0942aa53aULL,0x2e99cd45d9898d98ULL,
+0x64dd7e109d49d8edULL,0x7307be7a9b4865e8ULL,
+0x9a2e87bb76a216b4ULL,0x7170edaee1bd0174ULL,
+0x97cd47da58de12adULL,0x9da0b7bd08123e09ULL,
+0x72a7e22923ee23c9ULL,0xd26352641ade358bULL,
+0x9a2395409b6c0279ULL,0x5eb034067a433264ULL,
+0xc53ce371e8826d9bULL,0xeba2946489c78663ULL,
+0xab56e4a36377ce65ULL,0x0e3211637a68c20eULL,
+0x4047784c3b9bb31dULL,0x9308352d6b6b73d1ULL,
+0xb9d6ccdce50689a3ULL,0xa37a3b890549245dULL,
+0x9b24be8127347e77ULL,0x297ebe401aa095b1ULL,
+0x4c64a885c6575e6bULL,0x41b136c6c8d11d62ULL,
+0xe288ce2ebbde2d47ULL,0x9303362cad396b99ULL,
+0x48c88522a70eb828ULL,0xb246e84b66b0ed54ULL,
+0x1dc41ad95b70e9e4ULL,0x73566dbb6e22e866ULL,
+0x9c9d8207e8e6d156ULL,0xbb1a63a0650de8c5ULL,
+0xd5d00aa4c9659507ULL,0x9786dc2a61c4a0e2ULL,
+0x4a3897b2218ab549ULL,0x39ba98198b4ac1b7ULL,
+0x978b55c4eaac1e07ULL,0x0a38248d85725cc3ULL,
+0xa99e1c983925a0e2ULL,0xd8d8abe58ec20416ULL,
+0x2dced74c73618c26ULL,0x3e9e405bcda5ba20ULL,
+0x219ac306e47126c4ULL,0x21bd49b126ba55b7ULL,
+0x08081a20848b5c22ULL,0x8baddaeb2603a0bcULL,
+0x639b745876c52d7aULL,0x30adcd153c97d0a0ULL,
+0x98163111bda79629ULL,0xca1828ca67e11a26ULL,
+0xd5c5767e068dbe85ULL,0x4b4ee71629b2727dULL,
+0x0b6849cbe5d15caaULL,0x3983c66bcb685356ULL,
+0xcd325e0d9d925895ULL,0xa9ab57c0a7449555ULL,
+0xd21b9c120edea5b4ULL,0x4e8a14dda699810eULL,
+0xd051dba58b537414ULL,0x835a25b0c3d90e17ULL,
+0x50b3008c571a0840ULL,0x203620e8cac5acb5ULL,
+0x74bd8ad162d2b789ULL,0xb89a7b4016a7583bULL,
+0xccbde115d49b7bbcULL,0x73a12ee20bd374d6ULL,
+0x51bba4e726164d3cULL,0xb10adb46dd74a0e5ULL,
+0xc689401204adadecULL,0x51a0b86217e04554ULL,
+0x3499dab677ca88d3ULL,0x9c74258747eb89b4ULL,
+0xba37224ecb9bd72aULL,0x0dd05a81c6c3d3e8ULL,
+0xd987e546681798dcULL,0xa0ec30bc24739571ULL,
+0xe5ee5e24194789c9ULL,0xcae1a3b34d4526e8ULL,
+0x3c57170a043dcb7aULL,0xa1930d8c67e79ed5ULL,
+0x32a436e4d50a3c8cULL,0x2b791677c412569dULL,
+0xe396d6326945544bULL,0x169e78d017ce9e67ULL,
+0x9364ca21b77139aeULL,0x1a71500e9015da3bULL,
+0xd422e9917e07bc57ULL,0x561c8c91079b4e84ULL,
+0x2b8c049177bac647ULL,0x4cc8e00a8e909478ULL,
+0x1498771caad1c259ULL,0xa4a30a0ca8242c31ULL,
+0xa572520d551d7376ULL,0x112e7269a6807ddbULL,
+0xd36a42cb173e1d14ULL,0x8e178b784cc61307ULL,
+0x2edc2e208b7568c6ULL,0x9404852b8c70caeeULL,
+0xeba5a88636903085ULL,0x89872d5c25076428ULL,
+0x8b5eab5e6034a015ULL,0x33dc8ca473e0c756ULL,
+0xed68d1cb4c852c68ULL,0x040c87dce5eb8b65ULL,
+0x384e2702554a3ea6ULL,0x225ce744d0222815ULL,
+0xaacc50b47858ecd8ULL,0x7cab0ca7939d7cadULL,
+0x4d3a9e143936336cULL,0x38d181cbac5c458cULL,
+0xadb968d39edba7dcULL,0xddba4a2514742153ULL,
+0x61b5982b4d2c8e15ULL,0x6ca4e7a4296e1572ULL,
+0xade85d317d3674c7ULL,0x5e292c9a6b781536ULL,
+0xca756109018b9a8eULL,0xd43ac265bc4b5666ULL,
+0xe9c33d0163c3ecebULL,0x725b283c75e8dc5cULL,
+0x207ec1d78128573eULL,0x20d692d746ceb08aULL,
+0x378d7d9e49864172ULL,0xaa86bbd10aad6a58ULL,
+0x7d878d20bd9879aaULL,0x212b9570352c7ae0ULL,
+0xc40e74d92a42b5c6ULL,0x2b3c099e68e79d22ULL,
+0x8351cc9592c6230bULL,0x478b551093a15c5aULL,
+0xa581ee1ce32c3d45ULL,0x8ab31d5638d4b08aULL,
+0x9774ee24c43d5bb0ULL,0x1e11dad0204ed757ULL,
+0x21bba0b1ae787b10ULL,0x54cb9c4e7e9c8701ULL,
+0x261deee27178b002ULL,0xedee646003d653ceULL,
+0x2d38d30975501beaULL,0xe18a99a59277603aULL,
+0x67d94b994ede00dbULL,0x7b90d9ed6769060bULL,
+0x5536b2dbd01e1ce2ULL,0x3cce73e594248e75ULL,
+0x44a5e8321395a977ULL,0x9a449c8e50ebbd8eULL,
+0xb359104abb87895eULL,0xcbc5e65533e74580ULL,
+0xcc1b807556ab8442ULL,0x4e4476dab04480e4ULL,
+0xc5cbb95921768e15ULL,0xd425631e862d12c6ULL,
+0x39279270732653a1ULL,0x97177e1ca57c5427ULL,
+0x7382088e257c5452ULL,0x8672bda60578e4a5ULL,
+0xbbbbc451362e9385ULL,0xe31e908da153b363ULL,
+0x996e1d4083b0ac99ULL,0x120db81ccd6b92d1ULL,
+0x14cc9454827227cdULL,0x97022852792edbebULL,
+0xc2c9227305061e8cULL,0x585b70a3a73825b1ULL,
+0x00ce40739d2e82deULL,0x55413ccd4a040848ULL,
+0xa6882e790213bd50ULL,0x2e4241d6b6a1a893ULL,
+0x4927a2c110dc6b53ULL,0xe0e235b881d1e869ULL,
+0x9b44589d0a3cdd00ULL,0x957cdac95458ab02ULL,
+0xae622207257bdac2ULL,0x38c040085da8bd7dULL,
+0x94b8b143985c0a00ULL,0x4be9533a14d6e098ULL,
+0x447ede91d1da5015ULL,0x4b7dc9c01d4e0271ULL,
+0x8d0c791e4d91a23bULL,0x502c1a3de448ad9dULL,
+0x51568cb0a8321972ULL,0x5b850d79ad612d29ULL,
+0xd7643a4a40176e26ULL,0x4ab579e8615ac747ULL,
+0xba1554d7d81c8e13ULL,0x33241eb3b748c825ULL,
+0x783be578006a4544ULL,0x846d7e8ae69e29a1ULL,
+0x87654ddadd127b1eULL,0x94b3099cbab7b582ULL,
+0xb4210088acecdd77ULL,0xd98888e9e00b9a6dULL,
+0xa83b484d9d055353ULL,0x48c6bbea9209505dULL,
+0x758526335d12726bULL,0xba01dc4473a1d3c9ULL,
+0x39b20cdc900ac5caULL,0xa225293207536c98ULL,
+0x681805d04acd9a12ULL,0x1508e11685a3485dULL,
+0xd341b9966da7c468ULL,0xeadced2736d0ca84ULL,
+0xd6181a695d32a0e7ULL,0xd05459032670a764ULL,
+0xc3ec1034dcd45943ULL,0x53b8b47de2cc2a37ULL,
+0xda1ae552970406daULL,0x27e4c303949cade6ULL,
+0x63d279ee8dccaac4ULL,0xc26b32e539bcd8eaULL,
+0x466e68c15643a7abULL,0x050edaa158166cb0ULL,
+0x009e20b0be50e6b6ULL,0x1b3a94925143a87bULL,
+0x49cb1667c5b0450aULL,0xc52815be2dbc7991ULL,
+0x07534a07be4134ecULL,0xa99ec691176be260ULL,
+0x108adde0e09d87a7ULL,0x854ead7c5d5dc428ULL,
+0x77e7b19654cecc75ULL,0x75d90d53bcca3c33ULL,
+0x61ed1cbccd497519ULL,0x689d57963ab58c3eULL,
+0xa06c06ece09e0c19ULL,0x5b0d0127d7677620ULL,
+0x64e09de2bc149324ULL,0x3b31583e2929bbd2ULL,
+0xbc66a56b7e94981bULL,0xb76276d646eea8daULL,
+0x8746d475eb264ba9ULL,0x0355b76a580e34ccULL,
+0x968607e6bdbb9037ULL,0xc0e705d51bc43ca5ULL,
+0x419746ed5774b757ULL,0x71329721be2cca81ULL,
+0x7494041bbbd5053dULL,0xbbaa46653eedcb34ULL,
+0xa4d7821cddc4c849ULL,0xb62035aad99b9b55ULL,
+0x76a60d3378e035c4ULL,0x86db5123297edd76ULL,
+0x62ea2b991137eb6eULL,0xe1270c953810c00bULL,
+0xa98981ab5e003877ULL,0xded22377e01c6a43ULL,
+0x6bc4d83b842c1a10ULL,0x4cb20642996e4098ULL,
+0xde7bd876877461d8ULL,0x1a93998d40e7ca4aULL,
+0x3069aa311d746deeULL,0xa538d478cc5d8cc1ULL,
+0xb1261aa1b7141e5eULL,0xe4364b8373562213ULL,
+0xcb8a644995ccde59ULL,0x8e44653667ea9b56ULL,
+0xae56602ad366c4a6ULL,0x48e49e7925c08667ULL,
+0xb9cb828eeb34367bULL,0x80527183c1156264ULL,
+0x7d9a1373701b4a72ULL,0x2409a48d2ea89404ULL,
+0x2e66cb4ab2877d3bULL,0x357a9bcb76709b0aULL,
+0x138ebc63ee865c36ULL,0x986850435d069415ULL,
+0x679931325d0bbab7ULL,0x906a66e12cb4d878ULL,
+0x21dd1e93e139ca36ULL,0x32485d2bbad7e53eULL,
+0x6dc2679914d2a2a6ULL,0x0e347e8e584dac66ULL,
+0xa2c73373db8e45ebULL,0x5b5ba6094d989b6aULL,
+0x4b25cb1e832e7392ULL,0x0bb481725c115558ULL,
+0x9658dc0d6b490ee6ULL,0x4a8dab1991c38412ULL,
+0xec8abdc47d236cbdULL,0xd36b47b5d457a146ULL,
+0xceeac7de9ad1e4d2ULL,0x6b0ae53b5157c60aULL,
+0x6d053bed1e213107ULL,0x004aa499e6282b01ULL,
+0x306ee499a9ee9955ULL,0x652b8ceb4ebbcb3cULL,
+0xc07e41c6a9110417ULL,0xe63b5de3b6757720ULL,
+0xbd562c719c2187d8ULL,0x62c6c1874c52a8e9ULL,
+0x9c713a7aeb4aea22ULL,0xa82a340b1726036bULL,
+0xb44588212615d8a7ULL,0x3b19165c4e177891ULL,
+0xb32a5a9ddbc10aa4ULL,0x71a465eb25ad8c17ULL,
+0xedc182bceca4e326ULL,0x92887e3dc7bedc49ULL,
+0x39dc608857491322ULL,0xd423822acc484bc2ULL,
+0xca850b816c8b52e0ULL,0x731650e28dbe6115ULL,
+0x1792e46969409289ULL,0xda779829d561d459ULL,
+0x888c74ba4484ca8cULL,0xbb0a8b10418333d3ULL,
+0x21457d463c2b7060ULL,0x596aa9094b53d694ULL,
+0x17694896364a1ee6ULL,0x284b572deb60d98eULL,
+0xce3a022b4282a8d7ULL,0xaeac5c7774d4e5b3ULL,
+0xb20ab7d32cb2b5d8ULL,0x80156989629086e6ULL,
+0x11ca74c79bc22d38ULL,0x70902632e6818439ULL,
+0xa9e6e8e8b32bcc01ULL,0x0357124de8b331a3ULL,
+0x653ecdeebb883b54ULL,0x627251ddee2cb08aULL,
+0xa08882300a58ab8dULL,0xdd75b86604dcd083ULL,
+0x66e34074a6950654ULL,0x260b9c2ec94c980aULL,
+0xe8cb83ad7d9ae93aULL,0x8beb531c9141b5a8ULL,
+0x59bb478414146947ULL,0x16e3142602a8ae59ULL,
+0x8b1c8511d5ddab76ULL,0x88cca8e29cb04b6cULL,
+0x1a4d7a1b33a788a9ULL,0x4e595903726a7b73ULL,
+0x3874abda5860c8caULL,0x1729b954e694c4dcULL,
+0x41b14375ec6ae561ULL,0x946b496844e45538ULL,
+0xdd5abaaa662be00eULL,0x43d3707e61249e76ULL,
+0xe6a71954d8152930ULL,0x5816d4e253a1a350ULL,
+0x086838ba26a45beeULL,0x4b254e359e559e01ULL,
+0xe87a8b7543217041ULL,0x49e544c36781683bULL,
+0x5d65b52528e031aeULL,0xb536a400150c8c72ULL,
+0x257c7c91c08e9334ULL,0xc369aa2a4e52416cULL,
+0x9aec03012e20b8adULL,0xc98871c16124c158ULL,
+0x1c42bbd6197a07a4ULL,0x1e5d46a77a31ed61ULL,
+0x22a4abd8610e1059ULL,0xee886e6bd88e3be3ULL,
+0xb870a42b93274333ULL,0x575b9d1daee12b37ULL,
+0x5bee14462dd2d29cULL,0xb96729214d0dd789ULL,
+0x00dba11a5bd050e2ULL,0x67ee891de0bcc6daULL,
+0xb5a18117e9a4604bULL,0x5e44a8366dc5110bULL,
+0x370352c4741b314bULL,0xcc9892de085b74ceULL,
+0x3469541b01ab4204ULL,0xbee2eea4e5865391ULL,
+0xe5610c183d9d16d7ULL,0x863eeada38d65c50ULL,
+0xa36a4037d28c57a1ULL,0x9689e473d517e0d8ULL,
+0x51b272a8444be6daULL,0x0937432a2e0a4192ULL,
+0x84274ca6a92b57ecULL,0x64bb184767848e52ULL,
+0xe6206812a2048da2ULL,0xd60ebd335a7b6022ULL,
+0x24beec48dd4e3712ULL,0x9c01669c1337de06ULL,
+0xde5952987e88d7c9ULL,0x816805c9ab68cc02ULL,
+0x7554291cb73e8154ULL,0x3a53c8ec92b05803ULL,
+0x5bbab6136e926e1dULL,0x9c5de5ba29d7342cULL,
+0x9000885363d62982ULL,0x1c3c6614bb76b081ULL,
+0x454201b4bd47d667ULL,0x2548be8e73da073eULL,
+0x4b3d5c4ed1148474ULL,0x66bc02c1c797569aULL,
+0x2d532ad09a6568a3ULL,0x448c6e74083b05ccULL,
+0xd723c78c98c011aeULL,0x7801c4598cb80461ULL,
+0x711265b44beee7c5ULL,0x03ec7ba6e5897393ULL,
+0xbb377a7c7372de62ULL,0x0a7830ae152417e6ULL,
+0xaed1c9a18cbc9bccULL,0xcba166beae59615dULL,
+0x25ebee96377c5027ULL,0x026454036b79733aULL,
+0x8c40ad16925360e9ULL,0x80b86ad628258a02ULL,
+0xe48c78bb878824dcULL,0x50cd52469505a71dULL,
+0xbb8b3b74e92b0b15ULL,0x6c5b381ad08d7cb3ULL,
+0x5ec32c0a91354b0cULL,0xcc78753d6401e870ULL,
+0x0e3e385d3265a273ULL,0x9a0248297390175dULL,
+0x0ee923a65c554b46ULL,0x9768950c6da1dc05ULL,
+0x00abe064ee47a897ULL,0x4ba257ac77c64977ULL,
+0x45493e075903ddb5ULL,0x28196aea129d84eeULL,
+0xbd068aaa57bc9c43ULL,0x1e204da7719235d9ULL,
+0x7574883141279c52ULL,0x64c17c5ae97d425dULL,
+0x4357860dc98dc287ULL,0xe7447ca57ca7cd14ULL,
+0x4d507047b02ce425ULL,0xc1b0cc8c7b664319ULL,
+0x37e4ae39d6157605ULL,0x066dc74844592976ULL,
+0x58b5d27cc76048e7ULL,0xd67a5a97b4354827ULL,
+0xcc26881e2c1ea8ceULL,0xe0401be8ad43b8c8ULL,
+0x84579a53547c6a1aULL,0x70ebc0adeea3017eULL,
+0x8e7a425e54626931ULL,0x763313ce63ce2a48ULL,
+0xba1812a3ce328470ULL,0x8210870541ec568cULL,
+0x450745b30a42d3b0ULL,0x5e0c77a90ea902dbULL,
+0xeb8e8294c62dbea8ULL,0x13d49331dd40a0e5ULL,
+0xed82ac6620c8ed73ULL,0x124681d580b80958ULL,
+0x2147aa6a39957470ULL,0x69670d856d9460d9ULL,
+0x581972ad83973bb9ULL,0xe1abab506a10a866ULL,
+0x8b0e53b00c33920eULL,0xc37ae37ec1464caaULL,
+0x818b1798c305ce5cULL,0x6d8e6666653c6bbbULL,
+0xe10b8a9d951e68ebULL,0x6bc6173494c17c02ULL,
+0x13ebea41ba20934eULL,0x651bb12ed345711bULL,
+0xd044a01ee74709deULL,0x5d8947bd2c0a4577ULL,
+0x31c7da6eec13176cULL,0x4b3c668129172b82ULL,
+0x14bb8a2ce8828e2cULL,0x838e32093e02a107ULL,
+0xca856805893c5eebULL,0x8a8d864a84a8c97dULL,
+0xa761ed1db7d1c7edULL,0x909ac5d17b6c009aULL,
+0x4ba163dc525ebeddULL,0x8d71ece0579ebb87ULL,
+0xe5185ca9781950c0ULL,0xa84c5a0e3c293e89ULL,
+0xeb4c762023108c11ULL,0x05a6cbe570cb6a69ULL,
+0xaecdbd10b94ba03dULL,0x1643cbd5e86cc07dULL,
+0x5051cc86aba76a7eULL,0x4ed31704d6e9ea76ULL,
+0x23ecebd8a3eb17bcULL,0x1ba8be57b4c65e85ULL,
+0xb2a944c039dbcd5eULL,0x18e905c841895784ULL,
+0xde27604062e78687ULL,0x18a864d399ee8daeULL,
+0x99743eeaba3883d9ULL,0x9dbe217a109524c9ULL,
+0x87ce73ccec3633a7ULL,0xd56a278a6008602cULL,
+0xa2ac1a4b2b34c115ULL,0xd36b5c520370c310ULL,
+0x414bcebea8bb94aaULL,0xbb3ae7de043c0020ULL,
+0x4db732898371e2ddULL,0x3caa52aac8b292eeULL,
+0x100e12a4dee5eb97ULL,0x00903aa68ce7b131ULL,
+0x027e4056547171a9ULL,0x54e25aaab597336bULL,
+0xe8c953144487568cULL,0x60a06314784981b8ULL,
+0xb157bab838b57e7eULL,0x18875aab02eed431ULL,
+0x263653e14c9a27c2ULL,0xe58c566943d1a985ULL,
+0xea580c4abb76a7e5ULL,0x9235d3e755753658ULL,
+0xcc04867ab08a64daULL,0x019a8e0b12c18435ULL,
+0xe9d6cb3de85bd60aULL,0xc27e0bdcd64a1225ULL,
+0x3c99d6d07c93c962ULL,0x3e8e140c5c240b68ULL,
+0x34c9b8711e38418dULL,0xa56c756443a833a7ULL,
+0xa735d64be9087939ULL,0x47d48d391476be55ULL,
+0x12be5e816b2de1d7ULL,0x386b8ac19919dca0ULL,
+0x6c9ce47446ca7798ULL,0xa75693ed12b57067ULL,
+0xe1285d2edc5ba398ULL,0x3bb084db640b308eULL,
+0x9a24509a438db11bULL,0x3499e4950da9600dULL,
+0x1a0ab444ab0c37e4ULL,0x04c3889e5013de82ULL,
+0x43a7a7791d35e370ULL,0xee07ba22620e01eaULL,
+0x5c6bed6d0c0c09eaULL,0x57b144393516a0d1ULL,
+0x9c64da0067114eaaULL,0xbe65a4444e37aadeULL,
+0xd2ceb65de2d03b3dULL,0xa19379a1949a25abULL,
+0xa9d2d376b5d370dbULL,0x7a143326a84aceb0ULL,
+0x6abc82d73bead563ULL,0x7935995bd34beda7ULL,
+0x81c09e59c01a409dULL,0x1753896c27286668ULL,
+0x5397edcc982723beULL,0xa84a4848852c059cULL,
+0xab98c80eb638132cULL,0xd4d819e87607c6adULL,
+0xb51e705141b15c7dULL,0x075987baa10e4401ULL,
+0xd7d42a448d82e48cULL,0x0adb304500aede42ULL,
+0xdac1dc3eae15bb57ULL,0xc7ae6e2cb9b5dc84ULL,
+0x7d196cc1a5bddc01ULL,0x111b4626ccb5e729ULL,
+0x2e407ed5e606e8e0ULL,0x7a88482c65d9d87bULL,
+0x0dc1bd839653c21dULL,0x9e5e08c772d4506cULL,
+0xaeac9c1603012525ULL,0x5494ec4de22a74adULL,
+0x5752469a2c840324ULL,0x6d0b4bbd67a0570dULL,
+0xcc004d8646411092ULL,0x70d00087a165c473ULL,
+0xbbc68537134c7462ULL,0xadace4b71d0a222aULL,
+0x05128066c38d9647ULL,0x86625283bb195020ULL,
+0xce36d6213a8bbc05ULL,0xc0431b7dac518a8dULL,
+0xe577bb1be05008aeULL,0x088311376280d7b5ULL,
+0x7370d61ceae474ebULL,0xb8b1aa786bd1063dULL,
+0x0e709c505472d27aULL,0x397e6a69d78961a1ULL,
+0x36e9ecd4cb615491ULL,0xebeccc1dce298bddULL,
+0x143527d8379613bbULL,0x4c0534ae040ea948ULL,
+0x9566547de561bba3ULL,0x2d1101577db13783ULL,
+0x78ceb01bbe1da926ULL,0x1c40d31cea43b074ULL,
+0x5b0945ae3618c712ULL,0x51c6a3324334676aULL,
+0x30551975891de116ULL,0x0ec75a7a5e6026cdULL,
+0x25506b26123e4b0eULL,0x2d4618ac48bb49e4ULL,
+0xe9ce753a1892c4a6ULL,0xb21d8d637603daecULL,
+0xcd49d5dd49294b79ULL,0x3799b817de1be0a7ULL,
+0xa314957d8c139601ULL,0xc5350d09a0bec9e7ULL,
+0x7d6b67b9606e90c2ULL,0xce8e612a7c34bd1cULL,
+0x40ae14cbd76d0719ULL,0x2dc07a225b9783e8ULL,
+0x0542de33ac7c4328ULL,0x70cc31c58b21badaULL,
+0x48751a4689a729e0ULL,0x718b911233741d0dULL,
+0x4907ccc94c0de01bULL,0x18c0c45633c474b6ULL,
+0x77b34e2043cce124ULL,0xd97c5535bdba9839ULL,
+0xa521577b31c87c95ULL,0x9569218ac997b643ULL,
+0x5b93477c95e0eaa9ULL,0xb83786a73db54373ULL,
+0x211b89485cc2673bULL,0x3248ac181b1be73bULL,
+0x3db2b28b0637bd85ULL,0xc9d95d30759ec829ULL,
+0x537d0264d3521122ULL,0x3504ae02cc0cdd49ULL,
+0x333c727ceaeae2c7ULL,0xbe15126377087145ULL,
+0xec8645e9a7546d3aULL,0x7e10ab054e43d180ULL,
+0xc5387007d72d3014ULL,0x7723de9047209d30ULL,
+0xec4eaa4027772219ULL,0xeb853e77560edbb4ULL,
+0x78e14834475dc0d3ULL,0x7cb24d7a9c41a37cULL,
+0x9b5515a9e1210cc0ULL,0x7bea04670b3d109dULL,
+0xb45890070ce12440ULL,0xe9c9062d79e525daULL,
+0x3c20ca926dc172d5ULL,0x25089bc61c64ad12ULL,
+0x9b798e60602c38eeULL,0xca8563295435c856ULL,
+0x1b1cb1849b793ae6ULL,0x186d5ad59aa2b78dULL,
+0xa5d307cb3cb7763aULL,0xe58741b608e29186ULL,
+0x240ccdc4a877315eULL,0x10a0ad8a96ce40cdULL,
+0x0154814dc6756e59ULL,0xde49d39ee7deace1ULL,
+0x73aae18773b78dd9ULL,0xaa08842d8b0be6d6ULL,
+0x13c6916bc2c7145dULL,0x54669385cb5cd5eaULL,
+0xd3ca2b8332eb1723ULL,0x34b3d250dc75b168ULL,
+0x606114a5b3116401ULL,0x4e493ccc92578716ULL,
+0x73ee54771734380eULL,0x3a9d2ea974143495ULL,
+0x5a0b1475d72eae20ULL,0x0424e70804a5c1d3ULL,
+0x640ba7bbd353d094ULL,0xd82905c855c9b569ULL,
+0x7dcdb4bb0a40821cULL,0x926927e507365022ULL,
+0x13694245c05d0792ULL,0x9a62924c0ece39c1ULL,
+0x145ece7576774b89ULL,0xba649eb5c81d4374ULL,
+0x5e2adaa5c13769b3ULL,0x61bd8dca76182253ULL,
+0x9818176d0cbadd14ULL,0x61b08e89c424ea4eULL,
+0x7aa6c3400eb52e48ULL,0x671d041cced1d46dULL,
+0x2dc8861b18bc039cULL,0xe3ec68dc7b4dc748ULL,
+0x9dd2b5ca4236b665ULL,0x7d9b0adc82c18baeULL,
+0x7ab50abc6451d882ULL,0xc7ec6a87a20c3910ULL,
+0xca0967cad10ca999ULL,0x04e69a0131010e5eULL,
+0x5602a7668482b814ULL,0xd43713dbec873257ULL,
+0x4a64a86692181821ULL,0x11a2d7c93e3e32c9ULL,
+0x176002ab49e3d8d8ULL,0x2c12624e6e3094cbULL,
+0x7d0041780ca04ec7ULL,0x4b51e465e7e297e4ULL,
+0x5a9cd61cd7c988b1ULL,0x512e4827b2dd51bdULL,
+0x6ae974024486e84bULL,0xc5d98d12982b771bULL,
+0x72bd1c60d92255c8ULL,0x3797e40797ba4d91ULL,
+0xa90c66ac97a86492ULL,0xa3e1b9d13804c682ULL,
+0x032de51a591c10b1ULL,0x071008c86549cc40ULL,
+0xbcc859372311aac4ULL,0x14a4b0b9b64e1053ULL,
+0x4265a716b2a23090ULL,0x906da05dba2044d2ULL,
+0x2135ac2ba982825bULL,0x26372c8e7368322eULL,
+0xb67d897b37eae381ULL,0x90ce53e60690cc49ULL,
+0xb2a96ece7855742bULL,0x969a61aa44a744e2ULL,
+0x0a445da9a10d4de9ULL,0x38b4d23ad9b92738ULL,
+0xc3b43183b7d86ebaULL,0x6c38cd9a686da836ULL,
+0xdd1b82851a6d865dULL,0xe8265dbe66e0455bULL,
+0x38742605ed68ec09ULL,0x27c033ec9c3115aaULL,
+0xccccd4322c036d8aULL,0x9754663cba409b91ULL,
+0x3171a260c3ecd31eULL,0xe4c956adb6168104ULL,
+0x76a310293927bda8ULL,0xbe9566335901430dULL,
+0x90d0983a7a9ed0bbULL,0x440aa10a9ccb2e66ULL,
+0x6a1d6766377324e9ULL,0xd40d22da1be71123ULL,
+0x58588b28d45a3697ULL,0x18862a8b4590c549ULL,
+0xcb70b8e3bad0e2edULL,0x8e082911209086dcULL,
+0xc7e9788b182cdb14ULL,0xe4100007d461609aULL,
+0x23b279bc65a5c544ULL,0x7c811e4e32799640ULL,
+0x8d0b8bb5aa57c03aULL,0x139107c1aae72935ULL,
+0xe26d1a9750874bc2ULL,0x56355c5076968687ULL,
+0xb46344985336b81eULL,0x157162bdbe65e469ULL,
+0xb507a446ee36b143ULL,0xbe5d860699b7db7eULL,
+0xeb41d93c3642be68ULL,0x77ba2191926585b4ULL,
+0x6be39e43e5690a86ULL,0xd9619359ce52bea2ULL,
+0xc4d91aa97c135a36ULL,0xe9cce6cb7683d000ULL,
+0xa6ed60b91c330b48ULL,0xa1aa30b0c6177b22ULL,
+0x31272c6c1ce4e94aULL,0x1a725935a61e728cULL,
+0x5720644d78bc74d0ULL,0xd142a326ac6e2dcdULL,
+0x59d94aa51d5623aaULL,0x0db6381bde2b21c1ULL,
+0xac286423b4e47d77ULL,0xb8b3227324be77b1ULL,
+0x7091a897790d15ddULL,0xbbed09ba3cd1d7e6ULL,
+0x9dc9760ab8a5e1c9ULL,0xa1c7a769c2e70dd9ULL,
+0xa55516a90a57ce89ULL,0xc60d15267210a394ULL,
+0x044989a05270ca83ULL,0x03474bbe1b66b579ULL,
+0x841d379d28b99138ULL,0x44e05a597a14c612ULL,
+0x4a2733d2d7d6b785ULL,0xda4b229ddeb874eaULL,
+0xa3b0aace53477717ULL,0x5a3ce288e1ac078bULL,
+0xe54b0cd01b1b4859ULL,0x2eddd9b77b9e5a26ULL,
+0x3de832c73b79417cULL,0x017c877c0228ae0bULL,
+0x3c86a09011eb47e8ULL,0x92766bca5c7b85c1ULL,
+0xe0abc84cddb6722dULL,0x1a6adbb3e26c41e9ULL,
+0x51d462a12aa17542ULL,0xa83782ed47db14e5ULL,
+0xe0518c79db794343ULL,0xd7d0e0251c05dd84ULL,
+0xe2304cae4dd34813ULL,0xe18ec49872785ee0ULL,
+0x71d94007c2bcd487ULL,0xa7702286022151a7ULL,
+0x6e0a780208824dbcULL,0x5dedd760dc079ce8ULL,
+0x4979bb5e9c3254a4ULL,0xa3136515ee9d1130ULL,
+0x431281053ac5514aULL,0x75105972ae679061ULL,
+0x672ddbb56ccb2d4eULL,0x04642b0bb396c443ULL,
+0x42b5c7d4b78940b1ULL,0x60a202b35dea545eULL,
+0xcb8a7ec5e3e0031eULL,0xe2293e54559de810ULL,
+0x298ad8a649c15ec0ULL,0x1b766944ad9608caULL,
+0x5b263ee93dce0e46ULL,0x447dc506613d18adULL,
+0xa0b0860410c6ed49ULL,0xb91acb353acd9505ULL,
+0xce84767a6a731288ULL,0xc7b280dc872eb1d5ULL,
+0xbee80d1380027b4dULL,0x56c5693c9714b16bULL,
+0x906804cc681a9a34ULL,0x8d27a139204dea3bULL,
+0x3416972db33b0769ULL,0x8e1655da06e77259ULL,
+0x1c1922a0a8438972ULL,0xdd7573cc06455140ULL,
+0xebe5769469b98a44ULL,0xc29e833da1e74869ULL,
+0x9d3ed56b2b8979e5ULL,0x7dbe2b63680d86b8ULL,
+0x86cb48d38c542633ULL,0x12879218ec25bdb2ULL,
+0xda58a3ed795115b3ULL,0xeca817564e5de791ULL,
+0xabb186a7924325dcULL,0x5e778a5c241a9153ULL,
+0xdac3a8b2752a1cdcULL,0xbc601c3134dbd3baULL,
+0xe31914aa859d84a9ULL,0x9b55a11bb668c625ULL,
+0xa3873a5deb21489cULL,0x49579229c9d9ae1cULL,
+0xb84a1365292e8056ULL,0x028e538ae249c716ULL,
+0x8767a2b53be3e395ULL,0x8090d252cc162cb0ULL,
+0x53278cce5326adcbULL,0x044dc8b570d65e4bULL,
+0x909917887a1ec0b9ULL,0x168ed0202a055c96ULL,
+0xd27562b1942cd76cULL,0x3aee7408c609eebeULL,
+0x62494674ee2d6b9eULL,0x6b981980892ab3e7ULL,
+0xd2c01896c911316cULL,0x1d440ae04c08eb93ULL,
+0x8ad5bb6704a2ec19ULL,0x7c3c3ce7e4897267ULL,
+0x9d67e96da6901db0ULL,0xd9cbd354467432e8ULL,
+0x8e8b8d99a228abb6ULL,0x905169722305011cULL,
+0x615c09cca0e65376ULL,0x11635b414d2bda45ULL,
+0xa829d9960b0ecea5ULL,0xb8409a4777ccc360ULL,
+0x3e5e8ea79d754c66ULL,0x34012052661164c5ULL,
+0xcaea8734d8957d19ULL,0xd29873b1dae3a0ecULL,
+0x5e6c84e74cea779eULL,0xa1337a2d072be4d5ULL,
+0x532c7494d3767e98ULL,0xbd3ed28ad9b974dbULL,
+0x776db023bbcc23beULL,0x1199bb25a8455004ULL,
+0xd6de8a0315116227ULL,0x96e8587410931b3dULL,
+0xdd3b6c6855a77311ULL,0x56e9796494ed2731ULL,
+0xd02d1037d652a7c9ULL,0x085a4813e1c393b0ULL,
+0x82de78ed0c9e33abULL,0x995a22a5abe21a52ULL,
+0x7e9499db9b8d462bULL,0xc91448a30403ea8bULL,
+0x80be0ce327e763baULL,0x07e8334ae6ae18e0ULL,
+0x1c5592ee6dd34040ULL,0x41c36823491a9ee6ULL,
+0xa95b4c70c1b6cac6ULL,0x2b771ae70e811748ULL,
+0x0c674a492ce9721bULL,0x61d6b91a3abee752ULL,
+0x3b83aed47289e132ULL,0x0476582b79d59c01ULL,
+0x8ac609064931398eULL,0x14d9e8db8a7383b8ULL,
+0x64d737a50ee4c9d5ULL,0x94a811a23d516c49ULL,
+0x263c055b8c590e91ULL,0x09c7ecd8b132c056ULL,
+0x05188d8b54764d5bULL,0xd6444c2c24ac207cULL,
+0x2e0e76165c041db4ULL,0xd78ebdb0a3d7edaeULL,
+0x9b423530e7ae7e03ULL,0x3c200369d02ecb80ULL,
+0x78d5b0d6a02977b6ULL,0xb8d7de95c13483c7ULL,
+0x979de6698ccd0e23ULL,0xdd48bea81e29c140ULL,
+0xd5a3aceae06e12baULL,0x5761d1ad01db8395ULL,
+0x82b48a514283570cULL,0x8be41d400610a5b4ULL,
+0xa8b52468190aa19dULL,0xa84250ce7c308424ULL,
+0xea9d90cb055e10bbULL,0xc000807bc17c6a76ULL,
+0xb75be9a37048c662ULL,0x7c3b7de5ab578d04ULL,
+0xc9537a5329499955ULL,0x8a677423578e4e6aULL,
+0x340830d643b751ccULL,0xa87dd093479ab322ULL,
+0x1d9097d93db7075bULL,0xc3ba20876d97e781ULL,
+0x264c1ab0c08c7d90ULL,0x3ecb3cc5c2ee94d1ULL,
+0xe8c92909da95e3d2ULL,0xc10233c6a7383241ULL,
+0x94d571744568a83cULL,0x258042a042d694adULL,
+0xc44da8012c5b1803ULL,0x868ccc094553d944ULL,
+0x3047abb9a8307182ULL,0x66b5c437c4c39a6eULL,
+0x9266bb4964db1a81ULL,0x54164456e2852485ULL,
+0x161c7b855b0b9519ULL,0x1a81935b2d84e1bbULL,
+0xcd5612e1cb3e4e03ULL,0xea93404e4aec2c14ULL,
+0x421bdc8955d86c95ULL,0x771b3697e1d95b03ULL,
+0xbd90d0d385e34651ULL,0xb62ace239cd05c00ULL,
+0x96d90405cee11015ULL,0xd611d650890c3e9aULL,
+0x4d989343e1804748ULL,0x2bed1c4bee69291bULL,
+0x2643a13c5d1527b4ULL,0x676ab0e018424e7bULL,
+0xcd867e60c7e5d55aULL,0x193b229c4292045dULL,
+0xe6d0c114607222c0ULL,0x2a94baa1aeb2782eULL,
+0x8341baed6aa0697bULL,0x84a4d747221e9b92ULL,
+0x1a294e62dda140aeULL,0x4eb4728eb8b8d699ULL,
+0xba30a43ea394069aULL,0x6b6884e30306cc92ULL,
+0x694481ed5d19135aULL,0x28b4781ceb5b2037ULL,
+0x529c72b5e979b805ULL,0x539de49735a7c523ULL,
+0x80885ea246bb69ddULL,0xead380a52d5339acULL,
+0xe0cc1ae2275e206aULL,0x7328d309e9a897c3ULL,
+0x160a430a4d0e7b40ULL,0xbd91d27ba1b9466dULL,
+0xeea356832a6a18d3ULL,0x1784e62141128930ULL,
+0xa04720b58dc92841ULL,0xb58818dea8e7ac71ULL,
+0x5d3029342bacba36ULL,0xbcdd0707519dc459ULL,
+0x6b9c0b25d7d8b00cULL,0x8d0e559674aea820ULL,
+0x794e196a5a84aa06ULL,0x4ada2a4e92cda1c6ULL,
+0x51c60cc52dd57086ULL,0x37349c988e1c89d4ULL,
+0xcbb3747c00021b5bULL,0xc2cd944debba5c2eULL,
+0xd87715ece50802adULL,0xcca902d4ab6c74bbULL,
+0xe0b912b16b517403ULL,0xe99c32ab8947ca3eULL,
+0xa74bd65dd46d018cULL,0x3903c1e06d29d6c6ULL,
+0x3e12bbe6233174a4ULL,0x8e5ddcb1ee921d04ULL,
+0x70593e2e40bec53dULL,0x4645cb7289e088c1ULL,
+0x9cdd8094d912ebceULL,0xb142cac672236aa0ULL,
+0xab81d17b6943b445ULL,0x54ce58c8c3332bb8ULL,
+0xb78459e19125e45aULL,0x8eb3086ed1e4be82ULL,
+0xe682cdd5eab036b9ULL,0x9022490e2bc766ebULL,
+0x5ace37b70eee402aULL,0x55ca82da48e56c42ULL,
+0xb43bdc6c13ec14a0ULL,0x477c791aa509164eULL,
+0x2ab7e07113871dd3ULL,0x3b19c8180bd377eaULL,
+0xc46dd95a3d4a90d4ULL,0x3e8a3b36c97342a9ULL,
+0x8dde9508a50a2834ULL,0x41283be99468a65bULL,
+0x3ec299db87c0c92cULL,0xa9d2dc9a007cc47bULL,
+0xa9d93266365eeee5ULL,0x60e5a99c1a640addULL,
+0x89928b288eb1b67aULL,0x3055ed7001bcbcc4ULL,
+0xd4ed8a5d202116e6ULL,0x58b90bce140e57d1ULL,
+0x7b3e88cc7532e90aULL,0x80214c46d15add75ULL,
+0xa3639aa580432d40ULL,0x9a132c04136cee30ULL,
+0xc33c85d7277364d3ULL,0xad37829748c7a5a0ULL,
+0xeaed261dddbb6c42ULL,0xbb4bedd99b0c905aULL,
+0x504acd53b0582239ULL,0x354481ae8293a8a6ULL,
+0x9553dc63026145cdULL,0x66862aa5db38b5e0ULL,
+0xabc3602a01e9b87bULL,0x9242bb5438e6875eULL,
+0x940683bcab560aa0ULL,0x5bd948edbae3767bULL,
+0x1b21d6e33a82d592ULL,0x77d025e14bd1c779ULL,
+0x157cc8db0043a1bcULL,0x9ecea18ebe6485b6ULL,
+0x8d56a5e80560933bULL,0x57a1ddc61cd2c909ULL,
+0x67220b6de3ada788ULL,0xaccbea1eb2e8c2d6ULL,
+0x89c02e35d721dce8ULL,0x382e6c4336dde701ULL,
+0x76941db41b978915ULL,0x2ca80e95eaaa99deULL,
+0x3b897912d51020e0ULL,0xad2438127855e0c3ULL,
+0x72d1e6240711d202ULL,0x68a33bd4eeee5510ULL,
+0x7129cb3d14776ae8ULL,0x7d44d0a8d5564e6aULL,
+0x0e8a143710223991ULL,0xba2eb0a0357aa73cULL,
+0x0c1d95eabb6c0b6aULL,0x51ca8b793e55ac61ULL,
+0x1c259e1ea86c3422ULL,0x9633342c3e28406dULL,
+0x07c57c515645c3a2ULL,0x911a9cb5093ae33cULL,
+0x1aa4785963e734b7ULL,0xd135a88e3c461168ULL,
+0x3b8001549e8b4718ULL,0x225856e0d5cbc040ULL,
+0x44e1b5088097b4b0ULL,0x3e0e4d2dc75ea611ULL,
+0x27ab07e29c12ae30ULL,0x3490cc8262d3c683ULL,
+0x2d7d4b4a124ccd34ULL,0xebae2730a87941e3ULL,
+0xb1c7ea0b92b9bd36ULL,0x94e78d98306a9131ULL,
+0x7aea203c20d7ce6cULL,0x33b7a2d5c4c6e942ULL,
+0xed1e50e5aaba00e4ULL,0xc692a9b6e6d16a9aULL,
+0x985c2154eed3059bULL,0xb966728e04239ba4ULL,
+0xbd48d3a99a09648aULL,0x64dc47804d55cbb3ULL,
+0xb6c7b2793d2e77e8ULL,0xc3cca6be29657220ULL,
+0x45ce6c278c8357e9ULL,0x2d742548784515dcULL,
+0x18a0508e7d36b565ULL,0xda6626ed4781bdb7ULL,
+0x15c734296655a77eULL,0x35473bc22daae24dULL,
+0x7dec32e8917608d4ULL,0xead820d5453b342bULL,
+0x48a23b5388aa9571ULL,0x5b8e6a8040577464ULL,
+0xca3b7ea21d041706ULL,0x49730c7235ca24aeULL,
+0xe487039701d9687bULL,0x28dd848a38891694ULL,
+0x25c89c48ab9c92adULL,0x80c1cc6a8a05ae87ULL,
+0x2c63d518e9641470ULL,0x2b8e85c0c460a4dcULL,
+0xd1acc371c19636d4ULL,0xb4d0da11152789c3ULL,
+0x198c2d8ead066a21ULL,0x4c806dbb7e99760dULL,
+0x335dd54c26319ee1ULL,0x68a54ce729ea7491ULL,
+0x47141ebe75957b65ULL,0x3885ec4b2527270aULL,
+0x747d0140d2a91d35ULL,0x218c3157c0e56437ULL,
+0x5bbe5d96b0e0cad1ULL,0x11eec910351e7b9cULL,
+0x5ed08157881ca72aULL,0x1b10cb4dc1e3ebbaULL,
+0x81a8e198b5ea925eULL,0xe2d7052608695993ULL,
+0xac1c5a21ab1bd16dULL,0x6c862cd17a33861cULL,
+0x58e39ad961097d46ULL,0x8361a563537c70c4ULL,
+0x1cab4182c0eda479ULL,0xe600edacd1abca9eULL,
+0x306e81096bedb828ULL,0x4cecd15dceb68e97ULL,
+0x1b2a23252e354579ULL,0x4a8649e3001590d2ULL,
+0xad4a2a924de8c8a9ULL,0x2885da2db3571e28ULL,
+0x37250ea8948e8c97ULL,0x7589515ce6b0a527ULL,
+0x7d8b81a941525ae7ULL,0xeb43b5cc84c9d38eULL,
+0x8c35db929923c1b1ULL,0x355ad41bab852025ULL,
+0xb9369acc0c466268ULL,0xe3b7b24aac3d8433ULL,
+0x1584ca4a188707c7ULL,0xb10a4a5a5dc821e6ULL,
+0x16be7000bb8ca6a1ULL,0xc6d79aad3c26668dULL,
+0x3324142ad5e4ace1ULL,0xca9599244461002cULL,
+0x58e5d72e39d52e81ULL,0x99be3155ccad95acULL,
+0x708ad8a4cc527990ULL,0x1b464b4c67eb6588ULL,
+0x32038101ad31114bULL,0xa61ce27bd5862e5cULL,
+0xdd2514e6b03053b7ULL,0x0db6e80a97924bd6ULL,
+0xca752e8010611263ULL,0x201da8988c462285ULL,
+0x5d6015e42cabc848ULL,0xa58da0087a95070cULL,
+0xe828221d749dee23ULL,0x68d36e81de5d5accULL,
+0xe43ea286bd3c3d2cULL,0xa2a7e052b91a4800ULL,
+0xc24634e7711d590eULL,0x237630a7d16719d3ULL,
+0x7205de1e1ed0dd02ULL,0xec81a52c82ed783cULL,
+0x8a7b006763a73505ULL,0xc39608675be69637ULL,
+0x8962d58953d4465bULL,0xbe1ea18254eca515ULL,
+0x14847b3a1e891757ULL,0x25cec1ed31cc47c5ULL,
+0x47b4782d18051196ULL,0x1b5b5be672351b37ULL,
+0x9e5ba72d8bd32ea0ULL,0xb3d7ad6282e224cbULL,
+0x033d2a7ae577ca4dULL,0x6989245186dce9abULL,
+0x94b3d512a11b06e1ULL,0x33ab4b4117922381ULL,
+0xb61345630ae731ecULL,0xba7e6bc113b1b302ULL,
+0xea6d775cd3b8b376ULL,0x0ae0141dea66a835ULL,
+0x307bc236a5c8d4c2ULL,0xc1e8ae2cc4ba6b55ULL,
+0x465408d180e7b7c2ULL,0x65483ce640364dd7ULL,
+0xa2ab093b012b3beaULL,0x24230ec13d9539bdULL,
+0x34cce1886660b31bULL,0x88030e64e316700eULL,
+0xc6a6538bd7c07c89ULL,0x5ad335e892ad0b8eULL,
+0xaca2dc2327892b1cULL,0x353e82e26a000245ULL,
+0xd253b58d4b527595ULL,0x30e44368ced449d5ULL,
+0x0c3c0d065599b002ULL,0xe298abad1cbcee9eULL,
+0xe29d992179220a08ULL,0x047986a67de5218eULL,
+0x380789a392daa249ULL,0x00c8c1827ac4023dULL,
+0x71e13a29121675ddULL,0x4cd145b899ba479eULL,
+0x7a6bdda4003a4582ULL,0x03de64e0b109e279ULL,
+0xb458b5a763272a04ULL,0x5c634b62e6e0507dULL,
+0xd8050ce397ce8629ULL,0x6012b584414e34ddULL,
+0x7e1b4526183e0576ULL,0xc7411cd4e629916cULL,
+0x8e1c46a91b51324eULL,0xb969550b7a592110ULL,
+0xc82208aee42cdd19ULL,0x9844338b722debdeULL,
+0x590651e9227c9997ULL,0x2786c9d3a1107ee4ULL,
+0x22603e0a88b614daULL,0x2cb86a32cee69217ULL,
+0xb2e0202a44c4a7b0ULL,0xe65542ec6134b016ULL,
+0x624d6e53d38053c1ULL,0x62ec8b34e5626da2ULL,
+0x835a71ae8d787aa6ULL,0xc4c17cd346d590acULL,
+0x071a07a1d2380309ULL,0x3253b7b580200bcaULL,
+0x8c61696341b5e11bULL,0x082c479701b47b3aULL,
+0xc5e25ddd93672345ULL,0xe63b95d03784ad8dULL,
+0xe044dcc39524642aULL,0xc393d4cb8c45bec0ULL,
+0xe23ca7ede274e8d1ULL,0xd5b5e70849edd687ULL,
+0x8dbc92e2a2a94d56ULL,0xb9a1be9a3c665912ULL,
+0x8a094c35b4688791ULL,0xea0166e1126be5a7ULL,
+0x29d867cc1a8243baULL,0x6be4957b5c03bc47ULL,
+0xd00667bda59a1a4aULL,0xcb2aad630e3c465bULL,
+0x2e91cbe03157ee10ULL,0x785a53c934d15401ULL,
+0xc4ba1955e08de7dbULL,0xa362bbb3acd2e184ULL,
+0x56c5b476da2bc715ULL,0xa2e152c3b5d146cdULL,
+0x9ab4ee34872ae05bULL,0xb730b731c54a9436ULL,
+0xad05d74764192709ULL,0x4b273e3bc9dc54a6ULL,
+0x8345ed3e62b841c3ULL,0xcb66208372302a78ULL,
+0x3b9d0a4ccec9e564ULL,0xb179293e04932875ULL,
+0xb7e20aaec2e6100aULL,0xed4a4e68e4ade943ULL,
+0xeabe46d320541aedULL,0x5035789e5dda932cULL,
+0x9759d96064d6e493ULL,0x7d6907a3bb90696eULL,
+0x05d61dd620668c5bULL,0xb66a9b41a2d5a496ULL,
+0xb7499c5887e5c4ecULL,0x3c2c176a57b85e90ULL,
+0x38a2e6339ed4d3bbULL,0xa2389b243ae565b4ULL,
+0x1cca8286b546db73ULL,0xe0dd20bc33b919a9ULL,
+0x541e48240e582d32ULL,0x950d1d3204c5d59aULL,
+0x7c46d0913a716511ULL,0x78ad79cbacc0a3a5ULL,
+0x49e5bd58aa746ecbULL,0xb3613a94ddcb40d9ULL,
+0x11c2a493d63b4660ULL,0xd97e2ce5c3c53371ULL,
+0x72a67e955e1b6267ULL,0x584711be8ae789b9ULL,
+0x5ec72043c7aac312ULL,0xc293684bd763a118ULL,
+0x5c7e8c564da7ba19ULL,0xd539198a3725dccdULL,
+0x9997d7296d9a9960ULL,0xea8e04373ec4d295ULL,
+0x5922c2a03e721622ULL,0x3cde799b373c3a1eULL,
+0x80bc81c9cc041422ULL,0x61ea9dc83652c21bULL,
+0x2e5b9b518beb9084ULL,0xe6e35285502c9360ULL,
+0x5a569c1138e3032cULL,0x79ea7cbe3c864e54ULL,
+0xc4d7de3ad8312934ULL,0x0c416707ecb07381ULL,
+0x59298414ed16ced1ULL,0x873bb10612d0899dULL,
+0x62d2864718ca5ac3ULL,0x92235522715b9c26ULL,
+0xb9056dc8dd3505abULL,0x3db12cdc8eb74de9ULL,
+0x959347a9b213a0e0ULL,0x69d171a84e17374cULL,
+0x2d8b731382112ab0ULL,0x6d398d414e8715a9ULL,
+0x2558d440e7303a91ULL,0x6089148014d7043aULL,
+0x7382c7da68b755d4ULL,0x40154c1283c33281ULL,
+0xd20e9bedebe3a110ULL,0xed691be0c8e2c7c2ULL,
+0x3c3ccbe32bce175eULL,0x861babb4d474c385ULL,
+0x4a86380490197aecULL,0x764b115a8dac1a55ULL,
+0xa2e1a418eb7b0aa2ULL,0x540a4e59b205625eULL,
+0xb4e4daadeb0099aaULL,0xa59551225d53d866ULL,
+0x63e4640ba72b03ceULL,0xce2418099be27cc3ULL,
+0xba01d4431d051b68ULL,0x30cb2d4c59bec578ULL,
+0x8da7c55005ec3e79ULL,0x6be1d3731059ad23ULL,
+0x04b391e119d1c962ULL,0xe45c7b63968e21e2ULL,
+0xbd3a776e8a866ecaULL,0x958b4968a01ec041ULL,
+0x7a9d2937ab2a1271ULL,0x920c0d8861461933ULL,
+0x5042a0082dc2ca92ULL,0xd404167b6aa2ae76ULL,
+0xebc48a6149c811e6ULL,0x510a3628836ad905ULL,
+0x1269cbe17b8a54beULL,0x7d719ed75510a7edULL,
+0xc0095d058de8448cULL,0xb7ce413561de30a4ULL,
+0x909b36cc7023e7eaULL,0x1c6e69ae62c5ae50ULL,
+0xe5161e955303a698ULL,0x660e6e320478c49dULL,
+0x0146a5bb258ad289ULL,0x9094317ba177a25aULL,
+0x51962325ae0edc59ULL,0xeaaaacbd39bb6ceaULL,
+0x166d7be361ce1739ULL,0x2e86b17eeba17885ULL,
+0x27758c1387d7ae48ULL,0x3e2b48be66837927ULL,
+0x7c07da78d6011411ULL,0x64e3568412c6705aULL,
+0x0305859c2c477626ULL,0x823b14cd657ae643ULL,
+0xe2b44a2536678e6eULL,0x7c49a5d934de9269ULL,
+0x3ad52323983554a6ULL,0xc778903226a17338ULL,
+0x339c6bed639213ddULL,0xc962018662ee7cb9ULL,
+0x213ce5495c803e99ULL,0x0eaa06bd8160830cULL,
+0x73ee3e3506557dd0ULL,0x20bb659531a7b844ULL,
+0x51717204330a59c7ULL,0xd0707e4816233e9cULL,
+0xb233e288e75a85e4ULL,0x8c9aab0388539b94ULL,
+0x6b1a8050a56a40caULL,0x8bc538e4e8e40524ULL,
+0x57511610e38a7a80ULL,0x9d07387e512995d8ULL,
+0x2ade94c26394c5a9ULL,0x2c6871eca10b5badULL,
+0x59e132376e3200a8ULL,0x0527be67079de688ULL,
+0x2ce0dca615259eb0ULL,0xac4bd62d1ee62a8eULL,
+0x8c33577dc2caa809ULL,0xc83d22b485d590b0ULL,
+0xc60c274c124ed2e4ULL,0xb52acad2de2ba18cULL,
+0x80d891d6650ca1acULL,0x722835ce5b6eca5eULL,
+0xc1a3ae78cb9181c5ULL,0x7d8e599019dbe281ULL,
+0x45dc89e8825bb4e0ULL,0x22300a440742ba4aULL,
+0xe375b049ede48013ULL,0x02a2888e25265ac9ULL,
+0x48bc8d5600933b24ULL,0x9d2b5a02e41d4213ULL,
+0x88e1642c0650e3d7ULL,0xec0e02eb458a9667ULL,
+0xd2cb53268b3707d1ULL,0xe224356ed48d16ceULL,
+0xed127e44be95c837ULL,0xc4514e3703ec84a4ULL,
+0x5ee7ae74d069b3d5ULL,0x5b0218a7c477e0e0ULL,
+0x5124cbb867831d83ULL,0xb79b496d393591a0ULL,
+0x4b1e029979d1ecd8ULL,0xb1b46ab8854eaba4ULL,
+0x0c0385717d449b5dULL,0x96d7495b836745b0ULL,
+0xa79e70ce35161b72ULL,0x023dc8050ccce787ULL,
+0xa5604499ad60ccdaULL,0x6e611819571e4c5eULL,
+0x177350426be03648ULL,0x2a2b2065c15c3178ULL,
+0x24293b346ebd9c10ULL,0x887910698e2a083aULL,
+0xddbc8d72204c9194ULL,0x5cb655b5a6907b68ULL,
+0xd38c1240e35629a2ULL,0x515a1a0d9d52e107ULL,
+0x3997051027565ba5ULL,0x84d44c090aaaba7cULL,
+0xb8211d812caa78a1ULL,0x6264577b82b54609ULL,
+0x4788362ddbc546a7ULL,0x8c81d11ba59d35b4ULL,
+0x62cc6e0a49a53c94ULL,0xae333c2ac7c681aeULL,
+0xe6ee2127b69e920dULL,0xb04a48d331bead52ULL,
+0xc7454b95d68828b1ULL,0x1408028e064a9012ULL,
+0xec00b0bac8694241ULL,0x33ea96aa37482500ULL,
+0x71adab7e1b63ae26ULL,0xa120a3de9c8c041eULL,
+0xa494c050ab08b367ULL,0x59796c22bac57948ULL,
+0xe0de7957630ca3beULL,0xdc5379adea87a02cULL,
+0x63379ce96a58ca48ULL,0x67749c92c77554eaULL,
+0xaacdb0caa16b148bULL,0x9b25ad7683a18a29ULL,
+0x745e20e3cb7be3a8ULL,0x40c86075cb80da02ULL,
+0xb3c450ba01a2b823ULL,0xe519794a7d6d0db6ULL,
+0x50b6bd99a9a46635ULL,0x3a52287d92052b06ULL,
+0x92cc4bc1d199738cULL,0xd053b0b14123c6d4ULL,
+0xb21273d460314983ULL,0x750589e231bdd87cULL,
+0xbbe37d250788a672ULL,0xdc629708aea89247ULL,
+0x042c233c126a6268ULL,0xb157e79b239de04cULL,
+0xd36387441366b9c9ULL,0xec03d0c92da301ceULL,
+0x5e243e6d21db0367ULL,0x94d2c8b508299e14ULL,
+0x6333cb4d26a4107dULL,0x863eee39c65c37c0ULL,
+0xb4b7cc9b4646402dULL,0xa6498acd737ad96eULL,
+0x58d2cca16d4ccd23ULL,0x628d87505985e435ULL,
+0x101321e37b88c015ULL,0xb40539bd5c621717ULL,
+0xb2d79080d4425841ULL,0x023473c982663977ULL,
+0x4560e496c5a95c4eULL,0x3a07841648752e14ULL,
+0x2c99ba5dca9b2791ULL,0xc5d9e8401b10db4cULL,
+0xd50db2a0b352cb75ULL,0xbbabb8057122e2a3ULL,
+0x5e19333cb1ab3666ULL,0xe313243ee838c52cULL,
+0xeead8a796aa00e92ULL,0x5b65e29b9a9a8b81ULL,
+0x42a3da9e72c4d408ULL,0xc64b30a1e8205a20ULL,
+0xe806adc09db4ca9dULL,0x5e1c48d7172a9ea4ULL,
+0x8e989a47acb6c64dULL,0x43486b5c8bae0d7dULL,
+0x4dec53b11d428903ULL,0x4b6a0b8b5936ab30ULL,
+0x3ce71b5de4271c01ULL,0x8d124abd7dbe7e6aULL,
+0xac97c1d37a2b9851ULL,0xdc0bc5b8c3455a57ULL,
+0x13330d4edec1dbb0ULL,0x7e7514aa4c4e9007ULL,
+0x05159a76d3ce8b9dULL,0xcb117c369324ea13ULL,
+0xea3e0d58119ca522ULL,0xba0aee765c184b4eULL,
+0x870d4ab0226ed437ULL,0x51c3de776d89e31eULL,
+0xed4165736d9192c7ULL,0x9153de539c75c7dbULL,
+0xc9a80ea050ee437aULL,0xb96b317a12e2939aULL,
+0x2a773ee457d47adeULL,0xa2ac133b591e9b60ULL,
+0x30d5b6dc8d48d63aULL,0x63508887075a1c81ULL,
+0x0a2b5da97c9a83b2ULL,0x2adee4dec88ddee5ULL,
+0xd8c7971191b116adULL,0x2314cd6d6436c6aeULL,
+0x0646a8ec09b5260aULL,0xeabe74c1716e1acaULL,
+0x14690e5181c26d1eULL,0x3ad85714a678229bULL,
+0x29d01656c9d4475bULL,0x6d07d0a430988124ULL,
+0xbab8d3e360967dc5ULL,0x0c40b16a5847a288ULL,
+0xd8818348b76510e9ULL,0xcd7e00da7c401836ULL,
+0xb78b42421356a3d3ULL,0x9ea245175b15ace0ULL,
+0x113989c0c6de638bULL,0x3461450c7d98c756ULL,
+0x89412105699d2a1cULL,0xde86077937559667ULL,
+0x8596a396949701cdULL,0xa695373ca8610a0eULL,
+0xc7d0e263ce6c6661ULL,0x4281d965aaab19a9ULL,
+0x512caa506a67a27eULL,0x77e6403ee920a715ULL,
+0x8b5346cc23cdeb49ULL,0x563221d8ed196e8dULL,
+0x665289a7cd72b38aULL,0x2bc958e48285b8bdULL,
+0x0a68a65a63040a3dULL,0x6aa06ead44ed163cULL,
+0x5969d922da2cd902ULL,0x59135061998b5036ULL,
+0x15a569a671a05db7ULL,0xba55eec20b3476b4ULL,
+0xa995769874c2e5daULL,0x9412d69c3cacabc6ULL,
+0xd4d176dd3c89a932ULL,0xda3d881a689a500aULL,
+0x9a8c2253ca37e426ULL,0x423a4a4d977731dcULL,
+0x63a7e03ec2091b8aULL,0x3806772b7e607e63ULL,
+0x6b46eb4a68179c3dULL,0x907b3293d4305eeeULL,
+0x23047e662617ddb6ULL,0x4b415eb73d2b1e23ULL,
+0x002a4a6d30aed99eULL,0xcc5c816c698a755eULL,
+0x913d5131d3d1244dULL,0x964813b35c104591ULL,
+0x81745c3e8ea82d6dULL,0x91249c2bdb13b861ULL,
+0x4105ee54407c49cbULL,0x48117221348d91e5ULL,
+0x7422992e721c02edULL,0x12cd92eec05c21e9ULL,
+0xd5397e74e32dad2aULL,0xc48a9c40d2d21244ULL,
+0x4602b2811b2e0b44ULL,0x8bab9932552be8a2ULL,
+0xe19d53ea087b52e6ULL,0xd46d2e44797a0680ULL,
+0x031536e695cba257ULL,0x11954602a4a821c2ULL,
+0xeae791d50065371aULL,0xe3014865759b72beULL,
+0x7ce6922bbb52cbaaULL,0x61690bd60400da49ULL,
+0x5257936671e393dcULL,0x9c6916359e3c8a3dULL,
+0x95d5b15c6e08124bULL,0xa840a3e3e7c8673eULL,
+0x045b554aa396be6eULL,0xec0a3c02218a6427ULL,
+0x0c0856c1d8b5cdb1ULL,0x88b93c3e3b1083a3ULL,
+0x28d5e53646e937a4ULL,0xed36375e83738badULL,
+0xe54a2263c8b00502ULL,0xe0342aac23e1d247ULL,
+0x87499a86496788b2ULL,0xe9ba836352806c60ULL,
+0x3157cec5edede16cULL,0xd80079ce1558c786ULL,
+0xd0aa585414eed89eULL,0xbb915553495b702cULL,
+0x2ed52647154c2d43ULL,0x48aac92adc6d8212ULL,
+0x0538a887604327beULL,0x69312861ae5d2512ULL,
+0xea40711d3ed8c3ebULL,0x9d0173ecd9820b0bULL,
+0xdab1389c6b1061e4ULL,0xe3e059e2629c9039ULL,
+0xb30e1ec84e00ac3cULL,0x000000003b61a17dULL,
+0x0e2cedb37c38c62dULL,0x00000000b44d71a6ULL,
+0x07066eb85bde918cULL,0x00000000a47bdc6bULL,
+0xd717be8dd7051812ULL,0x0000000012658a36ULL,
+0x2d371bc62de26d09ULL,0x00000000dbb1cc58ULL,
+0x01e51263626e702cULL,0x0000000046e5a27bULL,
+0x7d6a2cde1489d436ULL,0x000000003d5d8de8ULL,
+0x3a3a85cead6cc426ULL,0x00000000a8aab8c1ULL,
+0x5dbcd86143eb03a2ULL,0x00000000b7b7cb76ULL,
+0x6bea891e1ab2798dULL,0x0000000023a4684eULL,
+0xd47bbd1cb0ba4c33ULL,0x000000003ca5a549ULL,
+0xdd45877c06ee3208ULL,0x00000000b8be2ae7ULL,
+0xa2193e1845473639ULL,0x00000000249361e8ULL,
+0x94dbdada8e0c4bacULL,0x0000000012590c20ULL,
+0x639c34567b653e25ULL,0x0000000021603de3ULL,
+0x54356091a169de4cULL,0x00000000542b9e14ULL,
+0xac70308b34265824ULL,0x0000000081b670a9ULL,
+0x8123255d95428a04ULL,0x0000000016e4ca89ULL,
+0x4c2e11041925e304ULL,0x0000000078eeb417ULL,
+0x25817ec737c4a131ULL,0x0000000050d07203ULL,
+0x0278de3b51a66707ULL,0x0000000083434bd2ULL,
+0xc4d15c900c021e6eULL,0x00000000020e3e6bULL,
+0x6611cc29835ba86aULL,0x00000000e5a7284cULL,
+0x0853ac58bbd99504ULL,0x00000000a03dc92aULL,
+0xc8009a59c3a10e1cULL,0x00000000111471bdULL,
+0x108029ede5aeb7beULL,0x00000000d97d4463ULL,
+0x6246384e7e9617c4ULL,0x00000000d6e66c96ULL,
+0x365123b88dbed17eULL,0x00000000a40ea065ULL,
+0x4eba7a9be4be88d0ULL,0x000000001d0486abULL,
+0x458412c8da19e39aULL,0x000000004b724b33ULL,
+0x7190842cd28c4b65ULL,0x0000000035abe654ULL,
+0x59cb0e734620e5ccULL,0x00000000d18d3808ULL,
+0x3b996a86a7589be8ULL,0x0000000089dcc38aULL,
+0x4b09c6c803c83157ULL,0x00000000a07e02a1ULL,
+0x9e1e394ad5cea719ULL,0x000000001d38e845ULL,
+0xec3069e8233eab23ULL,0x000000008c9474cdULL,
+0x2a88d143463da252ULL,0x000000000c0d9101ULL,
+0x5ae287387276c67bULL,0x00000000b7b29075ULL,
+0x4d9882a1090b2940ULL,0x0000000034ca3092ULL,
+0x7ca76bd2ddba2970ULL,0x000000005bd24612ULL,
+0xa5a83d723691ca07ULL,0x00000000ae815c00ULL,
+0xba91ab2239e37256ULL,0x000000008c217504ULL,
+0xad0730bc5c11ed78ULL,0x00000000e279707cULL,
+0x200ab38de00e9958ULL,0x00000000e7b3b2b9ULL,
+0x162e5d21da3acd30ULL,0x00000000a0db07acULL,
+0xe8b9c6b3de58d08dULL,0x00000000c9594eeeULL,
+0x4b961d1c90c285a7ULL,0x00000000c4ee8956ULL,
+0x76b56228eb496e25ULL,0x00000000b0bc6615ULL,
+0xe6cde23c5324827aULL,0x000000009aa4ed5bULL,
+0x47d51cce6c77a3b8ULL,0x00000000304bae04ULL,
+0x5987436919d7dbebULL,0x00000000b62ea290ULL,
+0x848c102895ce8ed4ULL,0x00000000c6683be7ULL,
+0xb0b1da244a0e084bULL,0x00000000cb3ab8baULL,
+0x6771dec46e51003dULL,0x00000000a09b1329ULL,
+0x9db7644c9181cae2ULL,0x0000000027b142e6ULL,
+0x25b6882c5a33c806ULL,0x000000003c4663aeULL,
+0x5ee18a95857d1081ULL,0x000000007114601dULL,
+0x9e8968b21dcb7e18ULL,0x00000000e4d2544cULL,
+0xc7143e961ba368acULL,0x000000009c64a686ULL,
+0x0e110b7abad3b60eULL,0x000000000edbc588ULL,
+0x8d4c4ed942320cdeULL,0x0000000055bc8284ULL,
+0x7694293947c18624ULL,0x0000000089e72147ULL,
+0xc2c7208050510878ULL,0x0000000026e02592ULL,
+0xb87d4b3e2cc35029ULL,0x000000009da13701ULL,
+0x7ce18b466db91c25ULL,0x00000000573c360dULL,
+0xa1cc52ca4d58714eULL,0x00000000b89eb075ULL,
+0x5ede17257709360eULL,0x00000000d34a12b4ULL,
+0x5b10e4d24b5bc003ULL,0x00000000013d4a7bULL,
+0xe3951187412d7615ULL,0x00000000c4380038ULL,
+0x3d365bdb11c173a4ULL,0x000000003842a178ULL,
+0xde1220e761421710ULL,0x000000006bcab390ULL,
+0x3759827d15381235ULL,0x00000000c5ded1d8ULL,
+0xe3bea941154c47c2ULL,0x0000000035c9ac51ULL,
+0xb715b8c71ee9437cULL,0x0000000014d58789ULL,
+0x7e14dbab8aba0589ULL,0x000000006a52ddd2ULL,
+0xeb8e9b52c0d99243ULL,0x00000000cca54ec0ULL,
+0xc2373bdc75dd7403ULL,0x00000000a41550c3ULL,
+0xab253088700c28aeULL,0x000000003ae0a13cULL,
+0x9763dd4d2a43a7e4ULL,0x00000000689aae84ULL,
+0x43aa21d33e88a657ULL,0x00000000e3c90955ULL,
+0x4ebbb09a4a189546ULL,0x00000000715a663dULL,
+0x28aa7ac59d59bb18ULL,0x000000003311c00cULL,
+0x094ab478d7bad260ULL,0x000000007403d81dULL,
+0x7c14138d8e0c70b5ULL,0x000000003319a644ULL,
+0x00cd19d9e34dd9bbULL,0x00000000a5206bb7ULL,
+0x9e95e795a2d1143eULL,0x000000002394a241ULL,
+0x18b6a84993a47e81ULL,0x00000000058dd23aULL,
+0x973a572755843b1aULL,0x000000001b3580a2ULL,
+0x257a9487bceb8453ULL,0x00000000d7cc81a0ULL,
+0x2bbb745084449ebcULL,0x000000004a8b1589ULL,
+0xcdb6985a33be67cbULL,0x000000004268ba30ULL,
+0x1b69da970e893d0bULL,0x00000000b7045c1eULL,
+0xceb74e917e2e97c5ULL,0x000000001ac1b549ULL,
+0x35754382bee010b3ULL,0x00000000bd4435a3ULL,
+0x73be5a9c6dc013cdULL,0x000000001e04e00cULL,
+0x1ce40e1a23889307ULL,0x000000003156cbd7ULL,
+0xc3b22196111ab432ULL,0x0000000058c4e662ULL,
+0x955b1456a618721aULL,0x00000000867cb9adULL,
+0x0ebd8c664628d8a7ULL,0x0000000030100d33ULL,
+0x82bd74a4c0d14780ULL,0x00000000275c9412ULL,
+0x0b936ab2187671c8ULL,0x00000000c472025dULL,
+0xb86301856aeb69ecULL,0x0000000034196118ULL,
+0x56b3e03ee9116b81ULL,0x00000000ec473732ULL,
+0x7288bc261db11880ULL,0x00000000e13900eaULL,
+0x99a2819a210dc815ULL,0x00000000cd93ebebULL,
+0xa596eeceacee061bULL,0x000000002cc2c36cULL,
+0xd87a978132d86c03ULL,0x000000000042e631ULL,
+0x8636a40c450958baULL,0x00000000b0b65660ULL,
+0x0156de5ba61a95eaULL,0x00000000dd4c84dbULL,
+0x9e809441c08b731aULL,0x0000000017b2c555ULL,
+0xdb00ed00ec72e7d9ULL,0x00000000b857c537ULL,
+0x912631724ae09a2aULL,0x0000000022077e55ULL,
+0x15e5049cee066578ULL,0x00000000de3bbbbbULL,
+0x6599aa3bcaa6355cULL,0x000000005376ca92ULL,
+0xa09a92ad5d622d9cULL,0x0000000006d9b4d7ULL,
+0xbac3720005266e64ULL,0x00000000a1c3c932ULL,
+0x0d01b2286eb8ba14ULL,0x00000000c307ce56ULL,
+0x593481030b3c1924ULL,0x00000000455a6c38ULL,
+0x17c3317c03e6772cULL,0x00000000e5ddc614ULL,
+0xe42dab2966007688ULL,0x000000001086437aULL,
+0x0242b16e290dc139ULL,0x00000000127a6260ULL,
+0x726aceea8a7d9be2ULL,0x00000000abd9066dULL,
+0xa2a9aa32783e956bULL,0x00000000656663c5ULL,
+0xbde7681c88b38b00ULL,0x000000002884939eULL,
+0xb41d543c28cb1c7eULL,0x000000007459504dULL,
+0xb129c9e54c1970b5ULL,0x0000000039b35062ULL,
+0x9bec2a618081d79dULL,0x000000007784cc76ULL,
+0x3598e4d4becc666cULL,0x0000000017223113ULL,
+0x54eb157a6795be06ULL,0x00000000e44573a2ULL,
+0x4bb7bedb1dea1dd8ULL,0x0000000090717660ULL,
+0x4cde3ce99976852dULL,0x000000000ed1ae49ULL,
+0x5e525c4267d037b5ULL,0x00000000a1412624ULL,
+0x4a44a7b36763ea32ULL,0x00000000183071ddULL,
+0xa838440e75935670ULL,0x00000000ae74471eULL,
+0x21944b5d2079a079ULL,0x000000003ebdb4a6ULL,
+0x57b957be5b43e75cULL,0x000000000c677e12ULL,
+0x81c04a53e428e81eULL,0x00000000b5e291e5ULL,
+0x68350a934c928de2ULL,0x00000000a9494a89ULL,
+0x64d2945b0975eec9ULL,0x000000007881389bULL,
+0x92c33ab4eb4a0624ULL,0x00000000b2a67180ULL,
+0x77e2532be37cb50dULL,0x00000000d5db4469ULL,
+0x352484611885d25eULL,0x0000000070ea9740ULL,
+0x9784404e72519d90ULL,0x00000000448a703dULL,
+0x6a61a66562c4603dULL,0x00000000db5bb915ULL,
+0xbb70d0b3b515d5a6ULL,0x00000000e8784c94ULL,
+0xa0995ee33972037eULL,0x00000000c7b31665ULL,
+0x1ce241339579be1dULL,0x00000000599cc570ULL,
+0x6813b8ddcad07a31ULL,0x000000008180d3c4ULL,
+0x96186d6b27cbdc82ULL,0x00000000ce23d607ULL,
+0x2cb6d8031e2ba304ULL,0x00000000d0d9d922ULL,
+0x4d7a7e1cbac9bcaaULL,0x000000001b407780ULL,
+0xea77ca8ebb07ba54ULL,0x0000000046e98097ULL,
+0x295ad102a2ad7057ULL,0x00000000eb15208dULL,
+0xc436412cc3605452ULL,0x000000001cbd63a6ULL,
+0xce6144a42e822464ULL,0x00000000deead897ULL,
+0xb6e819946365ea62ULL,0x0000000063a35a23ULL,
+0x2a9132cb3e34e5aeULL,0x000000004ea183c1ULL,
+0x3e3ca0b540eaca39ULL,0x0000000093255505ULL,
+0x36b0d32089477c2eULL,0x000000007e0e9c7bULL,
+0x33e3b277aa254c5cULL,0x0000000091c00002ULL,
+0x7384b8d13d479ae2ULL,0x00000000c5ebd3eaULL,
+0x032c4969d963ae7dULL,0x00000000c567bdc9ULL,
+0x12675249cb0a49edULL,0x000000009b7602d6ULL,
+0x9b6ccdd859e09585ULL,0x000000003862ba50ULL,
+0x2190b000200bd0a9ULL,0x00000000a1a09c43ULL,
+0xe3aab7e899acc051ULL,0x000000000294e4c1ULL,
+0xa5eb64e02dea3d7cULL,0x00000000ba8bd306ULL,
+0x5546cc8840a2ae08ULL,0x0000000008a70813ULL,
+0x66bb892a9a259c4dULL,0x000000003007144dULL,
+0x87b82d4e828ab0e4ULL,0x00000000615e7151ULL,
+0x2c9c4884d8ac5b26ULL,0x00000000be788b0dULL,
+0x2b64db35d48e0bb4ULL,0x00000000a1c02766ULL,
+0x32cc32271d513895ULL,0x00000000424c1e65ULL,
+0x900c2b5203eb7e64ULL,0x0000000071b98325ULL,
+0x83e1edebe3516494ULL,0x00000000acd91629ULL,
+0x38085670c12cda0bULL,0x000000006c83a41cULL,
+0x653d204d46e27e73ULL,0x00000000731dee3aULL,
+0x902e7d638cb5b947ULL,0x000000002b1c0e5cULL,
+0x4ce60c31ac3de75cULL,0x0000000022d9b049ULL,
+0xa08242b9a166285dULL,0x000000006da166baULL,
+0xdc295917b5141269ULL,0x00000000a70d4d41ULL,
+0xe62433c0d63c6a65ULL,0x000000004897e348ULL,
+0xe2a9b09ce190b9beULL,0x00000000675c626bULL,
+0xb07b32827d4ce361ULL,0x00000000c02c8037ULL,
+0x973e3a1657c21e1eULL,0x00000000b1c29ddeULL,
+0xb859584003ab58e1ULL,0x000000008b4db46dULL,
+0x5c6299bb3250ec18ULL,0x000000008eacedbcULL,
+0x9deb6c256c6be1a1ULL,0x000000001d8d86ebULL,
+0x84c3443d64d2a358ULL,0x0000000078cd2232ULL,
+0xbde600c4918d3ac1ULL,0x00000000a75a4286ULL,
+0x8ed2613662640c09ULL,0x0000000003ca38beULL,
+0x48869cce317305b8ULL,0x00000000494eb540ULL,
+0x21d2e63a17d07959ULL,0x00000000778d20ecULL,
+0x6e944871d1826d29ULL,0x0000000015b3ab05ULL,
+0xc17204ed82c98b38ULL,0x000000003c614831ULL,
+0x4ab445305789602aULL,0x00000000021568e2ULL,
+0x9c9d67cec0319732ULL,0x00000000a2d7a8b1ULL,
+0xc80c6b6544a851d7ULL,0x00000000655ddee3ULL,
+0x0e7dd5343902b17dULL,0x0000000058a23e27ULL,
+0xe455494971b30d6eULL,0x000000008adcb366ULL,
+0xba0e58d2958d481aULL,0x0000000024b0c56aULL,
+0x0b6374598eb6490dULL,0x000000001e44eea7ULL,
+0x03a20040e003bbd1ULL,0x0000000066181e0aULL,
+0x0e5045579e35d929ULL,0x000000004576e2b3ULL,
+0x7e09cc03e1b57d55ULL,0x00000000ec982e22ULL,
+0xb910a1ebb82c8e01ULL,0x00000000bc6dacc0ULL,
+0x205bd8b8d3210537ULL,0x000000003db8e455ULL,
+0x884b005c68d5c4edULL,0x00000000cdc4d03aULL,
+0xd940ba03eed5dcc3ULL,0x00000000cde9141dULL,
+0x7143a0e512d50834ULL,0x00000000359c7e0cULL,
+0x32ebb84425726538ULL,0x00000000664198e5ULL,
+0xb97ecea3428d338dULL,0x00000000997d8336ULL,
+0x07e8a2d3b735bc40ULL,0x00000000c48949b1ULL,
+0x9dde880b8e72a7b7ULL,0x00000000d7a3a345ULL,
+0xd42700e068386dd7ULL,0x00000000b679debbULL,
+0x52c6232b37d52e0aULL,0x00000000a1e8546cULL,
+0xb54829290b0ee266ULL,0x00000000b9baa6e3ULL,
+0xcb2614aeec2e855bULL,0x00000000e995ada9ULL,
+0x6cc5430dd2c7742eULL,0x00000000b445aa8bULL,
+0x23d0072859ad7923ULL,0x00000000219623a9ULL,
+0x72d7a58315756ecaULL,0x00000000a0559a74ULL,
+0x974e458db3262b48ULL,0x00000000d1d3ad52ULL,
+0xe39901ebdc936328ULL,0x000000009d0e87d9ULL,
+0xe9494eede4277ad5ULL,0x0000000097ea4cbeULL,
+0x956765c517eb91b7ULL,0x00000000656357a7ULL,
+0xd5cba5808d2a2e65ULL,0x000000003283302bULL,
+0xd12e48ec77c05236ULL,0x00000000ae762c84ULL,
+0xc3302c69047e5aabULL,0x000000009e27a165ULL,
+0x98e17c1b90894012ULL,0x00000000d47a47d2ULL,
+0x30579b560be442bdULL,0x0000000099768ad7ULL,
+0x875e718b99d15ea6ULL,0x00000000997b4029ULL,
+0x7eca1a9532605093ULL,0x000000004d53a9ceULL,
+0xc7a03120cb616493ULL,0x0000000047d5e30bULL,
+0x974c890960b75083ULL,0x0000000011e62437ULL,
+0x354d3343e813b03bULL,0x000000001c9b44e0ULL,
+0x9668e691b3a2ebc7ULL,0x0000000069c8a83eULL,
+0x99daab4cde1871b9ULL,0x0000000022e4ae1cULL,
+0x69d55851206a1d45ULL,0x00000000a53990abULL,
+0x6596b6636814e855ULL,0x00000000cb6c49a2ULL,
+0xd6d485979c5b02bdULL,0x000000006022d254ULL,
+0x15758559b9d7655cULL,0x000000002a796925ULL,
+0xd6aa0d9c9d13cb0cULL,0x00000000e3c16abaULL,
+0xb3098ce5e5dba66aULL,0x000000003d8abec4ULL,
+0x4045115744db4791ULL,0x00000000cb3478baULL,
+0xa058a616a90d8751ULL,0x0000000047edb0e1ULL,
+0xa7aa1ada660d27d1ULL,0x00000000a9a143c0ULL,
+0xd8736a0566ae40e0ULL,0x00000000754cce2bULL,
+0x7aa80ca5591b5e3aULL,0x00000000b6a97b36ULL,
+0x68694534e4c606e8ULL,0x0000000096e64922ULL,
+0xb54644732d38749dULL,0x0000000097069798ULL,
+0x4330e57652892e99ULL,0x000000001b3835c2ULL,
+0x07b496bdba16679bULL,0x00000000890c3229ULL,
+0x0320d814d11773bdULL,0x000000004a2d8dccULL,
+0x1b3c1e3118d863e0ULL,0x00000000633aea55ULL,
+0xd755b291b1017cd8ULL,0x00000000cbb69b84ULL,
+0x993e1c63d7b19261ULL,0x00000000247d1869ULL,
+0x4e67ca891773b87aULL,0x00000000bdcc168aULL,
+0x438a688bb9340b99ULL,0x00000000dcb46ed6ULL,
+0x8145b530a0d82b9dULL,0x000000002728d2a4ULL,
+0x5876eaa34e578a6eULL,0x000000008bb6d3deULL,
+0xcda165923a296ee0ULL,0x00000000cc3077ecULL,
+0x5b6e7937188e92a7ULL,0x000000000a1d2890ULL,
+0x4841ede0e0454cb9ULL,0x000000002835c80bULL,
+0x58555716d640a1c1ULL,0x00000000d35941e5ULL,
+0x2511dbbb1c0b325cULL,0x000000005545004cULL,
+0xb0ee5c3e3659c7c9ULL,0x000000003daa3180ULL,
+0x6a64eb25adeb0905ULL,0x000000003da869c9ULL,
+0xe1b13cb1aeb10e08ULL,0x000000005ba876d0ULL,
+0x7dc87265b61b04cdULL,0x00000000e627147dULL,
+0x24d2a8328c97c0e4ULL,0x000000009da28084ULL,
+0xb8719aca614434c7ULL,0x000000003b9c4179ULL,
+0xb0412c2e918a17b9ULL,0x0000000020c9a678ULL,
+0x4559a42dca34a8b6ULL,0x000000000cd29e50ULL,
+0x36b3b01062c0876eULL,0x00000000a3a1c3ceULL,
+0x0a0259dc88a4c7b5ULL,0x00000000ed7beb83ULL,
+0x895db4ae7bbd1314ULL,0x00000000621a01c5ULL,
+0x5402ebdb3dc2c8e8ULL,0x00000000ee8c6506ULL,
+0x9ae0638197a03d14ULL,0x00000000a18a4e25ULL,
+0x8d51786238e9a264ULL,0x0000000078eb2c3eULL,
+0x04bc2167c7ba8db3ULL,0x0000000021c990c2ULL,
+0x37ec070804d42626ULL,0x000000002ce2473bULL,
+0x752c319ecd761cb8ULL,0x000000002a639ed4ULL,
+0xe546c48d77e237a7ULL,0x0000000023aba77eULL,
+0x6961152e30163b12ULL,0x00000000dbcbc7a5ULL,
+0x7136532a8201516bULL,0x00000000e4ad1b82ULL,
+0xb506323d73bb8173ULL,0x00000000e855a317ULL,
+0x5ce584a2bc0746deULL,0x00000000ed5de390ULL,
+0xd626db57ce9d3516ULL,0x000000007d0aa8aeULL,
+0x98ad782cdd70543dULL,0x000000007be64ec3ULL,
+0xba2c671887c011c3ULL,0x0000000099d42779ULL,
+0x8ec30b51e6bcbd48ULL,0x000000009021c422ULL,
+0x8bcc2dc791221340ULL,0x00000000a2cc9b38ULL,
+0xce89685dbe5b07d4ULL,0x00000000e695777eULL,
+0x195da8b21ab250ecULL,0x000000000e68b56dULL,
+0x662d4cd864524524ULL,0x000000005e638300ULL,
+0x9c1d1180578bab3aULL,0x000000009724a01eULL,
+0x58c3ae95ccce3c6cULL,0x0000000075eb33d9ULL,
+0x325d10ba658a83ccULL,0x00000000a055d835ULL,
+0x99156539887da107ULL,0x00000000d0a34a6eULL,
+0xe858240400e4b48bULL,0x0000000060c730aeULL,
+0x02eac5689c10aec6ULL,0x000000001eb7ee1dULL,
+0x036d0ddb87114078ULL,0x000000005ee45e01ULL,
+0xa19d6c2ee749c35dULL,0x00000000a8c580e4ULL,
+0x47db781573c92244ULL,0x00000000a9194946ULL,
+0x12a65865cbaab341ULL,0x000000005e9107a9ULL,
+0xc4c6d3967a57d369ULL,0x00000000c1ec626cULL,
+0x60010e671bd35324ULL,0x000000003bd47a8bULL,
+0x3d3ed607ecd0773aULL,0x00000000b5a4b38dULL,
+0xd2ce7257aaa523beULL,0x0000000097b6dc97ULL,
+0x1ee7e7b84e31504aULL,0x000000000ca741a5ULL,
+0x1a46b5b3ac21d931ULL,0x00000000c52501d4ULL,
+0x421d383b09be3c73ULL,0x00000000b4d81a68ULL,
+0x482d4319d8225a96ULL,0x00000000928e847cULL,
+0xec68e3c04d3b0a03ULL,0x000000009d3c9772ULL,
+0x0bd9461e52dbb60eULL,0x000000003a6d2d17ULL,
+0xbc44c78d31a47b0dULL,0x0000000062a993b8ULL,
+0x2e82b9bc062a6ee2ULL,0x000000003b5d1590ULL,
+0x64e79802ee4e3ecdULL,0x000000004420ebd5ULL,
+0x7e52661102330609ULL,0x000000008a03066dULL,
+0xc4d6aedca67b2910ULL,0x000000001476a957ULL,
+0x65055dc82914ab7aULL,0x0000000049202593ULL,
+0xe67c17843ba6c73aULL,0x00000000a5c3b215ULL,
+0x106166ce30ed60a3ULL,0x000000007721b928ULL,
+0x30b835bc9388c630ULL,0x00000000462943a7ULL,
+0xc9c63cd8d0e17eb3ULL,0x00000000785a5932ULL,
+0xc99eb89925a76432ULL,0x000000001e6596ccULL,
+0x0a76507c4ee19b52ULL,0x0000000050bac54eULL,
+0xc43ca0e4050296caULL,0x000000006ca24d9aULL,
+0x12bb955810178e4eULL,0x00000000bac70694ULL,
+0x342b42691a698c43ULL,0x00000000024bc634ULL,
+0x93e566aa059ed203ULL,0x000000007ae91a54ULL,
+0x6a45582762c4a4eeULL,0x000000006632021bULL,
+0x5b872d9ac76d9949ULL,0x00000000359052b6ULL,
+0x213d0a50b23a5250ULL,0x00000000580a5bc7ULL,
+0x9624489e66aed366ULL,0x00000000e28511abULL,
+0xd09a4ada9b2354caULL,0x000000008e37b809ULL,
+0x7a600491c3e93d42ULL,0x000000006b8a3495ULL,
+0xd7097cb230e481ddULL,0x00000000c85dd17dULL,
+0x2029e137e64645a2ULL,0x000000005b17d3d4ULL,
+0xa86b36e45a559885ULL,0x0000000026be2544ULL,
+0x26b631ade45924a0ULL,0x00000000e7855226ULL,
+0x3c26b4ca8416443dULL,0x0000000091be9949ULL,
+0xba75d763ded2a21eULL,0x00000000be196441ULL,
+0x5809e0030293649aULL,0x00000000bb2d5952ULL,
+0x9a800d14770310c2ULL,0x000000004baa8260ULL,
+0x09ed5354252b9932ULL,0x00000000938d0c06ULL,
+0xd04040e7cc51a3dbULL,0x0000000060c6d044ULL,
+0x2366168c17b377aeULL,0x000000007abd5437ULL,
+0x973c1898e0353b48ULL,0x00000000a72852ecULL,
+0x3bc56054cebc79ccULL,0x00000000bc252b19ULL,
+0xc539ccc65a3e7840ULL,0x00000000bb64010dULL,
+0xebd428dda54c5263ULL,0x000000005725c252ULL,
+0x4836a1c748e07270ULL,0x000000009e121e45ULL,
+0x3a388468b30ce20eULL,0x000000007a684c85ULL,
+0x09ee8ed89bb4110cULL,0x0000000034b8558aULL,
+0x79a8617d01bc3557ULL,0x000000008c75001cULL,
+0x10181aa0c3983201ULL,0x000000002deea8d4ULL,
+0x1b14bb393cee9d29ULL,0x000000003545ce47ULL,
+0x2dda053cc195bbebULL,0x000000003724d2c1ULL,
+0x1842d53d728012b0ULL,0x00000000d644040dULL,
+0x98b1696b8a11341dULL,0x00000000a8a13c96ULL,
+0x909e6a23a3548474ULL,0x00000000e13edc73ULL,
+0xb520c9247e8a825aULL,0x000000006e282d41ULL,
+0x4b17453e55026d18ULL,0x00000000b8c06dc6ULL,
+0x936177d3aa85a324ULL,0x00000000109c0b33ULL,
+0xb7dd235389dd785cULL,0x0000000000589a24ULL,
+0x345bb9ec8187065aULL,0x00000000387e6d5cULL,
+0x7ae9d2ac3844958dULL,0x0000000007392767ULL,
+0x9c4690ee1360aa43ULL,0x00000000518d5395ULL,
+0x01d8c715dd2b0d09ULL,0x000000004661727cULL,
+0x12703d062e2b3996ULL,0x000000009ab2b504ULL,
+0xa45955ddc7965639ULL,0x00000000db6b98aaULL,
+0xb183d84639414391ULL,0x0000000050544b41ULL,
+0x322722ca3ae7416dULL,0x00000000a5dcc0c4ULL,
+0xaa89c23d784ce51eULL,0x0000000068c134d0ULL,
+0x9c2711a4d137de03ULL,0x000000004a0e0248ULL,
+0x4b79b878bcc9dc3aULL,0x00000000b5bd66b4ULL,
+0x0a4aa32c4dd7a1c0ULL,0x000000001607a2d7ULL,
+0x54a2d7b771e01ad4ULL,0x0000000069ab41edULL,
+0xb13dbd479925e0d9ULL,0x00000000d6679469ULL,
+0x2e1c0ab6b1378673ULL,0x0000000060375aeeULL,
+0x6b590d10eb6cac97ULL,0x000000008aee0b99ULL,
+0xec7be1e6440191c5ULL,0x0000000053a26ebcULL,
+0x6d1eb1edbc9e1d79ULL,0x0000000001411c71ULL,
+0xd55e16cdb515acc5ULL,0x00000000a964173eULL,
+0x694496897ea19d15ULL,0x00000000414229d8ULL,
+0xa66c1d990973c306ULL,0x00000000783e0a63ULL,
+0x856c459514badeb2ULL,0x00000000b8b65931ULL,
+0x97bbad0a2b9e206eULL,0x000000002943be02ULL,
+0xb83b952b9046e991ULL,0x00000000890484dbULL,
+0x30337095b128eaceULL,0x00000000aec68058ULL,
+0x9592de734b46d286ULL,0x0000000033544580ULL,
+0x2eb7435ad206da8bULL,0x000000001c99365bULL,
+0xc61be5dc7d4cdd8cULL,0x00000000a3c76097ULL,
+0xb4cecd401aa7ec18ULL,0x00000000549ab61dULL,
+0xe56514daacd05d7eULL,0x0000000027135c6aULL,
+0xb49428438e0ccb22ULL,0x0000000006348b78ULL,
+0x07960d79d2b948a3ULL,0x00000000506a9c92ULL,
+0x01752493892a66a1ULL,0x0000000091eadb12ULL,
+0x80ed078e1adce07eULL,0x000000008d6b1940ULL,
+0x379978373a0668c0ULL,0x000000008cb225b5ULL,
+0x8c8456c28ba77500ULL,0x0000000030eee807ULL,
+0x100b8ed0c9186953ULL,0x000000006c8d6aa5ULL,
+0x1386b063ea5ed23dULL,0x0000000078114314ULL,
+0x443b4e2e73b0cdbbULL,0x000000000e5b1268ULL,
+0x19a415dbe00927c3ULL,0x00000000993b50d1ULL,
+0xba39a3690d294558ULL,0x0000000080255ad3ULL,
+0x141c2c695ba19692ULL,0x00000000094313e3ULL,
+0xe04b0c9561687791ULL,0x00000000e86ad155ULL,
+0x527e11a17b023819ULL,0x00000000cc1c63c7ULL,
+0xdb9429e286b61c59ULL,0x00000000b961d001ULL,
+0xba0a7be519477768ULL,0x00000000c79ec934ULL,
+0x86a8d095da859348ULL,0x000000000c0d6926ULL,
+0x1cddc8722b5970c1ULL,0x00000000b8cb4082ULL,
+0x702917eab39331b2ULL,0x00000000b62ebd97ULL,
+0xb22add532735c93aULL,0x00000000413c80c8ULL,
+0xaaa0851c607e0499ULL,0x0000000027dca548ULL,
+0x316dc4540cbdd96eULL,0x00000000ab68820eULL,
+0x2b4c890ebeb8a81cULL,0x0000000009b05637ULL,
+0xa1d7ea20ce0959b1ULL,0x0000000076de6ea6ULL,
+0xaebe40906ea05539ULL,0x0000000077e041b8ULL,
+0x363c7c1436246663ULL,0x0000000004404a57ULL,
+0x4a3554602333c6ecULL,0x000000001c775559ULL,
+0x37a32460a6a42c77ULL,0x00000000b28501c1ULL,
+0x2a5e60ee14665132ULL,0x0000000062494227ULL,
+0x548d8d8caa4d9905ULL,0x00000000be295495ULL,
+0x1a9c573c600452aaULL,0x000000005a70b9acULL,
+0x84137595cd167c2aULL,0x00000000d77ddaeeULL,
+0x73066ac004926db1ULL,0x00000000abe098e0ULL,
+0xbeb81020509aed67ULL,0x00000000904a1d76ULL,
+0x15c06b25e3ad0327ULL,0x00000000e27c6098ULL,
+0xc4909007da692236ULL,0x0000000036bb7337ULL,
+0x7eb103e6520ad1b7ULL,0x00000000283b7c8eULL,
+0xdba35b7c52e1691cULL,0x00000000467a5cd4ULL,
+0x174c7c7acc57c0eeULL,0x0000000042ddddd3ULL,
+0x4a382633a9a85329ULL,0x00000000e9587eecULL,
+0xc5650de0630b2381ULL,0x00000000994c0091ULL,
+0x8c419665d78d4369ULL,0x00000000c725ab83ULL,
+0xe0d077907b24e3ebULL,0x00000000360c92d7ULL,
+0x3094ed3137ad4d18ULL,0x0000000066a140bdULL,
+0x8bb1c42eaea13b21ULL,0x00000000babd30b2ULL,
+0x3d1226667b15a4e9ULL,0x00000000871ec049ULL,
+0xbdb72c23becd0e76ULL,0x00000000e07852e1ULL,
+0x3a1c6539c99c8a48ULL,0x00000000e2a9e527ULL,
+0xd269d16d33258d5bULL,0x0000000031b0e654ULL,
+0xbd7762582e8b32e4ULL,0x00000000a128edb2ULL,
+0xc6aeead360a169baULL,0x00000000d423c6d1ULL,
+0xa69748a68db830abULL,0x000000001cebcc87ULL,
+0x56e0e95b697ee777ULL,0x00000000b3007042ULL,
+0x72aeae5a15112dd2ULL,0x000000003b744409ULL,
+0x9cd553777a4acb74ULL,0x000000001a300604ULL,
+0xa6ec3deb3ccad8a5ULL,0x00000000eab03adcULL,
+0x730305e951266b33ULL,0x00000000bab1e650ULL,
+0x876b9a5592d619d4ULL,0x00000000283c1a1eULL,
+0x670d205958331716ULL,0x000000000895b0e2ULL,
+0xa75b692755ab0c02ULL,0x0000000075e12765ULL,
+0x8cad55743942d749ULL,0x00000000451e20e1ULL,
+0x49c5e01b0dede4b2ULL,0x00000000592801e4ULL,
+0xadc69b20a5b0a068ULL,0x00000000d306a55aULL,
+0x0c0d52e64227e202ULL,0x000000004e267b3dULL,
+0x8bdd08e820129575ULL,0x00000000824c0eb7ULL,
+0xaa28b5bb39490153ULL,0x00000000e34bd4e0ULL,
+0x33cb8d1c6c37ec78ULL,0x00000000b53b5635ULL,
+0xe401427aca283177ULL,0x00000000a85c6781ULL,
+0xa976eb40202d9515ULL,0x00000000062d8c29ULL,
+0xc82124011e40eec0ULL,0x0000000048d7da59ULL,
+0xa755a12d3dc2e380ULL,0x0000000021199b0eULL,
+0x5eb6a3b9116a6ab5ULL,0x00000000203a72bdULL,
+0x7554b2741323dec5ULL,0x00000000e84316cbULL,
+0x8624246d015e912bULL,0x00000000acd88d33ULL,
+0x684eab846356e13dULL,0x0000000046c1311cULL,
+0x8c491942ba3c5d2eULL,0x00000000569096ccULL,
+0x31ebcb6e080116daULL,0x000000006002d57cULL,
+0x45b708d4a3ce9a3bULL,0x0000000072728b0eULL,
+0xe3ac7a1670346447ULL,0x00000000b4b937e2ULL,
+0xb5c7799ea2a623ebULL,0x0000000053aa6767ULL,
+0x5ecd3943e741c4beULL,0x000000007da6aac3ULL,
+0xca9051a99de06836ULL,0x000000001c4a4e4aULL,
+0x7beb9c1640332b22ULL,0x000000004c17ae9dULL,
+0x6be281e67d90acb6ULL,0x00000000717a1133ULL,
+0xb701d093750c6803ULL,0x00000000084adc98ULL,
+0x06cd6ac2840e4a1bULL,0x000000004c22d00aULL,
+0xaa408cce058e73e5ULL,0x000000007c9900a3ULL,
+0x4a83e007081a6c7dULL,0x0000000048a75257ULL,
+0x0e2ab307b49cb0e0ULL,0x0000000073b45a69ULL,
+0x4410976899c07024ULL,0x000000003be26e71ULL,
+0x62b83420e7329c5eULL,0x00000000c3bbcc06ULL,
+0x13c2529c990a2d9dULL,0x000000003e7dbd67ULL,
+0x1a8665dec798683bULL,0x00000000d593a607ULL,
+0x7949998a9be03a71ULL,0x000000008ecc3452ULL,
+0xa758180263d9a4daULL,0x0000000002bb1437ULL,
+0xc376ae132e9a7e12ULL,0x000000000d99646aULL,
+0x6b958c39d2c897c2ULL,0x000000004518c7ccULL,
+0xd833a16e7597bb20ULL,0x00000000605adcdbULL,
+0x54e644ca1ccad834ULL,0x0000000021391807ULL,
+0xdc7c5a76616d1666ULL,0x0000000000683200ULL,
+0x7ae86c3658cb1264ULL,0x000000005672aed8ULL,
+0x2cce085eb2edca2eULL,0x000000008ecd0e07ULL,
+0xbe910a8e6061e7ebULL,0x00000000b3582d10ULL,
+0x60435469874b9524ULL,0x0000000025019441ULL,
+0xb9dcdd9697207735ULL,0x000000004cd6a58eULL,
+0x3a155a034e4b0724ULL,0x00000000a975c9c9ULL,
+0x5489653048cd0709ULL,0x00000000078a7233ULL,
+0x82304c881e0aeb40ULL,0x00000000b4541b94ULL,
+0xc0294b7d4b1ec3b3ULL,0x0000000091c11166ULL,
+0x55305a4c65b14693ULL,0x00000000173c04e5ULL,
+0x00d018213223213eULL,0x00000000ec4303aaULL,
+0x640e276455895a99ULL,0x0000000065178d25ULL,
+0x6200c95d5de75d71ULL,0x00000000742c8ab1ULL,
+0xca138e6835b21941ULL,0x0000000090187c8aULL,
+0x8b7008b7ca697611ULL,0x000000007788d44bULL,
+0x3cb5357c8c001b4cULL,0x000000002bad7894ULL,
+0x0a5ab060c7c0cd67ULL,0x00000000b3d2526aULL,
+0x27bc6b44aa879b0cULL,0x000000001506e698ULL,
+0x574a8c6637a08313ULL,0x0000000040cd180bULL,
+0x18356b7b04338472ULL,0x00000000179c823dULL,
+0x782cdaa608e36ba7ULL,0x00000000dea70d23ULL,
+0x91272c80ac6672b3ULL,0x000000000ecca0e2ULL,
+0x2bb5b69410aed170ULL,0x00000000c440dd65ULL,
+0x58d9a2004c672a56ULL,0x00000000087eb40eULL,
+0x9b69b37e80364c47ULL,0x000000009257e824ULL,
+0x21cb16db3ea391c6ULL,0x000000003db8cdd4ULL,
+0x56b25218b158b45aULL,0x0000000085d17987ULL,
+0xb90265c98bbba98eULL,0x0000000029ba08eeULL,
+0xd7589326cb4aeb01ULL,0x0000000027e2128cULL,
+0x624830ad886bb0ceULL,0x00000000021d2d1aULL,
+0xb382ee8720c966a9ULL,0x00000000206e8829ULL,
+0xb03e95a9987715e0ULL,0x000000005276094aULL,
+0x0a5b838772e371e7ULL,0x0000000091aa898dULL,
+0x5cbd3d650465d987ULL,0x00000000302ca6eaULL,
+0xcc4bb932569d0195ULL,0x00000000ea83ca95ULL,
+0x2b2985006b6cc124ULL,0x000000004ac2a1b9ULL,
+0x152c832975e57229ULL,0x00000000beb46591ULL,
+0x1b0acb1dc000d273ULL,0x0000000008162515ULL,
+0xe1b971a8d40a0893ULL,0x00000000be393329ULL,
+0x45d0019eacdb52d3ULL,0x00000000cdb57231ULL,
+0x93eae066dda333d6ULL,0x00000000576badb9ULL,
+0x39ca8cdd0d13b06cULL,0x0000000080c02341ULL,
+0xa6e24379e2252802ULL,0x000000007c28cbd5ULL,
+0x6354acc3bac659e9ULL,0x0000000052b98542ULL,
+0x27306768595be76eULL,0x00000000016e859cULL,
+0x38578e2574bed313ULL,0x000000006b70e378ULL,
+0xe5e751c96765cce9ULL,0x000000007d0616a9ULL,
+0xe85d23b759dd9445ULL,0x000000002abdd448ULL,
+0x0e2baa2be12ecd02ULL,0x00000000d907e535ULL,
+0x9a11a579e73aede2ULL,0x00000000e11b02a5ULL,
+0x225601ed293a34daULL,0x000000009494b1b9ULL,
+0xe9a6ab2551020657ULL,0x00000000698641c7ULL,
+0xedae94e7ed35e6d1ULL,0x0000000031299617ULL,
+0x5c7bed000e2d8126ULL,0x0000000023642214ULL,
+0x8d5712e030985e2bULL,0x0000000020636725ULL,
+0x345c73b428257304ULL,0x000000008537a596ULL,
+0x09eb677a8267dd83ULL,0x000000002c0e064eULL,
+0x1d4613e399b66876ULL,0x0000000017850e59ULL,
+0x346643880aead054ULL,0x000000000de65341ULL,
+0xa84d962189b54d86ULL,0x000000009eb14008ULL,
+0x289b24e6e984524eULL,0x000000002e90e20cULL,
+0xd9d15e857195607eULL,0x00000000227a0912ULL,
+0x88715ee38039dd37ULL,0x000000005866a3ecULL,
+0x92ad254b975909edULL,0x00000000409cbdeaULL,
+0x84793ed3cc6032b4ULL,0x000000002181bdb1ULL,
+0x3441d2170b6040b7ULL,0x000000007e7ec654ULL,
+0x2a4949ddd3b81cb8ULL,0x000000002a24c442ULL,
+0x5c43b0c600563e61ULL,0x000000006e2e6507ULL,
+0x93912a7035d036d8ULL,0x00000000a45ab5e5ULL,
+0x6818468a03082b19ULL,0x000000001c5ddd53ULL,
+0xb7c06a89147b2bd0ULL,0x00000000284d9ec8ULL,
+0xd4e005d808ca80abULL,0x00000000051c9587ULL,
+0xccb3a333645a6b86ULL,0x00000000436c5ec6ULL,
+0x3a7ea363dd6bbba2ULL,0x00000000c40a44ecULL,
+0x84c8b0875194091dULL,0x000000009daac78aULL,
+0x763d926c31b144ceULL,0x0000000017c372a4ULL,
+0x72909e1bdcd4e02aULL,0x0000000000549c7aULL,
+0x0cded336eae1bb28ULL,0x000000004ad15de7ULL,
+0xdcb6c62454a5cad0ULL,0x0000000032ce9d04ULL,
+0xed4ca3e678eb25cdULL,0x000000004e2375bbULL,
+0x31a27e102dcd4280ULL,0x000000008d04c625ULL,
+0x5a3e069528396ea3ULL,0x00000000b0e1094cULL,
+0x665946d4bbcce5e0ULL,0x000000002b893927ULL,
+0xb58009ab68025dbdULL,0x0000000086a1c20cULL,
+0x4e18c3e981c10d9aULL,0x0000000034251a03ULL,
+0x3e720ec7206b44b4ULL,0x000000000c4d237eULL,
+0x30d103756708e049ULL,0x00000000619420a2ULL,
+0x0d859ee3202332acULL,0x0000000052d1be15ULL,
+0x5b3ac90606dbb274ULL,0x0000000007da09d9ULL,
+0x176ad64571d19be4ULL,0x000000007765d8d0ULL,
+0x1bbc7e475c295ea2ULL,0x0000000062e9dedcULL,
+0x4b612e4a4cc6bdbbULL,0x000000009b06c7ccULL,
+0x6986ba459d04e3e9ULL,0x00000000dd38b3c6ULL,
+0x1a71832917d6bb21ULL,0x0000000032a9c09bULL,
+0x3394484c04dd59e5ULL,0x00000000eee72290ULL,
+0xa8a92a2d3c05b99aULL,0x00000000523190e4ULL,
+0x5ec2b081a94204d6ULL,0x000000005b387b64ULL,
+0x30c7055dac5a2707ULL,0x000000008da92445ULL,
+0xa55316741c30d86dULL,0x000000004a957084ULL,
+0xb792a2d7bbc9d67cULL,0x00000000624dba92ULL,
+0x19c1b48a31d7d773ULL,0x00000000d0180b9aULL,
+0x5a78a217ead4114bULL,0x00000000eb404eadULL,
+0x471770b070594991ULL,0x00000000226d2448ULL,
+0xcd05d61101da8d5eULL,0x00000000334743abULL,
+0xd75d199bdd619183ULL,0x00000000c399d90cULL,
+0x56b1c17449970523ULL,0x000000003c909b55ULL,
+0xd73297a4b00b6b35ULL,0x0000000097d1e887ULL,
+0x66a508d2971ab0e0ULL,0x0000000019d816d1ULL,
+0x1bdee96676c11924ULL,0x0000000094115c0aULL,
+0x1406ec9412b49736ULL,0x00000000c4bb39c9ULL,
+0x7d709660bed919cdULL,0x0000000035a587a2ULL,
+0x328000d47b1e3b91ULL,0x000000009b635857ULL,
+0x52e1e059eb8c578eULL,0x0000000076c43711ULL,
+0x6717a56371191c1eULL,0x0000000092b7b08dULL,
+0x6a57a68daada6482ULL,0x00000000e0e994dcULL,
+0x93e52be0a88ae140ULL,0x0000000049894b48ULL,
+0x6d8e0d8aed8c39deULL,0x000000006deab5e9ULL,
+0x317e421ec9b7a153ULL,0x00000000a7b1bbb4ULL,
+0xc8c1e676ec75d239ULL,0x000000007bb1ceabULL,
+0xa1d679ca47b5ab0aULL,0x00000000de6bb513ULL,
+0x467d656302d96098ULL,0x0000000040464198ULL,
+0x9143c4080ce4e2baULL,0x000000008a7eb30eULL,
+0x27bec17691741a80ULL,0x0000000055400e39ULL,
+0x56b545583d88041eULL,0x00000000c9696656ULL,
+0xd3d454b8ae39e588ULL,0x000000009c362618ULL,
+0xe120d62aaa78a298ULL,0x000000007dda0965ULL,
+0xc4d5cc58377ad798ULL,0x000000003b424022ULL,
+0xb68eed5dca5d1ed4ULL,0x000000007ed1cc02ULL,
+0x407ab80406ca36c9ULL,0x00000000008592d7ULL,
+0x391b78b57e2b2b84ULL,0x00000000d90abddcULL,
+0xe392d18187b7623eULL,0x000000005c66c4dcULL,
+0x928cc6984418a505ULL,0x00000000c0567e69ULL,
+0x7a8d3ea2cb6c2a3eULL,0x00000000c1289b1bULL,
+0x62ab17a3d94b0750ULL,0x00000000ecbab45dULL,
+0x93895c839d3968e3ULL,0x00000000c70dc607ULL,
+0x6dd81429a53d75caULL,0x000000007ed7eaa1ULL,
+0x66643c54a300e79dULL,0x00000000c66949ceULL,
+0xa15b053d495966abULL,0x0000000034e6768cULL,
+0xbc0db5e8daa0161eULL,0x00000000582106b4ULL,
+0x5aa5be60600e59ddULL,0x00000000255c5151ULL,
+0xb129968734b031c4ULL,0x000000007c0a6d95ULL,
+0x9677448d51458b92ULL,0x00000000b60a167cULL,
+0xc945b356b4591beeULL,0x00000000b601e4eaULL,
+0xa96add54ce93bc55ULL,0x00000000d988048bULL,
+0x38a89c56baacd7adULL,0x00000000230b8d67ULL,
+0x0a399e453a8cc083ULL,0x000000004774db3aULL,
+0xd7c1b7b2e209e8bcULL,0x000000005a4b35e4ULL,
+0x9169e9b6b1ea76abULL,0x0000000096972d46ULL,
+0x41eb6e2298c1a5acULL,0x00000000c0285303ULL,
+0x901485e43eba8703ULL,0x0000000000eb01baULL,
+0xc1a41bd74e881c53ULL,0x0000000024617b08ULL,
+0xa5b88b92e9619a64ULL,0x000000006369b003ULL,
+0xa964dbc2347620dcULL,0x000000008111ad3eULL,
+0x6703e59ceb278d32ULL,0x000000004d5106bcULL,
+0x09948a3add78ccecULL,0x000000006e7b6253ULL,
+0x6660b1612d97e197ULL,0x00000000bd79d415ULL,
+0x6c77b33cc3aac045ULL,0x000000005635027eULL,
+0xe970d1515e6eedc6ULL,0x00000000e8d9b457ULL,
+0x7079a11e074613a4ULL,0x000000007419ea48ULL,
+0x8c75448c5b543a2eULL,0x0000000000ab651cULL,
+0x414e9e479da0b215ULL,0x000000007ee493caULL,
+0x4a637c2db62ee197ULL,0x00000000019760a1ULL,
+0xee37e21b833e27ddULL,0x000000002a99a498ULL,
+0x090796745869597bULL,0x000000004c080e00ULL,
+0xcb5dcca166ec252cULL,0x0000000064a18bc4ULL,
+0x73b602913d975dacULL,0x00000000e88bb140ULL,
+0x2a4b4e0aedd577e8ULL,0x0000000055a905c5ULL,
+0x373042a8a0a5d979ULL,0x00000000710a69baULL,
+0xe7c37ce3662d583bULL,0x000000004ad7dc04ULL,
+0xaa7b88e87886c0e1ULL,0x0000000089c68c95ULL,
+0xc67b7da71771a1caULL,0x000000008458cd6cULL,
+0x4e4aa85ba088a67dULL,0x00000000d5538e94ULL,
+0x766d5bacc636609bULL,0x000000004a3461d2ULL,
+0x17881362a932c361ULL,0x00000000d8e9319aULL,
+0x7568e1bced98e6c4ULL,0x000000008b339d69ULL,
+0x23366eb2cb57965cULL,0x00000000dd6d4278ULL,
+0x8a6a05a637c050b9ULL,0x000000000210bd81ULL,
+0x37196b5aaadc219bULL,0x00000000a5aed1a6ULL,
+0x421d69bbda969d58ULL,0x000000000e61ce43ULL,
+0xb5c313b03b6ae6aaULL,0x00000000173b0c14ULL,
+0x5ad325c147906ce5ULL,0x00000000b1cab2e3ULL,
+0x9c20c1c39d876806ULL,0x00000000505a08a3ULL,
+0xaac140ab6222b987ULL,0x00000000b4da3a33ULL,
+0x284d7c223d0aa651ULL,0x000000006510b663ULL,
+0x75d673b6762e1399ULL,0x0000000087aea62eULL,
+0xc5828bc9dde29d91ULL,0x000000008e463594ULL,
+0xd8caa1dda968c444ULL,0x00000000328a81b8ULL,
+0x842c9a65d0c4cdc0ULL,0x0000000062c24ed3ULL,
+0x5ab2195a80c02c1dULL,0x00000000ab6e7487ULL,
+0x1abe18260b7b40e0ULL,0x0000000051795bc5ULL,
+0x31912e32ba50d8e9ULL,0x00000000ed228ba3ULL,
+0x9a4b266675dc7b77ULL,0x0000000040e77e6dULL,
+0x9410c010984dace0ULL,0x00000000256c90c2ULL,
+0xe51d9b204d2d3655ULL,0x00000000ab00bad0ULL,
+0x8ae2b08043e90410ULL,0x0000000000071133ULL,
+0x639ed9d9ecdea9c0ULL,0x00000000cab18c81ULL,
+0xd09cc09cb46c2530ULL,0x00000000b7627cdbULL,
+0x1620c674409cb5d6ULL,0x0000000029ad957dULL,
+0x4685b3db2c76495cULL,0x000000003226add3ULL,
+0x010d2c56ea429eb3ULL,0x0000000041510a26ULL,
+0x532160600ea53729ULL,0x00000000dc89d3a0ULL,
+0x0638315c00a455a9ULL,0x0000000040419d85ULL,
+0xa9a1dcb8d27523c6ULL,0x00000000a719bc34ULL,
+0x09d2c0acce28becaULL,0x00000000469e1b23ULL,
+0x5d54ed92672b94eeULL,0x00000000e3006716ULL,
+0x604738304540ae02ULL,0x000000006535ce88ULL,
+0x60ebbb6caa598aa3ULL,0x00000000dc3d9277ULL,
+0x8c7ee5ddd394e954ULL,0x00000000dad9e239ULL,
+0xc2abd2e49b78782aULL,0x00000000b91467ccULL,
+0x83837c71919d1871ULL,0x0000000097dbbe85ULL,
+0x628308050b8dec11ULL,0x00000000582ee4b3ULL,
+0x68355b1ec743180cULL,0x00000000d015091aULL,
+0x766baa03a5e3eac6ULL,0x0000000067be9eb3ULL,
+0x2410d4ec8e810156ULL,0x00000000251b39d1ULL,
+0x38630b610b4a091aULL,0x000000008666638aULL,
+0x58a275399e0ed80dULL,0x0000000077551aa3ULL,
+0x39a63c09a4ac4449ULL,0x00000000ad55e5a4ULL,
+0xe500334b5becbac8ULL,0x000000005851e031ULL,
+0x866c030cd0141a2eULL,0x0000000059db8962ULL,
+0x0d27c86b3c4adc03ULL,0x000000009e958345ULL,
+0x6a4b7472b3c581d8ULL,0x000000005c1d22b9ULL,
+0x7598e2c3e5372195ULL,0x00000000750d8ccbULL,
+0xdd775ae8189d9889ULL,0x000000008b9e03bcULL,
+0x56a592676aee98e8ULL,0x0000000034604babULL,
+0x32d27da1d89b0363ULL,0x000000000eed1a09ULL,
+0x304085941e4bbab0ULL,0x00000000652b4d20ULL,
+0xc1bd2357a9d4103aULL,0x000000001a7c8396ULL,
+0x865786d026dd4251ULL,0x000000003d538741ULL,
+0x2caaa35763dee677ULL,0x00000000c565d48aULL,
+0xe24801351e529615ULL,0x0000000007150beeULL,
+0x5db3a009a4a428dcULL,0x000000005357c090ULL,
+0x7204d7ec81a4146aULL,0x00000000838d5bd7ULL,
+0x1ab5a5e85564e4b3ULL,0x000000002e8b2301ULL,
+0xda80aa5476120bc8ULL,0x0000000066dc3c31ULL,
+0x038d8917dd6aa231ULL,0x0000000037eced46ULL,
+0xc3ee93ae28d6c512ULL,0x000000003c396830ULL,
+0xa494062ca8aa627eULL,0x000000000062de46ULL,
+0x24809ec403c89049ULL,0x000000004eee4a2cULL,
+0x3076dc43904b8ea8ULL,0x00000000d3cb40a1ULL,
+0x119769d1dd8d4adcULL,0x000000000b9039a0ULL,
+0x491777d40b52bcb3ULL,0x00000000537c98d0ULL,
+0x5897a097a60a5374ULL,0x00000000735e20a8ULL,
+0xe34077d7234294e5ULL,0x0000000094999516ULL,
+0x76e95c04391489b7ULL,0x0000000084845a91ULL,
+0xe9ad11727ca59335ULL,0x000000007929a6b3ULL,
+0xb6a827b3691e21e0ULL,0x00000000e7418e72ULL,
+0x10ec6b8426018a31ULL,0x000000000a3e40acULL,
+0x7d94492025947331ULL,0x0000000097729985ULL,
+0x8e948d31aa1beddbULL,0x000000009de828ebULL,
+0x2591740bada34a07ULL,0x000000006990b266ULL,
+0xd85aa358adeee423ULL,0x0000000076762436ULL,
+0x7054414c4081c133ULL,0x000000004836dba1ULL,
+0x54036eb08399937dULL,0x0000000036da1986ULL,
+0x53cb49827d23e6d8ULL,0x00000000de0481cdULL,
+0x8ce0e63c17a72874ULL,0x0000000085dd82c2ULL,
+0x5b60b73ba0e677ccULL,0x000000008e3524a2ULL,
+0x90713bb8390e2ceaULL,0x00000000648248c6ULL,
+0x519d2e273613d21aULL,0x0000000031083522ULL,
+0x41421e78b297bbecULL,0x000000001c70a6acULL,
+0x9abd3bbd4a7b3241ULL,0x00000000748738b5ULL,
+0x536a863116a4cc7bULL,0x00000000303b7da2ULL,
+0x97b12169057edad6ULL,0x00000000a3aec8ccULL,
+0x6933e667b4e4219bULL,0x00000000212254a3ULL,
+0x2b87b4eabedaa87cULL,0x0000000001c35261ULL,
+0x8bbe92d23102664dULL,0x0000000080b7904dULL,
+0x42b720782ba5e16aULL,0x00000000dc166b03ULL,
+0x23157a81d41a5ebdULL,0x0000000055ab3653ULL,
+0x2c6088cb6d296755ULL,0x00000000254e1ddaULL,
+0xa941ddebe7131869ULL,0x00000000aac224aeULL,
+0x8000ee4d9352cebdULL,0x00000000d29cd291ULL,
+0x9161b738377a5946ULL,0x000000007ce842c2ULL,
+0x9d922cb920a6682eULL,0x00000000a631a3caULL,
+0x1dcaebb8ad18e86aULL,0x0000000059e2b675ULL,
+0x0ac5a2b8d7811429ULL,0x0000000069be396bULL,
+0x1b81139a14a8c1b5ULL,0x0000000053c48c10ULL,
+0x4943ada12ccb5971ULL,0x00000000bad8b27aULL,
+0x0ccc837495798b87ULL,0x0000000070711513ULL,
+0xdbc684887cb19703ULL,0x0000000015803381ULL,
+0xa80b20b3cbb41a16ULL,0x00000000d73342e6ULL,
+0x9d9ae179cd001883ULL,0x00000000e733be10ULL,
+0x1e2d22066c23c1c9ULL,0x0000000002561b75ULL,
+0xcd3857dd476dc635ULL,0x00000000839d8306ULL,
+0xe27c004a03482b72ULL,0x000000005c1e4249ULL,
+0x93e2baeb4d3821bbULL,0x00000000410c6361ULL,
+0xb50257a6d42597d5ULL,0x00000000455de52eULL,
+0x3dc57c7a9987210dULL,0x0000000019d18981ULL,
+0x6433c99d9b8411d2ULL,0x00000000404ec4c4ULL,
+0xd838443192c0dea0ULL,0x0000000053acd074ULL,
+0x4359609669d56708ULL,0x0000000007e42530ULL,
+0xd8e84547030726d0ULL,0x00000000b4d8caa0ULL,
+0xbc527c0d2cc36b65ULL,0x000000003388c1ceULL,
+0xb0d8b6021bea8246ULL,0x0000000076a61512ULL,
+0x44a057266242b194ULL,0x000000007e09c560ULL,
+0xe7054778c0919712ULL,0x00000000cb52c076ULL,
+0xb44909752dadd018ULL,0x00000000cb57b401ULL,
+0x627c6ec4a221d10cULL,0x0000000030c2412dULL,
+0x9188644c9ec9cd35ULL,0x000000002da66a42ULL,
+0xb94c460debdcc383ULL,0x00000000170c3653ULL,
+0x84ae3980ee5420e4ULL,0x000000008822eedaULL,
+0x477363d1a03584a5ULL,0x00000000376994b2ULL,
+0xddab0e6d1992ccadULL,0x00000000e974e733ULL,
+0x91a78a823279022dULL,0x000000005e7eb358ULL,
+0x7224e56135d4b77cULL,0x00000000daa69e1cULL,
+0x9133657cb483eb67ULL,0x0000000021de844bULL,
+0xd8dcb2058c2e9a39ULL,0x00000000219e7377ULL,
+0xa8649c95dc089215ULL,0x0000000036531d51ULL,
+0x5777b9d8821ba780ULL,0x0000000096ab6d95ULL,
+0x050425555642bbb8ULL,0x0000000005a34a3cULL,
+0x5451d5b5b4273177ULL,0x000000009c9d4ebeULL,
+0x199b781d3cd85310ULL,0x00000000d998e56eULL,
+0x6147900d96a21a13ULL,0x00000000624d538cULL,
+0x4ec9da4d4775b4e9ULL,0x00000000c9c03c32ULL,
+0x6c7d2195b7a95a53ULL,0x00000000bc4a61cdULL,
+0x4cdca9318aa08336ULL,0x000000000d4b8e4cULL,
+0xc847b51c69dcc19eULL,0x0000000035c5d31bULL,
+0x96d026665aee90e8ULL,0x00000000283b65dcULL,
+0x11921e03a4496d1eULL,0x0000000066693a93ULL,
+0x6024793327ec786dULL,0x0000000097c8ceddULL,
+0xe1eb32849c2aaa77ULL,0x0000000009a83515ULL,
+0x1d95d27e81848079ULL,0x0000000012ba7838ULL,
+0xd2c93da81205b4ccULL,0x000000009669de30ULL,
+0xe62a645e4e050175ULL,0x00000000e2626814ULL,
+0x160e93661440a1c2ULL,0x0000000018e694bcULL,
+0x1bbcd89a762629ceULL,0x00000000963cccabULL,
+0x8a1d3b43826eb71aULL,0x0000000098214032ULL,
+0xed860926e90ae810ULL,0x000000000280389dULL,
+0xc5d8042586455cb7ULL,0x0000000012b3bd15ULL,
+0xe128d28131132134ULL,0x000000005abb1369ULL,
+0x9b22ac902d38c6a2ULL,0x0000000074a25a6eULL,
+0x7189212bca137420ULL,0x000000004469ee19ULL,
+0xa17989a75d64e493ULL,0x000000002e79bed5ULL,
+0xba72863d308acb17ULL,0x00000000215a4cddULL,
+0xc4196c12005a6088ULL,0x000000008ca43daaULL,
+0x55ac348dc4257191ULL,0x00000000e29aba82ULL,
+0xcd15da55b50cc9ecULL,0x0000000066b91002ULL,
+0x2c5582596e47722cULL,0x00000000d1e45339ULL,
+0x05548d444b8bae05ULL,0x00000000d3bccc92ULL,
+0xde2c98477a15b90bULL,0x0000000030400545ULL,
+0x89948ba9c4919789ULL,0x0000000092a15ca5ULL,
+0x9691c430569893eaULL,0x00000000393072cdULL,
+0x22405087eac87ab5ULL,0x00000000d5938298ULL,
+0xa2a098ae869bcd0dULL,0x000000006c5aa01cULL,
+0x679d0e6186a736bcULL,0x00000000b7533656ULL,
+0x6e92e683e63e2e67ULL,0x000000009ac02d96ULL,
+0x6c325b2d69c61e00ULL,0x00000000192aa13aULL,
+0x463dad02b8d6ed21ULL,0x0000000033e6dd1eULL,
+0x8ebecbc6b37b1738ULL,0x00000000b69a83e2ULL,
+0x30701cab24478c57ULL,0x00000000a6e46678ULL,
+0x57ba79993ccb90daULL,0x00000000d07b9561ULL,
+0xa5849c1c7ab12645ULL,0x00000000d120e25cULL,
+0x661819b457b135ecULL,0x00000000850a5e2eULL,
+0x42d0d80836c3435aULL,0x000000004d611758ULL,
+0x68d0db5b3698b5c2ULL,0x0000000006618a78ULL,
+0xe3703e6a6e26520aULL,0x00000000d4233ee8ULL,
+0x85700e1523863a8cULL,0x00000000e2db7338ULL,
+0x135b2c95a45d6d53ULL,0x000000002996dae0ULL,
+0x587973e147783833ULL,0x00000000593e33aaULL,
+0x0d710bd4157c1a83ULL,0x000000002310e387ULL,
+0x5accae45b71d1608ULL,0x000000009d2558b9ULL,
+0x90a54eed7dcabe0bULL,0x000000004922e310ULL,
+0x7a4927346b2ee812ULL,0x0000000017e0684cULL,
+0x69d7ee6002409dc6ULL,0x00000000030b8dc5ULL,
+0x93735979b82b7544ULL,0x00000000d07cd7dcULL,
+0xcbbd9ae89d9c9901ULL,0x000000009a3baba1ULL,
+0x489384ba3676c8d3ULL,0x00000000da73c7dcULL,
+0xb5c7c93bc63a1030ULL,0x000000007976cdecULL,
+0xd9920dc2051744c8ULL,0x0000000053deeb3bULL,
+0xc1a801d8e9a3ac9aULL,0x00000000331952a2ULL,
+0x588ad46672a0a69cULL,0x00000000425bb1b5ULL,
+0x214122c3b39e8933ULL,0x00000000a5329ce2ULL,
+0x13dd6a57dbb3ed51ULL,0x000000003d8103b0ULL,
+0x3e776cb958c4b558ULL,0x00000000e4062979ULL,
+0xd5ed12524d1ca511ULL,0x000000008de12e2aULL,
+0x07be563e67ee3e37ULL,0x0000000028d11917ULL,
+0xab5cd235deb757d8ULL,0x00000000b109ab3cULL,
+0x6378b34162d5cb87ULL,0x00000000c6093de2ULL,
+0xe5e9ebd8d1934578ULL,0x0000000046eb5173ULL,
+0x05491425ee35115cULL,0x000000003ec13518ULL,
+0x81560792d605e9e6ULL,0x00000000320399b9ULL,
+0x69557a462807226cULL,0x0000000020dd63dbULL,
+0x2a2c3ed1e95e379dULL,0x0000000066b38d55ULL,
+0x58d9357150270394ULL,0x000000001904e3a5ULL,
+0x5182ba8c35a3dddaULL,0x000000001d605382ULL,
+0x90e8a0271d3c4e65ULL,0x00000000d3345dceULL,
+0x61903932368565b9ULL,0x0000000071ca3c66ULL,
+0x7abd92ee55c4e059ULL,0x00000000ed58b000ULL,
+0x0d4ee3b4dcd0432dULL,0x00000000584e05deULL,
+0x0a3905497ae890d8ULL,0x00000000d0e55585ULL,
+0x805b87e836d78605ULL,0x0000000092b97cb7ULL,
+0xc092ee6c468657ddULL,0x00000000579c7550ULL,
+0xaa23204628611360ULL,0x00000000c221c616ULL,
+0x354234d00dce64c4ULL,0x00000000a21b76b2ULL,
+0x18c5928e273de02dULL,0x00000000cbe32ee1ULL,
+0x09cec5e43b5b19a3ULL,0x00000000621356b2ULL,
+0x10e0377acb651766ULL,0x0000000046b81d87ULL,
+0x49ce27b88cace526ULL,0x00000000c64ccbc5ULL,
+0xb855d0044407552dULL,0x000000003d441396ULL,
+0xec9a5713630a9639ULL,0x00000000eea0861bULL,
+0x7247e22a1b34d385ULL,0x00000000654ce3aaULL,
+0xa80b982eaa4884e9ULL,0x00000000872b0483ULL,
+0x8a6e28b28a65a928ULL,0x0000000073ecb45aULL,
+0x32728ebe308ece9aULL,0x0000000094c1c290ULL,
+0x7720c4247b974c47ULL,0x00000000097c1563ULL,
+0xa1b5dc92625754a2ULL,0x000000006279420aULL,
+0x638612d6746d2076ULL,0x000000002987ea58ULL,
+0xa9982d9e9961ca9eULL,0x000000000d25c0b7ULL,
+0x4abd418cc12b9e4aULL,0x0000000006e3c77dULL,
+0x2b5a60067a9821d5ULL,0x00000000453337eeULL,
+0x651d3546da573784ULL,0x0000000005eda49cULL,
+0x1414da55e26628a9ULL,0x00000000c770d9ccULL,
+0x650273323ecae23cULL,0x000000009de3a5a5ULL,
+0x97c6b85d965a2b10ULL,0x0000000046b765ccULL,
+0xce047e43de121c59ULL,0x000000005ccd3c79ULL,
+0x50c5b4825182c283ULL,0x00000000095696beULL,
+0x3d02144b8472bd30ULL,0x00000000c303377cULL,
+0x984a82e8a4828281ULL,0x0000000085c63aaeULL,
+0x4928405d82871a98ULL,0x00000000a947c060ULL,
+0x02dd7a0bc5763e39ULL,0x0000000044369a7aULL,
+0x330d941722d833aaULL,0x00000000500dd98bULL,
+0x3413ced3946b7bb7ULL,0x000000006088c26aULL,
+0x232e7d305dbe97ddULL,0x0000000075428bd6ULL,
+0xa13ab34c252a9611ULL,0x0000000021885ebaULL,
+0x438b5c8de65b988eULL,0x00000000bd2abd0bULL,
+0x8e83a6786a7196e0ULL,0x0000000063846ed3ULL,
+0x2487403c4e43de5aULL,0x000000008a464cc3ULL,
+0xb84b40b650c7c81bULL,0x0000000020775235ULL,
+0x99012895b6733186ULL,0x000000006aa60a2dULL,
+0xc231b69e37dd9eb8ULL,0x00000000293ad434ULL,
+0x4690394b3a81c470ULL,0x0000000059cd9651ULL,
+0xa119a60b56199038ULL,0x00000000dc2cd06cULL,
+0x783242867caa4257ULL,0x000000001e6c3726ULL,
+0x655c9ed1e129d07cULL,0x00000000c736dcd1ULL,
+0xbdc8ed8c11970521ULL,0x000000000ea05000ULL,
+0x69d696e263746c51ULL,0x00000000e8b33bc9ULL,
+0x6b075d9c6250dde6ULL,0x00000000b9deb776ULL,
+0x1094ac653cb8474eULL,0x000000006e625567ULL,
+0xbc914a9ae7ae0a3bULL,0x0000000060a10ac0ULL,
+0xe4466ce888147d78ULL,0x000000009a46681cULL,
+0x0524ce1ad5ac3518ULL,0x00000000b721677cULL,
+0x7530567200c7dc99ULL,0x000000008cd8eaeaULL,
+0x6ed0bd4a2665b824ULL,0x0000000073840465ULL,
+0xd626be4123ed4093ULL,0x00000000889b2520ULL,
+0xdca16c6111594c22ULL,0x00000000d5911a1aULL,
+0x1e095ce736b3edc6ULL,0x000000009801c90bULL,
+0xee9349b819002ce9ULL,0x000000004add241dULL,
+0xe809136a24717dc5ULL,0x000000007269153eULL,
+0xa976b2692b833146ULL,0x000000002ec64208ULL,
+0x5d9a242e9c7262d1ULL,0x00000000613d38e4ULL,
+0x2dd45cd1861d3761ULL,0x000000009548e512ULL,
+0x09cc954d302d04c2ULL,0x000000009725c581ULL,
+0x2ba07d505ee22367ULL,0x00000000eb77b915ULL,
+0x43ba51e093007046ULL,0x000000005aeabc22ULL,
+0xedc75410983c0395ULL,0x000000005e2412d3ULL,
+0x9556d43ee512e7b6ULL,0x0000000000a01c3bULL,
+0x4ee20b8558ab02cdULL,0x000000001e011dedULL,
+0x8d735208b849046dULL,0x000000006d8ee680ULL,
+0x27e04ed6e77d0832ULL,0x0000000067594e3cULL,
+0x7482c4b550a275d5ULL,0x000000008d23a1c7ULL,
+0x6ae6c64cbb991a19ULL,0x00000000339cce35ULL,
+0x07297b1ba2de9e16ULL,0x00000000a2076c02ULL,
+0x78461ab125c9d7e6ULL,0x000000002a6a53ddULL,
+0x5b8e76e71b046539ULL,0x00000000777052b6ULL,
+0x5eea95ead42cb27aULL,0x000000003b7b8351ULL,
+0x0ec0456440e90aa6ULL,0x000000004b3da325ULL,
+0x595a04cd13c4b11aULL,0x00000000dd384dd7ULL,
+0xde7901b2d56264caULL,0x000000000b0a4890ULL,
+0x130759c31cbe0665ULL,0x00000000d23a7211ULL,
+0xeca4a9518c2eac82ULL,0x000000002e3d05e9ULL,
+0x3a5305cbed9ba2d1ULL,0x00000000eee46961ULL,
+0x4ccd68337aa80380ULL,0x00000000c948e4c2ULL,
+0xed61b4875b9aa97aULL,0x000000009325989cULL,
+0x1b6bdb9bae61bb84ULL,0x00000000d675c22bULL,
+0x902747203734a31cULL,0x00000000c372e216ULL,
+0x9e4dcc3e300045a8ULL,0x0000000014804643ULL,
+0x0aeec6d43b798d80ULL,0x00000000badd4ab2ULL,
+0x85253b91cb071964ULL,0x00000000abe8ce70ULL,
+0x78ec427ab89c18bdULL,0x00000000037454c5ULL,
+0xe31b27b365b0cc55ULL,0x0000000055d4725aULL,
+0x749d5dcd501a71adULL,0x000000000b6c0ac2ULL,
+0x63ce4b76332791e7ULL,0x000000008a965b91ULL,
+0xb39d0b8e912ed11dULL,0x00000000343a3088ULL,
+0x4285464880827ed2ULL,0x00000000466b0327ULL,
+0xe05c61b0ad44aeaeULL,0x0000000097c6203bULL,
+0x894c08b4d2499b82ULL,0x0000000091483c27ULL,
+0x0e6a748d6b13be07ULL,0x000000008e184d05ULL,
+0xba38999b58513a02ULL,0x0000000020bbe00dULL,
+0x1ebe86e7e4442985ULL,0x00000000b411211aULL,
+0x451aa9ed4975157eULL,0x00000000661747d7ULL,
+0xd1b42b2c38310315ULL,0x00000000cbe1dc2bULL,
+0x54ce183d843e3dc6ULL,0x00000000766c94e6ULL,
+0x08e92d85bbd924e9ULL,0x0000000093d52158ULL,
+0x935bb4e068aa3e3aULL,0x00000000a46e3cc0ULL,
+0xa933e602c71bde8aULL,0x000000002b39d385ULL,
+0x0066ab486850ddb1ULL,0x000000001187c917ULL,
+0xc0c15140ee2ce9c0ULL,0x0000000064095023ULL,
+0xa619c53627264db3ULL,0x000000009ae7b3d5ULL,
+0xcb908162961e069aULL,0x0000000012a45bcaULL,
+0x787381b1a5b73ec0ULL,0x00000000b7d9783eULL,
+0x8225342add3bd153ULL,0x000000009eea60beULL,
+0xcb72787915bee9a1ULL,0x000000007199d1b5ULL,
+0x7b46dcb3abb067a0ULL,0x00000000a04803ddULL,
+0x3cac64e445c27726ULL,0x00000000aceccbd1ULL,
+0x8c6034c7d588a074ULL,0x000000000cd217b0ULL,
+0xcb42ad60cee84782ULL,0x000000009cba4995ULL,
+0x619085c926ed414cULL,0x00000000891d187cULL,
+0xb99e0a7b374d407eULL,0x00000000c96eba11ULL,
+0xcd5c106c65985405ULL,0x000000001681615eULL,
+0x09e664dd677146c9ULL,0x00000000c0660984ULL,
+0x8b6b536d7dd7d5c3ULL,0x00000000399dc398ULL,
+0x505a72e7bd4ba8c5ULL,0x000000003bbcabcaULL,
+0xda00bb42c4b137d6ULL,0x0000000000e935b0ULL,
+0x55360d8ad11cc2d8ULL,0x00000000b6b897d8ULL,
+0x04cc3089dddc6bd1ULL,0x0000000074ab3e61ULL,
+0xe1e25b5dc266136aULL,0x00000000962dc8b3ULL,
+0xe545d5c670ec44a8ULL,0x0000000090a29dd7ULL,
+0x1737235688e35ba7ULL,0x00000000ead1c807ULL,
+0x79ae211eeabd0737ULL,0x0000000073e94a69ULL,
+0x0e8c8e2ae2a61aa6ULL,0x00000000149e1824ULL,
+0x181d86c7591551c3ULL,0x00000000356229a9ULL,
+0x1753729217e9e07eULL,0x000000007bded57aULL,
+0xa452d2ce3a93c158ULL,0x0000000020272157ULL,
+0x8c0a12522889b872ULL,0x00000000470d07d9ULL,
+0xdd17be4cb88e6cd3ULL,0x00000000632ac0c6ULL,
+0x4c61a237c6480d32ULL,0x00000000c87c1c49ULL,
+0xad5627d95b50b85bULL,0x00000000bec3a7adULL,
+0x90453976459086e0ULL,0x0000000002a8488cULL,
+0x9a8a556d00bb5d6cULL,0x0000000053a77ce2ULL,
+0xc3234eecba621877ULL,0x000000006529c636ULL,
+0x370bd3e707135b80ULL,0x0000000068324700ULL,
+0x7b443a9dd1989e07ULL,0x000000002633db23ULL,
+0xcb837ca61b197b0cULL,0x000000009b6ac3a3ULL,
+0x5e9cd28373a30d83ULL,0x0000000048881b12ULL,
+0x298babbea912e8eeULL,0x0000000017134e35ULL,
+0xde4de5ce162596a9ULL,0x000000006556bb69ULL,
+0x6bea0cd4c8754573ULL,0x000000000a461a48ULL,
+0x787c297e034994dcULL,0x000000009b18965eULL,
+0x6dabc72013429440ULL,0x00000000957d3875ULL,
+0x2ee5d1a9a90e9be1ULL,0x00000000170672bbULL,
+0x0e91ceb0cc306908ULL,0x000000002a534b87ULL,
+0xc29b441ca55e5499ULL,0x000000009c8dec02ULL,
+0xe583e0b1665ea37aULL,0x00000000600aee1dULL,
+0x748a9b6cee385400ULL,0x00000000b3ac41d1ULL,
+0x27d2723759b66998ULL,0x000000004eaac064ULL,
+0x1ae59ea3d7e43e46ULL,0x00000000861ae0e8ULL,
+0xbd1912e656c5c19dULL,0x00000000b44b28caULL,
+0xc9ade7ada811e0b0ULL,0x00000000a2ee1459ULL,
+0xc934c962d64e4c88ULL,0x000000000e889ac1ULL,
+0x9d62ea8070201b59ULL,0x000000004b64789cULL,
+0x32d0a93a0b201864ULL,0x00000000cec9b70aULL,
+0x5e37b98729686269ULL,0x0000000009598c6eULL,
+0x6be27ab518653eb3ULL,0x000000004a5be7ddULL,
+0xed304a9156539014ULL,0x00000000b0c38085ULL,
+0x5c73543c4ebb66b4ULL,0x0000000073480947ULL,
+0xba268915e184b61cULL,0x0000000055c9a177ULL,
+0xc45b5be47238e075ULL,0x0000000099d8a81dULL,
+0xb642edd1de03e7e6ULL,0x00000000953e49d8ULL,
+0xe049a36038a901e9ULL,0x000000009cad3c36ULL,
+0x85338d9b5a775b4dULL,0x0000000086491d7dULL,
+0x5b6c3013d43e7ccaULL,0x0000000021c56b99ULL,
+0x259a28e18b7b4a77ULL,0x00000000974dbcaaULL,
+0xd97cb1529640e1b4ULL,0x000000000a348c52ULL,
+0x96b9d780aa851e11ULL,0x00000000bee89093ULL,
+0x201a2624b729598cULL,0x00000000b3558324ULL,
+0xba2bb4e106235248ULL,0x0000000008b39cc4ULL,
+0xe5d32d1c84c8b82eULL,0x000000009337e7b4ULL,
+0x3d26665cde667291ULL,0x000000000ed09c04ULL,
+0x47d6d5e07dd20dcdULL,0x000000003b49641bULL,
+0x81c8729e707c548dULL,0x00000000d4ec8b1bULL,
+0x5ae39675ae43c551ULL,0x000000008d09d7d1ULL,
+0x56521d462e522481ULL,0x00000000edc9a235ULL,
+0x4b9bdd1903036702ULL,0x00000000031cb77dULL,
+0x5a1e5a71408b5774ULL,0x00000000670ab072ULL,
+0x9297ca84834c625aULL,0x00000000b3ba08d6ULL,
+0x56e6079ea3e3cb04ULL,0x000000004055b13dULL,
+0x2a3ed72ca1b8e1c7ULL,0x000000007a25a557ULL,
+0xc5653a960b762db9ULL,0x0000000017d3be9cULL,
+0xcb107445b83b85cbULL,0x000000000593d04cULL,
+0x2538adbc68d454e8ULL,0x000000007a109ae4ULL,
+0xad83084079d811a7ULL,0x000000001107ea80ULL,
+0xb408daae2c00b784ULL,0x0000000068b54a65ULL,
+0xa18c0a39be4481e7ULL,0x000000004a10d2d1ULL,
+0xd706d7ae4501b257ULL,0x0000000017dccbbbULL,
+0x33286731b4415a83ULL,0x000000009eb2eab0ULL,
+0x6779c265963e8019ULL,0x00000000cc331836ULL,
+0x50d20db4835147e4ULL,0x000000005412129aULL,
+0xd77d98a688409d9cULL,0x00000000295c2146ULL,
+0xe27ced0d8a6ce599ULL,0x00000000d7033d83ULL,
+0xae8ac55d08bc3156ULL,0x000000000ebd9379ULL,
+0xd5d409382cccddc9ULL,0x000000008ebc9735ULL,
+0x18ee2918e18e3838ULL,0x000000004d3c5beeULL,
+0xba5b79718e6223d9ULL,0x00000000c4807dd5ULL,
+0x2981a95c2b890d79ULL,0x0000000031c048c7ULL,
+0x1b09a948669589e7ULL,0x00000000a2d658c7ULL,
+0x27b6b97ce3828938ULL,0x0000000021682d19ULL,
+0xa3d138c1845ea3a9ULL,0x00000000c944e1aaULL,
+0x486368d1956c794cULL,0x000000008ad7b5bcULL,
+0x0a59209ec50e3b7cULL,0x0000000043d39872ULL,
+0x6ea3a9b3806de60aULL,0x0000000003370e29ULL,
+0x33d7b287571132e0ULL,0x00000000643812dbULL,
+0x7bdc5ac70deee71aULL,0x000000008112cab9ULL,
+0x97dc2b9498e16b4cULL,0x00000000a8537b3bULL,
+0x6d38715a88b9cdd9ULL,0x000000008b38e366ULL,
+0x3d793a63e3d951ebULL,0x00000000d1c1a7bbULL,
+0x57c6a8469bc1c19dULL,0x000000006d28b9c9ULL,
+0x6669439c317b13c0ULL,0x00000000c9ca6729ULL,
+0xe63537624a4ea9ddULL,0x0000000009a79a54ULL,
+0xe46731d46ba4698dULL,0x00000000ed2de48dULL,
+0x11ac40c3a9495014ULL,0x0000000063370722ULL,
+0xa912550ae90b908aULL,0x00000000d85d4109ULL,
+0x68e914920b418346ULL,0x000000007a21bee2ULL,
+0x237170659112b872ULL,0x00000000ccd708e2ULL,
+0x5ed6a68ca4610b2aULL,0x00000000b5591136ULL,
+0xdb08d8188624cacbULL,0x00000000d072334cULL,
+0xbd064d2b30b13d82ULL,0x000000007c29d124ULL,
+0x8c047005e7d756a4ULL,0x00000000cbbd33b8ULL,
+0x4d2e9da38747191aULL,0x000000004ec25085ULL,
+0xcc47d928db3b0635ULL,0x00000000b2ba917eULL,
+0x39a50c89d579e375ULL,0x00000000539ed867ULL,
+0xbc4210a81348c11bULL,0x0000000017ea88b6ULL,
+0xe6d0a1529d2048c0ULL,0x00000000c1c3b60dULL,
+0x716c74b587d6e3caULL,0x000000006952aa6dULL,
+0x891e60d5ed01543dULL,0x00000000891854e6ULL,
+0xbee29c78e4a67387ULL,0x0000000066c994d8ULL,
+0x906ee356e4c2e43eULL,0x00000000e58cc8a3ULL,
+0x093bedc95bb70002ULL,0x0000000036ae8e57ULL,
+0x5603b628d39d516bULL,0x00000000937b57eeULL,
+0x4cb9958662a67126ULL,0x00000000ebc8db86ULL,
+0x968a6220b87bd084ULL,0x00000000bcbae5e6ULL,
+0x9522113b985938ebULL,0x000000001846503eULL,
+0xdaeceae97ac1a40aULL,0x00000000d5a09bbcULL,
+0x77a67d3497bd75ddULL,0x000000003d66aa9eULL,
+0xb5ab21b42a823b07ULL,0x000000000ea86498ULL,
+0x0c060383195c0d26ULL,0x00000000c668d22aULL,
+0x06d278aa26289632ULL,0x000000007a31211bULL,
+0xdac64b4b2520c7a5ULL,0x0000000003616879ULL,
+0x3072cca4306ba783ULL,0x00000000b2adb2ceULL,
+0x58b5a556c17bc894ULL,0x0000000091b44c44ULL,
+0x4d61a058b888290dULL,0x00000000cd088311ULL,
+0x43a2279a5d693d1cULL,0x00000000045c6a23ULL,
+0x86565ae065569c19ULL,0x00000000e3c45974ULL,
+0xb0c56637977d008bULL,0x00000000c4d99486ULL,
+0xab471e21783e2ed0ULL,0x00000000c7281c6cULL,
+0x21451a4085a7a1c7ULL,0x00000000e6be829eULL,
+0x8b984349e0987890ULL,0x00000000a824920eULL,
+0x19a7775ac7015e13ULL,0x000000003ceae21aULL,
+0x37943ac9123d356bULL,0x000000002680692bULL,
+0x1ab6ec1132baa89aULL,0x000000000199514aULL,
+0x72e97e979d53d5a7ULL,0x000000000957489aULL,
+0xc74622c4ca594d98ULL,0x00000000ab8247c4ULL,
+0xb4266d7c083a0832ULL,0x00000000c3327ac6ULL,
+0xa3b483ad5768896eULL,0x000000005bbe61c2ULL,
+0x210627320807433eULL,0x0000000090dce971ULL,
+0xe2da6e400a320304ULL,0x0000000028d60d70ULL,
+0x34178c77a84793bcULL,0x0000000032c06582ULL,
+0x7b4362159a223bcaULL,0x0000000045584189ULL,
+0x86ee91d9865a1cecULL,0x00000000075a21b1ULL,
+0x38034279ad344db9ULL,0x0000000083a24d48ULL,
+0x207cde59a74eb212ULL,0x0000000090b08c56ULL,
+0x747c586ed05571b1ULL,0x00000000e7ed2c45ULL,
+0x5bb9d60a3ae8456aULL,0x000000008b73b4e5ULL,
+0x2c0dbccb3e5b279aULL,0x00000000e0003179ULL,
+0x6e36b8619a01a0a9ULL,0x000000009ee84d37ULL,
+0xd3b082a25daa39beULL,0x000000005932c852ULL,
+0x82239bd3036b88c2ULL,0x0000000026556686ULL,
+0x7a920890e57166a0ULL,0x00000000462ad52dULL,
+0xc3aaab8ea384846eULL,0x00000000d9437aa7ULL,
+0xd58a11d84779beb2ULL,0x000000008d4e3695ULL,
+0x71e5398dc2581793ULL,0x00000000a7d78100ULL,
+0x61b0e203d24975d5ULL,0x0000000040b37ba1ULL,
+0x5ba2438b9138d1e9ULL,0x0000000057aed209ULL,
+0x0aa2929906b55edeULL,0x0000000096c623ebULL,
+0x94d4bea87b2e6d63ULL,0x00000000ab5763d5ULL,
+0xe8906dd66cb5d6e3ULL,0x00000000eee29060ULL,
+0x53d4e19d75ddd5a0ULL,0x0000000043ac6be3ULL,
+0xb84ddbc927a98dd0ULL,0x00000000206a8480ULL,
+0x305bebb1729d6722ULL,0x00000000844746eaULL,
+0x436ed5519c6ab298ULL,0x0000000017388a79ULL,
+0x030de8dac7acc0b1ULL,0x000000005eb50226ULL,
+0x5c8ca3941b836c66ULL,0x000000001b327167ULL,
+0x4eb9be310e93e492ULL,0x00000000d756d83bULL,
+0x3e783d38661ad352ULL,0x000000005eb17c79ULL,
+0x95caa7588424979cULL,0x0000000012686724ULL,
+0x924a39ce7b0153c7ULL,0x000000002106ddc2ULL,
+0xc67e98cd928bd025ULL,0x000000001ec8bd21ULL,
+0x36157d883d513dd9ULL,0x00000000767de481ULL,
+0xa5babdc5b21416c7ULL,0x00000000b2912eb4ULL,
+0x18a8bdb57076781cULL,0x00000000a64deb18ULL,
+0x8576da104d41b25aULL,0x00000000d1775d8eULL,
+0x16ba57e45b83a773ULL,0x000000008adebb16ULL,
+0x429b4d664c077d53ULL,0x0000000048a565e0ULL,
+0x17eeea863a69ac90ULL,0x00000000624d3cb4ULL,
+0x5c973355ad7bd821ULL,0x000000007d8e0c47ULL,
+0xb33dd62c0e70372aULL,0x000000008bbae743ULL,
+0xaeed6bc8ea0a5a4bULL,0x0000000085a6ae9dULL,
+0x5cb60427e21eb12eULL,0x0000000078c42739ULL,
+0x970969b2e62ddcaeULL,0x000000002a5b366aULL,
+0x6ce4b75b4e2cd899ULL,0x0000000068403aecULL,
+0xee607c6c280d3468ULL,0x000000005e2eaa24ULL,
+0x4e5502e2194cb8edULL,0x000000005c6b6250ULL,
+0x6073394670a99c82ULL,0x0000000033976eb6ULL,
+0xa3632346c88ca916ULL,0x000000002e129364ULL,
+0x3e9958a9523d9767ULL,0x0000000092e25260ULL,
+0x03ea1cb94e6ec0c4ULL,0x00000000d2ee01c4ULL,
+0x3d5bb55515099691ULL,0x00000000653e6375ULL,
+0x414b8d8dae2198acULL,0x000000006793bc40ULL,
+0xb68775b66db69c84ULL,0x00000000e6d4a879ULL,
+0x6d9a300170da98beULL,0x00000000b8dbb8deULL,
+0xeb9941517560b329ULL,0x000000003a85bceeULL,
+0xecedd0392aaca5c4ULL,0x00000000b2a02a27ULL,
+0xd7a10e609782599aULL,0x000000001844974eULL,
+0x7ea288810ac4024cULL,0x000000003d69b61dULL,
+0x165321eb17048c7aULL,0x000000008313e188ULL,
+0x96bc2a7b88c4926dULL,0x000000005398b716ULL,
+0xcea1439b5b8d1d06ULL,0x0000000085245d76ULL,
+0x8b36eb388ed70124ULL,0x00000000ce6e7a82ULL,
+0x14a8a73750ce4355ULL,0x0000000002c7cd2bULL,
+0x74128a3a2e33e203ULL,0x00000000b4edcaabULL,
+0x626a5cd0eb2ba169ULL,0x00000000880c4068ULL,
+0x066b8b810b2112edULL,0x000000005a79cd87ULL,
+0x8c1d8aba9aa75900ULL,0x000000003dac0ee7ULL,
+0xe78c38bcb3eec287ULL,0x00000000e7058024ULL,
+0x54b1724ec169d15bULL,0x0000000030e588ddULL,
+0x6aa894bd65786b93ULL,0x00000000620d806dULL,
+0xb3e37a9dab99ebb0ULL,0x000000007b0438dbULL,
+0xb9e083c7dac12879ULL,0x00000000a58a1541ULL,
+0x82e1eb303465aab2ULL,0x0000000002b719ecULL,
+0xa8730376b33d2c7bULL,0x00000000b87125a5ULL,
+0xdd2dcee4d258d3d4ULL,0x0000000040363316ULL,
+0x5abc716138d4d597ULL,0x0000000068d85442ULL,
+0x7981e3cdd2337952ULL,0x0000000063b4a4deULL,
+0x60d4480bcc4b46c4ULL,0x00000000cb5b52a6ULL,
+0x6abccb75245e7a31ULL,0x00000000037e94c6ULL,
+0x0bea35624a1a1c5cULL,0x000000000546095bULL,
+0x10c53861ee9d4642ULL,0x00000000ca80c9cdULL,
+0x4ddacc8d4182403dULL,0x00000000280520c0ULL,
+0x0936ece006a4a037ULL,0x0000000047e4aaa8ULL,
+0x74e9729e3284a4c8ULL,0x00000000e6805172ULL,
+0xda2c8921842c4147ULL,0x000000003ecc5267ULL,
+0x9400b958b2a99056ULL,0x000000003e422ad3ULL,
+0x7d0d1a46239e4422ULL,0x000000002ddc5963ULL,
+0x0e36444cbbbdbab8ULL,0x0000000090440d51ULL,
+0x93035aae40765074ULL,0x000000006274024dULL,
+0x6eca9a870c52b584ULL,0x00000000ad911bebULL,
+0x0526469c419d9033ULL,0x00000000c80e7b17ULL,
+0x417ba55459d3e3a5ULL,0x0000000085016bb4ULL,
+0x0327dba4410bae66ULL,0x0000000038de403dULL,
+0xa63b2894b8db584eULL,0x00000000ee59c054ULL,
+0xac0093b087555872ULL,0x000000003ebec317ULL,
+0x6ada648499e6045aULL,0x0000000030ba8154ULL,
+0x5d3b694beb420e02ULL,0x000000007573da34ULL,
+0x6942970c438c5034ULL,0x000000005a0c47edULL,
+0x913a9b8924872bdaULL,0x0000000087654981ULL,
+0x0509ee57b4e51a8cULL,0x000000006c774096ULL,
+0xd67c7eda85348208ULL,0x00000000519aa5d8ULL,
+0x6b61993a57e9e742ULL,0x0000000041a74132ULL,
+0xce5591d28a111760ULL,0x000000008a3e4083ULL,
+0x05c5207068abcd73ULL,0x000000009400b315ULL,
+0x03ee2d44b1551695ULL,0x00000000161dbec0ULL,
+0x0556e73e651920b2ULL,0x0000000005b3be14ULL,
+0xc47686259be5bd44ULL,0x000000005450918dULL,
+0x55e8b16d6d6aade3ULL,0x00000000329612ceULL,
+0x0701282d87b4402eULL,0x0000000098026681ULL,
+0x3569bcea656acb25ULL,0x000000007e18305bULL,
+0xeb6033bd48ee2d5dULL,0x0000000089d64cc7ULL,
+0x8530942d04bca5d5ULL,0x000000001640aaceULL,
+0x6c3ed3c37093accaULL,0x00000000c99e3146ULL,
+0xa1352cdba8c104c2ULL,0x000000005d438163ULL,
+0xadb6dc74108be8baULL,0x00000000b8020049ULL,
+0x9a70c35eee519665ULL,0x000000002cb90986ULL,
+0x7ea2c819a3e57e73ULL,0x00000000e939a244ULL,
+0xa199b90a0b42d89eULL,0x00000000c75e2736ULL,
+0x16ab4c0234d2505cULL,0x00000000d138ad85ULL,
+0x779aa279ab0d8469ULL,0x00000000a156c921ULL,
+0xa1035b490e0c2298ULL,0x00000000c881d123ULL,
+0x4dac6e30a75e8308ULL,0x00000000e196abdeULL,
+0x0c0d4c11bdd493a6ULL,0x00000000c59c9930ULL,
+0x45a6851c1cb69083ULL,0x00000000a115c3bcULL,
+0xa740ab3ac6b62d02ULL,0x00000000e54cc728ULL,
+0x8aa01517c18876a8ULL,0x0000000064581401ULL,
+0xd5a67c631cd1b080ULL,0x000000000bc11591ULL,
+0xb093c0d7bd6c8274ULL,0x00000000bb5da55dULL,
+0x450e79c1edaa6953ULL,0x00000000846d25a2ULL,
+0x2bd6b2bb6152c2abULL,0x00000000036d6c0aULL,
+0x3e761d620291bd0aULL,0x00000000423c60b0ULL,
+0x230aa485cc739c60ULL,0x00000000b427e574ULL,
+0xa60047d54324a721ULL,0x000000002c452267ULL,
+0x5921d4e7cbaaeee2ULL,0x0000000032c13c0dULL,
+0xc3487373d5368495ULL,0x0000000010a646e6ULL,
+0x1d57b1a551b4660eULL,0x000000002904b38bULL,
+0xa9b5176469c16e7eULL,0x00000000ba1e67ebULL,
+0x16003d8e1d52c671ULL,0x000000001798061dULL,
+0x1c24425d62d42033ULL,0x000000008dea4182ULL,
+0xc8de1161e4c2dc29ULL,0x000000004109b91cULL,
+0xdcb8946bc6211d7bULL,0x00000000c2200c37ULL,
+0x550d59347bc2b951ULL,0x000000002acac90bULL,
+0x51d9495da36a44d7ULL,0x00000000017876b4ULL,
+0xb2762d9b019b8b8eULL,0x00000000b5d23595ULL,
+0x04226070dd5156c1ULL,0x00000000c7692928ULL,
+0x243e7d6ab1bd407dULL,0x00000000e32b6e0aULL,
+0xb4ceee98b18ea856ULL,0x0000000046e16630ULL,
+0x26e6ae9870852c22ULL,0x000000005eea7e21ULL,
+0x463075543b049e24ULL,0x00000000202798beULL,
+0x108c520b07848db4ULL,0x000000007e71825bULL,
+0x51dc5eb9b86206eaULL,0x000000009902dd9eULL,
+0xd36a494b5db98b9eULL,0x0000000022a0e524ULL,
+0x59802c84c7394097ULL,0x00000000e89c1eabULL,
+0x26ddd1161834e079ULL,0x000000002ac8e7c5ULL,
+0x1d7ce240b07d4550ULL,0x00000000db41db40ULL,
+0x5a9ca2b660e845e1ULL,0x00000000208a36b3ULL,
+0xd16a75d753a90ce1ULL,0x000000003bd49067ULL,
+0x6390dd12eb7a5c0aULL,0x00000000e4cc86e4ULL,
+0x679690c8e383c3bbULL,0x00000000833e4466ULL,
+0x36b451424395045cULL,0x00000000e8585721ULL,
+0x6615d25b11ba4022ULL,0x0000000089deed32ULL,
+0xb7b891ecb3516a6aULL,0x00000000717dea78ULL,
+0x594c3643e148381eULL,0x00000000e7198193ULL,
+0x4c430e5644293c05ULL,0x00000000531da52dULL,
+0xb956682b2293021bULL,0x00000000ed6e8944ULL,
+0xe0b72ae907885982ULL,0x00000000e49ea996ULL,
+0x943590c1444ed176ULL,0x000000008bbebca9ULL,
+0xed51e918c474b3edULL,0x000000000e69db26ULL,
+0x8a116b696acb31b8ULL,0x0000000095b2a1dbULL,
+0xabbcd00e6ceebe59ULL,0x0000000088373690ULL,
+0x96282185cb6abdb9ULL,0x00000000089415eaULL,
+0xd49d9e98b7c2b2c9ULL,0x000000004dcb9e2cULL,
+0xd512edc26464aa0bULL,0x0000000043ca858bULL,
+0x640081694ec24728ULL,0x0000000076b388d9ULL,
+0x4dc2dac468688105ULL,0x0000000051684dedULL,
+0x266100a44546ab0dULL,0x00000000c3a711c9ULL,
+0xcb9c6b3010da14adULL,0x000000002d402554ULL,
+0x89c3852526c08a00ULL,0x00000000422444d5ULL,
+0x14b32dc69ec28be4ULL,0x0000000063869a97ULL,
+0xb62c856a0e5d4770ULL,0x00000000a71770a8ULL,
+0x42c645a2470eb04aULL,0x000000000b626bd0ULL,
+0x0bc40c695b7d6580ULL,0x000000006dc8ae31ULL,
+0x87a92a1b27c4a006ULL,0x0000000008e13164ULL,
+0xacbede2e65ca1beeULL,0x000000007405c4d9ULL,
+0x44d3a1a3b86d9993ULL,0x0000000072739135ULL,
+0x353737368b5b019dULL,0x0000000002ec169bULL,
+0x4621030c24912010ULL,0x000000005bc40db7ULL,
+0x59307003582631c2ULL,0x000000006a50cac8ULL,
+0x6e08abee076d17aeULL,0x0000000083796895ULL,
+0x1e13ca444161eb17ULL,0x00000000323b66c2ULL,
+0x17d434a7e5948670ULL,0x00000000ed55c3e3ULL,
+0xd8ab36a423486410ULL,0x0000000011d36d33ULL,
+0x12d931ccdb8d4318ULL,0x00000000ebb3308aULL,
+0x06182d30eb499c29ULL,0x000000000616e88aULL,
+0x44ebb67517ac8cb7ULL,0x00000000daa7d31aULL,
+0x15c0bc87e5bea38cULL,0x00000000469780deULL,
+0x4ce7a426edee5141ULL,0x00000000137e7a07ULL,
+0xe645548752b05d3dULL,0x0000000000dbd14eULL,
+0x0000458d2501a2caULL,0x00000000dc5644c2ULL,
+0xad6b57b23c1118b0ULL,0x00000000a41709b1ULL,
+0xa21345e132c20ab0ULL,0x0000000064debe88ULL,
+0xac8076b655355b04ULL,0x000000004e230319ULL,
+0xb76c23b9ea69a769ULL,0x00000000d1a03353ULL,
+0x1dc24d3a406166d9ULL,0x0000000005237288ULL,
+0x64b70ead5288cc36ULL,0x0000000056991814ULL,
+0x657b3859ab1dd98dULL,0x0000000092e32ea4ULL,
+0x3aa7765ac9491ee9ULL,0x00000000747d1363ULL,
+0xcc7e458db6b07db9ULL,0x000000003ea611acULL,
+0x321534c1072a6772ULL,0x000000002db9e165ULL,
+0xc91e28c56ba065a1ULL,0x000000001e95ce9eULL,
+0xe71a3a326ad601abULL,0x0000000044336234ULL,
+0xc9578ec0bb207985ULL,0x00000000a4ba82caULL,
+0x43b5bb32341b2030ULL,0x00000000e729982dULL,
+0x4e30ce61aee3e92cULL,0x000000006b03bbcbULL,
+0xe07bd743548dc0d4ULL,0x0000000025a1184eULL,
+0xee900a3ba2b4eadeULL,0x000000003bbd338aULL,
+0x492647c55b894832ULL,0x00000000831b39baULL,
+0x823a21ad531ed1d7ULL,0x00000000a5283ae0ULL,
+0xc1815327180b1345ULL,0x000000007d42c500ULL,
+0x0d793ab8c81bae49ULL,0x00000000a0367a1eULL,
+0x186c640cd40d37a0ULL,0x00000000190718e3ULL,
+0xd89b481e1d831374ULL,0x000000002d549a57ULL,
+0x485a0e837207e1bcULL,0x000000004457adc4ULL,
+0x135c04d037aedd0bULL,0x00000000c42d50edULL,
+0x620c152db19d93a9ULL,0x00000000721a8389ULL,
+0x3e9e7ee0b6733ae7ULL,0x000000005161c064ULL,
+0xe9c7175a52570409ULL,0x0000000076278507ULL,
+0xc7cc32e8198d3480ULL,0x000000000a3b12e9ULL,
+0xc83e6b234eb3a68cULL,0x00000000c467793eULL,
+0x99bda63a11bae564ULL,0x000000005a5d2ddbULL,
+0x75b442e5786e7dd1ULL,0x000000007b158ab3ULL,
+0xe1c83496e104aee5ULL,0x00000000c54088b8ULL,
+0xeb4944641ab363c1ULL,0x00000000c35627b8ULL,
+0x259004707c0de363ULL,0x000000005480b1d9ULL,
+0x49a83813a33a7e26ULL,0x0000000003d860d6ULL,
+0xc0d3db3d7c7224e3ULL,0x0000000068c1c0deULL,
+0x563da40a5a76224eULL,0x00000000b151b2b1ULL,
+0xe423ca5636e7dd03ULL,0x0000000098876a97ULL,
+0xe98036424a6ccb19ULL,0x00000000d3944068ULL,
+0x02653dae57e9113dULL,0x000000002a6c3393ULL,
+0xd321584caa23d167ULL,0x0000000009711319ULL,
+0x86621ede515b19e4ULL,0x00000000cc0b3909ULL,
+0x1135dc1a62e9a188ULL,0x000000001b8d6e54ULL,
+0x0306785a2aaabde5ULL,0x00000000da3a8bc5ULL,
+0x8d1dcb9a99289edbULL,0x0000000079348a76ULL,
+0x01a6d19124e766dbULL,0x00000000ad8edb09ULL,
+0x056e66e68d873306ULL,0x00000000e21889b7ULL,
+0x3a6d892e3cb4c4a5ULL,0x000000009c014a9aULL,
+0x9ae234c5a4ad077aULL,0x00000000624c154cULL,
+0xa993bbd87237e6acULL,0x0000000099e3ceb5ULL,
+0xabc4875390385454ULL,0x0000000035daede9ULL,
+0x501d7628a666c5c7ULL,0x00000000060357b3ULL,
+0xa362e6d42acad62bULL,0x00000000040091dbULL,
+0x5bc42ac48c7e44c2ULL,0x00000000d72e25d4ULL,
+0x2235d0a941a4bc6bULL,0x0000000098dd0704ULL,
+0x57d51401024c2ec1ULL,0x0000000052c86253ULL,
+0x6575a2eca9890cc1ULL,0x000000009e5605a6ULL,
+0xadc94db43adbbb91ULL,0x00000000ee33b9d0ULL,
+0x6cba2e23ac56248bULL,0x000000005b5e038dULL,
+0xe440a1d0dc16a994ULL,0x000000002da03ec8ULL,
+0xa444a4c61aa56b37ULL,0x0000000063a519eaULL,
+0x52e37e3b459d9978ULL,0x00000000c8bb8a48ULL,
+0xd97723817e8ac8d1ULL,0x00000000377c3421ULL,
+0x163e61a1d3227c43ULL,0x00000000bb38ecd8ULL,
+0xd46124a4d310b640ULL,0x000000002da74bc0ULL,
+0x5521c4b4e09b6be5ULL,0x00000000db4850d8ULL,
+0x0d3e013ad746ad2dULL,0x00000000a799ba67ULL,
+0x09e3c6da2644daa1ULL,0x00000000947464bbULL,
+0xd1c1295d5ca0d525ULL,0x000000004a3479deULL,
+0xec8cd32cb2a92854ULL,0x000000009a442935ULL,
+0x0640808d2ea47091ULL,0x000000000d66e4e8ULL,
+0x122a03cda7ec4404ULL,0x000000008cb59447ULL,
+0xccc32d1251dc031bULL,0x0000000003d3b1d6ULL,
+0xad3e6cdab54e56e1ULL,0x000000005c8a9ac8ULL,
+0x14393ca1846e208dULL,0x000000007a6d966aULL,
+0x4c284c4250133d20ULL,0x00000000543425e8ULL,
+0x3ac5061a99ee632eULL,0x0000000086b5d25bULL,
+0xd59a8b6a560a1506ULL,0x00000000491718d3ULL,
+0xb661a054256e0478ULL,0x00000000182aeb57ULL,
+0x7d93d866cd82aa81ULL,0x000000005dbe77dbULL,
+0xe080835444238346ULL,0x00000000a86c482aULL,
+0x892066bcd540eed7ULL,0x0000000000629ceaULL,
+0x37a5c82220560dd7ULL,0x00000000d94e1947ULL,
+0x5bc7c5550ca21d46ULL,0x000000000e68788dULL,
+0x992be72080c33c86ULL,0x000000001beac3baULL,
+0x6c30481990975158ULL,0x00000000e77b4bb4ULL,
+0x93c30ed9cddb19ddULL,0x00000000c4bbee75ULL,
+0x7ddcc5465ae85058ULL,0x00000000a37d9b60ULL,
+0xdbc5b40a7ebd04d7ULL,0x000000001873b999ULL,
+0x7c77648c4db15587ULL,0x00000000b55e6075ULL,
+0xcb969b947024e9a8ULL,0x000000001e120d55ULL,
+0x2c961526ee7b4e9cULL,0x0000000008a846c3ULL,
+0x9b781090116314a1ULL,0x00000000e8e22c25ULL,
+0xcd3a9bd8eb947e93ULL,0x0000000048585ce7ULL,
+0xb94d704785172d02ULL,0x00000000a4ca005aULL,
+0xaa967b3c7b16b73eULL,0x000000007a703913ULL,
+0x3776c67269130e49ULL,0x000000006525add1ULL,
+0xb1e870dd29869191ULL,0x00000000b2d372ddULL,
+0x3ca70dcab61db25eULL,0x000000001ae56597ULL,
+0xe74e065700c3dcb9ULL,0x00000000d6d5eb17ULL,
+0xeb78b25365346a17ULL,0x0000000012421993ULL,
+0x3593701056c83e56ULL,0x000000000142ca01ULL,
+0x372102c3811a992eULL,0x000000003b058982ULL,
+0xc7e5921de0921d0eULL,0x00000000cbe0042aULL,
+0x209d2d1d05e0eab6ULL,0x000000000c7a657bULL,
+0x156723039adecc42ULL,0x00000000b7e8853cULL,
+0x67140e21ecac3c74ULL,0x00000000895207ecULL,
+0xd9ddc34bc09d75a0ULL,0x0000000095031453ULL,
+0x22c364ab343bac81ULL,0x00000000ee4a6873ULL,
+0x98703b7c43c7cc49ULL,0x00000000e0c4c3ceULL,
+0xa5374c5550ce4630ULL,0x00000000b4e40b69ULL,
+0x73ea967d830bb12aULL,0x00000000c38c33e0ULL,
+0xab3b3e3deeb5041cULL,0x0000000090961b96ULL,
+0xbd431893b40da0b9ULL,0x00000000b7853536ULL,
+0x810e2b7b0115c760ULL,0x0000000006d4dd89ULL,
+0x1b20eed56102a56aULL,0x0000000004ad85c7ULL,
+0x0d556bd459b7c651ULL,0x00000000c4b06072ULL,
+0x6e5a62e849b10589ULL,0x000000008a217c5aULL,
+0x5d69a21b52493c01ULL,0x00000000361b43d9ULL,
+0xc1e1550823bdc92eULL,0x000000003d7e030aULL,
+0xb9b7b93abc7daa3eULL,0x000000007ac094c3ULL,
+0xc7b7d3435864b56bULL,0x000000008e253dc2ULL,
+0xd405ee0981c31a00ULL,0x00000000a63868b7ULL,
+0x036bc60a9a440604ULL,0x00000000794ea760ULL,
+0x63c5d62c90457c48ULL,0x0000000002cba665ULL,
+0xed203455ded1a29eULL,0x000000007966977dULL,
+0x321610c7ed021ce5ULL,0x0000000082425770ULL,
+0x6ea6dd7844024b53ULL,0x0000000006c32102ULL,
+0x506b15ae2bd61013ULL,0x00000000c811e4a3ULL,
+0x661abec61cd65307ULL,0x00000000ba29c23cULL,
+0x3e02b3dde48c6ab5ULL,0x00000000c6a28958ULL,
+0x79dbb1d05ad7ecd5ULL,0x00000000b8078c9eULL,
+0x47a858e92b79330dULL,0x00000000dc2e274aULL,
+0xc0297be550d48cbdULL,0x0000000025ab3196ULL,
+0x658b892b05788d2dULL,0x0000000086855b12ULL,
+0xe5e84016bcc87a7bULL,0x000000002eee3132ULL,
+0xe39e423b7804dc42ULL,0x0000000080a02ab9ULL,
+0xdb516d09d962b565ULL,0x00000000931bad65ULL,
+0x9babc00679010d55ULL,0x00000000856e8883ULL,
+0x9d0997c554d6cc2aULL,0x000000009117c2e5ULL,
+0xbeb6764153865c9aULL,0x00000000116b66eaULL,
+0xa001d950b3196b5aULL,0x00000000a0e26e15ULL,
+0x43557d542c8966c9ULL,0x000000001322026eULL,
+0x87da6d91342d1de7ULL,0x00000000db18d985ULL,
+0x7c83970e8547807bULL,0x000000009526c8beULL,
+0x5bb4288cee2a7a3dULL,0x0000000040767ec7ULL,
+0x3974aa625e9b7210ULL,0x00000000005b2e06ULL,
+0xb267ed138c60d4b7ULL,0x00000000570790ecULL,
+0xe086795b3eb23362ULL,0x000000001308420cULL,
+0xd91b26905d96ceabULL,0x000000006cbb74d9ULL,
+0x357bc037b83dda36ULL,0x000000002a8c4c27ULL,
+0xa2da76477d0951d2ULL,0x000000003db7324eULL,
+0x12abdd5d5a11eac7ULL,0x00000000be694aa2ULL,
+0x3820ee272a444c10ULL,0x00000000e4703a57ULL,
+0x81c7c90022b00935ULL,0x000000003b8ae6d9ULL,
+0x088606c632098198ULL,0x000000004a1356a0ULL,
+0xd061c89b0a3dabe4ULL,0x000000008728d9d4ULL,
+0x28324ab6d8cd9a9aULL,0x0000000044ee1b70ULL,
+0xd45843975a76ce55ULL,0x00000000e0143a1bULL,
+0x19c54bac20c39cd8ULL,0x00000000a8be8b04ULL,
+0x67bd18b447dbb2dbULL,0x000000003315c10dULL,
+0x2b69eb011460135aULL,0x00000000ec2c8416ULL,
+0x6b0ac613d8c46066ULL,0x00000000c134bd55ULL,
+0xa16d38911bb9e83eULL,0x00000000c3db0246ULL,
+0x727388e5ecb56d53ULL,0x0000000088b8a0d5ULL,
+0xe14140ee58039ac1ULL,0x000000006a601807ULL,
+0xaa46a473deec0a9cULL,0x0000000065199398ULL,
+0xc51a609bae56c54aULL,0x000000000353986eULL,
+0x20e1ca8d441ddc32ULL,0x00000000d5aa8e77ULL,
+0xac098ad38c002071ULL,0x0000000009808266ULL,
+0x9a20648257c4bd8aULL,0x00000000999c1700ULL,
+0x01ddae4d85418598ULL,0x00000000c0d46d2bULL,
+0x6d249c30002ea93eULL,0x000000003823e62eULL,
+0xb223a160d36536ecULL,0x0000000009ca931aULL,
+0x8e931cca44607aaeULL,0x000000007a189139ULL,
+0x3da34d818679c929ULL,0x000000004b01b408ULL,
+0x00b63bae185a15a9ULL,0x00000000e1ac0318ULL,
+0xc0a82a056378bc2dULL,0x00000000019d1817ULL,
+0x9abc39c0d927c774ULL,0x0000000021bc84beULL,
+0x0d42e168d19cd893ULL,0x00000000670d7521ULL,
+0xbe4356ed6a75486dULL,0x00000000b79b5ebaULL,
+0xb1808a8dbe8366e4ULL,0x0000000048551cdaULL,
+0x976940642100bb60ULL,0x00000000aca4e71aULL,
+0x6dc59e4ce7da1225ULL,0x00000000b57eb5d8ULL,
+0x9e93639353cc78c4ULL,0x00000000832962deULL,
+0x34487605370c4b10ULL,0x00000000798b8842ULL,
+0x416904b2d3c3eeb7ULL,0x000000002325b77bULL,
+0x7ea373605adae16dULL,0x00000000649e34c7ULL,
+0x311698d5d1c1c856ULL,0x000000004d0a906dULL,
+0xa9941792352b63c7ULL,0x00000000be6903caULL,
+0x1ae8078db8a180beULL,0x00000000a8943a60ULL,
+0xdd6c4d2a2dc5e24aULL,0x000000006ccbd964ULL,
+0x012239c25809e39dULL,0x00000000dd442bbeULL,
+0x9e4582e8d0424950ULL,0x00000000a56ae93cULL,
+0x405173d9dd1db364ULL,0x00000000349d2b5dULL,
+0xd659b7519072842aULL,0x00000000ecd89ebcULL,
+0x563b00be525170e3ULL,0x000000004894bb07ULL,
+0x5804e8725d96b112ULL,0x000000001c078d64ULL,
+0xad686972d7463bbcULL,0x000000001c246a24ULL,
+0x734537969a67edcdULL,0x00000000e1a7a22cULL,
+0xdc562bc0ee7ee82dULL,0x0000000098737281ULL,
+0x17a870ab2eb6e915ULL,0x0000000065d1562aULL,
+0xea33eac76c8e02b2ULL,0x000000008a911c12ULL,
+0xee369e663de44b29ULL,0x0000000027c70d6aULL,
+0xcbdcd5cc9b6edd0aULL,0x000000003b8345e3ULL,
+0xea1e572be06420cdULL,0x0000000009c9952cULL,
+0x19eb80b0626ca68dULL,0x000000005be6a52bULL,
+0x91b4d8c717078140ULL,0x00000000219a0ea8ULL,
+0x4a5a78b2dd9b7257ULL,0x00000000a5a5ae43ULL,
+0x0da77aed26309218ULL,0x000000005c8a8a10ULL,
+0xe6570a174075a20aULL,0x000000008d1ad579ULL,
+0x5cad1ea0a20e22b3ULL,0x00000000a4d83729ULL,
+0x471d26b4e2b739baULL,0x000000000616b987ULL,
+0x608d33d8132b8dd0ULL,0x00000000d5d5ec9aULL,
+0x2a0441895eba964dULL,0x00000000e5470c15ULL,
+0x2271c66c7cac2099ULL,0x00000000235de36bULL,
+0x0a568997c26b4cdeULL,0x00000000802a821cULL,
+0x495e577bcd731b80ULL,0x000000007cae3eb8ULL,
+0x4e62551773b07c4aULL,0x000000000b72e772ULL,
+0x850cd3d19cca8613ULL,0x0000000099d37ba7ULL,
+0xe854be532e51131bULL,0x00000000eead4828ULL,
+0x4ac7cc10eea3e75eULL,0x000000007da853baULL,
+0x79c6e7dbd1c82b56ULL,0x000000003d9c2b9dULL,
+0x939d683aabc417b3ULL,0x00000000e2e683d6ULL,
+0x533dd14dbab58667ULL,0x00000000dbc3911eULL,
+0x9db12124ab64bb37ULL,0x00000000c5188567ULL,
+0x59014652ecb1ec43ULL,0x00000000d781432aULL,
+0x0c3cc500e43369a9ULL,0x00000000c795c8b7ULL,
+0x8557dddc214703aaULL,0x00000000c773a0acULL,
+0xbd704b4cb623e5d3ULL,0x0000000031ea4c13ULL,
+0x7977d8a50ad1bdc2ULL,0x00000000b59618adULL,
+0xc3b5cb8243539182ULL,0x00000000a2b557e2ULL,
+0x7916341a18003b3cULL,0x0000000030915dd3ULL,
+0x69b7aa403d035bb1ULL,0x00000000b751489dULL,
+0x05cb86b61686c712ULL,0x00000000cb51d92eULL,
+0x6b6db756839d6e58ULL,0x00000000459a8682ULL,
+0xed4b61bcac0c4601ULL,0x00000000641e28b6ULL,
+0xd31b9866785125c0ULL,0x000000007dc99112ULL,
+0x8278369d721d5273ULL,0x00000000d80bed37ULL,
+0xe25b35cc2b65c8d7ULL,0x00000000de282791ULL,
+0xc0dd378ea8429666ULL,0x000000007475b650ULL,
+0x8cbbd963b5d024c1ULL,0x000000009e302d7eULL,
+0x364252a686190ad3ULL,0x0000000038e666dbULL,
+0x1413476380462a12ULL,0x0000000051c15e79ULL,
+0x18d993c48b5c49ceULL,0x0000000076de4072ULL,
+0xd09c560d21d24c07ULL,0x00000000a95492dbULL,
+0x0709aa968913572aULL,0x00000000c659de0dULL,
+0xdaee2860b97031bcULL,0x00000000dc98edc4ULL,
+0xbdc3d768c44e02bcULL,0x00000000ab157bb4ULL,
+0x1191a85e80ae831eULL,0x00000000183ad0e0ULL,
+0x2e13ebebedccec28ULL,0x00000000a9168ca7ULL,
+0xb644e3e28b233537ULL,0x00000000881a94ddULL,
+0x3060a2e69143c906ULL,0x000000007c33e513ULL,
+0x49869995760e4123ULL,0x000000004b3d6ee4ULL,
+0xba23b96048184e77ULL,0x00000000c3e7285bULL,
+0x25bd898b6811038aULL,0x000000005a3729e2ULL,
+0x3b0a5256d20c2155ULL,0x0000000045ce9510ULL,
+0x5292b49242297781ULL,0x00000000010b1ab8ULL,
+0x6ced623cb3ed7566ULL,0x000000002114d90cULL,
+0xddea0b8941051e6cULL,0x00000000376ca5e2ULL,
+0x8a9658cd38b96d9aULL,0x00000000ead20330ULL,
+0xb2ce9e24a7c16ee6ULL,0x000000006748e724ULL,
+0x3881c11a6306d7deULL,0x00000000a4d27356ULL,
+0x971a7478269c9363ULL,0x00000000be491bb0ULL,
+0x87bd7a035990b924ULL,0x00000000534e7557ULL,
+0x5077815ac97ee5e3ULL,0x0000000025e6cec9ULL,
+0xd3843211d89796a3ULL,0x00000000a0d4c04eULL,
+0x897a9364dd3dde2dULL,0x000000001b508120ULL,
+0x58826858913b0b1aULL,0x00000000cbed1951ULL,
+0x6ceeb3c42cd8401cULL,0x00000000a2a8ca23ULL,
+0x5200ac59246ac51dULL,0x000000002e1ca800ULL,
+0xed448aac65807d7aULL,0x0000000071190d7cULL,
+0xdc609c26549d8077ULL,0x000000009712e379ULL,
+0x169ae8c2639bd003ULL,0x000000006a276787ULL,
+0xe42eb6792d5b1011ULL,0x000000008da9e35dULL,
+0x81412075618cea7aULL,0x00000000c906c6ccULL,
+0xe809e395905b3954ULL,0x0000000007b32908ULL,
+0x755504b285965107ULL,0x0000000008bb3bdbULL,
+0x9a9753538d396e3eULL,0x00000000c5a15904ULL,
+0x98559c27d4609c79ULL,0x00000000bc47232cULL,
+0x983950e54bd78e23ULL,0x0000000056a207d4ULL,
+0xd14d20549e26ba4aULL,0x00000000dc1dc762ULL,
+0x3269a6aba15d82ecULL,0x000000002a3119b5ULL,
+0xbb637e48c84d77e5ULL,0x0000000054a3d57cULL,
+0x38e073aea248435aULL,0x00000000a2100351ULL,
+0x8c0d9944e3100941ULL,0x0000000083da1498ULL,
+0x56a3841064ededc0ULL,0x00000000baee7524ULL,
+0xa43c8e99a65abcd0ULL,0x00000000e97a9834ULL,
+0xec599479450e9c64ULL,0x00000000d533a01aULL,
+0x0cd497eba7412225ULL,0x000000006043e0e8ULL,
+0x7a9540c72cd490ceULL,0x00000000c81d2921ULL,
+0x6a7ba1a9c6b86c2aULL,0x000000005615a5a5ULL,
+0x58b20312027193b0ULL,0x00000000e4c81cb7ULL,
+0x57674b43b1d3d192ULL,0x0000000078675371ULL,
+0x9bc9d7469ec3c6b3ULL,0x00000000855b5199ULL,
+0x179ab022ebd8bc39ULL,0x0000000022669687ULL,
+0xa846c427d68a2538ULL,0x0000000077834b17ULL,
+0x9476375401382a46ULL,0x0000000093aead85ULL,
+0x4dbbb739a2d73b94ULL,0x000000008d0ab227ULL,
+0x5636c22ebe560dc9ULL,0x000000006312758aULL,
+0x3dceac4606977056ULL,0x00000000a91ca311ULL,
+0x62d5a9079184abbbULL,0x00000000558b4113ULL,
+0x294ed0780cb7481aULL,0x0000000019641545ULL,
+0x25783dc7786973d7ULL,0x00000000e154a522ULL,
+0xc79a1c4ad744c819ULL,0x000000009118d250ULL,
+0x078b38267a2791d0ULL,0x00000000427432b3ULL,
+0xdbdc14b22c165d8cULL,0x000000000c210dbeULL,
+0xc85226cb1470b505ULL,0x000000001126b1d2ULL,
+0x18245b2036032a0eULL,0x000000007e2c1d05ULL,
+0x046a4a8dace7a0e4ULL,0x000000009417b2edULL,
+0x093a53a39de7c451ULL,0x00000000ad87b5d2ULL,
+0x2314b8b4897a75beULL,0x000000006d290c66ULL,
+0x6e089d7292170416ULL,0x00000000551c852bULL,
+0x1c80aabb55a5e765ULL,0x000000007bd74e51ULL,
+0x5c31346647483c81ULL,0x00000000b66a9a4aULL,
+0x68849a628589336cULL,0x000000009353978bULL,
+0x4004b2e819a48b89ULL,0x00000000012bba40ULL,
+0x38b5be50230a4859ULL,0x00000000779b3cc3ULL,
+0x661aa55975c6e648ULL,0x00000000b2153c79ULL,
+0xc044ab4e689928e5ULL,0x00000000cc26acbcULL,
+0xb1017e308d328191ULL,0x00000000736be373ULL,
+0x2a2b50db1d551917ULL,0x000000004edee60bULL,
+0xb05ed261b77541a9ULL,0x0000000029776312ULL,
+0x9d36ead8d0a5779aULL,0x00000000d0ea349dULL,
+0x0759dbdb75a14c19ULL,0x00000000b14172b9ULL,
+0x6858c02992b940b5ULL,0x00000000352cd853ULL,
+0x1c02a370859e6d50ULL,0x0000000003826d61ULL,
+0xcb79176308b4c319ULL,0x000000003495ac93ULL,
+0x645b5930564ec987ULL,0x000000007467177eULL,
+0x44daeb50d22d7b9aULL,0x0000000026404a66ULL,
+0x6e40a59a1817437bULL,0x000000001355d097ULL,
+0x69700d3acd8c2930ULL,0x00000000cb15313bULL,
+0x68a8715b70cb2121ULL,0x0000000006e154e6ULL,
+0x0aa0426d45778a3cULL,0x00000000b52b648cULL,
+0xa109ac4b95411dd1ULL,0x000000005976e3c5ULL,
+0xde385dd59ce5a7b0ULL,0x00000000852b532eULL,
+0x9ee75617061e99eaULL,0x00000000e385794dULL,
+0xbd8ded37969b3031ULL,0x0000000050abd4c4ULL,
+0x70e0bba412b09c6aULL,0x00000000934247c5ULL,
+0x49bba9b67447485cULL,0x0000000050a78520ULL,
+0x75a880d866657c6eULL,0x00000000b4c60a8aULL,
+0x4bb6b55637e3123eULL,0x000000006de92575ULL,
+0x1de61c8d81ad3427ULL,0x00000000e2da7961ULL,
+0xbd2d5a2a631a49eaULL,0x0000000093d54b58ULL,
+0x20dbdbd5bd57e4e6ULL,0x000000008755a1d5ULL,
+0xabdae76bb7427076ULL,0x00000000342e9e89ULL,
+0x8831c602ea4bd9a7ULL,0x000000007d74e187ULL,
+0xa3d74069230c9192ULL,0x0000000092819d09ULL,
+0x14545850ce68da8dULL,0x000000007b08d613ULL,
+0x888b9a69d8889a77ULL,0x0000000097b219a9ULL,
+0x0868cd4d1691e302ULL,0x0000000018510350ULL,
+0x330db051c168c765ULL,0x00000000c73d9736ULL,
+0x7b9956d009a7b432ULL,0x00000000c501e7e9ULL,
+0x2e37785ba67c5303ULL,0x0000000088bbca19ULL,
+0x9a50b07c330c7024ULL,0x00000000a8e2a512ULL,
+0x191e64ba3390cc6bULL,0x000000004480168dULL,
+0xedb9b1a7cd4c539cULL,0x00000000647187daULL,
+0x7eeaa99249b72206ULL,0x000000004ea82383ULL,
+0x39e49dad51204de0ULL,0x00000000bea79081ULL,
+0x3a97ed8c704d653dULL,0x00000000d8d663e4ULL,
+0xaea6bc0433c35730ULL,0x000000008ca29ac8ULL,
+0xa226072092ed77a3ULL,0x00000000d37b7798ULL,
+0xe63ce65075b7741dULL,0x0000000046361840ULL,
+0x4747a1c0c3b23cddULL,0x00000000ab1ad553ULL,
+0xddc5b6d99dcb6e9bULL,0x0000000042da12beULL,
+0x960e2b96339d5c75ULL,0x00000000cea97082ULL,
+0xca6badc49637380cULL,0x0000000068962950ULL,
+0x94233db86aa965beULL,0x000000005e0c4ce7ULL,
+0x364b8c9c05911312ULL,0x000000000e9a8e55ULL,
+0x09d70cb231eae429ULL,0x00000000174349adULL,
+0xdc5512a625691bacULL,0x00000000b308b5c8ULL,
+0x21066d08b09e9078ULL,0x000000006eb0e6ceULL,
+0xb3981c932c165045ULL,0x0000000008159cd2ULL,
+0x7420d8152e50ce85ULL,0x00000000c135a88aULL,
+0x5d809514c49d9b4cULL,0x000000009585bb9aULL,
+0x02c15895c2cdc44cULL,0x00000000c8ec2e38ULL,
+0x288c96cbeda25d88ULL,0x0000000078566e12ULL,
+0x52e04b8e739d8715ULL,0x00000000a4579753ULL,
+0x8451c7aee727e20cULL,0x000000009e264b39ULL,
+0x29389bacc6612a00ULL,0x00000000695c3b1aULL,
+0xc7159a04bcc6be19ULL,0x00000000bd8a660dULL,
+0x9ee389b54ca42e66ULL,0x0000000054cd821aULL,
+0x00220be2cbd1a613ULL,0x000000008e2ac459ULL,
+0x6b8aba2e6dc3b5b3ULL,0x000000003a67b573ULL,
+0x0ebeb12686cecca1ULL,0x00000000255ba933ULL,
+0x94b3085567683d71ULL,0x00000000170d0e83ULL,
+0x53c7115c959c29b4ULL,0x00000000b02c22d3ULL,
+0xcb7c861b4c640332ULL,0x00000000c695d84dULL,
+0x032c0db04785c9a2ULL,0x000000008d1cc927ULL,
+0x64c4343e52150017ULL,0x00000000807e1b46ULL,
+0x3042412400d9d52cULL,0x000000004eae2cb1ULL,
+0x5b297ca95117325aULL,0x00000000688c2c14ULL,
+0xb073c339c3a495d8ULL,0x00000000d963cb9aULL,
+0xe3ec58520a8b2ce5ULL,0x00000000995780d2ULL,
+0xd40ee0da8edaac0cULL,0x00000000d5955807ULL,
+0xaa6a41dcc8d94c84ULL,0x00000000db7b3e9cULL,
+0x8775ad0a72dc64b6ULL,0x00000000580a3a3dULL,
+0x11e7b48628089e36ULL,0x00000000dba80cb4ULL,
+0x450aa5777271238aULL,0x00000000e617e271ULL,
+0xaa70d36a63c9aec4ULL,0x00000000dae99beeULL,
+0xd9e6262eec9d959aULL,0x000000003466d782ULL,
+0x95c955e657286b01ULL,0x0000000031571dceULL,
+0xe200e91a3285823bULL,0x0000000045badab7ULL,
+0xb6283d016771e540ULL,0x00000000856d7a2aULL,
+0x6e5406c4b42274b6ULL,0x000000004c26b488ULL,
+0xc922bdec08564b0aULL,0x0000000026e3bd1dULL,
+0x9bb8ca98a0e5498dULL,0x0000000001e6540aULL,
+0xbe544966a5813c63ULL,0x0000000031e80a51ULL,
+0x5e4a3a140771984eULL,0x00000000bade1a6dULL,
+0xa2c43308b657eeceULL,0x000000003ae2c5d0ULL,
+0xa76e39b85e803092ULL,0x000000002eed8a3cULL,
+0xa6630c3ee1599a2cULL,0x000000007e93b9c4ULL,
+0xc45d59ac2523cbe7ULL,0x0000000009e5b4e9ULL,
+0x81524d29175ec361ULL,0x000000004de02e55ULL,
+0xe30127214c33543aULL,0x00000000a3b35d6cULL,
+0x2d641d7b644c5020ULL,0x00000000d491019aULL,
+0xc5466d42e9526ed5ULL,0x00000000163e6e70ULL,
+0x3dabba77b45c7dd7ULL,0x00000000a4c80957ULL,
+0x084e0e9d021cede2ULL,0x00000000e4bb25e9ULL,
+0x78411e4990209d4dULL,0x00000000ead441caULL,
+0x8c300996668d4a64ULL,0x0000000042013503ULL,
+0xed38187d3147eb27ULL,0x00000000257aad7bULL,
+0x489b859c2deb90bbULL,0x0000000092d29b92ULL,
+0x64e482101b20da65ULL,0x000000007117cb2bULL,
+0x39a83edca68cd813ULL,0x0000000065643434ULL,
+0x761a434b77b852bcULL,0x0000000005a11c06ULL,
+0x43e485281b60bed6ULL,0x000000009c8dbc8dULL,
+0x4200a87c5184b1e7ULL,0x00000000c06539bcULL,
+0x319a8b97815d230eULL,0x000000002c9b2d6eULL,
+0xa8b55b259843a213ULL,0x000000007174a0c5ULL,
+0x719ec867c6176decULL,0x00000000883dae82ULL,
+0x20a9d211bcebbbbdULL,0x000000005493e03cULL,
+0x2ae4bd45720e75d7ULL,0x0000000076d69dcbULL,
+0x1d885c4b611b6cdbULL,0x00000000c3a5e947ULL,
+0xc37bb4be8c4e500cULL,0x00000000431a402eULL,
+0x522507213dda2d69ULL,0x00000000913935ddULL,
+0xaca95820a6429019ULL,0x0000000042975d2cULL,
+0x24acd3e60892e9edULL,0x000000003879873eULL,
+0xeb94c8b613cd409eULL,0x00000000cc2157a5ULL,
+0x572202709d4d3e74ULL,0x0000000035a0e89cULL,
+0x96ca2570a87b8906ULL,0x000000000065913dULL,
+0x2e1aed658b921ba7ULL,0x0000000001de8b08ULL,
+0x1b1c42135b520e35ULL,0x0000000083379478ULL,
+0x0cc1741426ead8c0ULL,0x0000000021292480ULL,
+0x6c6b6b2dbea85887ULL,0x000000001a63a0a9ULL,
+0xa0a2ce59620c60bcULL,0x000000006b47ea95ULL,
+0x3e7736c1ba0e5a17ULL,0x000000008188ac76ULL,
+0xe6b4c12a23ed9cbcULL,0x0000000054a2ea2eULL,
+0x53097ee2b83b2350ULL,0x0000000018ccbd0dULL,
+0x049eecd327c2226bULL,0x000000000968cd8cULL,
+0xb79508c9786cdc80ULL,0x000000001285eda6ULL,
+0x599375917e2408d1ULL,0x0000000064a38005ULL,
+0xd36d40ea951aa176ULL,0x000000004b06dd8cULL,
+0x2205078adb836b17ULL,0x0000000085d0dcabULL,
+0x8306add8909325abULL,0x000000006b01781bULL,
+0xc89763b898685615ULL,0x00000000d01e2053ULL,
+0x0166b8b21616ca3eULL,0x0000000044bae608ULL,
+0x515089b8c4d05410ULL,0x0000000074690c2cULL,
+0x399b4ad35b462556ULL,0x0000000063cbc9d6ULL,
+0x3704a307428643bcULL,0x000000001918e4e6ULL,
+0x7bd96a8732cb860cULL,0x00000000718882c6ULL,
+0x449e16e28d8a2a2dULL,0x00000000caba545dULL,
+0x4a8c08c7984665c0ULL,0x00000000b675e76aULL,
+0xedcb1a15de9cb517ULL,0x0000000017086810ULL,
+0xa65e7aa71c44b65aULL,0x00000000cbc14c89ULL,
+0x28a807b65b48aae4ULL,0x00000000dcb05022ULL,
+0x98360ed74a2b7dd5ULL,0x00000000a8126215ULL,
+0xda6d7c0677a571ceULL,0x00000000db910006ULL,
+0x9aa874b6b8b219d7ULL,0x0000000010c328e4ULL,
+0x76a800b6e0ba6174ULL,0x0000000026ec6dc0ULL,
+0xae736a32bd3bebe3ULL,0x00000000c31e52e1ULL,
+0x8ac9e329e2477be1ULL,0x000000000586aae1ULL,
+0x1b98355819eb21b1ULL,0x0000000062e29a73ULL,
+0x6e81b1e51767408cULL,0x00000000c68533b2ULL,
+0x3e72c285992119c4ULL,0x00000000bce3475dULL,
+0xb05b70c8b2cdbd8cULL,0x0000000013a2cc13ULL,
+0x506acca653d38e9aULL,0x00000000122ab49bULL,
+0x7e013ebd4d8848dcULL,0x000000009a815eb3ULL,
+0xe17156847e21bacdULL,0x000000007b245942ULL,
+0xc6ce5b13ea016c63ULL,0x0000000015c9e335ULL,
+0x6e8cd1cc00dd6690ULL,0x00000000ed6882e5ULL,
+0x49e674be04661d18ULL,0x0000000017850e8cULL,
+0x199e61889bb29eacULL,0x0000000065644546ULL,
+0xde117be679aced00ULL,0x0000000032854750ULL,
+0x27c55ada013205d2ULL,0x00000000b9bca968ULL,
+0x775aac136d68e00bULL,0x00000000e270a34cULL,
+0x72c1790e4e32d045ULL,0x00000000577ee0a9ULL,
+0xd1112c98e5a8e053ULL,0x00000000775878c3ULL,
+0x2d9e47d09d82741bULL,0x0000000086d74b52ULL,
+0x99188e88aabd4aa9ULL,0x00000000b419bc2eULL,
+0xa7bbb391452636b0ULL,0x000000004b1d6714ULL,
+0xa666d2547c415b48ULL,0x000000007b42bb31ULL,
+0x1651dad8aec36203ULL,0x0000000012833cc2ULL,
+0x0823aaebea818ba0ULL,0x00000000c1081d4aULL,
+0x9d92deea559bc79cULL,0x000000002a8a72a6ULL,
+0xc00851ebaddb6ca5ULL,0x0000000008c3098cULL,
+0x11a04ce33943ce9bULL,0x0000000090688a84ULL,
+0xde23a5c639210322ULL,0x00000000b700ce7eULL,
+0x8bc1e4e966bc4763ULL,0x00000000d1ec8aa8ULL,
+0x7936252d518689c2ULL,0x000000003923a675ULL,
+0x6411b8d27c83765cULL,0x0000000097d64e00ULL,
+0x90e2650ea14bd85eULL,0x0000000030105e44ULL,
+0x490ba567b4be70b2ULL,0x00000000db821d88ULL,
+0xad9c4d02b9052a93ULL,0x0000000087b8aa8bULL,
+0xec844e06433522b3ULL,0x0000000019a023a6ULL,
+0x528ba8b8946c5810ULL,0x000000000c2c7500ULL,
+0xe64230967866c4c6ULL,0x000000000cc7b53cULL,
+0xd1b2c1bb059a3b2bULL,0x0000000060b44590ULL,
+0xc7c889c73117277eULL,0x0000000076886186ULL,
+0x15a276767dc14d3eULL,0x00000000a74ea987ULL,
+0x7dc637b20819741aULL,0x0000000044e66dabULL,
+0xe71ad8d06e1637c1ULL,0x00000000512330c0ULL,
+0x58da1e3168370dd5ULL,0x00000000b66a010cULL,
+0xd4d86a5b2c382096ULL,0x0000000075c3b1a9ULL,
+0x737ad0da241629a4ULL,0x00000000cd2c69a6ULL,
+0x7b7590d49b3d52d7ULL,0x00000000a8114c5dULL,
+0x888202c4301aa9beULL,0x0000000058c2a7ecULL,
+0x2759a96290a548b3ULL,0x00000000b14ba2a3ULL,
+0xc60ad70843a881e2ULL,0x00000000b61345a6ULL,
+0x415a9c18deb1d0b0ULL,0x000000005546c11dULL,
+0xd9c83bbc9db94926ULL,0x0000000086196559ULL,
+0x078ce252c2b9eb7dULL,0x000000008694a251ULL,
+0x51390130250cad28ULL,0x000000006d99120bULL,
+0x4cc61accdee0cda8ULL,0x00000000075ac310ULL,
+0xe3d0de4bb8812e17ULL,0x00000000ed2a82eeULL,
+0x2dc59d5468b524a1ULL,0x000000008abc6866ULL,
+0x9e6d64b604edae1eULL,0x0000000083958a01ULL,
+0x9e9eed3bee24a501ULL,0x000000009b270a87ULL,
+0xe2cbc9387db60ec8ULL,0x00000000592e1addULL,
+0xcc84ba71aa33666bULL,0x000000006d11524eULL,
+0x11c01980bca0eb47ULL,0x00000000e4aad67dULL,
+0x0a4e2685d977dd38ULL,0x000000006d506d49ULL,
+0x583a3750a78cab5dULL,0x000000001a134accULL,
+0x145e6a0322c6e534ULL,0x00000000036ee9deULL,
+0x67109e6a0c67a4c0ULL,0x0000000030554545ULL,
+0x5954d3272b8c94aaULL,0x0000000057cc9b52ULL,
+0x549ad92676ebe875ULL,0x0000000070cddc8bULL,
+0x184c34896d572814ULL,0x000000001635e3deULL,
+0x1bca52d6e5a88d6cULL,0x0000000036a9d87bULL,
+0x2b51d83b580814d6ULL,0x0000000017901973ULL,
+0x07d67c9699b4ab79ULL,0x00000000c9947a5cULL,
+0xe237b0bc48740ea1ULL,0x000000002eb0d7aaULL,
+0xdc8b57447741dc24ULL,0x0000000071001007ULL,
+0xc979316646705e5aULL,0x00000000256b91c2ULL,
+0x8c4ec6c5b642344aULL,0x00000000b57cb690ULL,
+0xa3a1d623811c3aedULL,0x00000000ed8aa090ULL,
+0x9777abd160aa15ddULL,0x00000000e51042a5ULL,
+0x0c0c16e06c2431b8ULL,0x0000000053aae82bULL,
+0x0352e061453ec3a5ULL,0x00000000a283aa80ULL,
+0xa5d28142d5a602cbULL,0x0000000064ad380bULL,
+0x645b782eb50213baULL,0x00000000273c9073ULL,
+0x2e7c1e497c7eed17ULL,0x00000000e71dd79aULL,
+0x4e94616d2a04427dULL,0x00000000a19c8d40ULL,
+0x66989b01e980233cULL,0x000000004bba9bb1ULL,
+0xd91ea4ba234db9c8ULL,0x0000000078dd9a4eULL,
+0xb2e9776a074db0c8ULL,0x00000000adc675e9ULL,
+0x1635e9cde8cbb0c3ULL,0x0000000034c341d6ULL,
+0xecd5464345c493a3ULL,0x00000000b61571adULL,
+0x9b2c06ae371ba796ULL,0x000000003270a38dULL,
+0x340adb7604987641ULL,0x000000002ac8eaa3ULL,
+0x1b965b5c7ec22de5ULL,0x000000005313c324ULL,
+0x1e4934b54eeeaeddULL,0x0000000057442dedULL,
+0x56185a3a85d45961ULL,0x00000000d057ac8dULL,
+0xaa07cedad0ca3053ULL,0x000000005ea702e5ULL,
+0x5eb2e0d0143bbb94ULL,0x0000000067a1a635ULL,
+0xa311a46d36435593ULL,0x0000000052100b7cULL,
+0x425c28e6d752948cULL,0x00000000e71784bbULL,
+0x4cc47e3c552ec84cULL,0x00000000d0816a85ULL,
+0x06bc41b3598e396dULL,0x00000000988ea112ULL,
+0x1bcc87a2e9011163ULL,0x00000000574103d7ULL,
+0x6dc3c40a24d4616aULL,0x00000000483e1c20ULL,
+0x3c5204859a53b428ULL,0x00000000e5ae1c12ULL,
+0x3328911baaba1282ULL,0x0000000023a36173ULL,
+0xb8326d7ee4c7ba5dULL,0x00000000d45b0482ULL,
+0x985929edc414c366ULL,0x000000000b2845b5ULL,
+0x5154ac90d83c82d1ULL,0x000000006bd10b29ULL,
+0x30bbd97b5ad02be6ULL,0x0000000005306261ULL,
+0x2b6d1501293c265bULL,0x00000000533e8239ULL,
+0xee1c1a2d5bab2824ULL,0x00000000bb9472e7ULL,
+0xb3950c2d68684d99ULL,0x000000008cc63286ULL,
+0x056d5d04b358598dULL,0x00000000e5827b9eULL,
+0xdc2b5545a4b55469ULL,0x00000000c2d08191ULL,
+0x7b58b45aa95c2243ULL,0x0000000018857d5cULL,
+0x279477eb125357acULL,0x0000000073085b00ULL,
+0xc685b5d1c39d179dULL,0x00000000804845a4ULL,
+0xa1278911c8cca0dbULL,0x00000000c373a1a6ULL,
+0xd48d2703382277d2ULL,0x00000000963e12c8ULL,
+0x5e2e430abc255a41ULL,0x00000000a4255733ULL,
+0x99020b0b8d70b74cULL,0x00000000d269a8e2ULL,
+0x8933b93ba1d7850bULL,0x0000000039264804ULL,
+0xd6002041ce96c415ULL,0x00000000d7013337ULL,
+0x77829837b474dbd4ULL,0x0000000041556bd0ULL,
+0x09c4da723c16930eULL,0x00000000606a7b92ULL,
+0x978b46c9e7ccbe17ULL,0x00000000c0894eadULL,
+0xa2331b42287d3d46ULL,0x00000000431bb411ULL,
+0x48be53d9e4c423d3ULL,0x00000000484d34a8ULL,
+0xbd83611db8739826ULL,0x00000000463913b6ULL,
+0xad6b64002b6e3a1dULL,0x000000009b1c546dULL,
+0x60bb22c7e3e4cb2cULL,0x00000000d2430838ULL,
+0x08d080d9b74590c0ULL,0x00000000c81299a7ULL,
+0x72320e7c5379dc5bULL,0x000000008563cecbULL,
+0x074b9495b86ed243ULL,0x00000000312a2e24ULL,
+0xd18394c6cbda8d74ULL,0x000000007d05b3d7ULL,
+0xe4582403cc932dbbULL,0x00000000db00c74cULL,
+0x35cda4722e964d8aULL,0x000000006529b334ULL,
+0x8c26906765747ea2ULL,0x0000000051621ba9ULL,
+0xe2087279e0a1a4a4ULL,0x000000001d979e86ULL,
+0x6cd05030b7644044ULL,0x00000000e3543703ULL,
+0x14c326b49ab4acaaULL,0x00000000a79517acULL,
+0x4a024464bcb1103bULL,0x0000000010be9743ULL,
+0xcc338c5a36ad8876ULL,0x0000000062310838ULL,
+0xd7dc3c783c063e1dULL,0x000000000b0a8ad0ULL,
+0xb2099e49b500aa89ULL,0x00000000521aa58aULL,
+0x1813168d477878deULL,0x00000000e2e785abULL,
+0xed4ce1e49a1ce6d4ULL,0x00000000a8b36034ULL,
+0x22d1b8ba8e6d864aULL,0x00000000816a941bULL,
+0x1e06b21e6e69db18ULL,0x00000000d1aa7c59ULL,
+0xc6e31503701735e8ULL,0x00000000055a4862ULL,
+0x211db8eea6894330ULL,0x00000000c54795b1ULL,
+0x728b8da871736391ULL,0x00000000ae9e3173ULL,
+0xb9a117546c7b772eULL,0x00000000b9869a26ULL,
+0x7bc13ee39a662776ULL,0x0000000083a98581ULL,
+0x08c319a6d775e6e7ULL,0x0000000085d86696ULL,
+0x14e767d40c830254ULL,0x000000000094053aULL,
+0x7be46ba36a6e4660ULL,0x000000001495eb1eULL,
+0xebc635085662dbebULL,0x000000000a8d7d2aULL,
+0xb52989b6a0a2e5dcULL,0x000000005e27db48ULL,
+0xc30a9208a110010bULL,0x00000000218360a9ULL,
+0x9d99c815c921e174ULL,0x000000003dd308e7ULL,
+0xe48777aa3516eb32ULL,0x0000000020e8450dULL,
+0x1e6c23a27a8b8d21ULL,0x000000009702d2eaULL,
+0x7a008ce83bb4d1bcULL,0x0000000039757725ULL,
+0x376dc0b3756e2288ULL,0x000000005937b4a0ULL,
+0x36eab662da948a00ULL,0x000000007503430cULL,
+0x6670779c56851990ULL,0x000000001507748dULL,
+0xc26e2e8bd598479aULL,0x00000000432713b4ULL,
+0x019486366d2d59a0ULL,0x0000000093549a58ULL,
+0xea1a5be247be064bULL,0x000000007a6e9860ULL,
+0xa6076464a4a81ab7ULL,0x000000005169d6daULL,
+0xdc91ca456edc5c12ULL,0x0000000030bde80cULL,
+0xb3550973bcb9a793ULL,0x00000000277ec388ULL,
+0x53ca93613101bdaaULL,0x0000000099e6157eULL,
+0xd653e932d9b1ea95ULL,0x00000000b98210acULL,
+0x1c48c79131cbd967ULL,0x0000000066e6438aULL,
+0x8e618ce453931c20ULL,0x0000000010c0b493ULL,
+0xd2508093e53374d8ULL,0x000000000b1474c4ULL,
+0xe1ae1e7cb00ee254ULL,0x0000000035c88198ULL,
+0x536be2e34d5d302eULL,0x000000000109078cULL,
+0x44e1a94addd1b0a0ULL,0x000000007a27b2a4ULL,
+0x531068ec5099da3aULL,0x00000000a30da90aULL,
+0x73677c09c21c7e7dULL,0x0000000033bba1eeULL,
+0x6248e82b2ab530a0ULL,0x00000000b3c9280eULL,
+0xaee1932a174bdeccULL,0x0000000036b28b33ULL,
+0x1e837917c2767406ULL,0x00000000c82d6988ULL,
+0x8cc278aae5973872ULL,0x00000000cb48d538ULL,
+0x69213817b3e7eb10ULL,0x000000004ea9001dULL,
+0x7dc020ad3062e4ddULL,0x00000000cac96a44ULL,
+0x3a5c5c00eb2a7db3ULL,0x0000000016be0d18ULL,
+0x15d46ade42cd4d52ULL,0x00000000a0dd4b36ULL,
+0x6d5990028733b546ULL,0x00000000847c5476ULL,
+0x93d0d77a732c3ac2ULL,0x00000000364a2577ULL,
+0xc548408066830078ULL,0x00000000ac7d8e07ULL,
+0xe914785b50e46a37ULL,0x000000006ae2d974ULL,
+0x8c23e29783355518ULL,0x000000008c02abb5ULL,
+0xd619c61818980bbcULL,0x000000004115a5e6ULL,
+0xec37baaba3eabc3dULL,0x000000005d410139ULL,
+0xe1e9eb72d11d9e69ULL,0x000000005867e018ULL,
+0xd8e129d028397463ULL,0x00000000c423366dULL,
+0x2ab5d3ce8598312bULL,0x000000001758deebULL,
+0x424e4d0e6e57900eULL,0x000000008a87b7b8ULL,
+0x5496450c69dc7dc0ULL,0x00000000e3bc7a42ULL,
+0x1b7e523a9e73e170ULL,0x00000000724d06a1ULL,
+0xc5e966565136b528ULL,0x00000000d5442375ULL,
+0x9b5d723d91c4b852ULL,0x00000000b3bd4813ULL,
+0x8907d1b155e6a8e5ULL,0x0000000083e7112bULL,
+0xeb2da0c5bc24563bULL,0x00000000b7a356daULL,
+0xe567038b16dbb4c7ULL,0x000000004a628462ULL,
+0xd6da84c67997b8c0ULL,0x0000000000973120ULL,
+0x4ec71938d4683babULL,0x00000000d75a6e23ULL,
+0xa8ea322d398da15bULL,0x00000000a59e554eULL,
+0x4bae3edce6754945ULL,0x0000000083515004ULL,
+0xb0ee6388a029c013ULL,0x00000000ba74d977ULL,
+0x9e2d405da92bedcaULL,0x0000000036330d28ULL,
+0x8e948c35c4321937ULL,0x000000006dd89aaeULL,
+0x2967a8319dcd4766ULL,0x000000001e902785ULL,
+0x838d3b20a4c579c6ULL,0x0000000033a51ea4ULL,
+0xb9e4042068b59ed5ULL,0x000000007563dd46ULL,
+0x729155d70bb7b12bULL,0x00000000a5e587e2ULL,
+0x0e1c217d6847b16eULL,0x000000006e11a875ULL,
+0x533809e6901c1888ULL,0x00000000ce2aa81eULL,
+0x048ca388949317c1ULL,0x0000000079e22eacULL,
+0x822798e839b0e150ULL,0x00000000bdcb3db0ULL,
+0x4729b3bd66999d1bULL,0x00000000685ac661ULL,
+0x38269c80ebbbcdacULL,0x000000006e011b6aULL,
+0x7a392eb4068dcb6cULL,0x00000000950ba176ULL,
+0xd9d015e36c84a690ULL,0x00000000504423e5ULL,
+0x38294d182b41be5eULL,0x00000000303b594aULL,
+0x4ac0a0a99cd3740cULL,0x00000000bc232786ULL,
+0x55cdce1e6d52e76bULL,0x00000000e01c39d7ULL,
+0x0516bc5c139761a5ULL,0x0000000036c3a9cbULL,
+0x82d23ce89281a7deULL,0x0000000018538125ULL,
+0x81b0b953ba678b04ULL,0x00000000d01b137aULL,
+0x8ac909ca45e5720dULL,0x00000000194ec937ULL,
+0x0d44068e271e51acULL,0x0000000085dc52dbULL,
+0xcbcd466940b6ea22ULL,0x00000000201b0807ULL,
+0x14cc4ede38d06887ULL,0x00000000909b61ddULL,
+0xd873aed31ad272d1ULL,0x000000009e67eb79ULL,
+0xe7567366b7c98411ULL,0x000000000508d737ULL,
+0xad0d644652224123ULL,0x0000000066b248a5ULL,
+0xb9ad3ad281846c12ULL,0x000000000ecdd66cULL,
+0x4a4d6dd40db6316aULL,0x000000009cc96279ULL,
+0x81a07d3b7b68a8a9ULL,0x00000000a2280ec5ULL,
+0x7694bdd17a58878aULL,0x00000000d13e6d83ULL,
+0x27995a751beb8a58ULL,0x00000000e8e8675aULL,
+0xaad711a09aa9a493ULL,0x0000000098edb19bULL,
+0x9779265535d0e17aULL,0x000000004625320aULL,
+0x92c3918770b3e7c5ULL,0x00000000315ade5eULL,
+0x11e9468b68de8b6aULL,0x00000000d42e2a70ULL,
+0xbd585e84089e4986ULL,0x00000000c0ed0b63ULL,
+0x94d4a12bb0bce602ULL,0x00000000e7ab0873ULL,
+0x988e09c54c2119bdULL,0x000000000ec38498ULL,
+0x9e1408ab7369eba5ULL,0x000000005dc551c4ULL,
+0x4c8aab46a6a9185cULL,0x00000000097cc1a4ULL,
+0xadebd59ca72db620ULL,0x00000000383c3ca3ULL,
+0x96cc04d29a969668ULL,0x00000000d090bb80ULL,
+0x08d0933776516a53ULL,0x00000000cad1a565ULL,
+0xe73d172d0ae9e7b4ULL,0x00000000866bc16dULL,
+0x120e497e1b99ee07ULL,0x000000007eddd755ULL,
+0xe5a307cd5ce5d515ULL,0x000000004c245052ULL,
+0xd1cb295a46cbd4caULL,0x0000000008d2ecbdULL,
+0x01638738607e5373ULL,0x00000000bdeeb92cULL,
+0x1d0ca8040d35e185ULL,0x00000000bb981a66ULL,
+0xc164685b5b84a54dULL,0x00000000472592a7ULL,
+0xd858e9e95c308878ULL,0x00000000dbbc4ae4ULL,
+0x0db85214c9d66516ULL,0x00000000cc510546ULL,
+0xa45e3e3e6a9e919eULL,0x0000000012049c61ULL,
+0xa16ec62c40e967e6ULL,0x000000008776bd07ULL,
+0x2aeb7624716c3d62ULL,0x00000000a01eae63ULL,
+0xb0858a4726315021ULL,0x0000000092b64be6ULL,
+0x0d33091425b478e6ULL,0x000000007d6c0da2ULL,
+0x12e77ae2a62d66a2ULL,0x00000000c2a7e889ULL,
+0xec2159d7be81c79bULL,0x0000000043180b66ULL,
+0x403d74b74898d576ULL,0x00000000eaba41caULL,
+0x49e9755715395a6bULL,0x0000000047b985e7ULL,
+0x17d9dadc7827441eULL,0x000000009eca94ddULL,
+0x22402cdb2bc169edULL,0x000000007bbe4c40ULL,
+0x656a411a4b8ded38ULL,0x00000000b20e551cULL,
+0x3ca58b5921501826ULL,0x00000000e22e3077ULL,
+0x47387e979bb54860ULL,0x0000000098cb4963ULL,
+0x07b646e15d59ab7cULL,0x00000000611163b0ULL,
+0xa67ab38d80b7cea7ULL,0x00000000b0a4a121ULL,
+0xe84045503280b3b0ULL,0x00000000c0bee9bdULL,
+0x866a33b069369494ULL,0x00000000d375cc37ULL,
+0xc65103e3310827b4ULL,0x00000000837de4abULL,
+0xa1bc7e8d59930038ULL,0x0000000090b56cb9ULL,
+0x06a2a7630a207c6bULL,0x00000000232bd942ULL,
+0xeb23e20c3940bcd0ULL,0x000000007060d39eULL,
+0x494b2038c13a68ddULL,0x00000000e27a7600ULL,
+0x367661aa57bc6d74ULL,0x00000000e6d53a30ULL,
+0xe97b743204574649ULL,0x000000009cdcb6e6ULL,
+0xac9cd82d5584b5e4ULL,0x000000006402e041ULL,
+0x973a00d3680e1861ULL,0x0000000014d37ac4ULL,
+0xd759e51ad15376c5ULL,0x000000000188d17bULL,
+0x62984689d8e3864cULL,0x00000000843b2bdcULL,
+0x11ce1c640c24e799ULL,0x00000000b915c929ULL,
+0x6d632e2471eea4eeULL,0x0000000027526513ULL,
+0x54425118a86c6531ULL,0x00000000b69cc00aULL,
+0x5a85e04e21ea3b74ULL,0x000000004cb46545ULL,
+0x6929d17081ee30c9ULL,0x000000007991da71ULL,
+0x6c078bac3cd4452dULL,0x0000000079b1d24bULL,
+0x39c98ee18ba61b0aULL,0x00000000cd3ce163ULL,
+0x04013d67502cb124ULL,0x0000000007002821ULL,
+0x5029cbb2cddbb63aULL,0x00000000a90aa45cULL,
+0xd47ed36468834a17ULL,0x000000007689b3a6ULL,
+0x1e02dd333d14d5a3ULL,0x00000000d352848bULL,
+0xacc6047589787930ULL,0x000000008b76d614ULL,
+0x0b1154716e1aad84ULL,0x00000000e702b1edULL,
+0xbed7e85052cc011aULL,0x0000000083a5ad97ULL,
+0xb2a21e969777d808ULL,0x00000000aeca2359ULL,
+0x6c29642d064a3507ULL,0x00000000135925e7ULL,
+0x179b82e3a4493d48ULL,0x00000000e7c2be5cULL,
+0x5073e10a144deea8ULL,0x000000006d27be42ULL,
+0x4763d904e34d6070ULL,0x0000000068ed3289ULL,
+0xb585bbb1cb2100bdULL,0x00000000058992ecULL,
+0x23e12b5d1e4d7777ULL,0x000000007a7cc53dULL,
+0x4ed13ae67b7a894dULL,0x0000000002dab811ULL,
+0x3e1ae03d06086c7aULL,0x0000000084622a81ULL,
+0x416daa2411d2d4daULL,0x00000000b1db495cULL,
+0x61d270e72a744db0ULL,0x0000000003aa4d31ULL,
+0x39cc787acc8b25e1ULL,0x0000000061500436ULL,
+0xb4478972a114eee3ULL,0x0000000039552bc8ULL,
+0xb5b869c8ca0188edULL,0x00000000edd70b1bULL,
+0x1904e6770d10b7ecULL,0x00000000d9579d71ULL,
+0x85bb4e296519415eULL,0x000000009eb1db51ULL,
+0x0a694a73e4dd228bULL,0x00000000ae953ce5ULL,
+0xdbec23eac520d7c5ULL,0x00000000323a18b7ULL,
+0x615606197c038d82ULL,0x0000000097a89260ULL,
+0x884128dd57408729ULL,0x000000004b7c9a68ULL,
+0xb139cd26de9ac86bULL,0x00000000935a780bULL,
+0xcd66b9895605aaaaULL,0x000000009adc6908ULL,
+0x04a312be17194681ULL,0x0000000090d198cdULL,
+0x35d5e791a6bdded7ULL,0x000000007eb59849ULL,
+0xcc7b67b845a60d45ULL,0x00000000827b2da8ULL,
+0x18e867341be6a6c9ULL,0x00000000dd8aea82ULL,
+0x2c7db7bdaca30094ULL,0x0000000049eb2be4ULL,
+0x82e22c08ce4cedbdULL,0x000000007ae506d8ULL,
+0x3d1aed9c2ee84e91ULL,0x00000000b5624acbULL,
+0x465513a467a02c9eULL,0x00000000c8487b0aULL,
+0x41c6aa13b4cb839aULL,0x000000000a6ad454ULL,
+0xd238e5d62a725619ULL,0x000000008242d301ULL,
+0x3edecb57d03347ecULL,0x00000000a6c766c1ULL,
+0x89585086984a4c5eULL,0x0000000045e27b68ULL,
+0xb71b9e4769c33b40ULL,0x000000007726626aULL,
+0x9e32a819cee43428ULL,0x00000000b803a999ULL,
+0xada424a53823c46eULL,0x00000000ec481229ULL,
+0x862b56aabb39cd33ULL,0x00000000762589d0ULL,
+0xe70edd8e7ea45779ULL,0x00000000a267b694ULL,
+0x69aa318a3b0ce952ULL,0x0000000090be2795ULL,
+0x64674c57251d8e68ULL,0x00000000a2476d5bULL,
+0xa65e02035635b207ULL,0x00000000809e117eULL,
+0x66ea16e79d17ea32ULL,0x000000006de23244ULL,
+0xd3a047e82b2a650eULL,0x00000000d39c87a7ULL,
+0x23cac4934815deb7ULL,0x000000002db0ec10ULL,
+0xe35cba56825d4ea6ULL,0x00000000a286961aULL,
+0x0aec99cbe3b4e5dbULL,0x00000000a7edb59eULL,
+0x03458d52a4609056ULL,0x00000000cd114a71ULL,
+0x8e7d3567272149b7ULL,0x000000003b66c061ULL,
+0xc229443ce9dd2887ULL,0x000000002a52a179ULL,
+0x0d1507204b195680ULL,0x0000000092217573ULL,
+0x17577d2717d18ae2ULL,0x00000000c9ca8e88ULL,
+0x3445a1bb3bb30e7dULL,0x0000000065763c82ULL,
+0xc07cd50a5eee1117ULL,0x0000000048a36910ULL,
+0x63eb45bc1843d170ULL,0x00000000abbc875eULL,
+0xe8d005dc361a26b4ULL,0x00000000b94643abULL,
+0x5cddde1d4c70aec5ULL,0x0000000033624606ULL,
+0x4a9b2d49151c54eeULL,0x0000000033539443ULL,
+0xc1a0d3e73e4197a2ULL,0x00000000d4a809acULL,
+0xec1d9843a0b92337ULL,0x00000000e307b69aULL,
+0x186983cdaeb481b0ULL,0x0000000040364b4bULL,
+0x44c0449300b3a915ULL,0x00000000aabd76caULL,
+0x17705b7bcad70d18ULL,0x00000000e4bdb3c6ULL,
+0x512c0e36e36317bdULL,0x000000000d1aa354ULL,
+0x819edd516c2b7d5bULL,0x00000000066280eeULL,
+0xee23bec157e75687ULL,0x00000000c9e2a08aULL,
+0x5b1c651c71ec719eULL,0x000000003bc30525ULL,
+0x076a3a54837777a2ULL,0x0000000083a78cc3ULL,
+0x86135beed4a8610bULL,0x00000000b7b63a84ULL,
+0x0a58384d054350d2ULL,0x00000000350eca0bULL,
+0xd160492096eb04a0ULL,0x0000000033ce17e9ULL,
+0xd229ecd2dc0345ddULL,0x000000006d7c076aULL,
+0x0803b279cbcd3445ULL,0x0000000029810530ULL,
+0x5bd8980e7334825bULL,0x0000000036924e48ULL,
+0x5682ae59671be980ULL,0x000000002931c7d7ULL,
+0x767485e66353d153ULL,0x00000000dd423286ULL,
+0x4a3042641875eaddULL,0x00000000698393b0ULL,
+0xea9bb040928b53dcULL,0x00000000932c0ec3ULL,
+0xc20e8633b3d85612ULL,0x00000000b7ececc4ULL,
+0x246de7b6651ae973ULL,0x0000000016b1c86bULL,
+0x5e0a24acad5b6b8aULL,0x000000009e7a99ddULL,
+0x643ceb8093a7e721ULL,0x00000000c583773aULL,
+0xa66d176b2a8c6a83ULL,0x0000000076c80383ULL,
+0x7379e6a7ac3529e0ULL,0x000000002616b9aaULL,
+0x6cc9ed3c95831873ULL,0x000000007ed63a74ULL,
+0xd29e78635274e3d2ULL,0x0000000067332d2bULL,
+0xc274a4e2962c8455ULL,0x00000000b4d88c1aULL,
+0xe3d73b916d3a3710ULL,0x00000000c3341b9cULL,
+0x39b6872d3a057523ULL,0x00000000e4a9c45bULL,
+0x7d2cc23147bb6905ULL,0x0000000075c6930cULL,
+0xdc5ed77ea7d70070ULL,0x000000007b3d6ed1ULL,
+0x8de8e2824489c912ULL,0x000000003cecdd66ULL,
+0x061275904437c410ULL,0x00000000d6358de2ULL,
+0x97338451a3e0b4b2ULL,0x0000000012ba4da4ULL,
+0x481a58c41d33a9b8ULL,0x00000000b1c4d619ULL,
+0xd58a4a3ad422e08cULL,0x00000000da48595aULL,
+0x9c0d6c4bc025ca61ULL,0x00000000340c15d0ULL,
+0xd3dd8bea350a8d40ULL,0x000000003b352d56ULL,
+0xd8189891b7656d9bULL,0x00000000303bbdecULL,
+0x9880446583799e5cULL,0x00000000c6a9ce22ULL,
+0xb400bdb5850cea6dULL,0x000000005b649112ULL,
+0x37e21302072365a4ULL,0x00000000e629a154ULL,
+0x79bd797c046544e6ULL,0x000000009134b4eeULL,
+0x5162e42dae313665ULL,0x00000000d0e57578ULL,
+0x5a8e41764ebaa1dbULL,0x00000000653c3834ULL,
+0x148bcb27a138e0d2ULL,0x0000000044e54a5eULL,
+0xeb0c3b678bc3bbdbULL,0x00000000c0865413ULL,
+0x069028b79a2b70b7ULL,0x00000000ab3e6797ULL,
+0x81ae1ad00d39cc29ULL,0x0000000068122a01ULL,
+0x1c764ae711b7bea9ULL,0x000000007c0d5e22ULL,
+0xaaac3a8e609e2bceULL,0x0000000076575652ULL,
+0x4020c8292c6b4466ULL,0x00000000e7e59a17ULL,
+0xb6a465b522a9d7ebULL,0x00000000b8062891ULL,
+0x61a4499ac6c59cd7ULL,0x000000001cb9d153ULL,
+0x5ea822e362eb7e0cULL,0x00000000c871c2a6ULL,
+0x3a15c054aa6bd730ULL,0x00000000e3ce5c01ULL,
+0x2e29171643514610ULL,0x00000000599b3185ULL,
+0x2c4d132d0ab23abdULL,0x000000009a170abcULL,
+0x0413771ee8e7eca7ULL,0x000000005a4e2378ULL,
+0xce52e9a1d12e5701ULL,0x0000000082b4ba15ULL,
+0x9c16676b505a7524ULL,0x0000000020777e95ULL,
+0x837ada7a551e9bd1ULL,0x000000002267a397ULL,
+0x11754dcca0331c01ULL,0x00000000c5078236ULL,
+0x0baada16a0e02dbcULL,0x0000000065e8d319ULL,
+0x055a195373ba985cULL,0x00000000457d4b1dULL,
+0xe8c6d1dc31025bb9ULL,0x00000000b80097cbULL,
+0x26ad4195c890cbe6ULL,0x000000003ae89e44ULL,
+0x813a81910ebc1209ULL,0x00000000ad2b370eULL,
+0x80e4e6be1937a4ddULL,0x000000004e202cb6ULL,
+0x8c9a450ad96424c7ULL,0x0000000067e374c4ULL,
+0x747807a3a2731a93ULL,0x00000000a5350380ULL,
+0x1ad8879dd872be44ULL,0x00000000c98ce810ULL,
+0x40485459e083a013ULL,0x0000000035695437ULL,
+0x145bbc374c9bac5eULL,0x000000000cc33281ULL,
+0x6c941c5cce921982ULL,0x00000000c58517e0ULL,
+0x0098961cee2ed2c2ULL,0x00000000c48ce0c7ULL,
+0x744dd7926252e427ULL,0x000000008855909cULL,
+0x2969b2b33adc9095ULL,0x00000000cd3aeee3ULL,
+0xd94dab13002ed270ULL,0x00000000a300ca61ULL,
+0x3d66760a0277a530ULL,0x00000000bcd2144eULL,
+0x37ae76aa7bca1b3aULL,0x00000000b900c770ULL,
+0x997d632377c3d645ULL,0x00000000927a6864ULL,
+0xe732a2e47110c94dULL,0x00000000b2628e32ULL,
+0x49a9da557e95e376ULL,0x0000000041e01dc7ULL,
+0xda98e95e954200b8ULL,0x00000000e4dcdd63ULL,
+0x9b82e01320d98d68ULL,0x000000009746c137ULL,
+0x084271933171b59bULL,0x000000004473109aULL,
+0xe78d2592b049da5dULL,0x000000007195d44cULL,
+0xab03370eccc3ac35ULL,0x00000000b743a74eULL,
+0x01295ea862eea64dULL,0x0000000094ec82a2ULL,
+0xbbd8696c57989187ULL,0x00000000677a4654ULL,
+0x2932429c49ac384cULL,0x00000000323788bcULL,
+0x10bceabe872825a9ULL,0x0000000093630528ULL,
+0x47a346ab34728866ULL,0x0000000057e12191ULL,
+0xc26e69da19a637ebULL,0x000000006e27cbc9ULL,
+0x74810a94380d3970ULL,0x00000000105814dcULL,
+0x16830a325cabcbc9ULL,0x000000006122a833ULL,
+0xce62e78a62d196c3ULL,0x000000009dbe6284ULL,
+0x6b88077c627c4214ULL,0x0000000022179763ULL,
+0xa0cbc7e27d3272a6ULL,0x0000000011a6a6b9ULL,
+0x51c383d2cc8131e7ULL,0x000000001112dc73ULL,
+0x46c7486469164020ULL,0x00000000ead37167ULL,
+0x245da028b8cd5169ULL,0x00000000dbd6e182ULL,
+0xb47e9ab5b5c735e4ULL,0x000000004dd5614aULL,
+0xd648c466bbdd356bULL,0x00000000aa9499aeULL,
+0xc024685bd5061e29ULL,0x00000000115a03ebULL,
+0x7a161cb62aa11d42ULL,0x000000005040084eULL,
+0x38380458baadb813ULL,0x0000000010c93da7ULL,
+0x9a0ed9b63eceab9bULL,0x00000000d8eb1316ULL,
+0x740dca1aa5dc9ed1ULL,0x0000000047893e3cULL,
+0xc3e5580613068306ULL,0x000000002675d32eULL,
+0xa85c370007851c09ULL,0x00000000d3c45eb1ULL,
+0xba15e34d41625c50ULL,0x0000000035219001ULL,
+0x8421e9514171d719ULL,0x00000000d4bd572aULL,
+0xd150033c2d9bbac5ULL,0x00000000e3a27ed3ULL,
+0x2e313249743c017dULL,0x000000005659c977ULL,
+0xacb8809c26bc5345ULL,0x00000000c4d5ec15ULL,
+0xc267996c1b454084ULL,0x000000006ba5866bULL,
+0x27e50d7d8e2e968bULL,0x00000000b5649406ULL,
+0x5c00963c77ae04a6ULL,0x00000000a1594956ULL,
+0xa2091232cb9c53d4ULL,0x0000000003cdc299ULL,
+0xb264054db50c3ccbULL,0x000000002b604cb3ULL,
+0xd89ed6cd6e52a405ULL,0x00000000154e18d3ULL,
+0x5e76992102168d8eULL,0x000000002ebc9db9ULL,
+0x99715ebddd791751ULL,0x0000000079723892ULL,
+0x529b2ba131a76106ULL,0x00000000043eaae4ULL,
+0xa61dea0de8e5a964ULL,0x0000000035b2d365ULL,
+0x537993c704dba753ULL,0x00000000ea7e14e9ULL,
+0x3c8eb2dad935838aULL,0x00000000eda7060eULL,
+0x15979190a56c9a58ULL,0x00000000cb83361bULL,
+0x6c50d60bd958a6d3ULL,0x00000000d921409aULL,
+0x511dd6d446494551ULL,0x00000000b0da24d0ULL,
+0xd4b7a18569e1338dULL,0x00000000acd81eb2ULL,
+0xacdd2a1e7de06117ULL,0x0000000008e9152dULL,
+0xae283b9a7b9486aaULL,0x000000008a19c8e9ULL,
+0xd084b43c786a2de6ULL,0x000000007c5d58e7ULL,
+0xe8cc65db3b39ee1bULL,0x000000009c99d60bULL,
+0x6010b8dd46a84d8cULL,0x00000000c13a2341ULL,
+0x1e77a4766080550aULL,0x00000000531bdc53ULL,
+0xd100a1e854d040bdULL,0x0000000099bd1eb3ULL,
+0xb1d255e6c828023dULL,0x00000000505a964aULL,
+0x6b1220b4e385a102ULL,0x0000000067764ba8ULL,
+0xed1842cc13bbbb42ULL,0x0000000026298398ULL,
+0x609d7952796ee690ULL,0x000000008c7de921ULL,
+0x3775b0b5a7916b8bULL,0x000000007157db8dULL,
+0x95cb7b84ce6a4baaULL,0x0000000033e3922cULL,
+0xb975b16bb5370a56ULL,0x0000000033c505c0ULL,
+0x75b42bd1844b0c84ULL,0x00000000dda18089ULL,
+0x737c8cd6beb153d8ULL,0x0000000091e4c731ULL,
+0xa05ce45d6081ab05ULL,0x000000003940dd48ULL,
+0x685a7ab650525c1eULL,0x00000000b1b0cb8eULL,
+0x2a9c27c6758743c4ULL,0x00000000c7480991ULL,
+0x3ed1c23cd78c0594ULL,0x000000004eae5554ULL,
+0x90cd7ab377241150ULL,0x00000000a1cd4acdULL,
+0xa7a449330300e89cULL,0x000000006b0cba70ULL,
+0xb116861c0454397bULL,0x000000002be9d9b7ULL,
+0x29258a85b64cd68eULL,0x00000000848d1b0eULL,
+0x19cd74d48c6ba3abULL,0x000000006b77a7e3ULL,
+0x1553edac613e0a21ULL,0x00000000d44987e5ULL,
+0x7ba52402813d2cd4ULL,0x00000000e35a4642ULL,
+0x033119d3a72088bdULL,0x00000000a5ce909eULL,
+0xb2d0b8aed3b89ab3ULL,0x00000000c671d020ULL,
+0x7c2936835c21acd8ULL,0x000000006c12ab79ULL,
+0x10a5c30425666c6eULL,0x000000002421ba07ULL,
+0x64a65ebc08d41abcULL,0x00000000a049b595ULL,
+0x4e44a115a934493bULL,0x0000000026bae082ULL,
+0x574932351ba1aecbULL,0x00000000137b21d5ULL,
+0x1b112ae812acdb59ULL,0x0000000062381341ULL,
+0xc2d3c9c74b47b701ULL,0x000000001a947b73ULL,
+0xa02bda06a576417eULL,0x000000001110b259ULL,
+0xe239e5648349576bULL,0x000000000bec722eULL,
+0xd9d84ed398b514c7ULL,0x00000000d89066bdULL,
+0x0c30745dc8ee0464ULL,0x00000000359cc725ULL,
+0x772b11088d5d20b9ULL,0x00000000eb839605ULL,
+0x0c7235c293377e29ULL,0x0000000031d0152aULL,
+0x6014a9e48039ba8cULL,0x000000001dedaddeULL,
+0xc25463e52c469295ULL,0x000000002960db14ULL,
+0x456277eb343b09acULL,0x00000000bb6ee594ULL,
+0xc5a51507846ea8b4ULL,0x00000000433e978eULL,
+0x4d991c58364abc86ULL,0x00000000c90e0bd6ULL,
+0xad48ae4e7bb83b3bULL,0x0000000026d317bcULL,
+0x80c8357d61c1abdbULL,0x000000007c455542ULL,
+0x58c866e3029936a0ULL,0x00000000dd998c48ULL,
+0xdcdd0785553d4386ULL,0x0000000026b6bc62ULL,
+0x27c155b5d0ec0e17ULL,0x00000000ec034816ULL,
+0x78c01a19c039b374ULL,0x000000009d0ca29cULL,
+0x85420013ce55a382ULL,0x00000000d5e8b274ULL,
+0xb04db901c54d4acdULL,0x00000000deaeaa81ULL,
+0x2a58e9784433c034ULL,0x000000005a78082aULL,
+0x03ed0c911c03ea7eULL,0x000000002b72d145ULL,
+0xc76ce046a5369341ULL,0x0000000092b9879bULL,
+0x25c5019bcb0e6766ULL,0x00000000b6636346ULL,
+0xd65a02498e544baeULL,0x000000001029a8a5ULL,
+0x998de5b1192c1aa3ULL,0x00000000ad664da1ULL,
+0x56eadb95b0468840ULL,0x00000000b9d45757ULL,
+0x121ddd693741935cULL,0x000000008e0119c2ULL,
+0x6b193174241373aaULL,0x000000008db3b4caULL,
+0x22932ea985b3249dULL,0x000000000498917aULL,
+0x07753c608e575e1aULL,0x00000000d856ae60ULL,
+0xbbe0ed222e16731eULL,0x000000009db0904eULL,
+0xea17eca88bec7481ULL,0x00000000358db65bULL,
+0x68b372d180b97971ULL,0x000000004a9e05eaULL,
+0x017ac65e6dde163cULL,0x0000000044ec186cULL,
+0x34060074d70678daULL,0x00000000a161b275ULL,
+0x795578272963915dULL,0x00000000914d3ed5ULL,
+0xba708b7eb1924092ULL,0x00000000ebb3cb79ULL,
+0xea72c339a619db78ULL,0x000000009d4e3b12ULL,
+0xc561697e06b095a0ULL,0x00000000bae59ce4ULL,
+0x5ea09c8352271ea8ULL,0x00000000950ce94bULL,
+0x7eeebbdb7e747ab5ULL,0x00000000d16ec2dcULL,
+0x18e26a8b153ec107ULL,0x00000000b03d7360ULL,
+0xb49650be8b4e96ebULL,0x0000000058d62c42ULL,
+0xd71007c8c98d5b71ULL,0x000000009020a4c6ULL,
+0xd2c8c5ac3ee52e85ULL,0x000000001735b976ULL,
+0xde3e8de73994cba3ULL,0x000000002e0a9e21ULL,
+0xa3cc231aedab10adULL,0x00000000abe35902ULL,
+0xa3142be816465920ULL,0x000000009b1b0ba2ULL,
+0x23490992b178b7a1ULL,0x00000000522b9172ULL,
+0xeabb7137e7d5a15aULL,0x000000008111dcdaULL,
+0x50294623da97810eULL,0x0000000075327934ULL,
+0x1db2290274371c3eULL,0x00000000e83c1a14ULL,
+0x0b68d6a3a3107eeeULL,0x0000000034b5a3a9ULL,
+0x1b57797102c25758ULL,0x0000000066b36221ULL,
+0x00d429c908ba2760ULL,0x000000009b8a5850ULL,
+0x3764b2a10061de34ULL,0x00000000b8649d82ULL,
+0xb5c9b88ee442aaa0ULL,0x000000001a70399bULL,
+0x7755cb70124c283dULL,0x0000000028723d5dULL,
+0x6943902c89bd2784ULL,0x000000000559d7aeULL,
+0x074b0e4a7670a64dULL,0x0000000043925e45ULL,
+0x2746101b5770a9ecULL,0x000000009e9c9b94ULL,
+0xe78043508bd568e6ULL,0x000000007871b296ULL,
+0x5a1715579b4444a1ULL,0x00000000ac79ac30ULL,
+0xd2eb12c60acac3a5ULL,0x000000000007c4e8ULL,
+0x1554e908a52d4d84ULL,0x000000003e49b70bULL,
+0x83a506636ad7ea16ULL,0x0000000041e38de0ULL,
+0xc82dcccc298c14e9ULL,0x0000000045e96e0aULL,
+0x89c8db081696c3abULL,0x00000000846aad72ULL,
+0x694e0848765e0843ULL,0x000000000b18b4ebULL,
+0xa53ecaa484b7d9c4ULL,0x0000000088c9076cULL,
+0x85adcc22ce3edc5cULL,0x000000001c421b7aULL,
+0xa0e8a0c5d7326cc3ULL,0x0000000050a77b06ULL,
+0x1a16300b985d74acULL,0x00000000294b057bULL,
+0xa37c18aa7a5aab64ULL,0x00000000744dde4bULL,
+0xbbcb82175a797548ULL,0x000000003d214054ULL,
+0x881eb13ba5a9d7a9ULL,0x00000000737120b9ULL,
+0x878cdb7e3335ca05ULL,0x0000000094de1093ULL,
+0x4807c755242907e6ULL,0x0000000007a6e3d2ULL,
+0x8c87261ca526d614ULL,0x0000000039b2c161ULL,
+0x2a2c2eed3c701b8cULL,0x000000007dc428eaULL,
+0x7726525e506c56bbULL,0x00000000d476e719ULL,
+0x576d45cb0d918919ULL,0x000000008ab643ceULL,
+0xb06b778b4b93d542ULL,0x00000000a7ea393cULL,
+0xe5418de4cd4536a1ULL,0x000000001819656eULL,
+0x64c0a12e2d62ed2aULL,0x00000000a08e4dabULL,
+0x7eeb4319390795a3ULL,0x000000007a042062ULL,
+0x051337b949ed4627ULL,0x00000000b1806ce6ULL,
+0x12e645450c4897eaULL,0x00000000c0c2edc2ULL,
+0xee8189dd07173de2ULL,0x000000005d0d8d6cULL,
+0xdbb2d10c33d967e0ULL,0x000000008a528be4ULL,
+0xa81b3c428a93d84bULL,0x00000000259bac53ULL,
+0xc5b05d7240379547ULL,0x0000000088d906e7ULL,
+0x80bd93037b28ec2aULL,0x000000000d3e1242ULL,
+0x784ae2760b189b85ULL,0x00000000e43871c5ULL,
+0xa24497342b1587edULL,0x00000000706e59ebULL,
+0x2259a1cc665417ddULL,0x00000000e64ac0a1ULL,
+0xca9353043c0c20a4ULL,0x00000000de18e090ULL,
+0xe6e19092e7325dc9ULL,0x0000000091ba3822ULL,
+0x6a340660648373d0ULL,0x000000003999c493ULL,
+0x80938c008399aa8aULL,0x000000009a1b7531ULL,
+0x2de23c34e3e1e235ULL,0x0000000059ad7eecULL,
+0x2d2d4edb89ae0e1bULL,0x0000000062c0750dULL,
+0x4d040090314de18cULL,0x00000000bd869581ULL,
+0x1435369ec4273e69ULL,0x000000001b82a425ULL,
+0xb00c813d8c6b019dULL,0x0000000071595ee3ULL,
+0x5e428a8a43b2e1b8ULL,0x00000000485d7c25ULL,
+0xc5d340367066dde3ULL,0x00000000b3613d53ULL,
+0x86c99a82631203a2ULL,0x00000000949296abULL,
+0xa20262587b1732a3ULL,0x000000002983b07eULL,
+0x29e3be2a4aa56b5eULL,0x0000000066354340ULL,
+0x170bab8a19d2e7ddULL,0x00000000553ae4e2ULL,
+0x85b043b5d3277527ULL,0x0000000098432161ULL,
+0x617eee2268279c56ULL,0x000000004a395587ULL,
+0x01dddca00cd78294ULL,0x00000000925e8ad9ULL,
+0xc62796c44a255b90ULL,0x000000002aebb790ULL,
+0x985ba8809b581b8dULL,0x0000000062413200ULL,
+0x69355c98a4458474ULL,0x000000009a551b02ULL,
+0x6dca6c0c86a331e6ULL,0x0000000072de9ed9ULL,
+0x15c2175c50689aa6ULL,0x00000000dc1c3d03ULL,
+0x76ec6d029a133d1cULL,0x00000000db90d3d6ULL,
+0x8c81ec8cd2dc24baULL,0x00000000b753bbdaULL,
+0x1bda5e2ae62649a6ULL,0x000000009a03e424ULL,
+0x21d0a87e65507cb0ULL,0x00000000365182a1ULL,
+0x4ea2edce008ccb7aULL,0x00000000269addc3ULL,
+0x697a7953255c2513ULL,0x00000000324bb176ULL,
+0x075e6e11b9b91054ULL,0x00000000e4eddd53ULL,
+0x3a4570282e175423ULL,0x00000000b3717c51ULL,
+0x33a96d6410ee82d3ULL,0x0000000026eb2e09ULL,
+0x039ec11463a57accULL,0x00000000a43c78daULL,
+0xbc65a6a281807a91ULL,0x00000000b035b8e0ULL,
+0x54c772081db42038ULL,0x00000000ee8164eeULL,
+0x3e3c8d7ed0e4774bULL,0x000000000147c3e7ULL,
+0x659ed37ed316a93cULL,0x0000000053856540ULL,
+0x1608a941662b3a9aULL,0x00000000ad0c9db7ULL,
+0x6882345c5869969cULL,0x0000000033b7a01cULL,
+0xc67ee0d3a62eb867ULL,0x000000005cee43a0ULL,
+0x9dac4283517cc1e6ULL,0x000000002ea49eb3ULL,
+0xc259d2d1e304abd4ULL,0x0000000031624601ULL,
+0x50a468d91177add6ULL,0x0000000099532beaULL,
+0x25461c58631c8a52ULL,0x00000000e3bbddb4ULL,
+0x6deeca1ac23e8675ULL,0x000000000cdca5a0ULL,
+0x4945d478d1294781ULL,0x000000005512e0b8ULL,
+0x90c5e52240ddc4aeULL,0x000000006d0e0d22ULL,
+0x96ea488c36628de1ULL,0x00000000867c1e19ULL,
+0x7e48683e5eae45b3ULL,0x00000000009db56aULL,
+0x08a3c50d10028647ULL,0x00000000d2b5568cULL,
+0x60d53e0ea6b3a202ULL,0x00000000ba5cb8e1ULL,
+0xeabda204dc210530ULL,0x00000000b11ca040ULL,
+0x0865a75721970a70ULL,0x000000008409a033ULL,
+0x531baae3d106d460ULL,0x00000000bc1d59eaULL,
+0xc3ee68cdd280314dULL,0x00000000d917294cULL,
+0x362a8442b9a90c9bULL,0x0000000094e9c23eULL,
+0xbdeb9531501db7bdULL,0x00000000401ee91dULL,
+0x190dd3a97ed08490ULL,0x0000000081333146ULL,
+0x94dd787b980d2624ULL,0x0000000045e3d531ULL,
+0xea95c1b75115977eULL,0x000000004b7ee76cULL,
+0x13dc1d47ccba1e0aULL,0x00000000ad1bb0d0ULL,
+0x8322bb3c91a7789aULL,0x000000003e392c7dULL,
+0x34d0a624dbe2973eULL,0x00000000c3743a9dULL,
+0x3301c15d280cace6ULL,0x00000000122278b3ULL,
+0xb3d26029d5d1399bULL,0x00000000e02a38eeULL,
+0xea3bc9b45767924cULL,0x000000008d23c5ecULL,
+0x3a1873c2e9cd6b22ULL,0x00000000a0e43471ULL,
+0xb73a546a39cdc3c3ULL,0x0000000026107962ULL,
+0xba18453d2a269707ULL,0x000000003010978aULL,
+0x4ca03849080a6c7bULL,0x00000000d644583aULL,
+0x1a14785ca728ed10ULL,0x000000004a8ed835ULL,
+0x0d598c96a11259d4ULL,0x000000008e52a85eULL,
+0xadaa7e517548d2aeULL,0x000000002a2a859eULL,
+0x86e298cbb538395eULL,0x0000000030710460ULL,
+0xbb2c55c9683a5c59ULL,0x00000000a6505d64ULL,
+0xddad1dd0012909e7ULL,0x000000003a665d4eULL,
+0xcc9d690481de2a5eULL,0x000000007867794eULL,
+0x10de44be37302de8ULL,0x00000000ec67e023ULL,
+0x715e2098a4aeb9b8ULL,0x0000000070c88c44ULL,
+0x78d4c078e15d0008ULL,0x000000005b567a8cULL,
+0xdee94d50589179d9ULL,0x000000003d4309a3ULL,
+0x92081db004cae6e4ULL,0x000000007ea8cd16ULL,
+0x84c113395117a256ULL,0x000000007cc3216aULL,
+0xc2e840db94c61672ULL,0x00000000d37c9e46ULL,
+0x2070921e16cb2a52ULL,0x00000000439c0a22ULL,
+0xec24ea4d46e03017ULL,0x000000003d3390dcULL,
+0x1ed890a4b33812b3ULL,0x00000000c0bcdc53ULL,
+0x555474eb165d0c0eULL,0x0000000085636342ULL,
+0x3e764c5300711e4eULL,0x0000000085b1dbc3ULL,
+0xe220c2a7aada3520ULL,0x00000000ce338c01ULL,
+0xc659d308a9884124ULL,0x000000005bc902bdULL,
+0x02babc61687b9370ULL,0x00000000cb3982e5ULL,
+0xd2ed70968aa1bdc7ULL,0x00000000c26d3d44ULL,
+0x66694dc8daed5c7eULL,0x000000003cd31292ULL,
+0xe159c3815d535314ULL,0x00000000c09a5a49ULL,
+0xaeed7560ee32c019ULL,0x0000000069dd1e93ULL,
+0xec1b9be556ece858ULL,0x00000000c256329dULL,
+0xa152b2ea3e540c2bULL,0x000000003244c707ULL,
+0x0ea962878ac8c2e7ULL,0x000000005cb7034aULL,
+0xa55cdd212ae7cde0ULL,0x0000000076cb75a1ULL,
+0xb7b4bcc846c2d5d0ULL,0x0000000001eb46a6ULL,
+0x4d9e0e594993762eULL,0x000000009b2a0831ULL,
+0x0a38b3e657e892d5ULL,0x0000000008386638ULL,
+0xec977e5c8748ca50ULL,0x0000000051bc1775ULL,
+0x3c90978d63024877ULL,0x000000003665ad5bULL,
+0xd030cbc0ac467a91ULL,0x000000001606dabaULL,
+0xdd2ab6e845e832d6ULL,0x00000000a1a3d7d5ULL,
+0x5008b2bab60b66ceULL,0x00000000b05e109dULL,
+0x5a0bc8073ad561a0ULL,0x00000000b7386e5bULL,
+0xd6270aeb383cb658ULL,0x00000000877e6572ULL,
+0xd1b8b472622e7b63ULL,0x00000000ba0879a0ULL,
+0x239509ba57e076c7ULL,0x00000000dcb41897ULL,
+0x9806b20cc7ac1183ULL,0x0000000084c62060ULL,
+0x3e886ba11b853c12ULL,0x00000000c5e6bd59ULL,
+0x2b88bbca22219862ULL,0x000000007c262286ULL,
+0xdeda7d23049968c8ULL,0x000000005b8cba3eULL,
+0x5117dc5bc25c43e8ULL,0x00000000ab5085d7ULL,
+0xd562b2631340e1ceULL,0x0000000068909158ULL,
+0x3d0eca90cb17ae7cULL,0x00000000a1a69565ULL,
+0x505c5e9418056029ULL,0x00000000c99b31e9ULL,
+0x6bce7848ed2909a4ULL,0x0000000052c683c6ULL,
+0x6212805451903097ULL,0x00000000de2d98d2ULL,
+0x588ea94ab19ec2ceULL,0x00000000be3dd378ULL,
+0x1ebbe7c0e6710bc8ULL,0x000000001679a94aULL,
+0x25068c22ec6b8739ULL,0x000000007367275eULL,
+0x25ed4d7346601784ULL,0x00000000a748d1ddULL,
+0xce1294dd66932110ULL,0x0000000012cb6600ULL,
+0x74b56db3dae36266ULL,0x00000000362bb1a7ULL,
+0x2372bd32c0085b11ULL,0x00000000e5725a2aULL,
+0xca911d431eb6eb45ULL,0x00000000a9a830eeULL,
+0x51a07be21841e48bULL,0x0000000068965624ULL,
+0xb9333839cd53bb80ULL,0x0000000006e97d68ULL,
+0xc923a067d93d1618ULL,0x00000000bed80bacULL,
+0x98b7615c9c301687ULL,0x000000004ae3e72cULL,
+0x560944495a973e18ULL,0x000000009ea2e722ULL,
+0x259bea7bdca590b5ULL,0x00000000a8d4e4a5ULL,
+0x4087d1cc5e27e36cULL,0x000000006656d874ULL,
+0x9edd529e4476cb8dULL,0x000000004db6270dULL,
+0x255433e4d15298c8ULL,0x0000000071d4a05aULL,
+0xb5ba5d96cedd7490ULL,0x000000002a88873cULL,
+0xe99568c8d9abb2eeULL,0x000000001b3d3139ULL,
+0xdada403c31ba5140ULL,0x00000000ce392ccdULL,
+0xd7ac01c5a0deedd4ULL,0x000000000913a4bbULL,
+0xe13014c5d290e6c8ULL,0x000000006a68a8cdULL,
+0x718e5d6720e0920aULL,0x00000000e4e2e746ULL,
+0xebd2d2eb621a3aa0ULL,0x00000000ca59b6c1ULL,
+0x5e61c384cb10e262ULL,0x00000000260bea38ULL,
+0xc18c2c3b2e64b9daULL,0x00000000ddd10528ULL,
+0x5ecc730093430432ULL,0x00000000438ed560ULL,
+0xb92468de347abc59ULL,0x000000007cec724bULL,
+0x356769276964a698ULL,0x000000005a535184ULL,
+0x09406c3d030d61c0ULL,0x0000000003111a0eULL,
+0x329e4c50ae1c68baULL,0x00000000135c3258ULL,
+0xaca77dd31018c72dULL,0x00000000a354ad20ULL,
+0x84c118e9348825a7ULL,0x00000000003c7a53ULL,
+0xcad1ac8e7c3e414eULL,0x00000000b00966eeULL,
+0x7b5b500e87b5283cULL,0x0000000087735d4eULL,
+0x86b819977b85a053ULL,0x00000000a4aa6d88ULL,
+0x5ec88d0bba22344aULL,0x00000000aeae3e68ULL,
+0x9e7953eca3dc8ee0ULL,0x00000000a5ac40d3ULL,
+0xe675d3bb71debdbeULL,0x0000000079bdeee9ULL,
+0x6b529513b64cd419ULL,0x0000000000a179e3ULL,
+0xae4cccc44c17b1d9ULL,0x0000000010a83a25ULL,
+0x2343d1846b02e4d0ULL,0x000000007e28e09dULL,
+0xa74c173b3267404dULL,0x00000000bda84ae2ULL,
+0xa33a587196b16d8dULL,0x0000000058bc9a1eULL,
+0x1eca17c53c78e384ULL,0x00000000d4d03625ULL,
+0x07e05de2e3c7d9b3ULL,0x000000004c9b0ab7ULL,
+0x9dd117a95c4a99d0ULL,0x000000005409d67cULL,
+0xeb39c850667e99b5ULL,0x000000007bcd1dc5ULL,
+0xd3ee22ace1b1abc7ULL,0x00000000c8a44ee8ULL,
+0x37d2b6149300e367ULL,0x0000000088060191ULL,
+0x47006e1d2931238dULL,0x000000007c31a4e6ULL,
+0xabea6a0697e04267ULL,0x0000000049c02910ULL,
+0x71cacd70b680701aULL,0x0000000080a48951ULL,
+0x64b7e425e0a14be5ULL,0x00000000ea4eace3ULL,
+0x315e8a00a32d8941ULL,0x00000000d0c4b4cdULL,
+0x1546862d8835024cULL,0x0000000086d43a04ULL,
+0xab170925e49a3a70ULL,0x000000005b794eeaULL,
+0x9398a240c968c974ULL,0x000000009eaa12eaULL,
+0x3dcd69c141a889d1ULL,0x0000000082bed90eULL,
+0xa33549b57c967071ULL,0x00000000ab1cde38ULL,
+0xda72aa54cbdd0474ULL,0x00000000ea242aebULL,
+0x7bbceeb5d8e94209ULL,0x00000000230cb0d1ULL,
+0xbdb0e5076e40eb68ULL,0x000000004ab4008cULL,
+0x23a677124cedd9c0ULL,0x00000000209122daULL,
+0xa63e6398c8609225ULL,0x000000007d271ad0ULL,
+0x147702c2a7c02491ULL,0x000000001a0539beULL,
+0x87ee5b899903a716ULL,0x000000009bc93552ULL,
+0xa5d8b5b1a539dd0bULL,0x000000008d49387cULL,
+0x01778bc71341b154ULL,0x00000000661e1ea3ULL,
+0x13745b72c8a35baaULL,0x00000000d7d86adcULL,
+0x41a6773a074e296aULL,0x00000000d547330eULL,
+0x6c1986d2dc1d4969ULL,0x0000000044735518ULL,
+0x086824020e90389dULL,0x00000000c29594e9ULL,
+0xb2d75d68843b29b5ULL,0x00000000bc387416ULL,
+0x70cba1127575e152ULL,0x000000002d4b3048ULL,
+0xe746051d148cc614ULL,0x00000000a292d314ULL,
+0x5b2744325887097dULL,0x00000000dd76bac7ULL,
+0xe033a35bbc1674e4ULL,0x0000000090400d7aULL,
+0xd4a56e4d66b30650ULL,0x00000000306c7dd2ULL,
+0xb8d62cdb9c904a37ULL,0x0000000016751632ULL,
+0x11a5b2a5b8740708ULL,0x000000007ab2d053ULL,
+0xc14275b44a1079baULL,0x0000000029200e8cULL,
+0x71471426ea0d616aULL,0x00000000b69a4143ULL,
+0xeeab20a409bb2838ULL,0x00000000b2c9194bULL,
+0xb11c43c49d23465aULL,0x00000000c019be42ULL,
+0x5ab96a9770dc3611ULL,0x000000000767062bULL,
+0x4d3b6664e636374eULL,0x00000000210049d8ULL,
+0xa1431c4a25c7c667ULL,0x000000003a1ad610ULL,
+0x8e49803bde26523bULL,0x000000006466b7b2ULL,
+0x3d4a755dc3de8d8bULL,0x000000000ca498c6ULL,
+0xa02b392c2eb0789cULL,0x0000000008826339ULL,
+0xde8b9b977b4e48e5ULL,0x00000000da800c11ULL,
+0x04eaa1b74e3d6eb5ULL,0x00000000c256a368ULL,
+0xce70c643d130be1bULL,0x000000000693920aULL,
+0x9cd2d6515a58e3dbULL,0x000000008990dd0dULL,
+0xee66b9de195237c1ULL,0x000000006314041cULL,
+0xce1827997ee81490ULL,0x000000008a4eae0dULL,
+0x8d768b8b608c8cceULL,0x00000000a364dda4ULL,
+0xe7508ebdd187e102ULL,0x000000000aad7505ULL,
+0x4441dd946ca5c2cdULL,0x000000009238a97cULL,
+0x361d7d183c99c1a3ULL,0x000000000eec1cb0ULL,
+0x8cda555376060276ULL,0x000000006988e39eULL,
+0xe53d4132cd47babeULL,0x000000006a48b15bULL,
+0x7b61b4c239a1a05eULL,0x00000000011528bbULL,
+0x9171655a8bed439cULL,0x00000000bdc8a063ULL,
+0xb0caa7033d83e973ULL,0x000000001d42a92cULL,
+0x3db6ab3297960d97ULL,0x000000009dd4a4baULL,
+0xa3dc3bb31514db35ULL,0x000000009a77888aULL,
+0xd3b88d00da9557dcULL,0x000000007aa4bdb9ULL,
+0x84bb5db31a70a444ULL,0x000000001753e6b3ULL,
+0x35c08ec73e0d4273ULL,0x00000000c16c0d99ULL,
+0x0b79d4ab965acb50ULL,0x000000006c5892b0ULL,
+0x566b337ea819cac3ULL,0x00000000b61ad6ebULL,
+0x0be5742c2de66ac8ULL,0x00000000d386b25cULL,
+0x58364403aa298c58ULL,0x00000000a23bc68bULL,
+0xd808ba555409e293ULL,0x0000000033080234ULL,
+0x9a9dc5088ed43123ULL,0x00000000a33a91a4ULL,
+0x61eee3b5ad22b481ULL,0x00000000e3d80db6ULL,
+0x692aeb551255432eULL,0x00000000da1c63d5ULL,
+0x83eaeb4a6c08a709ULL,0x0000000097e908b8ULL,
+0x810ce7dd0d5bde25ULL,0x0000000029ea74bcULL,
+0x3bb5a521278c7899ULL,0x000000009ad0e5b7ULL,
+0xa1476c53b29e14ceULL,0x000000004a068896ULL,
+0x22553e34c06d7821ULL,0x00000000ea77688eULL,
+0xa5a36dc738d15ab2ULL,0x000000009eba368aULL,
+0x18e0a8c3b372d888ULL,0x0000000001bda9aaULL,
+0xda71a282b576864dULL,0x0000000024292897ULL,
+0x07325e0ee6aae065ULL,0x000000006033c923ULL,
+0x4d940aed6099a343ULL,0x0000000028e96499ULL,
+0x5c3853230d5c191bULL,0x00000000c76ed380ULL,
+0xc5367cea1c574955ULL,0x00000000d5a216d4ULL,
+0x9c60970ac447ce45ULL,0x0000000057892c80ULL,
+0xab5da3d9cd3242c5ULL,0x000000001d7eba22ULL,
+0xb37842b7c4e72446ULL,0x000000003b31e0d7ULL,
+0x4bbc4267370c666bULL,0x00000000d2bd7ce9ULL,
+0x68dcc25499e218cdULL,0x00000000b6ae6995ULL,
+0x73b92e4b722c19ceULL,0x000000006aa89673ULL,
+0x3a043015a0b6b0c9ULL,0x00000000387b1482ULL,
+0x7430605745ce8abbULL,0x0000000080b34376ULL,
+0x67e7095d9e889a4eULL,0x00000000386bc665ULL,
+0xcedb9ddb75719a96ULL,0x00000000571c700bULL,
+0xcebb9881e054003bULL,0x0000000028544024ULL,
+0x9add05d2c3427e8cULL,0x00000000a7e8b3c5ULL,
+0xb3ee9d71a59c3d44ULL,0x000000000917cc08ULL,
+0xa725a7e54ab513dcULL,0x0000000017e4d0cbULL,
+0xa2c022d2eb46d9ecULL,0x00000000c611c2a1ULL,
+0xa70b374655651419ULL,0x000000000c6292b1ULL,
+0x9ae9c6a429085eaaULL,0x00000000d440d105ULL,
+0x974a9e5445e8c1dbULL,0x00000000022ddbaaULL,
+0x8a22208b65763d33ULL,0x00000000a7052618ULL,
+0x831b8c97c48a8d19ULL,0x00000000187da363ULL,
+0x3d1ac90d2d5013d7ULL,0x00000000c9390a6bULL,
+0x55006d60aa9dd88bULL,0x00000000deaced28ULL,
+0x893b05978083a9cbULL,0x0000000003568807ULL,
+0x5eeb5c3bb5811a3aULL,0x000000006bcba4c1ULL,
+0xa90744b9705d6b2aULL,0x000000006e6884b9ULL,
+0xda185728bc945963ULL,0x00000000886c7e38ULL,
+0xee4ac31bd97a9a5aULL,0x000000009708d199ULL,
+0xe7ce66506c6a2955ULL,0x0000000056689312ULL,
+0x4ea1147949c927c6ULL,0x000000003ecb4a47ULL,
+0x503b78a73500723bULL,0x0000000037356800ULL,
+0x95d7142ce8074c19ULL,0x0000000072baa2daULL,
+0x89641e250453bab7ULL,0x00000000415e7bd2ULL,
+0x7c30a9dceaa8ee81ULL,0x000000008d057983ULL,
+0x1be8aa1c81a38a41ULL,0x00000000be483b3dULL,
+0xa462ca6cd6d4bb12ULL,0x0000000012b22eb2ULL,
+0x480343ba61b9ab21ULL,0x00000000014c656bULL,
+0x921e195b0131609aULL,0x0000000084cd6c4aULL,
+0x22e490585a00db9aULL,0x00000000e8ba241dULL,
+0x6b8a03412c709907ULL,0x00000000c0804099ULL,
+0x21c12980917e465bULL,0x00000000aa08330bULL,
+0x45c6885da2a96577ULL,0x00000000932bb384ULL,
+0xbba9c6701a444709ULL,0x000000005857e19bULL,
+0x08d2b70e91045ea7ULL,0x0000000036c6ea6dULL,
+0xeb8c0603736d984aULL,0x000000004958c11bULL,
+0x28bd5c4342a4062cULL,0x0000000010a012edULL,
+0xd449778e3a63beb2ULL,0x00000000d57be868ULL,
+0x688577b1424a5750ULL,0x000000000a161e52ULL,
+0xc497bac87a7d0b09ULL,0x000000009dd9a0aaULL,
+0xa0909c499e85680dULL,0x000000000c0dd308ULL,
+0x666e5ae615220502ULL,0x00000000042a4884ULL,
+0x5a32cab4319d56e5ULL,0x00000000e47e4373ULL,
+0xdec88191ed7eb1c5ULL,0x000000007ee29304ULL,
+0x605be37cc0078012ULL,0x0000000025ea5a7cULL,
+0x315a7b845488a3edULL,0x000000005713eee4ULL,
+0xcd8871e7ddacc39dULL,0x00000000b0bab995ULL,
+0xe7be681d5696716aULL,0x0000000047890a36ULL,
+0x30dc7bb7dbd00d31ULL,0x0000000014a7549bULL,
+0x13131b139e1b34b9ULL,0x00000000a06c6302ULL,
+0xd19ae40d643aa428ULL,0x000000002d516424ULL,
+0xc64d9b2e1a71d77eULL,0x00000000992509ceULL,
+0x7500cd2cba706bc5ULL,0x00000000a6e961d0ULL,
+0x3494bad3898b56b6ULL,0x0000000015a4d485ULL,
+0x7934479b0ea83268ULL,0x000000008a22e5b0ULL,
+0x7aa952e2ca9019e6ULL,0x000000005db23e69ULL,
+0xa3769eab62949758ULL,0x0000000034a46a16ULL,
+0x71c1871dace576a3ULL,0x00000000816cd2baULL,
+0x61bdecd6c390cc1bULL,0x000000003b846dd9ULL,
+0x774d52e94cd2e68aULL,0x000000000ecdaa8cULL,
+0x93241db5deb7a088ULL,0x00000000d3b7de9dULL,
+0x0b1928bd29b6748eULL,0x0000000030823765ULL,
+0x5c6460bd8b951104ULL,0x000000005e601439ULL,
+0x4caae643246aec63ULL,0x000000004a6ae68eULL,
+0x82048ae52d4271edULL,0x00000000ad9ad1c2ULL,
+0x899ad42625974619ULL,0x00000000743b317dULL,
+0x263e57909736221dULL,0x0000000003627ce7ULL,
+0xd024ad4a045a3aceULL,0x00000000be300158ULL,
+0xe94decd0aca82618ULL,0x000000009419a2d0ULL,
+0xec336b1ea22ecd2aULL,0x0000000032c6345eULL,
+0xcee420c228343a11ULL,0x000000005eb19514ULL,
+0x8c439266ce500c05ULL,0x00000000e40ee331ULL,
+0x584442e55e977810ULL,0x00000000e5eaceebULL,
+0xec02896ba18baec8ULL,0x00000000d49d172eULL,
+0xa1ca0b81d4ddc9c2ULL,0x000000008b8846deULL,
+0xb589dd67ea1bbe12ULL,0x000000000622e707ULL,
+0x3658b2b1269500d2ULL,0x00000000db93abecULL,
+0x35ad790b84338390ULL,0x00000000a11ec0c4ULL,
+0xa678c14e7629ead0ULL,0x0000000033c0b667ULL,
+0x12492ac6dccae9c2ULL,0x00000000e987e015ULL,
+0x5575e6b07209c173ULL,0x00000000b61942bbULL,
+0xdc1804e345a97642ULL,0x00000000c4876163ULL,
+0xb96474ea5bd466e5ULL,0x00000000942591dcULL,
+0x0cb44ea2a5e17ad6ULL,0x000000003915054cULL,
+0x8b671e75eb7e8e7dULL,0x00000000a7ce0181ULL,
+0x326dc5c675ea6bc6ULL,0x000000001e4b1b4dULL,
+0x569291b840302765ULL,0x00000000a2a1935bULL,
+0x6405354d19a083b2ULL,0x00000000e341799eULL,
+0xd52e8235ebd47303ULL,0x00000000a38e56a7ULL,
+0x505db9d3d147c165ULL,0x000000001246d7d2ULL,
+0x95dbda263b07c39dULL,0x000000004208c133ULL,
+0x70cc26ce8ed0a7b3ULL,0x00000000e9ed1295ULL,
+0x52496b3b8ccea293ULL,0x00000000e4485dd4ULL,
+0x290256e557534965ULL,0x00000000e7544701ULL,
+0x1539467dc5d63bd3ULL,0x00000000be5763e2ULL,
+0x30960a17510c13e6ULL,0x00000000ba8256a0ULL,
+0x232591b6b94289e4ULL,0x00000000166dc7d8ULL,
+0xd68d2e1b64bbb81cULL,0x00000000d73b4d73ULL,
+0x59786c2a375e0a4aULL,0x000000009c0b055cULL,
+0x69d11ec51e3222e0ULL,0x0000000054588888ULL,
+0x581e8ec3ece89da7ULL,0x00000000d75a8d1dULL,
+0xd3b1c020c06b827cULL,0x00000000ae91dae4ULL,
+0x4edd04c75a852616ULL,0x0000000031d5673cULL,
+0xcc106a03d3b3ab2aULL,0x00000000c4ed5204ULL,
+0x9ab3c6eb377bc2cdULL,0x000000004d0b3426ULL,
+0xd774aaa6c788eac4ULL,0x0000000038e9c7daULL,
+0x428894286619d88aULL,0x00000000a85e3d1aULL,
+0x3ece90c339b21080ULL,0x00000000c2488d64ULL,
+0x12cd099a4e57d1ccULL,0x00000000d8ae0e14ULL,
+0xb057e9134e8d9cbcULL,0x00000000b18cc592ULL,
+0x49c7529cbacdb13eULL,0x00000000d508bcc1ULL,
+0xcca34c32089bb37cULL,0x00000000d986d295ULL,
+0x110c14728891c71dULL,0x000000008dae9a0cULL,
+0x6e3646eb5533846bULL,0x0000000045a08500ULL,
+0xbc76cb5857a46c40ULL,0x00000000971c4e63ULL,
+0x154cb44083052be5ULL,0x000000000bea3d66ULL,
+0x8c14c5d0d4cd387eULL,0x00000000dbb0856dULL,
+0x29b66cb664c4502cULL,0x00000000357c8523ULL,
+0x518bd7c08b51e657ULL,0x000000007438c539ULL,
+0x0ddd61441940d3d9ULL,0x000000000c89e584ULL,
+0xe1103a19d74cc70bULL,0x00000000dc785a41ULL,
+0xe5c850d4b0c2dd93ULL,0x0000000006ad6220ULL,
+0x4766426d3b475c0aULL,0x0000000007444a88ULL,
+0x4bd3ede59b7564a4ULL,0x0000000092388c63ULL,
+0xc2cc647a1b3507a1ULL,0x00000000e1939392ULL,
+0x6dd32c3d075e1da5ULL,0x0000000040b28718ULL,
+0x8a6031a86b5c5455ULL,0x00000000bacd1ebbULL,
+0x0cd9ee422a08d110ULL,0x000000007588d0d4ULL,
+0xea0816dda504e2ecULL,0x000000006a19d73aULL,
+0x5b30d6e14e08ebc9ULL,0x0000000069903535ULL,
+0x4c76b068d55a65bbULL,0x000000007685b35dULL,
+0x86c3daaa719d61aaULL,0x000000008ece1287ULL,
+0xce1e811561055e25ULL,0x000000003c2de2c6ULL,
+0xc42ad0369351d35bULL,0x000000006cbd7064ULL,
+0x0d5a21cd2e042038ULL,0x00000000954cd4d1ULL,
+0x7097bc9ec718d570ULL,0x0000000097d473a4ULL,
+0x2373daa26d0b293aULL,0x00000000945917edULL,
+0xc252bdbe53e99beeULL,0x00000000cba59a18ULL,
+0x4d8c1de54b2c2e42ULL,0x000000008db22b09ULL,
+0x32e7d4831a07394eULL,0x00000000a1b9ee48ULL,
+0x08261539cb2461b7ULL,0x0000000011e430beULL,
+0x79e61cc893914157ULL,0x000000007553533eULL,
+0x6cc9007a6bd4aad6ULL,0x00000000ddae03a1ULL,
+0xbc94b2974757876eULL,0x00000000874c1591ULL,
+0x4213973b4cb674e4ULL,0x000000001171d023ULL,
+0xe19e9107b1be85ebULL,0x00000000ebbe6d8bULL,
+0x7ad1768a9a4b1a67ULL,0x00000000a9694870ULL,
+0x6e5602eeb0d971aaULL,0x0000000042b44900ULL,
+0xb389c9d54e6b2119ULL,0x000000009aaba551ULL,
+0x013969c150067c55ULL,0x0000000035a29072ULL,
+0x68b74e266a80d2c5ULL,0x000000009ca7ec1cULL,
+0x6d878caa51bec772ULL,0x0000000009c60894ULL,
+0x82ba9086e8d3052bULL,0x000000007de8780bULL,
+0xc557a093ede75e1eULL,0x000000005e3b93ccULL,
+0xad118c089a6eeca2ULL,0x00000000c7192619ULL,
+0x9143182b04b7a5d4ULL,0x0000000005ca2580ULL,
+0x7db8873d81a387a7ULL,0x000000002255a1cdULL,
+0x446a7991a1b9911cULL,0x000000003ba2141cULL,
+0x233a432446b00e65ULL,0x0000000048179b11ULL,
+0x858ed76e2666a945ULL,0x000000001942bc1bULL,
+0x348c114c1a72b04bULL,0x0000000075d48057ULL,
+0x56278b787915d444ULL,0x0000000008c1ae9dULL,
+0xc72e10c68e23e3aeULL,0x000000002a3175dcULL,
+0x70175b07b8c148a8ULL,0x00000000a219dc97ULL,
+0x6cb6e1885ab1e0ebULL,0x0000000086ea5533ULL,
+0xd82da2150ee94400ULL,0x00000000156b51b9ULL,
+0xea3ee32bae02878aULL,0x00000000cbd75741ULL,
+0x60c21b4ede7b41a1ULL,0x0000000017063101ULL,
+0xc92062a515ce4a24ULL,0x000000006524c870ULL,
+0xd1cdcd1339c25bccULL,0x0000000067e8e2edULL,
+0x793b2be811a5cdc7ULL,0x0000000061c306c3ULL,
+0x9d319407b9ab2871ULL,0x00000000b45ce788ULL,
+0x354dd3697aca66c7ULL,0x0000000048d54aa8ULL,
+0x3c51a1494a49d81eULL,0x000000005d819187ULL,
+0xce2e46eb455825d4ULL,0x000000009bd37647ULL,
+0xbc7c79b3acbcc27dULL,0x00000000c0033817ULL,
+0x96e64925e1392a55ULL,0x0000000079ab435dULL,
+0x8c87ba64597c85b5ULL,0x00000000287c570dULL,
+0xbe1c8ac0bec94e0bULL,0x00000000518aee62ULL,
+0xb8743ae929723864ULL,0x0000000058893902ULL,
+0x3b1d169d463a8da8ULL,0x00000000eb05e903ULL,
+0x9306ec0095191c73ULL,0x00000000be2b3174ULL,
+0x7036b862d59480daULL,0x000000001e580d7eULL,
+0x2b28504656bc0116ULL,0x00000000eb11330dULL,
+0xe9e2886509748484ULL,0x000000002d6c8ab0ULL,
+0x4a6d4824619c1354ULL,0x00000000c5198638ULL,
+0x19ccbe4c80e4ccb5ULL,0x00000000e90e26e2ULL,
+0x6697b059ee443bb9ULL,0x000000002d44aa8aULL,
+0xe27c60e64d47ab3dULL,0x0000000048500c7bULL,
+0xa747553c66be7712ULL,0x000000003bcb4a0eULL,
+0xcdc97859eec932caULL,0x0000000034ed087eULL,
+0x49ea302041476883ULL,0x00000000e64442c2ULL,
+0x9dbae48bac91c01aULL,0x00000000a1b7c61aULL,
+0x12569e08c69d5bb4ULL,0x00000000a2a68676ULL,
+0x499140150a747173ULL,0x00000000164b06b0ULL,
+0xb41cec711a6a985aULL,0x00000000ccadcb57ULL,
+0xeae5742c477aae1aULL,0x0000000017dc79d2ULL,
+0x5364b96a8b86691dULL,0x00000000ebd4b148ULL,
+0x605bc544a99ac462ULL,0x000000001778a877ULL,
+0x70c0de10dcba81deULL,0x00000000732e3db2ULL,
+0x45cce596bcde875aULL,0x00000000a79de7caULL,
+0x4a849c2dde8bb597ULL,0x000000009160877bULL,
+0x81169ba5053b6882ULL,0x000000001b508a42ULL,
+0x47053a93a02adea1ULL,0x000000008e12b398ULL,
+0x57d8bb045c468d19ULL,0x00000000d353970aULL,
+0x7b4a300c5bebe95eULL,0x00000000b5926a28ULL,
+0xc24ade6b1ecc6d4aULL,0x00000000da749c07ULL,
+0x3b942189a5bb7c23ULL,0x000000004a662685ULL,
+0x50408eab558e2d91ULL,0x00000000ee689ab3ULL,
+0x586a9b38c476e179ULL,0x00000000e461784eULL,
+0xdcaa0eb683a83870ULL,0x000000000d7c9331ULL,
+0x0dcdc71690b68de2ULL,0x00000000eb11901eULL,
+0x122497c36a8c148bULL,0x0000000016882134ULL,
+0x2bb7ae6e99e892bcULL,0x000000009d9ac9c8ULL,
+0xe60abc0650b04d79ULL,0x00000000d808e9dcULL,
+0x4081375481853c68ULL,0x00000000290620bdULL,
+0xed47a6d3b35b369dULL,0x0000000051e50341ULL,
+0x4b9069393d477251ULL,0x000000002a57796cULL,
+0x1489c90aacad4a98ULL,0x00000000b6726628ULL,
+0xb3cdae4e3d55295aULL,0x00000000e1251397ULL,
+0x8e5eca5ec5e03a76ULL,0x00000000e8829c29ULL,
+0xdd801c25230d7030ULL,0x00000000093bcd34ULL,
+0x9ea8d6376e347791ULL,0x000000007254d286ULL,
+0xc05306ad7e2306b1ULL,0x00000000b38d9bbaULL,
+0x831634ed261e7ab9ULL,0x00000000353e8e2cULL,
+0xa7674c642c192e1bULL,0x0000000078817dedULL,
+0xb0562787a022ae17ULL,0x00000000242d39baULL,
+0x25be14c4b07a5932ULL,0x000000001de70209ULL,
+0x1191c40ce5620104ULL,0x00000000e781b759ULL,
+0xd6c7346652b8dd0bULL,0x00000000d87451bdULL,
+0xc502607c0e45c974ULL,0x0000000010390610ULL,
+0x90a396a5bc87c412ULL,0x00000000913433dcULL,
+0x931a700ee1328db8ULL,0x0000000061c9c3d7ULL,
+0xdb2479153e6651d0ULL,0x00000000292ca653ULL,
+0xb14b6a3511cc2413ULL,0x00000000e9ae8a7eULL,
+0x97852549c644ca05ULL,0x000000005403ec40ULL,
+0x9182d3b52e88c2dcULL,0x000000006564a4ecULL,
+0x91a1de58528605abULL,0x00000000e02cd854ULL,
+0x557e7de90ab61574ULL,0x00000000d944ad15ULL,
+0xd412da73593b9382ULL,0x0000000050415ea6ULL,
+0x33b41b646065cb60ULL,0x000000003c5b7709ULL,
+0x0cd2e28e1cc17ba9ULL,0x000000003a36ed74ULL,
+0x5dcb77c8a509b719ULL,0x0000000048e572caULL,
+0x110484bc338b4ee2ULL,0x0000000070631b07ULL,
+0x011aa953bc3a71c3ULL,0x00000000042e1c9aULL,
+0x9680d989d2de3c34ULL,0x0000000093b32bacULL,
+0x2b9b0cd483824e54ULL,0x00000000436e7c13ULL,
+0x348cbe8614d960a8ULL,0x00000000bebdd73cULL,
+0xd6141a5430d4c55dULL,0x000000003390530dULL,
+0xa71e3b990d2e8b64ULL,0x000000006a6e8ae9ULL,
+0xca56478cc74293d3ULL,0x00000000cc0d0332ULL,
+0x280021e175074719ULL,0x00000000285ca167ULL,
+0x40e416a56199888eULL,0x0000000078b25411ULL,
+0x59242d9b7b920bb5ULL,0x00000000074e3d78ULL,
+0x257e5700d284cec6ULL,0x00000000466e44a1ULL,
+0x15a651983a81b401ULL,0x00000000bbce66beULL,
+0x32c5b0613620ed86ULL,0x0000000045502db2ULL,
+0x24405561385e39d5ULL,0x00000000d94701c3ULL,
+0x59789597cdb59c23ULL,0x00000000c0282578ULL,
+0xb3682e25eb19e35bULL,0x00000000c3944d3eULL,
+0x9e8d2677ea8e6671ULL,0x0000000003797a55ULL,
+0x1a6742beca8e85c4ULL,0x000000005a6c0c68ULL,
+0x4bca3e7244aa1d2eULL,0x0000000008ce8e90ULL,
+0xdabc51cae43a1b91ULL,0x000000003b860b67ULL,
+0x212d457cbbdbeb91ULL,0x0000000007525643ULL,
+0x74c65ebd4c5d6487ULL,0x00000000ec766a70ULL,
+0xd838462dea184aadULL,0x000000001ecda975ULL,
+0xd24676a6c1652e64ULL,0x00000000ceda70a1ULL,
+0x982bcb5b6a82701aULL,0x000000003ec0cee7ULL,
+0x262d16910b75e638ULL,0x000000000d69066aULL,
+0x0b86a8e9d862c2d8ULL,0x0000000032d5d806ULL,
+0x62bccead1885dc0aULL,0x000000000c4c5a06ULL,
+0x5ce4428213bb28bbULL,0x0000000002995842ULL,
+0x1d0e8bb17919b278ULL,0x00000000ee39aeadULL,
+0x25c7a5a64c81417aULL,0x00000000d8891110ULL,
+0x1c8dea14132b6a73ULL,0x00000000e3248a64ULL,
+0xe0ba76ed94169e06ULL,0x00000000d3ec2e98ULL,
+0xb9d20cad98108247ULL,0x000000003a792bb0ULL,
+0x964cec01439ec577ULL,0x0000000041c19695ULL,
+0x2c1a14c400be31c0ULL,0x00000000119d4023ULL,
+0x947b6ee1781996cdULL,0x000000005cb2ec18ULL,
+0x60be9685386568a7ULL,0x00000000718cc495ULL,
+0xed87e9e8938d7a78ULL,0x000000007d9b3e3dULL,
+0xbe789a02ab91bd69ULL,0x00000000acca43d9ULL,
+0x8bd0940e68c479e0ULL,0x00000000ec47925dULL,
+0x256a9c37550a0d71ULL,0x00000000e14ae356ULL,
+0x59c858b80934a225ULL,0x00000000b670c919ULL,
+0x1bc0349c4e299903ULL,0x00000000a3b0c956ULL,
+0xa5a1c29528ed9460ULL,0x00000000993ca7b2ULL,
+0x5a3a6a3492516ab0ULL,0x0000000033d0dbcbULL,
+0x16d28e721262408cULL,0x00000000c14a5185ULL,
+0x84755d07618ddbe4ULL,0x00000000676dee17ULL,
+0x4e1c2e50e135bbabULL,0x000000001d4480e8ULL,
+0xb331ae28398a6359ULL,0x00000000962b20b7ULL,
+0xb3aeb59488615e29ULL,0x00000000ba963ceeULL,
+0xba40aa19e8285eebULL,0x000000006c591531ULL,
+0xd0e7443bbe081a4bULL,0x0000000005bc5ed4ULL,
+0x71e0888b9687cb1bULL,0x00000000cb405093ULL,
+0x1128ce30777edd55ULL,0x00000000e23710baULL,
+0x9d3a63e65eb04c4cULL,0x0000000084e17b5bULL,
+0x5933611697c043c3ULL,0x00000000956d8b10ULL,
+0x6098752acc6ecd77ULL,0x000000006e33a094ULL,
+0x511e4ae26a288629ULL,0x000000007c58a215ULL,
+0x6b60c5b06aeaaca0ULL,0x000000008bd57ab4ULL,
+0x19a6d512cd5de495ULL,0x000000009ec070d6ULL,
+0x50651dabce9c98c5ULL,0x000000000a98105aULL,
+0xd16d780475191756ULL,0x000000003b382a50ULL,
+0xada435d69131199dULL,0x00000000290c0837ULL,
+0x9767c4c208ae3a95ULL,0x00000000b4514131ULL,
+0xd7639b1d6e6aec81ULL,0x000000007acd8019ULL,
+0x08a2c29739941180ULL,0x000000006c876814ULL,
+0x744e62156293ed99ULL,0x000000004b139decULL,
+0x127143aae3e18760ULL,0x000000007bd291d3ULL,
+0xaa3b952eba7a050dULL,0x000000007150d018ULL,
+0x6e8b63169d676ea3ULL,0x00000000c407b46bULL,
+0xa957d1dc453e6688ULL,0x00000000205c7d83ULL,
+0x723121a340a3e2c6ULL,0x00000000b287743aULL,
+0xd1a4da6ee5c6527cULL,0x000000000aedb8e7ULL,
+0x0a375365c40527d5ULL,0x00000000a2176798ULL,
+0x2d8bba529a69989cULL,0x000000004436e456ULL,
+0x69127060da0324e2ULL,0x000000003646b245ULL,
+0x02a0c9ba9d6e18d5ULL,0x000000008932207cULL,
+0xb69664ed62c6b5edULL,0x00000000233ba807ULL,
+0xb9aad8a0ca302c2bULL,0x00000000ebeb3673ULL,
+0x3764a2d93542a8a9ULL,0x00000000d151401dULL,
+0xc99c7c1c27b6658aULL,0x00000000c439e71dULL,
+0xc74e00d05870127eULL,0x000000003735a927ULL,
+0x37d15e7b4ee230ddULL,0x00000000a427119bULL,
+0x6de6668b3d225c41ULL,0x0000000066c90368ULL,
+0x513e1be3211a5e65ULL,0x00000000b410b152ULL,
+0x371ac5755e608ecbULL,0x00000000a966db8cULL,
+0x75cd025dbe12651cULL,0x000000001a6019eeULL,
+0x6ba5cc55a77dd92dULL,0x00000000ec11661eULL,
+0xc7ebb35a62c80c09ULL,0x000000008ce5ed2eULL,
+0x7b745dae7ed1c846ULL,0x00000000ba234400ULL,
+0xc5b2be40ead77a0bULL,0x00000000cec93a43ULL,
+0xa65268ecb8023834ULL,0x00000000411520ecULL,
+0xd96286606591e684ULL,0x00000000d0077e68ULL,
+0x458c599038833d58ULL,0x000000009ce16390ULL,
+0x55c18e690e3c8abaULL,0x000000000d9ed16eULL,
+0x47289591326e7514ULL,0x0000000093d70049ULL,
+0x3a72ac509bc4bba5ULL,0x0000000055754423ULL,
+0x8b986e4345ea16c6ULL,0x0000000036140edcULL,
+0x700ed85be19a5920ULL,0x0000000052badb5aULL,
+0x78e1bd61b8a1adabULL,0x0000000026e28a8aULL,
+0x14d93b669c02182bULL,0x00000000516dcae9ULL,
+0xb9c15eb221ee075cULL,0x0000000099dda4a2ULL,
+0x65e0b1bb4ada3980ULL,0x00000000093d4bb5ULL,
+0xb0363d66b5868c8aULL,0x0000000036ea9ad1ULL,
+0x5de9ab66602bb144ULL,0x00000000d39be4beULL,
+0xe67db669a6135ee9ULL,0x000000004b12bbe7ULL,
+0x7ca33b593abde644ULL,0x0000000042218748ULL,
+0x034062eb80179635ULL,0x0000000092e1311eULL,
+0xcd63d144ebb9c7b3ULL,0x0000000076c8830aULL,
+0x039a87a9c145b63eULL,0x000000003ba134bcULL,
+0x04400b36abbcb04dULL,0x0000000077c1d28aULL,
+0xc478529cd7052eddULL,0x00000000db344bbdULL,
+0xac4a54bed3e7452aULL,0x000000008137a7a8ULL,
+0x218ab1daa130596bULL,0x0000000069732555ULL,
+0xc13631eca16d2ed0ULL,0x00000000d73c6289ULL,
+0xb1a23358647599c3ULL,0x0000000029d74859ULL,
+0x4608092c140aeeddULL,0x00000000cb35da1cULL,
+0xa8ddbada802d37e9ULL,0x000000009bdbd5c8ULL,
+0x1d9d9526e2774d6aULL,0x000000009d320666ULL,
+0x61ea974cc1654d14ULL,0x00000000eb13264eULL,
+0x0a6e21e3e288a535ULL,0x0000000021a85cd9ULL,
+0x89eb4d53311d1bc4ULL,0x0000000097635edaULL,
+0xee7b095d54a7e9c7ULL,0x00000000cece6e9aULL,
+0xcc512232e013dd6cULL,0x00000000a00c739cULL,
+0xa96d98a26acc826bULL,0x000000002c24d4d5ULL,
+0xd5c6e8418120da56ULL,0x00000000a31121b2ULL,
+0x39d5016e12a48dd0ULL,0x000000005b8488e1ULL,
+0x4c8d3b258e537e10ULL,0x000000005898e222ULL,
+0x28daca75dd1854c0ULL,0x0000000037ea5383ULL,
+0x97ee35934de23c60ULL,0x00000000367ab17aULL,
+0x9ed401d74a54b12cULL,0x00000000b463c2d0ULL,
+0xe113e20ce353412bULL,0x00000000747b9a95ULL,
+0x4881cdd4ebe6c3abULL,0x000000005854b283ULL,
+0xc8582b294da5bb02ULL,0x00000000c39a3023ULL,
+0x683695ad9a9ad2baULL,0x000000001b1b9c6bULL,
+0x95888dd7c585d821ULL,0x00000000a510ebb7ULL,
+0x9be61e3ec7285015ULL,0x000000008ada5156ULL,
+0x838733661450ecbeULL,0x00000000dc52a1c6ULL,
+0x97ae8e3abdeb41bcULL,0x00000000392c7490ULL,
+0x8802abeb1d4583acULL,0x00000000b18dd5abULL,
+0xdd67a1ac15952560ULL,0x000000008e609ccaULL,
+0x13e01c7e9c67ea89ULL,0x0000000081ae5849ULL,
+0xdae55683e60968e3ULL,0x00000000d0b8e35eULL,
+0x9da048c7320ba397ULL,0x00000000ad559508ULL,
+0xe8011c11c0520cd6ULL,0x00000000503359baULL,
+0x9824274649354b4aULL,0x000000002e759686ULL,
+0x9a63749763dcc164ULL,0x00000000cec60b27ULL,
+0x8d531bb29ced8e70ULL,0x000000009080d071ULL,
+0x817ce6d641a71919ULL,0x00000000e385b612ULL,
+0xad39898539ac783cULL,0x00000000a79646a8ULL,
+0x72da89234d119308ULL,0x00000000cc88d02eULL,
+0x941b87cd9973a4b4ULL,0x000000005129428dULL,
+0xc0a2bdac32e6d9d7ULL,0x00000000b7dba7c6ULL,
+0xa0529d42d70333b8ULL,0x00000000c24694b4ULL,
+0x26c36b9a897dd68cULL,0x000000003e54be86ULL,
+0x91be68b81137bc99ULL,0x00000000a0aa5a1aULL,
+0x5567880ea94e6d22ULL,0x0000000067822c07ULL,
+0x0ced2da2d22480beULL,0x00000000eb6da2b1ULL,
+0x5c46ea9c6b3a4838ULL,0x00000000e41ce68eULL,
+0x82d786b0ba0b71beULL,0x000000003a49b44cULL,
+0xaade8596808a2694ULL,0x00000000a3909678ULL,
+0x7099a544ea3171d9ULL,0x00000000c8c82c89ULL,
+0xae68c7870bc5737bULL,0x000000005117dc81ULL,
+0xd96701841b941ab0ULL,0x00000000de0cd6c4ULL,
+0x7688966d9ae74a0bULL,0x00000000543c3302ULL,
+0xbb18b72399828b6cULL,0x0000000006bd8514ULL,
+0x944511ed95827125ULL,0x000000004b98bd58ULL,
+0xd5d1dbd560280e23ULL,0x000000009a29c9ecULL,
+0x3a049e8715009283ULL,0x00000000ec9027acULL,
+0x93c0267edc62e476ULL,0x0000000015c41bb3ULL,
+0xb88855e71c14097aULL,0x000000003a05782dULL,
+0x000033a02d7171bdULL,0x0000000008417209ULL,
+0x82cd5c9503730337ULL,0x00000000e3138310ULL,
+0x17bba1359316657cULL,0x00000000dda9e80aULL,
+0x1a2b2260005136ceULL,0x0000000081de6b27ULL,
+0x00a7d32b8a19430dULL,0x00000000cb5c5600ULL,
+0x0a3ce1a9b785d6ceULL,0x00000000a1035602ULL,
+0xe625d25a3bd00bddULL,0x000000002ec9aa65ULL,
+0xb07e0e0e42719a48ULL,0x00000000a7e19480ULL,
+0x7a117ba26202d360ULL,0x00000000573ad1a7ULL,
+0xac41aa19176cb996ULL,0x000000004db0667aULL,
+0x41795205e4e3291dULL,0x00000000d9c50356ULL,
+0x4a45ed4d6d1221b0ULL,0x00000000464514a1ULL,
+0x27e649cca2e1e190ULL,0x0000000054a76a39ULL,
+0x031ed05d668b86b2ULL,0x000000006a338e8dULL,
+0x90095c2dcc37a710ULL,0x000000009a271344ULL,
+0x8335c013ec44dda0ULL,0x00000000647e3681ULL,
+0xe879ad2199d96c60ULL,0x00000000dc349d2bULL,
+0x549b3cd0ac60e5ccULL,0x0000000033da6858ULL,
+0x8d24add5aed55010ULL,0x000000000a3b0ee6ULL,
+0x581a6b12845e9e68ULL,0x00000000eeca518bULL,
+0xc054bb7c756b17d0ULL,0x0000000079872d1bULL,
+0xb576d31078197968ULL,0x0000000071134a0dULL,
+0x02c4ecb72a2321a2ULL,0x00000000b173e471ULL,
+0xc211807c2c84d264ULL,0x0000000057910d7aULL,
+0xa60ddb4b53a0289eULL,0x0000000078e0ee46ULL,
+0x174b000b0dadc43dULL,0x0000000030715a70ULL,
+0xe951a242865a9ad6ULL,0x000000001a15885aULL,
+0x9d49cc9850100b59ULL,0x000000006281cc97ULL,
+0x3c8d5759795ee432ULL,0x000000000912e30eULL,
+0x5837e8b329c83804ULL,0x0000000089d39abeULL,
+0xc27435d290a983d0ULL,0x000000001c996e78ULL,
+0x630c449e4b95a344ULL,0x0000000061846b61ULL,
+0x5481a8d1e45151b1ULL,0x000000005dc7d506ULL,
+0x2a23b5799b160d0dULL,0x000000009cde6ee5ULL,
+0x1c6b6823c6021bc3ULL,0x00000000ec99c3c7ULL,
+0x009105a5b07a3441ULL,0x000000000421327bULL,
+0x7e93168a27e1b784ULL,0x00000000555abc31ULL,
+0xa334193d87c59698ULL,0x00000000e9bd125eULL,
+0x87554511775a8b81ULL,0x000000000d095607ULL,
+0xc27aee89ae674e03ULL,0x000000002559757aULL,
+0x888cebc4dddbda7bULL,0x00000000a9954b81ULL,
+0x97c081612e99dc80ULL,0x00000000733e881eULL,
+0x31a9b248b9053886ULL,0x000000001a565272ULL,
+0x5845e5897c1dbe82ULL,0x00000000c78296b4ULL,
+0x95b8ee1dd3797711ULL,0x00000000cb42c2a4ULL,
+0x82a1738687573405ULL,0x00000000413449a6ULL,
+0x04b089e4b93c865bULL,0x000000003d703c34ULL,
+0x9b4888e7d58dd012ULL,0x000000006e6d1b75ULL,
+0x1ccdeeb36523c100ULL,0x000000007bd600deULL,
+0xe25d0bd406de450eULL,0x00000000dae54c35ULL,
+0x90aa790ab2680de4ULL,0x00000000375d9dbaULL,
+0x1a90575431ca7950ULL,0x000000009a46c1e2ULL,
+0xd67b8953624c5052ULL,0x00000000067cc9e5ULL,
+0xac9acd6d6926193dULL,0x00000000ec683b3dULL,
+0xea882a90e536360aULL,0x00000000cc6d5a45ULL,
+0x53abcd185688a976ULL,0x000000009542d8c8ULL,
+0x5e874481d02519caULL,0x00000000479e1192ULL,
+0xb73d0e557541844dULL,0x00000000b9b32142ULL,
+0x1dc31193024d9cacULL,0x00000000859176a2ULL,
+0xa765652c0a590554ULL,0x0000000006668788ULL,
+0xca75e30ce69ac369ULL,0x000000002dc40832ULL,
+0x155133329a2489e7ULL,0x0000000049e027d2ULL,
+0x3c1289b83293e558ULL,0x00000000dd6db9adULL,
+0xe41865d11727564aULL,0x0000000035023be9ULL,
+0x5a1cdd1ee117a59cULL,0x00000000bda13414ULL,
+0xcb8393b351bac35cULL,0x0000000094b959a9ULL,
+0x6a0c143079ad3c6bULL,0x000000007d4d7667ULL,
+0xac6201e741d76290ULL,0x00000000a4ec02e9ULL,
+0xd1a4986ad8a83c61ULL,0x00000000a76c93b5ULL,
+0x825e111d8227c4c2ULL,0x000000000aba762eULL,
+0x7716e157a57a5662ULL,0x00000000e160b27aULL,
+0x75bb725d43671b55ULL,0x0000000027934aa6ULL,
+0x16625dd59c681d7aULL,0x00000000720cc0b8ULL,
+0x7d430bae66330c6dULL,0x0000000077540576ULL,
+0xb9878e53bb7a830cULL,0x00000000cb493347ULL,
+0x53eb972cc2c01755ULL,0x000000002c57abd7ULL,
+0x20d5768d45c7dc7bULL,0x0000000049328034ULL,
+0x868611024ec8b6b2ULL,0x000000004d12c518ULL,
+0xb784845ab1212667ULL,0x000000005737841bULL,
+0x70dd3c7a9352e560ULL,0x00000000b097a724ULL,
+0x61049466e17e122eULL,0x0000000035712b26ULL,
+0xbe32e739d3c5ade1ULL,0x00000000b5569e94ULL,
+0x0413c72a35113e44ULL,0x00000000948a59baULL,
+0xe705b0ab088d2d4dULL,0x000000004a675036ULL,
+0x49b7a5152c92a23eULL,0x00000000836bc732ULL,
+0x377123e033924122ULL,0x0000000049ec495aULL,
+0x7dde19cacc15d415ULL,0x00000000b4251e2bULL,
+0x926bcc7d265ea6beULL,0x000000000605a946ULL,
+0x3808700090b95de2ULL,0x000000004083e11dULL,
+0xd8cbc7c53d1a0ec1ULL,0x000000000a0a152bULL,
+0x2a738dad2b5690edULL,0x00000000be360479ULL,
+0xabb568d60d1385acULL,0x00000000d14b1d1bULL,
+0x232c02d28e8d22eeULL,0x0000000026544a63ULL,
+0xe61e671e38d65814ULL,0x000000004ec46533ULL,
+0x3845ed94b862ce7aULL,0x0000000093c89781ULL,
+0xcbc2249b75961b05ULL,0x0000000099d865bbULL,
+0x8d429eb199872123ULL,0x00000000647ae4e7ULL,
+0x425597029e4ece3aULL,0x0000000030c1a5b8ULL,
+0xa70b56837b294b31ULL,0x00000000995d2a64ULL,
+0x80c42ae51e0d8e10ULL,0x00000000d0192193ULL,
+0x1775b44698e2b03bULL,0x00000000467b1192ULL,
+0xd12cae289b2b6d51ULL,0x00000000a6ad3de7ULL,
+0x38ee29d72cda94b1ULL,0x000000007c2d781eULL,
+0x674b708734e9cd87ULL,0x0000000021551037ULL,
+0x3bedd65da55ee527ULL,0x0000000082a3b536ULL,
+0x19ac385c94e2be9eULL,0x000000001307e7deULL,
+0xc3ac8862990e6497ULL,0x000000004aa4893aULL,
+0x9bda5b86907cc263ULL,0x00000000994a685cULL,
+0x64db1c898b46ba2bULL,0x0000000002470c80ULL,
+0x39794258a7e62422ULL,0x000000005b3e4e0dULL,
+0x1d3eb924178d9cd2ULL,0x00000000e9c6c43dULL,
+0xa3a97479d717b4aaULL,0x00000000179617ceULL,
+0x6c5cb00cdd280835ULL,0x0000000032543d28ULL,
+0x5b5a230639c46a57ULL,0x000000003bb2cc7dULL,
+0xb49eb337353d7627ULL,0x000000003c202aacULL,
+0x23e532355677908bULL,0x00000000e74bd13eULL,
+0x5da0d3971ded7ce3ULL,0x00000000cce45901ULL,
+0x08c0d29e082a522dULL,0x000000005931d648ULL,
+0x5675eb669356266eULL,0x000000007e73ad09ULL,
+0x964431b38e8c54b7ULL,0x0000000033e0582dULL,
+0xc6e8415c7332aa30ULL,0x0000000009e2bea4ULL,
+0x1a65d8035297d6d3ULL,0x00000000c9e45627ULL,
+0x2d332152931ad4b3ULL,0x000000002a42e3b4ULL,
+0xa37b12e6dad1e982ULL,0x00000000857181b7ULL,
+0xb4e0c1a87bb19cc6ULL,0x00000000e7274d3aULL,
+0x1db40b192833e28cULL,0x00000000ca6e25dcULL,
+0x4ccba3e94c7cba19ULL,0x0000000001ba7707ULL,
+0x8c05bcb5e10b0d70ULL,0x00000000709798edULL,
+0x3eccba29c1b2ed2eULL,0x00000000e9c0e446ULL,
+0xe669aa1a476c61d8ULL,0x000000003d025028ULL,
+0x908b5b0ba619c4eeULL,0x0000000014b90871ULL,
+0xb0ba23dce3c0d8b5ULL,0x0000000028dd9e64ULL,
+0x6e2852a0d74e18d7ULL,0x00000000d2a915dbULL,
+0x90a5c5e237254519ULL,0x00000000411008cbULL,
+0xc50812b0a1291c13ULL,0x00000000423dc5d4ULL,
+0xa75be199db28d575ULL,0x000000005cab6bdcULL,
+0x7ea8c9bbb75dc68bULL,0x0000000065a21cb8ULL,
+0x847a50bb563109a9ULL,0x000000007228e50cULL,
+0x715a6beb77b3ac5eULL,0x000000003c7090acULL,
+0xcc2ec374382b2b72ULL,0x0000000087c3e431ULL,
+0x8109e808da13ca78ULL,0x000000004a2509a4ULL,
+0x2146e52198a4a5b0ULL,0x0000000093795d05ULL,
+0x821dd6c8c69db9b7ULL,0x00000000042bd13bULL,
+0xd94740e6b957b62aULL,0x00000000174711ccULL,
+0x95e4d13013513d77ULL,0x000000006554b4b7ULL,
+0x08b2c9211862cde1ULL,0x00000000e174bab4ULL,
+0x708eb53335ebae57ULL,0x000000009621d753ULL,
+0x0c50955325615cdaULL,0x00000000b0d6e2e5ULL,
+0xdb9b00a79ad82606ULL,0x00000000c705eec3ULL,
+0xc5e7a5ab33dc4019ULL,0x00000000cbb2d742ULL,
+0x04d57a2bee31179dULL,0x00000000715e735cULL,
+0x387b0399015ad606ULL,0x000000006c7bee49ULL,
+0x28625c1e1a9067b6ULL,0x000000009943d4a7ULL,
+0xe2a4d2a201c80dbcULL,0x000000002710dd95ULL,
+0x656b7aa7cea4e657ULL,0x0000000060803480ULL,
+0x918b2b29aa9e5cd7ULL,0x00000000c47eb19bULL,
+0x2d41162647176093ULL,0x000000003b41275cULL,
+0xc2d3a41436cb2547ULL,0x000000008c8a55a1ULL,
+0x258c5be71335a365ULL,0x0000000029d33ac3ULL,
+0x49267d4c5635e565ULL,0x00000000eb028110ULL,
+0xe66bcb420e6150bcULL,0x000000009006cc65ULL,
+0x09a1a83043ea20e7ULL,0x000000007e112eb7ULL,
+0x857861ecbbb96e36ULL,0x0000000054185598ULL,
+0xd919cbd9bec911caULL,0x000000002c24d230ULL,
+0x189ee8237c5b698aULL,0x000000002b7b55d5ULL,
+0xdbdc25e073d24946ULL,0x0000000090e9b86aULL,
+0xaba0d443cdec8157ULL,0x00000000abe23902ULL,
+0x03699487704cbcd5ULL,0x000000009c3923b6ULL,
+0xd383d30ca00216a9ULL,0x00000000c687bb67ULL,
+0xa038cad251d1a1b8ULL,0x0000000036e980c5ULL,
+0x4056bc87ac63b94cULL,0x00000000b80c0badULL,
+0xad7a8952277767b6ULL,0x00000000c2192c92ULL,
+0x521e9098712a22e7ULL,0x00000000e3dbc7d7ULL,
+0xb107b54800548305ULL,0x0000000031ac4a2bULL,
+0x8e93c5861176a891ULL,0x000000002c980e32ULL,
+0xa37dd495342b6b1aULL,0x00000000a3be5e25ULL,
+0x7d2bc49586b09e2bULL,0x00000000add7aa95ULL,
+0x60021e80330d83d0ULL,0x00000000382bc93dULL,
+0x629b79d89d3e5aeeULL,0x00000000cd44c392ULL,
+0xd0651a1be17d6b2eULL,0x0000000004285598ULL,
+0xac4e2097ccb49e93ULL,0x0000000018d98c76ULL,
+0xbc8dc7d728398e19ULL,0x0000000012155ab5ULL,
+0x2dee0570d84774deULL,0x000000000618d9e1ULL,
+0x0d17de52361c6edeULL,0x0000000053c447b3ULL,
+0x620bd28c25259edaULL,0x00000000a572325dULL,
+0x29ba40004d7cc84bULL,0x00000000e4a50ad7ULL,
+0x5ad260c0c8b017adULL,0x000000008ed9c77dULL,
+0xc36948603ad628a4ULL,0x00000000b882cd13ULL,
+0x3846b782da615ea7ULL,0x00000000a7dd9307ULL,
+0x7666db64dd3e5c0eULL,0x00000000e964ea67ULL,
+0x2414b82a9d0a7222ULL,0x00000000cb736a59ULL,
+0x998662735a9bab25ULL,0x0000000030eb04a5ULL,
+0x379a04d67569a268ULL,0x000000009b243c49ULL,
+0x21481d1523cdd89dULL,0x00000000e4ed4b04ULL,
+0xe608e3885461d94eULL,0x00000000b74a34ccULL,
+0xe1c6de42482240d7ULL,0x000000006262c253ULL,
+0x462177a35db5d2b0ULL,0x0000000026e5ea80ULL,
+0xa3c76ab982838663ULL,0x000000008e98b663ULL,
+0xea1d8a0b5a718521ULL,0x000000003670c26eULL,
+0xe9104bc5adb46943ULL,0x00000000e670e3ceULL,
+0x7c4d4024990bb2c7ULL,0x00000000d3a4b28cULL,
+0x56ddbd31b109e2d5ULL,0x000000004d72ce01ULL,
+0x37c8a4a92b64e378ULL,0x00000000b1b2d3e9ULL,
+0x252824782d8177ebULL,0x00000000c6c9726dULL,
+0xe070d595aa078403ULL,0x000000002eb9de70ULL,
+0x7ba284ead4de5573ULL,0x00000000e1e72015ULL,
+0xcc04ab718a5b10ecULL,0x0000000091b22727ULL,
+0xc5937dcbd2b0c608ULL,0x00000000747a10b3ULL,
+0x7050e5d45e576b53ULL,0x00000000329ca0b2ULL,
+0x4851264ec75e4334ULL,0x00000000b95701cdULL,
+0x181b6c103d3061b1ULL,0x000000004be4c540ULL,
+0xdad5064867c2169cULL,0x00000000c46b13d8ULL,
+0x67edde9261a9bc4cULL,0x000000000ce3c3a5ULL,
+0x27071c098a408596ULL,0x0000000005426284ULL,
+0xa1d3170495990cedULL,0x0000000082bca459ULL,
+0x2ea00228ab8b1c1cULL,0x000000006ad01a95ULL,
+0x47d3db45eda12380ULL,0x0000000087b48847ULL,
+0x213030114a0a878dULL,0x00000000c8582825ULL,
+0xa420675165a624a5ULL,0x000000003e2cde46ULL,
+0x695845e34d66e8c5ULL,0x000000005b239b2cULL,
+0x315ce986d03328a2ULL,0x0000000058c7a932ULL,
+0x9a60d42aa3ebbd57ULL,0x00000000ee821209ULL,
+0x84bda8432312e4a3ULL,0x00000000aae11778ULL,
+0x6d19101686b8822aULL,0x000000004084ac6dULL,
+0xa1a5b495ba6639b7ULL,0x000000008ba77a23ULL,
+0x5b30e34d943002c9ULL,0x00000000b31caab5ULL,
+0x93eca32da93a9964ULL,0x000000008ceb8ce5ULL,
+0x8e05474832d2a122ULL,0x000000001ed35b15ULL,
+0x4ed53d7e42954091ULL,0x00000000ca9d5b06ULL,
+0xa8a8e1dc288c81acULL,0x0000000018e27b38ULL,
+0x384b6694cc3004bdULL,0x000000000b2ec887ULL,
+0x023b39599ed5d173ULL,0x000000002a067932ULL,
+0x850a459b7e478793ULL,0x000000001d782ae8ULL,
+0x912902a7db58487aULL,0x0000000001b59a42ULL,
+0x016a39b25570936cULL,0x0000000092b18c49ULL,
+0x53009b85eb713e19ULL,0x00000000a5e2bae3ULL,
+0x9ccb51767c64a17aULL,0x000000006514ca9cULL,
+0x98cb67969e3604b3ULL,0x000000008001b927ULL,
+0x68e7a89d67ea6544ULL,0x00000000392c49c3ULL,
+0x5ea39e542d24e378ULL,0x000000001ba76b38ULL,
+0xb29928b452d2e2e1ULL,0x00000000929b8e8bULL,
+0xd7d7c962b9ce59c2ULL,0x00000000e44cd4c5ULL,
+0x9aee3a62b617838bULL,0x00000000ec0c02b3ULL,
+0x0b511de72cbe5184ULL,0x000000005b5bb9d6ULL,
+0xca98dc6cd8ea198cULL,0x000000001468d140ULL,
+0xb64ac5a79794acddULL,0x0000000055e5e2c9ULL,
+0x1ae1983356ae761dULL,0x000000009d857d70ULL,
+0xe2bc273a85ed50ecULL,0x0000000011702050ULL,
+0x3648012e9205944eULL,0x0000000052243a3cULL,
+0x5014bbb021e6b6acULL,0x0000000041a1930cULL,
+0x9b611d0bc82841ceULL,0x000000006baceb1aULL,
+0xab963945ac42b73aULL,0x00000000370163d5ULL,
+0xe210dd6d862d8b88ULL,0x00000000c7d73616ULL,
+0x74458008529bc658ULL,0x000000005d930d90ULL,
+0x6e46a9babb842977ULL,0x00000000ccae7d3aULL,
+0xb42c84389173736cULL,0x0000000016690509ULL,
+0xd4ee8c8687dcc1c4ULL,0x000000008d1b012dULL,
+0x4e2cba948143e528ULL,0x000000006683ad30ULL,
+0x5479917e760a9266ULL,0x00000000900e6714ULL,
+0x115b596bd85e156eULL,0x00000000222d70dcULL,
+0x49b416447c2bedbaULL,0x00000000a885a6c9ULL,
+0xd7da1ae0097a57a5ULL,0x0000000047be4138ULL,
+0xe96c4630623337abULL,0x000000009ebd0923ULL,
+0x477166d936e19770ULL,0x000000002c350496ULL,
+0xc624a053018147d2ULL,0x0000000012c84b72ULL,
+0xedd83249c5d6ee3aULL,0x00000000d53732a7ULL,
+0x05498294a1c02b0aULL,0x000000005c7658e7ULL,
+0x38b44184e2a1258bULL,0x000000000c08a104ULL,
+0x06c9e3b279105d24ULL,0x0000000047cb1840ULL,
+0x07e0a58bd87c3ba0ULL,0x0000000062d9ec1bULL,
+0x40420c962bac4475ULL,0x00000000eeed89a9ULL,
+0xac5b966d712c94c7ULL,0x000000008c1ece4eULL,
+0x235095406ee0c97aULL,0x00000000748802b9ULL,
+0xaa15a0e356385c99ULL,0x00000000a6aed9c4ULL,
+0xbdb73b7494aa9391ULL,0x000000001e45a100ULL,
+0x11bb531772657a85ULL,0x00000000a992dacdULL,
+0xb9dcd5d1e1db9178ULL,0x00000000859c4b54ULL,
+0x0e280c34a8629cc7ULL,0x000000009ced90ddULL,
+0xc2b9b4d7e40d717dULL,0x00000000eecbe046ULL,
+0x02346b6895c31c53ULL,0x00000000d0310910ULL,
+0x87a097ca6b7c98e2ULL,0x00000000c6d70b39ULL,
+0x05452ac10e944ebaULL,0x00000000e2ddb950ULL,
+0x1677b335c96e21b2ULL,0x0000000015119127ULL,
+0x36e0cce6795747a7ULL,0x0000000018591bd1ULL,
+0x33499744d1c5eb41ULL,0x000000009147a5d2ULL,
+0x7beca910757bda32ULL,0x0000000026d6698cULL,
+0x63c74c6e1c7070beULL,0x00000000272898daULL,
+0x868c8c1b69d0b54bULL,0x0000000082b8b61cULL,
+0xaa346a57821a97b7ULL,0x000000007484d093ULL,
+0xc7047b80e9bb9547ULL,0x00000000855449ddULL,
+0x3a99b4926de0398eULL,0x000000003c66cde4ULL,
+0x4dee04e197071b0dULL,0x000000000d143890ULL,
+0xb704d00a252c0430ULL,0x000000000c7a1d53ULL,
+0x54cc69a1d8c6217dULL,0x00000000eb5a6819ULL,
+0x992bae5a78821ebaULL,0x000000004eb6a8a8ULL,
+0xad19e2a7a943c87bULL,0x00000000ca78b051ULL,
+0xb7b80d81cd602e6bULL,0x00000000986525b2ULL,
+0x26d54666e480c5caULL,0x00000000628768c0ULL,
+0x3c89bee3e5ce4ad2ULL,0x00000000205a25acULL,
+0x8c2859b32643ad02ULL,0x00000000c3464a90ULL,
+0xce7d6e3c02432394ULL,0x0000000003940479ULL,
+0x7892e029be7d496cULL,0x000000001d75ee37ULL,
+0xd9e631e18e8b9dceULL,0x0000000048aa4ac0ULL,
+0x0072043a46b62eedULL,0x000000005a484734ULL,
+0x3e0da3a0179ec237ULL,0x00000000ac8016e1ULL,
+0xa1c8006dc44b8690ULL,0x00000000ba8e41c0ULL,
+0x77aeb556debc8becULL,0x00000000591672edULL,
+0xea58a73ea4a1c30cULL,0x00000000be25337dULL,
+0xb8e80aeaa77450e7ULL,0x00000000dd1ba686ULL,
+0x293105693d800746ULL,0x00000000e3a1abdeULL,
+0xc46b55a40624c6cbULL,0x00000000c275c177ULL,
+0x4bc34631e4ed3028ULL,0x00000000c3eb9763ULL,
+0xb0bb72055ec57678ULL,0x00000000c4194a1bULL,
+0x0b2b46697bd9d9beULL,0x00000000cb0e6218ULL,
+0xbc5340e7ba1d2391ULL,0x00000000d18016b1ULL,
+0xa4b44e645715d5b3ULL,0x0000000000500c52ULL,
+0xad1b2ded46c0a0dbULL,0x000000003c214ad9ULL,
+0x0312481ab654967aULL,0x00000000276449e0ULL,
+0xb935e6d2bda38299ULL,0x00000000e17e1090ULL,
+0xb718b20b996e7d24ULL,0x000000008c3484d1ULL,
+0x73aae3c8b34c9e33ULL,0x00000000769463dbULL,
+0xbec79b5e3a119ac1ULL,0x0000000098a929a0ULL,
+0x096ad048ed1d26a9ULL,0x0000000017383820ULL,
+0x01c104ee3c80228bULL,0x00000000b9431d80ULL,
+0xd00a484b9e183b6eULL,0x00000000cadc1c5aULL,
+0x43471aa8c0561579ULL,0x000000004793dae3ULL,
+0xe21bb28113b6bce6ULL,0x00000000713663b8ULL,
+0x62ae038d8b284d4aULL,0x00000000171d1273ULL,
+0xb3280e638cb84d6aULL,0x00000000e7ae744cULL,
+0x4230179344d67d00ULL,0x00000000cade5206ULL,
+0x2b196d15e9ed2d76ULL,0x00000000ec9860e3ULL,
+0x51adc1e765d39127ULL,0x00000000ec1321a2ULL,
+0x4ddd18c8bdccd969ULL,0x000000006d966445ULL,
+0x990a15c5e476234cULL,0x000000003e1be13eULL,
+0xe06586e8b8a0619dULL,0x00000000e300882bULL,
+0xc04c4b4192c2b14dULL,0x000000002ce4e9b2ULL,
+0xab736d4265212c8bULL,0x00000000e9c305abULL,
+0x25d447b7422301ceULL,0x000000001334415eULL,
+0x89c85aa0be79e119ULL,0x00000000ee77c4d5ULL,
+0x3ec69de6d06249e0ULL,0x00000000417d59baULL,
+0x1050862abb37debaULL,0x000000005963c988ULL,
+0x195abac7c18714ebULL,0x00000000dc7c9601ULL,
+0xe5c33c646c28a4daULL,0x00000000b1a5c4caULL,
+0x5e5eda490c86bc44ULL,0x000000007e83761aULL,
+0x889d53a94cc81926ULL,0x00000000b7066d3eULL,
+0xb92777a532aa52d0ULL,0x00000000a66c6ac1ULL,
+0x494dc954e602cab7ULL,0x000000006da825c0ULL,
+0x41a7a50827704aa9ULL,0x0000000048e2044aULL,
+0x851e8b2c582d05dbULL,0x000000005a8ee383ULL,
+0xdeded40d5a9e83baULL,0x00000000cbb9a6c7ULL,
+0x66e03b7b191510c5ULL,0x00000000d35c7786ULL,
+0x9e9beea6c4b7412aULL,0x00000000a37b19a2ULL,
+0x6530ba306c458da9ULL,0x000000008d568db9ULL,
+0x61e5008d36042d19ULL,0x00000000cc434d31ULL,
+0x3c69b7889353bd65ULL,0x00000000dadb0c45ULL,
+0x39d85421b7479cd8ULL,0x00000000907c32a0ULL,
+0x99a1e76b2838a7d7ULL,0x000000008a27c67bULL,
+0x294e2d9c5226a3e7ULL,0x000000003dc04ee3ULL,
+0xd1c996c10a8ccbacULL,0x00000000b45be36aULL,
+0xd38b29142a7a2c85ULL,0x00000000a4d1995aULL,
+0xc4308e20db31eec5ULL,0x000000003d4e7c92ULL,
+0x648b66335826db65ULL,0x0000000005c60c75ULL,
+0x1ce1e01d401b3623ULL,0x000000008c9d480cULL,
+0x4226c9ec3914d04dULL,0x00000000bd36530bULL,
+0x8271449ea012ee76ULL,0x000000008c6d8e69ULL,
+0x42a7a18a1175ea9bULL,0x0000000025e3aa7aULL,
+0x33004a56e993867cULL,0x0000000054dab6e1ULL,
+0x885c1a61125ce434ULL,0x0000000030d7b2e3ULL,
+0x70e838555ba0e81dULL,0x00000000098b9292ULL,
+0x42622be7278a54ebULL,0x00000000252a40a1ULL,
+0x1a44b2a44ee2bb51ULL,0x0000000039bb47dbULL,
+0x831ad225b860a655ULL,0x000000005c306a67ULL,
+0xd8386c76dce66060ULL,0x0000000023c95269ULL,
+0x391cc57862c52e66ULL,0x000000003e2e4633ULL,
+0x1db3d9eae6748131ULL,0x0000000099d3a08cULL,
+0x61bb4a8573106914ULL,0x00000000bdd19572ULL,
+0x80870ed18c34e7d5ULL,0x000000005da597d5ULL,
+0xd131ae3e5a3a8460ULL,0x000000006b42065aULL,
+0x240906350b06353aULL,0x00000000db953b17ULL,
+0xa5a7e14496129e8bULL,0x00000000176a99b5ULL,
+0xc9048d79491a38a5ULL,0x00000000c4776117ULL,
+0x268aa9855841d1acULL,0x00000000862d1554ULL,
+0x9c89c43e517b69cdULL,0x00000000c80b0ae7ULL,
+0xac4cc1a1e05d819eULL,0x0000000082db0921ULL,
+0x89cd560bcb553a86ULL,0x00000000596121a4ULL,
+0x28ce60cbbaba6591ULL,0x00000000b50de558ULL,
+0xc9425cc828de8409ULL,0x00000000c7483ab0ULL,
+0x2584d435a10cc0bcULL,0x000000007751261aULL,
+0x558ce76367a90114ULL,0x00000000a9937aceULL,
+0xcaa5d9bd0696514cULL,0x000000009041d653ULL,
+0x5c1c9c6c6c1855a1ULL,0x00000000b046a887ULL,
+0xb22136c1987c547eULL,0x00000000e40a790dULL,
+0x34aa471ccd6969baULL,0x000000002816912bULL,
+0x930c6290e2c6a72cULL,0x000000008627982dULL,
+0xd768a159d685b4b1ULL,0x000000001b1ad4d5ULL,
+0xb63d719d19656068ULL,0x0000000057ba6709ULL,
+0x35a1ddb66a211617ULL,0x00000000bea100ccULL,
+0x9e537d62837a370dULL,0x00000000948d2945ULL,
+0xd561bcc8438b0c3bULL,0x000000004a7e5dccULL,
+0x437746b74d83c07aULL,0x0000000041db9de6ULL,
+0x2d07212b9c9dc18aULL,0x000000009b65ca3aULL,
+0xe42beae91227502cULL,0x00000000c1301474ULL,
+0x232d420a010dbbe3ULL,0x00000000a4d3976cULL,
+0xc9cec3237a390036ULL,0x00000000bd877238ULL,
+0x292d0479878c24b2ULL,0x00000000b6a0e168ULL,
+0xa97d1b1c74084db2ULL,0x000000006b59786bULL,
+0x316aa62a0c407795ULL,0x000000000b2cbdd8ULL,
+0x694b55ec4d2529caULL,0x000000002d863c83ULL,
+0x9d58c711ab5d1bb2ULL,0x0000000082dc8661ULL,
+0xe494749396c9c48cULL,0x00000000a351ca75ULL,
+0xb5ec9aa271483698ULL,0x00000000a1337395ULL,
+0x0d39b6e311e577a2ULL,0x000000000a74c459ULL,
+0xc5b4c419c50ab290ULL,0x00000000c1581707ULL,
+0x41a09956830d3a4dULL,0x000000008e3c83deULL,
+0xcc3b7ed452b69480ULL,0x0000000004512411ULL,
+0x0b719138e1208398ULL,0x00000000d011b803ULL,
+0xd10b9665e373e331ULL,0x0000000019952d4dULL,
+0x1b6cb5853b764184ULL,0x0000000094c17dc8ULL,
+0x6ba65320917a6b73ULL,0x000000002724464bULL,
+0x58d2b921a8a29026ULL,0x000000001d8d5e26ULL,
+0x9a31db9b2978386dULL,0x000000003abb382aULL,
+0xe346e2244c62038aULL,0x00000000e3ae18dbULL,
+0x0957994e6e0d7ce1ULL,0x0000000067ab4670ULL,
+0x7413197304b28447ULL,0x00000000ca531347ULL,
+0x553576d04ed480ebULL,0x000000002147e1a0ULL,
+0x94275ab98967d6e4ULL,0x000000003c3ea6b4ULL,
+0xca756415bd9acce9ULL,0x0000000086dc0129ULL,
+0xaa4b1cb66a77ee48ULL,0x00000000d46d18e7ULL,
+0x0b1e45cc60396116ULL,0x000000008bc8d742ULL,
+0x8b8c0ebad0d522edULL,0x0000000062d2edddULL,
+0x6d2b3d677569a23cULL,0x00000000dea99113ULL,
+0x543164204dcb731dULL,0x00000000ad941886ULL,
+0xa89e7853b945d10aULL,0x0000000089282203ULL,
+0x1e72345712417909ULL,0x00000000b7132109ULL,
+0xa4960e4e7876a500ULL,0x0000000085320eeaULL,
+0x2576c654b9673c74ULL,0x000000004781b4e5ULL,
+0x5735d8139bcd8242ULL,0x0000000054533970ULL,
+0x153c8d3e45ede7ccULL,0x00000000d685777bULL,
+0x3d5174147c42d729ULL,0x0000000091e1a0e1ULL,
+0xc1762a1d414113a3ULL,0x000000000d2d219bULL,
+0x18151208c074284dULL,0x00000000379c2978ULL,
+0x3ea913647db3e6d9ULL,0x000000003683a2c1ULL,
+0x6257709868b78ec7ULL,0x00000000dccea9ebULL,
+0xeb8c9d2d36e0d69bULL,0x000000001713edaeULL,
+0x32978ad8a4947444ULL,0x00000000e4699b09ULL,
+0xc73c488e0c39d271ULL,0x000000003a551720ULL,
+0xb6d78eb5a36a7a88ULL,0x00000000ed93318dULL,
+0x07bbce6e7711b16bULL,0x00000000c73d5b36ULL,
+0x376bdc2ae27020eaULL,0x00000000d8184a87ULL,
+0x452bd170b06c457bULL,0x00000000b8e04424ULL,
+0x80c09b7c668bc6daULL,0x00000000d8abdb45ULL,
+0x2bb7ca0689d200a5ULL,0x000000006e5ba42dULL,
+0x1c3a8cddb0bd1387ULL,0x00000000b9913d03ULL,
+0xdb651cd546ec831dULL,0x00000000e0bd18d9ULL,
+0x2365dc6c75240662ULL,0x00000000ae83aa8eULL,
+0x3150c1e156370c6cULL,0x0000000041890c04ULL,
+0xb7b561a938c39d83ULL,0x000000002860ed41ULL,
+0x2979267a6ed69a50ULL,0x00000000015b3727ULL,
+0x8b5cc6086e8d4bcaULL,0x00000000b3ed1cdaULL,
+0x0ea8bd7652bd722aULL,0x00000000291476a0ULL,
+0xd8ed8d8a89bb5536ULL,0x0000000005c6c815ULL,
+0x94169ae9ced56c68ULL,0x000000006c9e54c4ULL,
+0x9c7873457a4c93a6ULL,0x00000000b1abb620ULL,
+0x964a27ece9ace537ULL,0x00000000c834703bULL,
+0xa6cd6a61e2a0781eULL,0x000000007607a2b7ULL,
+0x53d2905a94897853ULL,0x000000005aeb74c2ULL,
+0x33d3308b91477916ULL,0x000000000738534dULL,
+0xd5e54e5c03bec5e9ULL,0x000000006e71a9e3ULL,
+0x38217d51c2b1bcbcULL,0x000000001c03b6e9ULL,
+0xa18766b1ae3a5e3aULL,0x000000007e13c760ULL,
+0x421d1e194c020ca8ULL,0x000000009aa4b61eULL,
+0x53b8962eeda38373ULL,0x000000004516b365ULL,
+0x6030a074d8b96062ULL,0x00000000576a9533ULL,
+0x01cb86c3a773c724ULL,0x000000004e8b714cULL,
+0xad588e5b1da7a96cULL,0x000000003a7329aaULL,
+0x8097edee92084246ULL,0x0000000035992aa6ULL,
+0x0c3d9d051a34749eULL,0x0000000086ebeaa3ULL,
+0x3186cea178cdc216ULL,0x00000000ab2e820bULL,
+0x29464e54b1be8281ULL,0x00000000a770a865ULL,
+0x8b66e701cd52059cULL,0x000000003901e662ULL,
+0xdc9878edb625bdc8ULL,0x000000005189131cULL,
+0x517a26e1be782e1eULL,0x00000000b580abd1ULL,
+0x1becb60b72683876ULL,0x00000000ec0c7a6dULL,
+0xd399ab394db5ac43ULL,0x000000005241aab6ULL,
+0x42be52b526d13d80ULL,0x000000005457e15eULL,
+0x06e91a6ce4cddac8ULL,0x00000000ab6d0726ULL,
+0xade36449abadb949ULL,0x00000000ac1d62a5ULL,
+0x3265d78338999d56ULL,0x00000000e04c6be5ULL,
+0xeceb841c4e435503ULL,0x00000000b69c5c53ULL,
+0x58231592446b6caeULL,0x0000000037ae883bULL,
+0xc7c129e9921445d0ULL,0x00000000d90955c6ULL,
+0x6756530055163339ULL,0x0000000019724245ULL,
+0x0c41bc73d0a128ceULL,0x000000008b74e980ULL,
+0x19088e68e23299a9ULL,0x00000000165d66a5ULL,
+0x390c4dd6736e1958ULL,0x0000000056375c12ULL,
+0xc172ce6b4d03b8b4ULL,0x000000001ca20563ULL,
+0xa228d5333d2e99d3ULL,0x000000006240c72bULL,
+0x61ab39780b04024aULL,0x00000000ca6355c9ULL,
+0x5e598e1205b7e491ULL,0x00000000e17ca413ULL,
+0x5c3c6346810d9b2bULL,0x0000000071a7516dULL,
+0x59e89e7b89d2aec2ULL,0x000000007308248dULL,
+0xb7391e0278c959e7ULL,0x00000000ce848125ULL,
+0xdb50b5932eb9e3edULL,0x00000000630eb655ULL,
+0xa8b9d4c1c44ae0a5ULL,0x000000001aeb80abULL,
+0xd58ebd16940dc75eULL,0x00000000d6322212ULL,
+0x698abb4d8ad113e9ULL,0x00000000091eda10ULL,
+0x3b7daba4a43a9017ULL,0x00000000e88eb17dULL,
+0x30749b33ab7854c3ULL,0x00000000ca720ac5ULL,
+0xe897843d755434a6ULL,0x000000005a070610ULL,
+0x24b65b77cc280823ULL,0x000000007ae56e10ULL,
+0xa304064eaa070596ULL,0x00000000ee31d85eULL,
+0x5ac9bcade8503790ULL,0x000000008d0b5b69ULL,
+0x98c8d4ddac25a6d5ULL,0x0000000029182e79ULL,
+0x6ba65e071d1c407aULL,0x00000000bc5e2d2dULL,
+0x4093c90c8181411aULL,0x00000000e4ed6148ULL,
+0xa683bd7aab95dab4ULL,0x000000009735a6d0ULL,
+0x7c5477a967e26cacULL,0x00000000e81ee982ULL,
+0x770d7ae988c4879bULL,0x0000000009690e03ULL,
+0x44bd3c900a7a8198ULL,0x00000000c798345cULL,
+0x29066b56a62a7989ULL,0x0000000066ec5070ULL,
+0x30d84c9141b61566ULL,0x000000002e9843d4ULL,
+0x2e5b9db304b71b64ULL,0x00000000c079ec2eULL,
+0xd52744b5413211a8ULL,0x000000001831bed0ULL,
+0x77570e044da770d5ULL,0x000000002809a9b5ULL,
+0xe90da763c4aabb5dULL,0x0000000001704060ULL,
+0x7ede8536ad59cee7ULL,0x0000000025ae0e4eULL,
+0x3ac0b031363de3ddULL,0x000000007c0d8594ULL,
+0xb06d83310ba7102dULL,0x00000000b28633edULL,
+0xe7d1a57ea717a9d7ULL,0x00000000e221ebaaULL,
+0x191cece81b0ee82eULL,0x0000000071881eb5ULL,
+0xa258db2d2e5ac821ULL,0x0000000029a9349cULL,
+0xe6007b6ed40b8502ULL,0x00000000eb403426ULL,
+0x645d1845991d895bULL,0x000000009ece82a1ULL,
+0x61ee2a9120cc68e7ULL,0x00000000cab44005ULL,
+0x61e1d94c2a1b4c95ULL,0x00000000113137c9ULL,
+0xbc67c385db2c5c4bULL,0x00000000d1566e91ULL,
+0x754c1ad0beecc58eULL,0x000000007c644e6aULL,
+0x2a8ad51b3cda3164ULL,0x0000000080527ae8ULL,
+0x4e75198154ce8770ULL,0x000000006721bde6ULL,
+0xaa07bb7089c30ba0ULL,0x00000000cecdb5e2ULL,
+0x8c1613b31d2325a8ULL,0x000000001cdda27dULL,
+0x4ce031e79dc9d8a1ULL,0x000000004c2a8e16ULL,
+0xebd0976208b6ab2eULL,0x00000000e9c5da9cULL,
+0xb0097d430e27aebbULL,0x0000000047756a41ULL,
+0x02eba6b0066957a9ULL,0x000000009e3368ceULL,
+0x8c66630a37d640a5ULL,0x000000002d4a3941ULL,
+0x985ba4e44e041602ULL,0x000000005d3b58a3ULL,
+0x91eeab4ae3c3d419ULL,0x000000006ea70976ULL,
+0x0d972d2e11a163e5ULL,0x000000005eb9cd54ULL,
+0xcda2a906c5d0e3ccULL,0x00000000e80e981eULL,
+0xa7345226615e340bULL,0x00000000690eaeedULL,
+0x546d5b55bb98a64bULL,0x00000000451a11ebULL,
+0xb909d14e7339db58ULL,0x00000000664214c1ULL,
+0x80b485225e220302ULL,0x00000000b56128a4ULL,
+0x288b0c394b61dee8ULL,0x000000006ba1da7cULL,
+0x5370c1a49c4d6eb5ULL,0x00000000b5d9e03cULL,
+0x4456923cde7d1538ULL,0x0000000006e83c64ULL,
+0x2b8e5368993a8c2dULL,0x000000008b6ce00cULL,
+0x98208a90b2911e31ULL,0x000000006158bc26ULL,
+0x519861c932904105ULL,0x00000000d545ca14ULL,
+0xb46a4243813e0d4dULL,0x00000000a7253798ULL,
+0xa50015936b6add8dULL,0x00000000482569b4ULL,
+0x59b7e56ee1b6c918ULL,0x0000000051db7ea7ULL,
+0x4b6d3c21db5b7c3eULL,0x0000000092993902ULL,
+0x9366b3855cd45312ULL,0x000000004100267cULL,
+0x4cace3a63e2a7cceULL,0x0000000016a7a6c1ULL,
+0xbd13a7cd8cd077adULL,0x0000000089243d6cULL,
+0x7d7346e416e2e035ULL,0x00000000bbd1a558ULL,
+0xc0d98d42a3530e20ULL,0x000000008cd7c354ULL,
+0x181656255dc1673cULL,0x00000000e5296648ULL,
+0x40477ad958a980a2ULL,0x00000000d3e3b838ULL,
+0xab74be9aa0cc335eULL,0x00000000ec9e956dULL,
+0xe5323da3547a582dULL,0x0000000081799067ULL,
+0x3b1dbb8136094229ULL,0x000000003b412ea1ULL,
+0x1cdc6ac178ad662bULL,0x00000000eb5b5db8ULL,
+0x0a59e1028c4dc595ULL,0x000000001417a736ULL,
+0x20aae921db092e19ULL,0x000000007b7ad77cULL,
+0x0b75976225657e0dULL,0x000000002a93acc0ULL,
+0x642e841e21067a99ULL,0x000000000814ce20ULL,
+0x04da7c963eabb2bdULL,0x00000000bda3cec8ULL,
+0x7b468c36ded72518ULL,0x000000005018373cULL,
+0xbaa9795b05c98956ULL,0x0000000051481177ULL,
+0xd1040a44a861e94bULL,0x00000000d4db72a9ULL,
+0x695d3a6a0d1eea5cULL,0x0000000059d253e7ULL,
+0x0333113699d5a2a7ULL,0x0000000075bb3bdeULL,
+0x555e1eb2475119c4ULL,0x000000009edd7ee1ULL,
+0x83585b816857dd81ULL,0x00000000525deeaeULL,
+0xd9638440936b331eULL,0x00000000eab5e910ULL,
+0xe7e4933b83ada084ULL,0x000000004ee84de6ULL,
+0x24273907aec04653ULL,0x00000000b305b33aULL,
+0x72ad5bc070a9067cULL,0x000000003551c32dULL,
+0x098da736654cc92cULL,0x000000008bc0a8e3ULL,
+0xe6699a4abc9a39bcULL,0x00000000406693eeULL,
+0xddd0663a54938400ULL,0x00000000c00843b4ULL,
+0x59bb7bc1c79c9d89ULL,0x00000000cee00c3dULL,
+0x4d8a04b6c45e2406ULL,0x00000000a75a8c4eULL,
+0x4b14840c8e3c7d78ULL,0x0000000057180a43ULL,
+0xbb21ea7467154357ULL,0x00000000e9448dceULL,
+0xa9de8b865c661328ULL,0x000000000b52de5dULL,
+0xce896de412655077ULL,0x00000000a887d9e2ULL,
+0x6c523d3888523442ULL,0x00000000b092c1ceULL,
+0xd13a40e8552a09d6ULL,0x00000000da4c15a6ULL,
+0xee4d440420ed597bULL,0x0000000034a286b0ULL,
+0x38ac6ea5aa7db949ULL,0x00000000b6daeba5ULL,
+0xdece4a60d771a254ULL,0x00000000958e7141ULL,
+0x8c55c330a16d41c2ULL,0x0000000007b3be96ULL,
+0x763224a7ad199a81ULL,0x0000000068706672ULL,
+0x8cd74d105020db4bULL,0x000000004e1c2718ULL,
+0x45a222bd272ab593ULL,0x00000000166980baULL,
+0xb10411e17a0da173ULL,0x00000000350c0260ULL,
+0x1a261c928ec210dbULL,0x00000000c6addb00ULL,
+0x611c60c87527a471ULL,0x00000000b5ebbc74ULL,
+0xc70d8e36eb9d6d78ULL,0x0000000066407577ULL,
+0xd93d1d485dd690b4ULL,0x0000000014cb135aULL,
+0x97245b998e0457e1ULL,0x000000006cdc542aULL,
+0x7eeb7a32ad45cbaaULL,0x00000000a9e20b43ULL,
+0x99c7459d7e46e83dULL,0x000000009896b7bbULL,
+0xbb030287ed9c059aULL,0x000000001488de51ULL,
+0x33dcb020289ba738ULL,0x00000000d0a04a6dULL,
+0xc6a68831a492336dULL,0x00000000ad1d27e1ULL,
+0xd08a51c264b1bc86ULL,0x00000000ea149a57ULL,
+0xb2315439991ab141ULL,0x00000000d4c84d27ULL,
+0xe4383db0476da762ULL,0x00000000d6e8b252ULL,
+0x535d444a0168313aULL,0x000000005a89b7deULL,
+0x35bdcac3a36ab89bULL,0x000000005c986549ULL,
+0xb9a0e9573b5c07bcULL,0x00000000d789a7d6ULL,
+0x177e2a458c73e7e5ULL,0x00000000655ad3b3ULL,
+0xd06c91e1d2e59403ULL,0x00000000bc95ee59ULL,
+0x3545e2203c3b11a5ULL,0x0000000023ce456cULL,
+0x6416ebe87b12c237ULL,0x0000000070509a94ULL,
+0x99abd038185708cbULL,0x000000002580938cULL,
+0xbc626861bd66c3d8ULL,0x00000000ad269a13ULL,
+0x7775a321c6c81a84ULL,0x0000000065071519ULL,
+0xba642b6c9d7e5e69ULL,0x0000000045964394ULL,
+0x6953903da0299a32ULL,0x000000006ec22b80ULL,
+0x16a5aed86ac6c357ULL,0x000000003b9979deULL,
+0xc717625890822533ULL,0x00000000c150de38ULL,
+0xc21b65c1680c22b2ULL,0x00000000e273ae92ULL,
+0xa2d0b995e8b5dea8ULL,0x00000000cbc0e8c6ULL,
+0xc59a2963051ac196ULL,0x00000000d0da8dbaULL,
+0x0ec28a6de84b3905ULL,0x00000000d62035eeULL,
+0x74c0349b11d07984ULL,0x00000000a6135539ULL,
+0xb807eeaebc32017dULL,0x00000000dae61550ULL,
+0x27c28d5096ddbcb9ULL,0x00000000e45b612bULL,
+0x0114bcc22925ea11ULL,0x00000000281d74adULL,
+0x75a22e0bada4a07bULL,0x0000000000cc815bULL,
+0x60ab54364e1c8ae4ULL,0x00000000d5382051ULL,
+0xd6d9754a70aa3739ULL,0x00000000d901752aULL,
+0x0c5ad1983cc910c7ULL,0x000000002cd12411ULL,
+0x3137db193094767bULL,0x00000000c4aed298ULL,
+0x96c81e20852cb72aULL,0x000000008cb5b853ULL,
+0xead5dc0945be0e9dULL,0x0000000046ee40deULL,
+0x7c08a4356b032781ULL,0x000000008587a690ULL,
+0x9d415c3925a53ccbULL,0x000000003d199364ULL,
+0x2779b1de6c4e2d48ULL,0x000000006e859635ULL,
+0x7b7b9a179b950135ULL,0x00000000d955851cULL,
+0x8eee40c61c641688ULL,0x00000000639a14bbULL,
+0xa7623690b69bb742ULL,0x00000000273dda26ULL,
+0x174c1382d6e0e67aULL,0x00000000b9679246ULL,
+0xcd4d1cc78ba17133ULL,0x00000000eeba3d77ULL,
+0x5c510363d1c14176ULL,0x000000006722e7b4ULL,
+0x88dd542bb8a2c646ULL,0x00000000899b2749ULL,
+0x4c54b88074147ea2ULL,0x000000007a328ca8ULL,
+0xa64b7408bb1a7188ULL,0x00000000b3d05730ULL,
+0x37ba832085310ebdULL,0x0000000048950514ULL,
+0x453203b5d0ebdb99ULL,0x000000006784d442ULL,
+0x1ead9d854ad403cbULL,0x0000000013e588cdULL,
+0xd9e4e2a230043394ULL,0x000000000cbaca7eULL,
+0x348dcbcbba520128ULL,0x00000000357ea189ULL,
+0x14bae4c076e429c9ULL,0x00000000c298cd08ULL,
+0x53b365a68e576a0dULL,0x000000007e9a220aULL,
+0x2445e7b4535eacb5ULL,0x00000000dc38881cULL,
+0x5ed19aee3c4ca300ULL,0x00000000972ca157ULL,
+0x77cab7082aedb7c9ULL,0x00000000103ad5e4ULL,
+0x616da7837c090b66ULL,0x000000002d1d3e77ULL,
+0x4871d2cccb10c3d0ULL,0x00000000b5e1985cULL,
+0x21711368b1cb273bULL,0x00000000c9c8695cULL,
+0x37000eda401a62ddULL,0x000000000816c720ULL,
+0x8ce7ba024165c552ULL,0x000000002694d5b7ULL,
+0x3e713b8919c808daULL,0x00000000a2e3bea5ULL,
+0xa9654a458c5801b0ULL,0x000000008963aa19ULL,
+0x8e43114565ebcb40ULL,0x00000000d89b2107ULL,
+0x32968929b050943bULL,0x0000000038c867b2ULL,
+0xea97419839800c21ULL,0x0000000044591c4cULL,
+0xc0ce6611ea5576edULL,0x0000000080c89d60ULL,
+0x158d1ae126ec75c0ULL,0x00000000b3004075ULL,
+0x72b62544b4da9cd4ULL,0x000000006542eb18ULL,
+0xb0ce874d14241d5eULL,0x00000000a46be2b4ULL,
+0x698137d85a34b317ULL,0x00000000d8d558abULL,
+0x3503bd5ba98796e1ULL,0x00000000705e708cULL,
+0x63ee71cc70062d2aULL,0x00000000e001c21cULL,
+0x5d14c7267ed93cc5ULL,0x000000001e4ca385ULL,
+0x521071486279a033ULL,0x000000000ba54c76ULL,
+0x9ddeec32a41359ddULL,0x0000000065b97196ULL,
+0x4eddc1d528810de9ULL,0x00000000407031b6ULL,
+0xba3d0d29496ea2e0ULL,0x0000000080d530e1ULL,
+0x2e89c9bcb435e1dbULL,0x00000000d0e20418ULL,
+0xd3109ea6337e5942ULL,0x00000000892e5b24ULL,
+0x7e380668a70a1e10ULL,0x00000000dd9dabdeULL,
+0x37e2a0bbec73e73bULL,0x00000000a3a9b4abULL,
+0xb850521883d7167dULL,0x000000006c94a07aULL,
+0x621a310a8bbe7b77ULL,0x000000005d3edc17ULL,
+0x65a2167b877e3519ULL,0x00000000aa176708ULL,
+0x86dc4e9c17480563ULL,0x000000003eba13b3ULL,
+0xd55094555562ec3aULL,0x0000000054cc5c0aULL,
+0x0b2db5cd8366c250ULL,0x00000000c35d0989ULL,
+0x1297291d14ce82e6ULL,0x00000000b584bd9bULL,
+0xa6ee3cbc09c6d80cULL,0x00000000b3d39427ULL,
+0x854331dae4a8d4a9ULL,0x00000000b8d1ee27ULL,
+0x6b8cb09168e99341ULL,0x00000000b705e03dULL,
+0x0e38574ea0d89d8bULL,0x00000000866cd821ULL,
+0x1041dc3e1d4ac400ULL,0x00000000504b7a6aULL,
+0xb7753d6094bb1ddaULL,0x000000008ad43cc6ULL,
+0xbec70836615daa87ULL,0x00000000647e667dULL,
+0x8d502710d0a1481dULL,0x00000000e3d4eb42ULL,
+0x0eab4646e804acaeULL,0x00000000c83ab03aULL,
+0x5a333a9da0aae28eULL,0x00000000b973c9e4ULL,
+0xb2234de92e022310ULL,0x000000007c1bd85aULL,
+0x863db682a1d8d445ULL,0x000000005ed00c7dULL,
+0xaaec17d6a3614d1aULL,0x000000005482bd8bULL,
+0xc22c2a5490eb839cULL,0x0000000043d15ba4ULL,
+0x20adc9495329174aULL,0x00000000b9865769ULL,
+0xc5a971a3b42ce1aaULL,0x00000000eab723edULL,
+0x7aa25386e20d4189ULL,0x0000000087cbc67eULL,
+0xe68802e40adb64a1ULL,0x00000000c98ab831ULL,
+0x314c482ac123cc44ULL,0x0000000074646b55ULL,
+0x61373d070c5aec89ULL,0x00000000bea2b7edULL,
+0x5d6bdc20e7329d91ULL,0x00000000243baa06ULL,
+0x9999cb9061bd9daaULL,0x000000000c7d651cULL,
+0x8e0b0a7c0acd5975ULL,0x00000000b507b958ULL,
+0xd026dc2b82005130ULL,0x00000000461369a4ULL,
+0xb0e78d6ab45b399cULL,0x00000000e05d9691ULL,
+0x6a81200d320464b2ULL,0x000000008eba1874ULL,
+0x93e333a927896262ULL,0x000000007d456eeaULL,
+0x70681d7073620a04ULL,0x0000000063ab6890ULL,
+0x86da5b3219029516ULL,0x0000000001061e75ULL,
+0x10b5ee3dcecd2181ULL,0x000000001b252e56ULL,
+0xc3bd485bb4c7eec2ULL,0x00000000482580a5ULL,
+0x8254ebca0ceec164ULL,0x00000000e74be03eULL,
+0xa7e8e7b5697d5a55ULL,0x000000006794b349ULL,
+0xe6c6467d4d618145ULL,0x000000009da53502ULL,
+0x64728b1508de37c8ULL,0x00000000db9be846ULL,
+0x0c9476d9a2cc85b7ULL,0x00000000435d1c10ULL,
+0x0e6c774301079a08ULL,0x00000000b986a72bULL,
+0x194562724e2789a9ULL,0x0000000096257a3cULL,
+0x1b07b443694e827eULL,0x000000008081011dULL,
+0xd22527b855a18da5ULL,0x0000000084d19477ULL,
+0x55b56b604001bd4cULL,0x0000000040c4e924ULL,
+0xe0ce06d56b0e6008ULL,0x00000000daed9553ULL,
+0x0975da20785c3e24ULL,0x00000000b72e08d8ULL,
+0x40a47a2e5e5c8965ULL,0x000000002e23ce03ULL,
+0xc207cee089d48e28ULL,0x000000004c4a1239ULL,
+0x32843a33668d66b6ULL,0x000000000b0e98b5ULL,
+0x767130b95e44e5e3ULL,0x000000008d6618bdULL,
+0x7dc40ec7ce2437d3ULL,0x00000000ab3b5ec8ULL,
+0x082a5312528ba1b6ULL,0x0000000070a47529ULL,
+0x41189ab3e0ae400bULL,0x00000000ce282102ULL,
+0x03b6a8d6308db90eULL,0x0000000045ec38a5ULL,
+0x3e892d421dcc8777ULL,0x000000001509de98ULL,
+0x50920d21a6e8226bULL,0x00000000de23eaa0ULL,
+0x068ca0303d10ea11ULL,0x0000000010c98772ULL,
+0x8a80b5a89d9915d9ULL,0x00000000e6bcd60eULL,
+0x4453bd379aa56175ULL,0x000000008c347a4cULL,
+0x1d2b6e36cd829256ULL,0x00000000c760a568ULL,
+0x6110067304c5b82bULL,0x000000002c6debe0ULL,
+0x10579ba434c52a81ULL,0x000000009e439308ULL,
+0x4e9681c406eb33d0ULL,0x00000000e1aad534ULL,
+0x0ae15de799e2397eULL,0x00000000076d870aULL,
+0xc08ea575a4ea899dULL,0x000000006571c576ULL,
+0xdd62261ec9ddd280ULL,0x000000004a98b93dULL,
+0x613b2a1468754d37ULL,0x0000000038d0cd50ULL,
+0xaae5dcc232337647ULL,0x00000000585a5359ULL,
+0x712444940bd493abULL,0x000000008d22a838ULL,
+0x6bd511c930b7a783ULL,0x00000000345902ddULL,
+0xe09de9b21d44c2a1ULL,0x000000003179b162ULL,
+0xab801a85d3c76dd7ULL,0x00000000ec3d1ae5ULL,
+0xce37c4eb1abe2613ULL,0x00000000252252ccULL,
+0x8a6a4355585d9a2dULL,0x000000002e55c8d5ULL,
+0x63ca3ea080a140e1ULL,0x000000000c4c51caULL,
+0xa9299d4e3c9301cbULL,0x00000000cd2eb506ULL,
+0x724b9bdbe1351613ULL,0x00000000ea4eda78ULL,
+0x6d4baa30b8525e0dULL,0x0000000054b41d82ULL,
+0xb280c60b727a5dbdULL,0x00000000a11b7eebULL,
+0x9e9bbebbd8b55b2aULL,0x00000000b3692ee7ULL,
+0xde3e9ea3beb41c74ULL,0x00000000d8b59653ULL,
+0x03a9ae9c6a6bbc1bULL,0x00000000a3c621b3ULL,
+0xd04bc568042baad4ULL,0x000000009ccd291cULL,
+0x0ae6667ed7250125ULL,0x0000000038b9a36aULL,
+0x5ddcbbd7be09c61eULL,0x000000004486461dULL,
+0x51328ed6e089c347ULL,0x00000000333cbcdcULL,
+0xed265261e89eb946ULL,0x00000000a3662448ULL,
+0x79bbcd1510a133edULL,0x00000000b775bbd7ULL,
+0xbb50740cbeb23b53ULL,0x0000000087434ce0ULL,
+0x5b30b90c9bbecc99ULL,0x000000006d0e3ab3ULL,
+0x979e81a55973d1e7ULL,0x000000003bab313aULL,
+0x870b9ad989236d86ULL,0x00000000e8622ce6ULL,
+0x9d74dbe90e832731ULL,0x0000000075cc45cbULL,
+0x562cbae8d5e115c6ULL,0x0000000095ba5cd2ULL,
+0x6632613e392aeddbULL,0x0000000087062a83ULL,
+0x48083a9a771642caULL,0x000000001db79accULL,
+0xe92415183a62e181ULL,0x0000000033c60c6aULL,
+0x3be96075e4c71a66ULL,0x000000007c25e873ULL,
+0x943db07114573930ULL,0x000000000b9ea306ULL,
+0xca6706e29e473677ULL,0x00000000490673d0ULL,
+0xb7800c0aa1d2140dULL,0x000000004b7d3cc5ULL,
+0x2dcc161979534e7aULL,0x000000005243e356ULL,
+0x78d750dda604ed7bULL,0x0000000088c3c835ULL,
+0xc0d9a8608965238aULL,0x00000000c710804aULL,
+0x4ddc96947d93ccdaULL,0x000000001457e6e1ULL,
+0x5ca4214ccb3ac9e2ULL,0x0000000016ccb038ULL,
+0xbe04ea68c6a1b374ULL,0x00000000199de1ddULL,
+0x9d5d5b4d7474d51cULL,0x0000000008a9bd61ULL,
+0x02871c85b7bc47e6ULL,0x00000000b9d7dae5ULL,
+0x9ae03a333a088732ULL,0x00000000070e50b3ULL,
+0xd56390374c159a20ULL,0x000000002a199b2eULL,
+0xeca0a9b75d23302dULL,0x00000000465168cdULL,
+0xb887b7e81d650caeULL,0x00000000eac28e0eULL,
+0xeaac44ca77acb13eULL,0x0000000084a9a06cULL,
+0xb0bab0aeb8ad4bd3ULL,0x00000000dd6e21d3ULL,
+0x154d1397629c79eeULL,0x0000000051c4bd3cULL,
+0x1108d9317e1dbe04ULL,0x00000000d6a3dc66ULL,
+0x2dad2e99b5796824ULL,0x000000000242d193ULL,
+0x34022b9b8dc0e51cULL,0x0000000072dc6368ULL,
+0x1890a78c99c2a554ULL,0x00000000341b4c36ULL,
+0x784a0d6cace85639ULL,0x0000000062d0ba64ULL,
+0x780ac81961c593c3ULL,0x000000007ba3b921ULL,
+0x61a53d3511eb5571ULL,0x00000000c007bc47ULL,
+0x9029288a6738eb93ULL,0x00000000e4920d51ULL,
+0x64a19c8e525b0712ULL,0x00000000c8a60021ULL,
+0x4162b3468d0125ebULL,0x0000000058dabd97ULL,
+0x372864e8c3283cc0ULL,0x00000000433dc0bbULL,
+0xa8a27eab4a373ca4ULL,0x000000000b389611ULL,
+0x09cc30e7260bdd6bULL,0x000000002bb7e48aULL,
+0xb353b63e9e183a3eULL,0x0000000073a50e0bULL,
+0x09dbe87349025a57ULL,0x0000000082029e06ULL,
+0x30ae58c6e27e9e7cULL,0x00000000a31314eaULL,
+0xc5708c61e47a8d7cULL,0x000000001872d6bcULL,
+0xbec34907b76328e6ULL,0x000000001a8b27c6ULL,
+0xade116200c9edc79ULL,0x00000000421e12b7ULL,
+0xbe779140a1731a91ULL,0x00000000265a73a2ULL,
+0x4c8beb25e7b8c7a5ULL,0x00000000d3db3c25ULL,
+0x1616220899418114ULL,0x000000002164a0d8ULL,
+0x71c616e61680497dULL,0x00000000c02e02ecULL,
+0x8d578330a5344357ULL,0x00000000a513ba07ULL,
+0x4cc4326733108741ULL,0x00000000b1b142d3ULL,
+0xb7007dd611d1cdd3ULL,0x0000000047239223ULL,
+0x92985a1e266b96ecULL,0x0000000017696462ULL,
+0x4714772cb7206cceULL,0x00000000998661a1ULL,
+0xaeca4027bea60ebeULL,0x0000000096864c22ULL,
+0xebb8c923d60bb533ULL,0x00000000d55c8941ULL,
+0xb433cb5e48db17baULL,0x000000007bed9857ULL,
+0xa99ea32d2ac6c72dULL,0x000000007152073cULL,
+0x1b296ad9279914e5ULL,0x000000005387d8c7ULL,
+0x66332a1857b5d503ULL,0x00000000e4693d39ULL,
+0xd2aa1a493bbdab33ULL,0x000000004c14eb92ULL,
+0x5bced913093ebba8ULL,0x00000000a4349281ULL,
+0x46d4d1de4d75b821ULL,0x00000000d3ed52a5ULL,
+0x94bc53bce700eae2ULL,0x000000002ab76205ULL,
+0x62e6ee84ac08b03dULL,0x0000000039b807daULL,
+0x58e5e61496412146ULL,0x00000000ea306385ULL,
+0xa62662b31d3cee52ULL,0x000000001a1db06aULL,
+0x3001a4d8850114dcULL,0x00000000c233a5d3ULL,
+0x7d798b4174b5a2b3ULL,0x00000000ba039ccdULL,
+0xd7a49222d5671d65ULL,0x00000000b2407b58ULL,
+0x894a6224262c7cbbULL,0x000000006287b89bULL,
+0x5679e63664b8ec24ULL,0x00000000490931c4ULL,
+0xd2edd0cdbc8ab5a4ULL,0x0000000006ca5e3eULL,
+0xbd62eb963e01a34aULL,0x0000000085a64858ULL,
+0xd54cd8984bd41383ULL,0x00000000a392110cULL,
+0xd2aa0cc4ce5a77c3ULL,0x00000000152ec753ULL,
+0x1ded835006177debULL,0x00000000c98a36c3ULL,
+0x0d6b9dad430d2b92ULL,0x0000000065810a94ULL,
+0x1426a62217d890c1ULL,0x00000000c2bd7162ULL,
+0xb3642a3a84150da5ULL,0x000000003d476ddbULL,
+0xa33342bd3482c8eaULL,0x00000000559b66c9ULL,
+0x93014cc41ab0d361ULL,0x0000000043edb3e7ULL,
+0xc9a179c9c2d95a69ULL,0x000000001563e1a4ULL,
+0x945cc1b0778d09ddULL,0x000000001537ce4cULL,
+0xd76180664639968cULL,0x000000009d6ae3b6ULL,
+0xda88700aa1e84815ULL,0x000000006c69b976ULL,
+0x9d855596e2644accULL,0x00000000926657ceULL,
+0xa68d7d95c5527a2dULL,0x00000000b6acb9bdULL,
+0x46a1e4720e8ea705ULL,0x0000000047614c62ULL,
+0x5980058059ab4805ULL,0x000000000d7498b5ULL,
+0x25319ce6d686c475ULL,0x0000000032431d7dULL,
+0xa058d2a3d2a896d2ULL,0x00000000cd0d2c61ULL,
+0x15b9a1b0675ca216ULL,0x000000007736aa0aULL,
+0x61ab8466d1a59dcbULL,0x00000000d41a3e78ULL,
+0x7e35c8968e298886ULL,0x00000000911b2350ULL,
+0x629010a584606c99ULL,0x00000000a15346b9ULL,
+0x102c92a629e46ab2ULL,0x0000000070463295ULL,
+0x4c1987ee47247046ULL,0x000000007b7926dbULL,
+0x356d6793ee7bdc24ULL,0x00000000656248caULL,
+0x51310da38b62abd7ULL,0x00000000e339b049ULL,
+0x75a15dd4c2a831b8ULL,0x00000000451c6ce2ULL,
+0xb4ae54a1ebbdc665ULL,0x0000000073bede31ULL,
+0xcccb54a44abba2d2ULL,0x000000003a757032ULL,
+0x740dd0a1ee3c2670ULL,0x000000004b9e57e0ULL,
+0xa7c7bd3a1735b559ULL,0x000000008977ad5dULL,
+0x4482c565a69ed4b2ULL,0x0000000006d75cd4ULL,
+0xed0a42528be6049dULL,0x00000000d77d6362ULL,
+0xd1c2a7629cc7b558ULL,0x00000000c3ddabc0ULL,
+0xeaeca25145834396ULL,0x00000000c20e830dULL,
+0x116d401b5707162cULL,0x00000000035a9b3aULL,
+0x012a72433c4d7c20ULL,0x000000003ad5e5acULL,
+0xa04ea7e5344da4d0ULL,0x0000000097031e67ULL,
+0xdc33e8496e7c8400ULL,0x00000000bce03475ULL,
+0xea3c0d277ed69db8ULL,0x000000003ca88408ULL,
+0xbd834e0829357e99ULL,0x000000002ab7716cULL,
+0x959b114a340c598eULL,0x0000000080d3b1ccULL,
+0x40256696c1c11464ULL,0x000000007c386056ULL,
+0x3e4e8be22762464aULL,0x00000000886a7e3eULL,
+0xd703ec1ccb509c65ULL,0x0000000024439017ULL,
+0x353a74b071e529d3ULL,0x00000000deca20cdULL,
+0x0cbad3033b012eeeULL,0x0000000050d112e2ULL,
+0x2983784a20a94d76ULL,0x00000000614e3b06ULL,
+0x61decbcba98ebae6ULL,0x00000000c569013aULL,
+0x161569c00c0e486cULL,0x00000000b4b33597ULL,
+0x5399827d07be572aULL,0x000000007eb3c0b3ULL,
+0xd7433b24076cd803ULL,0x0000000080485e11ULL,
+0x5e103d29a67186daULL,0x0000000004ed2741ULL,
+0xa31d5bbc79c5d08cULL,0x00000000eb799100ULL,
+0x4ee0bce2d05579e4ULL,0x000000004197180dULL,
+0x4d0c75416c48892eULL,0x0000000031a084acULL,
+0x55d15352152b1ee6ULL,0x0000000097856e4aULL,
+0x4685d326374ac107ULL,0x00000000a81d1bb7ULL,
+0xa6b989259b07c488ULL,0x000000004c136a7aULL,
+0xbe8e779a968a5124ULL,0x00000000b17a5644ULL,
+0x959a191412b40b62ULL,0x000000005bc68276ULL,
+0xc8ad111136279553ULL,0x000000002116e85dULL,
+0xc0e1443077011515ULL,0x000000009c330b45ULL,
+0x2bcd76cc94decbd7ULL,0x00000000c23ab288ULL,
+0xdc76bbea718b8ad6ULL,0x0000000048712662ULL,
+0xa15572c13757d91eULL,0x000000003aa0e426ULL,
+0x181655c354ada8ddULL,0x000000005a87a570ULL,
+0x21cd2659aab147d7ULL,0x00000000c24dd9d0ULL,
+0x02c235e0954e8d15ULL,0x000000004ae0257dULL,
+0x33782456178b0832ULL,0x0000000086ddad67ULL,
+0x5e07584131e9bcb0ULL,0x0000000022d5d20eULL,
+0xadde5b67d6a2073cULL,0x00000000523cba81ULL,
+0xc708b4c7c6679963ULL,0x000000005be71b31ULL,
+0x46995d370a875687ULL,0x000000001bc63b48ULL,
+0x1584a215846a0249ULL,0x00000000834c90e9ULL,
+0xa10c95a21eb800baULL,0x00000000558dae33ULL,
+0x3605209880e8cc96ULL,0x00000000dd78bdd8ULL,
+0x20c1eb4b5342e111ULL,0x00000000450b53a5ULL,
+0x0a40a1cc6036ab5bULL,0x0000000039b2c818ULL,
+0x3c4bb57891463e2eULL,0x0000000020084352ULL,
+0x36e4bdbb2e175a60ULL,0x00000000eaa483bdULL,
+0xc60789ce2c8b21b4ULL,0x00000000b1c1c328ULL,
+0xebb7480e16928303ULL,0x0000000070e71d94ULL,
+0x9e1d48d4966212acULL,0x0000000083ec43d5ULL,
+0x7c646bdec2ea1339ULL,0x0000000008784ca6ULL,
+0x71026d6a1841e9c0ULL,0x00000000dc74bb24ULL,
+0x157e08e6c5140c80ULL,0x000000009a775342ULL,
+0xcc284ebe53121c7eULL,0x00000000d71b40b9ULL,
+0x5d38d0a63925e01bULL,0x00000000ea8dc8ecULL,
+0x3d5906273a83d3d5ULL,0x00000000422ed32bULL,
+0x842a359edc479632ULL,0x00000000caaeb007ULL,
+0x36c89429b15d4803ULL,0x000000007c524920ULL,
+0xc7e84c5eb10c07daULL,0x0000000020a40b50ULL,
+0x1100869d4b2dd436ULL,0x00000000cb498d62ULL,
+0x34a96c745744e6a4ULL,0x00000000326961c7ULL,
+0xd455300eec9723b0ULL,0x000000008edd9468ULL,
+0xaaa8d728249cd207ULL,0x000000000aeb672dULL,
+0xae9e534a751e3148ULL,0x000000001b951882ULL,
+0xea6112873aba6099ULL,0x00000000ec751a14ULL,
+0xb479a106c856637dULL,0x0000000039e2caa8ULL,
+0xe351a89bc8197addULL,0x00000000549d3037ULL,
+0xdc0d692bc7b23506ULL,0x00000000c81070b5ULL,
+0xe6895654eed28a48ULL,0x000000009e989084ULL,
+0xcd096d16364173b8ULL,0x00000000ac4cc301ULL,
+0x3563ab461c226803ULL,0x00000000025128e3ULL,
+0x228c342133d49755ULL,0x00000000cc92c730ULL,
+0x7a35e724547a1ae6ULL,0x000000006364832aULL,
+0xa55c998d43952ad7ULL,0x00000000d60d0b3cULL,
+0x18dc3a3658d9b41cULL,0x00000000b61cae99ULL,
+0x4eae56c20430907cULL,0x00000000137272bcULL,
+0x73446e588cb0cdc1ULL,0x00000000e83672c1ULL,
+0xe33919bad42a000dULL,0x000000000b9dad5bULL,
+0x6a99e8328b9b886cULL,0x000000009cea854bULL,
+0x91c734860833536aULL,0x00000000de798bccULL,
+0xc278d8ce70b9bbe5ULL,0x00000000078e78ceULL,
+0xd330986249ab82e4ULL,0x00000000e5a4cb61ULL,
+0x4ae67cc326b5c449ULL,0x00000000345a7c93ULL,
+0x834c88622d3d5830ULL,0x00000000a4d3e95cULL,
+0x4e0a86d0e42ea6abULL,0x000000001ed1870cULL,
+0x8ab9516610bcadb9ULL,0x00000000420ab1b3ULL,
+0xda718cee3976c4b6ULL,0x0000000030473ceaULL,
+0x9656cdbb023b3ac4ULL,0x000000001c3595b4ULL,
+0x9eda6b758e669b60ULL,0x0000000033dcb04bULL,
+0xa7588111ec116374ULL,0x000000007aba6769ULL,
+0xc17be07ae79a35d8ULL,0x0000000065cb7394ULL,
+0x188a2b9da271b4bdULL,0x000000002ea1dbb9ULL,
+0xb28348882bdb17e3ULL,0x000000008758ed1bULL,
+0x493a0210ddae7553ULL,0x000000003a5283a2ULL,
+0x566481800a533710ULL,0x00000000cacb48c0ULL,
+0x315b56885c444959ULL,0x0000000073917b70ULL,
+0xb3cea609b1e59172ULL,0x000000009b0ad897ULL,
+0x19564606bb45deeeULL,0x00000000b52906b5ULL,
+0xb2b5bddcd799590dULL,0x00000000236c9786ULL,
+0xadb4855bb58268acULL,0x0000000055137102ULL,
+0xb2688511bc166766ULL,0x00000000442a1358ULL,
+0xd8756de36017ea81ULL,0x00000000e3dae005ULL,
+0x211209b5bc217a94ULL,0x00000000472e16edULL,
+0x0a877d8ee3ec5872ULL,0x00000000043e8a95ULL,
+0x1242c75707ca4738ULL,0x00000000c2d12481ULL,
+0x841a23e837c6e54bULL,0x000000005b694706ULL,
+0x21ac976b8d6e4be4ULL,0x0000000062b2b522ULL,
+0x06c53e1388dae4e0ULL,0x0000000001d9859cULL,
+0x1952ddda85da0695ULL,0x0000000065297697ULL,
+0x8de079b1a65d1177ULL,0x000000003b782660ULL,
+0xeb95581a7b1e4a4bULL,0x00000000b3884516ULL,
+0xa41e424414b57b90ULL,0x000000003a1ac790ULL,
+0x475c3172c2abe215ULL,0x0000000034692a1cULL,
+0xaeb62b945ed8c964ULL,0x0000000021b8c818ULL,
+0x50cb8698eadd937eULL,0x00000000ea815c62ULL,
+0x93585adec5c03150ULL,0x00000000081d6ac4ULL,
+0xedae86e14e9d5424ULL,0x000000001e287a72ULL,
+0x146c84cc67885ce1ULL,0x000000005aadba6eULL,
+0xd415863b20d5ae22ULL,0x00000000b97ebb17ULL,
+0x6c018a79d88b243cULL,0x00000000d3008034ULL,
+0x1299ee3babcb757bULL,0x0000000034c1711aULL,
+0xab3e51150bd3eaabULL,0x00000000096ee8b3ULL,
+0xba2668e25c266767ULL,0x00000000512ca125ULL,
+0xa35e65b215ece6c4ULL,0x0000000084085a19ULL,
+0xcec5c29c6bdb3c27ULL,0x00000000cb3d4295ULL,
+0x24baed896b24bb2bULL,0x00000000611aee2eULL,
+0xb73917bccb4971e9ULL,0x00000000cadbbb26ULL,
+0x78b84aa512235403ULL,0x00000000a36a7d59ULL,
+0x9a07b25e9395c61aULL,0x000000005137ee0cULL,
+0xc0414ecd88b147b7ULL,0x00000000a5e3cb48ULL,
+0xba44cedbb5579b51ULL,0x00000000e01491aeULL,
+0x35a04c4a318867a6ULL,0x00000000043c16d6ULL,
+0xd059b34e47064381ULL,0x00000000c62632a4ULL,
+0x00d745013721c028ULL,0x000000007892080bULL,
+0xd2b5c94ec3eb269bULL,0x0000000078dcb3b0ULL,
+0xe9d270b9573a9733ULL,0x00000000b68beb0aULL,
+0x131d6596583078beULL,0x000000009b77d507ULL,
+0x2b1b21ae6a77217bULL,0x000000002d2294c6ULL,
+0xd74201aeb4bc4314ULL,0x0000000034bd913dULL,
+0xe7a49c0404c50013ULL,0x00000000e1cb6008ULL,
+0xae24b1cc782b88daULL,0x00000000b8309680ULL,
+0x991093ac093314ebULL,0x000000008b33a054ULL,
+0x1e3a411392405c43ULL,0x00000000d9acc76eULL,
+0x59403d1176a45a06ULL,0x0000000005699b67ULL,
+0x7119d8139e0b567bULL,0x00000000c2354424ULL,
+0x73499db9e4ecd236ULL,0x000000004d01c4c1ULL,
+0x17bed3b8ca45b050ULL,0x0000000024e9e99eULL,
+0x46bc459ca147a043ULL,0x00000000914ce5dbULL,
+0x794879626b168b9aULL,0x000000005c1ba818ULL,
+0xb12ad37d59c5b563ULL,0x0000000097a19329ULL,
+0xa96355d37b800345ULL,0x0000000072b4902aULL,
+0x799903e80189e3d1ULL,0x000000008ce049b0ULL,
+0xc11ed18567aec1d4ULL,0x000000004c531e8eULL,
+0xb54eb0519c6dca7bULL,0x00000000ea2716a0ULL,
+0xdd6a0e0c260e36e0ULL,0x000000000cebec6aULL,
+0x96707ac4c9bcb4d8ULL,0x00000000670cd7a8ULL,
+0x26425c12bd5e4406ULL,0x00000000052e4222ULL,
+0x9cb68741bb651052ULL,0x00000000794c2317ULL,
+0x19767653c5276a99ULL,0x0000000047cba146ULL,
+0x01c68b56534e8652ULL,0x00000000c97c7d47ULL,
+0x0ed49a1921157412ULL,0x00000000cb883b4dULL,
+0x5dd1d26b684ddb4bULL,0x00000000a18a6152ULL,
+0x5089499de06665abULL,0x00000000421ce9a9ULL,
+0x3b21e3dddd5891e7ULL,0x00000000ed0a96a4ULL,
+0xa2de1b4891a34bb2ULL,0x00000000469e3079ULL,
+0xb996c822586383c8ULL,0x000000009e88b819ULL,
+0xba73cc56234644e5ULL,0x0000000076b7cd57ULL,
+0x0e812ce32ceb6cbeULL,0x00000000743ec368ULL,
+0x04d499a4a7644899ULL,0x0000000046977e0aULL,
+0x3856b47409290d5aULL,0x000000004085ab13ULL,
+0x8ea4357dc4b42d93ULL,0x0000000069d92178ULL,
+0xd91b277e29100241ULL,0x00000000e2ad6c54ULL,
+0xe7176d9bb8940a82ULL,0x00000000a24a8909ULL,
+0x5d5ba1035488562bULL,0x0000000019739606ULL,
+0xe22a1504b936cb03ULL,0x00000000c85982e6ULL,
+0x9b03d072d502780eULL,0x000000007c3e9a2cULL,
+0xae53194550c6a160ULL,0x00000000d6721703ULL,
+0x16e5c9bb3405cd70ULL,0x000000005e39d21aULL,
+0xddda87c6cc5d8b07ULL,0x000000007278c5d8ULL,
+0x2d19538e6345520eULL,0x000000009b526962ULL,
+0x89c324e890521d60ULL,0x000000005c084eddULL,
+0x37e48212ba232e66ULL,0x00000000a44c6abbULL,
+0x772305b3d7bc496eULL,0x00000000158d8612ULL,
+0xe64cc80e2c6778c7ULL,0x00000000347c8721ULL,
+0x6ed3b293a45dd564ULL,0x0000000040c85d53ULL,
+0x2a209c10d145ea5bULL,0x0000000091e45245ULL,
+0xaa9c9e952d14ab20ULL,0x0000000084e0ba2bULL,
+0xb8231356bb0bc779ULL,0x000000004b11ea8aULL,
+0x9ad11ed78509307eULL,0x00000000ada56409ULL,
+0x30dbb3148becdd6bULL,0x00000000a306b0e5ULL,
+0x1094ec6a78ed8da2ULL,0x00000000294b0d08ULL,
+0x4e20a298795e55caULL,0x00000000b82da1e5ULL,
+0x61dc7b9657958150ULL,0x000000003b54027aULL,
+0x0da850e961264e2cULL,0x000000006eb686a9ULL,
+0x29056d5214508590ULL,0x000000008a2392cbULL,
+0xcc62415a999a3b42ULL,0x00000000dd26109cULL,
+0x61276ea387219253ULL,0x000000002890cc62ULL,
+0x36773272987b1d33ULL,0x000000003427dc83ULL,
+0xa9b86a00b1d5071bULL,0x00000000a9c59238ULL,
+0x2c62a7d456819770ULL,0x00000000db9535c7ULL,
+0x72c2e848324e7d5cULL,0x000000003a5398adULL,
+0x4419a22834d3c21dULL,0x0000000005a570ecULL,
+0x945cc3d435dc363aULL,0x00000000629cd883ULL,
+0x8a9a9ec39db8e631ULL,0x0000000077a5452eULL,
+0x2472b374c35750c9ULL,0x00000000a4277144ULL,
+0x214e01a989a18719ULL,0x000000009a9b7973ULL,
+0x7a415823e5a11c8aULL,0x000000002bd8b595ULL,
+0xb4e81a6a782a968eULL,0x00000000a87525c9ULL,
+0xa1e5540e66613015ULL,0x00000000107842b6ULL,
+0x03289eeeaeadee13ULL,0x0000000042e6193dULL,
+0x6943b76cd45aece8ULL,0x00000000ad253012ULL,
+0x7b2d268c6c71497cULL,0x00000000c0a6c2e0ULL,
+0x6a945930c2cc3239ULL,0x0000000039dee2eeULL,
+0x8624d5aeb2e7742eULL,0x000000008eb96d2eULL,
+0xd9475ecd880c63d7ULL,0x00000000761d121dULL,
+0x508d62e777516b11ULL,0x0000000098bd948eULL,
+0xb51c6a6e9dd68ae4ULL,0x0000000004a12103ULL,
+0xa34609870b4a9822ULL,0x00000000dc47a8ecULL,
+0xa03a59c50d33cb88ULL,0x0000000056086912ULL,
+0x5a864145d112c017ULL,0x000000007c7dccb9ULL,
+0xaee91601d6ca5ab6ULL,0x000000009177320bULL,
+0x62e637284318ac66ULL,0x00000000eec7ad29ULL,
+0x76c62ca6dc4eba3cULL,0x00000000734d3e37ULL,
+0xc07c3ec1a970de16ULL,0x00000000187254c2ULL,
+0x04da00e90da95cd1ULL,0x00000000cd830787ULL,
+0x0b5a65be4ac143ddULL,0x000000008e5615b0ULL,
+0xc7459139a9272cc7ULL,0x0000000048d663d4ULL,
+0x0ac665c0d0675176ULL,0x00000000863dc7d1ULL,
+0x164bd4b362561be7ULL,0x00000000cdb35975ULL,
+0x87dcea7605cade0eULL,0x00000000e93e4e38ULL,
+0xd25a0b8bb6e17be8ULL,0x00000000e71e5e90ULL,
+0x2208c0151d8ce799ULL,0x0000000068931c11ULL,
+0x3101620a1247cc79ULL,0x00000000d9d95d0aULL,
+0x4907a034a0ed4533ULL,0x00000000cc04587cULL,
+0x0439eb8450973b99ULL,0x00000000627ba3baULL,
+0x021da46aa77c807bULL,0x00000000e49ccc22ULL,
+0x01aa0a4343ec2e63ULL,0x0000000066903888ULL,
+0xc0b89acacba4b229ULL,0x000000007ed50dbdULL,
+0x57ec13bed729601eULL,0x00000000324e55e1ULL,
+0x971a9ad875583355ULL,0x000000008207de18ULL,
+0xc8a2a16b43803a21ULL,0x000000006c3e8c68ULL,
+0x88c3386c0530756bULL,0x0000000049b1e9c2ULL,
+0x0337688c58a88610ULL,0x00000000e3513e66ULL,
+0x25d372cc67d3584eULL,0x000000002d7b1ad4ULL,
+0xa3c8c036719eb63aULL,0x00000000cbb58343ULL,
+0x288dc25644877babULL,0x00000000e7aba47dULL,
+0x78eb5c244c2e02dcULL,0x0000000058322741ULL,
+0x4d73c209ec52e6c1ULL,0x0000000002ad538aULL,
+0xb7c5342424755c80ULL,0x0000000081a45ee2ULL,
+0xd7a1dccc1dc37831ULL,0x000000001584ba5dULL,
+0x006197bb14ec534dULL,0x00000000813ecc3eULL,
+0x5b6c5a2bea658a62ULL,0x000000007420ac69ULL,
+0xbc8a1c02b6a08e2bULL,0x00000000be31e809ULL,
+0x590ba27e80c0da97ULL,0x00000000aa6ba541ULL,
+0x918bc67e7895cdebULL,0x000000001ba76da6ULL,
+0x8d96e259607733abULL,0x00000000b4126d67ULL,
+0x51e18774821e6a8aULL,0x00000000a632b575ULL,
+0x492a9c6475e46b7dULL,0x000000009bd694c8ULL,
+0xaeca6dcd06a0d01eULL,0x000000008ed8e855ULL,
+0x2b3c4ba98cb28958ULL,0x0000000068552b87ULL,
+0xd9a384c7e3d2c57aULL,0x00000000e9d0695aULL,
+0x8839b4b562e40c96ULL,0x00000000e779ca68ULL,
+0xe34b1c2daa297906ULL,0x000000007b87b8a8ULL,
+0x00253389041091d9ULL,0x000000003c6e0a4aULL,
+0x46aae6d6b3e82eb6ULL,0x0000000070e861ceULL,
+0x0bbe4b38dc8de8d8ULL,0x00000000e98b603bULL,
+0x26cd40edd5a7b91dULL,0x000000008183dea9ULL,
+0x2564b0b8c1245868ULL,0x0000000034e99986ULL,
+0xb1169e7e60998237ULL,0x00000000507ba889ULL,
+0x01ba1b7318bea013ULL,0x0000000060b0e9daULL,
+0xd524321583cb3537ULL,0x0000000063151631ULL,
+0x00dc474112864ca7ULL,0x0000000063aa7244ULL,
+0x32e85ae9e6d07b15ULL,0x00000000031a8dabULL,
+0x7c3bae29164a28a2ULL,0x00000000370d6621ULL,
+0x9d97d472ec02e819ULL,0x000000008b00ac53ULL,
+0xa5989c734b522496ULL,0x0000000091044a74ULL,
+0x6bd89b0e72151862ULL,0x00000000eaa98837ULL,
+0x7d27704ae8bb9793ULL,0x00000000e3d7e103ULL,
+0x024eb3a351028d33ULL,0x00000000c31c016bULL,
+0xca07dd3e5bd0b28eULL,0x00000000d42886daULL,
+0xca2b09c187a84247ULL,0x0000000049489692ULL,
+0x0c6ae8a508976e67ULL,0x000000009dd8a3deULL,
+0x109164c7de90d3d2ULL,0x0000000036372171ULL,
+0x48dd0051c3408389ULL,0x000000000a0a4070ULL,
+0x19e4d16d39ccbb11ULL,0x00000000a6c4dd85ULL,
+0x97e6a377709cc94dULL,0x000000005c15824eULL,
+0x65b53d939833a9d6ULL,0x0000000089b19255ULL,
+0x32a0d2acc0b8c25aULL,0x00000000bd025194ULL,
+0xbae1e65d0be1b34cULL,0x00000000c5d50644ULL,
+0xeda30b83073a3a27ULL,0x00000000b487be4eULL,
+0x16e63472ee62bc66ULL,0x0000000018e52e61ULL,
+0xd1ecb58756999db0ULL,0x00000000be770600ULL,
+0xa568a20e9c73dbb9ULL,0x0000000086bee481ULL,
+0x65e70ad4771660bdULL,0x00000000be1962c0ULL,
+0xb3333857a5dd6b54ULL,0x0000000093b579ccULL,
+0x3524d69da62c1448ULL,0x0000000061ba3626ULL,
+0xd93d0bbe2baddea3ULL,0x000000006a404675ULL,
+0x3708e124bb68e05dULL,0x0000000079d02981ULL,
+0x82ce1d9ddb4672d8ULL,0x000000003d7134edULL,
+0x7904805972477e7cULL,0x000000004848c553ULL,
+0x7aadd176217a11a1ULL,0x00000000b9930075ULL,
+0x87c42da6c5c3827bULL,0x00000000b48c66a7ULL,
+0xd932b8b1e7ccb7c8ULL,0x000000008b565130ULL,
+0xa1629deeed6b337bULL,0x00000000c7370decULL,
+0xaca3733ae804917bULL,0x0000000000696a1cULL,
+0x0d665a6e7e25dc8aULL,0x000000000aa4271bULL,
+0xd661509e7ea070d4ULL,0x000000000531a6eeULL,
+0x72c496c95bd3ac0cULL,0x00000000874e828bULL,
+0x5c30e3e223d1c049ULL,0x00000000228d707dULL,
+0x7185472a51b96451ULL,0x00000000a7633361ULL,
+0x260411c345371151ULL,0x00000000eb20742eULL,
+0xc1904379803285d9ULL,0x00000000650089b0ULL,
+0xd9be014ed6cec8a7ULL,0x00000000ce41314cULL,
+0x4b9b8d5a298e74e7ULL,0x0000000025e2833cULL,
+0x3ed2768dc1a219a2ULL,0x00000000b4eb1c26ULL,
+0x4d706484be899e21ULL,0x000000002533686bULL,
+0x1e7915a4e46c2ddbULL,0x000000005a334812ULL,
+0x2339a3d4ad1423e3ULL,0x00000000bd4b2d18ULL,
+0x50d94e8eee0a5650ULL,0x00000000a38e89dcULL,
+0xa29ac24321de6c69ULL,0x00000000dc86492eULL,
+0xd0badc92740ed35aULL,0x0000000011c983acULL,
+0x2d2163ce06908956ULL,0x000000003d2e3372ULL,
+0x4e6c097b3a925de6ULL,0x0000000099ce99ddULL,
+0x0683ae5b2b848d05ULL,0x00000000c3784d5bULL,
+0x1cb079828047d48dULL,0x00000000e29c0d25ULL,
+0xb044bb6837237ae7ULL,0x00000000b1c8d63aULL,
+0xe6708e255c0a77aaULL,0x00000000d3b611beULL,
+0x34bdd94508365c04ULL,0x0000000091adce60ULL,
+0x3816ee13413755d9ULL,0x00000000ca8adc6dULL,
+0xb19423343d1dc3c7ULL,0x0000000036a542e5ULL,
+0x435d420a3e8630dcULL,0x00000000a1e2342cULL,
+0x215148a25e154e4dULL,0x000000006c56c2ddULL,
+0xc772e65817c1739aULL,0x000000003ed3de30ULL,
+0xe70d9c79c405a4d6ULL,0x00000000903841c6ULL,
+0x5eea86698876bbaeULL,0x00000000e41cd9a3ULL,
+0x6574ed79ccea0654ULL,0x00000000c75e974eULL,
+0x25ed8660338a7930ULL,0x00000000c02ec526ULL,
+0xe4853656b0987d44ULL,0x0000000061e7da36ULL,
+0x89897ebc36793d54ULL,0x00000000eaa68413ULL,
+0x1db2901009d73855ULL,0x000000003479de25ULL,
+0x78eb25ed35458a86ULL,0x00000000e505dd6cULL,
+0x6bce376cc0255d96ULL,0x00000000c8277654ULL,
+0x55ee8209665d5c14ULL,0x0000000048587e77ULL,
+0x29cae1593cd1e660ULL,0x00000000b453d03dULL,
+0x260a3ddc82bb6400ULL,0x00000000b6064a78ULL,
+0x0811e8d93819135dULL,0x00000000ad45e133ULL,
+0xa0c6c67b4084ac03ULL,0x00000000c017ce3aULL,
+0x7a687cc6290db61dULL,0x00000000475d473bULL,
+0x814a63045ae35c12ULL,0x0000000008b24a66ULL,
+0x0cbce53085200a03ULL,0x0000000019a8dc77ULL,
+0x524cac1b3277b19dULL,0x0000000089122399ULL,
+0x92113897e170cd6bULL,0x00000000d01edda7ULL,
+0x2cc50bce62e97579ULL,0x000000005c1cb89cULL,
+0x16107e776a578149ULL,0x00000000637558bbULL,
+0xdbe4232e4d62648aULL,0x0000000026c22be7ULL,
+0x017521b4e134523cULL,0x00000000e01139e7ULL,
+0xac2a805ad3768662ULL,0x00000000ab98abb6ULL,
+0x60ee659ea9673791ULL,0x0000000034038a73ULL,
+0xbe081ee83c89c776ULL,0x000000005e63713aULL,
+0xeca596b435306390ULL,0x0000000071372c11ULL,
+0xcd14b6de0bd394d4ULL,0x00000000a064a6e0ULL,
+0x92bd58245acced3dULL,0x00000000dec4a081ULL,
+0xbd22877e55de4d87ULL,0x0000000039c93e91ULL,
+0xb8371c42a9bb9852ULL,0x0000000007d83d5bULL,
+0x124b5a14cdee9054ULL,0x000000003e363d10ULL,
+0xa128cd6c150444d3ULL,0x0000000013319257ULL,
+0x106c3c4847bcd501ULL,0x00000000db622c68ULL,
+0xb179ebac2d156437ULL,0x00000000b440aca0ULL,
+0x41ad3e485be13906ULL,0x00000000b50970acULL,
+0xbc3dc2258785b6adULL,0x0000000032a9bd68ULL,
+0x8967b18bbe29c12eULL,0x0000000005e4da92ULL,
+0x64a29de9ecc50347ULL,0x000000001ad03756ULL,
+0xb1280573b179e129ULL,0x000000006108ebeaULL,
+0xa74eb4a5a30023d4ULL,0x00000000ed6c485bULL,
+0xe42eee2b372bec36ULL,0x00000000961888beULL,
+0x273097727171622dULL,0x00000000aeedd095ULL,
+0x47d3a3cb9ccb7512ULL,0x00000000997d2e21ULL,
+0x20dcadda513eca24ULL,0x000000001c58a004ULL,
+0x05c0474170262681ULL,0x000000004d0d07b0ULL,
+0x6d0250bbb2a406a4ULL,0x00000000d00649c8ULL,
+0xb88a5e511be97c9aULL,0x00000000cec746e5ULL,
+0xa6d22028eb892053ULL,0x000000004c62e272ULL,
+0x364c6da29e129716ULL,0x0000000040d0ae12ULL,
+0x83b6a3b54d6b236bULL,0x00000000c7a190ccULL,
+0x8d1a6082598caa9eULL,0x00000000143dc4a1ULL,
+0x2113e708cd4aae13ULL,0x0000000050e06867ULL,
+0xd2b3b2d16141aa5aULL,0x00000000bb557db8ULL,
+0x2927d29e8697046dULL,0x00000000176e5599ULL,
+0xaed87d28ce3e1a44ULL,0x00000000a29cdaa1ULL,
+0x8ca8990cca350a48ULL,0x000000002ec555c3ULL,
+0xd528d74a1636c299ULL,0x00000000bd25b4c8ULL,
+0x3756e0e990bd3208ULL,0x00000000a7dc8d4aULL,
+0x279e1e64b1858cb0ULL,0x00000000bdda59c9ULL,
+0x77b02c4942bb1521ULL,0x0000000038920174ULL,
+0x3464d75e43aa0d86ULL,0x00000000a73ded6aULL,
+0x4b58a291ed78aab2ULL,0x0000000012e9576cULL,
+0xe91814b55bd1ad18ULL,0x0000000090228185ULL,
+0xea0b2740c4048436ULL,0x00000000a9769348ULL,
+0x6e57d639c19dc745ULL,0x000000006a436129ULL,
+0x044a387e661c1126ULL,0x00000000db9a2719ULL,
+0xc1ba908c72945727ULL,0x0000000032518bc7ULL,
+0xb2926010396b950dULL,0x00000000c23b329aULL,
+0x159212151695d0a5ULL,0x00000000d1bd7d49ULL,
+0xe216237915241c73ULL,0x000000001108e365ULL,
+0x0411272ad86142a3ULL,0x00000000636b31d0ULL,
+0xb9eb72e575acb6e3ULL,0x00000000006407bcULL,
+0x53de0b80341b2120ULL,0x000000003bbc4c97ULL,
+0x398abab4cb5eb1dcULL,0x000000004bd6b114ULL,
+0xa3e2a48d9dac3156ULL,0x00000000a719321dULL,
+0x32378da05537db20ULL,0x00000000e7d2c4a5ULL,
+0x37ec793651de29d5ULL,0x00000000188a4cb6ULL,
+0x16d3863673e6277eULL,0x00000000d4032b5dULL,
+0x5087ab22859ed455ULL,0x00000000e50c7583ULL,
+0xb682326b2a62eb43ULL,0x00000000b2a03460ULL,
+0xc0888319bdd1983dULL,0x000000006c3316a4ULL,
+0xb66b998b2e24b6a7ULL,0x00000000da643d7eULL,
+0x1535a561946625a1ULL,0x00000000763cc1d4ULL,
+0x68ce4722c629aa34ULL,0x00000000c21c6aceULL,
+0x2ad967ec4307587aULL,0x00000000e73184e2ULL,
+0x6dddc529ae70c0d4ULL,0x00000000532aa80eULL,
+0x02eb66213c356010ULL,0x000000001045d397ULL,
+0x807ab75238b89b90ULL,0x00000000e7056b27ULL,
+0xe9037b43eab0e748ULL,0x000000001591e3dbULL,
+0x860e49912d28b696ULL,0x00000000789be1e3ULL,
+0x40ba2adc3b034401ULL,0x00000000731ce32cULL,
+0x2b552c566e12d5e2ULL,0x00000000946b8614ULL,
+0x03069be2d70e0958ULL,0x000000000dbb9b30ULL,
+0xbbe6d786dc3ae3eeULL,0x000000006803d774ULL,
+0xc1cba12cccbb9750ULL,0x00000000a2c81e9aULL,
+0x463936859cb99a57ULL,0x0000000078a4b118ULL,
+0x6d61e67862b13195ULL,0x00000000383a2334ULL,
+0x24b310541d645460ULL,0x0000000087a6ec67ULL,
+0xcd78d3b6ce7daa1cULL,0x000000004e26450dULL,
+0xdeb5a61a56643aa7ULL,0x000000009ec1628aULL,
+0x5572b1065854647bULL,0x0000000056dbeee8ULL,
+0x78da0d415cddbd9dULL,0x0000000066bc6394ULL,
+0x4ad385286bd659c8ULL,0x00000000261714b2ULL,
+0x264967e4b62571beULL,0x00000000e7c4ba90ULL,
+0x9423cb8942112092ULL,0x00000000d18b93acULL,
+0xa69dbd86c39984d5ULL,0x0000000005e0eb62ULL,
+0x05ba90a05a7457d8ULL,0x000000008cac6ae6ULL,
+0x974b24ded8d1d3ecULL,0x00000000b0be0169ULL,
+0x8b13db4c05ec7618ULL,0x000000002eb40688ULL,
+0xa3953d60271739c6ULL,0x00000000b5b528bcULL,
+0x2e235e16156c8ea1ULL,0x00000000c6162044ULL,
+0x26780e2ebebb6342ULL,0x00000000a254a464ULL,
+0x6e727e977be398c1ULL,0x00000000c32c1753ULL,
+0x46854c01a69657eaULL,0x000000001a9d0494ULL,
+0x9c9b67b3eaab7e5eULL,0x00000000743e59e6ULL,
+0x49e72785d4121119ULL,0x0000000069a674b9ULL,
+0x1b2009b0b5a566c2ULL,0x0000000090ebbe35ULL,
+0xb132489ad41ae150ULL,0x000000005814ac24ULL,
+0x722e289a9e542a93ULL,0x000000003a5e9554ULL,
+0x0865ee599685192eULL,0x00000000d47648e3ULL,
+0x941b2539b7a77d2dULL,0x000000007daba237ULL,
+0x91720133a72b84eeULL,0x00000000b6d1640dULL,
+0x053428b93853174bULL,0x00000000d3016677ULL,
+0xc981d710a6453a10ULL,0x000000008e1c8038ULL,
+0x727bab1d20c2b5e8ULL,0x00000000e93ee619ULL,
+0x866459baba3b91eeULL,0x00000000d0e96ec0ULL,
+0xda9dcea65261aed4ULL,0x000000005bad3915ULL,
+0x1b057217d6d8a4d7ULL,0x00000000d2b0c875ULL,
+0x87c1ce736be23e98ULL,0x00000000b35d983cULL,
+0x45ddb24eae78a135ULL,0x00000000398bc5d3ULL,
+0x7624815389456ee6ULL,0x000000006849c507ULL,
+0x5b34c3b50ee9287aULL,0x00000000e766d2ddULL,
+0x9b0690b35d97479dULL,0x00000000e05d8d54ULL,
+0xd147d1ed3105cc26ULL,0x00000000292ee04aULL,
+0x9520dda5b2787824ULL,0x00000000ea505659ULL,
+0xdb4874220e90d276ULL,0x000000005e80a146ULL,
+0x99540dd925325b90ULL,0x000000004128e8b1ULL,
+0xba8ad11175716088ULL,0x000000005a7bb8d7ULL,
+0x5b2235ed1101de27ULL,0x00000000260c45c2ULL,
+0x2921810a9a86a645ULL,0x000000006e7dbb31ULL,
+0x12a23d02b6498427ULL,0x0000000008ebe82eULL,
+0x36c3994242da3b15ULL,0x0000000096a104b3ULL,
+0x11eacc454bc586a9ULL,0x000000004581a6c0ULL,
+0x10bcc840c072ec54ULL,0x00000000e2c8c8d7ULL,
+0x035a12ebac9b6b92ULL,0x00000000143db935ULL,
+0xd82c672718c4b3bbULL,0x00000000a6eb83d6ULL,
+0x14729844010be523ULL,0x000000000c85e256ULL,
+0x465550ec8d748610ULL,0x000000001cd5ec20ULL,
+0x6086cdaca0605ae0ULL,0x00000000a65bd5c1ULL,
+0x424887491ac5921dULL,0x000000005b953852ULL,
+0x4c40ccec6b421bc7ULL,0x0000000054688728ULL,
+0xe5d7a4a75d2b6612ULL,0x00000000b83a510dULL,
+0x61cb26a900da4a09ULL,0x00000000b3423122ULL,
+0x403392c47e581aadULL,0x0000000090791aabULL,
+0x5c1933e8e458723cULL,0x0000000038612a42ULL,
+0x370ae457e550aab2ULL,0x0000000094e79893ULL,
+0x999b811db883d658ULL,0x0000000073ade87dULL,
+0x95b57dba3e1c992dULL,0x000000000c2608edULL,
+0x5593488660963260ULL,0x00000000ac38e7b2ULL,
+0x8068aa62bd36ed89ULL,0x0000000053b0839cULL,
+0x19b2313e3d922bacULL,0x00000000ebc0ed66ULL,
+0x22d3b7847d96b3c5ULL,0x0000000053573eaeULL,
+0x85a0a6c90b16bd83ULL,0x000000005c3a4bd9ULL,
+0x98c487c152a37aa9ULL,0x00000000d9bd30ecULL,
+0x1cb14a94d130087cULL,0x000000005dc8b8adULL,
+0x5b7120105a6114edULL,0x000000004303b92eULL,
+0x3111763e57a41894ULL,0x000000008b5e540cULL,
+0xeae702bcb95e41d5ULL,0x00000000d9223220ULL,
+0x41ac5dcc71e364b2ULL,0x0000000038c542edULL,
+0xe43b56b1db4cb005ULL,0x000000006bd994e2ULL,
+0x617be128eebd187aULL,0x00000000e929613eULL,
+0x1b671bcb9b63075bULL,0x0000000024e6aa89ULL,
+0x8b5e0587e9be3a44ULL,0x00000000c1d60661ULL,
+0xb6c686b6d950ee10ULL,0x00000000b16db94aULL,
+0x96ea816a1282273aULL,0x000000003b09ebc6ULL,
+0xc45013dba29d57e3ULL,0x000000008118b658ULL,
+0x5ab91540d1bcc10aULL,0x00000000cd847e17ULL,
+0x80792b1709995bd0ULL,0x0000000032b087a9ULL,
+0xd42d578dd003933dULL,0x000000006d7058deULL,
+0x5706059b0ba80385ULL,0x000000000ca8da3bULL,
+0x76961c0311aaba88ULL,0x000000003818db24ULL,
+0x85e4a48c1711a45aULL,0x00000000d982de20ULL,
+0xbeeb05801d24bb7eULL,0x00000000eeb5a141ULL,
+0x17a816b8b93c71e9ULL,0x00000000414c5bd6ULL,
+0xe6eabcb36a58bca5ULL,0x00000000d775a8e0ULL,
+0x3b0074e909a70e48ULL,0x000000004d0b3589ULL,
+0x5076a63ada0120a1ULL,0x00000000b1d34417ULL,
+0xb8aa4e6928c31301ULL,0x0000000076617329ULL,
+0x87ba544a76ee9c55ULL,0x000000004592e5d4ULL,
+0x86e08e62e0b0318aULL,0x00000000e283b6a2ULL,
+0x82502db69117e7e7ULL,0x00000000e0859ad3ULL,
+0x83a8bab28c6833caULL,0x0000000013156a7cULL,
+0x66622d314c36d228ULL,0x000000000290c603ULL,
+0xd5cb3d5ea563ce86ULL,0x00000000ccbd8e89ULL,
+0x43a59c169a2b468bULL,0x0000000050cb20d3ULL,
+0x343706a794078e7bULL,0x0000000031c9d69aULL,
+0xe144debb79267948ULL,0x0000000020b0951cULL,
+0x03d9a7e741b84da8ULL,0x0000000021685827ULL,
+0x84010dec793e6123ULL,0x00000000d4484c05ULL,
+0x062c450abea37cb1ULL,0x00000000269739eaULL,
+0x1c59ce487306b309ULL,0x00000000b27b7270ULL,
+0xa18264aa4443a472ULL,0x000000008342b104ULL,
+0xdaed6263a84b8da2ULL,0x00000000b0c57a96ULL,
+0x1dd8717ada24ec96ULL,0x00000000b4b2302dULL,
+0x04a22e3804e713d6ULL,0x00000000666a5069ULL,
+0x0c27184a9be2e644ULL,0x0000000038687253ULL,
+0x0941381aa14216bbULL,0x0000000068956d93ULL,
+0x2171327670258994ULL,0x00000000ae66ad6dULL,
+0x43132850a2c719e6ULL,0x000000009e0a50daULL,
+0x036d2b676448643aULL,0x0000000041e04991ULL,
+0x8911b8239c46b1d6ULL,0x000000001568bc8aULL,
+0x9cde6490a6781a29ULL,0x000000000669a7e4ULL,
+0xd5c38ba39978b5b0ULL,0x00000000a5313abaULL,
+0xbc7cc843c4b45952ULL,0x00000000ae220bbeULL,
+0x9ecbe7b82a6408d4ULL,0x000000000a3ab7e0ULL,
+0x07eebbdae57143e9ULL,0x00000000676c4487ULL,
+0x25adbd693dee3726ULL,0x000000003ad66b89ULL,
+0x4ce99e3e774a1498ULL,0x00000000daa82d82ULL,
+0x1003edaaa5d7031dULL,0x00000000d9bab446ULL,
+0xb28c6e052657cbc8ULL,0x00000000c0eb2320ULL,
+0x6661500b21907ca0ULL,0x00000000eac09691ULL,
+0x79c231796b321836ULL,0x00000000b89d24eaULL,
+0xd43ba8d7cc4602a0ULL,0x00000000962aacebULL,
+0xb41da3e3e2e41810ULL,0x00000000c942d97aULL,
+0x96dea0e009749ce3ULL,0x00000000ea057adaULL,
+0x4608c97eaa469110ULL,0x000000007800b854ULL,
+0xe1bed8246ac024b9ULL,0x0000000056226ddcULL,
+0x490880c6a05adaa3ULL,0x000000009d6e557eULL,
+0x9574e5cdc9d7a239ULL,0x00000000547a3387ULL,
+0x7c9b8e3a98cea9a8ULL,0x00000000ae5ce4d1ULL,
+0x4b253a6dba634ac1ULL,0x00000000dbb72eb2ULL,
+0x5ea4c5656c3542b5ULL,0x00000000b2814d6cULL,
+0xc7cdaa2529e047c3ULL,0x00000000e02950baULL,
+0x612934638c914589ULL,0x000000008e9ad523ULL,
+0x6dcd5bd7b4514b23ULL,0x00000000b1415cd0ULL,
+0x1a212413ee19545dULL,0x00000000c9a10253ULL,
+0x35179d8b1689ac4aULL,0x0000000029dd96eaULL,
+0x81337ec95d73b940ULL,0x00000000906ab712ULL,
+0xc8e6cbde0a40ca7eULL,0x00000000d95b3b46ULL,
+0xb18a7d89b6b8cdd4ULL,0x0000000064335713ULL,
+0x6e721b3220d4d1b8ULL,0x00000000b5111977ULL,
+0xd8a052a3387ab344ULL,0x0000000038782e9eULL,
+0x7e2829c7a7ec3708ULL,0x000000005d7893abULL,
+0x8ab97a230a6a90abULL,0x000000001b3ea132ULL,
+0xc4add6575895edcaULL,0x00000000da5423b9ULL,
+0xd27b2238b64b8529ULL,0x00000000a4959a12ULL,
+0xacd21d4b4856cc01ULL,0x0000000056e92503ULL,
+0x37d366990ec38554ULL,0x00000000947b66deULL,
+0x6c139461aea82a6cULL,0x00000000152c1504ULL,
+0xbb2a5cae03e5a179ULL,0x000000000a6897a0ULL,
+0x2763e89a1db9ea33ULL,0x000000007095cb04ULL,
+0xe677a176d73a43c0ULL,0x00000000959eb0ecULL,
+0xdbe01ab0d589c760ULL,0x0000000088ce9ae1ULL,
+0x4ec40b61629eecc4ULL,0x00000000c2265495ULL,
+0x8b56a05487558097ULL,0x000000007d827d00ULL,
+0x4b3063b26bcb340dULL,0x00000000d3356a82ULL,
+0x22a741e016b0d234ULL,0x0000000059634502ULL,
+0x407851aa7c935456ULL,0x00000000be20ad3bULL,
+0x101013d64053a833ULL,0x000000006eeb3cabULL,
+0xb1830820bbbca461ULL,0x000000000099bccdULL,
+0x7bbd9601d7aa1017ULL,0x000000007394d9c4ULL,
+0xcce0edc89c536382ULL,0x00000000c1129aa0ULL,
+0x366b9dee3d7aa008ULL,0x000000006053ebd3ULL,
+0x2db9c4a013d03d5bULL,0x00000000488caac4ULL,
+0x8837be89be1e3697ULL,0x000000008255a3dbULL,
+0xeb1e923b4ee7b02aULL,0x00000000219e7142ULL,
+0xebceda8e189ed2deULL,0x0000000022423190ULL,
+0xdcb3aeb483c6ec98ULL,0x000000005b5c4977ULL,
+0x454d370b26d4bcbdULL,0x0000000089b55b9cULL,
+0x39cb49354490c04dULL,0x00000000051aa0a3ULL,
+0xaadb36ae1168e930ULL,0x000000003066d07aULL,
+0x6997ea670154d46aULL,0x000000006ec2d5bcULL,
+0x654ce066cd6d6474ULL,0x000000009a7d65c0ULL,
+0x69b59a9b16aa0ab7ULL,0x00000000856c0cebULL,
+0x399e21073d31b221ULL,0x000000001b404468ULL,
+0xb6746d9ccb719285ULL,0x00000000a6eb31e3ULL,
+0x05108ec8232d79beULL,0x000000003828c5a0ULL,
+0x238ed98dcc894eebULL,0x00000000c8765141ULL,
+0x6094155de84a372dULL,0x00000000091b7402ULL,
+0x48a1b942024e4330ULL,0x0000000048de657dULL,
+0x921c02c3e9296823ULL,0x00000000b36e0317ULL,
+0xeac23ec881b88955ULL,0x00000000ed962658ULL,
+0x700d01c34c3bb0ebULL,0x0000000005d5b371ULL,
+0x1a2a40099bea1428ULL,0x00000000e1814849ULL,
+0xb2c52645ed18dc21ULL,0x000000000b99267cULL,
+0x5c33e9aca2033b39ULL,0x00000000aee25690ULL,
+0x598c970953045426ULL,0x0000000066da4ea1ULL,
+0x1b17559dac1669ceULL,0x00000000b2cac3e1ULL,
+0x209dc8233c508b0eULL,0x000000006932886cULL,
+0xac905e4a81c58558ULL,0x00000000a91ab8cdULL,
+0x5a4bbac89ec03395ULL,0x000000000ebebde7ULL,
+0xa357e554b8256c10ULL,0x000000001c228523ULL,
+0x215da97a8e4a3a8cULL,0x0000000073ad4a4eULL,
+0x9a2b18db02b94d89ULL,0x00000000e9260cb6ULL,
+0xb476a7db2a8bb900ULL,0x000000007109c60bULL,
+0x906cde61d4264344ULL,0x0000000035ce74aeULL,
+0x2441b2130e77bbccULL,0x00000000a93cc183ULL,
+0x94d78a27acc5e2aeULL,0x0000000006edb64dULL,
+0xe27271cdccd60580ULL,0x00000000c0500567ULL,
+0xd522a86664b07077ULL,0x000000001cbbd049ULL,
+0x058ecbccc0a643c4ULL,0x00000000e6220aadULL,
+0x509db6b8110824daULL,0x000000002594d90cULL,
+0x1b432ba9194a6a7bULL,0x00000000a929c9d6ULL,
+0x1ab49a75231a4366ULL,0x0000000009ca14bdULL,
+0x9dc600aa4831508dULL,0x000000001317d62aULL,
+0x3b03cdc4636ac9c5ULL,0x000000001c4c11d4ULL,
+0x50c17c5b0ee860c1ULL,0x0000000051ca88aaULL,
+0x0c8ab7e012ac5358ULL,0x0000000057ed22b4ULL,
+0x0026c2bed0a2004aULL,0x00000000b6c009bcULL,
+0x6847878630ab4224ULL,0x00000000985b4279ULL,
+0x6c39ebe2888cc88cULL,0x0000000053c7e4bdULL,
+0xd6e91dcbd0626417ULL,0x000000002627835eULL,
+0x2b840c27229946a1ULL,0x00000000ade6ee06ULL,
+0xc0d40051b9bd601dULL,0x00000000d6b86480ULL,
+0x9c8bb8be9c885a98ULL,0x00000000781ebe21ULL,
+0x416726b489c86133ULL,0x0000000020a972c1ULL,
+0x86453d726026465cULL,0x0000000042450685ULL,
+0x18868c3d9a16b853ULL,0x00000000b59a7babULL,
+0xbb8519a8cacaea24ULL,0x000000009516be19ULL,
+0x79b2eb29b7e415e3ULL,0x00000000bc32b9b8ULL,
+0x9086d1a21a24ea8eULL,0x0000000081316e95ULL,
+0xe6e7098e54a02262ULL,0x000000000e16cc46ULL,
+0x341129bdad609851ULL,0x000000004065b74bULL,
+0x5c2ec5d32014591dULL,0x000000009be4252aULL,
+0xea33dd4d0663c7c1ULL,0x0000000062c7acc1ULL,
+0x3b15b09c04679d25ULL,0x0000000030d83d05ULL,
+0x00dcd8a86cc63117ULL,0x00000000de2c7ee3ULL,
+0xe9898bd5e5cd19e8ULL,0x000000004c19181cULL,
+0xc48120ddaed20895ULL,0x0000000023b9da22ULL,
+0x629b62bd43389ea0ULL,0x000000004c433d94ULL,
+0x0c04d26d4b3d54beULL,0x000000005dc25076ULL,
+0xd4100bc3adcdd8e9ULL,0x0000000039128e8cULL,
+0xe451dc818cbd34e2ULL,0x000000003507c1e7ULL,
+0x78465b344d992088ULL,0x00000000b5533b12ULL,
+0xae70660d93823c98ULL,0x000000006ea26c8bULL,
+0x61d535d3645dc1a9ULL,0x0000000052bc856dULL,
+0x2307ce081001c1b0ULL,0x000000004c94dac7ULL,
+0x60db4e40590bc20cULL,0x00000000930bb08cULL,
+0x90a64eb14e6a2ed0ULL,0x000000002ebe5be7ULL,
+0x13dd0cbd05b7c822ULL,0x00000000a055ad16ULL,
+0x13142709951396e8ULL,0x0000000006baec33ULL,
+0x68b06578187d687cULL,0x00000000808027a3ULL,
+0x7041ea6241515e13ULL,0x00000000bea7daaaULL,
+0x2aaa3b653dac97b0ULL,0x0000000008d81758ULL,
+0x9127e2d9b82d55b2ULL,0x00000000ea63584eULL,
+0xbc3d3141aba5b7c5ULL,0x00000000e19233b3ULL,
+0x494187a7198cadbeULL,0x000000003c156948ULL,
+0xabc8982daa3b4bb3ULL,0x00000000a7223940ULL,
+0x446b27927911c897ULL,0x00000000c08a56a9ULL,
+0x6ad14b67163ee83cULL,0x00000000322d26e4ULL,
+0xd7e8b9e1361320a5ULL,0x0000000093ae503bULL,
+0x2a0a32acdc7ea610ULL,0x000000003e8c0d59ULL,
+0xcbbe73ba424901e6ULL,0x000000009dd9c384ULL,
+0x088db9c3287ae5e9ULL,0x0000000010115c03ULL,
+0x91c4ab7e4130365eULL,0x00000000b8d60676ULL,
+0x83c8b577d09ab898ULL,0x00000000ab4540ebULL,
+0xad26bb3b79c87534ULL,0x00000000876ed92cULL,
+0xc680a8842700ba52ULL,0x000000006ba16308ULL,
+0x1958a18025c7c7c9ULL,0x0000000079341d28ULL,
+0x3bb93562ae245467ULL,0x000000006e59351aULL,
+0x488036b93ccb1c4aULL,0x0000000080991cadULL,
+0x2196214ac72d9448ULL,0x00000000a4a88bd2ULL,
+0x783dd32268361742ULL,0x0000000039197b13ULL,
+0x799c00db1ec32491ULL,0x00000000630ebd23ULL,
+0xb29560ede5390be5ULL,0x00000000dd0c6ba0ULL,
+0x6bc332b7b4437bb5ULL,0x000000006580750bULL,
+0xd7a86e3e0cc33c92ULL,0x00000000dc810421ULL,
+0xe9bb216cad76424aULL,0x00000000bd43db7bULL,
+0x83ccd80203818063ULL,0x00000000d70aa69aULL,
+0x44a8b37ae1b9d02cULL,0x0000000061c2c9b8ULL,
+0x98c15b68574ae5a7ULL,0x000000006e85795eULL,
+0xab6dd50c4add5187ULL,0x0000000031c5d75aULL,
+0x10872a7bb40c36adULL,0x00000000e4171b36ULL,
+0xd249766483a8d950ULL,0x000000003922c254ULL,
+0x39a104ebbdea1bbcULL,0x00000000d136eda3ULL,
+0x706dde2047ba42c2ULL,0x00000000e6514e8cULL,
+0x6d4082a391574244ULL,0x000000007e35531bULL,
+0x79b3cc85cb1a5c1bULL,0x0000000030e4e4d5ULL,
+0x9b6caa28a73a3705ULL,0x00000000a527269dULL,
+0x5b72841a8d3a74b7ULL,0x0000000093e13866ULL,
+0x4d8b172c981d9b84ULL,0x000000005ed86298ULL,
+0xdd224c4194930448ULL,0x00000000ac259441ULL,
+0xce0814ce8968514eULL,0x00000000ac55020dULL,
+0x02bc2e63b3d0ba94ULL,0x00000000d08e207dULL,
+0xb554dc963db3e967ULL,0x000000008d61e3a0ULL,
+0x015107d4495e3033ULL,0x000000004c456aa8ULL,
+0xad0ae7aea00941acULL,0x000000005e34ee1aULL,
+0x3a6c7dc27527d89cULL,0x000000009470169cULL,
+0x5b85c600ba7b55b5ULL,0x000000006b5c5943ULL,
+0x38d17445c2224300ULL,0x000000003dc26759ULL,
+0xaa7c0d54e5ada0c3ULL,0x0000000071c5e78aULL,
+0x24e075a78e2e0c55ULL,0x000000007ba6030cULL,
+0x080b615d8869a93dULL,0x00000000c8898161ULL,
+0xc6a03bc2720a7701ULL,0x00000000a1ac9094ULL,
+0x6ed9e452104a246cULL,0x000000000350bb25ULL,
+0x30776c764e599c85ULL,0x0000000037ade3baULL,
+0x5912b3d404994a65ULL,0x00000000dc784933ULL,
+0xb97d36ad264c7966ULL,0x000000000d01da24ULL,
+0x26cd35eb4d96d413ULL,0x000000001e842c41ULL,
+0x5e0b558e170201a3ULL,0x0000000093dc9b3dULL,
+0xe8e3bbd3c6019e46ULL,0x00000000751490e1ULL,
+0xace11c6325d16672ULL,0x00000000b0e820aaULL,
+0x0a820cbe6a66bd1dULL,0x000000006ad109d6ULL,
+0xac8bd6a2ba422814ULL,0x00000000292b9a19ULL,
+0x99d3c877998104e6ULL,0x0000000048c8c79bULL,
+0x64563e12316ad1beULL,0x000000001cac1825ULL,
+0xb73e06c1e9b947e6ULL,0x00000000dbace49eULL,
+0x91760a08b5a23ee6ULL,0x000000001b503097ULL,
+0x0e67042cca39e231ULL,0x0000000002dbd327ULL,
+0xc3edbc32365ab25bULL,0x00000000165a0c01ULL,
+0x8a77b64bc3251dbaULL,0x0000000017882143ULL,
+0x3c605325de704370ULL,0x0000000001a11ec6ULL,
+0x229020630349c087ULL,0x00000000b0b5c6beULL,
+0xd03e665a868532b5ULL,0x000000008467c28dULL,
+0x2e83d1b796a37ab4ULL,0x000000004309d498ULL,
+0xd918d3d4c9551e87ULL,0x000000001993abbdULL,
+0x8e011ca10b854275ULL,0x00000000aca83c09ULL,
+0xdd73113bd1b492b2ULL,0x0000000097c15649ULL,
+0x348321771538e9c6ULL,0x00000000e82325a9ULL,
+0x39a27bbd9e58eac5ULL,0x0000000026ee805dULL,
+0x87aa5031d9a09a58ULL,0x00000000424b0024ULL,
+0x9c04d113eb9c6720ULL,0x0000000091ebe900ULL,
+0xc435390212099466ULL,0x000000000118da41ULL,
+0x0dc051c1c969a6d1ULL,0x00000000254e312eULL,
+0xe16044169924d867ULL,0x00000000eec73638ULL,
+0xe793975bb18c1250ULL,0x0000000049043ed7ULL,
+0x73d863616505e190ULL,0x000000000ee4b9bdULL,
+0xecdd3aaa7cce92b3ULL,0x00000000d9b5269aULL,
+0xd3a776d90be74611ULL,0x00000000c144021eULL,
+0x01935b1ec9030242ULL,0x000000008958a8abULL,
+0xc5bd3543a7a4a256ULL,0x00000000a1643636ULL,
+0x7805117a6239a8c0ULL,0x00000000e94de3c0ULL,
+0x09211d4420ee1cb0ULL,0x00000000d754a31aULL,
+0x220aed6553220749ULL,0x0000000025b7a73eULL,
+0x8b42127379a358eaULL,0x00000000535481a7ULL,
+0xb73a6a0a4871b54bULL,0x0000000042188d01ULL,
+0x104d88267775cb16ULL,0x0000000076c795ddULL,
+0x4408191644db4b65ULL,0x0000000099c024a9ULL,
+0x9a4bbc25d2857b2dULL,0x00000000eac253b8ULL,
+0x22d3452e73b56839ULL,0x000000006d10353cULL,
+0x64e2d98547c40270ULL,0x00000000b80d3673ULL,
+0xd57a930a0d15591cULL,0x000000007b94d026ULL,
+0x9c5629371739cea1ULL,0x000000008deb6487ULL,
+0x6544a542deebe714ULL,0x0000000021746467ULL,
+0x7a4a3337da1e6618ULL,0x000000006c288812ULL,
+0x8b51a8db0cdb8368ULL,0x00000000016e5580ULL,
+0x85d085235a6e4aabULL,0x000000000ba71926ULL,
+0x572b9d3e7d529bd8ULL,0x000000000aa0d151ULL,
+0x47d24843176d539eULL,0x000000008c503cbcULL,
+0x8c5a87e78c65a79aULL,0x000000002268422aULL,
+0x0872b6c9cca53c27ULL,0x000000008a15ca9aULL,
+0xbb0d205c8344c8bcULL,0x00000000cb406125ULL,
+0x3b13b49a1c955106ULL,0x00000000a9344582ULL,
+0x6d615acb387e255bULL,0x00000000cb0894dcULL,
+0xdbc20e7e7d0b753eULL,0x00000000eaa1a14eULL,
+0xe695d63806a27d52ULL,0x00000000e9bdcba7ULL,
+0x4928332a4a0c23ebULL,0x000000004e989d27ULL,
+0xa4c0cacb2b77969eULL,0x0000000025491372ULL,
+0xcd059c60305eaa4aULL,0x00000000436b0726ULL,
+0xd5a29cd85b251a19ULL,0x00000000d76aa761ULL,
+0x9d6455be0bc42570ULL,0x00000000c1c56bb8ULL,
+0x00419028ad8400daULL,0x0000000001719de8ULL,
+0xcab1a635049c35b9ULL,0x00000000158a56b9ULL,
+0x7d5d2ad28e472e95ULL,0x00000000b12ccb5aULL,
+0x91cc8c5ed0335921ULL,0x0000000024635c07ULL,
+0x906963d1cdaa5289ULL,0x0000000032152aaeULL,
+0x1e836493aa7eb395ULL,0x00000000009d08b6ULL,
+0x6820019812948760ULL,0x000000007ab97eeaULL,
+0x2144e32789934616ULL,0x00000000c7d76b79ULL,
+0x8c6631c418787100ULL,0x00000000ace5b395ULL,
+0xbcb8bc3bd99be957ULL,0x00000000b9eccc42ULL,
+0xc8da762e746e2906ULL,0x0000000041370017ULL,
+0x820c3e60b621d7caULL,0x00000000c708d144ULL,
+0x6771112b1336ab56ULL,0x000000006903ac2bULL,
+0x8885090264c2d614ULL,0x000000001bce70a9ULL,
+0x5244d39be1202139ULL,0x0000000092171224ULL,
+0x117a8873e385cc3dULL,0x00000000bb7b65bcULL,
+0x4e2c898a4a102370ULL,0x000000009398c316ULL,
+0xae505c107bb1eae3ULL,0x0000000044e13266ULL,
+0x8e93d6ba4092193eULL,0x0000000099aa967eULL,
+0x58001845ea5074d5ULL,0x00000000e7ea6447ULL,
+0xbe5e7507847c9e3bULL,0x0000000022a7d4b1ULL,
+0x57b3470876766c51ULL,0x00000000cd399775ULL,
+0x5286454e4c37ee04ULL,0x000000003a20035eULL,
+0x5059d83ec65563d5ULL,0x000000003517191aULL,
+0xa1dda3720c965003ULL,0x00000000630d3d62ULL,
+0x1412c9d52d6ee55bULL,0x00000000c58671c0ULL,
+0x3c6684383463444cULL,0x00000000d4961aa6ULL,
+0xc1521b4c7750440aULL,0x00000000bee330e8ULL,
+0x8b39485b93a6dcd3ULL,0x0000000074edc015ULL,
+0x0596b804e30d4766ULL,0x000000001a925c60ULL,
+0x6544c272d41562c9ULL,0x00000000d3067470ULL,
+0xd8383247c812c1e2ULL,0x0000000060e8709dULL,
+0x2c1cc042be24d6deULL,0x0000000054789990ULL,
+0x7e465362e46750c5ULL,0x000000000eb17232ULL,
+0xd43777c664bde300ULL,0x00000000cb0603c1ULL,
+0xe1b8538c9c7d5712ULL,0x00000000ceab2275ULL,
+0x6d49dcea9004e3b2ULL,0x00000000b2c77c7eULL,
+0x00b50b26ca5cc064ULL,0x0000000097618920ULL,
+0x1ba6394e36ba8a2dULL,0x00000000c1aec4d0ULL,
+0x3748e10809b6d6b3ULL,0x00000000c0948498ULL,
+0x48365d0b213db55dULL,0x00000000766d3a25ULL,
+0xdd972627739cd907ULL,0x0000000055a4e56dULL,
+0x60a52d291ed87e69ULL,0x00000000d5b2c08bULL,
+0x23b3a9eb463c226dULL,0x000000003cdb5558ULL,
+0x17895306c639a5eaULL,0x00000000a6acbccbULL,
+0x5181c7c8765ba83aULL,0x0000000074983760ULL,
+0x5be42d22518e8655ULL,0x00000000dad5d89eULL,
+0xb88294a4c3c1282dULL,0x0000000022e251daULL,
+0x966000b0548e64c2ULL,0x0000000011780726ULL,
+0xd6a255a387d5e095ULL,0x0000000080d1c352ULL,
+0x659707088d49e3e4ULL,0x000000004be5a7a8ULL,
+0x00eb5bda37cb7e3dULL,0x00000000ab4a22a6ULL,
+0x9c819542913e651bULL,0x000000005ee33104ULL,
+0xe63a27c52e972c5aULL,0x00000000ba778e9bULL,
+0x0006bd325dce7272ULL,0x00000000e4a60529ULL,
+0xbc19b19016390addULL,0x00000000de5597d0ULL,
+0x2a903e0cc4d890c2ULL,0x0000000004b74831ULL,
+0xb84ca4ec91b6dddbULL,0x00000000214aa3d5ULL,
+0x125bb4b826b60db8ULL,0x000000006e18bca9ULL,
+0x92b1b37e28739907ULL,0x0000000073c14605ULL,
+0xc6a9c9c3b2d4e529ULL,0x000000002eb740b8ULL,
+0x6318c8b10825eca6ULL,0x00000000778d5b92ULL,
+0x36b5315065d03401ULL,0x00000000d7d838aeULL,
+0xb3abdeb00d9ca648ULL,0x000000007e44e2ddULL,
+0x830d8523999aa1e8ULL,0x000000006bd1e192ULL,
+0xe8827bae407c62eaULL,0x00000000e66b1ea4ULL,
+0xa9c596590b3e886bULL,0x000000005a600b89ULL,
+0x2a2dc92d9bd93c31ULL,0x000000009b7c3bceULL,
+0xcb6855abcc5ee4acULL,0x00000000698c4dd7ULL,
+0xc64aad90a9284d9cULL,0x00000000698e9ca2ULL,
+0xd12a71a1177a5c86ULL,0x000000008c2b6d48ULL,
+0x4a314a4a9d4ab1a2ULL,0x000000002cee01b2ULL,
+0x4340a3437e0e4c7cULL,0x000000007b030966ULL,
+0xd35d97ab755b942cULL,0x00000000cc91bacdULL,
+0x773ebae6a348b603ULL,0x0000000035cb0a98ULL,
+0x819ebaa9dc96145aULL,0x000000007bb641b0ULL,
+0x827040abe856e24eULL,0x00000000606b7a75ULL,
+0x15b4651b0c73909dULL,0x000000007da0781bULL,
+0x9c0a98281cdabb81ULL,0x00000000a11c43b9ULL,
+0xe12dc99db756d769ULL,0x00000000b09765e7ULL,
+0x329934b2656569dcULL,0x00000000e28c373dULL,
+0x45ee7257db0c9973ULL,0x00000000b4024990ULL,
+0xc001db5ed529cb08ULL,0x0000000046d928b2ULL,
+0x88d459a2eb2c5c0eULL,0x0000000020c3b642ULL,
+0x94c31caabb6953e4ULL,0x000000007e57e9b6ULL,
+0x65e217b59bad11a4ULL,0x00000000c85d416cULL,
+0x9038e757379bda20ULL,0x000000004e3da828ULL,
+0xb431e0be6ab16bbbULL,0x00000000eb3006d1ULL,
+0x80131a45939a334cULL,0x00000000a6901bbdULL,
+0x05458a031a4aeb94ULL,0x0000000049120e56ULL,
+0x31c2130195622bd8ULL,0x0000000029190dceULL,
+0x3636ace2626e99bbULL,0x0000000076588d1eULL,
+0xd21bee3ae51b2126ULL,0x00000000e68437abULL,
+0xb497e94a73404051ULL,0x000000004896ee83ULL,
+0x09d1eaba37807c5aULL,0x000000001c34dbc4ULL,
+0x49542e9a0507c6e2ULL,0x0000000023374a77ULL,
+0x4a21c2909b2db4a0ULL,0x00000000c0dae083ULL,
+0xd3a28e3ead63b294ULL,0x00000000b57dc416ULL,
+0x006e011c437a8344ULL,0x00000000aa872233ULL,
+0x70cd47e66eb92608ULL,0x0000000008a4096eULL,
+0xba7281cd9333e005ULL,0x000000002e3d7e88ULL,
+0xdd329c876a6395a7ULL,0x000000007a00e8c0ULL,
+0xd522d5a8ee9a304eULL,0x00000000d329730dULL,
+0x6c69a7b330486881ULL,0x00000000d06aebcbULL,
+0xe51e8cda49da7c81ULL,0x00000000ce09ec92ULL,
+0x493e941916278371ULL,0x000000000e3c57beULL,
+0xd8e0a1c30a48bce3ULL,0x000000007d68e274ULL,
+0x09287d0174930312ULL,0x00000000c6dc54ccULL,
+0x8851bc02d09ee27bULL,0x00000000e16906ebULL,
+0x52cb814b65da418eULL,0x00000000bba382b7ULL,
+0xe11284837d3cc616ULL,0x0000000079158195ULL,
+0xc5435e5099e5e2eaULL,0x0000000046495014ULL,
+0x126c931110b770d0ULL,0x00000000dacda792ULL,
+0x7de4ec28339c4604ULL,0x000000003e1bb2a1ULL,
+0x62e9ad5119e01b8dULL,0x000000003106237aULL,
+0x55cb1b4eb525039eULL,0x000000000b60648eULL,
+0xa3960401200b1019ULL,0x0000000070bb0629ULL,
+0xb4a5ca549d96a395ULL,0x00000000834c5703ULL,
+0x2008825d48e91bc6ULL,0x0000000094d53573ULL,
+0xcb92be8d81b8dc43ULL,0x00000000250e9633ULL,
+0x5740debad0bd9909ULL,0x000000001a50d035ULL,
+0x348a5796c2688dacULL,0x00000000547770e9ULL,
+0x1275393149d59c0cULL,0x00000000d71c6901ULL,
+0x2e46d0bb236edc28ULL,0x00000000e68e67c1ULL,
+0xa0c6484eec2b88e7ULL,0x000000002014e744ULL,
+0x092200935bb7d6b1ULL,0x0000000080cb375dULL,
+0xb6b1322ea7cbb81aULL,0x00000000b185880bULL,
+0xabcce7cd41023662ULL,0x00000000e5047996ULL,
+0x70d13c937091a662ULL,0x0000000039833591ULL,
+0x91caa799aa653b83ULL,0x0000000045478d77ULL,
+0x2a11557c47c0ad5eULL,0x00000000c8abe5b3ULL,
+0x519088a807c8393bULL,0x000000002a28548dULL,
+0x0286a870ad2c0ed5ULL,0x000000008cde90a5ULL,
+0xbd874c08bb4e4a03ULL,0x00000000bcd60ad0ULL,
+0x68330ede744e9ba5ULL,0x00000000848936ccULL,
+0x196795b903b87836ULL,0x000000002b9cbec8ULL,
+0xdbd91163ac43cee5ULL,0x00000000dc392d7aULL,
+0xce8255e904ea4e7dULL,0x000000007c909783ULL,
+0x26bc3a925274329cULL,0x000000002b8a161eULL,
+0xdb7c0a266e88c1b9ULL,0x0000000019a53262ULL,
+0xe2d2c5b1ab8e3533ULL,0x000000002894d9e7ULL,
+0x3da6390e0a097260ULL,0x000000004e17781bULL,
+0x0289a86d3ce85dc2ULL,0x00000000651e8d73ULL,
+0x64cdb1a7556d7d3eULL,0x0000000084680734ULL,
+0x313863705491d520ULL,0x000000007213775dULL,
+0x639aae5725539e93ULL,0x00000000e699486aULL,
+0xeb568360b2356e38ULL,0x0000000025e3156eULL,
+0xb0432a7bd66d96ebULL,0x00000000d059d040ULL,
+0x14d2e58e09c1aa6bULL,0x000000003d44b5a9ULL,
+0xa23786edebad5236ULL,0x00000000c6ad3168ULL,
+0xea3bce100c7a7372ULL,0x000000008e2a5b7aULL,
+0x70989660a9c3e2beULL,0x00000000a2b0221cULL,
+0x8d811d441e1e5291ULL,0x00000000da696768ULL,
+0x940b736bba3c83a1ULL,0x0000000054eea668ULL,
+0xee32c0255cecda01ULL,0x0000000013595448ULL,
+0xb99384e3335198bdULL,0x00000000de3e8ac6ULL,
+0xb645411d695b3e77ULL,0x0000000063a7d389ULL,
+0x054b1d12058770e7ULL,0x0000000088998d0aULL,
+0x23d517e5915c6802ULL,0x000000007d5b299aULL,
+0x00d6a06c7e7a40e6ULL,0x000000001d480e69ULL,
+0x63a80c9900d55a36ULL,0x000000003ab70297ULL,
+0x9b55d92bebe90066ULL,0x00000000cc13d57eULL,
+0x55cb1113a8d99475ULL,0x000000003d9c640cULL,
+0x3398702c39b36816ULL,0x00000000752ac6edULL,
+0xbc2e05add2363527ULL,0x000000001ce56d49ULL,
+0x0094716ed122d0d9ULL,0x000000008ac4ab33ULL,
+0xd06e52565cebe700ULL,0x00000000c3603231ULL,
+0xe268a3c754abc195ULL,0x00000000e526a563ULL,
+0x5c6d695d41b5b752ULL,0x000000001dd23a25ULL,
+0x674898776c64b3cbULL,0x0000000061d4c866ULL,
+0x278876c53327940aULL,0x00000000190dc59aULL,
+0x3cd7a3772e3200dcULL,0x000000006ab48aa3ULL,
+0x6490951dc7b1139eULL,0x0000000030e18882ULL,
+0xab984c34426a4ae1ULL,0x00000000a3e78704ULL,
+0x3dc175abd4c579a8ULL,0x000000004054a2b7ULL,
+0xaad8b6a715cb2a32ULL,0x0000000075b8e1e1ULL,
+0x88712e29c1c84b8cULL,0x000000001a4ebdb5ULL,
+0x2554dc2003e258b3ULL,0x0000000072bbbcc2ULL,
+0xd5b31a349cb7d679ULL,0x000000006e798c73ULL,
+0x586b277e3d58cd42ULL,0x0000000092bcbbc8ULL,
+0x16e7dcb0170c93a8ULL,0x00000000862d3613ULL,
+0x6c0a64a18989d0adULL,0x000000007093e4aaULL,
+0x0bc25606bb473d56ULL,0x00000000ec34d553ULL,
+0x91c7544805720b6eULL,0x0000000049477308ULL,
+0xa7aee470a26e09d3ULL,0x00000000d7676a46ULL,
+0xae7db84eeb8b360bULL,0x000000005955e065ULL,
+0xc38a93b59c7e60c3ULL,0x00000000e22d50bdULL,
+0x1b6bc68d703403adULL,0x0000000081a98792ULL,
+0x2283c8327118a55dULL,0x00000000eddc0009ULL,
+0x256c8ac397acb835ULL,0x00000000408b62c5ULL,
+0x50a746322e382e93ULL,0x00000000ada733b0ULL,
+0x95c6811bb34c76abULL,0x000000003a82a04dULL,
+0x0a035d70e3954858ULL,0x000000006c142c4bULL,
+0x3844ea86a59b4062ULL,0x000000002e734a34ULL,
+0x42cac0354e70baccULL,0x00000000611bcd08ULL,
+0xc97395208c365b3bULL,0x000000007d07047aULL,
+0x090c9b02bec2e569ULL,0x00000000748433adULL,
+0x487dc3bd1c396ca2ULL,0x00000000d46867cdULL,
+0x7420a53a79821824ULL,0x0000000006429472ULL,
+0xa03448de95010e4cULL,0x00000000a041b642ULL,
+0x65eae5897390a989ULL,0x00000000e05bc080ULL,
+0x16e1b38da41b1a11ULL,0x00000000c62e46a7ULL,
+0xc451959d1212364dULL,0x00000000514171d8ULL,
+0xb5b2e42c75b392c6ULL,0x00000000779613c1ULL,
+0xe9285339e6eac564ULL,0x00000000066dda47ULL,
+0x73beea75036673adULL,0x00000000ee280507ULL,
+0x5d7d49996b1ced90ULL,0x000000007be45304ULL,
+0xe27035e73c3501dbULL,0x00000000ea2e1ca2ULL,
+0x5e2e62b075325c95ULL,0x000000001412dc01ULL,
+0xd12182ee28411dc7ULL,0x000000008e4b610aULL,
+0x4e5db19d129ee1c8ULL,0x00000000a8548a3cULL,
+0xd715991080ee4aa9ULL,0x0000000050b75548ULL,
+0x48dc4dd061296ab5ULL,0x00000000416a1c46ULL,
+0x09630380e546bb13ULL,0x00000000bcab2e76ULL,
+0xd249521a4a3ce73cULL,0x00000000b5d71da7ULL,
+0x880708e9934533e1ULL,0x00000000a4ed9c07ULL,
+0x3ebc324b8b432161ULL,0x00000000ed4e6554ULL,
+0x8521591896d745acULL,0x000000007552387eULL,
+0xa67136cbd1732661ULL,0x0000000060281357ULL,
+0x85bd67eca9e0e21dULL,0x0000000094eb61d5ULL,
+0x1ad35eae5d7d8508ULL,0x000000005abe1628ULL,
+0x7ba5b4aba88d3b71ULL,0x000000006eacd300ULL,
+0x3829b34ceba9a177ULL,0x0000000046e525a3ULL,
+0x8897c6cc908a5d18ULL,0x000000005b49bed9ULL,
+0x37c0123366726c65ULL,0x000000004e624b32ULL,
+0xb9324de22a3ca9acULL,0x00000000be19365bULL,
+0x04cdca54393c9e86ULL,0x000000002683ba1bULL,
+0x173ee7503354885bULL,0x0000000091d0a89dULL,
+0xe91767041212b7e0ULL,0x000000002d546033ULL,
+0xa8a1c67b16499b52ULL,0x0000000099650ceeULL,
+0x7695738acbd53797ULL,0x000000007980236cULL,
+0x3e72898eb8ccac71ULL,0x00000000980174c9ULL,
+0xde2d881a9e48a252ULL,0x00000000e465ddb4ULL,
+0x3468c3ac6063b486ULL,0x0000000030b5e524ULL,
+0xee2e0765b2e7724bULL,0x0000000088b5431eULL,
+0xda944763d39a92bcULL,0x0000000071860976ULL,
+0xa34a39055b65b79aULL,0x00000000432b891cULL,
+0x4104ab2d2e9b15a3ULL,0x0000000018c17256ULL,
+0xe50a889e4a35395aULL,0x000000002906c2c3ULL,
+0x46a6c1eeb1631e0dULL,0x000000005d0d9dceULL,
+0x3a7aa6d565deac23ULL,0x000000003aa1bb85ULL,
+0x326a0c0235153026ULL,0x00000000c9cd6098ULL,
+0x8072d4e9d78081d8ULL,0x000000008c2601a4ULL,
+0xd38709851b541ae4ULL,0x000000008a58da78ULL,
+0xeba5cd585dd2555bULL,0x00000000e9be1a19ULL,
+0x6b715815aee81430ULL,0x00000000d465d5d6ULL,
+0x5e34bc75b8d550c6ULL,0x000000009b71ea77ULL,
+0x30ba026104b1e291ULL,0x00000000e6555532ULL,
+0x2d2b695e115b60e8ULL,0x000000008d091b01ULL,
+0x8cb564b65e6b960cULL,0x00000000d5893aa4ULL,
+0xc322b1346b9b6bc4ULL,0x000000002a41293cULL,
+0x26c1457040ecc24eULL,0x0000000034412a3eULL,
+0x4c19c867949b8558ULL,0x00000000ca80c8cbULL,
+0x544d1e103a3beab2ULL,0x000000000de09593ULL,
+0x705370797289394aULL,0x000000004188bc96ULL,
+0x4a019595835533d0ULL,0x000000001453027cULL,
+0x179da788bc460465ULL,0x00000000460e6d18ULL,
+0xa092512662b29394ULL,0x000000004c884945ULL,
+0xdabe9eb17e2b5c05ULL,0x000000002c367368ULL,
+0x4bdc166a6bab50b8ULL,0x000000004e4b8b73ULL,
+0x3c7bcd8087c13601ULL,0x000000009e3d10a3ULL,
+0x1ea9e8b3ae674485ULL,0x000000003abe7361ULL,
+0x9aacc427692e76e4ULL,0x00000000db7991eaULL,
+0x2c6d49992bca12c6ULL,0x00000000adab6687ULL,
+0x2bcc85a9b465e371ULL,0x0000000062cb7ea4ULL,
+0x839ea30948e32d2eULL,0x00000000cb2abc0cULL,
+0x850419b246b09d76ULL,0x00000000d2d552c4ULL,
+0x4386ea4021db0b5bULL,0x00000000738c7531ULL,
+0x885065b1270402c0ULL,0x000000004a5c3367ULL,
+0xa8a4b03436aa5476ULL,0x00000000de347eadULL,
+0xb867e63c478eb1bdULL,0x00000000a3a53d58ULL,
+0x1d9c1945b9b8a57eULL,0x000000002eeac38eULL,
+0x8472dee845cb4d43ULL,0x00000000427a9b2eULL,
+0x41e9e273ec8e2cd6ULL,0x000000008d4342bbULL,
+0x0cc4276a985ce856ULL,0x00000000c76b3295ULL,
+0x83291703173e698bULL,0x000000009bd7d712ULL,
+0x81467b07d67e123cULL,0x0000000058ce309cULL,
+0xee74207ad305d460ULL,0x000000004cc24e40ULL,
+0x1ec9cdd588c7c75bULL,0x0000000020541196ULL,
+0x5b53e275a6d9e175ULL,0x000000004995375bULL,
+0xb21289ca2b12dce2ULL,0x00000000bec35ba6ULL,
+0x7b370dc34230e20eULL,0x00000000e2c7dbc3ULL,
+0x1be4236673d3071dULL,0x000000002238d52cULL,
+0x88a390958a2e1ea9ULL,0x00000000d0098b9dULL,
+0xda0d62c04c4c2e00ULL,0x000000007951cd85ULL,
+0xd69c5622ad83c59aULL,0x000000006a352e61ULL,
+0x85921ab681a7ce91ULL,0x000000002ee3ecb3ULL,
+0x2b51c5aa930ccb8cULL,0x00000000970b56ccULL,
+0xb67c80025cb532c2ULL,0x00000000d68b103dULL,
+0x65a99057381b9761ULL,0x000000006e7e7b3aULL,
+0x7c77b25126283b96ULL,0x000000001420b191ULL,
+0x54d1d13002186928ULL,0x0000000065e80b6eULL,
+0x5d6442865d2883e4ULL,0x000000005cbc8455ULL,
+0x993636b2be28ae4aULL,0x00000000c4ddaeabULL,
+0x2eb0925eb2b62404ULL,0x00000000cd6ee00dULL,
+0xbd02603900349c85ULL,0x0000000076686a9aULL,
+0x89309d5186689cbaULL,0x00000000eea3ab14ULL,
+0xd44b12d6810ee35bULL,0x0000000042526117ULL,
+0xc64a14925de738b9ULL,0x0000000034a72ce8ULL,
+0xaad1876a6c28645bULL,0x000000008ed231c9ULL,
+0x12eb7bab6082200bULL,0x00000000c49e4a53ULL,
+0xe6aa6267e9ad6373ULL,0x00000000e8c0b0bbULL,
+0xcd9743b7604573dcULL,0x000000009059cb93ULL,
+0xdee5374b226eb5ebULL,0x000000006658d186ULL,
+0x8b96d41501d647d6ULL,0x00000000be16406dULL,
+0x677d2193e380dc9dULL,0x00000000c4bc6e7eULL,
+0xdd0d1d65a987da15ULL,0x00000000a3ca6493ULL,
+0xbb4325662c81cd94ULL,0x00000000408987c8ULL,
+0x43a0e42cd4c2d60cULL,0x0000000075c69043ULL,
+0x35062dd8e767bee2ULL,0x00000000bc2b2111ULL,
+0x3b4b2e7c6a210031ULL,0x000000003d090766ULL,
+0x0c7c51b56bb3e1abULL,0x0000000097e2545aULL,
+0xd9ab49eb31293330ULL,0x0000000002d28ba3ULL,
+0x072050b394b848e1ULL,0x00000000423bb535ULL,
+0x89dbda183eb407c6ULL,0x000000009c129d2cULL,
+0x471843d0a815273dULL,0x000000009d73d66bULL,
+0x87407d9a83789232ULL,0x00000000a76c5dacULL,
+0x3311c94e3ec74b09ULL,0x000000007b1958e9ULL,
+0x6c10797bc3b40c99ULL,0x00000000b1a50840ULL,
+0xab20eddb8e8a67b4ULL,0x000000009a569422ULL,
+0x1a4b33e516ab4271ULL,0x00000000490ce806ULL,
+0xdb03920066dabe81ULL,0x00000000d11b478bULL,
+0x5c64d98a5aee5acaULL,0x000000007a5094aeULL,
+0xc69d4cac1213c467ULL,0x0000000004d0055dULL,
+0x69d13bec2d1b0e49ULL,0x00000000ec8b41a0ULL,
+0xb9203b3d7e580ed9ULL,0x000000001a93e60eULL,
+0xa29ae08d972918b5ULL,0x00000000bacde462ULL,
+0x9a3372ed53c2c8d8ULL,0x000000004c8c7db2ULL,
+0x77449e063623cb9aULL,0x00000000c65c404cULL,
+0xc4a0169c277a9e00ULL,0x00000000d28139c5ULL,
+0xe3d1217d53b7586aULL,0x00000000846a0036ULL,
+0xbd4a507d3746910aULL,0x000000001c208baaULL,
+0x9ce72d48247dcb69ULL,0x000000000cba6da9ULL,
+0x72037e0b51d18bd8ULL,0x0000000011139e8cULL,
+0x2e590a231e128977ULL,0x00000000977a9da2ULL,
+0xda4dd2a5aec3d74bULL,0x0000000024531b96ULL,
+0x50506c20b08ad0a4ULL,0x00000000c3abe729ULL,
+0x5186a8bc30de9b8eULL,0x00000000993314a9ULL,
+0xeb00aa25310c3a5dULL,0x00000000c89c126bULL,
+0xe02584d0988e78a3ULL,0x0000000086056d6dULL,
+0x3b8dd0e125e0b05bULL,0x0000000049c7cd38ULL,
+0x1183de7d0d591e1bULL,0x000000005ed6be0cULL,
+0xd5636de3a83d2015ULL,0x00000000ca36badcULL,
+0x7be66cbc8dc07a44ULL,0x00000000069e1d28ULL,
+0xe84e8d6a7d187813ULL,0x00000000e29aa021ULL,
+0x9a43b3eaea69b406ULL,0x00000000222a38ccULL,
+0x233361cb7d86a788ULL,0x000000007b8ce41dULL,
+0xe460939ea1234a12ULL,0x00000000e308553eULL,
+0x21d2a2516d16930cULL,0x000000002077b6ecULL,
+0x72000a11364bacb5ULL,0x00000000ead31120ULL,
+0x81816a763c824a64ULL,0x00000000c466b146ULL,
+0xa9212d85ab01e8baULL,0x0000000076203b66ULL,
+0x0a60d9c7902d3b90ULL,0x00000000db7c8b28ULL,
+0xb1b488b5c5ed89beULL,0x00000000aa288215ULL,
+0x3027a3ea88283923ULL,0x00000000ba00d05bULL,
+0x397e8bc5b9db4517ULL,0x000000007987ad7bULL,
+0xd8e9b03c6c499813ULL,0x00000000de2e34a8ULL,
+0x1d75197e87641d25ULL,0x00000000653c939bULL,
+0x0454d27ebd755d74ULL,0x0000000027837064ULL,
+0x57a46c27d5e422abULL,0x00000000281971a7ULL,
+0x8cc6d287783c963bULL,0x000000004400d887ULL,
+0xb408834e6a025bcbULL,0x00000000e16de860ULL,
+0xa1cd12dbca962b13ULL,0x00000000aae197d3ULL,
+0x2711939b3d2e9871ULL,0x0000000069bccc05ULL,
+0xa0a692271d2c0ebeULL,0x00000000c778e23cULL,
+0x9ee9ba8de6123c61ULL,0x000000007d411805ULL,
+0x26eb9de242263e95ULL,0x000000002a25ada0ULL,
+0xd24ec9b4c2990898ULL,0x00000000988dd473ULL,
+0xce2ace33804625b5ULL,0x000000006c49c50cULL,
+0xe760838b037eec89ULL,0x000000002c774dc2ULL,
+0x4105934568821356ULL,0x00000000152448bbULL,
+0x44d7a297d9939398ULL,0x000000007bc079abULL,
+0x04ec474846a89203ULL,0x000000004357d746ULL,
+0x0c155a64085e284dULL,0x000000009442a767ULL,
+0x19e0c225ce17ecc2ULL,0x000000004d4164beULL,
+0x97b5c2067a7785ecULL,0x00000000be133bb2ULL,
+0xc321e228b1be2be6ULL,0x000000002e0d15cdULL,
+0x5579ead95e67440bULL,0x00000000b1001704ULL,
+0xa1e418732a474872ULL,0x000000007d27e02dULL,
+0x93e4d11b1aa3dd3cULL,0x00000000c7d731c0ULL,
+0x92181157908bcb04ULL,0x0000000026e307d2ULL,
+0xb72c419c2551d2a4ULL,0x00000000674aebd9ULL,
+0xa23556e0b46b6426ULL,0x0000000026661857ULL,
+0xc9384ec17888059bULL,0x0000000088671435ULL,
+0x0cb9bbbeb9d1b6ecULL,0x00000000913913dcULL,
+0x37625ad8de0923b0ULL,0x0000000085b67d07ULL,
+0x705042c33320a0b2ULL,0x000000002a88e718ULL,
+0x0689d21256d9b55eULL,0x000000005c3ac971ULL,
+0x4d9a080e489ee36bULL,0x000000003439b5e1ULL,
+0xc2e244d4e860c3ebULL,0x00000000c6687d3aULL,
+0x664c12db652ae68bULL,0x0000000045623639ULL,
+0x2148331bc0635724ULL,0x0000000003038c2dULL,
+0x679d20c47b71a255ULL,0x00000000a1d731c2ULL,
+0x3ba421c514ea2bd1ULL,0x00000000c490669eULL,
+0x7cab835e5e9e95c5ULL,0x000000004b5d17baULL,
+0x7a0b9de5734edadcULL,0x0000000016a2bd3dULL,
+0xb54c706a5d12973bULL,0x000000009475b6daULL,
+0xa789690cdb164712ULL,0x0000000048d72a58ULL,
+0x664427538339ddb5ULL,0x00000000ca386a51ULL,
+0x5385d05d665b4570ULL,0x000000006872bb41ULL,
+0xebce34cd623d9dcdULL,0x00000000b4d5a00eULL,
+0x27ce331b83e3ba88ULL,0x00000000e1236a20ULL,
+0x908b1754e1988649ULL,0x00000000a94c7aa9ULL,
+0x753b0126dc260039ULL,0x000000009c5b6e3eULL,
+0xb7a841c7d394eb09ULL,0x000000007dca1d86ULL,
+0xd4760c9292522e19ULL,0x000000003ae103a9ULL,
+0xec969ae74b71b604ULL,0x00000000b08ae220ULL,
+0xd479209306d38605ULL,0x000000002abb9353ULL,
+0xb16bd194ed2023d3ULL,0x00000000b44a4aeaULL,
+0xd0b1b900e0796b68ULL,0x00000000b3a72939ULL,
+0x5688b219b873d05aULL,0x000000003b519ca4ULL,
+0xbdeebb9dee427c99ULL,0x00000000a1aed088ULL,
+0x1b6094ed88ebc830ULL,0x000000002ae88cc0ULL,
+0x8d6ead170131abebULL,0x00000000ade1467eULL,
+0xa2cb52d0588a65ccULL,0x000000005c5dd199ULL,
+0x01b8b07dc51d2390ULL,0x00000000e3e9b1a0ULL,
+0xe571927b31d20ba2ULL,0x0000000037676a89ULL,
+0x0c78ed5c18d4b366ULL,0x000000004bd909bcULL,
+0x60c26b32209debb8ULL,0x000000009e8246dbULL,
+0x1824b2c2927ada1dULL,0x000000003066b7d8ULL,
+0x83367e7344e3b37eULL,0x0000000025da5414ULL,
+0x447625a977c253c3ULL,0x00000000684c4095ULL,
+0xd8a419998d6ada70ULL,0x000000007b87ea5cULL,
+0xac789681e0624117ULL,0x00000000ed990882ULL,
+0x09d422c9500b9d7eULL,0x00000000626ad68bULL,
+0xd430a7841e048274ULL,0x00000000820e789eULL,
+0x1049a2ec24c0a563ULL,0x00000000e654884eULL,
+0x787e0c90a610108eULL,0x000000004bc7157dULL,
+0x2b0e874eab65ada8ULL,0x00000000190c0e59ULL,
+0x6585bea5704ca134ULL,0x00000000d25d1559ULL,
+0xb5e1adeadceda487ULL,0x00000000a75e1d5cULL,
+0xc6325c6a88b6c0daULL,0x000000006c59ae99ULL,
+0x641d098ca6d10436ULL,0x0000000011ab421aULL,
+0xa7ed8e2b8358dae9ULL,0x00000000b93edc53ULL,
+0x27286d4584432258ULL,0x00000000182286c0ULL,
+0x5b76a19479ed2284ULL,0x0000000030153542ULL,
+0xd38bb5ad5991cb91ULL,0x00000000b4d453c3ULL,
+0x26eaad47dec765e4ULL,0x0000000009c2477bULL,
+0x9eb6104c50d4b440ULL,0x000000006739949aULL,
+0x6c46574349e93c80ULL,0x00000000e9221d90ULL,
+0x9c82bb37e8d0acddULL,0x000000007c7566d4ULL,
+0x22a3e794e98955b5ULL,0x000000006c080742ULL,
+0xb86987187b230d82ULL,0x00000000b10ec319ULL,
+0x013318b836805057ULL,0x00000000008c5b34ULL,
+0x170696403455d9b1ULL,0x00000000bd3e16ddULL,
+0xaecca465c1c2ce70ULL,0x000000004d375229ULL,
+0x09118d8ec0a7e098ULL,0x000000002d3a58ccULL,
+0x9273a0766a78a823ULL,0x00000000a3dd77ceULL,
+0x34bec130617e1158ULL,0x00000000bc0dd8b5ULL,
+0x84a51946791c1146ULL,0x00000000bc12e8e8ULL,
+0x5293aa616ea1dd56ULL,0x00000000dca826deULL,
+0x40c72881ab15240eULL,0x0000000031b5d159ULL,
+0x342a7c34042e5c17ULL,0x0000000022a0471dULL,
+0xc30b21047bac4114ULL,0x00000000d81987e9ULL,
+0x90d2a46e0242d829ULL,0x0000000046776453ULL,
+0x985d5a47d314b77aULL,0x0000000035bd34e5ULL,
+0xdd73b67d6c7d0d11ULL,0x00000000c9810a7bULL,
+0xd40cc3ea2d2ea65bULL,0x00000000d3a3c0dcULL,
+0x8a652c2bc73c82d5ULL,0x00000000ab5768bbULL,
+0x89bb0dbba93db644ULL,0x00000000c93236deULL,
+0xb1cc385b889c9e5bULL,0x0000000098573cc2ULL,
+0x05787052e167471eULL,0x0000000005e98792ULL,
+0x46471302ced7e66aULL,0x0000000001203d71ULL,
+0x60432983e5db414bULL,0x0000000036d98793ULL,
+0xd12a87dd903d5665ULL,0x0000000013e3e35cULL,
+0x1cbb1e9567ad718aULL,0x0000000052391318ULL,
+0x0a12e18eeee61076ULL,0x0000000070c431d2ULL,
+0xcd1ebd8c125d0eb5ULL,0x0000000066388cd5ULL,
+0xa35dbe9e5c905e1bULL,0x0000000065b1bb29ULL,
+0x289d92d651ec03ebULL,0x00000000d0111128ULL,
+0xcae07ea11d546d06ULL,0x0000000065c3b15aULL,
+0xbd25818985a010adULL,0x0000000008bb123aULL,
+0xd3b2923d864ee96aULL,0x00000000c8bda9a5ULL,
+0xee508010d7656dedULL,0x000000001abc4914ULL,
+0x123ea70391bd5a63ULL,0x000000003844b25aULL,
+0xe5277e8d8bb12d48ULL,0x000000002a88ba97ULL,
+0x02b81877e251755dULL,0x00000000bc495124ULL,
+0x3424be590b4ca948ULL,0x000000005226cbd2ULL,
+0x086a5d911ac448cbULL,0x00000000cc710b22ULL,
+0xd078cb050aac5eb4ULL,0x000000009058349bULL,
+0x37a066666e4a4565ULL,0x000000001a742c16ULL,
+0x808499ad6550c940ULL,0x00000000caec3189ULL,
+0x81bd3765eb59c97dULL,0x000000003159d487ULL,
+0xaed24954cd3eae93ULL,0x0000000012285662ULL,
+0xb06e240511c6e25bULL,0x000000005eb20480ULL,
+0xc6e9cb4b540bba8dULL,0x0000000080c3587aULL,
+0x24aa65473193a630ULL,0x00000000a00d4739ULL,
+0xcc346d65085b7385ULL,0x00000000b2c7ab92ULL,
+0x36b29859141b5a37ULL,0x0000000063aeb948ULL,
+0x8d0be5d6a27814b8ULL,0x0000000063289a37ULL,
+0x29cc880905adb8deULL,0x00000000ecc91661ULL,
+0x8574bab5e623939cULL,0x00000000a9294b55ULL,
+0x95d07622995175c5ULL,0x000000001058d150ULL,
+0x0c55a1cc705aa37eULL,0x00000000984482b3ULL,
+0xeec6b5ddc6d8b6d0ULL,0x000000005078e006ULL,
+0x7a6bd085dda76d50ULL,0x000000004ce92180ULL,
+0x7494c68d0e5189ceULL,0x0000000005b20069ULL,
+0xa0667435beba19ccULL,0x0000000076b48738ULL,
+0x6c5398e08c620a10ULL,0x0000000093248d33ULL,
+0x7083693488d92287ULL,0x00000000cd705134ULL,
+0x2895009b558d1e6cULL,0x000000002a8bdd32ULL,
+0x71e832ec3e477b54ULL,0x000000007cbe243cULL,
+0xeca405beed955ac2ULL,0x000000009a4d6157ULL,
+0x708ab68414a7b02eULL,0x0000000028297a2dULL,
+0x020dd8d38112a1ddULL,0x0000000072aabb73ULL,
+0xd761b1a05e525554ULL,0x00000000005483e5ULL,
+0x94b7962804171645ULL,0x0000000001b8e2b4ULL,
+0xd8dbdebbeed95ed2ULL,0x00000000a35739c0ULL,
+0xc784983466a5229dULL,0x00000000ace23aabULL,
+0xa3372428e64d754aULL,0x00000000ec857886ULL,
+0x24946bde1d9097e7ULL,0x000000002dadade9ULL,
+0x4420342693a6e86eULL,0x00000000b6eb518aULL,
+0x92a7d0cb4eba7766ULL,0x00000000e582c67dULL,
+0x1a2a2d1447aa0d19ULL,0x000000001e095292ULL,
+0x6200c68b6569c839ULL,0x000000003aa57d08ULL,
+0x5ab97ab6763e8304ULL,0x0000000099d44008ULL,
+0x86ec49d622964755ULL,0x0000000002d7baa1ULL,
+0xb3d105c9ac509793ULL,0x00000000b0d084caULL,
+0x90d4d6d6e2509d68ULL,0x0000000012871e7eULL,
+0x5a5a0145530e523cULL,0x00000000d733d628ULL,
+0xa98b28b38ca4b383ULL,0x00000000b4d5271cULL,
+0xab753c197aac32acULL,0x00000000ce8273e5ULL,
+0x7ce91244bd127d82ULL,0x0000000021c39222ULL,
+0xb2592c09839e8d65ULL,0x00000000840b8402ULL,
+0x018c0cbcad859200ULL,0x00000000a1cbc444ULL,
+0x8e93d0116bda0381ULL,0x000000009d3417deULL,
+0x91143949696ea4e5ULL,0x000000005b551828ULL,
+0x85ee61e61a625e61ULL,0x00000000dd01d452ULL,
+0xeabc5ccd939198b5ULL,0x000000009be18ee4ULL,
+0xc2696b810d9e9a10ULL,0x00000000b294678eULL,
+0xe429e01604008c54ULL,0x00000000cad07da9ULL,
+0x637e3e472be99828ULL,0x0000000026dc06d3ULL,
+0xd6ee31280ebdb05aULL,0x00000000b5bc16ddULL,
+0x18e36e21dd99abc0ULL,0x000000007d0a4e22ULL,
+0xeb89a846a789b5ebULL,0x00000000109cad84ULL,
+0x9a2196be77c645e1ULL,0x00000000d82eb346ULL,
+0x2a48029b197e18e5ULL,0x000000004dd03b03ULL,
+0x54603c52175c3788ULL,0x000000005d15072cULL,
+0xd36d462e5187ec05ULL,0x00000000d7a3920aULL,
+0x6ccd3d29dadb2036ULL,0x00000000d66831daULL,
+0xcdcd4d5e5bcbc6d7ULL,0x000000005c2b88a3ULL,
+0x28c6e3824b1580aeULL,0x0000000012cac2b7ULL,
+0xe8ba435d85572ed4ULL,0x0000000042ba4155ULL,
+0x35a4a62dbeb7270bULL,0x0000000031859419ULL,
+0x37b5ac755e7661a8ULL,0x000000005bd46248ULL,
+0xb128eb9782266689ULL,0x000000003b917455ULL,
+0x34ba8628e541eee9ULL,0x00000000595c7a92ULL,
+0x30126e9262e7c28dULL,0x0000000078e6bd8eULL,
+0x094369a4018bb89cULL,0x0000000030ac146cULL,
+0xce9d075b3586d7e0ULL,0x0000000047601e4dULL,
+0x5ecc4e3a9c598154ULL,0x00000000ca053bc6ULL,
+0xc6382219829b2bdbULL,0x000000002cd3ca0eULL,
+0xa55699a774aa47c5ULL,0x0000000025e943bcULL,
+0x83301262e6492833ULL,0x00000000c31933d0ULL,
+0xbc46e2d2756743a3ULL,0x00000000c979db04ULL,
+0xa2c4b3da284c3db1ULL,0x00000000a5353e39ULL,
+0x48146694005525b3ULL,0x0000000014d25923ULL,
+0x6464a4260aa3c31cULL,0x0000000091d658e5ULL,
+0x862dedc65346d51bULL,0x000000005d2c18d2ULL,
+0xb1884a4c78a5d60bULL,0x00000000b526019dULL,
+0x1d027c97448e5117ULL,0x0000000089c2d5aeULL,
+0x1d32bd42691abe16ULL,0x000000002b29a8aaULL,
+0xe2d1941e9c1665ceULL,0x000000009eedc6bdULL,
+0x5321c29479dd175eULL,0x000000006d32c96cULL,
+0x4a6dd8012b94bc99ULL,0x000000001c57b04aULL,
+0x54b86a83958ae6dbULL,0x0000000093535241ULL,
+0xee4b3eeb515c7e47ULL,0x00000000955366a1ULL,
+0x6774b112ddb35170ULL,0x0000000083eb4191ULL,
+0x1441cc6701c2aca6ULL,0x000000009aca1e29ULL,
+0x0d49d691348ae3c0ULL,0x0000000071119a7dULL,
+0xa558d8b9669912b2ULL,0x00000000bed7d495ULL,
+0x835632ae60728e79ULL,0x00000000053902c5ULL,
+0x2e8d4e1183688cb1ULL,0x00000000b6caebccULL,
+0xa1c7b2841529c143ULL,0x0000000034162641ULL,
+0xa1eee729b616e18bULL,0x00000000a8c26290ULL,
+0x7e7100439280c565ULL,0x00000000c044136cULL,
+0x117403abd8379939ULL,0x000000004828315eULL,
+0xdcc2a258b2cac516ULL,0x00000000e1c18bc4ULL,
+0x624dc163494ea374ULL,0x000000003b680e87ULL,
+0x985be56d60439347ULL,0x000000002c31c490ULL,
+0xd23661682e8560cdULL,0x0000000085846e16ULL,
+0x5be9a87389d0eedcULL,0x00000000e2252016ULL,
+0xbdc48a36d4e2e20cULL,0x0000000083a99cc5ULL,
+0x008aae9ed44c11b9ULL,0x00000000425594d5ULL,
+0x6b08e25c176daed3ULL,0x00000000e4b7aeb5ULL,
+0x008e4a3c4e9d09b4ULL,0x00000000074401c1ULL,
+0xe238db25ae82199cULL,0x00000000dd0c4a0eULL,
+0x6e42063de045e867ULL,0x000000003802a286ULL,
+0x96684853e48a434eULL,0x0000000017883ab9ULL,
+0xe3aa053d14c9bb56ULL,0x0000000021017d6bULL,
+0x6dc26e17d9eca1d6ULL,0x000000004ada8c04ULL,
+0x170a49598e22e7c1ULL,0x0000000086da0987ULL,
+0x2b7b5a60b3c8eed5ULL,0x0000000025019e78ULL,
+0xe80b56e7b7714853ULL,0x000000006236b527ULL,
+0xa91a3660b63598a0ULL,0x00000000718290d7ULL,
+0xee2436d7d253b549ULL,0x00000000d41e94a9ULL,
+0xc8903932572e214cULL,0x00000000a3c7c4c6ULL,
+0x2e9ab3b2ad9c9971ULL,0x0000000059be1b6bULL,
+0x0ebc40c5546c6294ULL,0x00000000e8101de0ULL,
+0x5552a0485dc2d166ULL,0x00000000ed676e22ULL,
+0xd888eb832e7bea93ULL,0x00000000be07c242ULL,
+0x7660c70c629e26a6ULL,0x000000006271197bULL,
+0x2968ebd524ada7e3ULL,0x0000000004c3a697ULL,
+0x1c52a22876bac3b1ULL,0x00000000763c8bb4ULL,
+0xccb6e23cb6994274ULL,0x00000000ebb46550ULL,
+0xe827095c314bd88bULL,0x0000000045b1c4d5ULL,
+0x3419293899013bb5ULL,0x000000007b7823bbULL,
+0x59358aedcddb2b67ULL,0x000000008102d895ULL,
+0x60c30697d184bdd1ULL,0x000000009b09ec7aULL,
+0x12d424609ac91375ULL,0x00000000717b96c3ULL,
+0x5a99b3cb85032512ULL,0x000000003487a9c0ULL,
+0x2e5c757d1d182e04ULL,0x000000003d8c5993ULL,
+0x51cc3a799b529503ULL,0x00000000631a3586ULL,
+0xb6350949709c249cULL,0x00000000d467a49cULL,
+0x67561421e9ddc16cULL,0x00000000ca8b40e7ULL,
+0xc66a64102b585cb7ULL,0x00000000aa3e7d52ULL,
+0xaa7192b2c416646eULL,0x00000000d3ae6058ULL,
+0xa260d00c053804aeULL,0x00000000b9427d41ULL,
+0x5ee1cdc701b15a8cULL,0x00000000593a58ddULL,
+0x3ab9294ed2331d3cULL,0x0000000086562a18ULL,
+0x0054ba9bbd01814dULL,0x000000002220ba7dULL,
+0x539d87ba64a29c96ULL,0x0000000095c5042bULL,
+0x46d4130ac0b37e02ULL,0x000000001da7700cULL,
+0xe5772d72d7ad0aa7ULL,0x0000000011334e48ULL,
+0xeb5ea2d34d5ad710ULL,0x0000000048dd2ca8ULL,
+0x0ba934b3a3a67bbdULL,0x000000007dbbc807ULL,
+0xd368c5aa49168db7ULL,0x00000000695c02d5ULL,
+0x579350aa28badd93ULL,0x00000000ea02967dULL,
+0x76a2e433c11d0ddaULL,0x0000000093070463ULL,
+0x8915b74d6e2cc553ULL,0x0000000005425d99ULL,
+0x1b0d6d1821365db2ULL,0x00000000276c7a73ULL,
+0x0a833409529cb951ULL,0x0000000085e0e6b6ULL,
+0x2de0d424015a8430ULL,0x00000000a91d4852ULL,
+0x72c0ed0d0634a19eULL,0x000000003b94c825ULL,
+0x28342026e2d1e721ULL,0x00000000d0dece74ULL,
+0xa8eb314b556d7209ULL,0x00000000b6095081ULL,
+0x5e1cc323d6c81a08ULL,0x000000002641e518ULL,
+0x75942eb361d32126ULL,0x00000000adea0880ULL,
+0x88e4ae5134292984ULL,0x00000000e2213d89ULL,
+0x6cd3a63222a3b23aULL,0x0000000004343ad1ULL,
+0x828b208eb7ed7132ULL,0x00000000e2c88314ULL,
+0x5b7253e626642aa3ULL,0x000000003eda29d8ULL,
+0x6c4e5a57c2ced73dULL,0x000000002c1c6ee1ULL,
+0x1868b416c66a2a7cULL,0x0000000005a2e9c2ULL,
+0x81567b59891ce913ULL,0x000000006dc6a95dULL,
+0x0da0bd2254b3c62eULL,0x00000000d44a118cULL,
+0x14270c2604da0ca2ULL,0x00000000e2d83c36ULL,
+0xaeeaa4bbba887d44ULL,0x000000009692abebULL,
+0x39b60230c4403cc6ULL,0x0000000075bed453ULL,
+0xe517e971d48a51b0ULL,0x0000000014d5ceabULL,
+0xe71b2bcc61b5d120ULL,0x000000007633d9e0ULL,
+0x6c935d2d81544adaULL,0x000000002b7b88baULL,
+0x46c55e8852754381ULL,0x000000003bce9390ULL,
+0xc7a41b16b84d1033ULL,0x00000000cdab2067ULL,
+0x5c640d31810872bcULL,0x00000000386dbaa6ULL,
+0x1604795316cb339cULL,0x00000000b9aa6a5bULL,
+0x765b426aa65ca4bdULL,0x000000002b70509bULL,
+0x753926b14c66da83ULL,0x0000000084612a7cULL,
+0xd7998bdbde9d2928ULL,0x000000001522ab92ULL,
+0x386519354640b759ULL,0x000000003ea90c42ULL,
+0x96085d43b3990b1cULL,0x000000009213689dULL,
+0x517e99a080324985ULL,0x000000004c3111d6ULL,
+0x3b70370a7d800038ULL,0x000000009367788aULL,
+0x161233b6962ea4dcULL,0x00000000225993ddULL,
+0xdbe88d3c054ce70cULL,0x000000006ca85415ULL,
+0x23245e39e8e58695ULL,0x00000000be121b66ULL,
+0xd60067c4997bed61ULL,0x000000005b224877ULL,
+0xc4a9b260b5d0cdadULL,0x00000000557e4bb0ULL,
+0x9daa51dcb0c01d10ULL,0x00000000a844d779ULL,
+0x181399e33079b41aULL,0x000000009843c263ULL,
+0xa014276643bd79e8ULL,0x0000000070db83c9ULL,
+0x893dc902e12b8ae3ULL,0x0000000010c40d77ULL,
+0xa795005b0da8a0a3ULL,0x0000000062671a31ULL,
+0x364b4b06840b7b24ULL,0x00000000a80cc190ULL,
+0xd9ca929726c1abe2ULL,0x00000000cbedaa0bULL,
+0xd6327db031778234ULL,0x00000000eaceb0beULL,
+0xe317a5ae195c5349ULL,0x0000000009b120c7ULL,
+0x49abde261138944eULL,0x0000000050a86e82ULL,
+0x98c0a050685147cdULL,0x00000000620deca1ULL,
+0xd7c38133bc2d6d49ULL,0x00000000e3972ecdULL,
+0x9c1b47972b941d25ULL,0x00000000c5d90d0cULL,
+0xec55c4999e8c6eaaULL,0x00000000c061008bULL,
+0x71b49d8aa6c38520ULL,0x00000000936867a4ULL,
+0x8cc3d5a2657c9678ULL,0x00000000bdccb412ULL,
+0xdd967530de564a6bULL,0x00000000be5acb34ULL,
+0xeb61a3526e820b01ULL,0x00000000966a0ce5ULL,
+0x66e9d33dc6696d24ULL,0x000000007cc9e779ULL,
+0xe480da257a299513ULL,0x000000001ca89a79ULL,
+0xaec890ca8a49cba8ULL,0x0000000003d907c0ULL,
+0x25deae5da8cddcdeULL,0x0000000075e1aedaULL,
+0xd9dbb1349a80075dULL,0x0000000059e39966ULL,
+0xb97519db448860c7ULL,0x00000000dc28e850ULL,
+0x22769ad3bee28175ULL,0x00000000c3a8b46aULL,
+0xdb20ba3484879a37ULL,0x0000000083385590ULL,
+0x6b7350ed60ea4488ULL,0x000000003c7ae443ULL,
+0x16143a9563d5ae85ULL,0x00000000547ce7c9ULL,
+0x350330348d929b88ULL,0x00000000c19058aaULL,
+0x8b95aa45c562a856ULL,0x000000002d4748b3ULL,
+0xa48312e8b9e41225ULL,0x000000007bad6881ULL,
+0x7870b941931c4323ULL,0x0000000088c20087ULL,
+0x7033b23532e672bcULL,0x00000000462d1b27ULL,
+0xe06c0d1473388a35ULL,0x0000000015d4d64aULL,
+0xe0e4be5420659e47ULL,0x0000000078ec33e2ULL,
+0xa3dda22619b80762ULL,0x00000000d2689062ULL,
+0x99c6e246e64887a1ULL,0x0000000071eec250ULL,
+0x5898d937808ce50eULL,0x000000001b1a33beULL,
+0x384813b7464d6112ULL,0x0000000028471881ULL,
+0x9539a7ade4a174adULL,0x00000000ad3ce001ULL,
+0xee23daa4c7614d2dULL,0x000000001b34e735ULL,
+0x7937531db48cd70cULL,0x000000005b973c55ULL,
+0x84d3a374e80916ccULL,0x00000000e7e873a3ULL,
+0x4173b2dd823ad3bbULL,0x00000000c468a4caULL,
+0x91be82a8c9b9d1aaULL,0x000000006e299cc1ULL,
+0xd3a33d5dec5637b1ULL,0x0000000037ca8ccaULL,
+0x968d8cdb5ade681cULL,0x0000000041b679beULL,
+0x4e363134d669a0ccULL,0x0000000011b07971ULL,
+0x8565c02512d31426ULL,0x00000000de4cbd82ULL,
+0xe60dd0e1ec451ab4ULL,0x00000000c921b4a4ULL,
+0x0d6eb3965a762106ULL,0x000000005b689d3cULL,
+0x4710b85b7b01b58bULL,0x0000000087ed0947ULL,
+0x4b97eb540d3458eeULL,0x00000000e19c616bULL,
+0x296d43896a528e02ULL,0x0000000043768737ULL,
+0x6e129280781647d7ULL,0x000000006bdcc531ULL,
+0x796da4489614c077ULL,0x000000004ed89e2eULL,
+0xa846b5ec1c1b10ddULL,0x00000000c8923c63ULL,
+0x9d16acbbc794173aULL,0x000000006050e15eULL,
+0x837ec88d69abba7eULL,0x0000000093bc56caULL,
+0xab118bb4344898a6ULL,0x0000000094b9833cULL,
+0xe9be0b8889405165ULL,0x00000000e72e4bd6ULL,
+0x95264424c712a354ULL,0x000000006dec904cULL,
+0x88a556221e6558a1ULL,0x00000000ae3489baULL,
+0xa1513714b71a9355ULL,0x0000000021eea185ULL,
+0xde0c9b8e370b2710ULL,0x00000000818b9c52ULL,
+0x5d7267a3dd05e67eULL,0x00000000ea2da9e6ULL,
+0x812ca05175c4e8d6ULL,0x00000000b8574317ULL,
+0x76577e33d9000ee0ULL,0x000000001da55b12ULL,
+0xa426e87018752c86ULL,0x0000000081e39b89ULL,
+0xdb8a91a74390c6e9ULL,0x000000009d416da6ULL,
+0x837095e6c2b37372ULL,0x0000000043a91200ULL,
+0xb1527aebc78b2b59ULL,0x00000000cb906472ULL,
+0xc626c3a5a38bdebeULL,0x000000003b6507a9ULL,
+0x278c37ddbcc46854ULL,0x000000006a5ab8c3ULL,
+0xcec49a76a7d15c06ULL,0x000000002c50d87bULL,
+0xdae4422799adb634ULL,0x0000000025aa13b1ULL,
+0xdea9d28e790d52e2ULL,0x0000000032b36a79ULL,
+0x63a1e335e9a28d00ULL,0x0000000021a8dbddULL,
+0x668b5e7364463e78ULL,0x00000000264c4821ULL,
+0x43e573b840b35292ULL,0x000000006524ac56ULL,
+0x78ad6ce39e666528ULL,0x000000002db9ee46ULL,
+0x1246413a9e8b4125ULL,0x000000001274401dULL,
+0x5c1ce658d011c7beULL,0x0000000097a6942bULL,
+0x7091991ce82553c9ULL,0x0000000062ee6b64ULL,
+0xc5c9d59a8302cba7ULL,0x00000000a73d8a70ULL,
+0x86417e967cb27c31ULL,0x00000000532d404aULL,
+0xc348cbcac19e43c4ULL,0x000000001b9de9a5ULL,
+0x5921a73b7b0a6abaULL,0x00000000e305eb57ULL,
+0x4161d1a3637c3414ULL,0x00000000622019c9ULL,
+0x69a9872d67c8c019ULL,0x00000000b41914deULL,
+0xd546a2b0028c7a99ULL,0x00000000394813c0ULL,
+0x9b017011462d2a3dULL,0x00000000ba2d5d9aULL,
+0x6726a0e38e01838aULL,0x000000009d83e9caULL,
+0x5c9c7eba83647883ULL,0x000000006e83dd40ULL,
+0x7472785614822679ULL,0x00000000b73cbdc0ULL,
+0xc790d4b8a3ee756bULL,0x0000000081899c4aULL,
+0xb5b1066d9b39b369ULL,0x000000008164a481ULL,
+0x26018016be9e8e04ULL,0x00000000e9b21484ULL,
+0xb419c88e9d42309eULL,0x000000000bcbe781ULL,
+0x6913679593503db1ULL,0x00000000e4c3776cULL,
+0x66a4cc32e6dc03bbULL,0x0000000075d245eeULL,
+0x3bd7d2c030827226ULL,0x00000000585106ccULL,
+0xc5e37854d300d181ULL,0x00000000286c43dcULL,
+0x804bc0ba69b31c47ULL,0x000000001548c2b7ULL,
+0xc47b9143a3e92d49ULL,0x00000000b2304d90ULL,
+0x3399beb012d01572ULL,0x0000000026e09a9bULL,
+0x6079ed975489e1d7ULL,0x00000000daacd819ULL,
+0x25610c0e06d788cdULL,0x00000000b1ba3290ULL,
+0x34d62067b7d10b78ULL,0x00000000c8a0097aULL,
+0x6d7b13b2c178544dULL,0x00000000231da6e4ULL,
+0xccc40bc55dcb201dULL,0x0000000072c32d8dULL,
+0x79cea4edc2514d74ULL,0x00000000090da5aaULL,
+0x581d8c283502c8abULL,0x00000000376e39aaULL,
+0x789a4e57bce829cdULL,0x00000000b49bcca9ULL,
+0x8aecd6aa75c1c0a2ULL,0x000000000a740d3aULL,
+0x160a19ea65e86cd9ULL,0x0000000094a6ebacULL,
+0xd97eae991007a4beULL,0x00000000ae55eaa1ULL,
+0x605e512297db8c3aULL,0x00000000e870065cULL,
+0x902d897c3874b2ceULL,0x000000007462c606ULL,
+0x5559b32b41c9c1bbULL,0x000000001819d44cULL,
+0x9534b855732d41e7ULL,0x000000005514adc6ULL,
+0xe9e52477c5473536ULL,0x00000000d520d753ULL,
+0x8eb6edb82623c7e7ULL,0x0000000077e9b1edULL,
+0xd89273ae8385cae8ULL,0x00000000158a1cdeULL,
+0xd3e02b3a25b575b6ULL,0x000000004e17657cULL,
+0x27ea3775384c9e32ULL,0x00000000c4893874ULL,
+0xa27e81bbca2517c6ULL,0x000000006cc6c380ULL,
+0x8b3bd84d212ddcd1ULL,0x00000000ea720bd0ULL,
+0xc46edc06edbd0a91ULL,0x00000000cb20b616ULL,
+0xb3699b0e3735aadaULL,0x000000007534d6d4ULL,
+0xc14bd62443596b3eULL,0x00000000b72ec592ULL,
+0xa9aa1a0877759789ULL,0x00000000111a4ceeULL,
+0x9a32b2b30534e157ULL,0x000000000b301814ULL,
+0x94222c5099c32747ULL,0x0000000012a078baULL,
+0xacc18e4c33ea362cULL,0x00000000725ee78aULL,
+0x883146d911ab0be9ULL,0x000000004685027eULL,
+0xd567c504ace0c9acULL,0x00000000a289aaeaULL,
+0xc6b4882b05a04361ULL,0x00000000946ec004ULL,
+0x8ba753e9e7330e72ULL,0x000000007326a281ULL,
+0x7d78329aa7681717ULL,0x000000000a9422bdULL,
+0x665a216467a0d517ULL,0x0000000041abcdecULL,
+0xc9bde3ee1abd3323ULL,0x00000000ce733c49ULL,
+0x22283bb59d139d45ULL,0x0000000027057d21ULL,
+0xb177679ba887ba01ULL,0x0000000060d6acc9ULL,
+0xc0ee31d09e03e8c8ULL,0x0000000022cde963ULL,
+0xd87cb73ce6895271ULL,0x00000000cb3b6015ULL,
+0x85e95c6ee4832a0bULL,0x000000002c7c02e9ULL,
+0x94dc9a8bee2abed1ULL,0x0000000046becaceULL,
+0xc5950d5d323d4627ULL,0x0000000007a8b60cULL,
+0x1e187ba16a6777cbULL,0x000000003b405ba5ULL,
+0x7854db0a50b71598ULL,0x000000002b487645ULL,
+0x152ddc7dbe0a04d2ULL,0x0000000018ea6024ULL,
+0x3107d07138809de3ULL,0x00000000d32610daULL,
+0xe00e129d9e920674ULL,0x00000000a00a71bdULL,
+0x904e0ce18e83b2c7ULL,0x00000000129b06e1ULL,
+0x88e380de6a601bbcULL,0x00000000d6d0755dULL,
+0x38725a087a6c8413ULL,0x00000000538a4badULL,
+0x7333648eb092d572ULL,0x00000000cd6902b1ULL,
+0xce074b8431d79b86ULL,0x000000004ad75e12ULL,
+0xe96271649e00ea09ULL,0x0000000071683344ULL,
+0xa501e8b3675ac0edULL,0x000000006307842cULL,
+0x7884c35c4c182c66ULL,0x000000003c8de6d8ULL,
+0x74a9a9ba5e0316aeULL,0x000000004059c170ULL,
+0x452e3a2aa9e15b7dULL,0x00000000d0de3dc8ULL,
+0xa37db43ec47b4ae3ULL,0x00000000c4cb1383ULL,
+0xaadca0e02832ded1ULL,0x000000005441e333ULL,
+0x72783334e513e8c2ULL,0x0000000080a847aaULL,
+0x7163dd16d96432b9ULL,0x000000002d435a4cULL,
+0x3a015bb4a3c5e03aULL,0x00000000b1160384ULL,
+0x7986e7cd99d285b1ULL,0x00000000edeb51e2ULL,
+0x396c84c80286c377ULL,0x00000000566128bbULL,
+0x3e4862d328a38be7ULL,0x00000000877987c1ULL,
+0x14d6b0c3ab2ba397ULL,0x00000000ea867356ULL,
+0xe29c70e9d70eac9dULL,0x00000000d7e05b34ULL,
+0xdaebdc14da0722bdULL,0x000000007bbceb7cULL,
+0x4a70ad6e17409527ULL,0x0000000094474b1eULL,
+0x993554a234597b53ULL,0x00000000c769a1c9ULL,
+0xe8e4325d8da36403ULL,0x000000007d46a525ULL,
+0x55ac0c16db5a12e8ULL,0x00000000de8d8d53ULL,
+0x394b781295053ba0ULL,0x00000000c13c12a6ULL,
+0x03d75aed29599952ULL,0x00000000c6e0ae94ULL,
+0xc0dd173766a3b3d7ULL,0x0000000068484a3eULL,
+0x70714beb1a556b58ULL,0x00000000b9c5e1e5ULL,
+0x8160b99c80dea2d3ULL,0x000000001ee923a0ULL,
+0xeb385a67dc7d09bdULL,0x000000008ed57d34ULL,
+0x014514ca6c4d80ceULL,0x0000000087600ea4ULL,
+0x07934c8eb2bb9537ULL,0x00000000bb09d0b8ULL,
+0x68dc75b4241386b5ULL,0x00000000733a1e50ULL,
+0x17d55ceae8016b63ULL,0x00000000dc486417ULL,
+0x05d74309b69e6beeULL,0x0000000099847209ULL,
+0x913ac9b0c5dec66cULL,0x00000000e68a2d68ULL,
+0x7aa0747d1c2da29cULL,0x0000000043d256d0ULL,
+0x446662274d951166ULL,0x000000007a5bdc2dULL,
+0xa179e229b831e7eaULL,0x00000000d52e3598ULL,
+0x8d4521c224b90a93ULL,0x00000000947304aaULL,
+0xea2257e0e7220d89ULL,0x0000000008d44d0aULL,
+0x1d3474b4ab011b3dULL,0x00000000dc87a760ULL,
+0x69d450335580a82dULL,0x0000000010c48928ULL,
+0x5c008e2edb6790acULL,0x00000000199e426bULL,
+0xb3a14bac27ae8db8ULL,0x00000000d01d1732ULL,
+0x9326a52040d5a87dULL,0x000000008e8ebc2cULL,
+0xb67d06915ba5b94aULL,0x00000000705c71d1ULL,
+0xe54243e6e5e9492dULL,0x0000000021ac7896ULL,
+0xce9a13dedca8e98bULL,0x000000001a59ae15ULL,
+0xa0276351bb9662e1ULL,0x0000000030b3181aULL,
+0x91ddd131685a96bbULL,0x000000009d0bc04cULL,
+0xa25c7c105e2300b3ULL,0x00000000481b38deULL,
+0x1391572a29bc9327ULL,0x00000000ecae273cULL,
+0x1b1dd0491a99bd12ULL,0x000000007a1b3316ULL,
+0xc736bba1b689a507ULL,0x00000000b4bd5becULL,
+0x90b84c971b9a40c1ULL,0x00000000cb207ec2ULL,
+0x443cac7a629935caULL,0x000000007e1ca522ULL,
+0x5e99a356dc478685ULL,0x0000000053c6ed13ULL,
+0x6ed1215aca62226dULL,0x000000000eb11013ULL,
+0xb9706e4e7c0e47a2ULL,0x0000000036e55554ULL,
+0x28bd257620e62dd6ULL,0x0000000001028781ULL,
+0xced59a7ac6327625ULL,0x0000000006c715b6ULL,
+0xce36666b23c67cc5ULL,0x000000008eb166a2ULL,
+0xc0419b53ec2e9e6bULL,0x000000001591d098ULL,
+0x3d0d680dc53b7b80ULL,0x0000000048555333ULL,
+0xa865a393225e68e5ULL,0x0000000095cba615ULL,
+0x82997a154b24a624ULL,0x00000000ade581b4ULL,
+0x7424285d64739739ULL,0x00000000d871734bULL,
+0xed467e09227a5c83ULL,0x00000000b4955384ULL,
+0x0b99069eb15a82baULL,0x00000000ee6d42b6ULL,
+0xc6e906aaee4a692aULL,0x000000005b0e45d7ULL,
+0x0d5609199b126b70ULL,0x00000000a3cbe7c9ULL,
+0x949213a156094d64ULL,0x0000000030eda94bULL,
+0xe31b5491a494a652ULL,0x00000000d8edd8edULL,
+0x7c618350589b344aULL,0x000000009127314cULL,
+0xbb0d5bc6c3050816ULL,0x000000008878667cULL,
+0xc495c719e2891d7dULL,0x00000000d5d50cd8ULL,
+0x76c4230d68d9713aULL,0x0000000057847102ULL,
+0x8d2898447541928cULL,0x00000000262c2cdaULL,
+0x5db847a358b29018ULL,0x000000009d88e88bULL,
+0xe89ee227e8ca2ad1ULL,0x0000000012a89b2dULL,
+0xb487a0e044359733ULL,0x00000000d6ae3544ULL,
+0x621e60ca80c9a95dULL,0x000000009ee78b22ULL,
+0xe82d35c66bbe62c9ULL,0x00000000d501ae02ULL,
+0x7caa38b361ea30c2ULL,0x0000000047919422ULL,
+0x9a365e0c01abaccdULL,0x0000000007996b5dULL,
+0xda4c5baea05ea2ddULL,0x000000000a0bd8c2ULL,
+0xa6da1099e0b789caULL,0x0000000029cda24dULL,
+0xcb73b9cbd96e2e7eULL,0x00000000290ad6d8ULL,
+0x0d3db2b2cc0a315aULL,0x0000000046838290ULL,
+0xcb81dd2298094a6aULL,0x00000000eb8d3885ULL,
+0x140d2c01d98bb42eULL,0x0000000072d02645ULL,
+0xb236174eb4b4443eULL,0x00000000330d6a3aULL,
+0xdebb33bbdc2c4348ULL,0x00000000261c9517ULL,
+0x3290de83ab67bbc0ULL,0x00000000a9814804ULL,
+0x868941249ad766a6ULL,0x00000000dcc90c6eULL,
+0xd51112c532e43346ULL,0x00000000ca375330ULL,
+0x287d9c90e3c927d1ULL,0x000000002031e82cULL,
+0xd6263873e9151e9bULL,0x00000000127bc929ULL,
+0x38365ec47e664b1eULL,0x0000000096ad85b4ULL,
+0xe79db0780c00bce1ULL,0x000000005aaa7782ULL,
+0x44b0275b3be8343dULL,0x00000000e28c4670ULL,
+0xe5b2ea0cc96b6765ULL,0x00000000aa586d5aULL,
+0x424778b26a4d4d04ULL,0x0000000042294d58ULL,
+0x7c9db9d4c1aaa85bULL,0x00000000ca708944ULL,
+0x8b920391e5276a51ULL,0x00000000e8b5228aULL,
+0xb8e3d6598312e971ULL,0x0000000070d6422aULL,
+0xeb8664d60747869bULL,0x00000000880b8951ULL,
+0x54e2da69ba8352a4ULL,0x00000000ece7cde9ULL,
+0x4d2c0bc8c8675c8aULL,0x0000000091d83a7aULL,
+0xbd61659ba6b2b599ULL,0x000000005951d425ULL,
+0xe33368032cd6bae6ULL,0x000000000c271ec1ULL,
+0x7c699ac5728a8c21ULL,0x000000000a850091ULL,
+0x8ac7928006ea7204ULL,0x0000000077d2b188ULL,
+0xcab8b5c85878da14ULL,0x00000000563403b6ULL,
+0x0cd2d827c77368ebULL,0x000000000bbdb814ULL,
+0xa886cb97eb300b8aULL,0x00000000726b3855ULL,
+0x262b24e72d466502ULL,0x0000000007ade084ULL,
+0x7bcd4965106556b8ULL,0x000000009502d6a0ULL,
+0x63a37778c1a33ca7ULL,0x00000000923a6653ULL,
+0xce85785ed8d714bcULL,0x0000000026177340ULL,
+0x890b5241ce49cbc4ULL,0x0000000028bac8ebULL,
+0x2c38b10601d94a47ULL,0x00000000eece4b84ULL,
+0x4150784388465c71ULL,0x00000000d599edd4ULL,
+0xe18d234b4a0a8799ULL,0x00000000884e6a89ULL,
+0x63d2406655174c66ULL,0x000000007aa5508eULL,
+0x869532bce36789b2ULL,0x0000000026d678e4ULL,
+0x7a6992eab56a143aULL,0x00000000ee7306ceULL,
+0x0844aad1bd020c16ULL,0x00000000d4c25c54ULL,
+0x4105b7c73cddd0e9ULL,0x0000000014bb72abULL,
+0x7ab65944dad3eed4ULL,0x000000002b11710cULL,
+0x67a85b58528a803cULL,0x00000000819ddd93ULL,
+0x3b1e4113c5394655ULL,0x0000000089167179ULL,
+0xcca33a52b3365a74ULL,0x00000000ee105bc0ULL,
+0xeb4ada1e32c0c5c5ULL,0x000000002b5433a5ULL,
+0xbc7ad768ddc36a50ULL,0x0000000031a1ec9dULL,
+0x888e4e3bb786b352ULL,0x00000000962e854bULL,
+0xbced8ee6ca01a118ULL,0x0000000085db466cULL,
+0xe555a35c8329b2a5ULL,0x000000006bb4e8caULL,
+0xaa5b3052eb48c05bULL,0x000000006e889bcdULL,
+0x0d54e1257a0e1570ULL,0x00000000c698c28eULL,
+0xcd2c138c534ea678ULL,0x000000006db1d92aULL,
+0x4e67dab4c13633d1ULL,0x00000000be38c0d8ULL,
+0xb8dd6964369a1372ULL,0x00000000cc6331b6ULL,
+0xe0534c3e5576064eULL,0x00000000457be73cULL,
+0xc5b060dc70817248ULL,0x000000005bc799e2ULL,
+0x8c12b057e79b4a33ULL,0x000000008a8cc826ULL,
+0xea7d016c029c1d53ULL,0x00000000122db7eaULL,
+0xcc059a8d608a1539ULL,0x0000000031821c66ULL,
+0xe5c96c257a38e2ebULL,0x00000000a0b842a7ULL,
+0x805401700d2b17b6ULL,0x000000005a324b8bULL,
+0x31c0513d506750daULL,0x000000003ede4034ULL,
+0xcc4dbd99bd7a98e4ULL,0x00000000a09b81d8ULL,
+0x6ec6db8aab6c5035ULL,0x0000000057103463ULL,
+0x5209a403e817ac52ULL,0x000000007e8aebe9ULL,
+0x21740717c15eae70ULL,0x000000007a97b500ULL,
+0xd494ec7cc7e174e4ULL,0x00000000c45146dbULL,
+0xbd5be0d5117657d8ULL,0x000000005c980cdcULL,
+0x6b7600e469589a37ULL,0x000000006c37ad76ULL,
+0x3891cacb21609307ULL,0x00000000b2c2683dULL,
+0x1bb0609071a1c6ebULL,0x000000002d8ae6aeULL,
+0x4864eb9608c17edaULL,0x00000000e9654b3eULL,
+0xb4570ba8ca5344eaULL,0x00000000b53c037bULL,
+0x8dd5273927343579ULL,0x0000000001b66c44ULL,
+0x4d19be8cba851c8dULL,0x00000000432000e2ULL,
+0xbb2180989183783aULL,0x00000000c240653cULL,
+0x26ab990821d751b4ULL,0x0000000016962e4eULL,
+0x70d44782671470c7ULL,0x000000004c953078ULL,
+0x530672dc111edd21ULL,0x00000000ee27b8e8ULL,
+0x24e880c35bc37b27ULL,0x0000000061603021ULL,
+0x05cc9699deb70ee1ULL,0x000000008206ee8aULL,
+0xd6c208608286e7a5ULL,0x0000000061621ba6ULL,
+0x63a63b736bb6e7c0ULL,0x00000000c0472830ULL,
+0x50cad243e8b2c668ULL,0x0000000035ab0740ULL,
+0x4e79e5648992db86ULL,0x000000009ca838a3ULL,
+0x5ce53945e9881a5cULL,0x00000000b1175977ULL,
+0xe7cebec2dbd1c79cULL,0x000000006ad499e4ULL,
+0x48ae4a6de80bb92cULL,0x00000000e72ce2eeULL,
+0x6a91c22c79a61b0dULL,0x0000000040705e1cULL,
+0xddd025323b7eda92ULL,0x0000000066a6e766ULL,
+0x6289934a000020d4ULL,0x00000000de87c1a1ULL,
+0xbb914a3a87e1e65dULL,0x0000000010873299ULL,
+0xe2a89a0bc4e17a29ULL,0x0000000057611a9dULL,
+0xd5ae4e8842670b91ULL,0x0000000074321356ULL,
+0x326895abdea06dbcULL,0x0000000016b22a0cULL,
+0x50c03055952e1782ULL,0x00000000b1c1313bULL,
+0x87e865c3a15b1b60ULL,0x00000000cc791485ULL,
+0x38dd2867d28aeec8ULL,0x0000000000008e57ULL,
+0x2620c8dd1314a1daULL,0x00000000e786b9ceULL,
+0x817a43d9340e2e6cULL,0x00000000664d6143ULL,
+0xaa749463d2803104ULL,0x000000002d6e4c37ULL,
+0x7d5658ebae663e60ULL,0x0000000034125cb1ULL,
+0x606533a29526a2b4ULL,0x0000000046cde486ULL,
+0x01953da4ebab8051ULL,0x00000000454605eaULL,
+0x1374b7e3c998b367ULL,0x00000000ed36bd01ULL,
+0x0929625bb0d0bac8ULL,0x0000000075914913ULL,
+0x7ea2ba44c18e3b55ULL,0x00000000ca521687ULL,
+0xce288b71a9e50424ULL,0x00000000b421172dULL,
+0x45735ba1c2733d64ULL,0x0000000013482b21ULL,
+0x1b0561bebc799934ULL,0x0000000077ce048dULL,
+0xc0e4a5ab6ecdb108ULL,0x00000000ac42c233ULL,
+0xb52358a042b89766ULL,0x00000000393e87aaULL,
+0x3315a507354da087ULL,0x00000000da81e4a9ULL,
+0xd0212e825177a680ULL,0x00000000659d2082ULL,
+0x885506472497a954ULL,0x00000000a141c44cULL,
+0xeb034a07dd679768ULL,0x00000000230bbeaaULL,
+0x888ce165ce5eea23ULL,0x000000001ac30cdcULL,
+0xe107269821c88587ULL,0x0000000086ec386bULL,
+0xcea433aece2aa898ULL,0x000000004d1c6b5eULL,
+0x4b227aa9ec064869ULL,0x00000000e9207360ULL,
+0x2e142e7067aa5869ULL,0x000000009e5bca4cULL,
+0xe2dad576b29e0070ULL,0x0000000094c2b916ULL,
+0x0223613296a17b58ULL,0x000000000896c916ULL,
+0xe92a30c105edb55eULL,0x00000000490b65d7ULL,
+0x387c7c3b200ba76bULL,0x000000001dc4c828ULL,
+0x5be0c2b399ac0094ULL,0x000000005007ed8aULL,
+0x6d3cdb9bd4a6eb9eULL,0x00000000a3d3813aULL,
+0xc9e1117778e01e11ULL,0x00000000026ae10eULL,
+0xbecedaa987b9a57bULL,0x00000000d2b2938aULL,
+0xe79cbe06ba7860d6ULL,0x00000000a5748d2dULL,
+0x3a1bd16ae2116196ULL,0x000000006e63ac14ULL,
+0x86d76bc3ed85099dULL,0x000000008eb02ccbULL,
+0x6eb6de12647b194eULL,0x00000000d6533624ULL,
+0x432c92755e9c7634ULL,0x00000000b7587b34ULL,
+0x8cca22c6c270397eULL,0x000000002d926172ULL,
+0xebab72de09023cc0ULL,0x000000008bc8662cULL,
+0xb31c9a3e9e97c4b9ULL,0x000000009d196105ULL,
+0x8503a67e29288842ULL,0x000000001c286206ULL,
+0x6c42157c304ae1dbULL,0x00000000030ba10eULL,
+0x133ca87613e65174ULL,0x000000003167a65aULL,
+0x60d847de5de25bd0ULL,0x000000002d2965d7ULL,
+0xd14b56a50e89ee5dULL,0x0000000062c42c50ULL,
+0x22514ee7cc3c667eULL,0x000000005ed00d93ULL,
+0xb50becb47e3c6507ULL,0x0000000064dbaad8ULL,
+0xb90e35e4bbb1a50aULL,0x00000000a33e2bc6ULL,
+0x2919524c4d7429cbULL,0x0000000068e6ebc8ULL,
+0xb503906b77b80e03ULL,0x00000000523d8337ULL,
+0xad28025bb146dad3ULL,0x0000000080548ad4ULL,
+0x9d6a0166b229537cULL,0x00000000d771e770ULL,
+0x2bb29371ad1e1075ULL,0x00000000842bca44ULL,
+0x16ca1c3e7a38b08eULL,0x000000000cd9219dULL,
+0x0ee74bea40606879ULL,0x00000000cade34dbULL,
+0x135d992a5194890bULL,0x0000000009633090ULL,
+0x9130650ab94c9947ULL,0x00000000168d76ebULL,
+0x731c884da1a06379ULL,0x0000000073b63b67ULL,
+0x2c528bb88a5a42aeULL,0x000000007c868019ULL,
+0xac9445eb65a712ceULL,0x00000000923e1685ULL,
+0xdcd56476843ca016ULL,0x00000000732b460dULL,
+0xe5a500e3a206693cULL,0x00000000a17de947ULL,
+0xc7a638b584ad3e01ULL,0x000000000213d355ULL,
+0x1a25a9e44b42e4b8ULL,0x00000000c6dcb312ULL,
+0x53e06ea1b7e9e7daULL,0x0000000012c1d018ULL,
+0x386638d511be7766ULL,0x000000002773795bULL,
+0x045be9e000b202aaULL,0x00000000d5bc8dccULL,
+0x7b5150a2aae39d92ULL,0x0000000073ab2133ULL,
+0x3a773a93832643c7ULL,0x000000002a1531b0ULL,
+0x648a766ae1e8eb5dULL,0x0000000080c18976ULL,
+0x4d945b5de71b8ec8ULL,0x00000000aa171d18ULL,
+0x223ee65ae96d36d1ULL,0x000000002644221eULL,
+0x1936b514cbee3cacULL,0x000000001bd95673ULL,
+0xdc6888c203348b9aULL,0x000000002d577cc8ULL,
+0xabcacb07979a8734ULL,0x000000004a0bbc51ULL,
+0xb9781eaa5bca7a51ULL,0x00000000d8c411d0ULL,
+0xd19e7023d54ec428ULL,0x0000000014e0cc38ULL,
+0x82200a20cd4007adULL,0x00000000a83ea478ULL,
+0x673d20626c68516dULL,0x0000000049c97b42ULL,
+0xdd756da4a87a18e4ULL,0x000000001a1a4494ULL,
+0x0a7733b1ab051c25ULL,0x00000000ae79826cULL,
+0x4d9198c2b81eb68eULL,0x00000000919d45d6ULL,
+0xa547a6edb054159bULL,0x0000000049045103ULL,
+0xdb87dc95bc3ade03ULL,0x0000000081de2cc5ULL,
+0x94eb6d21b4278d4bULL,0x0000000009b7c60dULL,
+0x249b38d4682b4516ULL,0x00000000a8ca37e9ULL,
+0xe5b9ba9c09a6e9bdULL,0x00000000cccd7610ULL,
+0x8521bc19463cb337ULL,0x0000000045494348ULL,
+0xab0051716c145a80ULL,0x00000000ec38ce70ULL,
+0x96489859aad1c668ULL,0x00000000242be41bULL,
+0xb670e913b67c3a46ULL,0x00000000215b0c1dULL,
+0x81e91e921b568e17ULL,0x0000000066ed65d2ULL,
+0x06c5bcdd803844a5ULL,0x00000000a2a967b4ULL,
+0x98476320621ce795ULL,0x00000000343e5a74ULL,
+0x7ae95ed0944ea2d2ULL,0x000000001579e4b5ULL,
+0x60cd9eb411748b30ULL,0x0000000091cec56dULL,
+0x1b15a3ee41995bccULL,0x00000000e2491697ULL,
+0x34aa762b98194e0eULL,0x00000000809943a8ULL,
+0x6d4d000e360a9c35ULL,0x0000000077d22413ULL,
+0x9e8b6d0ae0b3b233ULL,0x000000005abbcc28ULL,
+0x3dc5ab794c332705ULL,0x00000000a9b3a9ddULL,
+0x2a619ebc9619aee3ULL,0x000000009c7ca13aULL,
+0x3b97c5572aec6139ULL,0x0000000012ae8d47ULL,
+0xc604b3c4b966c50eULL,0x00000000c062562cULL,
+0x657338a3165317d4ULL,0x00000000250e02e7ULL,
+0x575c9aa5ac6213e3ULL,0x00000000082d1b4aULL,
+0x7b714049491444d8ULL,0x00000000d1711783ULL,
+0x2b3adc16106087b1ULL,0x000000000ac095d6ULL,
+0xb213e5275dc381acULL,0x00000000e7a9b858ULL,
+0xe8ad98866205c40bULL,0x000000000c3ddd98ULL,
+0x6146ca630b2968e9ULL,0x00000000d168ae19ULL,
+0x19edc07d8a898574ULL,0x00000000ab61e140ULL,
+0xbe6d368e90b4421eULL,0x00000000063e1c6bULL,
+0xa41b149cabd37861ULL,0x00000000986e0c41ULL,
+0x2cceccb706bdd990ULL,0x00000000b03b8503ULL,
+0xabeea53523812017ULL,0x0000000072388d9eULL,
+0x83bd6411edab31d3ULL,0x00000000aec0ac65ULL,
+0x6667c01edd47301eULL,0x00000000c5ba4e21ULL,
+0xee1a15068c97a442ULL,0x000000004a1a6761ULL,
+0x76ced03d6a775d35ULL,0x000000003ce56d36ULL,
+0xce158b786890936bULL,0x00000000e92081edULL,
+0x9d7e14eb84b3ed6cULL,0x00000000dddc7620ULL,
+0x151823ba4aea92d5ULL,0x0000000081b921daULL,
+0x00db562926ccb8b5ULL,0x00000000306c664eULL,
+0x87e82183479171b3ULL,0x000000002e869b0cULL,
+0x27b9c391269dc043ULL,0x000000002ce5cb6dULL,
+0xd10036a40386b566ULL,0x00000000ddbeca93ULL,
+0x2a222551b9d0d5a3ULL,0x00000000d3829a2aULL,
+0xee8aceed31b322c0ULL,0x00000000024ac57bULL,
+0xa0ac63618e187c23ULL,0x00000000287d1c84ULL,
+0x9a43c8ce38cc2d6bULL,0x00000000ade0381dULL,
+0x436e535b867deb84ULL,0x00000000b0e03970ULL,
+0xead6ed24461900c8ULL,0x000000002cc09cebULL,
+0xce0c2047b236c509ULL,0x00000000e2bcc9cdULL,
+0xd42007605a4d4633ULL,0x000000001b012cb9ULL,
+0x0eced8616e2e5ec8ULL,0x00000000285cee09ULL,
+0xad04663a82342d90ULL,0x0000000096e68661ULL,
+0xd0a6891603047cd5ULL,0x00000000908b8498ULL,
+0xa576a3c098e3009cULL,0x0000000063abd40eULL,
+0x3e9ab36eb87eb9c5ULL,0x00000000d62b83dbULL,
+0x8985129ada6a2533ULL,0x000000004cbebeeeULL,
+0x5422e29d99b9aa85ULL,0x000000002524de93ULL,
+0x7a205a77cdada586ULL,0x0000000040519d5aULL,
+0xd34c38257e2ae9c7ULL,0x0000000067e39564ULL,
+0xc048b3a356e226a9ULL,0x000000008d63c9dcULL,
+0x22ac2e831b9cedb2ULL,0x000000005752192bULL,
+0xe6a4d679b17d0db6ULL,0x000000000cae2680ULL,
+0x6b5761c3161b3e7aULL,0x000000002603b1e1ULL,
+0x8eeedd54031c9451ULL,0x00000000d69cddc1ULL,
+0x22dc56a561ed67cdULL,0x00000000ecee93a9ULL,
+0x9b2041e56666b5b3ULL,0x00000000c0b629a6ULL,
+0xea433062e40ba98eULL,0x00000000b6d3214bULL,
+0x73405a5d1db92118ULL,0x00000000de9eaceaULL,
+0x70d035727e44282aULL,0x00000000d5d612c3ULL,
+0x42acab09001396beULL,0x000000005864525aULL,
+0xbc6b9b5834502b69ULL,0x00000000436122acULL,
+0x6861583384352284ULL,0x00000000eb65da04ULL,
+0xb140e76647bc9e30ULL,0x000000009a6ddb79ULL,
+0x63b5d4bc80349c35ULL,0x00000000c3ec3cebULL,
+0xcccabc7390d335a6ULL,0x00000000d75c6ec4ULL,
+0xbe753bcb77d76ca3ULL,0x000000000b7c3187ULL,
+0x0cb847ee0a878cb9ULL,0x000000007912481bULL,
+0xe6dd7dd21a3e862aULL,0x00000000e6a79e0dULL,
+0x2db82376ac04b9eeULL,0x000000002d3e19b7ULL,
+0x85bec187314dc4c3ULL,0x000000000604cbe1ULL,
+0x39524c9ccbb28c95ULL,0x00000000094e2232ULL,
+0x0d7d83d0249ab33cULL,0x000000001c8b71ebULL,
+0x9b69ba41377b2d45ULL,0x0000000003613a44ULL,
+0x84d32b7606ce77aeULL,0x00000000945668d2ULL,
+0x8a3aaa0d31eda95cULL,0x00000000e0000d1cULL,
+0xc6e7b5be5bbb20a0ULL,0x00000000815d4a88ULL,
+0xd226a518a4d7bea3ULL,0x0000000043064a0cULL,
+0x776925aec11b7bd2ULL,0x0000000094a7988dULL,
+0x3cb1540dedce36c1ULL,0x00000000a1252008ULL,
+0x5a5d6ca646900755ULL,0x0000000063827172ULL,
+0xc78918792d973a10ULL,0x000000006d2b8a39ULL,
+0x13826a11556d758cULL,0x000000008da57da6ULL,
+0xca41035e9ac2ce90ULL,0x0000000002674b5cULL,
+0x42b075dce238d8dbULL,0x00000000321a3a9eULL,
+0x3c1de84acec4e2c4ULL,0x000000007bd431c6ULL,
+0xc2493bd2da618106ULL,0x00000000e07b6ba5ULL,
+0xac5471b6232dc6c3ULL,0x0000000029865e35ULL,
+0xa7ae7258596e6578ULL,0x0000000028323ccaULL,
+0x549e041ed6cc1702ULL,0x00000000061649caULL,
+0x48796a10c8c3550cULL,0x00000000a379bb14ULL,
+0xd726178de42e5268ULL,0x00000000e77ac1e8ULL,
+0x52c2a0dae7bb33d3ULL,0x0000000064741a12ULL,
+0x74c345c2cda5bcc6ULL,0x00000000151764e6ULL,
+0xca949be9c7193598ULL,0x0000000012bdeb31ULL,
+0x68410875a564505dULL,0x00000000794b6d05ULL,
+0xaad9a642672bb10dULL,0x0000000096a16d92ULL,
+0x92e7ae936485e741ULL,0x00000000a36d4dc3ULL,
+0xde1c44755b58947eULL,0x000000009d6a5816ULL,
+0x55850e1c9252b704ULL,0x000000007e32a74eULL,
+0x68240e97e1049930ULL,0x00000000252a2ee8ULL,
+0xe05c32147b60940bULL,0x0000000012bd02bdULL,
+0x47d1412a9a0c45ecULL,0x000000003753bb40ULL,
+0x1941c945dd035678ULL,0x00000000b78e1840ULL,
+0x3945d00732b64d80ULL,0x0000000098e47ac5ULL,
+0x8ead33827695b61dULL,0x00000000435b5bbaULL,
+0x52b6a8e26e8a5010ULL,0x000000004a8d8051ULL,
+0xd5d94c7e23316e76ULL,0x00000000187096d1ULL,
+0xa4149c0275d92da5ULL,0x00000000ad6558e0ULL,
+0xc8e489e810a756daULL,0x000000009639c8a8ULL,
+0x25576b9a2d030798ULL,0x00000000a98001d7ULL,
+0x9aeb96d6e5be718eULL,0x000000009b600701ULL,
+0xc93b3a972d3a896aULL,0x0000000078613871ULL,
+0x9cb2b6e5d6e66e71ULL,0x00000000139c77ebULL,
+0x63e0a8c28ca0da50ULL,0x00000000563b76e5ULL,
+0xc8891415533d76bcULL,0x0000000044b36b44ULL,
+0x200a79919b40252cULL,0x00000000bda9299dULL,
+0x88bce749d533bc23ULL,0x000000006e0be659ULL,
+0x5e46504017e11bb7ULL,0x00000000727bc2a4ULL,
+0x5b3018cc91ed979aULL,0x000000006d678d6bULL,
+0xcbd3a6cc76a89814ULL,0x000000001cbaa02bULL,
+0xb80815ab302eb12cULL,0x000000007952d070ULL,
+0xcb123151e51511ddULL,0x00000000257710d2ULL,
+0x37dd603203313e79ULL,0x0000000037832a81ULL,
+0x93e783a85ae1d077ULL,0x0000000012ab35a7ULL,
+0xe2a9ca20c29597d7ULL,0x000000005b9874aaULL,
+0x47d9a34914e107eaULL,0x000000006c64123dULL,
+0xeac223723705a149ULL,0x000000003c60e788ULL,
+0xb4b2cd918136b2b9ULL,0x00000000a3da20beULL,
+0xae8319245b293308ULL,0x000000006d9a4061ULL,
+0x71ba36adb54b7322ULL,0x00000000862e7c88ULL,
+0x73a2bacc4007268bULL,0x000000003109e145ULL,
+0x32485ba3996b00c6ULL,0x0000000099a8c0c3ULL,
+0xac3a3230e1cdd550ULL,0x00000000be432830ULL,
+0x78a1804ca0267510ULL,0x0000000021c41299ULL,
+0x4b3e52784186c967ULL,0x0000000022179a52ULL,
+0x68c7346983a7ba90ULL,0x0000000074aa73b4ULL,
+0x750cb474ce741ccdULL,0x0000000074811117ULL,
+0xdc2c7e93c1c0a05cULL,0x0000000050301901ULL,
+0xdae85953b52ee732ULL,0x000000001a6b13baULL,
+0x505d695a9ce51b1eULL,0x000000006c903b62ULL,
+0x2819d88bb4e9597aULL,0x00000000dba0ac8cULL,
+0x3398b584c4ede40aULL,0x000000008d274284ULL,
+0x9a322732c9ca963bULL,0x00000000420e4236ULL,
+0x19d5d06b68261217ULL,0x000000003e1109e5ULL,
+0x5e6b27eca8b4160dULL,0x00000000c5b575b8ULL,
+0xb005d08a44c11d86ULL,0x0000000025d2967dULL,
+0x6450c516ec8ac68eULL,0x0000000063dc63ceULL,
+0x19c80069949ae577ULL,0x000000007a913e51ULL,
+0xc9743101d2ac85c9ULL,0x00000000c5874b13ULL,
+0x95a8bbdcb019a2adULL,0x000000003eaa56aaULL,
+0x930c39750c912430ULL,0x000000009d2d2994ULL,
+0x5b96721caa978d60ULL,0x00000000b263a0e2ULL,
+0xe1bb2841beee9906ULL,0x00000000936529bbULL,
+0xb479146ac25debebULL,0x00000000b98739daULL,
+0x05015d07693cec4bULL,0x0000000038e1ebc7ULL,
+0x252b8ba02966b39cULL,0x000000008b7b4632ULL,
+0x51d4319030d3065aULL,0x00000000834e7720ULL,
+0xd0e0ded03467e769ULL,0x000000004e7b3bcaULL,
+0x6dd6652e3e0e9006ULL,0x00000000c583da47ULL,
+0x2a64535ace3d7965ULL,0x00000000a8d1295bULL,
+0x50b288beb442c69eULL,0x000000007e370a31ULL,
+0xccca26e0e6218772ULL,0x00000000c3654b87ULL,
+0x3db7823ac8a7a6c3ULL,0x000000008e4a0a93ULL,
+0x006982add2a3ec1eULL,0x00000000a6a8ebeaULL,
+0x9dd100309e37354bULL,0x00000000379ab7c9ULL,
+0xa374d61824211684ULL,0x00000000ea1e666bULL,
+0x3ec9c8b17d2155e1ULL,0x000000002ab75c42ULL,
+0xe25b47de512884e6ULL,0x000000001a3d7b00ULL,
+0xbdcd9e294ee60094ULL,0x0000000046da4b6cULL,
+0x2cd1e6a51dd776d5ULL,0x00000000ba066e32ULL,
+0x7d7086052a2772b6ULL,0x000000009068e881ULL,
+0x0ba480ed8e31a693ULL,0x0000000027826166ULL,
+0xc411362892c187bdULL,0x00000000ae8b8eb9ULL,
+0xb977a79dc70a4c6cULL,0x00000000beab1ec4ULL,
+0xc2d8863dc4a33c61ULL,0x000000005ccdacb1ULL,
+0x0b6a1616a2ae3b99ULL,0x0000000007b98403ULL,
+0x91185b4e9528bc63ULL,0x00000000b93ee993ULL,
+0xca33d003de429814ULL,0x000000009d6b7419ULL,
+0x7862c0779d74a383ULL,0x0000000067121b5bULL,
+0x87d34a810050064bULL,0x000000000e42e00cULL,
+0x23e2ce4ece83c1b9ULL,0x0000000028c536b1ULL,
+0xc13926ad4eb47327ULL,0x00000000533b9caaULL,
+0x0bc76660312e2ba7ULL,0x00000000247e4e98ULL,
+0x7c3a5d27e5561448ULL,0x00000000e08648bbULL,
+0x0b04b0b20a590655ULL,0x00000000da61519eULL,
+0xcb766b676c3833cdULL,0x0000000088912e6cULL,
+0xea3e34d796c72cb6ULL,0x0000000006bd4e66ULL,
+0x3875cb050902281bULL,0x00000000751d3296ULL,
+0x251a8499823ee10dULL,0x000000002c00e3a4ULL,
+0xc67432b849d3e714ULL,0x000000005e8d2163ULL,
+0x469e730408235a71ULL,0x000000008c19c803ULL,
+0xca40619de41d0092ULL,0x00000000d85b927bULL,
+0x7093bd8a73aa7334ULL,0x000000005b3769d8ULL,
+0x6017b0bc85960c0cULL,0x00000000db010280ULL,
+0x798e03c52591446dULL,0x0000000099a5980bULL,
+0xebb112e792d83022ULL,0x0000000057495004ULL,
+0x75355aaee11e2e64ULL,0x000000006519cecdULL,
+0x5d292b0a4a79c181ULL,0x000000001635cb42ULL,
+0x9bd91c06beb1d404ULL,0x00000000abd434b1ULL,
+0x1d45db76a606c0d6ULL,0x00000000de905940ULL,
+0x227a1a87191a9aa2ULL,0x00000000a5d78a27ULL,
+0x9a56a3e969c75054ULL,0x000000009a0d17deULL,
+0xe3d93a905251b9e1ULL,0x00000000b4b7a6acULL,
+0xe99433a35bbbeb0bULL,0x00000000db009825ULL,
+0xee64c807bc3717e3ULL,0x00000000a80e18e2ULL,
+0x681584647068a9a7ULL,0x000000003debd58eULL,
+0xd8ea6cd565e5d2c4ULL,0x000000002ee22a92ULL,
+0x164727bbda3cba88ULL,0x00000000c7b2d792ULL,
+0xde170762282aeb4dULL,0x000000009d1edacdULL,
+0xa40b29b32e6b681cULL,0x0000000096715269ULL,
+0x140e28c8e97b5305ULL,0x000000007ca87bd8ULL,
+0xdc7cd3ec87eb134dULL,0x000000005810b9c6ULL,
+0x4a9013e9406be5d1ULL,0x00000000de2443e3ULL
+};
+
+/// @endcond 
+
+
+/************************************************************************
+** load order vector
+************************************************************************/
+
+
+/** 
+  @brief Load order vector from tables to a buffer
+
+  The function stores the precomputed order vector \f$v_1\f$ into the
+  array referred by ``p_dest``. That array must must be sufficiently
+  long to store a vector of the representation  \f$\rho_{15}\f$.
+
+  See [Sey22] for a decription of the properties of the vector \f$v_1\f$
+  in the representation  \f$\rho_{15}\f$ of the monster group.
+  
+  The standard way to obtain the number of entries of type ``unint_mmv_t``
+  required for a vector of the representation \f$\rho_{15}\f$
+  is to call function ``mm_aux_mmv_size(15)`` in file ``mm_aux.c``.
+
+  The order vector is stored in this module as a read-only table in
+  the same format as a vector of the representation \f$\rho_{15}\f$.
+  So loading the order vector is just a copy operation.
+*/
+// %%EXPORT px
+MM_REDUCE_API
+void mm_order_load_vector(uint_mmv_t *p_dest)
+{
+    memcpy(p_dest, ORDER_VECTOR_MMV, sizeof(ORDER_VECTOR_MMV));
+}
+
+
+/** 
+  @brief Return pointer to the precomputed order vector
+
+  The function returns a pointer to the precomputed order 
+  vector \f$v_1\f$ in the representation \f$\rho_{15}\f$. That
+  vector is stored in a read-only table of length
+  ``mm_aux_mmv_size(15)``. It is shared by all threads and must
+  not be modified.
+*/
+// %%EXPORT p
+MM_REDUCE_API
+const uint_mmv_t *mm_order_vector_ptr()
+{
+    return ORDER_VECTOR_MMV;
+}
+
+
+/************************************************************************
+** Check if a vector is equal to the order vector
+************************************************************************/
+
+
+/// @cond DO_NOT_DOCUMENT 
+
+// Macro ``reduce_w(w, t)`` reduces the integers stored in the 4-bit 
+// fields of variable ``w`` (of type ``uint_mmv_t``) modulo 15.
+// It uses an auxiliary variable ``t`` of type ``uint_mmv_t``.
+#define reduce_w(w, t) \
+    t = (w) & ((w) >> 2);  \
+    t = (t) & ((t) >> 1) & 0x1111111111111111ULL; \
+    w = (w) + (t) - ((t) << 4)
+
+
+// Compare ``n`` rows of 24 entries of the vector ``p_v`` with the 
+// corresponding rows of the order vector. Parameter ``ofs`` is the
+// offset of these rows in the vector.
+static inline int32_t check24(uint32_t ofs, uint_mmv_t *p_v, uint32_t n)
+{
+     uint_fast32_t i;
+     const uint_mmv_t *p_o = ORDER_VECTOR_MMV + ofs;
+     uint_mmv_t o0, o1, t;
+     p_v += ofs;
+     for (i = 0; i < n; ++i) {
+         o0 = p_v[0];
+         o1 = p_v[1] & 0xffffffffULL;
+         reduce_w(o0, t);
+         reduce_w(o1, t);
+         o0 ^= p_o[0];
+         o1 ^= p_o[1] & 0xffffffffULL;
+         if (o0 | o1) return 1;
+         p_v += 2;
+         p_o += 2;
+     }
+     return 0;
+}
+
+
+// Compare ``n`` rows of 64 entries of the vector ``p_v`` with the 
+// corresponding rows of the order vector. Parameter ``ofs`` is the
+// offset of these rows in the vector.
+static inline int32_t check64(uint32_t ofs, uint_mmv_t *p_v, uint32_t n)
+{
+     uint_fast32_t i;
+     const uint_mmv_t *p_o = ORDER_VECTOR_MMV + ofs;
+     uint_mmv_t o0, o1, t;
+     p_v += ofs;
+     for (i = 0; i < 2*n; ++i) {
+         o0 = p_v[0];
+         o1 = p_v[1];
+         reduce_w(o0, t);
+         reduce_w(o1, t);
+         o0 ^= p_o[0];
+         o1 ^= p_o[1];
+         if (o0 | o1) return 1;
+         p_v += 2;
+         p_o += 2;
+     }
+     return 0;
+}
+
+/// @endcond 
+
+
+/** 
+  @brief Compare vector with precomputed order vector
+  
+  The function compares the vector \f$v\f$ in the
+  representation \f$\rho_{15}\f$ of the monster group referred
+  by ``p_v`` with the precomputed order vector \f$v_1\f$.
+
+  The function returns 0 in case of equality and 1 otherwise.
+*/
+// %%EXPORT px
+MM_REDUCE_API
+int32_t mm_order_compare_vector(uint_mmv_t *p_v)
+{  
+    if (check24(MM_OP15_OFS_Z, p_v, 2*2048)) return 1;
+    if (check24(MM_OP15_OFS_A, p_v, 72)) return 1;
+    if (check64(MM_OP15_OFS_T, p_v, 759)) return 1;
+    if (check24(MM_OP15_OFS_X, p_v, 2048)) return 1;
+    return 0;
+}
+
+
+/** 
+  @brief Compare A part of vector with precomputed order vector
+  
+  The function compares the A part the vector \f$v\f$ in the
+  representation \f$\rho_{15}\f$ of the monster group referred
+  by ``p_v`` with the A part of the precomputed order
+  vector \f$v_1\f$.
+
+  The function returns 0 in case of equality and 1 otherwise.
+*/
+// %%EXPORT px
+MM_REDUCE_API
+int32_t mm_order_compare_vector_part_A(uint_mmv_t *p_v)
+{  
+    return check24(MM_OP15_OFS_A, p_v, 24);
+}
+
+
+/************************************************************************
+** Hash value of the vector 
+************************************************************************/
+
+
+
+
+/** 
+  @brief Return the hash value of the ordervector
+
+  The function returns the hash value of the precomuted order vector
+  as given by function ``mm_aux_hash`` in file ``mm_aux.c``.
+  
+*/
+// %%EXPORT px
+MM_REDUCE_API
+uint64_t mm_order_hash_vector(uint_mmv_t *p_dest)
+{
+    return 0x5982a5b3fed7aa61ULL;
+}
+
+
+//  %%GEN h
+//  %%GEN c
@@ -0,0 +1,325 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C header file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+#ifndef MM_REDUCE_H
+#define MM_REDUCE_H
+
+
+
+
+/** @file mm_reduce.h
+
+ Yet to be documented
+*/
+
+#include <stdint.h>
+#include <stdlib.h>
+#include "mat24_functions.h"
+#include "mmgroup_generators.h"
+#include "clifford12.h"   
+#include "mm_basics.h"   
+#include "mm_op3.h"   
+#include "mm_op15.h"   
+#include "mm_reduce.h"   
+
+
+
+/// @cond DO_NOT_DOCUMENT 
+
+
+#define MM_REDUCE_DLL  // We want a DLL!!
+
+
+// Generic helper definitions for shared library support
+#if defined _WIN32 || defined __CYGWIN__
+  #define MM_REDUCE_HELPER_DLL_IMPORT __declspec(dllimport)
+  #define MM_REDUCE_HELPER_DLL_EXPORT __declspec(dllexport)
+  #define MM_REDUCE_HELPER_DLL_LOCAL
+#else
+  #if __GNUC__ >= 4
+    #define MM_REDUCE_HELPER_DLL_IMPORT __attribute__ ((visibility ("default")))
+    #define MM_REDUCE_HELPER_DLL_EXPORT __attribute__ ((visibility ("default")))
+    #define MM_REDUCE_HELPER_DLL_LOCAL  __attribute__ ((visibility ("hidden")))
+  #else
+    #define MM_REDUCE_HELPER_DLL_IMPORT
+    #define MM_REDUCE_HELPER_DLL_EXPORT
+    #define MM_REDUCE_HELPER_DLL_LOCAL
+  #endif
+#endif
+
+
+// Now we use the generic helper definitions above to define MM_REDUCE_API 
+// and MM_REDUCE_LOCAL.
+// MM_REDUCE_API is used for the public API symbols. It either DLL imports 
+// or DLL exports (or does nothing for static build). 
+// MM_REDUCE_LOCAL is used for non-api symbols.
+
+#ifdef MM_REDUCE_DLL // defined if MM_BASICS is compiled as a DLL
+  #ifdef MM_REDUCE_DLL_EXPORTS // defined if we are building a DLL 
+                           // (instead of using it)
+    #define MM_REDUCE_API MM_REDUCE_HELPER_DLL_EXPORT
+  #else
+    #define MM_REDUCE_API MM_REDUCE_HELPER_DLL_IMPORT
+  #endif // MM_REDUCE_DLL_EXPORTS
+  #define MM_REDUCE_LOCAL MM_REDUCE_HELPER_DLL_LOCAL
+#else // MM_REDUCE_DLL is not defined: this means we build a static lib.
+  #define MM_REDUCE_API
+  #define MM_REDUCE_LOCAL
+#endif // MM_REDUCE_DLL
+
+
+
+
+/// @endcond  
+
+
+
+/// @cond DO_NOT_DOCUMENT 
+MM_REDUCE_API
+extern const uint32_t MM_ORDER_VECTOR_TAG_DATA[];
+MM_REDUCE_API
+int32_t mm_order_load_tag_data(uint32_t n, uint32_t *buf, uint32_t buf_size);
+MM_REDUCE_API
+void mm_order_load_vector(uint_mmv_t *p_dest);
+MM_REDUCE_API
+const uint_mmv_t *mm_order_vector_ptr();
+MM_REDUCE_API
+int32_t mm_order_compare_vector(uint_mmv_t *p_v);
+MM_REDUCE_API
+int32_t mm_order_compare_vector_part_A(uint_mmv_t *p_v);
+MM_REDUCE_API
+uint64_t mm_order_hash_vector(uint_mmv_t *p_dest);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_REDUCE_API
+int32_t mm_order_check_in_Gx0(uint_mmv_t *v, uint32_t *g, uint32_t mode, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_order_element_Gx0_work(uint32_t *g, uint32_t n, uint32_t *h, uint32_t o, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_order_element_Gx0(uint32_t *g, uint32_t n, uint32_t *h, uint32_t o);
+MM_REDUCE_API
+int32_t mm_order_element_M_work(uint32_t *g, uint32_t n, uint32_t o, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_order_element_M(uint32_t *g, uint32_t n, uint32_t o);
+MM_REDUCE_API
+int32_t mm_order_element_M_bsgs_work(uint32_t *g, uint32_t n, uint32_t o, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_order_element_M_many(uint32_t *a, uint32_t *ofs, uint32_t m, uint32_t o, uint32_t mode, uint32_t *orders, uint_mmv_t *work);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_REDUCE_API
+uint32_t mm_reduce_2A_axis_type(uint_mmv_t *v);
+MM_REDUCE_API
+int32_t mm_reduce_analyze_2A_axis(uint_mmv_t *v, uint32_t * r);
+MM_REDUCE_API
+uint32_t mm_reduce_find_type4(uint32_t *v, uint32_t n, uint32_t v2);
+MM_REDUCE_API
+int32_t  mm_reduce_load_axis(uint_mmv_t *v, uint32_t s);
+MM_REDUCE_API
+int32_t mm_reduce_map_axis(uint32_t *vt, uint_mmv_t *v, uint32_t *a, uint32_t n, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_reduce_vector_vp(uint32_t *vt, uint_mmv_t *v, uint32_t mode, uint32_t *r, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_reduce_vector_shortcut(uint32_t stage, uint32_t mode, uint32_t axis, uint32_t *r);
+MM_REDUCE_API
+int32_t mm_reduce_vector_vm(uint32_t *vt, uint_mmv_t *v, uint32_t *r, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_reduce_vector_v1(uint_mmv_t *v, uint32_t *r, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_reduce_M(uint32_t *a,  uint32_t n, uint32_t mode, uint32_t *r);
+MM_REDUCE_API
+int32_t mm_reduce_M_work(uint32_t *a, uint32_t n, uint32_t mode, uint32_t *r, uint_mmv_t *work);
+MM_REDUCE_API
+int32_t mm_reduce_M_many(uint32_t *a, uint32_t *ofs, uint32_t m, uint32_t mode, uint32_t *r, uint32_t len_r, uint32_t *r_ofs);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT 
+MM_REDUCE_API
+uint32_t mm_reduce_op_2A_axis_type(uint_mmv_t *v, uint32_t *g, uint32_t len_g, uint32_t mode);
+/// @endcond 
+
+/// @cond DO_NOT_DOCUMENT 
+#define MAX_GT_WORD_DATA 24
+
+/// @endcond 
+
+
+
+/** 
+   @brief Stucture to store a subword of generators of the Monster
+
+   This structure is required in file ``mm_shorten.c``.
+
+   It stores a subword of a word in the Monster in a node
+   of a circular doubly-linked list. There is a dedicated EOF (end of
+   file) mark in that list, in which member ``eof``is set to 1; and
+   elsewhere member ``eof`` is set to zero. Note that standard
+   operations like insertions and deletions are easier in a circular
+   doubly-linked list than in a standard doubly-linked list.
+
+   Member ``data`` contains a word \f$g\f$ of generators of the
+   subgroup \f$G_{x0}\f$; and member ``t_exp`` contains an
+   exponent \f$0 \leq e < 3\f$. Then the structure represents the
+   element  \f$g \tau^e\f$ of the Monster, where  \f$\tau\f$  is
+   the triality element in the subgroup  \f$N_0\f$ of the Monster.
+
+   The length of a word in member ``data`` is limited to the
+   size ``MAX_GT_WORD_DATA - 1``; and we will reduce that word
+   using function ``xsp2co1_reduce_word`` in module ``xsp2co1.c``
+   if necessary. Note that member ``data`` may contain atoms with
+   tags ``'x', 'y', 'd', 'p', 'l'`` only, and the inversion bit
+   in such an atom is always cleared.
+
+   Member ``img_Omega`` contains the image \f$g \cdot \Omega\f$,
+   where \f$\Omega\f$ is the standard frame of the Leech lattice
+   mod 2. Here ``img_Omega`` is given in Leech lattice encoding.
+   Member ``reduced`` is 1 if the word in member ``data`` is
+   reduced (by function ``xsp2co1_reduce_word``) and 0 otherwise.
+   
+*/
+struct gt_subword_s {
+    uint32_t eof;        ///< 0 means standard subword, 1 means EOF mark 
+    uint32_t length;     ///< Number of entries in component ``data``
+    uint32_t img_Omega;  ///< Image of \f$\Omega\f$ under element
+    uint32_t t_exp;      ///< Exponent of final tag 't' 
+    uint32_t reduced;    ///< True if part 'data' is reduced 
+    struct gt_subword_s *p_prev;     ///< Pointer to previous subword 
+    struct gt_subword_s *p_next;     ///< Pointer to previous subword 
+    uint32_t data[MAX_GT_WORD_DATA]; ///< Element of monster group 
+} ;
+
+
+
+
+/** 
+   @brief typedef for structure ``struct gt_subword_s``
+*/
+typedef struct gt_subword_s gt_subword_type;
+
+/** 
+   @brief Structure to store an array of entries of type ``gt_subword_type``
+
+   We allocate several entries of of type ``gt_subword_type`` with a
+   single call to function ``malloc``. This saves a considerable amount
+   of interaction with the operating system.
+
+   This structure contains an array of type ``gt_subword_type[]`` plus
+   the necessary bookkeeping information.
+*/
+struct gt_subword_buf_s {
+    uint32_t capacity;   ///< max No of type ``gt_subword_s `` entries
+    uint32_t n_used;     ///< used No of type ``gt_subword_s `` entries
+    struct gt_subword_buf_s *p_next; ///< Pointer to next buffer
+    gt_subword_type subwords[1];     ///< array of subwords in this buffer
+} ;
+
+
+
+
+/** 
+   @brief typedef for structure ``struct gt_subword_buf_s``
+*/
+typedef struct gt_subword_buf_s gt_subword_buf_type;
+
+
+
+/** 
+   @brief Stucture to store a word of generators of the Monster
+
+   This structure is required in file ``mm_shorten.c``.
+
+   It stores a word in the Monster in a circular
+   doubly-linked list of nodes of type ``gt_subword_type``. Each of
+   these node represents subword of that word, and there is a
+   dedicated EOF (end of file) mark in that list that marks both,
+   the beginning and the end of the list. Member ``p_end`` always
+   points to the EOF mark.
+
+   The structure contains a pointer ``p_node`` pointing to one of
+   the nodes of the list, which we will call the **current** node.
+   Some functions in these module take a pointer to this structure,
+   and the perform operations on the current node. The pointer may
+   be manipulated with function ``gt_word_seek``.
+
+*/
+typedef struct {
+    gt_subword_type *p_end;   ///< Pointer to the **end mark** subword 
+    gt_subword_type *p_node;  ///< Pointer to current subword 
+    gt_subword_type *p_free;  ///< Pointer to list of free subwords
+    int32_t reduce_mode;      ///< Mode for the reduction of a word 
+
+    /* memory management */
+    uint32_t is_allocated;    ///< 1 if this structure has been allcocated
+    gt_subword_buf_type *pb0; ///< pointer to first buffer
+    gt_subword_buf_type *pbe; ///< pointer to last buffer
+    gt_subword_buf_type buf;  ///< 1st buffer containing Array of subwords 
+} gt_word_type;
+
+
+
+
+
+
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+/// @cond DO_NOT_DOCUMENT 
+MM_REDUCE_API
+void gt_subword_clear(gt_subword_type *p_gtsub);
+MM_REDUCE_API
+gt_word_type *gt_word_alloc(uint32_t mode, void *p_buffer, size_t nbytes);
+MM_REDUCE_API
+void gt_word_free(gt_word_type *p_gt);
+MM_REDUCE_API
+void gt_word_clear(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_insert(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_delete(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_seek(gt_word_type *p_gt, int32_t pos, uint32_t set);
+MM_REDUCE_API
+int32_t gt_word_append_sub_part(gt_word_type *p_gt, uint32_t *a,  uint32_t n);
+MM_REDUCE_API
+int32_t gt_word_reduce_sub(gt_word_type *p_gt, uint32_t sub_mode);
+MM_REDUCE_API
+int32_t gt_word_rule_join(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_rule_t_xi_t(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_reduce_input(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_append(gt_word_type *p_gt, uint32_t *a, uint32_t n);
+MM_REDUCE_API
+uint32_t gt_word_n_subwords(uint32_t *a, uint32_t n);
+MM_REDUCE_API
+int32_t gt_word_length(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_reduce(gt_word_type *p_gt);
+MM_REDUCE_API
+int32_t gt_word_store(gt_word_type *p_gt, uint32_t *pa, uint32_t maxlen);
+MM_REDUCE_API
+int32_t gt_word_shorten(uint32_t *g, uint32_t n, uint32_t *g1, uint32_t n1max, uint32_t mode);
+/// @endcond  
+#ifdef __cplusplus
+}
+#endif
+
+
+/// @cond DO_NOT_DOCUMENT 
+MM_REDUCE_API
+void mm_order_load_vector_v1_mod3(uint_mmv_t *p_dest);
+MM_REDUCE_API
+const uint_mmv_t *mm_order_vector_v1_mod3_ptr();
+MM_REDUCE_API
+int32_t mm_order_compare_v1_mod3(uint_mmv_t *v);
+MM_REDUCE_API
+int32_t mm_order_find_Gx0_via_v1_mod3(uint_mmv_t *v,  uint32_t *g);
+/// @endcond 
+/// @cond DO_NOT_DOCUMENT
+MM_REDUCE_API
+int32_t mm_crt_op_word(uint_mmv_t *v7, uint_mmv_t *v31, uint_mmv_t *v127, uint_mmv_t *v255, uint32_t *g, uint32_t len_g, uint32_t check, uint_mmv_t *work);
+/// @endcond
+
+#endif  // #ifndef MM_REDUCE_H
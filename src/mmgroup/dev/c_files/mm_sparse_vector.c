@@ -0,0 +1,609 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+/** @file mm_sparse_vector.c
+
+ File ``mm_sparse_vector.c`` provides functions for dealing with
+ vectors in the representation of the monster group modulo a small
+ odd number ``p`` that are given in **sparse representation**.
+
+ The sparse representation of a vector is described in the
+ documentation of module ``mm_aux.c``. Here an entry of a sparse
+ vector is a 32-bit integer, where bits 27,...,8 encode a basis
+ vector (given as a tuple ``(tag, i0, i1)``) and bits 7,...,0
+ contain the coordinate of that basis vector.
+
+ In this module a sparse vector is **reduced** if its entries are
+ sorted and no basis vector occurs more than once. Here all
+ coordinates must be nonzero and reduced modulo ``p``.
+ For basis vectors with tags ``A, B, C`` we also require
+ ``i0 > i1``. For tag ``A`` we require ``i0 >= i1``.
+ Function ``mm_sparse_sort_reduce`` converts a sparse vector to a
+ reduced sparse vector. All other functions in this module (except
+ for function ``mm_sparse_sort_reduce``) expect reduced sparse
+ vectors as input and return reduced sparse vectors. Then vector
+ addition and the scalar product can be done by merging sorted
+ arrays.
+
+ Function ``mm_sparse_op_n0`` computes the operation of an element
+ of the subgroup \f$N_0\f$ of the monster on a sparse vector.
+ This is done without converting the vector to internal
+ representation. The formulas for the operation on the basis
+ vectors are taken from the reference implementation in module
+ ``mmgroup.tests.spaces.sparse_mm_space``.
+
+ Usually, the order of the parameters of functions in this file is
+ as in file ``mm_aux.c``.
+*/
+
+
+/// @cond DO_NOT_DOCUMENT
+#include <stdlib.h>
+#include <string.h>
+#include "mat24_functions.h"
+#include "mm_basics.h"
+/// @endcond
+
+// %%EXPORT_KWD MM_BASICS_API
+
+
+// %%GEN ch
+#ifdef __cplusplus
+extern "C" {
+#endif
+// %%GEN c
+
+//  %%GEN h
+//  %%GEN c
+
+
+
+/**********************************************************************
+*** Auxiliary functions
+**********************************************************************/
+
+/// @cond DO_NOT_DOCUMENT
+
+// Return the basis vector (tag, i, j) in sparse representation,
+// with coordinate 0.
+#define SP_ENTRY(tag, i, j) (((tag) << 25) + ((i) << 14) + ((j) << 8))
+
+// Return  -x (mod p) for 0 <= x < p
+#define NEG_MOD_P(x, p) ((x) ? (p) - (x) : 0)
+
+static int compare_uint32(const void *pa, const void *pb)
+{
+    uint32_t a = *(const uint32_t *)pa, b = *(const uint32_t *)pb;
+    return (a > b) - (a < b);
+}
+
+
+// Standardize a basis vector a in sparse representation. Here the
+// coordinate of a is ignored. The function returns the
+// standardized basis vector with coordinate 0, or 0 if a is not a
+// legal basis vector.
+static inline uint32_t purge_index(uint32_t a)
+{
+    uint_fast32_t tag = a >> 25, i = (a >> 14) & 0x7ff;
+    uint_fast32_t j = (a >> 8) & 0x3f;
+    switch (tag) {
+        case 2:  // tag B
+        case 3:  // tag C
+            if (i == j) return 0;
+            // Fall through to case tag A
+        case 1:  // tag A
+            if (i >= 24 || j >= 24) return 0;
+            if (i < j) return SP_ENTRY(tag, j, i);
+            break;
+        case 4:  // tag T
+            if (i >= 759) return 0;
+            break;
+        case 5:  // tag X
+        case 6:  // tag Z
+        case 7:  // tag Y
+            if (j >= 24) return 0;
+            break;
+        default:
+            return 0;
+    }
+    return SP_ENTRY(tag, i, j);
+}
+
+/// @endcond
+
+
+/**********************************************************************
+*** Reducing a sparse vector
+**********************************************************************/
+
+
+/**
+  @brief Convert a vector in sparse representation to reduced form
+
+  The function converts the vector ``sp`` of length ``length``
+  in sparse representation (modulo ``p``) to a reduced sparse
+  vector in place, as described in the header of this file.
+  Here illegal entries of ``sp`` are dropped, and the coordinates
+  of entries of ``sp`` referring to the same basis vector are
+  added.
+
+  The function returns the length of the reduced vector ``sp``,
+  or -1 in case of an error.
+*/
+// %%EXPORT px
+MM_BASICS_API
+int32_t mm_sparse_sort_reduce(uint32_t p, uint32_t *sp, uint32_t length)
+{
+    uint_fast32_t i, len_out = 0, a, index, last, sum;
+    if ((p & 1) == 0 || p < 3 || p > 255) return -1;
+    for (i = 0; i < length; ++i) {
+        a = sp[i];
+        index = purge_index(a);
+        if (index && (a & 0xff) % p) sp[len_out++] = index + (a & 0xff);
+    }
+    length = len_out;
+    if (length == 0) return 0;
+    qsort(sp, length, sizeof(uint32_t), compare_uint32);
+    last = sp[0] & 0xffffff00;
+    sum = 0;
+    len_out = 0;
+    for (i = 0; i < length; ++i) {
+        a = sp[i];
+        index = a & 0xffffff00;
+        if (index != last) {
+            sum %= p;
+            if (sum) sp[len_out++] = last + sum;
+            last = index; sum = 0;
+        }
+        sum += a & 0xff;
+    }
+    sum %= p;
+    if (sum) sp[len_out++] = last + sum;
+    return len_out;
+}
+
+
+/**********************************************************************
+*** Linear operations on reduced sparse vectors
+**********************************************************************/
+
+
+/**
+  @brief Linear combination of two reduced sparse vectors
+
+  Let ``sp1`` and ``sp2`` be reduced sparse vectors (modulo ``p``)
+  of length ``len1`` and ``len2``, respectively. The function
+  computes the reduced sparse vector ``sp1 + f * sp2`` by merging
+  the two input vectors; and it stores the result in the array
+  ``sp_out`` of length at least ``len1 + len2``. Array ``sp_out``
+  must not overlap with any of the input vectors.
+
+  The function returns the length of the output vector, or -1
+  in case of an error.
+*/
+// %%EXPORT px
+MM_BASICS_API
+int32_t mm_sparse_add(uint32_t p, uint32_t *sp1, uint32_t len1, uint32_t *sp2, uint32_t len2, int32_t f, uint32_t *sp_out)
+{
+    uint_fast32_t i1 = 0, i2 = 0, len_out = 0, a1, a2, v;
+    if ((p & 1) == 0 || p < 3 || p > 255) return -1;
+    f %= (int32_t)p;
+    if (f < 0) f += p;
+    while (i1 < len1 && i2 < len2) {
+        a1 = sp1[i1] & 0xffffff00; a2 = sp2[i2] & 0xffffff00;
+        if (a1 < a2) {
+            sp_out[len_out++] = sp1[i1++];
+        } else if (a1 > a2) {
+            v = (sp2[i2++] & 0xff) * f % p;
+            if (v) sp_out[len_out++] = a2 + v;
+        } else {
+            v = ((sp1[i1++] & 0xff) + (sp2[i2++] & 0xff) * f) % p;
+            if (v) sp_out[len_out++] = a1 + v;
+        }
+    }
+    while (i1 < len1) sp_out[len_out++] = sp1[i1++];
+    while (i2 < len2) {
+        a2 = sp2[i2] & 0xffffff00;
+        v = (sp2[i2++] & 0xff) * f % p;
+        if (v) sp_out[len_out++] = a2 + v;
+    }
+    return len_out;
+}
+
+
+/**
+  @brief Multiply a reduced sparse vector with a scalar
+
+  The function multiplies the reduced sparse vector ``sp``
+  (modulo ``p``) of length ``length`` with the scalar ``f``
+  in place. It returns the length of the result, or -1 in case
+  of an error. Note that the result has length 0 if ``f`` is
+  divisible by ``p``.
+*/
+// %%EXPORT px
+MM_BASICS_API
+int32_t mm_sparse_scale(uint32_t p, uint32_t *sp, uint32_t length, int32_t f)
+{
+    uint_fast32_t i, len_out = 0, v;
+    if ((p & 1) == 0 || p < 3 || p > 255) return -1;
+    f %= (int32_t)p;
+    if (f < 0) f += p;
+    if (f == 0) return 0;
+    for (i = 0; i < length; ++i) {
+        v = (sp[i] & 0xff) * f % p;
+        if (v) sp[len_out++] = (sp[i] & 0xffffff00) + v;
+    }
+    return len_out;
+}
+
+
+
+/**
+  @brief Scalar product of two reduced sparse vectors
+
+  The function returns the scalar product of the reduced sparse
+  vectors ``sp1`` and ``sp2`` (modulo ``p``) of length ``len1``
+  and ``len2``, respectively. The result is reduced modulo ``p``.
+  Here the scalar product is the symmetric bilinear form invariant
+  under the monster, such that the norm of a vector is the sum of
+  the squares of its entries, where for all entries with index
+  ``('A', i0, i1)``, ``i0 != i1``, the doubled square of the entry
+  must be taken instead.
+
+  The function returns -1 in case of an error.
+*/
+// %%EXPORT px
+MM_BASICS_API
+int32_t mm_sparse_scalprod(uint32_t p, uint32_t *sp1, uint32_t len1, uint32_t *sp2, uint32_t len2)
+{
+    uint_fast32_t i1 = 0, i2 = 0, a1, a2, v;
+    uint64_t sum = 0;
+    if ((p & 1) == 0 || p < 3 || p > 255) return -1;
+    while (i1 < len1 && i2 < len2) {
+        a1 = sp1[i1] & 0xffffff00; a2 = sp2[i2] & 0xffffff00;
+        if (a1 < a2) ++i1;
+        else if (a1 > a2) ++i2;
+        else {
+            v = (sp1[i1++] & 0xff) * (sp2[i2++] & 0xff);
+            // Double v for tag A if i0 != i1
+            if ((a1 >> 25) == 1 && ((a1 >> 14) & 0x7ff) != ((a1 >> 8) & 0x3f))
+                v <<= 1;
+            sum += v;
+        }
+    }
+    return (int32_t)(sum % p);
+}
+
+
+/**********************************************************************
+*** Monomial operation of the group N_x0 on a basis vector
+**********************************************************************/
+
+/// @cond DO_NOT_DOCUMENT
+
+// The following functions compute the monomial operation of a
+// generator of the group N_x0 on a basis vector given by the
+// entry ``a`` in sparse representation. The coordinate of ``a``
+// is ignored. The functions return the image of the basis vector
+// in sparse representation with coordinate 0 or 1. Here a
+// coordinate of 1 means that the basis vector is negated.
+// These functions are C versions of the functions mul_<tag><g>
+// in module mmgroup.tests.spaces.sparse_mm_space.
+
+
+// Operation of x_delta * x_pi. Here delta is a cocode element,
+// pi is a permutation in M_24, and rep is the standard
+// representative of delta * pi in the automorphism group
+// of the Parker loop, as computed by function mat24_perm_to_autpl.
+static inline uint32_t
+op_p_entry(uint32_t a, uint32_t delta, uint8_t *pi, uint32_t *rep)
+{
+    uint_fast32_t tag = a >> 25, i = (a >> 14) & 0x7ff;
+    uint_fast32_t j = (a >> 8) & 0x3f, s = 0, d, c, d1, c1, t;
+    uint_fast32_t odd = (delta >> 11) & 1;
+    switch (tag) {
+        case 3:  // tag C
+            s = odd;
+            // Fall through to cases tag A, B
+        case 1:  // tag A
+        case 2:  // tag B
+            i = pi[i]; j = pi[j];
+            if (i < j) {t = i; i = j; j = t;}
+            return SP_ENTRY(tag, i, j) + s;
+        case 4:  // tag T
+            d = mat24_octad_to_gcode(i);
+            c = mat24_suboctad_to_cocode(j, d);
+            d1 = mat24_op_ploop_autpl(d, rep);
+            c1 = mat24_op_cocode_perm(c, pi);
+            s = ((d1 >> 12) ^ (odd & mat24_suboctad_weight(j))) & 1;
+            i = mat24_gcode_to_octad(d1 & 0xfff, 0);
+            j = mat24_cocode_to_suboctad(c1, d1 & 0xfff);
+            return SP_ENTRY(tag, i, j) + s;
+        case 5:  // tag X
+            d1 = mat24_op_ploop_autpl(i, rep);
+            s = d1 >> 12;
+            if (odd) {
+                s ^= mat24_scalar_prod(i, mat24_vect_to_cocode(1 << j));
+                s ^= mat24_pow_ploop(i, 2) >> 12;
+            }
+            return SP_ENTRY(tag, d1 & 0x7ff, pi[j]) + (s & 1);
+        case 6:  // tag Z
+            d1 = mat24_op_ploop_autpl(i, rep);
+            s = d1 >> 12;
+            if (odd) {
+                tag = 7; s ^= d1 >> 11;
+            }
+            return SP_ENTRY(tag, d1 & 0x7ff, pi[j]) + (s & 1);
+        case 7:  // tag Y
+            d1 = mat24_op_ploop_autpl(i, rep);
+            s = (d1 >> 12) ^ (d1 >> 11);
+            if (odd) {
+                tag = 6; s ^= d1 >> 11;
+            }
+            return SP_ENTRY(tag, d1 & 0x7ff, pi[j]) + (s & 1);
+        default:
+            return 0;
+    }
+}
+
+
+// Operation of x_e, e an element of the Parker loop.
+static inline uint32_t op_x_entry(uint32_t a, uint32_t e)
+{
+    uint_fast32_t tag = a >> 25, i = (a >> 14) & 0x7ff;
+    uint_fast32_t j = (a >> 8) & 0x3f, s = 0, d, ed;
+    switch (tag) {
+        case 1:  // tag A
+            return a & 0xffffff00;
+        case 2:  // tag B
+        case 3:  // tag C
+            s = mat24_scalar_prod(e,
+                   mat24_vect_to_cocode((1UL << i) ^ (1UL << j)));
+            break;
+        case 4:  // tag T
+            d = mat24_octad_to_gcode(i);
+            s = mat24_ploop_comm(d, e);
+            s ^= mat24_scalar_prod(e, mat24_suboctad_to_cocode(j, d));
+            break;
+        case 5:  // tag X
+            s = mat24_scalar_prod(e, mat24_vect_to_cocode(1UL << j));
+            s ^= mat24_ploop_comm(i, e);
+            break;
+        case 6:  // tag Z
+            ed = mat24_mul_ploop(mat24_pow_ploop(e, 3), i);
+            return SP_ENTRY(tag, ed & 0x7ff, j) + ((ed >> 12) & 1);
+        case 7:  // tag Y
+            ed = mat24_mul_ploop(mat24_pow_ploop(e, 3), i);
+            s = (ed >> 12) ^ (ed >> 11);
+            return SP_ENTRY(tag, ed & 0x7ff, j) + (s & 1);
+        default:
+            return 0;
+    }
+    return (a & 0xffffff00) + (s & 1);
+}
+
+
+// Operation of y_e, e an element of the Parker loop.
+static inline uint32_t op_y_entry(uint32_t a, uint32_t e)
+{
+    uint_fast32_t tag = a >> 25, i = (a >> 14) & 0x7ff;
+    uint_fast32_t j = (a >> 8) & 0x3f, s = 0, d, c, de;
+    switch (tag) {
+        case 1:  // tag A
+            s = mat24_scalar_prod(e,
+                   mat24_vect_to_cocode((1UL << i) ^ (1UL << j)));
+            break;
+        case 2:  // tag B
+        case 3:  // tag C
+            s = mat24_scalar_prod(e,
+                   mat24_vect_to_cocode((1UL << i) ^ (1UL << j))) & 1;
+            // exchange tags B and C if s is odd
+            return SP_ENTRY(tag ^ s, i, j) + s;
+        case 4:  // tag T
+            d = mat24_octad_to_gcode(i);
+            c = mat24_suboctad_to_cocode(j, d);
+            s = mat24_scalar_prod(e, c);
+            j = mat24_cocode_to_suboctad(mat24_ploop_cap(d, e) ^ c, d);
+            return SP_ENTRY(tag, i, j) + (s & 1);
+        case 5:  // tag X
+            de = mat24_mul_ploop(i, e);
+            return SP_ENTRY(tag, de & 0x7ff, j) + ((de >> 12) & 1);
+        case 6:  // tag Z
+            de = mat24_mul_ploop(i, e);
+            s = mat24_scalar_prod(e, mat24_vect_to_cocode(1UL << j));
+            s ^= de >> 12;
+            return SP_ENTRY(tag, de & 0x7ff, j) + (s & 1);
+        case 7:  // tag Y
+            s = mat24_scalar_prod(e, mat24_vect_to_cocode(1UL << j));
+            s ^= mat24_ploop_comm(i, e & 0xfff);
+            break;
+        default:
+            return 0;
+    }
+    return (a & 0xffffff00) + (s & 1);
+}
+
+
+// Monomial operation of the triality element tau**e, e = 1, 2,
+// on a basis vector with tag X, Y, or Z.
+static inline uint32_t op_t_xyz_entry(uint32_t a, uint32_t e)
+{
+    // Map tags X, Z, Y to 0, 2, 1
+    static const uint8_t TAG_INDEX[8] = {0,0,0,0, 0,0,2,1};
+    // Map indices 0, 1, 2 to tags X, Y, Z
+    static const uint8_t TAGS[5] = {5, 7, 6, 5, 7};
+    // Sign functions: 0 = none, 1 = XY, 2 = YZ, 3 = ZX
+    static const uint8_t SIGNS[3][3] = {{0,1,3}, {0,2,1}, {0,3,2}};
+    uint_fast32_t tag = a >> 25, d = (a >> 14) & 0x7ff;
+    uint_fast32_t j = (a >> 8) & 0x3f, s = 0, index;
+    index = TAG_INDEX[tag];
+    switch (SIGNS[index][e]) {
+        case 1:
+            s = mat24_scalar_prod(d, mat24_vect_to_cocode(1UL << j));
+            break;
+        case 2:
+            s = mat24_scalar_prod(d, mat24_vect_to_cocode(1UL << j));
+            s ^= mat24_pow_ploop(d, 2) >> 12;
+            break;
+        case 3:
+            s = mat24_pow_ploop(d, 2) >> 12;
+            break;
+        default:
+            break;
+    }
+    return SP_ENTRY(TAGS[index + e], d, j) + (s & 1);
+}
+
+/// @endcond
+
+
+/**********************************************************************
+*** Operation of the group N_0 on a sparse vector
+**********************************************************************/
+
+/// @cond DO_NOT_DOCUMENT
+
+// Compute the operation of the triality element tau**e, e = 1, 2,
+// on the reduced sparse vector sp (modulo p) of length len.
+// Store the (unreduced) result in sp_out and return the length
+// of the result. sp_out must have length at least 64 * len.
+static uint32_t op_t_sparse(uint32_t p, uint32_t *sp, uint32_t len, uint32_t e, uint32_t *sp_out)
+{
+    // Entries of the 3 times 3 matrices for the operation on
+    // tags A, B, C (off diagonal), to be multiplied by 1/2.
+    static const int8_t MAT3[3][3][3] = {
+        {{0,0,0}, {0,0,0}, {0,0,0}},
+        {{0,2,-2}, {1,1,1}, {1,-1,-1}},
+        {{0,2,2}, {1,1,-1}, {-1,1,-1}},
+    };
+    uint_fast32_t k, n_out = 0, a, tag, i, j, v, l, half, eighth;
+    uint_fast32_t w_i, v_neg;
+    half = (p + 1) >> 1;
+    eighth = half * half % p * half % p;
+    for (k = 0; k < len; ++k) {
+        a = sp[k];
+        tag = a >> 25; i = (a >> 14) & 0x7ff; j = (a >> 8) & 0x3f;
+        v = a & 0xff;
+        switch (tag) {
+            case 1:  // tag A
+                if (i == j) {
+                    sp_out[n_out++] = a;
+                    break;
+                }
+                // Fall through to cases tag B and C
+            case 2:  // tag B
+            case 3:  // tag C
+                v = v * half % p;
+                v_neg = NEG_MOD_P(v, p);
+                for (l = 0; l < 3; ++l) {
+                    int_fast32_t m = MAT3[e][tag - 1][l];
+                    if (m == 0) continue;
+                    sp_out[n_out++] = SP_ENTRY(l + 1, i, j) +
+                      (m == 2 ? 2 * v % p : m == -2 ? 2 * v_neg % p :
+                       m > 0 ? v : v_neg);
+                }
+                break;
+            case 4:  // tag T
+                v = v * eighth % p;
+                v_neg = NEG_MOD_P(v, p);
+                w_i = mat24_suboctad_weight(j);
+                for (l = 0; l < 64; ++l) {
+                    uint_fast32_t s = mat24_suboctad_scalar_prod(j, l);
+                    s ^= e == 1 ? mat24_suboctad_weight(l) : w_i;
+                    sp_out[n_out++] = SP_ENTRY(4, i, l) +
+                        ((s & 1) ? v_neg : v);
+                }
+                break;
+            default:  // tags X, Z, Y
+                a = op_t_xyz_entry(a, e);
+                sp_out[n_out++] = (a & 0xffffff00) +
+                    ((a & 1) ? NEG_MOD_P(v, p) : v);
+                break;
+        }
+    }
+    return n_out;
+}
+
+/// @endcond
+
+
+
+/**
+  @brief Operation of an element of the group \f$N_0\f$ on a sparse vector
+
+  Let ``sp`` be a reduced sparse vector (modulo ``p``) of length
+  ``length``. The function computes the image of ``sp`` under the
+  operation of an element ``g`` of the subgroup \f$N_0\f$ of the
+  monster. Here ``g`` is given as an array of five integers, as
+  in function ``mm_group_n_mul_word_scan`` in
+  file ``mm_group_n.c``; so we have
+
+  \f$g = \tau^{g_0} y_{g_1} x_{g_2} x_{g_3} x_{g_4}\f$ ,
+
+  where \f$\tau\f$ is the triality element, \f$g_1, g_2\f$ are
+  elements of the Parker loop,  \f$g_3\f$ is an element of the
+  Golay cocode, and \f$g_4\f$ is the number of a permutation
+  in \f$M_{24}\f$.
+
+  The reduced result is stored in the array ``sp_out``; and the
+  function returns the length of the result. Array ``sp_out``
+  must have length at least ``64 * length`` if \f$g_0\f$ is not
+  divisible by 3 and length at least ``length`` otherwise. Arrays
+  ``sp`` and ``sp_out`` may be equal in case \f$g_0 = 0\f$ only.
+
+  The operation of the subgroup \f$N_{x0}\f$ of \f$N_0\f$ is
+  monomial. The triality element \f$\tau\f$ operates monomially
+  on basis vectors with tags ``X, Y, Z``. An entry with tag ``B``,
+  ``C``, or ``T``, or an off-diagonal entry with tag ``A`` is
+  mapped to a linear combination of at most 3 or 64 entries by
+  \f$\tau\f$.
+
+  The function returns -1 in case of an error.
+*/
+// %%EXPORT px
+MM_BASICS_API
+int32_t mm_sparse_op_n0(uint32_t p, uint32_t *sp, uint32_t length, uint32_t *g, uint32_t *sp_out)
+{
+    uint8_t pi[24];
+    uint32_t rep[12];
+    uint_fast32_t k, e, f_y, e_x, delta, a, v, n_pi, mono;
+    if ((p & 1) == 0 || p < 3 || p > 255) return -1;
+    e = g[0] % 3; f_y = g[1] & 0x1fff; e_x = g[2] & 0x1fff;
+    delta = g[3] & 0xfff; n_pi = g[4];
+    if (e) {
+        length = op_t_sparse(p, sp, length, e, sp_out);
+        sp = sp_out;
+    }
+    mono = f_y | e_x | delta | n_pi;
+    if (mono) {
+        if (mat24_m24num_to_perm(n_pi, pi)) return -1;
+        mat24_perm_to_autpl(delta, pi, rep);
+    }
+    for (k = 0; k < length; ++k) {
+        a = sp[k] & 0xffffff00;
+        v = sp[k] & 0xff;
+        if (mono) {
+            if (f_y) a = op_y_entry(a, f_y) ^ (a & 1);
+            if (e_x) a = op_x_entry(a, e_x) ^ (a & 1);
+            if (delta | n_pi) a = op_p_entry(a, delta, pi, rep) ^ (a & 1);
+            // Here bit 0 of a is the sign of the monomial operation
+            if (a & 1) v = NEG_MOD_P(v, p);
+        }
+        sp_out[k] = (a & 0xffffff00) + v;
+    }
+    return mm_sparse_sort_reduce(p, sp_out, length);
+}
+
+
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+// %%GEN ch
+#ifdef __cplusplus
+}
+#endif
+//  %%GEN c
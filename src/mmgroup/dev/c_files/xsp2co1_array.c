@@ -0,0 +1,466 @@
+/////////////////////////////////////////////////////////////////////////////
+// This C file has been created automatically. Do not edit!!!
+/////////////////////////////////////////////////////////////////////////////
+
+/** @file xsp2co1_array.c
+  File ``xsp2co1_array.c`` contains functions for computing in
+  arrays of elements of the subgroup \f$G_{x0}\f$ (of structure
+  \f$2^{1+24}.\mbox{Co}_1\f$) of the monster.
+
+  Here an array of \f$n\f$ elements of \f$G_{x0}\f$ is stored
+  in an array of \f$26 n\f$ integers of type ``uint64_t``, where
+  each element is stored in **G_x0 representation** as in
+  file ``xsp2co1.c``. The functions in this file apply the
+  corresponding function for a single element of \f$G_{x0}\f$
+  to all elements of an array in a single loop. They are used
+  in the python class ``Xsp2_Co1Array``.
+
+  This file also contains functions for *compiling* an element
+  of \f$G_{x0}\f$. A compiled element contains precomputed tables
+  for the operation of that element on many vectors of the Leech
+  lattice modulo 2 and modulo 3.
+
+  Unless stated otherwise, the functions in this file return the
+  number \f$n\f$ of elements processed in case of success. In case
+  of an error, they return the (negative) error code returned by
+  the function for a single element that has failed.
+*/
+
+
+/*************************************************************************
+** External references
+*************************************************************************/
+
+/// @cond DO_NOT_DOCUMENT
+#include <string.h>
+#include "mat24_functions.h"
+#define MMGROUP_GENERATORS_INTERN
+#include "mmgroup_generators.h"
+#define CLIFFORD12_INTERN
+#include "clifford12.h"
+/// @endcond
+
+
+// %%EXPORT_KWD CLIFFORD12_API
+
+
+// %%GEN ch
+#ifdef __cplusplus
+extern "C" {
+#endif
+// %%GEN c
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+/// @cond DO_NOT_DOCUMENT
+
+// Offset of the images of the unit vectors modulo 3 in a
+// compiled element of G_x0
+#define OFS_COMPILED_LEECH3 768
+
+/// @endcond
+
+
+
+/*************************************************************************
+*** Group operations in arrays of elements of G_x0
+*************************************************************************/
+
+
+/**
+  @brief Multiply two arrays of elements of  \f$G_{x0}\f$
+
+  Let \f$g_i, h_i\f$ be stored in the arrays ``a1, a2``, for
+  \f$0 \leq i < n\f$. The function computes the products
+  \f$g_i \cdot h_i\f$  and stores them in the array ``a3``.
+
+  Arrays ``a1, a2, a3`` may overlap if they are equal.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_mul_elem_array(uint64_t *a1, uint64_t *a2, uint64_t *a3, uint32_t n)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_mul_elem(a1 + 26 * i, a2 + 26 * i, a3 + 26 * i);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/**
+  @brief Invert an array of elements of \f$G_{x0}\f$
+
+  Let \f$g_i\f$ be stored in the array ``a1``, for
+  \f$0 \leq i < n\f$. The function computes the
+  inverses \f$g_i^{-1}\f$ and stores them in the array ``a2``.
+
+  Arrays ``a1, a2`` may overlap if they are equal.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_inv_elem_array(uint64_t *a1, uint64_t *a2, uint32_t n)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_inv_elem(a1 + 26 * i, a2 + 26 * i);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/**
+  @brief Exponentiation of an array of elements of \f$G_{x0}\f$
+
+  Let \f$g_i\f$ be stored in the array ``a1``, for
+  \f$0 \leq i < n\f$. The function computes the
+  powers \f$g_i^e\f$ and stores them in the array ``a2``.
+  Here \f$-2^{63} < e < 2^{63}\f$ must hold.
+
+  Arrays ``a1, a2`` may overlap if they are equal.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_power_elem_array(uint64_t *a1, int64_t e, uint64_t *a2, uint32_t n)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_power_elem(a1 + 26 * i, e, a2 + 26 * i);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/**
+  @brief Reduce an array of elements of \f$G_{x0}\f$
+
+  The function reduces the \f$n\f$ elements of \f$G_{x0}\f$
+  stored in the array ``a`` as in function ``xsp2co1_reduce_elem``.
+  Then two elements of the array are equal if and only if their
+  representations in the array are equal.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_reduce_elem_array(uint64_t *a, uint32_t n)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_reduce_elem(a + 26 * i);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/*************************************************************************
+*** Properties of elements in an array of elements of G_x0
+*************************************************************************/
+
+
+/**
+  @brief Compute the orders of an array of elements of \f$G_{x0}\f$
+
+  Let \f$g_i\f$ be stored in the array ``a``, for
+  \f$0 \leq i < n\f$. The function stores the order of
+  \f$g_i\f$ in ``orders[i]``.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_order_elem_array(uint64_t *a, uint32_t n, int32_t *orders)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_order_elem(a + 26 * i);
+        if (res < 0) return res;
+        orders[i] = res;
+    }
+    return n;
+}
+
+
+/**
+  @brief Compute the subtypes of an array of elements of \f$G_{x0}\f$
+
+  Let \f$g_i\f$ be stored in the array ``a``, for
+  \f$0 \leq i < n\f$. The function stores the subtype of
+  \f$g_i\f$ in ``subtypes[i]``, as computed by
+  function ``xsp2co1_elem_subtype``.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_elem_subtype_array(uint64_t *a, uint32_t n, int32_t *subtypes)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_elem_subtype(a + 26 * i);
+        if (res < 0) return res;
+        subtypes[i] = res;
+    }
+    return n;
+}
+
+
+/**
+  @brief Compute characters of an array of elements of \f$G_{x0}\f$
+
+  Let \f$g_i\f$ be stored in the array ``a``, for
+  \f$0 \leq i < n\f$. The function computes the characters
+  of \f$g_i\f$ as in function ``xsp2co1_traces_fast`` and
+  stores them in ``ptrace[4*i],..., ptrace[4*i+3]``.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_traces_fast_array(uint64_t *a, uint32_t n, int32_t *ptrace)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_traces_fast(a + 26 * i, ptrace + 4 * i);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/**
+  @brief Compute fingerprints of an array of elements of \f$G_{x0}\f$
+
+  Let \f$g_i\f$ be stored in the array ``a``, for
+  \f$0 \leq i < n\f$. The function computes the fingerprint of
+  the class of \f$g_i\f$ as in function ``xsp2co1_elem_fingerprint``
+  and stores it in ``fp[7*i],..., fp[7*i+6]``.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_elem_fingerprint_array(uint64_t *a, uint32_t n, int32_t *fp)
+{
+    uint_fast32_t i;
+    int32_t res;
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_elem_fingerprint(a + 26 * i, fp + 7 * i);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/*************************************************************************
+*** Arrays of random elements of G_x0
+*************************************************************************/
+
+
+/**
+  @brief Generate an array of random elements of \f$G_{x0}\f$
+
+  The function stores \f$n\f$ uniform distributed random elements
+  of the group \f$G_{x0}\f$ in the array ``a``, using
+  function ``xsp2co1_rand_word_G_x0``. Parameter ``seed`` must be
+  a seed for a random generator as  described in
+  file ``gen_random.c``.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_rand_elem_G_x0_array(uint64_t *a, uint32_t n, uint64_t *seed)
+{
+    uint_fast32_t i;
+    int32_t res;
+    uint32_t w[16];
+    for (i = 0; i < n; ++i) {
+        res = xsp2co1_rand_word_G_x0(w, seed);
+        if (res < 0) return res;
+        res = xsp2co1_set_elem_word(a + 26 * i, w, res);
+        if (res < 0) return res;
+    }
+    return n;
+}
+
+
+/*************************************************************************
+*** Compiled elements of G_x0
+*************************************************************************/
+
+
+/**
+  @brief Compile an element of \f$G_{x0}\f$
+
+  Let \f$g \in G_{x0}\f$ be stored in the array ``elem``
+  in **G_x0 representation**. The function stores a compiled
+  version of \f$g\f$ in the array ``c`` of length 792.
+  Functions ``xsp2co1_compiled_op_leech2`` and
+  ``xsp2co1_compiled_op_leech3`` use the compiled version of
+  \f$g\f$ for computing the operation of \f$g\f$ on arrays of
+  vectors. Here an entry of ``c`` is as follows:
+
+  ``c[256*k + b]``, \f$0 \leq k < 3, 0 \leq b < 256\f$: Let
+  \f$x = 2^{8k} \cdot b\f$ be an element of \f$Q_{x0}\f$ in
+  **Leech lattice encoding**, and let \f$x_i\f$ be the elements
+  of \f$Q_{x0}\f$ given by the bits of \f$x\f$, with sign bit 0.
+  Then bits 24,...,0 of ``c[256*k + b]`` contain the product of
+  the images \f$g^{-1} x_i g\f$ over all bits of \f$x\f$. Bits
+  55,...,32 contain the sum of certain vectors which are used
+  for correcting the sign of the image of a product of the
+  elements \f$x_i\f$, see the implementation for details.
+
+  ``c[768 + i]``, \f$0 \leq i < 24\f$: the image of the \f$i\f$-th
+  unit vector of the Leech lattice modulo 3 under \f$g\f$,
+  in **Leech lattice mod 3 encoding**. Here the operation of
+  \f$g\f$ on the Leech lattice is given by the matrix computed
+  by function ``xsp2co1_elem_to_leech_op``. In particular, \f$g\f$
+  maps the standard short vector ``STD_V3`` to  ``elem[0]``.
+
+  The function returns 0 in case of success and a negative
+  value in case of an error.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_elem_compile(uint64_t *elem, uint64_t *c)
+{
+    uint64_t a[24], m, w, x;
+    int8_t l[576];
+    int32_t res;
+    uint_fast32_t i, j, k, b;
+
+    // Let a[i] be the image of the i-th basis vector of Q_x0
+    for (i = 0; i < 24; ++i) a[i] = 1ULL << i;
+    res = xsp2co1_xspecial_conjugate(elem, 24, a, 1);
+    if (res < 0) return res;
+
+    // Let x = x_{i_1} ... x_{i_k} with i_1 < ... < i_k. The sign
+    // of that product differs from the sign of x by the sum of the
+    // terms beta(x_{i_j}, x_{i_l}), j < l, where beta is the
+    // bilinear form given by the commutator of Q_x0 in function
+    // gen_leech2_mul(). A similar statement holds for the product
+    // of the images a[i_j]. So we store in bits 55...32 of a[i]
+    // the bit vector m with bit j set if i < j and
+    // beta(a[i], a[j]) + beta(x_i, x_j) = 1. Then the sign of the
+    // image of x must be corrected by the parity of w & x, where w
+    // is the sum of the bit vectors m for all bits i in x.
+    for (i = 0; i < 24; ++i) {
+        m = 0;
+        for (j = i + 1; j < 24; ++j) {
+            w = (a[j] >> 12) & a[i] & 0xfff;
+            mat24_def_parity12(w);
+            m |= (w ^ (j == i + 12)) << j;
+        }
+        a[i] = (a[i] & 0x1ffffffULL) | (m << 32);
+    }
+
+    // Store the tables for the operation on Q_x0
+    for (k = 0; k < 3; ++k) {
+        c[256 * k] = 0;
+        for (b = 1; b < 256; ++b) {
+            j = mat24_lsbit24(b);
+            c[256 * k + b] = c[256 * k + (b & (b - 1))] ^ a[8 * k + j];
+        }
+    }
+
+    // Store the images of the unit vectors modulo 3. Here the
+    // operation of the group element is given by 1/8 * l, and
+    // we have 1/8 = -1 (mod 3).
+    res = xsp2co1_elem_to_leech_op(elem, l);
+    if (res < 0) return res;
+    for (i = 0; i < 24; ++i) {
+        x = 0;
+        for (j = 0; j < 24; ++j) {
+            b = (uint32_t)(l[24 * i + j] % 3 + 3) % 3;
+            if (b) x |= 1ULL << (j + (b == 1 ? 24 : 0));
+        }
+        c[OFS_COMPILED_LEECH3 + i] = x;
+    }
+    return 0;
+}
+
+
+/**
+  @brief Operation of a compiled element on \f$Q_{x0}\f$
+
+  Let \f$g \in G_{x0}\f$ be a compiled element stored in the
+  array ``c``, as returned by function ``xsp2co1_elem_compile``.
+  Let \f$x_0,\ldots,x_{n-1}\f$ a list of \f$n\f$ elements of
+  \f$Q_{x0}\f$ stored in the the array ``a``
+  in **Leech lattice encoding**.
+
+  Then the function replaces the element \f$x_i\f$ by
+  \f$g^{-1} x_i g\f$ for \f$0 \leq i < n\f$. So this function
+  computes the same operation as
+  function ``xsp2co1_xspecial_conjugate`` (with ``sign = 1``),
+  but it is much faster for large \f$n\f$. The function
+  returns \f$n\f$.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_compiled_op_leech2(uint64_t *c, uint32_t *a, uint32_t n)
+{
+    uint_fast32_t i;
+    uint64_t v, x, w;
+    for (i = 0; i < n; ++i) {
+        x = a[i];
+        v = c[x & 0xff] ^ c[256 + ((x >> 8) & 0xff)]
+             ^ c[512 + ((x >> 16) & 0xff)];
+        w = (v >> 32) & x;
+        w = (w ^ (w >> 12)) & 0xfff;
+        mat24_def_parity12(w);
+        a[i] = (uint32_t)((v ^ (x & 0x1000000ULL) ^ (w << 24))
+                   & 0x1ffffffULL);
+    }
+    return n;
+}
+
+
+/**
+  @brief Operation of a compiled element on the Leech lattice mod 3
+
+  Let \f$g \in G_{x0}\f$ be a compiled element stored in the
+  array ``c``, as returned by function ``xsp2co1_elem_compile``.
+  Let \f$v_0,\ldots,v_{n-1}\f$ a list of \f$n\f$ vectors in
+  the Leech lattice modulo 3 stored in the the array ``a``
+  in **Leech lattice mod 3 encoding**.
+
+  Then the function replaces the vector \f$v_i\f$ by
+  \f$v_i \cdot g\f$ for \f$0 \leq i < n\f$. Here the operation
+  of \f$g\f$ on the Leech lattice modulo 3 is as in
+  function ``xsp2co1_elem_compile``. The function returns \f$n\f$.
+*/
+// %%EXPORT px
+CLIFFORD12_API
+int32_t xsp2co1_compiled_op_leech3(uint64_t *c, uint64_t *a, uint32_t n)
+{
+    uint_fast32_t i, j;
+    uint64_t v, x, y;
+    uint64_t *pc = c + OFS_COMPILED_LEECH3;
+    for (i = 0; i < n; ++i) {
+        x = a[i];
+        y = 0;
+        for (j = 0; j < 24; ++j) {
+            if ((x >> j) & 1) y = gen_leech3_add(y, pc[j]);
+            if ((x >> (j + 24)) & 1) {
+                v = pc[j];
+                y = gen_leech3_add(y, (v >> 24) | ((v & 0xffffffULL) << 24));
+            }
+        }
+        a[i] = y;
+    }
+    return n;
+}
+
+
+//  %%GEN h
+//  %%GEN c
+
+
+// %%GEN ch
+#ifdef __cplusplus
+}
+#endif
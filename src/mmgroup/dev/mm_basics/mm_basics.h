@@ -106,6 +106,10 @@ enum MM_AUX_OFS {
 };
 
 
+/// Number of blocks of a vector hashed by function ``mm_aux_hash_blocks``
+#define MM_AUX_HASH_BLOCKS 5
+
+
 /** 
   This enumeration contains the offsets for the tags ``A,B,C,T,X,Z,Y``
   in a vector in the 196884-dimensional representation of the monster,
@@ -162,6 +166,53 @@ enum MM_SPACE_TAG {
 #define mm_aux_bad_p(p) (((p) & ((p)+1)) | (((p)-3) & ((0UL-256UL))))
 
 
+/** @def MM_OMP(directive)
+    @brief Expand to ``#pragma directive`` if OpenMP is enabled
+
+    E.g. ``MM_OMP(omp section)`` is equivalent to the
+    line ``#pragma omp section`` if the code has been compiled
+    with OpenMP support; otherwise it is ignored.
+    See function ``mm_aux_set_num_threads``.
+*/
+#if defined(_OPENMP) && defined(_MSC_VER)
+#define MM_OMP(directive) __pragma(directive)
+#elif defined(_OPENMP)
+#define MM_OMP(directive) _Pragma(#directive)
+#else
+#define MM_OMP(directive)
+#endif
+
+
+/** @def MM_TARGET_CLONES
+    @brief Compile a function for several instruction sets
+
+    Prefixing the definition of a function with ``MM_TARGET_CLONES``
+    instructs the compiler to generate several versions of the
+    function for different instruction sets, e.g. a generic
+    version, a version using AVX2, and a version using AVX-512
+    instructions. The appropriate version is selected when the
+    shared library is loaded, depending on the features of the CPU.
+
+    Here we use the instruction set levels ``x86-64-v3`` (including
+    AVX2) and ``x86-64-v4`` (including AVX-512) defined in the
+    x86-64 psABI. This is supported by GCC (version 12 or higher)
+    for x86_64 processors only, if the operating system supports
+    indirect functions. In all other cases, or if macro
+    ``MM_NO_TARGET_CLONES`` is defined, ``MM_TARGET_CLONES`` is
+    ignored. Function ``mm_aux_simd_level`` returns the version
+    selected.
+*/
+#if defined(__GNUC__) && !defined(__clang__) && __GNUC__ >= 12 \
+    && defined(__x86_64__) && defined(__linux__) \
+    && !defined(MM_NO_TARGET_CLONES)
+#define MM_HAVE_TARGET_CLONES
+#define MM_TARGET_CLONES __attribute__((target_clones( \
+    "arch=x86-64-v4", "arch=x86-64-v3", "default")))
+#else
+#define MM_TARGET_CLONES
+#endif
+
+
 /// @cond DO_NOT_DOCUMENT 
 
 // Mask for all tags:
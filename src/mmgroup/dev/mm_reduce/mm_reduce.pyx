@@ -252,7 +252,38 @@ cdef class GtWord():
         print(m)
 
 
-        
 
+#######################################################################
+# Read-only views of precomputed vectors 
+#######################################################################
 
 
+cdef _const_mmv_view(const uint64_t *p, uint32_t length):
+    cdef uint64_t[:] view = <uint64_t[:length]>(<uint64_t*>p)
+    a = np.asarray(view)
+    a.flags.writeable = False
+    return a
+
+
+def mm_order_vector_view():
+    """Return the precomputed order vector as a read-only array
+
+    The function returns a read-only numpy array of type
+    ``np.uint64`` referring to the precomputed order vector
+    in the representation of the monster modulo 15. That array
+    is a view on a table in the C library, so no data are copied.
+    """
+    from mmgroup.mm import mm_aux_mmv_size
+    return _const_mmv_view(mr.mm_order_vector_ptr(), mm_aux_mmv_size(15))
+
+
+def mm_order_vector_v1_mod3_view():
+    """Return the precomputed vector ``v1_mod3`` as a read-only array
+
+    Similar to function ``mm_order_vector_view``; but here we
+    return a view on the precomputed vector ``v1_mod3`` in the
+    representation of the monster modulo 3.
+    """
+    from mmgroup.mm import mm_aux_mmv_size
+    return _const_mmv_view(mr.mm_order_vector_v1_mod3_ptr(), 
+        mm_aux_mmv_size(3))
@@ -56,25 +56,9 @@ def order_vector_from_C_data():
 
 
 
-def compress_order_vector_data(ov):
-    t = []
-    v = ov.data
-    def compress24(start, length):
-        for i in range(start, start + 2*length, 2):
-             t.append(int(v[i]) & 0xffffffff)
-             t.append(int(v[i]) >> 32)
-             t.append(int(v[i+1]) & 0xffffffff)
-    def compress64(start, length):
-        for i in range(start, start + 4*length):
-             t.append(int(v[i]) & 0xffffffff)
-             t.append(int(v[i]) >> 32)
-    OFS_ABC = 0
-    OFS_T = 72*2
-    OFS_XYZ = OFS_T + 759*4
-    compress24(OFS_ABC, 72)
-    compress64(OFS_T, 759)
-    compress24(OFS_XYZ, 3*2048)
-    return np.array(t, dtype = np.uint32)
+def dense_order_vector_data(ov):
+    from mmgroup.mm import mm_aux_mmv_size
+    return np.array(ov.data[:mm_aux_mmv_size(15)], dtype = np.uint64)
 
 
 #####################################################################
@@ -144,7 +128,7 @@ class OrderVectorTable:
             import_all()
         ov, tag, data =  order_vector_from_py_data()
         ov_hash = ov.hash()  
-        a_ov =  compress_order_vector_data(ov)
+        a_ov =  dense_order_vector_data(ov)
         tag_data = []
         tag_indices = [0]
         for i, name in enumerate(NAMES):
@@ -155,7 +139,7 @@ class OrderVectorTable:
         tag_indices = np.array(tag_indices, dtype = np.uint16)
         tlt_conversion = tlt_conversion_table()
         self.__class__.tables = {
-            "ORDER_VECTOR_DATA": a_ov,
+            "ORDER_VECTOR_MMV": a_ov,
             "ORDER_VECTOR_TAG_DATA": tag_data,
             "ORDER_VECTOR_TAG_INDICES": tag_indices,
             "ORDER_VECTOR_NUM_TAG_DATA": len(NAMES),
@@ -168,11 +152,11 @@ class OrderVectorTable:
 
 
 class Mockup_OrderVectorTable:
-    a_ov =  np.array([0], dtype = np.uint32)
+    a_ov =  np.array([0], dtype = np.uint64)
     tag_data = np.array([0], dtype = np.uint32)
     tag_indices = np.array([0,0], dtype = np.uint16)
     tables = {
-        "ORDER_VECTOR_DATA": a_ov,
+        "ORDER_VECTOR_MMV": a_ov,
         "ORDER_VECTOR_TAG_DATA": tag_data,
         "ORDER_VECTOR_TAG_INDICES": tag_indices,
         "ORDER_VECTOR_NUM_TAG_DATA": 1,
@@ -43,6 +43,7 @@ def import_all():
     global  mm_op3_watermark_A_perm_num
     global  mm_op3_word_tag_A
     global  mm_op3_checkzero
+    global  mm_aux_mmv_size
 
     from mmgroup import MMV, MMVector, Xsp2_Co1
     from mmgroup.mat24 import vect_to_cocode
@@ -67,6 +68,7 @@ def import_all():
     from mmgroup.mm3 import op_watermark_A_perm_num as mm_op3_watermark_A_perm_num
     from mmgroup.mm3 import op_word_tag_A as  mm_op3_word_tag_A
     from mmgroup.mm3 import op_checkzero as  mm_op3_checkzero
+    from mmgroup.mm import mm_aux_mmv_size
 
     MMV3 = MMV(3)
 
@@ -309,9 +311,13 @@ class V1_Mod3_Table:
         if import_pending:
             import_all()
         v1_data =  get_v1_mod3_data()
+        v1 = MMV3(0)
+        a = np.array(v1_data, dtype = np.uint32)
+        mm_aux_mmv_add_sparse(3, a, len(a), v1.data)
         self.__class__.tables = {
             "V1_MOD3_DATA": v1_data,
-            "V1_MOD3_TAG_DATA": make_v1_mod3_tags(v1_data)
+            "V1_MOD3_TAG_DATA": make_v1_mod3_tags(v1_data),
+            "V1_MOD3_MMV": v1.data[:mm_aux_mmv_size(3)],
         }
 
     def __init__(self, *args):
@@ -323,7 +329,8 @@ class Mockup_V1_Mod3_Table:
     directives = {}
     tables = {
         "V1_MOD3_DATA": a_ov,
-        "V1_MOD3_TAG_DATA": a_ov
+        "V1_MOD3_TAG_DATA": a_ov,
+        "V1_MOD3_MMV": np.array([0], dtype = np.uint64),
     }
     def __init__(self, *args):
         pass
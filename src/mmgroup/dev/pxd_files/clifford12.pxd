@@ -0,0 +1,287 @@
+# This .pxd file has been generated automatically. Do not edit!
+
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t, int8_t
+
+
+cdef extern from "clifford12.h":
+    enum: QSTATE12_MAXCOLS
+    enum: QSTATE12_MAXROWS
+    enum: QSTATE12_UNDEF_ROW
+    ctypedef struct qstate12_type:
+        uint32_t maxrows
+        uint32_t nrows
+        uint32_t ncols
+        int32_t  factor
+        uint32_t shape1
+        uint32_t reduced
+        uint64_t *data 
+
+
+
+cdef extern from "clifford12.h":
+    int32_t qstate12_check(qstate12_type *pqs)
+    int32_t qstate12_set_mem(qstate12_type *pqs, uint64_t *data, uint32_t size)
+    int32_t qstate12_zero(qstate12_type *pqs, uint32_t nqb)
+    int32_t qstate12_vector_state(qstate12_type *pqs, uint32_t nqb, uint64_t v)
+    int32_t qstate12_set(qstate12_type *pqs, uint32_t nqb, uint32_t nrows, uint64_t *data, uint32_t mode)
+    int32_t qstate12_copy(qstate12_type *pqs1, qstate12_type *pqs2)
+    int32_t qstate12_copy_alloc(qstate12_type *pqs1, qstate12_type *pqs2, uint64_t *data, uint32_t size)
+    int32_t qstate12_factor_to_complex(int32_t factor, double *pcomplex)
+    int32_t qstate12_factor_to_int32(int32_t factor, int32_t *pi)
+    int32_t qstate12_conjugate(qstate12_type *pqs)
+    int32_t qstate12_mul_scalar(qstate12_type *pqs, int32_t e, uint32_t phi)
+    int32_t qstate12_abs(qstate12_type *pqs)
+    uint64_t qstate12_get_column(qstate12_type *pqs, uint32_t j)
+    int32_t qstate12_mul_Av(qstate12_type *pqs, uint64_t v, uint64_t *pw)
+    int32_t qstate12_rot_bits(qstate12_type *pqs, int32_t rot, uint32_t nrot, uint32_t n0)
+    int32_t qstate12_xch_bits(qstate12_type *pqs, uint32_t sh, uint64_t mask)
+    int32_t qstate12_echelonize(qstate12_type *pqs)
+    int32_t qstate12_reduce(qstate12_type *pqs)
+    int32_t qstate12_row_table(qstate12_type *pqs, uint8_t *row_table)
+    int32_t qstate12_equal(qstate12_type *pqs1, qstate12_type *pqs2)
+    int32_t qstate12_extend_zero(qstate12_type *pqs, uint32_t j, uint32_t nqb)
+    int32_t qstate12_extend(qstate12_type *pqs, uint32_t j, uint32_t nqb)
+    int32_t qstate12_sum_cols(qstate12_type *pqs, uint32_t j, uint32_t nqb)
+    int32_t qstate12_restrict_zero(qstate12_type *pqs, uint32_t j, uint32_t nqb)
+    int32_t qstate12_restrict(qstate12_type *pqs, uint32_t j, uint32_t nqb)
+    int32_t qstate12_gate_not(qstate12_type *pqs, uint64_t v)
+    int32_t qstate12_gate_ctrl_not(qstate12_type *pqs, uint64_t vc, uint64_t v)
+    int32_t qstate12_gate_phi(qstate12_type *pqs, uint64_t v, uint32_t phi)
+    int32_t qstate12_gate_ctrl_phi(qstate12_type *pqs, uint64_t v1, uint64_t v2)
+    int32_t qstate12_gate_h(qstate12_type *pqs, uint64_t v)
+    int32_t qstate12_complex(qstate12_type *pqs,  double *pc)
+    int32_t qstate12_entries(qstate12_type *pqs, uint32_t n, uint32_t *v, double *pc)
+    int32_t qstate12_int32(qstate12_type *pqs,  int32_t *pi)
+    int32_t qstate12_to_signs(qstate12_type *pqs,  uint64_t *bmap)
+    int32_t qstate12_compare_signs(qstate12_type *pqs, uint64_t *bmap)
+    int32_t qstate12_from_signs(uint64_t *bmap, int32_t n, qstate12_type *pqs)
+    int32_t qstate12_mul_matrix_mod3(qstate12_type *pqs, uint64_t *v, uint64_t w)
+    int32_t qstate12_std_matrix(qstate12_type *pqs, uint32_t rows, uint32_t cols, uint32_t rk)
+    int32_t qstate12_unit_matrix(qstate12_type *pqs, uint32_t nqb)
+    int32_t qstate12_monomial_column_matrix(qstate12_type *pqs, uint32_t nqb, uint64_t *pa)
+    int32_t qstate12_monomial_row_matrix(qstate12_type *pqs, uint32_t nqb, uint64_t *pa)
+    int32_t qstate12_monomial_matrix_row_op(qstate12_type *pqs, uint32_t *pa)
+    int32_t qstate12_mat_reshape(qstate12_type *pqs, int32_t rows, int32_t cols)
+    int32_t qstate12_mat_t(qstate12_type *pqs)
+    int32_t qstate12_mat_trace_factor(qstate12_type *pqs, int32_t *pfactor)
+    int32_t qstate12_mat_trace(qstate12_type *pqs, double *p_trace)
+    int32_t qstate12_mat_itrace(qstate12_type *pqs, int32_t *p_itrace)
+    int32_t qstate12_prep_mul(qstate12_type *pqs1, qstate12_type *pqs2, uint32_t nqb)
+    int32_t qstate12_product(qstate12_type *pqs1, qstate12_type *pqs2, uint32_t nqb, uint32_t nc)
+    int32_t qstate12_matmul(qstate12_type *pqs1, qstate12_type *pqs2, qstate12_type *pqs3)
+    int32_t qstate12_pauli_vector(qstate12_type *pqs, uint64_t *pv)
+    int32_t qstate12_pauli_matrix(qstate12_type *pqs, uint32_t nqb, uint64_t v)
+    # PYX <wrap pxi>
+    uint64_t qstate12_pauli_vector_mul(uint32_t nqb, uint64_t v1, uint64_t v2)
+    # PYX <wrap pxi>
+    uint64_t qstate12_pauli_vector_exp(uint32_t nqb, uint64_t v, uint32_t e)
+    int32_t qstate12_reduce_matrix(qstate12_type *pqs, uint8_t *row_table)
+    int32_t qstate12_mat_lb_rank(qstate12_type *pqs)
+    int32_t qstate12_mat_inv(qstate12_type *pqs)
+    int32_t qstate12_to_symplectic(qstate12_type *pqs, uint64_t *pA)
+    int32_t qstate12_pauli_conjugate(qstate12_type *pqs, uint32_t n, uint64_t *pv, uint32_t arg)
+    # PYX <wrap pxi>
+    uint32_t bitmatrix64_error_pool(uint64_t *dest, uint32_t length)
+    # PYX <wrap pxi>
+    uint32_t uint64_parity(uint64_t v)
+    void bitmatrix64_add_diag(uint64_t *m, uint32_t i, uint32_t j)
+    void bitmatrix64_mask_rows(uint64_t *m, uint32_t i, uint64_t mask)
+    int32_t bitmatrix64_find_masked_row(uint64_t *m, uint32_t i, uint64_t mask, uint64_t v)
+    uint32_t bitmatrix64_find_low_bit(uint64_t *m, uint32_t imin, uint32_t imax)
+    void bitmatrix64_mul(uint64_t *m1,  uint64_t *m2, uint32_t i1, uint32_t i2, uint64_t *m3)
+    int32_t bitmatrix64_rot_bits(uint64_t *m, uint32_t i, int32_t rot, uint32_t nrot, uint32_t n0)
+    int32_t bitmatrix64_xch_bits(uint64_t *m, uint32_t i, uint32_t sh, uint64_t mask)
+    int32_t bitmatrix64_reverse_bits(uint64_t *m, uint32_t i, uint32_t n, uint32_t n0)
+    int32_t bitmatrix64_t(uint64_t *m1, uint32_t i, uint32_t j, uint64_t *m2)
+    # PYX <wrap pxi>
+    uint32_t bitmatrix64_echelon_h(uint64_t *m, uint32_t i, uint32_t j0, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t bitmatrix64_echelon_l(uint64_t *m, uint32_t i, uint32_t j0, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t bitmatrix64_cap_h(uint64_t *m1, uint64_t *m2, uint32_t i1, uint32_t i2, uint32_t j0, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t bitmatrix64_inv(uint64_t *m, uint32_t i)
+    # PYX <wrap pxi>
+    int64_t bitmatrix64_solve_equation(uint64_t *m, uint32_t i, uint32_t j)
+    # PYX <wrap pxi>
+    void bitvector32_copy(uint32_t *a_src, uint32_t n, uint32_t *a_dest)
+    # PYX <wrap pxi>
+    void bitvector32_heapsort(uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    void bitvector32_sort(uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    void bitvector64_copy(uint64_t *a_src, uint32_t n, uint64_t *a_dest)
+    # PYX <wrap pxi>
+    void bitvector64_heapsort(uint64_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    void bitvector64_sort(uint64_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t xsp2co1_error_pool(uint64_t *dest, uint32_t length)
+    # PYX <wrap pxi>
+    uint64_t xsp2co1_find_chain_short_3(uint64_t v3_1, uint64_t v3_2)
+    int32_t xsp2co1_chain_short_3(qstate12_type *pqs, uint32_t n, uint64_t *psrc, uint64_t *pdest)
+    int32_t xsp2co1_elem_to_qs_i(uint64_t *elem, qstate12_type *pqs)
+    int32_t xsp2co1_elem_to_qs(uint64_t *elem, qstate12_type *pqs)
+    int32_t xsp2co1_qs_to_elem_i(qstate12_type *pqs, uint64_t v_g, uint64_t *elem)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_reduce_elem(uint64_t *elem)
+    # PYX <wrap pxi>
+    void xsp2co1_neg_elem(uint64_t *elem)
+    # PYX <wrap pxi>
+    void xsp2co1_copy_elem(uint64_t *elem1, uint64_t *elem2)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_to_bitmatrix(uint64_t *elem, uint64_t *pA)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_mul_elem(uint64_t *elem1, uint64_t *elem2, uint64_t *elem3)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_inv_elem(uint64_t *elem1, uint64_t *elem2)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_conj_elem(uint64_t *elem1, uint64_t *elem2, uint64_t *elem3)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_xspecial_conjugate(uint64_t *elem, uint32_t n, uint64_t *ax, uint32_t sign)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_check_fix_short(uint64_t *elem1, uint32_t v)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_xspecial_vector(uint64_t *elem)
+    # PYX <wrap pxi>
+    void xsp2co1_unit_elem(uint64_t *elem)
+    # PYX <wrap pxi>
+    uint32_t xsp2co1_is_unit_elem(uint64_t *elem)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_xspecial(uint64_t *elem, uint32_t x)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_mul_elem_word(uint64_t *elem, uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_set_elem_word(uint64_t *elem, uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_mul_elem_atom(uint64_t *elem, uint32_t v)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_set_elem_atom(uint64_t *elem, uint32_t v)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_set_elem_word_scan(uint64_t *elem, uint32_t *a, uint32_t n, uint32_t mul)
+    # PYX <wrap pxi>
+    uint64_t xsp2co1_to_vect_mod3(uint64_t x)
+    # PYX <wrap pxi>
+    uint64_t xsp2co1_from_vect_mod3(uint64_t x)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_to_leech_op(uint64_t *elem, int8_t *pdest)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_short_3_to_leech(uint64_t x, int8_t *pdest)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_short_2_to_leech(uint64_t x, int8_t *pdest)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_monomial_to_xsp(uint64_t *elem, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_to_word(uint64_t *elem, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_reduce_word(uint32_t *a, uint32_t n, uint32_t *a1)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_subtype(uint64_t *elem)
+    # PYX <wrap pxi>
+    uint32_t xsp2co1_check_word_g_x0(uint32_t *w, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_row_mod3(uint64_t *elem, uint32_t column, uint64_t *v)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_read_mod3(uint64_t *v, uint64_t *elem, uint32_t row, uint32_t column)
+    # PYX <wrap pxi>
+    void leech3matrix_echelon(uint64_t *a)
+    # PYX <wrap pxi>
+    void leech3matrix_compress(uint64_t *a, uint64_t *v)
+    # PYX <wrap pxi>
+    void leech3matrix_sub_diag(uint64_t *a, uint64_t diag, uint32_t offset)
+    # PYX <wrap pxi>
+    uint64_t leech3matrix_rank(uint64_t *a, uint32_t d)
+    # PYX <wrap pxi>
+    int32_t leech2matrix_add_eqn(uint64_t *m, uint32_t nrows, uint32_t ncols, uint64_t a)
+    # PYX <wrap pxi>
+    uint32_t leech2matrix_solve_eqn(uint32_t *m, uint32_t ncols, uint64_t v)
+    # PYX <wrap pxi>
+    uint32_t leech2_matrix_basis(uint32_t *v2, uint32_t n, uint64_t *basis, uint32_t d)
+    # PYX <wrap pxi>
+    int32_t leech2_matrix_orthogonal(uint64_t *a, uint64_t *b, uint32_t k)
+    # PYX <wrap pxi>
+    uint32_t leech2_matrix_radical(uint32_t *v2, uint32_t n, uint64_t *basis, uint32_t d)
+    # PYX <wrap pxi>
+    uint32_t leech2_matrix_expand(uint64_t *basis, uint32_t dim, uint32_t *v2)
+    # PYX <wrap pxi>
+    void leech3_vect_mod3_to_signs(uint64_t *v, uint64_t mult, uint32_t n, uint64_t *signs)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_to_N0(uint64_t *elem, uint32_t *g)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_from_N0(uint64_t *elem, uint32_t *g)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_conjugate_elem(uint64_t *elem, uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_power_elem(uint64_t *elem1, int64_t e, uint64_t *elem2)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_power_word(uint32_t *a1, uint32_t n, int64_t e, uint32_t *a2)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_half_order_elem(uint64_t *elem1, uint64_t *elem2)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_order_elem(uint64_t *elem)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_half_order_word(uint32_t *a1, uint32_t n, uint32_t *a2)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_order_word(uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t  xsp2co1_leech2_count_type2(uint64_t *a, uint32_t n)
+    int32_t xsp2co1_trace_98280(uint64_t *elem, int32_t (*f_fast)(uint64_t*))
+    # PYX <wrap pxi>
+    int32_t xsp2co1_traces_small(uint64_t *elem, int32_t *ptrace)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_traces_all(uint64_t *elem, int32_t *ptrace)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_rand_word_N_0(uint32_t *w, uint32_t in_N_x0, uint32_t even, uint64_t *seed)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_rand_word_G_x0(uint32_t *w, uint64_t *seed)
+    # PYX <wrap pxi>
+    uint32_t xsp2co1_involution_error_pool(uint64_t *dest, uint32_t length)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_involution_invariants(uint64_t *elem, uint64_t *invar)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_involution_orthogonal(uint64_t *invar, uint32_t col)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_involution_find_type4(uint64_t *invar, uint32_t guide)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_find_type4(uint64_t *elem, uint32_t guide)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_conj_G_x0_to_Q_x0(uint64_t *elem, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_conjugate_involution(uint64_t *elem, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_involution_class(uint64_t *elem)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_traces_fast(uint64_t *elem, int32_t *ptrace)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_fingerprint(uint64_t *elem, int32_t *fp)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_conjugate_involution_Gx0(uint64_t *elem, uint32_t guide, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_map_involution_class_Gx0(uint32_t iclass, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_mul_elem_array(uint64_t *a1, uint64_t *a2, uint64_t *a3, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_inv_elem_array(uint64_t *a1, uint64_t *a2, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_power_elem_array(uint64_t *a1, int64_t e, uint64_t *a2, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_reduce_elem_array(uint64_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_order_elem_array(uint64_t *a, uint32_t n, int32_t *orders)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_subtype_array(uint64_t *a, uint32_t n, int32_t *subtypes)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_traces_fast_array(uint64_t *a, uint32_t n, int32_t *ptrace)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_fingerprint_array(uint64_t *a, uint32_t n, int32_t *fp)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_rand_elem_G_x0_array(uint64_t *a, uint32_t n, uint64_t *seed)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_elem_compile(uint64_t *elem, uint64_t *c)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_compiled_op_leech2(uint64_t *c, uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t xsp2co1_compiled_op_leech3(uint64_t *c, uint64_t *a, uint32_t n)
@@ -0,0 +1,914 @@
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t, int8_t
+
+
+cdef extern from "clifford12.h":
+    enum: QSTATE12_MAXCOLS
+    enum: QSTATE12_MAXROWS
+    enum: QSTATE12_UNDEF_ROW
+    ctypedef struct qstate12_type:
+        uint32_t maxrows
+        uint32_t nrows
+        uint32_t ncols
+        int32_t  factor
+        uint32_t shape1
+        uint32_t reduced
+        uint64_t *data 
+
+
+
+
+######################################################################
+### Wrappers for C functions from file clifford12.pxd
+######################################################################
+
+
+cimport cython
+cimport clifford12
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def qstate12_pauli_vector_mul(nqb, v1, v2):
+    cdef uint32_t nqb_v_ = nqb
+    cdef uint64_t v1_v_ = v1
+    cdef uint64_t v2_v_ = v2
+    cdef uint64_t ret_
+    ret_ = clifford12.qstate12_pauli_vector_mul(nqb_v_, v1_v_, v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def qstate12_pauli_vector_exp(nqb, v, e):
+    cdef uint32_t nqb_v_ = nqb
+    cdef uint64_t v_v_ = v
+    cdef uint32_t e_v_ = e
+    cdef uint64_t ret_
+    ret_ = clifford12.qstate12_pauli_vector_exp(nqb_v_, v_v_, e_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitmatrix64_error_pool(dest, length):
+    cdef uint64_t[::1] dest_v_ = dest
+    cdef uint32_t length_v_ = length
+    cdef uint32_t ret_
+    ret_ = clifford12.bitmatrix64_error_pool(&dest_v_[0], length_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def uint64_parity(v):
+    cdef uint64_t v_v_ = v
+    cdef uint32_t ret_
+    ret_ = clifford12.uint64_parity(v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitmatrix64_echelon_h(m, i, j0, n):
+    cdef uint64_t[::1] m_v_ = m
+    cdef uint32_t i_v_ = i
+    cdef uint32_t j0_v_ = j0
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = clifford12.bitmatrix64_echelon_h(&m_v_[0], i_v_, j0_v_, n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitmatrix64_echelon_l(m, i, j0, n):
+    cdef uint64_t[::1] m_v_ = m
+    cdef uint32_t i_v_ = i
+    cdef uint32_t j0_v_ = j0
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = clifford12.bitmatrix64_echelon_l(&m_v_[0], i_v_, j0_v_, n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitmatrix64_cap_h(m1, m2, i1, i2, j0, n):
+    cdef uint64_t[::1] m1_v_ = m1
+    cdef uint64_t[::1] m2_v_ = m2
+    cdef uint32_t i1_v_ = i1
+    cdef uint32_t i2_v_ = i2
+    cdef uint32_t j0_v_ = j0
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.bitmatrix64_cap_h(&m1_v_[0], &m2_v_[0], i1_v_, i2_v_, j0_v_, n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitmatrix64_inv(m, i):
+    cdef uint64_t[::1] m_v_ = m
+    cdef uint32_t i_v_ = i
+    cdef int32_t ret_
+    ret_ = clifford12.bitmatrix64_inv(&m_v_[0], i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitmatrix64_solve_equation(m, i, j):
+    cdef uint64_t[::1] m_v_ = m
+    cdef uint32_t i_v_ = i
+    cdef uint32_t j_v_ = j
+    cdef int64_t ret_
+    ret_ = clifford12.bitmatrix64_solve_equation(&m_v_[0], i_v_, j_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitvector32_copy(a_src, n, a_dest):
+    cdef uint32_t[::1] a_src_v_ = a_src
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] a_dest_v_ = a_dest
+    clifford12.bitvector32_copy(&a_src_v_[0], n_v_, &a_dest_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitvector32_heapsort(a, n):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    clifford12.bitvector32_heapsort(&a_v_[0], n_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitvector32_sort(a, n):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    clifford12.bitvector32_sort(&a_v_[0], n_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitvector64_copy(a_src, n, a_dest):
+    cdef uint64_t[::1] a_src_v_ = a_src
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] a_dest_v_ = a_dest
+    clifford12.bitvector64_copy(&a_src_v_[0], n_v_, &a_dest_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitvector64_heapsort(a, n):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    clifford12.bitvector64_heapsort(&a_v_[0], n_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def bitvector64_sort(a, n):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    clifford12.bitvector64_sort(&a_v_[0], n_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_error_pool(dest, length):
+    cdef uint64_t[::1] dest_v_ = dest
+    cdef uint32_t length_v_ = length
+    cdef uint32_t ret_
+    ret_ = clifford12.xsp2co1_error_pool(&dest_v_[0], length_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_find_chain_short_3(v3_1, v3_2):
+    cdef uint64_t v3_1_v_ = v3_1
+    cdef uint64_t v3_2_v_ = v3_2
+    cdef uint64_t ret_
+    ret_ = clifford12.xsp2co1_find_chain_short_3(v3_1_v_, v3_2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_reduce_elem(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_reduce_elem(&elem_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_neg_elem(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    clifford12.xsp2co1_neg_elem(&elem_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_copy_elem(elem1, elem2):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef uint64_t[::1] elem2_v_ = elem2
+    clifford12.xsp2co1_copy_elem(&elem1_v_[0], &elem2_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_to_bitmatrix(elem, pA):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint64_t[::1] pA_v_ = pA
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_to_bitmatrix(&elem_v_[0], &pA_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_mul_elem(elem1, elem2, elem3):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef uint64_t[::1] elem2_v_ = elem2
+    cdef uint64_t[::1] elem3_v_ = elem3
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_mul_elem(&elem1_v_[0], &elem2_v_[0], &elem3_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_inv_elem(elem1, elem2):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef uint64_t[::1] elem2_v_ = elem2
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_inv_elem(&elem1_v_[0], &elem2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_conj_elem(elem1, elem2, elem3):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef uint64_t[::1] elem2_v_ = elem2
+    cdef uint64_t[::1] elem3_v_ = elem3
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_conj_elem(&elem1_v_[0], &elem2_v_[0], &elem3_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_xspecial_conjugate(elem, n, ax, sign):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] ax_v_ = ax
+    cdef uint32_t sign_v_ = sign
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_xspecial_conjugate(&elem_v_[0], n_v_, &ax_v_[0], sign_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_check_fix_short(elem1, v):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef uint32_t v_v_ = v
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_check_fix_short(&elem1_v_[0], v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_xspecial_vector(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_xspecial_vector(&elem_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_unit_elem(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    clifford12.xsp2co1_unit_elem(&elem_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_is_unit_elem(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t ret_
+    ret_ = clifford12.xsp2co1_is_unit_elem(&elem_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_xspecial(elem, x):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t x_v_ = x
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_xspecial(&elem_v_[0], x_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_mul_elem_word(elem, a, n):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_mul_elem_word(&elem_v_[0], &a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_set_elem_word(elem, a, n):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_set_elem_word(&elem_v_[0], &a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_mul_elem_atom(elem, v):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t v_v_ = v
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_mul_elem_atom(&elem_v_[0], v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_set_elem_atom(elem, v):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t v_v_ = v
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_set_elem_atom(&elem_v_[0], v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_set_elem_word_scan(elem, a, n, mul):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t mul_v_ = mul
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_set_elem_word_scan(&elem_v_[0], &a_v_[0], n_v_, mul_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_to_vect_mod3(x):
+    cdef uint64_t x_v_ = x
+    cdef uint64_t ret_
+    ret_ = clifford12.xsp2co1_to_vect_mod3(x_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_from_vect_mod3(x):
+    cdef uint64_t x_v_ = x
+    cdef uint64_t ret_
+    ret_ = clifford12.xsp2co1_from_vect_mod3(x_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_to_leech_op(elem, pdest):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int8_t[::1] pdest_v_ = pdest
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_to_leech_op(&elem_v_[0], &pdest_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_short_3_to_leech(x, pdest):
+    cdef uint64_t x_v_ = x
+    cdef int8_t[::1] pdest_v_ = pdest
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_short_3_to_leech(x_v_, &pdest_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_short_2_to_leech(x, pdest):
+    cdef uint64_t x_v_ = x
+    cdef int8_t[::1] pdest_v_ = pdest
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_short_2_to_leech(x_v_, &pdest_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_monomial_to_xsp(elem, a):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_monomial_to_xsp(&elem_v_[0], &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_to_word(elem, a):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_to_word(&elem_v_[0], &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_reduce_word(a, n, a1):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] a1_v_ = a1
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_reduce_word(&a_v_[0], n_v_, &a1_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_subtype(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_subtype(&elem_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_check_word_g_x0(w, n):
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = clifford12.xsp2co1_check_word_g_x0(&w_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_row_mod3(elem, column, v):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t column_v_ = column
+    cdef uint64_t[::1] v_v_ = v
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_row_mod3(&elem_v_[0], column_v_, &v_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_read_mod3(v, elem, row, column):
+    cdef uint64_t[::1] v_v_ = v
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t row_v_ = row
+    cdef uint32_t column_v_ = column
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_read_mod3(&v_v_[0], &elem_v_[0], row_v_, column_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech3matrix_echelon(a):
+    cdef uint64_t[::1] a_v_ = a
+    clifford12.leech3matrix_echelon(&a_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech3matrix_compress(a, v):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint64_t[::1] v_v_ = v
+    clifford12.leech3matrix_compress(&a_v_[0], &v_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech3matrix_sub_diag(a, diag, offset):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint64_t diag_v_ = diag
+    cdef uint32_t offset_v_ = offset
+    clifford12.leech3matrix_sub_diag(&a_v_[0], diag_v_, offset_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech3matrix_rank(a, d):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t d_v_ = d
+    cdef uint64_t ret_
+    ret_ = clifford12.leech3matrix_rank(&a_v_[0], d_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech2matrix_add_eqn(m, nrows, ncols, a):
+    cdef uint64_t[::1] m_v_ = m
+    cdef uint32_t nrows_v_ = nrows
+    cdef uint32_t ncols_v_ = ncols
+    cdef uint64_t a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.leech2matrix_add_eqn(&m_v_[0], nrows_v_, ncols_v_, a_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech2matrix_solve_eqn(m, ncols, v):
+    cdef uint32_t[::1] m_v_ = m
+    cdef uint32_t ncols_v_ = ncols
+    cdef uint64_t v_v_ = v
+    cdef uint32_t ret_
+    ret_ = clifford12.leech2matrix_solve_eqn(&m_v_[0], ncols_v_, v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech2_matrix_basis(v2, n, basis, d):
+    cdef uint32_t[::1] v2_v_ = v2
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] basis_v_ = basis
+    cdef uint32_t d_v_ = d
+    cdef uint32_t ret_
+    ret_ = clifford12.leech2_matrix_basis(&v2_v_[0], n_v_, &basis_v_[0], d_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech2_matrix_orthogonal(a, b, k):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint64_t[::1] b_v_ = b
+    cdef uint32_t k_v_ = k
+    cdef int32_t ret_
+    ret_ = clifford12.leech2_matrix_orthogonal(&a_v_[0], &b_v_[0], k_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech2_matrix_radical(v2, n, basis, d):
+    cdef uint32_t[::1] v2_v_ = v2
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] basis_v_ = basis
+    cdef uint32_t d_v_ = d
+    cdef uint32_t ret_
+    ret_ = clifford12.leech2_matrix_radical(&v2_v_[0], n_v_, &basis_v_[0], d_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech2_matrix_expand(basis, dim, v2):
+    cdef uint64_t[::1] basis_v_ = basis
+    cdef uint32_t dim_v_ = dim
+    cdef uint32_t[::1] v2_v_ = v2
+    cdef uint32_t ret_
+    ret_ = clifford12.leech2_matrix_expand(&basis_v_[0], dim_v_, &v2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def leech3_vect_mod3_to_signs(v, mult, n, signs):
+    cdef uint64_t[::1] v_v_ = v
+    cdef uint64_t mult_v_ = mult
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] signs_v_ = signs
+    clifford12.leech3_vect_mod3_to_signs(&v_v_[0], mult_v_, n_v_, &signs_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_to_N0(elem, g):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] g_v_ = g
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_to_N0(&elem_v_[0], &g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_from_N0(elem, g):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] g_v_ = g
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_from_N0(&elem_v_[0], &g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_conjugate_elem(elem, a, n):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_conjugate_elem(&elem_v_[0], &a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_power_elem(elem1, e, elem2):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef int64_t e_v_ = e
+    cdef uint64_t[::1] elem2_v_ = elem2
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_power_elem(&elem1_v_[0], e_v_, &elem2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_power_word(a1, n, e, a2):
+    cdef uint32_t[::1] a1_v_ = a1
+    cdef uint32_t n_v_ = n
+    cdef int64_t e_v_ = e
+    cdef uint32_t[::1] a2_v_ = a2
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_power_word(&a1_v_[0], n_v_, e_v_, &a2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_half_order_elem(elem1, elem2):
+    cdef uint64_t[::1] elem1_v_ = elem1
+    cdef uint64_t[::1] elem2_v_ = elem2
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_half_order_elem(&elem1_v_[0], &elem2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_order_elem(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_order_elem(&elem_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_half_order_word(a1, n, a2):
+    cdef uint32_t[::1] a1_v_ = a1
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] a2_v_ = a2
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_half_order_word(&a1_v_[0], n_v_, &a2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_order_word(a, n):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_order_word(&a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_leech2_count_type2(a, n):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = clifford12.xsp2co1_leech2_count_type2(&a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_traces_small(elem, ptrace):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t[::1] ptrace_v_ = ptrace
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_traces_small(&elem_v_[0], &ptrace_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_traces_all(elem, ptrace):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t[::1] ptrace_v_ = ptrace
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_traces_all(&elem_v_[0], &ptrace_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_rand_word_N_0(w, in_N_x0, even, seed):
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t in_N_x0_v_ = in_N_x0
+    cdef uint32_t even_v_ = even
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_rand_word_N_0(&w_v_[0], in_N_x0_v_, even_v_, &seed_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_rand_word_G_x0(w, seed):
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_rand_word_G_x0(&w_v_[0], &seed_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_involution_error_pool(dest, length):
+    cdef uint64_t[::1] dest_v_ = dest
+    cdef uint32_t length_v_ = length
+    cdef uint32_t ret_
+    ret_ = clifford12.xsp2co1_involution_error_pool(&dest_v_[0], length_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_involution_invariants(elem, invar):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint64_t[::1] invar_v_ = invar
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_involution_invariants(&elem_v_[0], &invar_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_involution_orthogonal(invar, col):
+    cdef uint64_t[::1] invar_v_ = invar
+    cdef uint32_t col_v_ = col
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_involution_orthogonal(&invar_v_[0], col_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_involution_find_type4(invar, guide):
+    cdef uint64_t[::1] invar_v_ = invar
+    cdef uint32_t guide_v_ = guide
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_involution_find_type4(&invar_v_[0], guide_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_find_type4(elem, guide):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t guide_v_ = guide
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_find_type4(&elem_v_[0], guide_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_conj_G_x0_to_Q_x0(elem, a):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_conj_G_x0_to_Q_x0(&elem_v_[0], &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_conjugate_involution(elem, a):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_conjugate_involution(&elem_v_[0], &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_involution_class(elem):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_involution_class(&elem_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_traces_fast(elem, ptrace):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t[::1] ptrace_v_ = ptrace
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_traces_fast(&elem_v_[0], &ptrace_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_fingerprint(elem, fp):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef int32_t[::1] fp_v_ = fp
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_fingerprint(&elem_v_[0], &fp_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_conjugate_involution_Gx0(elem, guide, a):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t guide_v_ = guide
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_conjugate_involution_Gx0(&elem_v_[0], guide_v_, &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_map_involution_class_Gx0(iclass, a):
+    cdef uint32_t iclass_v_ = iclass
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_map_involution_class_Gx0(iclass_v_, &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_mul_elem_array(a1, a2, a3, n):
+    cdef uint64_t[::1] a1_v_ = a1
+    cdef uint64_t[::1] a2_v_ = a2
+    cdef uint64_t[::1] a3_v_ = a3
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_mul_elem_array(&a1_v_[0], &a2_v_[0], &a3_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_inv_elem_array(a1, a2, n):
+    cdef uint64_t[::1] a1_v_ = a1
+    cdef uint64_t[::1] a2_v_ = a2
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_inv_elem_array(&a1_v_[0], &a2_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_power_elem_array(a1, e, a2, n):
+    cdef uint64_t[::1] a1_v_ = a1
+    cdef int64_t e_v_ = e
+    cdef uint64_t[::1] a2_v_ = a2
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_power_elem_array(&a1_v_[0], e_v_, &a2_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_reduce_elem_array(a, n):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_reduce_elem_array(&a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_order_elem_array(a, n, orders):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t[::1] orders_v_ = orders
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_order_elem_array(&a_v_[0], n_v_, &orders_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_subtype_array(a, n, subtypes):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t[::1] subtypes_v_ = subtypes
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_subtype_array(&a_v_[0], n_v_, &subtypes_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_traces_fast_array(a, n, ptrace):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t[::1] ptrace_v_ = ptrace
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_traces_fast_array(&a_v_[0], n_v_, &ptrace_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_fingerprint_array(a, n, fp):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t[::1] fp_v_ = fp
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_fingerprint_array(&a_v_[0], n_v_, &fp_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_rand_elem_G_x0_array(a, n, seed):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_rand_elem_G_x0_array(&a_v_[0], n_v_, &seed_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_elem_compile(elem, c):
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint64_t[::1] c_v_ = c
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_elem_compile(&elem_v_[0], &c_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_compiled_op_leech2(c, a, n):
+    cdef uint64_t[::1] c_v_ = c
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_compiled_op_leech2(&c_v_[0], &a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def xsp2co1_compiled_op_leech3(c, a, n):
+    cdef uint64_t[::1] c_v_ = c
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = clifford12.xsp2co1_compiled_op_leech3(&c_v_[0], &a_v_[0], n_v_)
+    return ret_
+
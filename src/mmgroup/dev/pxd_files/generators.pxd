@@ -0,0 +1,184 @@
+# This .pxd file has been generated automatically. Do not edit!
+
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t
+
+
+cdef extern from "mmgroup_generators.h":
+    # PYX <wrap pxi>
+    uint32_t gen_xi_g_gray(uint32_t v)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_w2_gray(uint32_t v)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_g_cocode(uint32_t c)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_w2_cocode(uint32_t v)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_op_xi(uint32_t x, uint32_t e)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_op_xi_nosign(uint32_t x, uint32_t e)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_leech_to_short(uint32_t x)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_short_to_leech(uint32_t x)
+    # PYX <wrap pxi>
+    uint32_t gen_xi_op_xi_short(uint32_t x, uint32_t u)
+    uint32_t gen_xi_make_table(uint32_t b, uint32_t e, uint16_t *ptab)
+    void gen_xi_invert_table(uint16_t *ptab, uint32_t len, uint32_t ncols, uint16_t *pres, uint32_t len_res)
+    void gen_xi_split_table(uint16_t *ptab, uint32_t len, uint32_t mod, uint32_t *psign)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_delta_pi(uint32_t *g, uint32_t delta, uint32_t pi)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_inv_delta_pi(uint32_t *g, uint32_t delta, uint32_t pi)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_x(uint32_t * g, uint32_t e)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_y(uint32_t * g, uint32_t f)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_t(uint32_t * g, uint32_t t)
+    # PYX <wrap pxi>
+    void mm_group_n_clear(uint32_t *g)
+    # PYX <wrap pxi>
+    void mm_group_n_copy_element(uint32_t *g_1, uint32_t *g_2)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_element(uint32_t *g_1, uint32_t *g_2, uint32_t *g_3)
+    # PYX <wrap pxi>
+    void mm_group_n_mul_inv_element(uint32_t *g_1, uint32_t *g_2, uint32_t *g_3)
+    # PYX <wrap pxi>
+    void mm_group_n_inv_element(uint32_t *g_1, uint32_t *g_2)
+    # PYX <wrap pxi>
+    void mm_group_n_conjugate_element(uint32_t *g_1, uint32_t *g_2, uint32_t *g_3)
+    # PYX <wrap pxi>
+    uint32_t mm_group_n_mul_word_scan(uint32_t *g, uint32_t *w, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t mm_group_n_mul_atom(uint32_t *g, uint32_t atom)
+    # PYX <wrap pxi>
+    uint32_t mm_group_n_scan_word(uint32_t *w, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t  mm_group_n_conj_word_scan(uint32_t *g, uint32_t *w, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t mm_group_n_reduce_element(uint32_t *g)
+    # PYX <wrap pxi>
+    uint32_t mm_group_n_to_word(uint32_t *g, uint32_t *word)
+    # PYX <wrap pxi>
+    uint32_t mm_group_n_right_coset_N_x0(uint32_t *g)
+    # PYX <wrap pxi>
+    int32_t mm_group_n_conj_to_Q_x0(uint32_t *g)
+    # PYX <wrap pxi>
+    uint32_t mm_group_split_word_n(uint32_t *word, uint32_t length, uint32_t *g)
+    # PYX <wrap pxi>
+    uint32_t mm_group_mul_words(uint32_t *w1, uint32_t l1, uint32_t *w2, uint32_t l2, int32_t e)
+    # PYX <wrap pxi>
+    void mm_group_invert_word(uint32_t *w, uint32_t l)
+    # PYX <wrap pxi>
+    uint32_t mm_group_check_word_n(uint32_t *w1, uint32_t l1, uint32_t *g_out)
+    # PYX <wrap pxi>
+    uint32_t mm_group_words_equ(uint32_t *w1, uint32_t l1, uint32_t *w2, uint32_t l2, uint32_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_group_parse_word(uint8_t *s, uint32_t n, uint32_t *w, uint32_t len_w)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_mul(uint32_t x1, uint32_t x2)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_pow(uint32_t x1, uint32_t e)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_scalprod(uint32_t x1, uint32_t x2)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_op_word(uint32_t q0, uint32_t *g, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_op_atom(uint32_t q0, uint32_t g)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_prefix_Gx0(uint32_t *g, uint32_t len_g)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_op_word_many(uint32_t *q, uint32_t m, uint32_t *g, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_op_word_leech2(uint32_t l, uint32_t *g, uint32_t n, uint32_t back)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_map_std_subframe(uint32_t *g, uint32_t len_g, uint32_t *a)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_set_subtype_table(uint8_t *table, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_subtype(uint64_t v2)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_compute_subtype_table(uint8_t *table, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_type(uint64_t v2)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_type2(uint64_t v2)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_count_type2(uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_start_type24(uint32_t v)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_start_type4(uint32_t v)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3_scalprod(uint64_t v3_1, uint64_t v3_2)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3_add(uint64_t v3_1, uint64_t v3_2)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3_neg(uint64_t v3)
+    # PYX <wrap pxi>
+    uint64_t gen_leech2to3_short(uint64_t v2)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3to2_short(uint64_t v3)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3to2_type4(uint64_t v3)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3to2_type3(uint64_t v3)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3_op_xi(uint64_t v3, uint32_t e)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3_op_vector_word(uint64_t v3, uint32_t *pg, uint32_t n)
+    # PYX <wrap pxi>
+    uint64_t gen_leech3_op_vector_atom(uint64_t v3, uint32_t g)
+    int32_t apply_perm(uint32_t v, uint8_t *p_src, uint8_t *p_dest, uint32_t n, uint32_t *p_res)
+    uint32_t find_octad_permutation(uint32_t v, uint32_t *p_res)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_reduce_type2(uint32_t v, uint32_t *pg_out)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_reduce_type2_ortho(uint32_t v, uint32_t *pg_out)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_reduce_type4(uint32_t v, uint32_t *pg_out)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_type_selftest(uint32_t start, uint32_t n, uint32_t *result)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_reduce_n(uint32_t v, uint32_t *pg_out)
+    # PYX <wrap pxi>
+    int32_t gen_leech2_reduce_n_rep(uint32_t subtype)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_type_array(uint32_t *a, uint32_t n, uint8_t *t)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_subtype_array(uint32_t *a, uint32_t n, uint8_t *t)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_type2_array(uint32_t *a, uint32_t n, uint8_t *t)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_mul_array(uint32_t *a, uint32_t *b, uint32_t n, uint32_t *c)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2_scalprod_array(uint32_t *a, uint32_t *b, uint32_t n, uint8_t *c)
+    # PYX <wrap pxi>
+    uint32_t gen_leech2to3_short_array(uint32_t *a, uint32_t n, uint64_t *b)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3to2_short_array(uint64_t *a, uint32_t n, uint32_t *b)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3to2_type3_array(uint64_t *a, uint32_t n, uint32_t *b)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3to2_type4_array(uint64_t *a, uint32_t n, uint32_t *b)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3_add_array(uint64_t *a, uint64_t *b, uint32_t n, uint64_t *c)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3_scalprod_array(uint64_t *a, uint64_t *b, uint32_t n, uint8_t *c)
+    # PYX <wrap pxi>
+    uint32_t gen_leech3_op_vector_word_many(uint64_t *a, uint32_t n, uint32_t *g, uint32_t len_g)
+    # PYX <wrap pxi>
+    void gen_rng_seed_rnd(uint64_t *seed, uint64_t user_rand)
+    # PYX <wrap pxi>
+    void gen_rng_seed_no(uint64_t *seed, uint64_t seed_no)
+    # PYX <wrap pxi>
+    void gen_rng_seed_child(uint64_t *seed, uint64_t *child_seed)
+    # PYX <wrap pxi>
+    int32_t gen_rng_bytes_modp(uint32_t p, uint8_t *out, uint32_t len, uint64_t *seed)
+    # PYX <wrap pxi>
+    uint32_t gen_rng_modp(uint32_t p, uint64_t *seed)
+    # PYX <wrap pxi>
+    uint64_t gen_rng_bitfields_modp(uint64_t p, uint32_t d, uint64_t *seed)
@@ -0,0 +1,775 @@
+
+######################################################################
+### Wrappers for C functions from file generators.pxd
+######################################################################
+
+
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t
+
+
+cimport cython
+cimport generators
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_g_gray(v):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_g_gray(v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_w2_gray(v):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_w2_gray(v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_g_cocode(c):
+    cdef uint32_t c_v_ = c
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_g_cocode(c_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_w2_cocode(v):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_w2_cocode(v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_op_xi(x, e):
+    cdef uint32_t x_v_ = x
+    cdef uint32_t e_v_ = e
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_op_xi(x_v_, e_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_op_xi_nosign(x, e):
+    cdef uint32_t x_v_ = x
+    cdef uint32_t e_v_ = e
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_op_xi_nosign(x_v_, e_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_leech_to_short(x):
+    cdef uint32_t x_v_ = x
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_leech_to_short(x_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_short_to_leech(x):
+    cdef uint32_t x_v_ = x
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_short_to_leech(x_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_xi_op_xi_short(x, u):
+    cdef uint32_t x_v_ = x
+    cdef uint32_t u_v_ = u
+    cdef uint32_t ret_
+    ret_ = generators.gen_xi_op_xi_short(x_v_, u_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_delta_pi(g, delta, pi):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t delta_v_ = delta
+    cdef uint32_t pi_v_ = pi
+    generators.mm_group_n_mul_delta_pi(&g_v_[0], delta_v_, pi_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_inv_delta_pi(g, delta, pi):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t delta_v_ = delta
+    cdef uint32_t pi_v_ = pi
+    generators.mm_group_n_mul_inv_delta_pi(&g_v_[0], delta_v_, pi_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_x(g, e):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t e_v_ = e
+    generators.mm_group_n_mul_x(&g_v_[0], e_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_y(g, f):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t f_v_ = f
+    generators.mm_group_n_mul_y(&g_v_[0], f_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_t(g, t):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t t_v_ = t
+    generators.mm_group_n_mul_t(&g_v_[0], t_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_clear(g):
+    cdef uint32_t[::1] g_v_ = g
+    generators.mm_group_n_clear(&g_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_copy_element(g_1, g_2):
+    cdef uint32_t[::1] g_1_v_ = g_1
+    cdef uint32_t[::1] g_2_v_ = g_2
+    generators.mm_group_n_copy_element(&g_1_v_[0], &g_2_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_element(g_1, g_2, g_3):
+    cdef uint32_t[::1] g_1_v_ = g_1
+    cdef uint32_t[::1] g_2_v_ = g_2
+    cdef uint32_t[::1] g_3_v_ = g_3
+    generators.mm_group_n_mul_element(&g_1_v_[0], &g_2_v_[0], &g_3_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_inv_element(g_1, g_2, g_3):
+    cdef uint32_t[::1] g_1_v_ = g_1
+    cdef uint32_t[::1] g_2_v_ = g_2
+    cdef uint32_t[::1] g_3_v_ = g_3
+    generators.mm_group_n_mul_inv_element(&g_1_v_[0], &g_2_v_[0], &g_3_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_inv_element(g_1, g_2):
+    cdef uint32_t[::1] g_1_v_ = g_1
+    cdef uint32_t[::1] g_2_v_ = g_2
+    generators.mm_group_n_inv_element(&g_1_v_[0], &g_2_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_conjugate_element(g_1, g_2, g_3):
+    cdef uint32_t[::1] g_1_v_ = g_1
+    cdef uint32_t[::1] g_2_v_ = g_2
+    cdef uint32_t[::1] g_3_v_ = g_3
+    generators.mm_group_n_conjugate_element(&g_1_v_[0], &g_2_v_[0], &g_3_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_word_scan(g, w, n):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_mul_word_scan(&g_v_[0], &w_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_mul_atom(g, atom):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t atom_v_ = atom
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_mul_atom(&g_v_[0], atom_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_scan_word(w, n):
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_scan_word(&w_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_conj_word_scan(g, w, n):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_conj_word_scan(&g_v_[0], &w_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_reduce_element(g):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_reduce_element(&g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_to_word(g, word):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t[::1] word_v_ = word
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_to_word(&g_v_[0], &word_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_right_coset_N_x0(g):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_n_right_coset_N_x0(&g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_n_conj_to_Q_x0(g):
+    cdef uint32_t[::1] g_v_ = g
+    cdef int32_t ret_
+    ret_ = generators.mm_group_n_conj_to_Q_x0(&g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_split_word_n(word, length, g):
+    cdef uint32_t[::1] word_v_ = word
+    cdef uint32_t length_v_ = length
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_split_word_n(&word_v_[0], length_v_, &g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_mul_words(w1, l1, w2, l2, e):
+    cdef uint32_t[::1] w1_v_ = w1
+    cdef uint32_t l1_v_ = l1
+    cdef uint32_t[::1] w2_v_ = w2
+    cdef uint32_t l2_v_ = l2
+    cdef int32_t e_v_ = e
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_mul_words(&w1_v_[0], l1_v_, &w2_v_[0], l2_v_, e_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_invert_word(w, l):
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t l_v_ = l
+    generators.mm_group_invert_word(&w_v_[0], l_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_check_word_n(w1, l1, g_out):
+    cdef uint32_t[::1] w1_v_ = w1
+    cdef uint32_t l1_v_ = l1
+    cdef uint32_t[::1] g_out_v_ = g_out
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_check_word_n(&w1_v_[0], l1_v_, &g_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_words_equ(w1, l1, w2, l2, work):
+    cdef uint32_t[::1] w1_v_ = w1
+    cdef uint32_t l1_v_ = l1
+    cdef uint32_t[::1] w2_v_ = w2
+    cdef uint32_t l2_v_ = l2
+    cdef uint32_t[::1] work_v_ = work
+    cdef uint32_t ret_
+    ret_ = generators.mm_group_words_equ(&w1_v_[0], l1_v_, &w2_v_[0], l2_v_, &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_parse_word(s, n, w, len_w):
+    cdef uint8_t[::1] s_v_ = s
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] w_v_ = w
+    cdef uint32_t len_w_v_ = len_w
+    cdef int32_t ret_
+    ret_ = generators.mm_group_parse_word(&s_v_[0], n_v_, &w_v_[0], len_w_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_mul(x1, x2):
+    cdef uint32_t x1_v_ = x1
+    cdef uint32_t x2_v_ = x2
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_mul(x1_v_, x2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_pow(x1, e):
+    cdef uint32_t x1_v_ = x1
+    cdef uint32_t e_v_ = e
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_pow(x1_v_, e_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_scalprod(x1, x2):
+    cdef uint32_t x1_v_ = x1
+    cdef uint32_t x2_v_ = x2
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_scalprod(x1_v_, x2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_op_word(q0, g, n):
+    cdef uint32_t q0_v_ = q0
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_op_word(q0_v_, &g_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_op_atom(q0, g):
+    cdef uint32_t q0_v_ = q0
+    cdef uint32_t g_v_ = g
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_op_atom(q0_v_, g_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_prefix_Gx0(g, len_g):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t len_g_v_ = len_g
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_prefix_Gx0(&g_v_[0], len_g_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_op_word_many(q, m, g, n):
+    cdef uint32_t[::1] q_v_ = q
+    cdef uint32_t m_v_ = m
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_op_word_many(&q_v_[0], m_v_, &g_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_op_word_leech2(l, g, n, back):
+    cdef uint32_t l_v_ = l
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t back_v_ = back
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_op_word_leech2(l_v_, &g_v_[0], n_v_, back_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_map_std_subframe(g, len_g, a):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t len_g_v_ = len_g
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_map_std_subframe(&g_v_[0], len_g_v_, &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_set_subtype_table(table, n):
+    cdef uint8_t[::1] table_v_ = table
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_set_subtype_table(&table_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_subtype(v2):
+    cdef uint64_t v2_v_ = v2
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_subtype(v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_compute_subtype_table(table, n):
+    cdef uint8_t[::1] table_v_ = table
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_compute_subtype_table(&table_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_type(v2):
+    cdef uint64_t v2_v_ = v2
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_type(v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_type2(v2):
+    cdef uint64_t v2_v_ = v2
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_type2(v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_count_type2(a, n):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_count_type2(&a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_start_type24(v):
+    cdef uint32_t v_v_ = v
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_start_type24(v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_start_type4(v):
+    cdef uint32_t v_v_ = v
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_start_type4(v_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_scalprod(v3_1, v3_2):
+    cdef uint64_t v3_1_v_ = v3_1
+    cdef uint64_t v3_2_v_ = v3_2
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3_scalprod(v3_1_v_, v3_2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_add(v3_1, v3_2):
+    cdef uint64_t v3_1_v_ = v3_1
+    cdef uint64_t v3_2_v_ = v3_2
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3_add(v3_1_v_, v3_2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_neg(v3):
+    cdef uint64_t v3_v_ = v3
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3_neg(v3_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2to3_short(v2):
+    cdef uint64_t v2_v_ = v2
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech2to3_short(v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3to2_short(v3):
+    cdef uint64_t v3_v_ = v3
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3to2_short(v3_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3to2_type4(v3):
+    cdef uint64_t v3_v_ = v3
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3to2_type4(v3_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3to2_type3(v3):
+    cdef uint64_t v3_v_ = v3
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3to2_type3(v3_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_op_xi(v3, e):
+    cdef uint64_t v3_v_ = v3
+    cdef uint32_t e_v_ = e
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3_op_xi(v3_v_, e_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_op_vector_word(v3, pg, n):
+    cdef uint64_t v3_v_ = v3
+    cdef uint32_t[::1] pg_v_ = pg
+    cdef uint32_t n_v_ = n
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3_op_vector_word(v3_v_, &pg_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_op_vector_atom(v3, g):
+    cdef uint64_t v3_v_ = v3
+    cdef uint32_t g_v_ = g
+    cdef uint64_t ret_
+    ret_ = generators.gen_leech3_op_vector_atom(v3_v_, g_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_reduce_type2(v, pg_out):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t[::1] pg_out_v_ = pg_out
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_reduce_type2(v_v_, &pg_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_reduce_type2_ortho(v, pg_out):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t[::1] pg_out_v_ = pg_out
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_reduce_type2_ortho(v_v_, &pg_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_reduce_type4(v, pg_out):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t[::1] pg_out_v_ = pg_out
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_reduce_type4(v_v_, &pg_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_type_selftest(start, n, result):
+    cdef uint32_t start_v_ = start
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] result_v_ = result
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_type_selftest(start_v_, n_v_, &result_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_reduce_n(v, pg_out):
+    cdef uint32_t v_v_ = v
+    cdef uint32_t[::1] pg_out_v_ = pg_out
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_reduce_n(v_v_, &pg_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_reduce_n_rep(subtype):
+    cdef uint32_t subtype_v_ = subtype
+    cdef int32_t ret_
+    ret_ = generators.gen_leech2_reduce_n_rep(subtype_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_type_array(a, n, t):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint8_t[::1] t_v_ = t
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_type_array(&a_v_[0], n_v_, &t_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_subtype_array(a, n, t):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint8_t[::1] t_v_ = t
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_subtype_array(&a_v_[0], n_v_, &t_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_type2_array(a, n, t):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint8_t[::1] t_v_ = t
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_type2_array(&a_v_[0], n_v_, &t_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_mul_array(a, b, n, c):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t[::1] b_v_ = b
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] c_v_ = c
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_mul_array(&a_v_[0], &b_v_[0], n_v_, &c_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2_scalprod_array(a, b, n, c):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t[::1] b_v_ = b
+    cdef uint32_t n_v_ = n
+    cdef uint8_t[::1] c_v_ = c
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2_scalprod_array(&a_v_[0], &b_v_[0], n_v_, &c_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech2to3_short_array(a, n, b):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] b_v_ = b
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech2to3_short_array(&a_v_[0], n_v_, &b_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3to2_short_array(a, n, b):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] b_v_ = b
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3to2_short_array(&a_v_[0], n_v_, &b_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3to2_type3_array(a, n, b):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] b_v_ = b
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3to2_type3_array(&a_v_[0], n_v_, &b_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3to2_type4_array(a, n, b):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] b_v_ = b
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3to2_type4_array(&a_v_[0], n_v_, &b_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_add_array(a, b, n, c):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint64_t[::1] b_v_ = b
+    cdef uint32_t n_v_ = n
+    cdef uint64_t[::1] c_v_ = c
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3_add_array(&a_v_[0], &b_v_[0], n_v_, &c_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_scalprod_array(a, b, n, c):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint64_t[::1] b_v_ = b
+    cdef uint32_t n_v_ = n
+    cdef uint8_t[::1] c_v_ = c
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3_scalprod_array(&a_v_[0], &b_v_[0], n_v_, &c_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_leech3_op_vector_word_many(a, n, g, len_g):
+    cdef uint64_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t len_g_v_ = len_g
+    cdef uint32_t ret_
+    ret_ = generators.gen_leech3_op_vector_word_many(&a_v_[0], n_v_, &g_v_[0], len_g_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_rng_seed_rnd(seed, user_rand):
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef uint64_t user_rand_v_ = user_rand
+    generators.gen_rng_seed_rnd(&seed_v_[0], user_rand_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_rng_seed_no(seed, seed_no):
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef uint64_t seed_no_v_ = seed_no
+    generators.gen_rng_seed_no(&seed_v_[0], seed_no_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_rng_seed_child(seed, child_seed):
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef uint64_t[::1] child_seed_v_ = child_seed
+    generators.gen_rng_seed_child(&seed_v_[0], &child_seed_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_rng_bytes_modp(p, out, len, seed):
+    cdef uint32_t p_v_ = p
+    cdef uint8_t[::1] out_v_ = out
+    cdef uint32_t len_v_ = len
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef int32_t ret_
+    ret_ = generators.gen_rng_bytes_modp(p_v_, &out_v_[0], len_v_, &seed_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_rng_modp(p, seed):
+    cdef uint32_t p_v_ = p
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef uint32_t ret_
+    ret_ = generators.gen_rng_modp(p_v_, &seed_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gen_rng_bitfields_modp(p, d, seed):
+    cdef uint64_t p_v_ = p
+    cdef uint32_t d_v_ = d
+    cdef uint64_t[::1] seed_v_ = seed
+    cdef uint64_t ret_
+    ret_ = generators.gen_rng_bitfields_modp(p_v_, d_v_, &seed_v_[0])
+    return ret_
+
@@ -0,0 +1,131 @@
+# This .pxd file has been generated automatically. Do not edit!
+
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t
+from libc.stdint cimport uint64_t as uint_mmv_t
+
+INT_BITS = 64
+
+cdef extern from "mm_basics.h":
+    # PYX <wrap pxi>
+    void mm_aux_read_mmv1(uint32_t p, uint_mmv_t *mv, uint8_t *b, uint32_t len)
+    # PYX <wrap pxi>
+    void mm_aux_read_direct_mmv1(uint32_t p, uint_mmv_t *mv, uint8_t *b, uint32_t len)
+    # PYX <wrap pxi>
+    void mm_aux_write_mmv1(uint32_t p, uint8_t *b, uint_mmv_t *mv, uint32_t len)
+    # PYX <wrap pxi>
+    void mm_aux_read_mmv24(uint32_t p, uint_mmv_t *mv, uint8_t *b, uint32_t len)
+    # PYX <wrap pxi>
+    void mm_aux_write_mmv24(uint32_t p, uint8_t *b, uint_mmv_t *mv, uint32_t len)
+    # PYX <wrap pxi>
+    uint8_t mm_aux_get_mmv1(uint32_t p, uint_mmv_t *mv, uint32_t i)
+    # PYX <wrap pxi>
+    void mm_aux_put_mmv1(uint32_t p, uint8_t value, uint_mmv_t *mv, uint32_t i)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_mmv_size(uint32_t p)
+    # PYX <wrap pxi>
+    void mm_aux_zero_mmv(uint32_t p, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    uint8_t mm_aux_get_mmv(uint32_t p, uint_mmv_t *mv, uint32_t i)
+    # PYX <wrap pxi>
+    void mm_aux_put_mmv(uint32_t p, uint8_t value, uint_mmv_t *mv, uint32_t i)
+    # PYX <wrap pxi>
+    void mm_aux_random_mmv(uint32_t p, uint_mmv_t *mv, uint64_t *seed)
+    # PYX <wrap pxi>
+    int32_t mm_aux_reduce_mmv(uint32_t p, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    int32_t mm_aux_reduce_mmv_fields(uint32_t p, uint_mmv_t *mv, uint32_t nfields)
+    # PYX <wrap pxi>
+    int32_t mm_aux_check_mmv(uint32_t p, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    void mm_aux_small24_expand(uint8_t *b_src, uint8_t *b_dest)
+    # PYX <wrap pxi>
+    void mm_aux_small24_compress(uint8_t *b_src, uint8_t *b_dest)
+    # PYX <wrap pxi>
+    void mm_aux_mmv_to_bytes(uint32_t p, uint_mmv_t *mv, uint8_t *b)
+    # PYX <wrap pxi>
+    void mm_aux_bytes_to_mmv(uint32_t p, uint8_t *b, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    int32_t mm_aux_mmv_to_sparse(uint32_t p, uint_mmv_t *mv, uint32_t *sp)
+    # PYX <wrap pxi>
+    void mm_aux_mmv_extract_sparse(uint32_t p, uint_mmv_t *mv, uint32_t *sp, uint32_t length)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_mmv_get_sparse(uint32_t p, uint_mmv_t *mv, uint32_t sp)
+    # PYX <wrap pxi>
+    void mm_aux_mmv_add_sparse(uint32_t p, uint32_t *sp, uint32_t length, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    void mm_aux_mmv_set_sparse(uint32_t p, uint_mmv_t *mv, uint32_t *sp, uint32_t length)
+    # PYX <wrap pxi>
+    int32_t mm_aux_mmv_extract_sparse_signs(uint32_t p, uint_mmv_t *mv, uint32_t *sp, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t mm_aux_mmv_extract_x_signs(uint32_t p, uint_mmv_t *mv, uint64_t *elem, uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    int32_t mm_aux_mul_sparse(uint32_t p, uint32_t *sp, uint32_t length, int64_t f, uint32_t p1, uint32_t *sp1)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_index_extern_to_sparse(uint32_t i)
+    # PYX <wrap pxi>
+    void mm_aux_array_extern_to_sparse(uint32_t *a, uint32_t len)
+    # PYX <wrap pxi>
+    int32_t mm_aux_index_sparse_to_extern(uint32_t i)
+    # PYX <wrap pxi>
+    int32_t mm_aux_index_sparse_to_leech(uint32_t i, int32_t *v)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_index_sparse_to_leech2(uint32_t i)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_index_leech2_to_sparse(uint32_t v2)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_index_intern_to_sparse(uint32_t i)
+    # PYX <wrap pxi>
+    int32_t mm_aux_get_mmv_leech2(uint32_t p, uint_mmv_t *mv, uint32_t v2)
+    # PYX <wrap pxi>
+    uint64_t mm_aux_hash(uint32_t p, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    uint64_t mm_aux_hash_combine(uint32_t p, uint64_t *hashes)
+    # PYX <wrap pxi>
+    uint64_t mm_aux_hash_blocks(uint32_t p, uint_mmv_t *mv, uint32_t mask, uint64_t *hashes)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_set_num_threads(uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t mm_aux_get_num_threads()
+    # PYX <wrap pxi>
+    uint32_t mm_aux_have_openmp()
+    # PYX <wrap pxi>
+    uint32_t mm_aux_simd_level()
+    # PYX <wrap pxi>
+    int32_t mm_sub_test_prep_pi_64(uint32_t eps, uint32_t pi, uint32_t *p_tbl)
+    # PYX <wrap pxi>
+    void  mm_sub_test_prep_xy(uint32_t f, uint32_t e, uint32_t eps, uint32_t n, uint32_t *p_tbl)
+    # PYX <wrap pxi>
+    int32_t mm_group_prepare_op_ABC(uint32_t *g, uint32_t len_g, uint32_t *a)
+    # PYX <wrap pxi>
+    uint32_t mm_sub_get_table_xi(uint32_t e, uint32_t i, uint32_t j, uint32_t k)
+    # PYX <wrap pxi>
+    uint32_t mm_crt_combine(uint_mmv_t *p7, uint_mmv_t *p31, uint_mmv_t *p127, uint_mmv_t *p255, int32_t *p_out)
+    # PYX <wrap pxi>
+    uint32_t mm_crt_combine_bytes(uint8_t *p7, uint8_t *p31, uint8_t *p127, uint8_t *p255, uint32_t n, int32_t *p_out)
+    # PYX <wrap pxi>
+    int32_t mm_crt_combine_rows(uint_mmv_t *p7, uint_mmv_t *p31, uint_mmv_t *p127, uint_mmv_t *p255, uint32_t row, uint32_t nrows, int32_t *p_out, int64_t *p_norm2)
+    # PYX <wrap pxi>
+    uint32_t mm_crt_check_v2(uint_mmv_t *p7, uint_mmv_t *p31, uint_mmv_t *p127, uint_mmv_t *p255)
+    # PYX <wrap pxi>
+    uint32_t mm_crt_check_g(uint32_t g, uint_mmv_t *p7, uint_mmv_t *p31, uint_mmv_t *p127, uint_mmv_t *p255)
+    # PYX <wrap pxi>
+    int64_t mm_crt_norm_int32_32(int32_t *pv, uint32_t i0, uint32_t i1)
+    # PYX <wrap pxi>
+    int64_t mm_crt_norm_int32(int32_t *pv)
+    # PYX <wrap pxi>
+    uint32_t mm_crt_v2_int32_32(int32_t *pv, uint32_t i0, uint32_t i1)
+    # PYX <wrap pxi>
+    uint32_t mm_crt_v2_int32(int32_t *pv)
+    # PYX <wrap pxi>
+    int32_t mm_sparse_sort_reduce(uint32_t p, uint32_t *sp, uint32_t length)
+    # PYX <wrap pxi>
+    int32_t mm_sparse_add(uint32_t p, uint32_t *sp1, uint32_t len1, uint32_t *sp2, uint32_t len2, int32_t f, uint32_t *sp_out)
+    # PYX <wrap pxi>
+    int32_t mm_sparse_scale(uint32_t p, uint32_t *sp, uint32_t length, int32_t f)
+    # PYX <wrap pxi>
+    int32_t mm_sparse_scalprod(uint32_t p, uint32_t *sp1, uint32_t len1, uint32_t *sp2, uint32_t len2)
+    # PYX <wrap pxi>
+    int32_t mm_sparse_op_n0(uint32_t p, uint32_t *sp, uint32_t length, uint32_t *g, uint32_t *sp_out)
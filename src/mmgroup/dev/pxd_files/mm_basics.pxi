@@ -0,0 +1,588 @@
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t
+from libc.stdint cimport uint64_t as uint_mmv_t
+
+INT_BITS = 64
+
+
+######################################################################
+### Wrappers for C functions from file mm_basics.pxd
+######################################################################
+
+
+cimport cython
+cimport mm_basics
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_read_mmv1(p, mv, b, len):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint8_t[::1] b_v_ = b
+    cdef uint32_t len_v_ = len
+    mm_basics.mm_aux_read_mmv1(p_v_, &mv_v_[0], &b_v_[0], len_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_read_direct_mmv1(p, mv, b, len):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint8_t[::1] b_v_ = b
+    cdef uint32_t len_v_ = len
+    mm_basics.mm_aux_read_direct_mmv1(p_v_, &mv_v_[0], &b_v_[0], len_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_write_mmv1(p, b, mv, len):
+    cdef uint32_t p_v_ = p
+    cdef uint8_t[::1] b_v_ = b
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t len_v_ = len
+    mm_basics.mm_aux_write_mmv1(p_v_, &b_v_[0], &mv_v_[0], len_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_read_mmv24(p, mv, b, len):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint8_t[::1] b_v_ = b
+    cdef uint32_t len_v_ = len
+    mm_basics.mm_aux_read_mmv24(p_v_, &mv_v_[0], &b_v_[0], len_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_write_mmv24(p, b, mv, len):
+    cdef uint32_t p_v_ = p
+    cdef uint8_t[::1] b_v_ = b
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t len_v_ = len
+    mm_basics.mm_aux_write_mmv24(p_v_, &b_v_[0], &mv_v_[0], len_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_get_mmv1(p, mv, i):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t i_v_ = i
+    cdef uint8_t ret_
+    ret_ = mm_basics.mm_aux_get_mmv1(p_v_, &mv_v_[0], i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_put_mmv1(p, value, mv, i):
+    cdef uint32_t p_v_ = p
+    cdef uint8_t value_v_ = value
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t i_v_ = i
+    mm_basics.mm_aux_put_mmv1(p_v_, value_v_, &mv_v_[0], i_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_size(p):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_mmv_size(p_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_zero_mmv(p, mv):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    mm_basics.mm_aux_zero_mmv(p_v_, &mv_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_get_mmv(p, mv, i):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t i_v_ = i
+    cdef uint8_t ret_
+    ret_ = mm_basics.mm_aux_get_mmv(p_v_, &mv_v_[0], i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_put_mmv(p, value, mv, i):
+    cdef uint32_t p_v_ = p
+    cdef uint8_t value_v_ = value
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t i_v_ = i
+    mm_basics.mm_aux_put_mmv(p_v_, value_v_, &mv_v_[0], i_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_random_mmv(p, mv, seed):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint64_t[::1] seed_v_ = seed
+    mm_basics.mm_aux_random_mmv(p_v_, &mv_v_[0], &seed_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_reduce_mmv(p, mv):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_reduce_mmv(p_v_, &mv_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_reduce_mmv_fields(p, mv, nfields):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t nfields_v_ = nfields
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_reduce_mmv_fields(p_v_, &mv_v_[0], nfields_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_check_mmv(p, mv):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_check_mmv(p_v_, &mv_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_small24_expand(b_src, b_dest):
+    cdef uint8_t[::1] b_src_v_ = b_src
+    cdef uint8_t[::1] b_dest_v_ = b_dest
+    mm_basics.mm_aux_small24_expand(&b_src_v_[0], &b_dest_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_small24_compress(b_src, b_dest):
+    cdef uint8_t[::1] b_src_v_ = b_src
+    cdef uint8_t[::1] b_dest_v_ = b_dest
+    mm_basics.mm_aux_small24_compress(&b_src_v_[0], &b_dest_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_to_bytes(p, mv, b):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint8_t[::1] b_v_ = b
+    mm_basics.mm_aux_mmv_to_bytes(p_v_, &mv_v_[0], &b_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_bytes_to_mmv(p, b, mv):
+    cdef uint32_t p_v_ = p
+    cdef uint8_t[::1] b_v_ = b
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    mm_basics.mm_aux_bytes_to_mmv(p_v_, &b_v_[0], &mv_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_to_sparse(p, mv, sp):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_mmv_to_sparse(p_v_, &mv_v_[0], &sp_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_extract_sparse(p, mv, sp, length):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    mm_basics.mm_aux_mmv_extract_sparse(p_v_, &mv_v_[0], &sp_v_[0], length_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_get_sparse(p, mv, sp):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t sp_v_ = sp
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_mmv_get_sparse(p_v_, &mv_v_[0], sp_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_add_sparse(p, sp, length, mv):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    mm_basics.mm_aux_mmv_add_sparse(p_v_, &sp_v_[0], length_v_, &mv_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_set_sparse(p, mv, sp, length):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    mm_basics.mm_aux_mmv_set_sparse(p_v_, &mv_v_[0], &sp_v_[0], length_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_extract_sparse_signs(p, mv, sp, n):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_mmv_extract_sparse_signs(p_v_, &mv_v_[0], &sp_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mmv_extract_x_signs(p, mv, elem, a, n):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint64_t[::1] elem_v_ = elem
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_mmv_extract_x_signs(p_v_, &mv_v_[0], &elem_v_[0], &a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_mul_sparse(p, sp, length, f, p1, sp1):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    cdef int64_t f_v_ = f
+    cdef uint32_t p1_v_ = p1
+    cdef uint32_t[::1] sp1_v_ = sp1
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_mul_sparse(p_v_, &sp_v_[0], length_v_, f_v_, p1_v_, &sp1_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_index_extern_to_sparse(i):
+    cdef uint32_t i_v_ = i
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_index_extern_to_sparse(i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_array_extern_to_sparse(a, len):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t len_v_ = len
+    mm_basics.mm_aux_array_extern_to_sparse(&a_v_[0], len_v_)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_index_sparse_to_extern(i):
+    cdef uint32_t i_v_ = i
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_index_sparse_to_extern(i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_index_sparse_to_leech(i, v):
+    cdef uint32_t i_v_ = i
+    cdef int32_t[::1] v_v_ = v
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_index_sparse_to_leech(i_v_, &v_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_index_sparse_to_leech2(i):
+    cdef uint32_t i_v_ = i
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_index_sparse_to_leech2(i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_index_leech2_to_sparse(v2):
+    cdef uint32_t v2_v_ = v2
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_index_leech2_to_sparse(v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_index_intern_to_sparse(i):
+    cdef uint32_t i_v_ = i
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_index_intern_to_sparse(i_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_get_mmv_leech2(p, mv, v2):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t v2_v_ = v2
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_aux_get_mmv_leech2(p_v_, &mv_v_[0], v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_hash(p, mv):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint64_t ret_
+    ret_ = mm_basics.mm_aux_hash(p_v_, &mv_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_hash_combine(p, hashes):
+    cdef uint32_t p_v_ = p
+    cdef uint64_t[::1] hashes_v_ = hashes
+    cdef uint64_t ret_
+    ret_ = mm_basics.mm_aux_hash_combine(p_v_, &hashes_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_hash_blocks(p, mv, mask, hashes):
+    cdef uint32_t p_v_ = p
+    cdef uint_mmv_t[::1] mv_v_ = mv
+    cdef uint32_t mask_v_ = mask
+    cdef uint64_t[::1] hashes_v_ = hashes
+    cdef uint64_t ret_
+    ret_ = mm_basics.mm_aux_hash_blocks(p_v_, &mv_v_[0], mask_v_, &hashes_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_set_num_threads(n):
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_set_num_threads(n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_get_num_threads():
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_get_num_threads()
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_have_openmp():
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_have_openmp()
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_aux_simd_level():
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_aux_simd_level()
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sub_test_prep_pi_64(eps, pi, p_tbl):
+    cdef uint32_t eps_v_ = eps
+    cdef uint32_t pi_v_ = pi
+    cdef uint32_t[::1] p_tbl_v_ = p_tbl
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_sub_test_prep_pi_64(eps_v_, pi_v_, &p_tbl_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sub_test_prep_xy(f, e, eps, n, p_tbl):
+    cdef uint32_t f_v_ = f
+    cdef uint32_t e_v_ = e
+    cdef uint32_t eps_v_ = eps
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] p_tbl_v_ = p_tbl
+    mm_basics.mm_sub_test_prep_xy(f_v_, e_v_, eps_v_, n_v_, &p_tbl_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_group_prepare_op_ABC(g, len_g, a):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t len_g_v_ = len_g
+    cdef uint32_t[::1] a_v_ = a
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_group_prepare_op_ABC(&g_v_[0], len_g_v_, &a_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sub_get_table_xi(e, i, j, k):
+    cdef uint32_t e_v_ = e
+    cdef uint32_t i_v_ = i
+    cdef uint32_t j_v_ = j
+    cdef uint32_t k_v_ = k
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_sub_get_table_xi(e_v_, i_v_, j_v_, k_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_combine(p7, p31, p127, p255, p_out):
+    cdef uint_mmv_t[::1] p7_v_ = p7
+    cdef uint_mmv_t[::1] p31_v_ = p31
+    cdef uint_mmv_t[::1] p127_v_ = p127
+    cdef uint_mmv_t[::1] p255_v_ = p255
+    cdef int32_t[::1] p_out_v_ = p_out
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_crt_combine(&p7_v_[0], &p31_v_[0], &p127_v_[0], &p255_v_[0], &p_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_combine_bytes(p7, p31, p127, p255, n, p_out):
+    cdef uint8_t[::1] p7_v_ = p7
+    cdef uint8_t[::1] p31_v_ = p31
+    cdef uint8_t[::1] p127_v_ = p127
+    cdef uint8_t[::1] p255_v_ = p255
+    cdef uint32_t n_v_ = n
+    cdef int32_t[::1] p_out_v_ = p_out
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_crt_combine_bytes(&p7_v_[0], &p31_v_[0], &p127_v_[0], &p255_v_[0], n_v_, &p_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_combine_rows(p7, p31, p127, p255, row, nrows, p_out, p_norm2):
+    cdef uint_mmv_t[::1] p7_v_ = p7
+    cdef uint_mmv_t[::1] p31_v_ = p31
+    cdef uint_mmv_t[::1] p127_v_ = p127
+    cdef uint_mmv_t[::1] p255_v_ = p255
+    cdef uint32_t row_v_ = row
+    cdef uint32_t nrows_v_ = nrows
+    cdef int32_t[::1] p_out_v_ = p_out
+    cdef int64_t[::1] p_norm2_v_ = p_norm2
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_crt_combine_rows(&p7_v_[0], &p31_v_[0], &p127_v_[0], &p255_v_[0], row_v_, nrows_v_, &p_out_v_[0], &p_norm2_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_check_v2(p7, p31, p127, p255):
+    cdef uint_mmv_t[::1] p7_v_ = p7
+    cdef uint_mmv_t[::1] p31_v_ = p31
+    cdef uint_mmv_t[::1] p127_v_ = p127
+    cdef uint_mmv_t[::1] p255_v_ = p255
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_crt_check_v2(&p7_v_[0], &p31_v_[0], &p127_v_[0], &p255_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_check_g(g, p7, p31, p127, p255):
+    cdef uint32_t g_v_ = g
+    cdef uint_mmv_t[::1] p7_v_ = p7
+    cdef uint_mmv_t[::1] p31_v_ = p31
+    cdef uint_mmv_t[::1] p127_v_ = p127
+    cdef uint_mmv_t[::1] p255_v_ = p255
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_crt_check_g(g_v_, &p7_v_[0], &p31_v_[0], &p127_v_[0], &p255_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_norm_int32_32(pv, i0, i1):
+    cdef int32_t[::1] pv_v_ = pv
+    cdef uint32_t i0_v_ = i0
+    cdef uint32_t i1_v_ = i1
+    cdef int64_t ret_
+    ret_ = mm_basics.mm_crt_norm_int32_32(&pv_v_[0], i0_v_, i1_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_norm_int32(pv):
+    cdef int32_t[::1] pv_v_ = pv
+    cdef int64_t ret_
+    ret_ = mm_basics.mm_crt_norm_int32(&pv_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_v2_int32_32(pv, i0, i1):
+    cdef int32_t[::1] pv_v_ = pv
+    cdef uint32_t i0_v_ = i0
+    cdef uint32_t i1_v_ = i1
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_crt_v2_int32_32(&pv_v_[0], i0_v_, i1_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_v2_int32(pv):
+    cdef int32_t[::1] pv_v_ = pv
+    cdef uint32_t ret_
+    ret_ = mm_basics.mm_crt_v2_int32(&pv_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sparse_sort_reduce(p, sp, length):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_sparse_sort_reduce(p_v_, &sp_v_[0], length_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sparse_add(p, sp1, len1, sp2, len2, f, sp_out):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp1_v_ = sp1
+    cdef uint32_t len1_v_ = len1
+    cdef uint32_t[::1] sp2_v_ = sp2
+    cdef uint32_t len2_v_ = len2
+    cdef int32_t f_v_ = f
+    cdef uint32_t[::1] sp_out_v_ = sp_out
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_sparse_add(p_v_, &sp1_v_[0], len1_v_, &sp2_v_[0], len2_v_, f_v_, &sp_out_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sparse_scale(p, sp, length, f):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    cdef int32_t f_v_ = f
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_sparse_scale(p_v_, &sp_v_[0], length_v_, f_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sparse_scalprod(p, sp1, len1, sp2, len2):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp1_v_ = sp1
+    cdef uint32_t len1_v_ = len1
+    cdef uint32_t[::1] sp2_v_ = sp2
+    cdef uint32_t len2_v_ = len2
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_sparse_scalprod(p_v_, &sp1_v_[0], len1_v_, &sp2_v_[0], len2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_sparse_op_n0(p, sp, length, g, sp_out):
+    cdef uint32_t p_v_ = p
+    cdef uint32_t[::1] sp_v_ = sp
+    cdef uint32_t length_v_ = length
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t[::1] sp_out_v_ = sp_out
+    cdef int32_t ret_
+    ret_ = mm_basics.mm_sparse_op_n0(p_v_, &sp_v_[0], length_v_, &g_v_[0], &sp_out_v_[0])
+    return ret_
+
@@ -0,0 +1,73 @@
+# This .pxd file has been generated automatically. Do not edit!
+
+
+# cython: language_level=3
+
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+from libc.stdint cimport uint32_t, uint16_t, uint8_t, int32_t
+from libc.stdint cimport uint64_t
+from libc.stdint cimport uint64_t as uint_mmv_t
+
+
+
+cdef extern from "mm_op255.h" nogil:
+    # PYX <wrap pxi>
+    void mm_op255_pi(uint_mmv_t *v_in, uint32_t delta, uint32_t pi, uint_mmv_t * v_out)
+    # PYX <wrap pxi>
+    void mm_op255_pi_multi(uint_mmv_t *v_in, uint32_t k, uint32_t delta, uint32_t pi, uint_mmv_t * v_out)
+    # PYX <wrap pxi>
+    void mm_op255_delta(uint_mmv_t *v_in, uint32_t delta, uint_mmv_t * v_out)
+    # PYX <wrap pxi>
+    void mm_op255_pi_tag_ABC(uint_mmv_t *v, uint32_t delta, uint32_t pi, uint32_t mode)
+    # PYX <wrap pxi>
+    void mm_op255_pi_tag_ABC_hash(uint_mmv_t *v, uint32_t delta, uint32_t pi, uint32_t mode, uint64_t *hashes)
+    # PYX <wrap pxi>
+    void mm_op255_delta_tag_ABC(uint_mmv_t *v, uint32_t d, uint32_t mode)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_copy(uint_mmv_t *mv1, uint_mmv_t *mv2)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_compare_len(uint_mmv_t *mv1, uint_mmv_t *mv2, uint32_t len)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_compare(uint_mmv_t *mv1, uint_mmv_t *mv2)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_checkzero(uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    void mm_op255_vector_add(uint_mmv_t *mv1, uint_mmv_t *mv2)
+    # PYX <wrap pxi>
+    void mm_op255_scalar_mul(int32_t factor, uint_mmv_t *mv1)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_compare_mod_q(uint_mmv_t *mv1, uint_mmv_t *mv2, uint32_t q)
+    # PYX <wrap pxi>
+    int32_t mm_op255_store_axis(uint32_t x, uint_mmv_t *mv)
+    # PYX <wrap pxi>
+    void mm_op255_xy(uint_mmv_t *v_in, uint32_t f, uint32_t e, uint32_t eps, uint_mmv_t *v_out)
+    # PYX <wrap pxi>
+    void mm_op255_xy_multi(uint_mmv_t *v_in, uint32_t k, uint32_t f, uint32_t e, uint32_t eps, uint_mmv_t *v_out)
+    # PYX <wrap pxi>
+    void mm_op255_omega(uint_mmv_t *v, uint32_t d)
+    # PYX <wrap pxi>
+    void mm_op255_xy_tag_ABC(uint_mmv_t *v, uint32_t f, uint32_t e, uint32_t eps, uint32_t mode)
+    # PYX <wrap pxi>
+    void mm_op255_xy_tag_ABC_hash(uint_mmv_t *v, uint32_t f, uint32_t e, uint32_t eps, uint32_t mode, uint64_t *hashes)
+    # PYX <wrap pxi>
+    void mm_op255_t(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out)
+    # PYX <wrap pxi>
+    void mm_op255_t_A(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out)
+    # PYX <wrap pxi>
+    void mm_op255_t_ABC(uint_mmv_t *v,  uint32_t exp)
+    # PYX <wrap pxi>
+    void mm_op255_xi(uint_mmv_t *v_in,  uint32_t exp, uint_mmv_t *v_out)
+    # PYX <wrap pxi>
+    void mm_op255_xi_tag_A(uint_mmv_t *v,  uint32_t exp)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_word(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    uint32_t mm_op255_word_multi(uint_mmv_t *v, uint32_t k, uint32_t *g, int32_t len_g, int32_t e, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_op255_word_tag_A(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e)
+    # PYX <wrap pxi>
+    int32_t mm_op255_word_tag_A_hash(uint_mmv_t *v, uint32_t *g, int32_t len_g, int32_t e, uint64_t *hashes)
+    # PYX <wrap pxi>
+    int32_t mm_op255_word_ABC(uint_mmv_t *v, uint32_t *g, int32_t len_g, uint_mmv_t *v_out)
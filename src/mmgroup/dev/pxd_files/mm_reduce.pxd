@@ -0,0 +1,113 @@
+# This .pxd file has been generated automatically. Do not edit!
+
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t
+from libc.stdint cimport uint64_t as uint_mmv_t
+
+INT_BITS = 64
+
+
+cdef extern from "mm_reduce.h":
+    enum: MAX_GT_WORD_DATA
+
+    ctypedef struct gt_subword_type:
+        uint32_t eof  
+        uint32_t length
+        uint32_t img_Omega
+        uint32_t t_exp
+        uint32_t reduced
+        gt_subword_type *p_prev
+        gt_subword_type *p_next
+        uint32_t data[MAX_GT_WORD_DATA]
+
+    ctypedef struct gt_word_type:
+        gt_subword_type *p_end
+        gt_subword_type *p_node
+        gt_subword_type *p_free
+        int32_t reduce_mode;
+
+
+
+cdef extern from "mm_reduce.h" nogil:
+    # PYX <wrap pxi>
+    int32_t mm_order_load_tag_data(uint32_t n, uint32_t *buf, uint32_t buf_size)
+    # PYX <wrap pxi>
+    void mm_order_load_vector(uint_mmv_t *p_dest)
+    const uint_mmv_t *mm_order_vector_ptr()
+    # PYX <wrap pxi>
+    int32_t mm_order_compare_vector(uint_mmv_t *p_v)
+    # PYX <wrap pxi>
+    int32_t mm_order_compare_vector_part_A(uint_mmv_t *p_v)
+    # PYX <wrap pxi>
+    uint64_t mm_order_hash_vector(uint_mmv_t *p_dest)
+    # PYX <wrap pxi>
+    int32_t mm_order_check_in_Gx0(uint_mmv_t *v, uint32_t *g, uint32_t mode, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_order_element_Gx0_work(uint32_t *g, uint32_t n, uint32_t *h, uint32_t o, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_order_element_Gx0(uint32_t *g, uint32_t n, uint32_t *h, uint32_t o)
+    # PYX <wrap pxi>
+    int32_t mm_order_element_M_work(uint32_t *g, uint32_t n, uint32_t o, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_order_element_M(uint32_t *g, uint32_t n, uint32_t o)
+    # PYX <wrap pxi>
+    int32_t mm_order_element_M_bsgs_work(uint32_t *g, uint32_t n, uint32_t o, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_order_element_M_many(uint32_t *a, uint32_t *ofs, uint32_t m, uint32_t o, uint32_t mode, uint32_t *orders, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    uint32_t mm_reduce_2A_axis_type(uint_mmv_t *v)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_analyze_2A_axis(uint_mmv_t *v, uint32_t * r)
+    # PYX <wrap pxi>
+    uint32_t mm_reduce_find_type4(uint32_t *v, uint32_t n, uint32_t v2)
+    # PYX <wrap pxi>
+    int32_t  mm_reduce_load_axis(uint_mmv_t *v, uint32_t s)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_map_axis(uint32_t *vt, uint_mmv_t *v, uint32_t *a, uint32_t n, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_vector_vp(uint32_t *vt, uint_mmv_t *v, uint32_t mode, uint32_t *r, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_vector_shortcut(uint32_t stage, uint32_t mode, uint32_t axis, uint32_t *r)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_vector_vm(uint32_t *vt, uint_mmv_t *v, uint32_t *r, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_vector_v1(uint_mmv_t *v, uint32_t *r, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_M(uint32_t *a,  uint32_t n, uint32_t mode, uint32_t *r)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_M_work(uint32_t *a, uint32_t n, uint32_t mode, uint32_t *r, uint_mmv_t *work)
+    # PYX <wrap pxi>
+    int32_t mm_reduce_M_many(uint32_t *a, uint32_t *ofs, uint32_t m, uint32_t mode, uint32_t *r, uint32_t len_r, uint32_t *r_ofs)
+    # PYX <wrap pxi>
+    uint32_t mm_reduce_op_2A_axis_type(uint_mmv_t *v, uint32_t *g, uint32_t len_g, uint32_t mode)
+    void gt_subword_clear(gt_subword_type *p_gtsub)
+    gt_word_type *gt_word_alloc(uint32_t mode, void *p_buffer, size_t nbytes)
+    void gt_word_free(gt_word_type *p_gt)
+    void gt_word_clear(gt_word_type *p_gt)
+    int32_t gt_word_insert(gt_word_type *p_gt)
+    int32_t gt_word_delete(gt_word_type *p_gt)
+    int32_t gt_word_seek(gt_word_type *p_gt, int32_t pos, uint32_t set)
+    int32_t gt_word_append_sub_part(gt_word_type *p_gt, uint32_t *a,  uint32_t n)
+    int32_t gt_word_reduce_sub(gt_word_type *p_gt, uint32_t sub_mode)
+    int32_t gt_word_rule_join(gt_word_type *p_gt)
+    int32_t gt_word_rule_t_xi_t(gt_word_type *p_gt)
+    int32_t gt_word_reduce_input(gt_word_type *p_gt)
+    int32_t gt_word_append(gt_word_type *p_gt, uint32_t *a, uint32_t n)
+    # PYX <wrap pxi>
+    uint32_t gt_word_n_subwords(uint32_t *a, uint32_t n)
+    int32_t gt_word_length(gt_word_type *p_gt)
+    int32_t gt_word_reduce(gt_word_type *p_gt)
+    int32_t gt_word_store(gt_word_type *p_gt, uint32_t *pa, uint32_t maxlen)
+    # PYX <wrap pxi>
+    int32_t gt_word_shorten(uint32_t *g, uint32_t n, uint32_t *g1, uint32_t n1max, uint32_t mode)
+    # PYX <wrap pxi>
+    void mm_order_load_vector_v1_mod3(uint_mmv_t *p_dest)
+    const uint_mmv_t *mm_order_vector_v1_mod3_ptr()
+    # PYX <wrap pxi>
+    int32_t mm_order_compare_v1_mod3(uint_mmv_t *v)
+    # PYX <wrap pxi>
+    int32_t mm_order_find_Gx0_via_v1_mod3(uint_mmv_t *v,  uint32_t *g)
+    # PYX <wrap pxi>
+    int32_t mm_crt_op_word(uint_mmv_t *v7, uint_mmv_t *v31, uint_mmv_t *v127, uint_mmv_t *v255, uint32_t *g, uint32_t len_g, uint32_t check, uint_mmv_t *work)
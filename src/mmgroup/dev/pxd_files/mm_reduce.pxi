@@ -0,0 +1,391 @@
+
+
+from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t
+from libc.stdint cimport int64_t, int32_t
+from libc.stdint cimport uint64_t as uint_mmv_t
+
+INT_BITS = 64
+
+
+cdef extern from "mm_reduce.h":
+    enum: MAX_GT_WORD_DATA
+
+    ctypedef struct gt_subword_type:
+        uint32_t eof  
+        uint32_t length
+        uint32_t img_Omega
+        uint32_t t_exp
+        uint32_t reduced
+        gt_subword_type *p_prev
+        gt_subword_type *p_next
+        uint32_t data[MAX_GT_WORD_DATA]
+
+    ctypedef struct gt_word_type:
+        gt_subword_type *p_end
+        gt_subword_type *p_node
+        gt_subword_type *p_free
+        int32_t reduce_mode;
+
+
+
+
+######################################################################
+### Wrappers for C functions from file mm_reduce.pxd
+######################################################################
+
+
+cimport cython
+cimport mm_reduce
+
+cimport cython
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_load_tag_data(n, buf, buf_size):
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] buf_v_ = buf
+    cdef uint32_t buf_size_v_ = buf_size
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_load_tag_data(n_v_, &buf_v_[0], buf_size_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_load_vector(p_dest):
+    cdef uint_mmv_t[::1] p_dest_v_ = p_dest
+    with nogil:
+        mm_reduce.mm_order_load_vector(&p_dest_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_compare_vector(p_v):
+    cdef uint_mmv_t[::1] p_v_v_ = p_v
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_compare_vector(&p_v_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_compare_vector_part_A(p_v):
+    cdef uint_mmv_t[::1] p_v_v_ = p_v
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_compare_vector_part_A(&p_v_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_hash_vector(p_dest):
+    cdef uint_mmv_t[::1] p_dest_v_ = p_dest
+    cdef uint64_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_hash_vector(&p_dest_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_check_in_Gx0(v, g, mode, work):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t mode_v_ = mode
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_check_in_Gx0(&v_v_[0], &g_v_[0], mode_v_, &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_element_Gx0_work(g, n, h, o, work):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] h_v_ = h
+    cdef uint32_t o_v_ = o
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_element_Gx0_work(&g_v_[0], n_v_, &h_v_[0], o_v_, &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_element_Gx0(g, n, h, o):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] h_v_ = h
+    cdef uint32_t o_v_ = o
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_element_Gx0(&g_v_[0], n_v_, &h_v_[0], o_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_element_M_work(g, n, o, work):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t o_v_ = o
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_element_M_work(&g_v_[0], n_v_, o_v_, &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_element_M(g, n, o):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t o_v_ = o
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_element_M(&g_v_[0], n_v_, o_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_element_M_bsgs_work(g, n, o, work):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t o_v_ = o
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_element_M_bsgs_work(&g_v_[0], n_v_, o_v_, &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_element_M_many(a, ofs, m, o, mode, orders, work):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t[::1] ofs_v_ = ofs
+    cdef uint32_t m_v_ = m
+    cdef uint32_t o_v_ = o
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t[::1] orders_v_ = orders
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_element_M_many(&a_v_[0], &ofs_v_[0], m_v_, o_v_, mode_v_, &orders_v_[0], &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_2A_axis_type(v):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_2A_axis_type(&v_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_analyze_2A_axis(v, r):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] r_v_ = r
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_analyze_2A_axis(&v_v_[0], &r_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_find_type4(v, n, v2):
+    cdef uint32_t[::1] v_v_ = v
+    cdef uint32_t n_v_ = n
+    cdef uint32_t v2_v_ = v2
+    cdef uint32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_find_type4(&v_v_[0], n_v_, v2_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_load_axis(v, s):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t s_v_ = s
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_load_axis(&v_v_[0], s_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_map_axis(vt, v, a, n, work):
+    cdef uint32_t[::1] vt_v_ = vt
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_map_axis(&vt_v_[0], &v_v_[0], &a_v_[0], n_v_, &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_vector_vp(vt, v, mode, r, work):
+    cdef uint32_t[::1] vt_v_ = vt
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t[::1] r_v_ = r
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_vector_vp(&vt_v_[0], &v_v_[0], mode_v_, &r_v_[0], &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_vector_shortcut(stage, mode, axis, r):
+    cdef uint32_t stage_v_ = stage
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t axis_v_ = axis
+    cdef uint32_t[::1] r_v_ = r
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_vector_shortcut(stage_v_, mode_v_, axis_v_, &r_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_vector_vm(vt, v, r, work):
+    cdef uint32_t[::1] vt_v_ = vt
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] r_v_ = r
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_vector_vm(&vt_v_[0], &v_v_[0], &r_v_[0], &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_vector_v1(v, r, work):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] r_v_ = r
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_vector_v1(&v_v_[0], &r_v_[0], &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_M(a, n, mode, r):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t[::1] r_v_ = r
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_M(&a_v_[0], n_v_, mode_v_, &r_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_M_work(a, n, mode, r, work):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t[::1] r_v_ = r
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_M_work(&a_v_[0], n_v_, mode_v_, &r_v_[0], &work_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_M_many(a, ofs, m, mode, r, len_r, r_ofs):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t[::1] ofs_v_ = ofs
+    cdef uint32_t m_v_ = m
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t[::1] r_v_ = r
+    cdef uint32_t len_r_v_ = len_r
+    cdef uint32_t[::1] r_ofs_v_ = r_ofs
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_M_many(&a_v_[0], &ofs_v_[0], m_v_, mode_v_, &r_v_[0], len_r_v_, &r_ofs_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_reduce_op_2A_axis_type(v, g, len_g, mode):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t len_g_v_ = len_g
+    cdef uint32_t mode_v_ = mode
+    cdef uint32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_reduce_op_2A_axis_type(&v_v_[0], &g_v_[0], len_g_v_, mode_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gt_word_n_subwords(a, n):
+    cdef uint32_t[::1] a_v_ = a
+    cdef uint32_t n_v_ = n
+    cdef uint32_t ret_
+    with nogil:
+        ret_ = mm_reduce.gt_word_n_subwords(&a_v_[0], n_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def gt_word_shorten(g, n, g1, n1max, mode):
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t n_v_ = n
+    cdef uint32_t[::1] g1_v_ = g1
+    cdef uint32_t n1max_v_ = n1max
+    cdef uint32_t mode_v_ = mode
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.gt_word_shorten(&g_v_[0], n_v_, &g1_v_[0], n1max_v_, mode_v_)
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_load_vector_v1_mod3(p_dest):
+    cdef uint_mmv_t[::1] p_dest_v_ = p_dest
+    with nogil:
+        mm_reduce.mm_order_load_vector_v1_mod3(&p_dest_v_[0])
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_compare_v1_mod3(v):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_compare_v1_mod3(&v_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_order_find_Gx0_via_v1_mod3(v, g):
+    cdef uint_mmv_t[::1] v_v_ = v
+    cdef uint32_t[::1] g_v_ = g
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_order_find_Gx0_via_v1_mod3(&v_v_[0], &g_v_[0])
+    return ret_
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def mm_crt_op_word(v7, v31, v127, v255, g, len_g, check, work):
+    cdef uint_mmv_t[::1] v7_v_ = v7
+    cdef uint_mmv_t[::1] v31_v_ = v31
+    cdef uint_mmv_t[::1] v127_v_ = v127
+    cdef uint_mmv_t[::1] v255_v_ = v255
+    cdef uint32_t[::1] g_v_ = g
+    cdef uint32_t len_g_v_ = len_g
+    cdef uint32_t check_v_ = check
+    cdef uint_mmv_t[::1] work_v_ = work
+    cdef int32_t ret_
+    with nogil:
+        ret_ = mm_reduce.mm_crt_op_word(&v7_v_[0], &v31_v_[0], &v127_v_[0], &v255_v_[0], &g_v_[0], len_g_v_, check_v_, &work_v_[0])
+    return ret_
+
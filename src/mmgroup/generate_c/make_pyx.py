@@ -37,14 +37,14 @@ def pxi_defs(pxifile_name):
 
 
 
-m_pxd_line = re.compile(r"\s+(\w+)\s+(\w+)\((.+)\)")
+m_pxd_line = re.compile(r"\s+(\w+)\s+(\w+)\((.*)\)")
 m_pxd_arglist = re.compile(r"\s*(\w+)(\s*(\*)?\s*)(\w+)")
 
 def _parse_pxd_line(l):
     m = m_pxd_line.match(l) 
     if m:
          type, function, args = m.groups()
-         arglist = args.split(",")
+         arglist = args.split(",") if args.strip() else []
          args = []
          for arg in arglist:
              m_arg = m_pxd_arglist.match(arg)
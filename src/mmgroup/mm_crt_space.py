@@ -20,7 +20,7 @@ import re
 import numpy as np
 from numbers import Integral
 import warnings
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 import math 
 from functools import partial
 
@@ -48,6 +48,8 @@ from mmgroup.mm import mm_crt_combine, mm_crt_check_v2
 from mmgroup.mm import mm_crt_combine_bytes
 from mmgroup.mm import mm_crt_check_g
 from mmgroup.mm import mm_crt_norm_int32
+from mmgroup.mm import mm_crt_combine_rows
+from mmgroup.mm_reduce import mm_crt_op_word
 from mmgroup.generators import mm_group_n_clear
 from mmgroup.generators import mm_group_n_mul_word_scan
 from mmgroup.generators import mm_group_n_to_word
@@ -73,13 +75,25 @@ ERR_CRT_TYPE = "Connot construct MMVectorCRT object from type '%s'"
 
 
 class vsparse:
+    """Models a sparse vector with integer coefficients
+
+    A sparse vector is stored in two ``numpy`` arrays of the same
+    length. Array ``index`` contains indices of entries in sparse
+    representation (with the coefficient bits cleared), and array
+    ``value`` contains the corresponding integer coefficients.
+    Indices may occur repeatedly in these arrays; then the sum of the
+    corresponding coefficients is taken. Method ``reduce`` merges
+    the entries with equal indices and deletes zero entries.
+    """
     def __init__(self, *data):
-        self.d = defaultdict(int)
+        self.index = np.zeros(0, dtype = np.uint32)
+        self.value = np.zeros(0, dtype = np.int64)
         if len(data) == 0 or not data[0]:
             return
         scalar = 1
         if isinstance(data[0], vsparse):
-            self.d.update(data[0].d)
+            self.index = data[0].index.copy()
+            self.value = data[0].value.copy()
             return
         if isinstance(data[0], Integral):
             scalar, data = data[0],  data[1:]
@@ -91,18 +105,15 @@ class vsparse:
                 raise ValueError(err %  data[0]) 
         else:
             raise TypeError(ERR_CRT_TYPE % type(data[0]))          
-        for t in tuple_to_sparse(255, *data):
-            scalar1, t =  t & 0xff, t & 0xffffff00
-            scalar1 = scalar1 if scalar1 < 128 else scalar1 - 255
-            self.d[t] += scalar * scalar1
+        a = np.array(tuple_to_sparse(255, *data), dtype = np.uint32)
+        value = (a & 0xff).astype(np.int64)
+        value[value >= 128] -= 255
+        self.index = a & 0xffffff00
+        self.value = value * scalar
 
     def __imul__(self, other):
         assert isinstance(other, Integral)
-        if other == 0:
-            self.d.clear()
-        else:
-            for tag in self.d.keys():
-                 self.d[tag] *= other
+        self.value *= other
         return self
 
     def __mul__(self, other):
@@ -117,51 +128,45 @@ class vsparse:
         return self  
  
     def __iadd__(self, other):
-        if other == 0:
-            return
+        if isinstance(other, Integral) and other == 0:
+            return self
         assert isinstance(other, vsparse)
-        for tag, value in other.d.items():
-            self.d[tag] += value
+        self.index = np.concatenate((self.index, other.index))
+        self.value = np.concatenate((self.value, other.value))
         return self
 
     def __add__(self, other):
         return vsparse(self).__iadd__(other)
 
     def __isub__(self, other):
-        if other == 0:
-            return
-        assert isinstance(other, vsparse)
-        for tag, value in other.d.items():
-            self.d[tag] -= value
-        return self
+        return self.__iadd__(-other)
 
     def __sub__(self, other):
         return vsparse(self).__isub__(other)
 
     def reduce(self):
-        for tag, value in self.d.items():
-            if value == 0:
-                del self.d[tag]
+        if len(self.index):
+            order = np.argsort(self.index, kind = "stable")
+            index, value = self.index[order], self.value[order]
+            start = np.flatnonzero(np.concatenate(
+                ([True], index[1:] != index[:-1])))
+            value = np.add.reduceat(value, start)
+            index = index[start]
+            nonzero = value != 0
+            self.index, self.value = index[nonzero], value[nonzero]
         return self
         
     def norm(self):
-        norm = 0
         self.reduce()
-        for tag, value in self.d.items():
-            factor = 1
-            if tag & 0xE000000 == 0x2000000:
-                i0, i1 = (tag >> 14) & 0x7ff, (tag >> 8) & 0x3f
-                factor += i0 != i1
-            norm += factor * value * value
-        return norm    
+        index = self.index
+        factor = 1 + ((index & 0xE000000 == 0x2000000) &
+            ((index >> 14) & 0x7ff != (index >> 8) & 0x3f))
+        return int(np.sum(factor * self.value * self.value))
 
     def sparse_array(self, p, shift = 0):
         assert p & 1 and p < 256
         self.reduce()
-        a = np.zeros(len(self.d), dtype = np.uint32)
-        for i, (tag, value) in enumerate(self.d.items()):
-            a[i] = tag + (value << shift) % p 
-        return a    
+        return self.index + ((self.value << shift) % p).astype(np.uint32)
   
 
 ######################################################################
@@ -211,8 +216,12 @@ def _iter_group(g):
             start = end_ 
 
 
-def compress_data(data):
-    out = np.zeros(196884, dtype = np.int32)
+CRT_ROWS = 7734    # No of rows of 32 entries in internal rep.
+CRT_ROWS_T = 72    # First row with tag T in internal rep.
+CRT_ROWS_X = 1590  # First row with tag X in internal rep.
+
+
+def _compress_abc(data, out):
     out[0:24] = data[0:768:33]
     k = 24
     for i in range(1,24):
@@ -221,6 +230,11 @@ def compress_data(data):
         out[552+k:552+k+i] = data[1536+32*i:1536+32*i+i]
         k += i
     assert k == 300
+
+
+def compress_data(data):
+    out = np.zeros(196884, dtype = np.int32)
+    _compress_abc(data, out)
     out[852:49428] = data[2304:50880]
     t = data[50880:247488].reshape((3*2048,32))[:,:24]
     out[49428:196884] = t.ravel()
@@ -235,6 +249,27 @@ def compress_data(data):
 
 check_MMVectorCRT = True 
 
+######################################################################
+# If threads_MMVectorCRT is greater than 1 then the group operation
+# on a vector of type MMVectorCRT is done in a pool of that many
+# threads, one thread for each of the four moduli. By default we
+# use the fused C function mm_crt_op_word in the calling thread;
+# the user may set threads_MMVectorCRT to e.g. 4 on a multicore
+# machine if this turns out to be faster.
+######################################################################
+
+threads_MMVectorCRT = 1
+
+_crt_executor = None
+
+def _get_crt_executor():
+    global _crt_executor
+    if _crt_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _crt_executor = ThreadPoolExecutor(max(1, threads_MMVectorCRT),
+            thread_name_prefix = "mm_crt")
+    return _crt_executor
+
 ######################################################################
 # Modelling a vector of the 196884-dimensional rep of the monster
 ######################################################################
@@ -335,11 +370,13 @@ class MMVectorCRT(AbstractMmRepVector):
         and 255. 
         """
         if not self.expanded:
-            v2 = mm_crt_combine(self.data[7].data, 
+            norm2 = np.zeros(1, dtype = np.int64)
+            v2 = mm_crt_combine_rows(self.data[7].data, 
                 self.data[31].data, self.data[127].data, 
-                self.data[255].data, self.data_int)  
+                self.data[255].data, 0, CRT_ROWS, self.data_int,
+                norm2)  
             self._v2 = v2 - self.shift if v2 < 24 else 24        
-            self._inorm = mm_crt_norm_int32(self.data_int)
+            self._inorm = int(norm2[0]) >> 1
             self.expanded = True
 
 
@@ -354,7 +391,7 @@ class MMVectorCRT(AbstractMmRepVector):
                     raise ValueError(ERR_OVERFLOW)
                 self.data_int <<= sh  
                 self._inorm *= 4**sh            
-            for d in self.data.values:
+            for d in self.data.values():
                 d <<= sh
             self._v2 += sh            
         elif sh < 0:
@@ -365,7 +402,7 @@ class MMVectorCRT(AbstractMmRepVector):
                     raise ValueError(ERR_UNDERFLOW)
                 self.data_int >>= nsh           
                 self._inorm *= 4**sh            
-            for d in self.data.values:
+            for d in self.data.values():
                 d >>= nsh
             self._v2 += sh            
         return self     
@@ -457,6 +494,49 @@ class MMVectorCRT(AbstractMmRepVector):
         """
         return self.inorm * self.factor**2
 
+    def as_int32(self, out = None, block_rows = 1024):
+        """Return the vector as an array of integers and its norm
+
+        Let ``k = self.shift``. The function computes the integral 
+        vector ``v * 2**k`` as a one-dimensional array of 196884
+        integers of type ``numpy.int32`` in the same order as in
+        method ``as_bytes`` of class |MMVector|.
+
+        The caller may provide such an array ``out``, e.g. an
+        instance of class ``numpy.memmap``. Otherwise a new
+        array is created. The vector is computed in blocks of 
+        ``block_rows`` rows of 32 entries of the internal
+        representation. So no further copy of the whole vector
+        is made; and attribute ``data_int`` is not changed. 
+
+        The function returns a pair ``(out, inorm)``, where 
+        ``inorm`` is the norm of the integral vector, as returned 
+        by property ``inorm``.
+        """
+        if out is None:
+            out = np.zeros(196884, dtype = np.int32)
+        if out.shape != (196884,) or out.dtype != np.int32:
+            err = "Output array for MMVectorCRT object must be int32[196884]"
+            raise ValueError(err)
+        block_rows = max(int(block_rows), CRT_ROWS_T)
+        buf = np.zeros(32 * block_rows, dtype = np.int32)
+        norm2 = np.zeros(1, dtype = np.int64)
+        p7, p31, p127, p255 = [self.data[p].data for p in (7, 31, 127, 255)]
+        def combine(row, n):
+            mm_crt_combine_rows(p7, p31, p127, p255, row, n, buf, norm2)
+            return buf[:32 * n]
+        _compress_abc(combine(0, CRT_ROWS_T), out)
+        for row in range(CRT_ROWS_T, CRT_ROWS_X, block_rows):
+            n = min(block_rows, CRT_ROWS_X - row)
+            start = 852 + 32 * (row - CRT_ROWS_T) 
+            out[start : start + 32 * n] = combine(row, n)
+        for row in range(CRT_ROWS_X, CRT_ROWS, block_rows):
+            n = min(block_rows, CRT_ROWS - row)
+            start = 49428 + 24 * (row - CRT_ROWS_X) 
+            a = combine(row, n).reshape((n, 32))[:, :24]
+            out[start : start + 24 * n] = a.ravel()
+        return out, int(norm2[0]) >> 1
+
 ######################################################################
 # class MMSpace
 ######################################################################
@@ -480,9 +560,11 @@ class MMSpaceCRT(AbstractMmRepSpace):
         Here randomized scalars are illegal.
 
       * The only operations allowed for vectors are copying, 
-        multiplication with a group element, and testing for 
-        equality. Vector addition and scalar multiplication
-        are illegal.
+        multiplication with a group element, testing for 
+        equality, vector addition and subtraction, and 
+        multiplication with an integer scalar. ValueError is
+        raised if the result of an addition or a scalar 
+        multiplication might overflow.
 
       * A vector may be reduced modulo one of the primes
         ``p = 7, 31, 127, 255`` using the modulo operatior ``%%``.
@@ -621,28 +703,80 @@ class MMSpaceCRT(AbstractMmRepSpace):
 
 
     def iadd(self, v1, v2):
-        err = "Vector addition not supported in class MMSpaceCRT"
-        raise NotImplementedError(err)
+        if v2.shift != v1.shift:
+            v2 = MMVectorCRT(v1.shift, v2)
+        if check_MMVectorCRT:
+            bound = math.isqrt(v1.inorm) + math.isqrt(v2.inorm) + 2
+            if bound * bound > MAX_CRT_NORM:
+                raise ValueError(ERR_OVERFLOW)
+        for p in (7, 31, 127, 255):
+            v1.data[p] += v2.data[p]
+        v1.expanded = False
+        return v1
  
     def imul_scalar(self, v1, a):
-        err = "Scalar multiplication not supported in class MMSpaceCRT"
-        raise NotImplementedError(err)
+        if not isinstance(a, Integral):
+            err = "Scalar factor for MMVectorCRT object must be int"
+            raise TypeError(err)
+        if check_MMVectorCRT and v1.inorm * a * a > MAX_CRT_NORM:
+            raise ValueError(ERR_OVERFLOW)
+        for p in (7, 31, 127, 255):
+            v1.data[p] *= a
+        v1.expanded = False
+        return v1
            
     #######################################################################
     # Group operation 
     #######################################################################
 
-    def _imul_word(self, v1, g_word, buf):
-        if len(g_word):
-            vectors = list(v1.data.values())
-            if check_MMVectorCRT:
-                if mm_crt_check_g(g_word[0], *[v.data for v in vectors]):
-                    print("MMVectorCRT: shift = %d, v2 = %d, tag = %s" %
-                        (v1.shift, v1.v2, ((g_word[0] >> 28) & 7)))
+    @staticmethod
+    def _split_word(a):
+        """Split word ``a`` of generators into parts
+
+        The function yields the parts of ``a`` as numpy arrays. Each
+        part is either a word in the generators of the subgroup
+        N_0 of the monster or a single power of the generator xi.
+        """
+        nn = np.zeros(5, dtype = np.uint32)
+        nnw = np.zeros(5, dtype = np.uint32)
+        while len(a):
+            mm_group_n_clear(nn)
+            i = mm_group_n_mul_word_scan(nn, a, len(a))
+            length =  mm_group_n_to_word(nn, nnw)
+            if length:
+                yield nnw[:length]
+            a = a[i:]
+            if len(a):
+                yield a[:1]
+                a = a[1:]
+
+    def _imul_word_parallel(self, v1, a):
+        """Compute v1 * a for a word ``a`` in a pool of threads
+
+        The word ``a`` is applied to the four vectors modulo
+        7, 31, 127, and 255 in parallel, part by part. Here the 
+        parts are as in method ``_split_word``. Before applying a
+        part we check for underflow, so that an underflow is
+        detected before any of the four vectors is changed
+        by that part.
+        """
+        vectors = [v1.data[p] for p in (7, 31, 127, 255)]
+        data = [v.data for v in vectors]
+        bufs = [np.zeros(v.ops.MMV_INTS, dtype = np.uint64) 
+            for v in vectors]
+        executor = _get_crt_executor()
+        def op(i, w):
+            return vectors[i].ops.op_word(data[i], w, len(w), 1, bufs[i])
+        try:
+            for w in self._split_word(a):
+                if check_MMVectorCRT and mm_crt_check_g(w[0], *data):
                     raise ValueError(ERR_UNDERFLOW_G)
-            for v in vectors:
-                v.ops.op_word(v.data, g_word, len(g_word), 1, buf)
-        
+                if any(executor.map(partial(op, w = w), range(4))):
+                    err = "Group operation in class MMVectorCRT failed"
+                    raise ValueError(err)
+        finally:
+            v1.expanded = False
+        return v1
 
     def imul_group_word(self, v1, g):
         """Return product v1 * g of vector v1 and group word g.
@@ -651,23 +785,24 @@ class MMSpaceCRT(AbstractMmRepSpace):
 
         This method is called for elements v1 of the space
         'self' and for elements g of the group 'self.group' only.
+
+        If ``threads_MMVectorCRT > 1`` then the four vectors 
+        modulo 7, 31, 127, and 255 are processed in parallel.
         """
         assert isinstance(g, AbstractGroupWord) and g.group.is_mmgroup 
         a = g.mmdata
-        nn = np.zeros(5, dtype = np.uint32)
-        nnw = np.zeros(5, dtype = np.uint32)
+        if threads_MMVectorCRT > 1:
+            return self._imul_word_parallel(v1, a)
         buf = np.zeros(v1.data[255].ops.MMV_INTS, dtype = np.uint64)
-        while len(a):
-            mm_group_n_clear(nn)
-            i = mm_group_n_mul_word_scan(nn, a, len(a))
-            length =  mm_group_n_to_word(nn, nnw)
-            self._imul_word(v1, nnw[:length], buf)
-            a = a[i:]
-            if len(a):
-                self._imul_word(v1, a[:1], buf)    
-                a = a[1:]
-        del buf 
+        res = mm_crt_op_word(v1.data[7].data, v1.data[31].data,
+            v1.data[127].data, v1.data[255].data, a, len(a), 
+            check_MMVectorCRT, buf)
         v1.expanded = False
+        if res < 0:
+            raise ValueError(ERR_UNDERFLOW_G)
+        if res:
+            err = "Group operation in class MMVectorCRT failed"
+            raise ValueError(err)
         return v1       
         
             
@@ -738,7 +873,7 @@ class MMSpaceCRT(AbstractMmRepSpace):
         a = np.zeros(l, dtype = np.int32)
         mm_crt_combine_bytes(d[7], d[31], d[127], d[255], l, a)
         af = np.array(a * v.factor,  dtype = float)
-        return af.reshape(shape) if len(shape) else float(af)
+        return af.reshape(shape) if len(shape) else float(af[0])
         
 
 
@@ -172,6 +172,8 @@ from mmgroup.clifford12 import chk_qstate12
 from mmgroup.clifford12 import xsp2co1_rand_word_G_x0
 from mmgroup.clifford12 import xsp2co1_rand_word_N_0
 from mmgroup.mm import mm_vector
+from mmgroup.structures.mm_workspace import current_workspace
+from mmgroup.structures.mm_cache import REDUCE_CACHE
 
 
 
@@ -208,6 +210,8 @@ check_mm_equal = None
 check_mm_half_order = None
 check_mm_in_g_x0 = None
 mm_reduce_M = None
+mm_reduce_M_many = None
+mm_reduce_M_work = None
 
 def import_mm_order_functions():
     """Import functions from module ``mmgroup.mm_order``.
@@ -217,12 +221,14 @@ def import_mm_order_functions():
     """
     global check_mm_order, check_mm_equal
     global check_mm_half_order, check_mm_in_g_x0
-    global mm_reduce_M
+    global mm_reduce_M, mm_reduce_M_many, mm_reduce_M_work
     from mmgroup.structures.mm_order import check_mm_order
     from mmgroup.structures.mm_order import check_mm_equal 
     from mmgroup.structures.mm_order import check_mm_half_order
     from mmgroup.structures.mm_order import check_mm_in_g_x0
     from mmgroup.mm_reduce import mm_reduce_M 
+    from mmgroup.mm_reduce import mm_reduce_M_many
+    from mmgroup.mm_reduce import mm_reduce_M_work
 
 
 
@@ -517,6 +523,20 @@ class MM(MM0):
         self._extend(self.MIN_LEN)
         self.reduce()
 
+    def __hash__(self):
+        """Return a hash value of the element of the monster group
+
+        The representation of an element of the monster as a reduced
+        word is unique. So we return a hash value of the reduced word
+        representing the element.
+
+        An element should not be changed in place (e.g. with 
+        the ``*=`` operator) while it is used as a key of a 
+        dictionary or as an element of a set.
+        """
+        self.reduce()
+        return hash(self._data[:self.length].tobytes())
+
     def _t_shape(self):
         l = []
         self.reduce()
@@ -569,28 +589,88 @@ class MMGroup(AbstractMMGroup):
     def reduce(self, g1, copy = False):
         l1 = g1.length
         if not g1.reduced:
+            key = g1._data[:l1].tobytes() if REDUCE_CACHE.maxsize else None
+            cached = REDUCE_CACHE.get(key)
+            if cached is not None:
+                g2 = self.word_type() if copy else g1
+                g2._setdata(cached)
+                g2.reduced = True
+                return g2
             if not mm_reduce_M:
                 import_mm_order_functions() 
+            ws = current_workspace()
             if copy:
                 g2 = self.word_type()
-                length = mm_reduce_M(g1._data, g1.length, 
-                    REDUCE_MODE, g2._data)
+                length = mm_reduce_M_work(g1._data, g1.length, 
+                    REDUCE_MODE, g2._data, ws.work)
                 if not 0 <= length <= 128:
                     raise ValueError(self.ERR_REDUCE % length)
                 g2.length = length
                 g2.reduced = True
+                if key is not None:
+                    REDUCE_CACHE.put(key, g2._data[:length].copy())
                 return g2
             else:
-                a = np.zeros(128, dtype = np.uint32)
-                length = mm_reduce_M(g1._data, g1.length, REDUCE_MODE, a)
+                a = ws.r
+                length = mm_reduce_M_work(g1._data, g1.length, 
+                    REDUCE_MODE, a, ws.work)
                 if not 0 <= length <= 128:
                     raise ValueError(self.ERR_REDUCE % length)
                 g1._setdata(a[:length])
                 g1.reduced = True
+                if key is not None:
+                    REDUCE_CACHE.put(key, a[:length].copy())
                 return g1
         return self.copy(g1) if copy else g1
 
-        
+    def reduce_many(self, g_list):
+        """Reduce a list of elements of the monster group
+
+        Here ``g_list`` must be a list of instances of class |MM|.
+        All these elements are reduced in place, and the list
+        ``g_list`` is returned.
+
+        This is equivalent to calling method ``reduce`` for all
+        entries of ``g_list``, but considerably faster, since all
+        elements are reduced in a single call to the C
+        function ``mm_reduce_M_many``.
+        """
+        if not mm_reduce_M_many:
+            import_mm_order_functions()
+        todo = []
+        use_cache = REDUCE_CACHE.maxsize > 0
+        for g in g_list:
+            if not g.reduced:
+                cached = None
+                if use_cache:
+                    cached = REDUCE_CACHE.get(g._data[:g.length].tobytes())
+                if cached is None:
+                    todo.append(g)
+                else:
+                    g._setdata(cached)
+                    g.reduced = True
+        if len(todo) == 0:
+            return g_list
+        lengths = [g.length for g in todo]
+        ofs = np.zeros(len(todo) + 1, dtype = np.uint32)
+        ofs[1:] = np.cumsum(lengths)
+        a = np.zeros(max(1, int(ofs[-1])), dtype = np.uint32)
+        for g, start, length in zip(todo, ofs, lengths):
+            a[start : start + length] = g._data[:length]
+        r = np.zeros(128 * len(todo), dtype = np.uint32)
+        r_ofs = np.zeros(len(todo) + 1, dtype = np.uint32)
+        res = mm_reduce_M_many(a, ofs, len(todo), REDUCE_MODE,
+            r, len(r), r_ofs)
+        if res != len(todo):
+            raise ValueError(self.ERR_REDUCE % res)
+        for i, g in enumerate(todo):
+            key = g._data[:g.length].tobytes() if use_cache else None
+            g._setdata(r[r_ofs[i] : r_ofs[i+1]])
+            g.reduced = True
+            if use_cache:
+                REDUCE_CACHE.put(key, r[r_ofs[i] : r_ofs[i+1]].copy())
+        return g_list
+
     def _imul(self, g1, g2):
         l1, l2 = g1.length, g2.length
         g1._extend(2*(l1 + l2) + 1)
@@ -614,6 +694,10 @@ class MMGroup(AbstractMMGroup):
         return result
 
     def _equal_words(self, g1, g2):
+        if g1.reduced and g2.reduced:
+            # Reduced words are unique, so we may just compare them
+            return (g1.group == g2.group and g1.length == g2.length and
+               (g1._data[:g1.length] == g2._data[:g2.length]).all())
         if not check_mm_equal is None:
             return g1.group == g2.group and check_mm_equal(g1, g2)
         try:
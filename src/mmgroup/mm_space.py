@@ -470,6 +470,7 @@ from numbers import Integral
 from random import randint
 import warnings
 import time
+import zlib
 from timeit import default_timer
 from importlib import import_module
 from functools import partial
@@ -503,14 +504,28 @@ from mmgroup.mm import mm_aux_index_sparse_to_extern
 from mmgroup.mm import mm_aux_index_sparse_to_leech
 from mmgroup.mm import mm_aux_index_sparse_to_leech2
 from mmgroup.mm import mm_aux_hash
+from mmgroup.mm import mm_aux_hash_blocks
+from mmgroup.mm import mm_aux_hash_combine
 
 uint_mmv = np.uint32 if INT_BITS == 32 else np.uint64
+
+# Magic number, version, and number of entries of type uint64 in
+# the header of a file written by method MMSpace.save_vectors()
+FILE_MAGIC = 0x524f544345564d4d  # "MMVECTOR" in little endian order
+FILE_VERSION = 2
+FILE_HEADER_INTS = 8
 #standard_seed = mm_rng_make_seed()
 standard_mm_group = MM0
 
 
 TAGS = " ABCTXZY"
 
+# Bit masks of the blocks containing the entries with a given tag,
+# as used in C function mm_aux_hash_blocks()
+HASH_BLOCK_MASKS = {
+    "A":1, "B":2, "C":2, "T":4, "X":8, "Z":16, "Y":16
+}
+
 
 ######################################################################
 # Importing a C wrapper for a specific characteristic 'p'
@@ -526,6 +541,7 @@ class MMVectorOps:
         self.op_vector_add = mm.op_vector_add
         self.op_scalar_mul = mm.op_scalar_mul
         self.op_word = mm.op_word
+        self.op_word_many = mm.op_word_multi
         self.op_compare = mm.op_compare
         self.op_t_A = mm.op_t_A
         self.op_delta = mm.op_delta
@@ -535,6 +551,11 @@ class MMVectorOps:
         self.op_xy = mm.op_xy
         self.op_omega = mm.op_omega
         self.op_word_tag_A = mm.op_word_tag_A
+        self.op_word_tag_A_hash = mm.op_word_tag_A_hash
+        self.op_xy_tag_ABC = mm.op_xy_tag_ABC
+        self.op_xy_tag_ABC_hash = mm.op_xy_tag_ABC_hash
+        self.op_pi_tag_ABC = mm.op_pi_tag_ABC
+        self.op_pi_tag_ABC_hash = mm.op_pi_tag_ABC_hash
         self.op_store_axis = mm.op_store_axis
         self.mm_vector = partial(mm_vector, p)
         del mm
@@ -816,6 +837,82 @@ class MMVector(AbstractMmRepVector):
         """Return a hash value of the vector"""
         return int(mm_aux_hash(self.p, self.data))
 
+    def block_hashes(self, hashes = None, tags = "ABCTXZY"):
+        r"""Return the hash values of the blocks of the vector
+
+        The vector is split into 5 blocks of entries with 
+        tags ``A``,  ``BC``, ``T``, ``X``, and ``ZY``. The function
+        returns the hash values of these blocks as a numpy array
+        of shape ``(5,)`` and type ``numpy.uint64``.
+
+        If an array ``hashes`` of such hash values is given then 
+        the hash values of the blocks containing an entry with a 
+        tag in the string ``tags`` are recomputed and stored in
+        ``hashes``. The other entries of ``hashes`` are not changed.
+        This is useful if only some blocks of the vector have been
+        changed. E.g. function ``op_word_tag_A_hash`` in the
+        C wrapper ``self.ops`` changes the entries with tag ``A``
+        only and updates the hash value of block ``A``. Functions
+        ``op_xy_tag_ABC_hash`` and ``op_pi_tag_ABC_hash`` update
+        the hash values of the blocks ``A`` and ``BC``.
+    
+        The combined hash value of all blocks can be obtained with
+        method ``fingerprint``.
+        """
+        if hashes is None:
+            hashes = np.zeros(5, dtype = np.uint64)
+            tags = "ABCTXZY"
+        mask = 0
+        for tag in tags:
+            mask |= HASH_BLOCK_MASKS[tag]
+        mm_aux_hash_blocks(self.p, self.data, mask, hashes)
+        return hashes
+
+    def fingerprint(self, hashes = None):
+        r"""Return a hash value of the vector combined from its blocks
+
+        Here ``hashes`` should be the array of the hash values of 
+        the blocks of the vector as returned by method 
+        ``block_hashes``. Combining these hash values takes 
+        constant time. If ``hashes`` is ``None`` then all hash 
+        values of the blocks are computed.
+
+        The result differs from the value returned by method 
+        ``hash``.
+        """
+        if hashes is None:
+            hashes = self.block_hashes()
+        return int(mm_aux_hash_combine(self.p, hashes))
+
+    def __reduce__(self):
+        # Pickle the vector as its characteristic and its native data
+        return (_unpickle_mmvector, (self.p, self.data.view(np.ndarray)))
+
+    def save(self, path):
+        """Save the vector to a file
+
+        The vector is stored in the file with name ``path`` in its
+        internal representation together with a small header. The
+        vector can be read back with method ``load``. See method
+        ``save_vectors`` of class |MMSpace| for details.
+        """
+        self.space.save_vectors(path, [self])
+
+    @staticmethod
+    def load(path, mmap = True):
+        """Load a vector from a file written by method ``save``
+
+        If ``mmap`` is True (default) then the data of the vector 
+        are mapped to memory from the file. Changing the returned
+        vector does not change the file. See method
+        ``load_vectors`` of class |MMSpace| for details.
+        """
+        vectors = MMSpace().load_vectors(path, mmap)
+        if len(vectors) != 1:
+            err = "File %s does not contain exactly one MM vector"
+            raise ValueError(err % path)
+        return vectors[0]
+
 
 
     def __mod__(self, p):
@@ -1092,7 +1189,33 @@ class MMSpace(AbstractMmRepSpace):
         v1.ops.op_word(v1.data, g._data, length, e, work)
         v1.last_timing = time.perf_counter() - t_start
         #v1.last_timing = default_timer() - t_start
-        return v1  
+        return v1
+
+    def imul_group_word_many(self, vectors, g):
+        """Replace all vectors v in a list by v * g
+
+        Here ``vectors`` is a list of vectors in this space and ``g``
+        is an element of the group ``self.group``. All vectors in the
+        list must have the same characteristic ``p``. The word ``g``
+        is prepared only once for all vectors. The function returns
+        the list ``vectors``.
+        """
+        if len(vectors) == 0:
+            return vectors
+        if not isinstance(g, AbstractMMGroupWord):
+            err = "Multiplicator for MM vector must be in MM group"
+            raise TypeError(err)
+        p = vectors[0].p
+        assert all(v.p == p for v in vectors)
+        ops = vectors[0].ops
+        k, n = len(vectors), ops.MMV_INTS
+        a = g.mmdata
+        data = np.concatenate([v.data[:n] for v in vectors])
+        work = np.zeros(k * n, dtype = uint_mmv)
+        ops.op_word_many(data, k, a, len(a), 1, work)
+        for i, v in enumerate(vectors):
+            v.data[:n] = data[i * n : (i + 1) * n]
+        return vectors
 
 
     #######################################################################
@@ -1147,6 +1270,102 @@ class MMSpace(AbstractMmRepSpace):
         mm_aux_bytes_to_mmv(p, b, v.data)
         return v
 
+
+    #######################################################################
+    # Saving vectors to a file and loading vectors from a file
+    #######################################################################
+
+    def save_vectors(self, path, vectors):
+        """Save a list of vectors to a file in native format
+
+        Here ``vectors`` is a list of vectors in this space with the
+        same characteristic ``p``; and ``path`` is the name of the
+        file to be written. The vectors are stored in the internal
+        representation described in the header of this module,
+        preceded by a header of ``FILE_HEADER_INTS`` entries of
+        type ``uint64``. The header contains the characteristic
+        ``p``, the value ``INT_BITS``, the number of the vectors, 
+        and a checksum for each vector. That checksum is the CRC-32
+        checksum (as computed by function ``zlib.crc32``) of all bytes
+        of the internal representation of the vector.
+
+        A file written by this method can be read with
+        method ``load_vectors`` on a machine with the same value
+        ``INT_BITS``.
+        """
+        vectors = list(vectors)
+        if len(vectors) == 0:
+            raise ValueError("No vectors to be saved")
+        p = vectors[0].p
+        if not all(v.p == p for v in vectors):
+            raise ValueError("Vectors to be saved differ in characteristic")
+        length = len(vectors[0].data)
+        n = len(vectors)
+        header = np.zeros(FILE_HEADER_INTS + n, dtype = np.uint64)
+        header[0] = FILE_MAGIC
+        header[1:5] = [FILE_VERSION, p, INT_BITS, n]
+        header[5] = length
+        data = [np.ascontiguousarray(v.data, dtype = uint_mmv)
+            for v in vectors]
+        for i, d in enumerate(data):
+            header[FILE_HEADER_INTS + i] = zlib.crc32(d)
+        with open(path, "wb") as f:
+            header.tofile(f)
+            for d in data:
+                d.tofile(f)
+
+    def load_vectors(self, path, mmap = True, check = True):
+        """Load a list of vectors from a file written by ``save_vectors``
+
+        The function returns the list of vectors stored in the file
+        with name ``path``. If ``mmap`` is True (default) then the
+        data of the vectors are mapped to memory with ``numpy.memmap``
+        in copy-on-write mode; so no data are copied, and changing
+        a vector does not change the file. Otherwise the data
+        are read into memory.
+
+        If ``check`` is True (default) then the checksums of the
+        vectors are checked. The function raises ValueError if the
+        file is not in the correct format, if the file has been
+        written on a machine with a different value of ``INT_BITS``,
+        or if a checksum is not correct.
+        """
+        header = np.fromfile(path, dtype = np.uint64, 
+            count = FILE_HEADER_INTS)
+        if len(header) < FILE_HEADER_INTS or header[0] != FILE_MAGIC:
+            raise ValueError("File %s is not an MM vector file" % path)
+        version, p, int_bits, n, length = map(int, header[1:6])
+        if version != FILE_VERSION:
+            err = "Unsupported version %d of MM vector file"
+            raise ValueError(err % version)
+        if int_bits != INT_BITS:
+            err = "MM vector file has been written with INT_BITS = %d"
+            raise ValueError(err % int_bits)
+        p_vector = get_mm_ops(p).MMV_INTS + 1
+        if length != p_vector:
+            raise ValueError("Bad vector length in MM vector file")
+        checksums = np.fromfile(path, dtype = np.uint64,
+            count = FILE_HEADER_INTS + n)[FILE_HEADER_INTS:]
+        offset = 8 * (FILE_HEADER_INTS + n)
+        if mmap:
+            data = np.memmap(path, dtype = uint_mmv, mode = 'c',
+                offset = offset, shape = (n, length))
+        else:
+            data = np.fromfile(path, dtype = uint_mmv, 
+                count = n * length, offset = offset)
+            if len(data) != n * length:
+                raise ValueError("MM vector file %s is too short" % path)
+            data = data.reshape((n, length))
+        vectors = []
+        for i in range(n):
+            v = MMVector(p, 0)
+            v.data = data[i]
+            if check and zlib.crc32(data[i]) != checksums[i]:
+                err = "Bad checksum in MM vector file %s"
+                raise ValueError(err % path)
+            vectors.append(v)
+        return vectors
+
  
         
     #######################################################################
@@ -1378,6 +1597,160 @@ def MMV(p):
 
 
 
+def _unpickle_mmvector(p, data):
+    """Reconstruct a pickled vector from the native data"""
+    v = MMVector.__new__(MMVector)
+    v.ops = get_mm_ops(p)
+    if data.shape != (v.ops.MMV_INTS + 1,) or data.dtype != uint_mmv:
+        raise ValueError("Bad data for pickled vector of MM space")
+    v.p = p
+    v.data = data
+    return v
+
+
+######################################################################
+# Transporting vectors via shared memory
+######################################################################
+
+
+class _SharedMMVector(MMVector):
+    """A vector with data stored in a shared memory block
+
+    The vector keeps a reference to the ``SharedMemory`` object
+    containing its data, so that the shared memory block is not
+    unmapped as long as the vector is alive.
+    """
+    __slots__ = "_shm",
+
+    def __del__(self):
+        # Release the data before the shared memory object; otherwise
+        # the shared memory object cannot unmap the memory block.
+        self.data = None
+
+
+
+class SharedMMVectors:
+    r"""Store vectors of the representation of the monster in shared memory
+
+    :param vectors: a list of vectors of type |MMVector| with the
+                    same characteristic ``p``
+    
+    The constructor creates a block of shared memory (using
+    class ``SharedMemory`` in module ``multiprocessing.shared_memory``)
+    and copies the given vectors into that block. Attribute
+    ``vectors`` of the constructed object is a list of vectors of 
+    type |MMVector| with data stored in that block.
+
+    An instance of this class can be passed to another process, 
+    e.g. to a worker in a ``multiprocessing.Pool``.
+    Here only the name of the shared memory block is pickled,
+    but not the vectors. In the worker process, attribute
+    ``vectors`` is a list of vectors referring to the same
+    shared memory block. So changing a vector in one process
+    also changes that vector in all other processes.
+
+    The creating process should call method ``unlink`` when the 
+    shared memory block is no longer needed. Then the block is
+    released as soon as all processes have stopped using it.
+    A vector taken from attribute ``vectors`` keeps the shared
+    memory block mapped into memory as long as that vector is
+    alive, even if the instance of this class has been deleted.
+    Instances of this class may also be used as context managers;
+    then method ``unlink`` is called at the end of the context in
+    the creating process. Here no ``BufferError`` is raised.
+    """
+    def __init__(self, vectors):
+        from multiprocessing.shared_memory import SharedMemory
+        vectors = list(vectors)
+        if len(vectors) == 0:
+            raise ValueError("No vectors to be shared")
+        p = vectors[0].p
+        if not all(v.p == p for v in vectors):
+            raise ValueError("Shared vectors differ in characteristic")
+        length = get_mm_ops(p).MMV_INTS + 1
+        size = len(vectors) * length * uint_mmv().itemsize
+        self._shm = SharedMemory(create = True, size = size)
+        self._owner = True
+        self._set_vectors(p, len(vectors), length)
+        for v, w in zip(vectors, self.vectors):
+            w.data[:] = v.data
+
+    def _set_vectors(self, p, n, length):
+        self.p, self._n, self._length = p, n, length
+        # Function np.frombuffer keeps the buffer of the shared memory
+        # exported; so that buffer cannot be closed under live vectors.
+        a = np.frombuffer(self._shm.buf, dtype = uint_mmv,
+            count = n * length).reshape((n, length))
+        self.vectors = []
+        for i in range(n):
+            v = _SharedMMVector.__new__(_SharedMMVector)
+            v.ops = get_mm_ops(p)
+            v.p = p
+            v.data = a[i]
+            v._shm = self._shm
+            self.vectors.append(v)
+
+    @classmethod
+    def _attach(cls, name, p, n, length):
+        from multiprocessing.shared_memory import SharedMemory
+        self = cls.__new__(cls)
+        self._shm = SharedMemory(name = name)
+        self._owner = False
+        self._set_vectors(p, n, length)
+        return self
+
+    def __reduce__(self):
+        return (SharedMMVectors._attach, 
+            (self._shm.name, self.p, self._n, self._length))
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i):
+        return self.vectors[i]
+
+    def close(self):
+        """Close access to the shared memory in this process
+
+        Afterwards, attribute ``vectors`` is an empty list. The
+        function raises ``BufferError`` if a vector taken from that
+        attribute is still alive in this process. In that case the
+        shared memory remains accessible for that vector.
+        """
+        if self._shm is not None:
+            self.vectors = []
+            self._shm.close()
+
+    def unlink(self):
+        """Close and release the shared memory block
+
+        This should be called once by the process that has created
+        the shared memory block. As in method ``close``, the function
+        raises ``BufferError`` if a vector taken from attribute
+        ``vectors`` is still alive. Then the shared memory block
+        is released as soon as all these vectors have been deleted.
+        """
+        if self._shm is not None:
+            shm, self._shm = self._shm, None
+            shm.unlink()
+            self.vectors = []
+            shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        # Vectors still alive keep the shared memory block mapped;
+        # so we need not fail if the block cannot be closed here.
+        try:
+            if self._owner:
+                self.unlink()
+            else:
+                self.close()
+        except BufferError:
+            pass
+
+
 def order_vector():
    r"""Return the precomputed order vector
 
@@ -0,0 +1,310 @@
+r"""Vectors of the representation of the monster in sparse form.
+
+Here class ``SparseMMVector`` is an analogue of class ``MMVector``
+for vectors with few nonzero entries. A vector is stored as a sorted
+array of entries in the *sparse representation* described in method
+``from_sparse`` of class |MMSpace|. Vector addition, scalar
+multiplication and the scalar product are done by merging sorted
+arrays. Elements of the subgroup :math:`N_0` of the monster operate
+on such a vector without converting it to a vector of length 196884.
+
+Other elements of the monster operate on an instance of class
+``SparseMMVector`` via an intermediate instance of class |MMVector|.
+"""
+
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+
+import numpy as np
+from numbers import Integral
+from functools import partial
+
+
+from mmgroup.structures.abstract_group import singleton
+from mmgroup.structures.abstract_mm_rep_space import AbstractMmRepVector
+from mmgroup.structures.abstract_mm_rep_space import AbstractMmRepSpace
+from mmgroup.structures.abstract_mm_rep_space import add_vector
+from mmgroup.structures.abstract_mm_group import AbstractMMGroupWord
+from mmgroup.mm_space  import MMVector
+
+from mmgroup.mm import mm_sparse_sort_reduce
+from mmgroup.mm import mm_sparse_add
+from mmgroup.mm import mm_sparse_scale
+from mmgroup.mm import mm_sparse_scalprod
+from mmgroup.mm import mm_sparse_op_n0
+from mmgroup.generators import mm_group_n_clear
+from mmgroup.generators import mm_group_n_mul_word_scan
+
+
+
+ERR_P = "Illegal modulus %s for class SparseMMVector"
+
+
+def _reduce_sparse(p, a):
+    """Return reduced copy of sparse vector ``a`` modulo ``p``
+
+    The result is a sorted array of type ``numpy.uint32`` as
+    described in file ``mm_sparse_vector.c``.
+    """
+    a = np.array(a, dtype = np.uint32).reshape(-1)
+    length = mm_sparse_sort_reduce(p, a, len(a))
+    if length < 0:
+        raise ValueError(ERR_P % p)
+    return a[:length]
+
+
+def _purge_indices(a):
+    """Standardize indices of the entries of a sparse vector ``a``
+
+    For tags ``A, B, C`` we exchange indices ``i0, i1`` if
+    ``i0 < i1``. Coordinates of the entries are dropped.
+    """
+    tag, i0, i1 = a >> 25, (a >> 14) & 0x7ff, (a >> 8) & 0x3f
+    swap = (tag >= 1) & (tag <= 3) & (i0 < i1)
+    a = a & 0xffffff00
+    return np.where(swap, (tag << 25) + (i1 << 14) + (i0 << 8), a)
+
+
+######################################################################
+# Modelling a sparse vector of the representation of the monster
+######################################################################
+
+
+class SparseMMVector(AbstractMmRepVector):
+    r"""Models a sparse vector in a representation of the monster group.
+
+    The constructor of this class has the same parameters as the
+    constructor of class |MMVector|. The functionality of this
+    class is a subset of the functionality of class |MMVector|.
+    Vectors of this class should be used for vectors with a small
+    number of nonzero entries only.
+
+    Internally, a vector is stored in the attribute ``data`` as a
+    sorted array of entries in sparse representation, with each
+    basis vector occuring at most once. Linear operations, the
+    scalar product (see method ``dot``), and the operation of
+    elements of the subgroup :math:`N_0` of the monster take
+    time proportional to the number of nonzero entries.
+
+    A vector can be converted to an instance of class |MMVector|
+    with method ``as_mmvector``.  Conversely, we may construct an
+    instance of this class from an instance ``v`` of class
+    |MMVector| with ``SparseMMVector(v.p, v)``.
+    """
+    __slots__ = "p", "data"
+
+    def __init__(self, p, tag = 0, i0 = None, i1 = None):
+        if not isinstance(p, Integral) or p & 1 == 0 or not 3 <= p < 256:
+            raise ValueError(ERR_P % p)
+        self.p = p
+        self.data = np.zeros(0, dtype = np.uint32)
+        add_vector(self, tag, i0, i1)
+
+    def __len__(self):
+        """Return the number of nonzero entries of the vector"""
+        return len(self.data)
+
+    def dot(self, other):
+        """Return scalar product of vector with vector ``other``
+
+        Here ``other`` must be an instance of this class with the
+        same modulus ``p``. The scalar product is taken with respect
+        to the invariant bilinear form of the representation; and
+        it is returned as an integer modulo ``p``.
+        """
+        return self.space.scalprod(self, other)
+
+    def as_mmvector(self):
+        """Return the vector as an instance of class |MMVector|"""
+        return MMVector(self.p, self)
+
+
+
+######################################################################
+# class SparseMMSpace
+######################################################################
+
+
+
+@singleton
+class SparseMMSpace(AbstractMmRepSpace):
+    """Models the representation of the monster with sparse vectors
+
+    This class contains a collection of functions for manipulating
+    vectors of class |SparseMMVector|. These function are used
+    implicitly in the operators applied to these vectors.
+    """
+    vector_type = SparseMMVector
+    space_name = "SMV"
+
+    def __init__(self):
+        """Create a 196884-dimensional representation of the monster
+
+        All calculations are done modulo the odd number p
+        """
+        pass
+
+    #######################################################################
+    # Creating vectors
+    #######################################################################
+
+    def zero(self, p):
+        """Return the zero vector"""
+        return SparseMMVector(p, 0)
+
+    def copy_vector(self, v1):
+        assert v1.space == self
+        v = SparseMMVector(v1.p, 0)
+        v.data = v1.data.copy()
+        return v
+
+    #######################################################################
+    # Obtaining and setting components via sparse vectors
+    #######################################################################
+
+    def getitems_sparse(self, v1, a_indices):
+        """Get items from vector v1
+
+        Here we assert that v1 is a vector of this vector space and
+        that 'a_indices' is a one-dimensional numpy array of type
+        np.uint32, containing the coordinates to be read from v1.
+        The function stores the corresponding coordinates in
+        the entries of the array 'a_indices'.
+
+        A zero entry in the array 'a_indices' is ignored.
+        """
+        if len(a_indices):
+            keys = v1.data & 0xffffff00
+            indices = _purge_indices(a_indices)
+            pos = np.searchsorted(keys, indices)
+            pos = np.minimum(pos, len(keys) - 1)
+            if len(keys):
+                found = (keys[pos] == indices) & (indices != 0)
+                values = np.where(found, v1.data[pos] & 0xff, 0)
+            else:
+                values = 0
+            a_indices[:] = (a_indices & 0xffffff00) + values
+        return a_indices
+
+    def additems_sparse(self, v, a_indices):
+        """Add a vector in sparse representation to vector v."""
+        if len(a_indices):
+            a = np.concatenate((v.data, a_indices), axis = None)
+            v.data = _reduce_sparse(v.p, a)
+        return v
+
+    def setitems_sparse(self, v, a_indices):
+        """Set selected components of a vector
+
+        Arguments 'v' and 'a_indices' are as in method getitems_sparse().
+        Here the coordinates of vector 'v' described by 'a_indices' are
+        set to the values given in 'a_indices'.
+        The array 'a_indices' is not changed.
+        """
+        if len(a_indices):
+            indices = _purge_indices(a_indices)
+            keep = ~np.isin(v.data & 0xffffff00, indices)
+            a = np.concatenate((v.data[keep], a_indices), axis = None)
+            v.data = _reduce_sparse(v.p, a)
+        return v
+
+    #######################################################################
+    # Conversion from and to to sparse representation
+    #######################################################################
+
+    def as_sparse(self, v1):
+        """Return a copy of the sorted sparse representation of v1"""
+        return v1.data.copy()
+
+    def as_bytes(self, v1):
+        """Return vector 'self' as a byte array
+
+        The result is a numpy array with dtype = uint8 and
+        shape = (196884,).
+        """
+        return v1.as_mmvector().as_bytes()
+
+    #######################################################################
+    # Vector operations
+    #######################################################################
+
+    def iadd(self, v1, v2):
+        if v1.p != v2.p:
+            err = "Cannot add vectors modulo differnt numbers"
+            raise ValueError(err)
+        d1, d2 = v1.data, v2.data
+        out = np.zeros(len(d1) + len(d2), dtype = np.uint32)
+        length = mm_sparse_add(v1.p, d1, len(d1), d2, len(d2), 1, out)
+        v1.data = out[:length]
+        return v1
+
+    def imul_scalar(self, v1, a):
+        length = mm_sparse_scale(v1.p, v1.data, len(v1.data), a % v1.p)
+        v1.data = v1.data[:length]
+        return v1
+
+    def scalprod(self, v1, v2):
+        """Return scalar product of vectors v1 and v2 modulo p"""
+        if v1.p != v2.p:
+            err = "Cannot multiply vectors modulo differnt numbers"
+            raise ValueError(err)
+        d1, d2 = v1.data, v2.data
+        return mm_sparse_scalprod(v1.p, d1, len(d1), d2, len(d2))
+
+    #######################################################################
+    # Group operation
+    #######################################################################
+
+    def imul_group_word(self, v1, g):
+        """Return product v1 * g of vector v1 and group word g.
+
+        v1 is replaced by v1 * g.
+
+        If ``g`` is in the subgroup N_0 of the monster then this
+        is done without converting ``v1`` to a dense vector.
+        """
+        if not isinstance(g, AbstractMMGroupWord):
+            err = "Multiplicator for MM vector must be int or in MM group"
+            raise TypeError(err)
+        a = g.mmdata
+        nn = np.zeros(5, dtype = np.uint32)
+        mm_group_n_clear(nn)
+        if mm_group_n_mul_word_scan(nn, a, len(a)) < len(a):
+            v = v1.as_mmvector() * g
+            v1.data = _reduce_sparse(v1.p, v.as_sparse())
+            return v1
+        d = v1.data
+        out = np.zeros(64 * len(d) + 1, dtype = np.uint32)
+        length = mm_sparse_op_n0(v1.p, d, len(d), nn, out)
+        if length < 0:
+            err = "Group operation on SparseMMVector object failed"
+            raise ValueError(err)
+        v1.data = out[:length].copy()
+        return v1
+
+    #######################################################################
+    # Checking equality
+    #######################################################################
+
+    def equal_vectors(self, v1, v2):
+        """Return True iff vectors v1 and v2 are equal
+
+        This method is called for elements v1 and v2 of the space
+        'self' only.
+        """
+        return v1.p == v2.p and np.array_equal(v1.data, v2.data)
+
+
+StdSparseMMSpace = SparseMMSpace()
+SparseMMVector.space = StdSparseMMSpace
+
+
+def SparseMMV(p):
+   """Return an object correponding to the sparse space modulo ``p``
+
+   Technically, ``SparseMMV(p)`` is the partial application of
+   the constructor of class |SparseMMVector| to the number ``p``.
+   """
+   return partial(SparseMMVector, p)
+
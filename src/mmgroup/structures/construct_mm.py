@@ -21,6 +21,7 @@ from mmgroup.generators import mm_group_invert_word
 from mmgroup.generators import mm_group_n_reduce_element
 from mmgroup.generators import mm_group_n_clear
 from mmgroup.generators import mm_group_n_mul_atom
+from mmgroup.generators import mm_group_parse_word
 from mmgroup.clifford12 import xsp2co1_rand_word_G_x0
 from mmgroup.clifford12 import xsp2co1_rand_word_N_0
 
@@ -438,7 +439,39 @@ def element_from_atom(group, tag, *data):
          raise ERR_TAG_VALUE(tag)
 
 
+def fast_parse_mm_string(s):
+    """Convert a string to a word of generators of the monster
+
+    The function converts a string ``s`` representing an element
+    of the monster to a word of generators of the monster, using 
+    function ``mm_group_parse_word`` in file ``mm_group_n.c``. This
+    works for strings obtained by converting an instance of 
+    class |MM| or ``MM0`` to a string, but not for more general
+    strings accepted by the constructors of these classes. 
+
+    The function returns the word as a ``numpy`` array of type 
+    ``numpy.uint32``. It returns None if the fast conversion fails.
+    """
+    try:
+        b = bytearray(s, "ascii")
+    except UnicodeEncodeError:
+        return None
+    if len(b) == 0:
+        return None
+    if b[-1] == ord(">"):
+        group_name = s[:s.find("<")]
+        if group_name and group_name not in ATOM_PARSERS:
+            return None
+    a = np.zeros(len(b) // 2 + 1, dtype = np.uint32)
+    length = mm_group_parse_word(b, len(b), a, len(a))
+    return a[:length] if length >= 0 else None
+
+
 def iter_parse_mm_string(group, s):
+    a = fast_parse_mm_string(s)
+    if a is not None:
+        yield from a
+        return
     m = FRAME.match(s)
     group_name, string = (m[1], m[2]) if m else (None, s)
     if not group_name:
@@ -628,3 +661,173 @@ def iter_strings_from_tuples(tuples):
                   raise TypeError(err)
           yield "%s_%s" % (tag, fmt(value))
 
+
+
+
+###########################################################################
+# Reading and writing monster elements in binary format
+###########################################################################
+
+# Binary format for a sequence of elements of the monster:
+# A file in this format is a sequence of blocks; each block contains
+# a sequence of elements of the monster. All entries of a block are 
+# unsigned 32-bit integers stored in little-endian order. A block 
+# containing ``n`` elements is structured as follows:
+#
+#   * Header of length 4: ``MM_WORDS_MAGIC``, ``MM_WORDS_VERSION``,
+#     the number ``n`` of elements, and the total number ``m`` of
+#     generators in all elements.
+#
+#   * ``n + 1`` offsets, with the first offset equal to 0 and the
+#     last offset equal to ``m``.
+#
+#   * ``m`` generators. Element ``i`` is the word of generators
+#     stored between offsets ``i`` and ``i + 1``, using the internal
+#     representation of elements of the monster as described
+#     in file mmgroup_generators.h.
+#
+# Blocks may be appended to an existing file.
+
+MM_WORDS_MAGIC = 0x444d574d  # "MWMD" in little-endian order
+MM_WORDS_VERSION = 1
+MM_WORDS_HEADER_LEN = 4
+MM_WORDS_BLOCK_SIZE = 4096
+ERR_MM_WORDS = "Bad block in binary file of monster elements"
+
+
+class MMWordWriter:
+    r"""Write elements of the monster to a file in binary format
+
+    :param file: Name of the file or a file object opened in 
+                 binary mode
+    :param append: Append to an existing file if this is ``True``.
+                   Otherwise an existing file is overwritten.
+                   This is ignored if ``file`` is a file object.
+    :param block_size: Maximum number of elements in a block
+
+    Method ``write`` writes an element of the monster (e.g. an
+    instance of class |MM| or ``MM0``) to the file, and method 
+    ``write_many`` writes all elements of an iterable. Elements
+    are buffered and written in blocks, so method ``close`` must
+    be called at the end. Instances of this class may also be used
+    as context managers.
+
+    Function ``iter_read_mm_words`` reads the elements written
+    by this class.
+    """
+    def __init__(self, file, append = False, block_size = None):
+        if isinstance(file, str):
+            self.file = open(file, "ab" if append else "wb")
+            self.own_file = True
+        else:
+            self.file = file
+            self.own_file = False
+        self.block_size = block_size or MM_WORDS_BLOCK_SIZE
+        self.words = []
+    
+    def write(self, g):
+        """Write an element ``g`` of the monster to the file"""
+        self.words.append(np.array(g.mmdata, dtype = np.uint32))
+        if len(self.words) >= self.block_size:
+            self.flush()
+
+    def write_many(self, elements):
+        """Write all elements of the monster in an iterable"""
+        for g in elements:
+            self.write(g)
+
+    def flush(self):
+        """Write all buffered elements to the file"""
+        n = len(self.words)
+        if n == 0:
+            return
+        lengths = [len(w) for w in self.words]
+        block = np.zeros(MM_WORDS_HEADER_LEN + n + 1, dtype = '<u4')
+        block[:MM_WORDS_HEADER_LEN] = [
+            MM_WORDS_MAGIC, MM_WORDS_VERSION, n, sum(lengths)]
+        np.cumsum(lengths, out = block[MM_WORDS_HEADER_LEN + 1:])
+        self.file.write(block.tobytes())
+        self.file.write(np.concatenate(self.words).astype('<u4').tobytes())
+        self.words = []
+        self.file.flush()
+
+    def close(self):
+        """Write all buffered elements and close the file
+
+        A file object passed to the constructor is not closed.
+        """
+        self.flush()
+        if self.own_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_mm_words(file, elements, append = False):
+    r"""Write elements of the monster to a file in binary format
+
+    Here ``elements`` is an iterable of elements of the monster, 
+    and  ``file`` and ``append`` are as in the constructor of 
+    class ``MMWordWriter``.
+    """
+    with MMWordWriter(file, append) as writer:
+        writer.write_many(elements)
+
+
+def iter_read_mm_word_blocks(file):
+    r"""Read the words of generators from a file in binary format
+
+    Here ``file`` is the name of a file or a file object opened in
+    binary mode. The file must have been written by class
+    ``MMWordWriter``.
+
+    The function yields a pair ``(offsets, words)`` of arrays of
+    type ``numpy.uint32`` for each block in the file. Here the
+    ``i``-th element in a block is ``words[offsets[i]:offsets[i+1]]``.
+    """
+    f = open(file, "rb") if isinstance(file, str) else file
+    try:
+        while True:
+            b = f.read(4 * MM_WORDS_HEADER_LEN)
+            if len(b) == 0:
+                return
+            if len(b) < 4 * MM_WORDS_HEADER_LEN:
+                raise ValueError(ERR_MM_WORDS)
+            magic, version, n, m = map(int, np.frombuffer(b, dtype = '<u4'))
+            if magic != MM_WORDS_MAGIC or version != MM_WORDS_VERSION:
+                raise ValueError(ERR_MM_WORDS)
+            b = f.read(4 * (n + 1 + m))
+            if len(b) < 4 * (n + 1 + m):
+                raise ValueError(ERR_MM_WORDS)
+            a = np.frombuffer(b, dtype = '<u4').astype(np.uint32)
+            offsets, words = a[:n+1], a[n+1:]
+            if offsets[0] != 0 or offsets[n] != m:
+                raise ValueError(ERR_MM_WORDS)
+            yield offsets, words
+    finally:
+        if f is not file:
+            f.close()
+
+
+def iter_read_mm_words(group, file):
+    r"""Read elements of the monster from a file in binary format
+
+    Here ``group`` is the class of the elements to be returned, e.g.
+    class |MM| or ``MM0``; ``group`` may also be an instance of a
+    group of such elements. Parameter ``file`` is as in function
+    ``iter_read_mm_word_blocks``.
+
+    The function yields the elements stored in the file. Elements
+    are read lazily, one block at a time.
+    """
+    if isinstance(group, AbstractGroup):
+        group = group.word_type
+    for offsets, words in iter_read_mm_word_blocks(file):
+        for i in range(len(offsets) - 1):
+            g = group()
+            g._setdata(words[offsets[i]:offsets[i+1]])
+            yield g
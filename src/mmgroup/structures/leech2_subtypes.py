@@ -0,0 +1,164 @@
+r"""Table of the subtypes of all vectors in the Leech lattice mod 2
+
+The C functions ``gen_leech2_subtype``, ``gen_leech2_type``, and
+``gen_leech2_type2`` in the extension ``mmgroup.generators`` compute
+the (sub)type of a vector in the Leech lattice mod 2 from the
+Golay code and cocode parts of that vector. These functions are
+called in the inner loops of the reduction algorithms for the
+monster group, e.g. in C functions ``gen_leech2_reduce_type4``,
+``gen_leech2_start_type4``, and ``mm_reduce_find_type4``.
+
+Alternatively, these functions may look up the subtype of a vector
+in a table of length :math:`2^{24}`, which has to be installed with
+C function ``gen_leech2_set_subtype_table``. Function
+``install_leech2_subtype_table`` in this module computes such a
+table, caches it in a file, and installs it. If the table is
+available in that file, it is mapped into memory from the file
+with ``numpy.memmap``.
+
+Installing that table is optional. It requires 16 MB of memory,
+and the results of all functions are the same with or without
+the table. A table read from a file is installed only if its
+SHA-256 digest is equal to the digest ``TABLE_SHA256`` of the
+correct table.
+
+Installing or uninstalling the table is not thread safe and
+requires external locking. A table once installed is never freed,
+so that a C function running without holding the GIL, e.g. a
+reduction function for the monster group, never reads a freed
+table.
+"""
+
+import os
+import hashlib
+import numpy as np
+
+from mmgroup.generators import gen_leech2_compute_subtype_table
+from mmgroup.generators import gen_leech2_set_subtype_table
+
+
+TABLE_LENGTH = 0x1000000
+
+TABLE_FILE_NAME = "leech2_subtypes.bin"
+
+# SHA-256 digest of the correct table
+TABLE_SHA256 = (
+   "22caf233cd96eae3705e6a4096f88b39398ef9eced2d1a9ec5ea4d0d894e8585")
+
+DEFAULT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The installed table. We must keep a reference to that table as
+# long as it is installed, since the C functions access it.
+SUBTYPE_TABLE = None
+
+# List of all tables ever installed. We never drop a reference to a
+# table installed once, since a C function running in another thread
+# may still read an uninstalled table.
+_ALL_TABLES = []
+
+
+
+def compute_leech2_subtype_table():
+    """Compute the table of the subtypes of all vectors mod 2
+
+    The function returns a numpy array ``a`` of length ``2**24`` and
+    type ``numpy.uint8``, where entry ``a[v]`` is equal to the value
+    ``gen_leech2_subtype(v)`` for a vector ``v`` in the Leech lattice
+    mod 2 in Leech lattice encoding. The table is computed without
+    using any installed table. The function does not install or
+    uninstall any table.
+    """
+    table = np.zeros(TABLE_LENGTH, dtype = np.uint8)
+    gen_leech2_compute_subtype_table(table, TABLE_LENGTH)
+    return table
+
+
+def check_leech2_subtype_table(table):
+    """Return True if ``table`` is the correct table of subtypes
+
+    Here ``table`` must be a numpy array of type ``numpy.uint8``. The
+    function compares the SHA-256 digest of the whole table with the
+    digest ``TABLE_SHA256`` of the correct table.
+    """
+    return (len(table) == TABLE_LENGTH and
+        hashlib.sha256(table).hexdigest() == TABLE_SHA256)
+
+
+def _load_table(path):
+    """Map table from file ``path`` into memory; return None if failed
+
+    The function also returns None if the table is not correct.
+    """
+    try:
+        if os.path.getsize(path) != TABLE_LENGTH:
+            return None
+        table = np.memmap(path, dtype = np.uint8, mode = 'c',
+            shape = (TABLE_LENGTH,))
+    except OSError:
+        return None
+    return table if check_leech2_subtype_table(table) else None
+
+
+def _save_table(path, table):
+    """Try to save table to file ``path``; return True if successful"""
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        table.tofile(tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+def install_leech2_subtype_table(directory = None):
+    r"""Install a table of the subtypes of all vectors mod 2
+
+    The function installs a table of the subtypes of all vectors in
+    the Leech lattice mod 2, so that C functions computing the
+    (sub)type of such a vector look up the result in that table.
+
+    The table is cached in the file ``leech2_subtypes.bin`` in the
+    given ``directory``. By default, this is the directory of the
+    ``mmgroup`` package. If that file is present then the table is
+    mapped into memory from that file, provided that the table in
+    that file is correct. Otherwise the table is computed with
+    function ``compute_leech2_subtype_table`` and stored in that
+    file, if possible.
+
+    The function returns the installed table as a numpy array. It
+    does nothing if a table has already been installed.
+    """
+    global SUBTYPE_TABLE
+    if SUBTYPE_TABLE is not None:
+        return SUBTYPE_TABLE
+    if directory is None:
+        directory = DEFAULT_DIR
+    path = os.path.join(directory, TABLE_FILE_NAME)
+    table = _load_table(path)
+    if table is None or gen_leech2_set_subtype_table(
+            table, TABLE_LENGTH) < 0:
+        # The cached table is missing or corrupted; so we recompute it
+        table = compute_leech2_subtype_table()
+        _save_table(path, table)
+        if gen_leech2_set_subtype_table(table, TABLE_LENGTH) < 0:
+            err = "Could not install table of subtypes of Leech vectors"
+            raise ValueError(err)
+    SUBTYPE_TABLE = table
+    _ALL_TABLES.append(table)
+    return table
+
+
+def uninstall_leech2_subtype_table():
+    """Uninstall the table installed by install_leech2_subtype_table()
+
+    Afterwards the C functions compute the (sub)type of a vector in
+    the Leech lattice mod 2 without using a table. The memory used
+    by the uninstalled table is not freed.
+    """
+    global SUBTYPE_TABLE
+    gen_leech2_set_subtype_table(np.zeros(1, dtype = np.uint8), 0)
+    SUBTYPE_TABLE = None
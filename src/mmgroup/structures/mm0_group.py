@@ -252,6 +252,7 @@ check_mm_order = None
 check_mm_equal = None
 check_mm_half_order = None
 check_mm_in_g_x0 = None
+hash_mm = None
 
 def import_mm_order_functions():
     """Import functions from module ``mmgroup.mm_order``.
@@ -261,11 +262,12 @@ def import_mm_order_functions():
     """
     global check_mm_order, check_mm_equal
     global check_mm_half_order, check_mm_in_g_x0
-    global mm_reduce_M
+    global mm_reduce_M, hash_mm
     from mmgroup.structures.mm_order import check_mm_order
     from mmgroup.structures.mm_order import check_mm_equal 
     from mmgroup.structures.mm_order import check_mm_half_order
     from mmgroup.structures.mm_order import check_mm_in_g_x0
+    from mmgroup.structures.mm_order import hash_mm
 
 
 
@@ -376,6 +378,36 @@ class MM0(AbstractMMGroupWord):
         
     def __getitem__(self,i):
         raise TypeError(self.ERR_ITER)
+
+    def __reduce__(self):
+        # Pickle the element as its internal representation
+        data = self._data[:self.length].tobytes()
+        return (type(self)._from_mmdata, (data, self.reduced))
+
+    @classmethod
+    def _from_mmdata(cls, data, reduced):
+        """Reconstruct a pickled element from its internal representation"""
+        g = cls()
+        g._setdata(np.frombuffer(data, dtype = np.uint32))
+        g.reduced = reduced
+        return g
+
+    def __hash__(self):
+        """Return a hash value of the element of the monster group
+
+        The hash value depends on the element of the monster, 
+        but not on its representation as a word of generators.
+        So equal elements have equal hash values. Computing the
+        hash value requires an operation of the element on a 
+        vector of the representation of the monster modulo 15.
+
+        An element should not be changed in place (e.g. with 
+        the ``*=`` operator) while it is used as a key of a 
+        dictionary or as an element of a set.
+        """
+        if hash_mm is None:
+            import_mm_order_functions()
+        return hash((self.group, hash_mm(self)))
  
         
     def is_reduced(self):
@@ -390,7 +422,7 @@ class MM0(AbstractMMGroupWord):
 
 
 
-    def order(self, max_order = 119):
+    def order(self, max_order = 119, mode = 0):
         r"""Return the order of the element of the monster group
 
         We use the method in :cite:`LPWW98`, section 7, for computing
@@ -401,10 +433,16 @@ class MM0(AbstractMMGroupWord):
         Then the function returns ``0`` if the order is greater than 
         ``max_order``. By default, the function returns the exact 
         order of the element.
+
+        If ``mode`` is 1 then we use a baby-step giant-step method
+        that requires fewer operations on vectors for elements of
+        large order, see function ``mm_order_element_M_bsgs_work``
+        in module ``mmgroup.mm_reduce``. The default mode 0 uses
+        the standard method.
         """
         if check_mm_order is None:
             import_mm_order_functions()
-        return check_mm_order(self, max_order)
+        return check_mm_order(self, max_order, mode)
 
     def half_order(self, max_order = 119):
         r"""Return the (halved) order of the element of the monster group
@@ -0,0 +1,154 @@
+r"""Caches for reduced words and orders of elements of the monster
+
+In many applications the same elements of the monster group are
+multiplied, reduced, and checked for their orders again and again.
+This module provides bounded caches with a *least recently used*
+(LRU) replacement policy for the results of such computations.
+
+The following caches are used:
+
+  * ``REDUCE_CACHE``  maps a word of generators of the monster
+    (as an element of class ``MM``) to the reduced word. It is used
+    by method ``reduce`` of class ``MMGroup``, and hence also by
+    the multiplication of elements of class ``MM``.
+
+  * ``ORDER_CACHE`` maps a reduced word to the order of the
+    corresponding element. It is used by method ``order`` of
+    class ``MM``.
+
+  * ``HALF_ORDER_CACHE`` maps a reduced word to the result of
+    method ``half_order`` of class ``MM``.
+
+The keys of these caches are the byte strings of the words of
+generators. All caches are disabled by default, so that they cost
+neither memory nor time for computing keys. A cache may be enabled
+by setting its size, e.g.:
+
+.. code-block:: python
+
+  from mmgroup.structures import mm_cache
+  mm_cache.set_cache_size(10000)   # Set size of all caches
+  mm_cache.set_cache_size(0)       # Disable all caches
+  print(mm_cache.cache_info())     # Show cache statistics
+
+Caches are shared between all threads.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_CACHE_SIZE = 0
+
+
+class LRUCache:
+    """Models a bounded cache with LRU replacement policy
+
+    Parameter ``maxsize`` is the maximum number of entries of the
+    cache. If ``maxsize`` is zero (default) then the cache is
+    disabled. A disabled cache ignores all keys; so a caller may
+    pass ``None`` as a key instead of computing a key for a
+    disabled cache.
+
+    Attributes ``hits`` and ``misses`` count the successful and
+    unsuccessful lookups in the cache.
+    """
+    def __init__(self, maxsize = DEFAULT_CACHE_SIZE):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = max(0, int(maxsize))
+        self.hits = self.misses = 0
+
+    @property
+    def maxsize(self):
+        """Maximum number of entries; 0 means that the cache is disabled"""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, size):
+        with self._lock:
+            self._maxsize = max(0, int(size))
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last = False)
+
+    def get(self, key):
+        """Return the entry for ``key``; return None if not found"""
+        if not self._maxsize or key is None:
+            return None
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store ``value`` in the cache under the key ``key``"""
+        if not self._maxsize or key is None:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last = False)
+
+    def clear(self):
+        """Delete all entries and reset statistics"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        """Return dictionary with statistical information"""
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "size": len(self._data), "maxsize": self._maxsize,
+        }
+
+
+REDUCE_CACHE = LRUCache()
+ORDER_CACHE = LRUCache()
+HALF_ORDER_CACHE = LRUCache()
+
+CACHES = {
+    "reduce": REDUCE_CACHE,
+    "order": ORDER_CACHE,
+    "half_order": HALF_ORDER_CACHE,
+}
+
+
+def set_cache_size(size, name = None):
+    """Set the maximum number of entries of a cache
+
+    If ``name`` is None (default) then the size of all caches in this
+    module is set to ``size``. Otherwise ``name`` must be one of
+    the strings "reduce", "order", or "half_order"; then only the
+    size of the corresponding cache is changed. A size of 0 disables
+    a cache.
+    """
+    names = CACHES.keys() if name is None else [name]
+    for name in names:
+        CACHES[name].maxsize = size
+
+
+def cache_info():
+    """Return dictionary with information about all caches
+
+    The function returns a dictionary mapping the names of the caches
+    to dictionaries as returned by method ``info`` of class
+    ``LRUCache``.
+    """
+    return {name: cache.info() for name, cache in CACHES.items()}
+
+
+def clear_caches():
+    """Delete all entries of all caches and reset statistics"""
+    for cache in CACHES.values():
+        cache.clear()
+
@@ -1,4 +1,6 @@
 import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from mmgroup import structures
@@ -6,6 +8,7 @@ from mmgroup.mat24 import vect_to_cocode
 from mmgroup.mat24 import ploop_theta
 from mmgroup.mm import mm_aux_index_sparse_to_leech2
 from mmgroup.mm import mm_vector
+from mmgroup.mm import mm_aux_hash
 from mmgroup.mm import mm_aux_mmv_extract_sparse_signs
 from mmgroup.structures.mm0_group import MM0Group, MM0
 from mmgroup.mm_group import MMGroup, MM
@@ -32,9 +35,15 @@ from mmgroup.mm15 import op_norm_A as mm_op15_norm_A
 from mmgroup.mm15 import op_watermark_A as mm_op15_watermark_A
 from mmgroup.mm_reduce import mm_order_element_M
 from mmgroup.mm_reduce import mm_order_element_Gx0
+from mmgroup.mm_reduce import mm_order_element_M_work
+from mmgroup.mm_reduce import mm_order_element_M_bsgs_work
+from mmgroup.mm_reduce import mm_order_element_M_many
+from mmgroup.mm_reduce import mm_order_element_Gx0_work
 from mmgroup.mm_reduce import mm_order_load_vector
 from mmgroup.mm_reduce import mm_order_load_tag_data
 from mmgroup.mm_reduce import mm_reduce_M
+from mmgroup.structures.mm_workspace import current_workspace
+from mmgroup.structures.mm_cache import ORDER_CACHE, HALF_ORDER_CACHE
 
 
 
@@ -82,15 +91,36 @@ def check_mm_equal(g1, g2, mode = 0):
         g2._data, g2.length, g3)
     if status < 2:
         return not status
-    v = mm_vector(15)
-    mm_order_load_vector(v.data)
-    work = mm_vector(15)
+    v, work = current_workspace().v[:2]
+    mm_order_load_vector(v)
     mm_op15_word(v, g3, status - 2, 1, work)
-    mm_order_load_vector(work.data)
+    mm_order_load_vector(work)
     return not mm_op15_compare(v, work)
 
 
 
+###########################################################################
+# Hash value of an element of the monster
+###########################################################################
+
+
+def hash_mm(g):
+    """Return a hash value of an element ``g`` of the monster
+
+    The hash value is computed from the image of the *ORDER_VECTOR*
+    ``v`` under ``g``, using C function ``mm_aux_hash``. So it
+    depends on the element ``g`` of the monster only, but not on 
+    its representation as a word of generators.
+
+    We just check the data in ``g``, ingnoring ``g.group``.
+    """
+    assert isinstance(g, (MM, MM0))
+    v, work = current_workspace().v[:2]
+    mm_order_load_vector(v)
+    mm_op15_word(v, g._data, g.length, 1, work)
+    return int(mm_aux_hash(15, v))
+
+
 ###########################################################################
 # Computing the order of an element of the monster
 ###########################################################################
@@ -100,7 +130,13 @@ def check_mm_equal(g1, g2, mode = 0):
 
 
 
-def check_mm_order(g, max_order = 119):
+ORDER_FUNCTIONS = {
+    0: mm_order_element_M_work,
+    1: mm_order_element_M_bsgs_work,
+}
+
+
+def check_mm_order(g, max_order = 119, mode = 0):
     """Return order of monster group element ``g``.
 
     ``g`` must be an instance of class ``MM``.  The function
@@ -111,11 +147,30 @@ def check_mm_order(g, max_order = 119):
     and in some cases we are interested in small orders only.   
     If ``max_order``is given then the function may return 0 if the
     order of ``g`` is greater than ``max_order``.
+
+    Parameter ``mode`` selects the algorithm used. If ``mode == 0``
+    (default) we use C function ``mm_order_element_M``. If
+    ``mode == 1`` we use the baby-step giant-step method in
+    C function ``mm_order_element_M_bsgs_work``. This is usually
+    faster, except for elements ``g`` where ``g**e`` is in the 
+    subgroup ``G_x0`` for a small exponent ``e``.
     """
     assert isinstance(g, (MM0, MM))
+    try:
+        f = ORDER_FUNCTIONS[mode]
+    except KeyError:
+        err = "Bad mode %s for computing the order in the monster"
+        raise ValueError(err % mode)
     g.reduce()
-    o = mm_order_element_M(g._data, g.length, max_order)
-    return  chk_qstate12(o)
+    key = g._data[:g.length].tobytes() if ORDER_CACHE.maxsize else None
+    o = ORDER_CACHE.get(key)
+    if o is not None:
+        return o
+    o = f(g._data, g.length, max_order, current_workspace().work)
+    chk_qstate12(o)
+    if o:
+        ORDER_CACHE.put(key, o)
+    return o
 
 def check_mm_half_order(g, max_order = 119):
     """Return (halved) order of monster group element ``g``.
@@ -132,8 +187,27 @@ def check_mm_half_order(g, max_order = 119):
     """
     assert isinstance(g, (MM0, MM))
     g.reduce()
+    key = None
+    if HALF_ORDER_CACHE.maxsize:
+        key = type(g), g._data[:g.length].tobytes()
+    cached = HALF_ORDER_CACHE.get(key)
+    if cached is not None:
+        o, h = cached
+        return o, (None if h is None else h.copy())
+    o, h = _half_order(g, max_order)
+    if o:
+        HALF_ORDER_CACHE.put(key, (o, None if h is None else h.copy()))
+    return o, h
+
+
+def _half_order(g, max_order):
+    """Workhorse for function ``check_mm_half_order``
+
+    Here ``g`` must be reduced.
+    """
     h = np.zeros(10, dtype = np.uint32)
-    o1 = mm_order_element_Gx0(g._data, g.length, h, max_order)
+    o1 = mm_order_element_Gx0_work(g._data, g.length, h, max_order,
+        current_workspace().work)
     chk_qstate12(o1)
     if o1 == 0:
         return 0, None
@@ -195,3 +269,122 @@ def check_mm_in_g_x0(g):
 
 
 
+
+
+
+###########################################################################
+# Reducing elements and computing orders in a pool of threads
+###########################################################################
+
+
+def _n_threads(nthreads, n_items):
+    if not nthreads:
+        nthreads = os.cpu_count() or 1
+    return max(1, min(nthreads, n_items))
+
+
+def reduce_mm_threaded(g_list, nthreads = None):
+    """Reduce a list of elements of the monster in a pool of threads
+
+    Here ``g_list`` must be a list of instances of class ``MM``. All
+    these elements are reduced in place, and ``g_list`` is returned.
+    
+    The list is split into ``nthreads`` chunks, and each chunk is
+    reduced by method ``reduce_many`` of class ``MMGroup`` in a 
+    separate thread. Here the C function doing the reduction releases
+    the GIL. By default, ``nthreads`` is the number of CPUs.
+    """
+    n = _n_threads(nthreads, len(g_list))
+    chunks = [g_list[i::n] for i in range(n)]
+    with ThreadPoolExecutor(max_workers = n) as executor:
+        list(executor.map(MMGroup().reduce_many, chunks))
+    return g_list
+
+
+def check_mm_order_threaded(g_list, max_order = 119, nthreads = None):
+    """Return list of orders of monster elements computed in threads
+
+    Here ``g_list`` must be a list of instances of class ``MM``.
+    The function returns the list of the orders of the elements of 
+    ``g_list``, computed by function ``check_mm_order`` in a pool
+    of ``nthreads`` threads. Parameter ``max_order`` is as in
+    function ``check_mm_order``. By default, ``nthreads`` is the 
+    number of CPUs.
+    """
+    if len(g_list) == 0:
+        return []
+    n = _n_threads(nthreads, len(g_list))
+    f = lambda g: check_mm_order(g, max_order)
+    with ThreadPoolExecutor(max_workers = n) as executor:
+        return list(executor.map(f, g_list))
+
+
+
+###########################################################################
+# Computing the orders of many elements of the monster
+###########################################################################
+
+
+def _check_mm_order_chunk(g_list, max_order, mode):
+    """Return list of orders of the monster elements in ``g_list``
+
+    The orders are computed in a single call to the C function
+    ``mm_order_element_M_many``, using the workspace of the
+    current thread.
+    """
+    for g in g_list:
+        assert isinstance(g, (MM0, MM))
+    mm_list = [g for g in g_list if hasattr(g.group, "reduce_many")]
+    if len(mm_list):
+        mm_list[0].group.reduce_many(mm_list)
+    for g in g_list:
+        g.reduce()
+    lengths = [g.length for g in g_list]
+    ofs = np.zeros(len(g_list) + 1, dtype = np.uint32)
+    ofs[1:] = np.cumsum(lengths)
+    a = np.zeros(max(1, int(ofs[-1])), dtype = np.uint32)
+    for g, start, length in zip(g_list, ofs, lengths):
+        a[start : start + length] = g._data[:length]
+    orders = np.zeros(len(g_list), dtype = np.uint32)
+    res = mm_order_element_M_many(a, ofs, len(g_list), max_order,
+        mode, orders, current_workspace().work)
+    chk_qstate12(res)
+    return [int(o) for o in orders]
+
+
+def check_mm_order_many(g_list, max_order = 119, mode = 0, nthreads = 1):
+    """Return list of orders of a list of monster elements
+
+    Here ``g_list`` must be a list of instances of class ``MM``.
+    The function returns the list of the orders of the elements 
+    of ``g_list``. Parameters ``max_order`` and ``mode`` are as in
+    function ``check_mm_order``.
+
+    This is equivalent to calling function ``check_mm_order`` for
+    all entries of ``g_list``. But here all elements are first
+    reduced together, and then their orders are computed in a
+    single call to a C function, reusing the same work buffers.
+
+    If ``nthreads`` is not 1 then the list is split into
+    ``nthreads`` chunks, and the chunks are processed in a pool
+    of threads. Here each thread uses its own workspace.
+    If ``nthreads`` is 0 or ``None`` then the number of threads
+    is the number of CPUs.
+    """
+    if not mode in ORDER_FUNCTIONS:
+        err = "Bad mode %s for computing the order in the monster"
+        raise ValueError(err % mode)
+    g_list = list(g_list)
+    if len(g_list) == 0:
+        return []
+    n = _n_threads(nthreads, len(g_list))
+    if n == 1:
+        return _check_mm_order_chunk(g_list, max_order, mode)
+    chunks = [g_list[i::n] for i in range(n)]
+    f = lambda chunk: _check_mm_order_chunk(chunk, max_order, mode)
+    with ThreadPoolExecutor(max_workers = n) as executor:
+        results = list(executor.map(f, chunks))
+    orders = [0] * len(g_list)
+    for i, result in enumerate(results):
+        orders[i::n] = result
+    return orders
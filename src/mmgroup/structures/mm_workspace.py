@@ -0,0 +1,93 @@
+r"""Reusable work buffers for computations in the monster group
+
+Reducing an element of the monster group and computing the order of
+an element of the monster requires several work buffers, each of the
+size of a vector in the representation :math:`\rho_{15}` of the
+monster. Allocating (and zeroing) these buffers in each call to a
+C function is expensive.
+
+An instance of class ``Workspace`` holds a set of such buffers. Each
+thread has its own default workspace, which is created on demand.
+A workspace may also be activated explicitly in a ``with``
+statement as follows:
+
+.. code-block:: python
+
+  from mmgroup import MM, Workspace
+  ws = Workspace()
+  with ws:
+      for i in range(1000):
+          g = MM('r', 'M')
+          o = g.order()
+
+Here all computations in the ``with`` statement use the buffers in
+``ws``. A workspace must not be shared between threads.
+"""
+
+import threading
+import numpy as np
+
+from mmgroup.mm import mm_vector
+
+
+
+class Workspace:
+    """Models a set of reusable work buffers for the monster group
+
+    Attribute ``v`` of an instance of this class is an array of three
+    vectors of the representation of the monster modulo 15, as
+    returned by function ``mm_vector(15, 3)`` in module ``mmgroup.mm``.
+    Attribute ``work`` is a flat view on the same memory, which
+    is suitable as a work buffer for the C functions
+    ``mm_reduce_M_work``, ``mm_order_element_Gx0_work``,
+    and ``mm_order_element_M_work``.
+
+    Attribute ``r`` is a buffer of length 128 for storing a reduced
+    element of the monster group.
+    """
+    __slots__ = "v", "work", "r"
+
+    def __init__(self):
+        self.v = mm_vector(15, 3)
+        self.work = self.v.reshape(-1)
+        self.r = np.zeros(128, dtype = np.uint32)
+
+    def __enter__(self):
+        _workspace_stack().append(self)
+        return self
+
+    def __exit__(self, *args):
+        stack = _workspace_stack()
+        assert stack[-1] is self
+        stack.pop()
+
+
+
+_local = threading.local()
+
+
+def _workspace_stack():
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+def current_workspace():
+    """Return the workspace to be used in the current thread
+
+    This is the workspace activated by the innermost ``with``
+    statement in the current thread. If no such workspace is
+    active then the default workspace of the current thread is
+    returned.
+    """
+    stack = _workspace_stack()
+    if len(stack):
+        return stack[-1]
+    try:
+        return _local.default
+    except AttributeError:
+        _local.default = Workspace()
+        return _local.default
+
@@ -51,6 +51,10 @@ from mmgroup.clifford12 import xsp2co1_conjugate_elem
 from mmgroup.clifford12 import xsp2co1_elem_conjugate_involution
 from mmgroup.clifford12 import xsp2co1_elem_conjugate_involution_Gx0
 from mmgroup.clifford12 import xsp2co1_elem_subtype
+from mmgroup.clifford12 import xsp2co1_elem_fingerprint
+from mmgroup.clifford12 import xsp2co1_elem_compile
+from mmgroup.clifford12 import xsp2co1_compiled_op_leech2
+from mmgroup.clifford12 import xsp2co1_compiled_op_leech3
 
 from mmgroup.structures.qs_matrix import QStateMatrix
 from mmgroup.structures.construct_mm import iter_strings_from_atoms
@@ -79,6 +83,17 @@ DICT_INVOLUTION_G_x0 = {
 
 
 
+G_X0_FINGERPRINTS = None
+
+def import_G_x0_fingerprints():
+    global G_X0_FINGERPRINTS
+    if G_X0_FINGERPRINTS is None:
+        from mmgroup.structures.xsp2_co1_fingerprints import \
+            G_X0_FINGERPRINTS
+    return G_X0_FINGERPRINTS
+
+
+
 MM = None
 
 def import_MM():
@@ -124,6 +139,17 @@ class Xsp2_Co1(AbstractMMGroupWord):
         self._data = np.zeros(26, dtype = np.uint64)
         xsp2co1_set_elem_word(self._data, a_atoms, len(a_atoms))
          
+    def __reduce__(self):
+        # Pickle the element as its internal representation
+        return (type(self)._from_xsp2co1_data, (self._data.tobytes(),))
+
+    @classmethod
+    def _from_xsp2co1_data(cls, data):
+        """Reconstruct a pickled element from its internal representation"""
+        g = cls()
+        g._data[:] = np.frombuffer(data, dtype = np.uint64)
+        return g
+
     @property
     def data(self):
         return list(map(int, self._data))
@@ -207,6 +233,16 @@ class Xsp2_Co1(AbstractMMGroupWord):
         else:
             return int(v[0])
 
+    def compile(self):
+        r"""Return a compiled version of the element
+
+        The function returns an instance of class ``Xsp2_Co1Compiled``
+        containing precomputed tables for the operation of the
+        element on many vectors of the Leech lattice modulo 2 and
+        modulo 3.
+        """
+        return Xsp2_Co1Compiled(self)
+
     def mul_data(self, data):
         a_atoms = np.array(data, dtype = np.uint32)
         xsp2co1_mul_elem_word(self._data, a_atoms, len(a_atoms))
@@ -369,6 +405,43 @@ class Xsp2_Co1(AbstractMMGroupWord):
         assert res & 0x40 == 0x40
         return res >> 4, res & 0xf
 
+    def fingerprint(self):
+        r"""Return a fingerprint of the element
+
+        The function returns a tuple of invariants of the element
+        under conjugation in :math:`G_{x0}` as computed by C function
+        ``xsp2co1_elem_fingerprint``. This tuple contains the 
+        order :math:`o`, the characters of the representations
+        :math:`24_x, 576_x, 4096_x, 98280_x`, and the 
+        information about the element and about its
+        power :math:`o/2` (if :math:`o` is even), as computed by
+        C function ``xsp2co1_elem_involution_class``.
+        """
+        a = np.zeros(7, dtype = np.int32)
+        chk_qstate12(xsp2co1_elem_fingerprint(self._data, a))
+        return tuple(map(int, a))
+
+    def fingerprint_label(self):
+        r"""Return a label of the fingerprint of the element
+
+        The function looks up the fingerprint of the element (as 
+        returned by method ``fingerprint``) in a precomputed table
+        and returns the label of that fingerprint, e.g. ``'4B'``.
+        Elements with the same fingerprint obtain the same label,
+        even if they are not conjugate. The function
+        returns ``None`` if the fingerprint has not been found in
+        the table.
+
+        The precomputed table is the dictionary ``G_X0_FINGERPRINTS``
+        in module ``mmgroup.structures.xsp2_co1_fingerprints``. That
+        dictionary also contains an element for each fingerprint.
+        """
+        table = import_G_x0_fingerprints()
+        try:
+            return table[self.fingerprint()][0]
+        except KeyError:
+            return None
+
     def str(self):
         """Convert group element to a string
         """
@@ -379,6 +452,68 @@ class Xsp2_Co1(AbstractMMGroupWord):
 
 
 
+###########################################################################
+# Compiled elements of the group G_x0
+###########################################################################
+
+
+class Xsp2_Co1Compiled(object):
+    r"""Models a compiled element :math:`g` of the group :math:`G_{x0}`
+
+    :param g:  Element of :math:`G_{x0}` to be compiled
+
+    An instance of this class should be constructed by calling
+    method ``compile`` of an instance ``g`` of class ``Xsp2_Co1``.
+    It contains precomputed tables for the operation of :math:`g`
+    on the Leech lattice modulo 2 (or, more precisely, on the
+    group :math:`Q_{x0}`) and on the Leech lattice modulo 3,
+    as computed by C function ``xsp2co1_elem_compile``.
+
+    Methods ``op_leech2`` and ``op_leech3`` apply :math:`g`
+    to numpy arrays of vectors with a single call to a C function.
+    This is much faster than applying :math:`g` to each vector
+    in a separate call, since the operation of :math:`g` is
+    not recomputed for each call.
+    """
+    __slots__ =  "g", "_data"
+    def __init__(self, g):
+        self.g = g.copy() if isinstance(g, Xsp2_Co1) else Xsp2_Co1(g)
+        self._data = np.zeros(792, dtype = np.uint64)
+        chk_qstate12(xsp2co1_elem_compile(self.g._data, self._data))
+
+    def op_leech2(self, a):
+        r"""Conjugate elements of :math:`Q_{x0}` with :math:`g`
+
+        Here ``a`` must be a one-dimensional array-like object of
+        elements of :math:`Q_{x0}` in **Leech lattice encoding**.
+        The function returns the numpy array of the
+        elements :math:`g^{-1} x g` for all :math:`x` in ``a``
+        as a numpy array of type ``numpy.uint32``. The result
+        is the same as the result of method ``xsp_conjugate``
+        of class ``Xsp2_Co1``.
+        """
+        a = np.array(a, dtype = np.uint32).ravel()
+        xsp2co1_compiled_op_leech2(self._data, a, len(a))
+        return a
+
+    def op_leech3(self, a):
+        r"""Map vectors of the Leech lattice mod 3 with :math:`g`
+
+        Here ``a`` must be a one-dimensional array-like object of
+        vectors of the Leech lattice mod 3 in **Leech lattice mod 3
+        encoding**. The function returns the numpy array of the
+        images of these vectors under :math:`g` as a numpy array
+        of type ``numpy.uint64``. Here the operation of :math:`g`
+        is given by the matrix ``g.leech_op / 8``, so that the
+        standard short vector ``STD_V3`` is mapped
+        to ``g.short3``.
+        """
+        a = np.array(a, dtype = np.uint64).ravel()
+        xsp2co1_compiled_op_leech3(self._data, a, len(a))
+        return a
+
+
+
 ###########################################################################
 # The class representing the group G_x0
 ###########################################################################
@@ -0,0 +1,250 @@
+r"""Arrays of elements of the subgroup :math:`G_{x0}` of the monster
+
+Class ``Xsp2_Co1Array`` in this module models an array of elements
+of the subgroup :math:`G_{x0}` of the monster. Such an array is
+stored in a numpy array of shape ``(n, 26)`` and type
+``numpy.uint64``, where each row stores an element
+of :math:`G_{x0}` in the same way as in class ``Xsp2_Co1``.
+
+Multiplication, exponentiation, and the computation of orders,
+subtypes and characters are done elementwise. Each of these
+operations is done in a single loop in C, without creating an
+instance of class ``Xsp2_Co1`` for each element. This is useful
+for sampling statistics over  :math:`G_{x0}`.
+"""
+
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+import numpy as np
+from numbers import Integral
+
+from mmgroup.structures.xsp2_co1 import Xsp2_Co1
+from mmgroup.structures.xsp2_co1 import import_G_x0_fingerprints
+from mmgroup.generators import rand_get_seed
+from mmgroup.clifford12 import chk_qstate12
+from mmgroup.clifford12 import xsp2co1_unit_elem
+from mmgroup.clifford12 import xsp2co1_mul_elem_array
+from mmgroup.clifford12 import xsp2co1_inv_elem_array
+from mmgroup.clifford12 import xsp2co1_power_elem_array
+from mmgroup.clifford12 import xsp2co1_reduce_elem_array
+from mmgroup.clifford12 import xsp2co1_order_elem_array
+from mmgroup.clifford12 import xsp2co1_elem_subtype_array
+from mmgroup.clifford12 import xsp2co1_traces_fast_array
+from mmgroup.clifford12 import xsp2co1_elem_fingerprint_array
+from mmgroup.clifford12 import xsp2co1_rand_elem_G_x0_array
+
+
+
+class Xsp2_Co1Array(object):
+    r"""Models an array of elements of the subgroup :math:`G_{x0}`
+
+    :param elements:  Description of the elements of the array
+
+    If ``elements`` is an integer ``n`` then we construct an array
+    of ``n`` neutral elements. If ``elements`` is a numpy array of
+    shape ``(n, 26)`` and type ``numpy.uint64`` then this numpy array
+    is used for storing the elements (without copying it). Otherwise
+    ``elements`` must be an iterable; and each entry of that iterable
+    is converted to an instance of class ``Xsp2_Co1``.
+
+    Entries of an array can be read and written in the same way
+    as the entries of a one-dimensional numpy array. Reading
+    an entry with an integer index returns an instance of
+    class ``Xsp2_Co1``.
+
+    If ``a`` and ``b`` are instances of this class of the same
+    length then ``a * b`` is the elementwise product of ``a``
+    and ``b``. Here ``b`` may also be an instance of
+    class ``Xsp2_Co1``, which is then multiplied with all
+    elements of ``a``. If ``e`` is an integer then ``a**e``
+    is the array of the ``e``-th powers of the elements of ``a``.
+    """
+    __slots__ = "data"
+
+    def __init__(self, elements = 0):
+        if isinstance(elements, Integral):
+            self.data = np.zeros((elements, 26), dtype = np.uint64)
+            for i in range(elements):
+                xsp2co1_unit_elem(self.data[i])
+        elif isinstance(elements, np.ndarray):
+            if elements.dtype != np.uint64 or elements.ndim != 2 or (
+                    elements.shape[1] != 26):
+                err = "Bad numpy array for class Xsp2_Co1Array"
+                raise TypeError(err)
+            self.data = np.ascontiguousarray(elements)
+        else:
+            elements = [x if isinstance(x, Xsp2_Co1) else Xsp2_Co1(x)
+                for x in elements]
+            self.data = np.zeros((len(elements), 26), dtype = np.uint64)
+            for i, x in enumerate(elements):
+                self.data[i] = x._data
+
+    @classmethod
+    def rand(cls, n):
+        r"""Return array of ``n`` random elements of :math:`G_{x0}`
+
+        The elements are uniform distributed in :math:`G_{x0}`,
+        and independent.
+        """
+        a = cls(np.zeros((n, 26), dtype = np.uint64))
+        chk_qstate12(xsp2co1_rand_elem_G_x0_array(
+            a.data.ravel(), n, rand_get_seed()))
+        return a
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        if isinstance(i, Integral):
+            g = Xsp2_Co1()
+            g._data[:] = self.data[i]
+            return g
+        return Xsp2_Co1Array(self.data[i].copy())
+
+    def __setitem__(self, i, value):
+        if isinstance(value, Xsp2_Co1Array):
+            self.data[i] = value.data
+        else:
+            if not isinstance(value, Xsp2_Co1):
+                value = Xsp2_Co1(value)
+            self.data[i] = value._data
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def copy(self):
+        """Return a (deep) copy of the array"""
+        return Xsp2_Co1Array(self.data.copy())
+
+    def _operand(self, other):
+        """Return ``other`` as a flat array of the same length"""
+        if isinstance(other, Xsp2_Co1Array):
+            if len(other) != len(self):
+                err = "Arrays of type Xsp2_Co1Array differ in length"
+                raise ValueError(err)
+            return other.data.ravel()
+        if not isinstance(other, Xsp2_Co1):
+            other = Xsp2_Co1(other)
+        return np.tile(other._data, len(self))
+
+    def __imul__(self, other):
+        a = self.data.ravel()
+        chk_qstate12(xsp2co1_mul_elem_array(
+            a, self._operand(other), a, len(self)))
+        return self
+
+    def __mul__(self, other):
+        return self.copy().__imul__(other)
+
+    def __pow__(self, e):
+        if not isinstance(e, Integral):
+            return NotImplemented
+        res = Xsp2_Co1Array(np.zeros(self.data.shape, dtype = np.uint64))
+        a, a_res = self.data.ravel(), res.data.ravel()
+        if e == -1:
+            chk_qstate12(xsp2co1_inv_elem_array(a, a_res, len(self)))
+        else:
+            chk_qstate12(xsp2co1_power_elem_array(a, e, a_res, len(self)))
+        return res
+
+    def reduce(self):
+        """Reduce all elements of the array
+
+        After reduction, two elements of the array are equal if and
+        only if the corresponding rows of the attribute ``data``
+        are equal.
+        """
+        chk_qstate12(xsp2co1_reduce_elem_array(self.data.ravel(),
+              len(self)))
+        return self
+
+    def __eq__(self, other):
+        """Return boolean numpy array indicating equal entries"""
+        if not isinstance(other, Xsp2_Co1Array):
+            other = Xsp2_Co1Array(np.tile(Xsp2_Co1(other)._data,
+                        (len(self), 1)))
+        other = other.copy().reduce()
+        return (self.copy().reduce().data == other.data).all(axis = 1)
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    def order(self):
+        """Return the orders of the elements as a numpy array"""
+        orders = np.zeros(len(self), dtype = np.int32)
+        chk_qstate12(xsp2co1_order_elem_array(self.data.ravel(),
+            len(self), orders))
+        return orders
+
+    def subtype(self):
+        """Return the subtypes of the elements as a numpy array
+
+        Here a subtype is encoded as an integer as returned by
+        function ``gen_leech2_subtype``. E.g. subtype ``(4,8)``
+        of the neutral element is encoded as ``0x48``.
+        """
+        subtypes = np.zeros(len(self), dtype = np.int32)
+        chk_qstate12(xsp2co1_elem_subtype_array(self.data.ravel(),
+            len(self), subtypes))
+        return subtypes
+
+    def traces(self):
+        r"""Return relevant characters of the elements of the array
+
+        The function returns a numpy array ``t`` of shape ``(n, 4)``,
+        where ``n`` is the length of the array. Row ``t[i]`` contains
+        the characters of the representations
+        :math:`\rho_{24}, \rho_{576}, \rho_{4096}, \rho_{98280}`
+        of element ``i`` of the array, as computed by
+        C function ``xsp2co1_traces_fast``.
+        """
+        traces = np.zeros((len(self), 4), dtype = np.int32)
+        chk_qstate12(xsp2co1_traces_fast_array(self.data.ravel(),
+            len(self), traces.ravel()))
+        return traces
+
+    def chi_G_x0(self):
+        r"""Compute characters of the elements of the array
+
+        The function returns a numpy array ``chi`` of shape ``(n, 4)``
+        and type ``numpy.int64``, where ``n`` is the length of the
+        array. Row ``chi[i]`` contains the tuple of characters
+        returned by method ``chi_G_x0`` of class |MM| for
+        element ``i`` of the array.
+        """
+        t = self.traces().astype(np.int64)
+        chi24, chisq24, chi4096, chi98280 = t.T
+        chi299 = (chi24**2 + chisq24) // 2 - 1
+        chi_M = chi299 + chi98280 + chi24 * chi4096
+        return np.stack((chi_M, chi299, chi24, chi4096), axis = 1)
+
+    def fingerprint(self):
+        """Return fingerprints of the elements
+
+        The function returns a numpy array of shape ``(n, 7)``,
+        where ``n`` is the length of the array. Row ``i`` of that
+        array contains the fingerprint of element ``i`` of the
+        array, as returned by method ``fingerprint`` of
+        class ``Xsp2_Co1``.
+        """
+        fp = np.zeros((len(self), 7), dtype = np.int32)
+        chk_qstate12(xsp2co1_elem_fingerprint_array(self.data.ravel(),
+            len(self), fp.ravel()))
+        return fp
+
+    def fingerprint_label(self):
+        """Return list of the labels of the fingerprints of the elements
+
+        Entry ``i`` of the returned list is the label of the
+        fingerprint of element ``i`` of the array, as returned by
+        method ``fingerprint_label`` of class ``Xsp2_Co1``.
+        """
+        table = import_G_x0_fingerprints()
+        return [table.get(tuple(map(int, x)), (None,))[0]
+             for x in self.fingerprint()]
+
+    def __str__(self):
+        return "Xsp2_Co1Array of length %d" % len(self)
+    __repr__ = __str__
+
@@ -0,0 +1,351 @@
+# This file has been created automatically, do not change!!!
+# It has been created by executing module
+# mmgroup.tests.test_involutions.make_g_x0_fingerprints.
+
+r"""Table of labels of fingerprints of elements of the group G_x0
+
+Dictionary G_X0_FINGERPRINTS maps a fingerprint of an element of G_x0
+to a pair (label, element). Here a fingerprint of an element g of G_x0
+is the tuple of invariants computed by C function
+``xsp2co1_elem_fingerprint``:
+
+   - Order o of g
+   - Character of g in the representations 24_x, 576_x, 4096_x, 98280_x
+   - Information about g computed by C function
+     ``xsp2co1_elem_involution_class``
+   - Information about g**(o/2) computed by C function
+     ``xsp2co1_elem_involution_class``; this is 0 if o is odd
+
+Conjugate elements have the same fingerprint; but elements with the
+same fingerprint need not be conjugate. The table has been obtained
+from random samples, so it need not contain all fingerprints.
+
+A label is a string as described in module
+``mmgroup.tests.test_involutions.make_g_x0_fingerprints``. An
+element with the given fingerprint is given as a word of generators
+of G_x0, as in attribute ``mmdata`` of class ``Xsp2_Co1``.
+"""
+
+G_X0_FINGERPRINTS = {
+ (1, 24, 24, 4096, 98280, 4113, 0) : ('1A', []),
+ (2, 24, 24, 0, 4072, 33, 33) : ('2A', [0x30001508, 0x1000088f]),
+ (2, 24, 24, 0, -24, 34, 34) : ('2B', [0x30000d95, 0x10000bbe]),
+ (2, 24, 24, -4096, 98280, 12322, 12322) : ('2C', [0x30001000]),
+ (2, 8, 24, 256, 2280, 4385, 4385) : ('2D', [0x30000fa1, 0x10000fff, 0x4000042b, 0x2e682458, 0x60000002, 0x20000780, 0x60000002, 0x228bf6f0]),
+ (2, 8, 24, 0, 232, 290, 290) : ('2E', [0x30000c31, 0x1000043a, 0x400005b8, 0x22948913, 0x60000001, 0x20159780, 0x60000001, 0x20005700]),
+ (2, 8, 24, -256, 2280, 4386, 4386) : ('2F', [0x30001982, 0x10000692, 0x400006c2, 0x2d8e9142, 0x60000001, 0x20000780, 0x60000001, 0x20a9ddc0]),
+ (2, 0, 24, 0, 264, 802, 802) : ('2G', [0x300009c1, 0x10000752, 0x40000384, 0x2a239319, 0x60000001, 0x20284880, 0x60000001, 0x200eb5b4]),
+ (3, 12, -12, -1, 0, 0, 0) : ('3A', [0x30001045, 0x10000193, 0x4000040c, 0x2a918625, 0x60000002, 0x201da600, 0x60000002, 0x23d1e0f0, 0x60000001, 0x202adc80]),
+ (3, 6, 6, 64, 378, 0, 0) : ('3B', [0x30001bf2, 0x10000cb3, 0x40000125, 0x2ce76934, 0x60000002, 0x201d0100, 0x60000002, 0x214de75b]),
+ (3, 3, -3, 8, 27, 0, 0) : ('3C', [0x30001a13, 0x10000441, 0x400000c1, 0x24d1431f, 0x60000001, 0x20284880, 0x60000001, 0x202adde1, 0x60000001]),
+ (3, 0, 0, 16, 0, 0, 0) : ('3D', [0x30000bbf, 0x10000cec, 0x400004f2, 0x2df187a9, 0x60000002, 0x20000f00, 0x60000001, 0x20071c10, 0x60000001, 0x200873c0]),
+ (4, 24, 24, 0, -24, 8257, 12322) : ('4A', [0x30001b95, 0x10000360]),
+ (4, 8, 24, 0, 232, 321, 34) : ('4B', [0x30001e7d, 0x100002ed, 0x4000046d, 0x22727010, 0x60000001, 0x204842c0, 0x60000002]),
+ (4, 8, 24, 0, 8, 322, 33) : ('4C', [0x30000967, 0x100007b8, 0x40000647, 0x28e7c531, 0x60000002, 0x202d1e00, 0x60000001, 0x215b7087]),
+ (4, 8, 24, 0, -24, 323, 34) : ('4D', [0x3000050f, 0x10000b30, 0x40000319, 0x2cd15cae, 0x60000002, 0x20163c80, 0x60000001, 0x2008bc86]),
+ (4, 8, 24, 0, -24, 8515, 12322) : ('4E', [0x30001dfa, 0x10000914, 0x400007db, 0x23ad4b9c, 0x60000002, 0x20000780, 0x60000001, 0x20000510]),
+ (4, 8, -8, 16, 120, 0, 4386) : ('4F', [0x30001b36, 0x10000b2d, 0x4000001d, 0x2ad460e1, 0x60000002, 0x202b2f00, 0x60000002, 0x265b9872, 0x60000002, 0x20b1ef40]),
+ (4, 8, -8, 0, -8, 0, 290) : ('4G', [0x300014a4, 0x10000ab7, 0x40000692, 0x285cdbd8, 0x60000001, 0x20284880, 0x60000001, 0x228bc5c9, 0x60000001, 0x20a2be80]),
+ (4, 8, -8, -16, 120, 0, 4386) : ('4H', [0x30000ac8, 0x10000c3e, 0x400007d7, 0x246ce661, 0x60000002, 0x20159780, 0x60000002, 0x200717c0, 0x60000001, 0x2001c5c0]),
+ (4, 4, 8, 32, 136, 0, 290) : ('4I', [0x30001b5b, 0x100008f4, 0x4000044d, 0x2a13f00a, 0x60000001, 0x20000f00, 0x60000002, 0x20a2c390, 0x60000001, 0x201df880]),
+ (4, 4, 8, 0, 40, 0, 4385) : ('4J', [0x300008be, 0x100007d1, 0x40000072, 0x22581f27, 0x60000002, 0x201e4b00, 0x60000001, 0x25c02995, 0x60000001, 0x214c97c0]),
+ (4, 4, 8, 0, 8, 0, 290) : ('4K', [0x30000913, 0x10000c34, 0x400005ed, 0x2ad830f3, 0x60000002, 0x202d1e00, 0x60000001, 0x25c03111, 0x60000002, 0x200e2e00]),
+ (4, 4, 8, 0, -24, 0, 4386) : ('4L', [0x30000acc, 0x10000ce1, 0x40000504, 0x2952e06e, 0x60000002, 0x2023c580, 0x60000002, 0x200ea324, 0x60000002]),
+ (4, 4, 8, -32, 136, 0, 290) : ('4M', [0x30000248, 0x10000412, 0x4000019f, 0x2d994fd9, 0x60000002, 0x20071ac0, 0x60000001, 0x21f00470]),
+ (4, 0, 24, 64, 264, 833, 34) : ('4N', [0x3000165d, 0x10000b21, 0x40000264, 0x2d91e5d5, 0x60000002, 0x20246a80, 0x60000002, 0x21546f25, 0x60000002]),
+ (4, 0, 24, 0, 40, 834, 33) : ('4O', [0x3000010d, 0x1000085f, 0x40000794, 0x2a8e8929, 0x60000002, 0x200003c0, 0x60000002, 0x20a2bf40, 0x60000002, 0x20188580]),
+ (4, 0, 24, 0, 8, 835, 34) : ('4P', [0x30000f51, 0x1000055b, 0x40000697, 0x264137cc, 0x60000001, 0x20284880, 0x60000001, 0x201d8607, 0x60000001]),
+ (4, 0, 24, 0, -24, 836, 34) : ('4Q', [0x300011bd, 0x1000009b, 0x40000509, 0x24ca69ee, 0x60000002, 0x2023c580, 0x60000002, 0x21fdb2b8, 0x60000002]),
+ (4, 0, 8, 16, 48, 0, 4385) : ('4R', [0x30001632, 0x1000089e, 0x400006e7, 0x299f62d8, 0x60000001, 0x20000b40, 0x60000002, 0x20005b20, 0x60000002, 0x2056b080]),
+ (4, 0, 8, 0, 16, 0, 290) : ('4S', [0x300000ec, 0x100003e9, 0x40000374, 0x20f56f17, 0x60000002, 0x20159780, 0x60000001, 0x20a2c300, 0x60000001, 0x2000e100]),
+ (4, 0, 8, 0, -16, 0, 290) : ('4Z', [0x30001c5f, 0x10000434, 0x400006e7, 0x299f62d8, 0x60000001, 0x20000b40, 0x60000002, 0x20005b20, 0x60000002, 0x2056b080]),
+ (4, 0, 0, 0, -12, 0, 802) : ('4T', [0x30000c76, 0x100004d4, 0x4000063e, 0x25ebb658, 0x60000001, 0x201ef000, 0x60000001, 0x251d6eb1, 0x60000001, 0x20071e80]),
+ (4, 0, -8, 16, 24, 0, 4386) : ('4U', [0x3000148f, 0x10000288, 0x40000685, 0x2cb739b3, 0x60000001, 0x20163c80, 0x60000002, 0x251dd405, 0x60000002, 0x20a2c600]),
+ (4, 0, -8, 0, 24, 0, 290) : ('4V', [0x30000084, 0x100000e2, 0x40000623, 0x2e0371a1, 0x60000002, 0x202a8a00, 0x60000002, 0x200070d7, 0x60000002]),
+ (4, 0, -8, 0, -8, 0, 290) : ('4W', [0x30001eea, 0x1000033c, 0x40000483, 0x2c2b3d9d, 0x60000001, 0x200003c0, 0x60000002, 0x20000fc0, 0x60000002, 0x201dc040]),
+ (4, 0, -24, 64, 0, 8772, 12322) : ('4X', [0x30001ffb, 0x1000005e, 0x40000776, 0x2d663199, 0x60000001, 0x20284880, 0x60000001, 0x25bfdaa2, 0x60000001, 0x20000780]),
+ (4, 0, -24, 0, 0, 580, 34) : ('4Y', [0x30001eab, 0x10000d3d, 0x4000032f, 0x26c18f8a, 0x60000001, 0x20284880, 0x60000001, 0x25242c19]),
+ (5, 6, -6, -1, 0, 0, 0) : ('5A', [0x30000555, 0x10000ed5, 0x40000184, 0x245cec85, 0x60000001, 0x2016e180, 0x60000001, 0x23354910, 0x60000002]),
+ (5, 4, 4, 16, 60, 0, 0) : ('5B', [0x30000a68, 0x100005ce, 0x40000706, 0x26b01217, 0x60000001, 0x20000780, 0x60000002, 0x20000c00, 0x60000002, 0x203a1c40]),
+ (5, 1, -1, 4, 5, 0, 0) : ('5C', [0x300003dd, 0x100005d2, 0x40000634, 0x2a701d14, 0x60000002, 0x201c5c00, 0x60000001, 0x20005b50, 0x60000002, 0x2007c740]),
+ (6, 12, -12, 1, 0, 0, 12322) : ('6A', [0x30000fef, 0x100006b4, 0x40000646, 0x27d9a186, 0x60000001, 0x20284880, 0x60000001, 0x2299aca3, 0x60000001, 0x20a2be80]),
+ (6, 6, 6, 0, 58, 0, 33) : ('6B', [0x30000e70, 0x10000ea4, 0x4000007f, 0x2d2fe6e3, 0x60000001, 0x201ef000, 0x60000001, 0x202b0ad9, 0x60000001]),
+ (6, 6, 6, 0, -6, 0, 34) : ('6C', [0x30001a5e, 0x10000c69, 0x40000092, 0x20980814, 0x60000001, 0x2016e180, 0x60000002, 0x202482c1, 0x60000002]),
+ (6, 6, 6, -64, 378, 0, 12322) : ('6D', [0x30000712, 0x100008c0, 0x400002e4, 0x29312a59, 0x60000001, 0x201ef000, 0x60000001, 0x200e4cba]),
+ (6, 5, -3, 8, 27, 0, 4386) : ('6E', [0x30000a70, 0x10000971, 0x40000059, 0x2d2f9121, 0x60000001, 0x20284880, 0x60000001, 0x21e87817, 0x60000001]),
+ (6, 5, -3, 0, -5, 0, 290) : ('6F', [0x30001911, 0x10000804, 0x400005ee, 0x201550ab, 0x60000002, 0x20000f00, 0x60000001, 0x20071fa0, 0x60000001, 0x209e9580]),
+ (6, 5, -3, -8, 27, 0, 4385) : ('6G', [0x300015ea, 0x10000bf7, 0x400004ff, 0x20836265, 0x60000001, 0x201ef000, 0x60000001, 0x25b968b6, 0x60000001]),
+ (6, 4, 6, 8, 36, 0, 4385) : ('6H', [0x3000112b, 0x10000c26, 0x40000138, 0x20c80a28, 0x60000002, 0x20154500, 0x60000001, 0x20a2c390, 0x60000001, 0x205d7c80]),
+ (6, 4, 6, -8, 36, 0, 4386) : ('6I', [0x30000dbc, 0x10000e63, 0x400000ef, 0x2d76db9c, 0x60000002, 0x2027a380, 0x60000001, 0x265b85b0, 0x60000002, 0x215bbd40]),
+ (6, 4, -12, 1, 0, 0, 4386) : ('6J', [0x300009c5, 0x10000f54, 0x40000086, 0x216999f2, 0x60000002, 0x201e4b00, 0x60000001, 0x25175314, 0x60000002, 0x20000b40]),
+ (6, 4, -12, -1, 0, 0, 4385) : ('6K', [0x30001b60, 0x10000655, 0x40000650, 0x2a2334f0, 0x60000002, 0x20000b40, 0x60000002, 0x20000c00, 0x60000002, 0x20169e00]),
+ (6, 3, -3, 0, -5, 0, 33) : ('6L', [0x3000186d, 0x10000196, 0x40000651, 0x2d23629a, 0x60000002, 0x20000780, 0x60000001, 0x20005eb0, 0x60000001, 0x20241f80]),
+ (6, 3, -3, -8, 27, 0, 12322) : ('6M', [0x300001be, 0x10000223, 0x400001ea, 0x2263f8a3, 0x60000001, 0x201c5c00, 0x60000001, 0x20005760, 0x60000002, 0x209df800]),
+ (6, 2, 6, 16, 42, 0, 4385) : ('6N', [0x30000e6d, 0x100005bd, 0x40000525, 0x2217dc72, 0x60000002, 0x201d0100, 0x60000002, 0x201121e0]),
+ (6, 2, 6, 0, 10, 0, 290) : ('6O', [0x30000b1c, 0x10000745, 0x400007c9, 0x22514509, 0x60000001, 0x20000b40, 0x60000001, 0x20000870, 0x60000001, 0x209dbfc0]),
+ (6, 2, 6, -16, 42, 0, 4386) : ('6P', [0x30000e66, 0x10000740, 0x400001d2, 0x252c4b94, 0x60000002, 0x20154500, 0x60000001, 0x20000c00, 0x60000002, 0x2007c740]),
+ (6, 1, -3, 4, 3, 0, 4386) : ('6Q', [0x30001ec7, 0x1000092b, 0x4000067b, 0x2d90c9e5, 0x60000001, 0x20284880, 0x60000001, 0x20aa42f1, 0x60000001]),
+ (6, 1, -3, -4, 3, 0, 4385) : ('6R', [0x30001e18, 0x10000908, 0x400006a4, 0x2c8d27b0, 0x60000001, 0x201ef000, 0x60000001, 0x21f77248, 0x60000001]),
+ (6, 0, 6, 0, 12, 0, 802) : ('6V', [0x3000046d, 0x10000441, 0x40000648, 0x2229116c, 0x60000002, 0x20159780, 0x60000002, 0x20000870, 0x60000001, 0x209cb580]),
+ (6, 0, 0, 16, 0, 0, 12322) : ('6S', [0x3000146f, 0x10000fdf, 0x4000077d, 0x213a79e3, 0x60000002, 0x201e4b00, 0x60000001, 0x21f00f50, 0x60000002]),
+ (6, 0, 0, 0, 0, 0, 34) : ('6T', [0x30000a01, 0x10000048, 0x400005e9, 0x2155e76f, 0x60000001, 0x2016e180, 0x60000002, 0x251d6eb0, 0x60000001, 0x200ed300]),
+ (6, 0, 0, 0, 0, 0, 802) : ('6U', [0x300009f1, 0x10000b6c, 0x400002ad, 0x2c517395, 0x60000002, 0x20246a80, 0x60000002, 0x251dd410, 0x60000001, 0x20a2c9c0]),
+ (7, 4, -4, -1, 0, 0, 0) : ('7A', [0x30001022, 0x100001a4, 0x400004cb, 0x2b751830, 0x60000002, 0x2023c580, 0x60000002, 0x25247e24, 0x60000001, 0x20000b40]),
+ (7, 3, 3, 8, 21, 0, 0) : ('7B', [0x30000b12, 0x10000f2a, 0x400004e0, 0x296db14e, 0x60000001, 0x201c5c00, 0x60000001, 0x20a2c750, 0x60000002, 0x2046f140]),
+ (8, 8, -8, 0, 8, 0, 12322) : ('8A', [0x30000b13, 0x10000ed8, 0x40000030, 0x2b95c5eb, 0x60000002, 0x201d0100, 0x60000002, 0x23d0a922, 0x60000002, 0x20005640]),
+ (8, 4, 8, 0, 24, 0, 34) : ('8B', [0x30000010, 0x10000c5c, 0x4000004d, 0x2889500c, 0x60000001, 0x20000b40, 0x60000002, 0x200717c0, 0x60000002, 0x2000b040]),
+ (8, 4, 8, 0, 0, 0, 34) : ('8AJ', [0x30001b61, 0x10000ec1, 0x4000044d, 0x2a13f00a, 0x60000001, 0x20000f00, 0x60000002, 0x20a2c390, 0x60000001, 0x201df880]),
+ (8, 4, 8, 0, -8, 0, 34) : ('8C', [0x30000f07, 0x10000739, 0x4000042c, 0x2b224695, 0x60000002, 0x201da600, 0x60000002, 0x232e7582, 0x60000001, 0x20005280]),
+ (8, 4, 8, 0, -16, 0, 12322) : ('8D', [0x30000226, 0x10000ae1, 0x400000a0, 0x2a477e46, 0x60000002, 0x201548c0, 0x60000001, 0x20000c30, 0x60000002, 0x202097c0]),
+ (8, 4, 0, 4, 12, 0, 4386) : ('8E', [0x30000558, 0x1000090a, 0x4000029f, 0x25db5dd7, 0x60000001, 0x20163c80, 0x60000002, 0x201d1943]),
+ (8, 4, 0, 0, -4, 0, 290) : ('8F', [0x30000962, 0x100003ce, 0x400003ce, 0x21fa13f0, 0x60000002, 0x201d0100, 0x60000002, 0x228c6ed1, 0x60000002, 0x20005640]),
+ (8, 4, 0, -4, 12, 0, 4386) : ('8G', [0x30000201, 0x10000774, 0x400003f4, 0x2207db24, 0x60000001, 0x20154500, 0x60000001, 0x20005e80, 0x60000002, 0x200ed6c0]),
+ (8, 2, 4, 8, 16, 0, 290) : ('8H', [0x30000835, 0x10000c54, 0x400003f8, 0x2a8fc5c5, 0x60000001, 0x200003c0, 0x60000002, 0x20a2c360, 0x60000001, 0x202c9340]),
+ (8, 2, 4, 0, 8, 0, 290) : ('8I', [0x300017b3, 0x10000dbb, 0x40000471, 0x25adf510, 0x60000002, 0x202a8a00, 0x60000002, 0x23d1e863, 0x60000002, 0x20164040]),
+ (8, 2, 4, 0, 0, 0, 290) : ('8J', [0x300014fb, 0x10000f23, 0x40000234, 0x26a4da36, 0x60000002, 0x202b2f00, 0x60000002, 0x25b92557, 0x60000002, 0x21462200]),
+ (8, 2, 4, 0, -4, 0, 4385) : ('8K', [0x30001cec, 0x10000085, 0x4000048d, 0x249368db, 0x60000001, 0x20000b40, 0x60000002, 0x20a2bfd0, 0x60000002, 0x200ab540]),
+ (8, 2, 4, 0, -4, 0, 4386) : ('8L', [0x30000dce, 0x10000e95, 0x4000021b, 0x2254d561, 0x60000001, 0x201c5c00, 0x60000002, 0x20071fd0, 0x60000001, 0x2010e3c0]),
+ (8, 2, 4, 0, -8, 0, 290) : ('8M', [0x30001712, 0x10000e4a, 0x400003c1, 0x2b0f528b, 0x60000002, 0x201548c0, 0x60000002, 0x20005b50, 0x60000001, 0x209d2240]),
+ (8, 2, 4, -8, 16, 0, 290) : ('8N', [0x300015b7, 0x10000945, 0x40000334, 0x299d97b4, 0x60000002, 0x202b2f00, 0x60000002, 0x25243725, 0x60000001, 0x21e83b80]),
+ (8, 0, 24, 0, 0, 9090, 12322) : ('8O', [0x30000a79, 0x10000f6c, 0x400004be, 0x206a5d35, 0x60000002, 0x20072240, 0x60000001, 0x20154a10]),
+ (8, 0, 8, 4, 8, 0, 4386) : ('8P', [0x30001a06, 0x100001bc, 0x40000774, 0x235a671d, 0x60000001, 0x20159780, 0x60000001, 0x202aedf0, 0x60000002]),
+ (8, 0, 8, 0, 8, 0, 34) : ('8Q', [0x300006a9, 0x10000a42, 0x400003db, 0x23f92a60, 0x60000001, 0x202dc300, 0x60000001, 0x20155fd2]),
+ (8, 0, 8, 0, 0, 0, 34) : ('8R', [0x30000cf4, 0x10000d59, 0x4000009a, 0x2b6e6ddf, 0x60000002, 0x201e4b00, 0x60000001, 0x2146f953, 0x60000001]),
+ (8, 0, 8, 0, 0, 0, 290) : ('8S', [0x3000157e, 0x100000d0, 0x4000052e, 0x2b349b9f, 0x60000002, 0x202d1e00, 0x60000001, 0x25b91666, 0x60000001, 0x20a9d940]),
+ (8, 0, 8, 0, -8, 0, 34) : ('8T', [0x30001dfe, 0x10000150, 0x4000025e, 0x2af86a73, 0x60000002, 0x201c5c00, 0x60000001, 0x20001020, 0x60000002, 0x20118500]),
+ (8, 0, 8, 0, -8, 0, 290) : ('8U', [0x30000371, 0x10000b63, 0x400005e5, 0x29fb1045, 0x60000002, 0x20005dc0, 0x60000001, 0x21f71ba0, 0x60000001]),
+ (8, 0, 0, 8, 12, 0, 34) : ('8V', [0x30001c7e, 0x10000fc5, 0x40000347, 0x243a97ba, 0x60000001, 0x20163c80, 0x60000002, 0x20008386, 0x60000002]),
+ (8, 0, 0, 8, 0, 0, 12322) : ('8W', [0x300010f0, 0x10000d4f, 0x40000434, 0x2ce0a5e1, 0x60000002, 0x201548c0, 0x60000001, 0x20000c60, 0x60000002, 0x20092f40]),
+ (8, 0, 0, 4, 4, 0, 4386) : ('8X', [0x30001be5, 0x10000f41, 0x400004c7, 0x2a6417eb, 0x60000002, 0x20246a80, 0x60000002, 0x20aa8e01]),
+ (8, 0, 0, 4, 0, 0, 4385) : ('8Y', [0x30001a20, 0x10000060, 0x400006dc, 0x22e8db55, 0x60000002, 0x201d0100, 0x60000002, 0x23d0a8f3, 0x60000001, 0x21fd8080]),
+ (8, 0, 0, 0, 4, 0, 34) : ('8Z', [0x30001e30, 0x10000d19, 0x4000023f, 0x257b3f0e, 0x60000002, 0x2027a380, 0x60000001, 0x25b91290, 0x60000001, 0x21ef5280]),
+ (8, 0, 0, 0, 4, 0, 290) : ('8AA', [0x300019cc, 0x10000bf3, 0x40000397, 0x2ccac64e, 0x60000002, 0x2027a380, 0x60000001, 0x20157a17, 0x60000001]),
+ (8, 0, 0, 0, 0, 0, 33) : ('8AB', [0x300012fa, 0x10000932, 0x40000366, 0x28999d2a, 0x60000002, 0x2023c580, 0x60000002, 0x21fd81c0, 0x60000002]),
+ (8, 0, 0, 0, 0, 0, 34) : ('8AC', [0x30000cec, 0x10000a7e, 0x21991174, 0x60000002, 0x2023c580, 0x60000002, 0x25b97794, 0x60000001, 0x20005640]),
+ (8, 0, 0, 0, 0, 0, 290) : ('8AD', [0x30001724, 0x10000b90, 0x4000015e, 0x2915223a, 0x60000001, 0x2016e180, 0x60000002, 0x20006d07, 0x60000001]),
+ (8, 0, 0, 0, -4, 0, 34) : ('8AK', [0x300011ef, 0x10000fca, 0x400006a4, 0x2725b232, 0x60000001, 0x2016e180, 0x60000001, 0x25174ba6, 0x60000001, 0x202a8a00]),
+ (8, 0, 0, 0, -4, 0, 290) : ('8AE', [0x30000ab8, 0x10000789, 0x4000077b, 0x20a38abe, 0x60000002, 0x201da600, 0x60000002, 0x25bfe994, 0x60000002, 0x21e83b80]),
+ (8, 0, -8, 4, 0, 0, 4386) : ('8AF', [0x30001caa, 0x10000b70, 0x4000060e, 0x295b38ff, 0x60000002, 0x20246a80, 0x60000002, 0x232f6293, 0x60000001]),
+ (8, 0, -8, 0, 8, 0, 12322) : ('8AG', [0x3000021c, 0x100000fe, 0x400001ab, 0x2dead15a, 0x60000001, 0x20000f00, 0x60000002, 0x20005790, 0x60000002, 0x205cdb40]),
+ (8, 0, -8, 0, 0, 0, 34) : ('8AH', [0x3000156c, 0x1000080a, 0x4000049f, 0x2cc9b452, 0x60000002, 0x20159780, 0x60000002, 0x20071850, 0x60000001, 0x20130ec0]),
+ (8, 0, -8, 0, 0, 0, 290) : ('8AI', [0x300009e1, 0x10000cb8, 0x40000165, 0x23eb3cd2, 0x60000002, 0x202a8a00, 0x60000002, 0x20024a87]),
+ (9, 3, 3, 4, 9, 0, 0) : ('9A', [0x30001507, 0x1000059a, 0x4000004a, 0x268fd46a, 0x60000002, 0x201d0100, 0x60000002, 0x21e9e1f1]),
+ (9, 3, -3, -1, 0, 0, 0) : ('9B', [0x3000169d, 0x10000cc1, 0x400007ee, 0x28d15dd2, 0x60000002, 0x2023c580, 0x60000002, 0x20a2ec03, 0x60000001]),
+ (9, 0, 0, 2, 0, 0, 0) : ('9C', [0x300016f4, 0x10000756, 0x40000698, 0x23315cdf, 0x60000001, 0x201ef000, 0x60000001, 0x21ea0331, 0x60000002]),
+ (10, 6, -6, 1, 0, 0, 12322) : ('10A', [0x30000ae7, 0x100000b0, 0x40000698, 0x2b684702, 0x60000001, 0x2016e180, 0x60000001, 0x23d0ec9a]),
+ (10, 4, 4, 0, 12, 0, 33) : ('10B', [0x30000a84, 0x10000df6, 0x4000052d, 0x2e071c30, 0x60000002, 0x202d1e00, 0x60000001, 0x214cd0a0]),
+ (10, 4, 4, 0, -4, 0, 34) : ('10C', [0x300002ea, 0x10000192, 0x40000449, 0x2e3f6d8c, 0x60000001, 0x2016e180, 0x60000002, 0x20acc9a1, 0x60000002]),
+ (10, 4, 4, -16, 60, 0, 12322) : ('10D', [0x3000143a, 0x1000002c, 0x4000031c, 0x20cf004b, 0x60000001, 0x20284880, 0x60000001, 0x20bfead0]),
+ (10, 3, -1, 4, 5, 0, 4386) : ('10E', [0x30000a90, 0x10000ad6, 0x40000352, 0x239b756d, 0x60000001, 0x202dc300, 0x60000001, 0x251747e1, 0x60000002, 0x20000780]),
+ (10, 3, -1, 0, -3, 0, 290) : ('10F', [0x30001787, 0x10000c3b, 0x4000045f, 0x22222a8b, 0x60000002, 0x20000b40, 0x60000002, 0x20005eb0, 0x60000002, 0x200b07c0]),
+ (10, 3, -1, -4, 5, 0, 4385) : ('10G', [0x30001d93, 0x10000612, 0x400006e1, 0x2e30c9d9, 0x60000002, 0x20000b40, 0x60000002, 0x20005eb0, 0x60000002, 0x2007d280]),
+ (10, 2, 4, 4, 10, 0, 4385) : ('10H', [0x30000180, 0x100004e9, 0x40000303, 0x21c45d38, 0x60000002, 0x20246a80, 0x60000002, 0x214daf65, 0x60000002]),
+ (10, 2, 4, -4, 10, 0, 4386) : ('10I', [0x30001fc3, 0x10000eab, 0x40000729, 0x201ddc09, 0x60000001, 0x2016e180, 0x60000002, 0x20bf94e4, 0x60000002]),
+ (10, 2, -6, 1, 0, 0, 4386) : ('10J', [0x30001949, 0x10000c31, 0x40000304, 0x27e14e18, 0x60000001, 0x2016e180, 0x60000002, 0x20a32457]),
+ (10, 2, -6, -1, 0, 0, 4385) : ('10K', [0x30001830, 0x100003a2, 0x400005ef, 0x2b87cb17, 0x60000001, 0x2016e180, 0x60000002, 0x21fdaf58]),
+ (10, 1, -1, 0, -3, 0, 33) : ('10L', [0x300013f3, 0x10000a1f, 0x400003df, 0x2744d1e7, 0x60000002, 0x202a8a00, 0x60000002, 0x251d7275, 0x60000002, 0x200e3580]),
+ (10, 1, -1, -4, 5, 0, 12322) : ('10M', [0x30001401, 0x10000ff1, 0x4000052a, 0x21f04d8e, 0x60000002, 0x202d1e00, 0x60000001, 0x228cfa08, 0x60000001, 0x20071ac0]),
+ (10, 0, 4, 0, 4, 0, 802) : ('10N', [0x300018d1, 0x10000901, 0x4000007d, 0x2a9645ac, 0x60000001, 0x20284880, 0x60000001, 0x25243710, 0x60000001, 0x20a2be80]),
+ (11, 2, 2, 4, 6, 0, 0) : ('11A', [0x30000870, 0x1000026f, 0x40000222, 0x28435623, 0x60000001, 0x20159780, 0x60000001, 0x20a2c360, 0x60000001, 0x2016a940]),
+ (12, 6, 6, 0, -6, 0, 12322) : ('12A', [0x30001d6b, 0x1000025f, 0x40000308, 0x20ddd6fc, 0x60000001, 0x201ef000, 0x60000001, 0x25175303, 0x60000001, 0x214c97c0]),
+ (12, 5, -3, 0, 3, 0, 12322) : ('12B', [0x30001b18, 0x10000f5c, 0x400003fc, 0x2b3e6ea4, 0x60000001, 0x2016e180, 0x60000001, 0x20ab7409]),
+ (12, 4, 6, 0, 4, 0, 34) : ('12C', [0x30000bac, 0x100006eb, 0x40000707, 0x22afa567, 0x60000001, 0x2016e180, 0x60000002, 0x265c3280, 0x60000001, 0x20bf70c0]),
+ (12, 4, 6, 0, -4, 0, 33) : ('12D', [0x30001967, 0x10000ee0, 0x400005ef, 0x279c9c4f, 0x60000002, 0x201da600, 0x60000002, 0x21fdb2f0]),
+ (12, 4, 4, 1, 0, 0, 4386) : ('12E', [0x300016a2, 0x10000435, 0x4000057f, 0x23b54c11, 0x60000001, 0x20000f00, 0x60000002, 0x20071f70, 0x60000002, 0x201ef3c0]),
+ (12, 4, 4, -1, 0, 0, 4386) : ('12F', [0x3000095b, 0x100006f0, 0x4000011c, 0x280f7127, 0x60000002, 0x20163c80, 0x60000001, 0x20aa1975, 0x60000001]),
+ (12, 3, 1, 2, 3, 0, 4386) : ('12G', [0x30000e02, 0x10000bdf, 0x400002b7, 0x25f3deb5, 0x60000001, 0x20000b40, 0x60000001, 0x20005e80, 0x60000001, 0x20024900]),
+ (12, 3, 1, -2, 3, 0, 4386) : ('12H', [0x30000d72, 0x10000ea9, 0x40000173, 0x2419083a, 0x60000001, 0x20000f00, 0x60000001, 0x20000c90, 0x60000001, 0x200fa8c0]),
+ (12, 3, -3, 0, 3, 0, 12322) : ('12I', [0x30000887, 0x10000665, 0x4000076c, 0x20cb5b14, 0x60000002, 0x20000f00, 0x60000002, 0x20a2bf40, 0x60000001, 0x20189840]),
+ (12, 2, 6, 0, 10, 0, 34) : ('12J', [0x30001e59, 0x100009b4, 0x4000070d, 0x2b41a86d, 0x60000002, 0x20246a80, 0x60000002, 0x25248d23, 0x60000002, 0x20b80380]),
+ (12, 2, 6, 0, 2, 0, 33) : ('12K', [0x300015a1, 0x10000fed, 0x40000431, 0x293d684a, 0x60000002, 0x202d1e00, 0x60000001, 0x21e84ed2]),
+ (12, 2, 6, 0, -6, 0, 34) : ('12L', [0x30001c42, 0x100000c0, 0x400001e2, 0x2b056bc4, 0x60000001, 0x2016e180, 0x60000002, 0x228c6b16, 0x60000001, 0x215453c0]),
+ (12, 2, 6, 0, -6, 0, 12322) : ('12M', [0x3000105d, 0x10000994, 0x40000436, 0x2aa30582, 0x60000002, 0x202a8a00, 0x60000002, 0x20166b32]),
+ (12, 2, 2, 4, 4, 0, 290) : ('12N', [0x30000fca, 0x1000014c, 0x4000040f, 0x2d03d88c, 0x60000002, 0x20246a80, 0x60000002, 0x2516c073, 0x60000002, 0x21e88e00]),
+ (12, 2, 2, 0, 4, 0, 4385) : ('12O', [0x3000163c, 0x10000b79, 0x4000063d, 0x2bc5daff, 0x60000002, 0x202b2f00, 0x60000002, 0x251747e5, 0x60000002, 0x20b80380]),
+ (12, 2, 2, -4, 4, 0, 290) : ('12P', [0x30001164, 0x100003aa, 0x40000194, 0x29b724c0, 0x60000001, 0x20163c80, 0x60000002, 0x228bb715, 0x60000002]),
+ (12, 2, -2, 4, 6, 0, 4386) : ('12Q', [0x300000b8, 0x1000090d, 0x400000ba, 0x236d1328, 0x60000001, 0x20159780, 0x60000001, 0x20005790, 0x60000002, 0x200a5780]),
+ (12, 2, -2, 0, -2, 0, 290) : ('12R', [0x30001354, 0x10000039, 0x4000068c, 0x2d8c4c07, 0x60000001, 0x2016e180, 0x60000001, 0x25b97793, 0x60000002, 0x200e3580]),
+ (12, 2, -2, -4, 6, 0, 4386) : ('12S', [0x30000083, 0x1000065e, 0x4000033c, 0x210b6f6b, 0x60000001, 0x202dc300, 0x60000001, 0x251d6ae5, 0x60000002, 0x2145d340]),
+ (12, 1, 5, 4, 7, 0, 290) : ('12T', [0x3000133c, 0x10000ca0, 0x4000079a, 0x2e33a004, 0x60000001, 0x201ef000, 0x60000001, 0x21f7bda6]),
+ (12, 1, 5, 0, 3, 0, 4386) : ('12U', [0x300015e4, 0x10000fdd, 0x400006a6, 0x24188434, 0x60000001, 0x201ef000, 0x60000001, 0x25b96c61, 0x60000002, 0x201c5c00]),
+ (12, 1, 5, 0, -1, 0, 290) : ('12V', [0x300000fe, 0x1000020e, 0x40000026, 0x2da825fa, 0x60000002, 0x202d1e00, 0x60000001, 0x20abcda7]),
+ (12, 1, 5, 0, -5, 0, 4385) : ('12W', [0x30001749, 0x10000536, 0x40000216, 0x2d9367cb, 0x60000001, 0x2016e180, 0x60000002, 0x215b9555, 0x60000001]),
+ (12, 1, 5, -4, 7, 0, 290) : ('12X', [0x30001289, 0x10000eb4, 0x400005f3, 0x266a8d8a, 0x60000002, 0x20159780, 0x60000001, 0x20005340, 0x60000002, 0x209db480]),
+ (12, 1, 1, 2, 3, 0, 4386) : ('12Y', [0x30001d1a, 0x10000df1, 0x400007fb, 0x27667cbf, 0x60000001, 0x20163c80, 0x60000002, 0x2516b533, 0x60000002, 0x20b1e400]),
+ (12, 1, 1, -2, 3, 0, 4386) : ('12Z', [0x30000d18, 0x10000af0, 0x400001ad, 0x21dc6e22, 0x60000002, 0x20000780, 0x60000001, 0x20071f40, 0x60000001, 0x2017f340]),
+ (12, 1, -3, 0, 3, 0, 12322) : ('12AA', [0x300014fa, 0x1000032e, 0x400002df, 0x2c600a4f, 0x60000002, 0x201d0100, 0x60000002, 0x25247e35, 0x60000001, 0x20a9dd00]),
+ (12, 1, -3, 0, -1, 0, 33) : ('12AB', [0x30001f10, 0x10000f92, 0x400006e6, 0x2ae25f1d, 0x60000001, 0x2016e180, 0x60000002, 0x25bfe9a4, 0x60000001, 0x20076980]),
+ (12, 0, 12, 1, 0, 0, 12322) : ('12AC', [0x3000179e, 0x100000a6, 0x40000046, 0x2e55c3f7, 0x60000001, 0x20284880, 0x60000001, 0x201c89c2, 0x60000002]),
+ (12, 0, 6, 8, 12, 0, 34) : ('12AQ', [0x30000d29, 0x10000ef2, 0x4000020c, 0x2c899204, 0x60000001, 0x2016e180, 0x60000002, 0x25b97790, 0x60000002, 0x20a9dd00]),
+ (12, 0, 6, 0, 4, 0, 33) : ('12AD', [0x30001ce3, 0x10000069, 0x4000020c, 0x2c899204, 0x60000001, 0x2016e180, 0x60000002, 0x25b97790, 0x60000002, 0x20a9dd00]),
+ (12, 0, 6, 0, -4, 0, 34) : ('12AE', [0x30001f78, 0x10000e0a, 0x400004a2, 0x29db0a94, 0x60000002, 0x201e4b00, 0x60000001, 0x228bba79, 0x60000002]),
+ (12, 0, 4, 1, 0, 0, 4386) : ('12AF', [0x30001336, 0x10000587, 0x400003f2, 0x2d1c7eb8, 0x60000002, 0x2023c580, 0x60000002, 0x20b11de4, 0x60000001]),
+ (12, 0, 2, 4, 6, 0, 4385) : ('12AG', [0x300002b2, 0x100002d6, 0x40000577, 0x26abbb5f, 0x60000002, 0x201d0100, 0x60000002, 0x2334e3d0, 0x60000002, 0x200003c0]),
+ (12, 0, 2, 0, -2, 0, 290) : ('12AH', [0x300001d0, 0x10000018, 0x40000003, 0x246de0d1, 0x60000002, 0x200003c0, 0x60000002, 0x20005ac0, 0x60000002, 0x200a5f00]),
+ (12, 0, 0, 4, 0, 0, 34) : ('12AI', [0x3000112c, 0x10000df1, 0x4000076b, 0x2be7c35d, 0x60000002, 0x201da600, 0x60000002, 0x25bfde73, 0x60000001, 0x20a9d940]),
+ (12, 0, 0, 4, 0, 0, 12322) : ('12AJ', [0x3000014e, 0x10000c44, 0x4000067e, 0x2640b647, 0x60000001, 0x201548c0, 0x60000002, 0x20071fa0, 0x60000001, 0x200ab540]),
+ (12, 0, 0, 0, 0, 0, 34) : ('12AK', [0x30001a58, 0x1000062b, 0x4000026e, 0x2ae7e825, 0x60000002, 0x202b2f00, 0x60000002, 0x20a4dc1a, 0x60000001]),
+ (12, 0, 0, 0, 0, 0, 802) : ('12AL', [0x30000e91, 0x100007ce, 0x40000628, 0x2aa1ef88, 0x60000002, 0x201e4b00, 0x60000001, 0x2154a3d2, 0x60000002]),
+ (12, 0, 0, 0, 0, 0, 12322) : ('12AM', [0x30000b1a, 0x10000d39, 0x400004f2, 0x2df187a9, 0x60000002, 0x20000f00, 0x60000001, 0x20071c10, 0x60000001, 0x200873c0]),
+ (12, 0, -2, 4, 0, 0, 4386) : ('12AN', [0x300012c8, 0x100005ff, 0x40000751, 0x2bb23e91, 0x60000001, 0x20163c80, 0x60000002, 0x214d909b, 0x60000002]),
+ (12, 0, -2, 0, 0, 0, 290) : ('12AO', [0x3000193c, 0x1000072d, 0x4000057a, 0x297d4dd3, 0x60000002, 0x201e4b00, 0x60000001, 0x25b97b65, 0x60000002, 0x20a2c240]),
+ (12, 0, -4, 1, 0, 0, 4385) : ('12AP', [0x30001cfc, 0x10000a72, 0x400006ff, 0x2d349c69, 0x60000001, 0x201c5c00, 0x60000001, 0x20a2c6f0, 0x60000002, 0x209cf900]),
+ (13, 2, -2, -1, 0, 0, 0) : ('13A', [0x30001d4e, 0x10000e41, 0x4000039f, 0x2c0125ef, 0x60000001, 0x2016e180, 0x60000002, 0x20021202]),
+ (14, 4, -4, 1, 0, 0, 12322) : ('14A', [0x300012bc, 0x100004ce, 0x4000023f, 0x2811e153, 0x60000001, 0x20284880, 0x60000001, 0x265b8d30, 0x60000001, 0x20b1ef40]),
+ (14, 3, 3, 0, 5, 0, 33) : ('14B', [0x300002ed, 0x10000912, 0x40000156, 0x24b7e5ef, 0x60000002, 0x201e4b00, 0x60000001, 0x2003f6d7, 0x60000002]),
+ (14, 3, 3, 0, -3, 0, 34) : ('14C', [0x30000d42, 0x10000a38, 0x400003f2, 0x2af28248, 0x60000002, 0x2027a380, 0x60000001, 0x251dd040, 0x60000002, 0x20a314c0]),
+ (14, 3, 3, -8, 21, 0, 12322) : ('14D', [0x3000052f, 0x1000019e, 0x400003b3, 0x2677aae4, 0x60000002, 0x201e4b00, 0x60000001, 0x20241956, 0x60000001]),
+ (14, 1, 3, 4, 5, 0, 4385) : ('14E', [0x300002ff, 0x10000464, 0x400001de, 0x2a455c4d, 0x60000001, 0x202dc300, 0x60000001, 0x25b968a3, 0x60000002, 0x20005dc0]),
+ (14, 1, 3, 0, 1, 0, 290) : ('14F', [0x30000996, 0x1000069f, 0x400000c7, 0x2a3fdf9f, 0x60000001, 0x2016e180, 0x60000001, 0x20165448, 0x60000001]),
+ (14, 1, 3, -4, 5, 0, 4386) : ('14G', [0x30001aae, 0x10000496, 0x40000502, 0x208234f8, 0x60000002, 0x20000f00, 0x60000002, 0x20005730, 0x60000002, 0x20561300]),
+ (15, 3, 3, 1, 0, 0, 0) : ('15A', [0x30001626, 0x10000c8f, 0x4000066b, 0x2044e637, 0x60000001, 0x2016e180, 0x60000001, 0x229ad1e9]),
+ (15, 2, 2, 2, 2, 0, 0) : ('15B', [0x300013b0, 0x1000097a, 0x400004b3, 0x2dc7f72d, 0x60000001, 0x20163c80, 0x60000002, 0x21473180, 0x60000001]),
+ (15, 2, -2, -1, 0, 0, 0) : ('15C', [0x30000b62, 0x1000061c, 0x4000057c, 0x2c7e82cf, 0x60000002, 0x201d0100, 0x60000002, 0x2146edc8, 0x60000002]),
+ (15, 1, 1, 4, 3, 0, 0) : ('15D', [0x30001e81, 0x10000ad3, 0x400002a8, 0x2acde4be, 0x60000001, 0x200003c0, 0x60000002, 0x20a2c720, 0x60000002, 0x203abd80]),
+ (15, 0, 0, 1, 0, 0, 0) : ('15E', [0x30000904, 0x100005c5, 0x400004f6, 0x2deae1f2, 0x60000001, 0x202dc300, 0x60000001, 0x228bd4d6, 0x60000001, 0x20071ac0]),
+ (16, 4, 0, 0, 0, 0, 12322) : ('16A', [0x3000102f, 0x10000e86, 0x400007ed, 0x2a7d7903, 0x60000001, 0x201c5c00, 0x60000002, 0x20005ee0, 0x60000001, 0x209eef80]),
+ (16, 2, 4, 0, 4, 0, 34) : ('16B', [0x300013c9, 0x10000092, 0x400003dd, 0x2110f5b5, 0x60000002, 0x20000f00, 0x60000001, 0x200004e0, 0x60000001, 0x20098580]),
+ (16, 2, 4, 0, 0, 0, 34) : ('16C', [0x30001a67, 0x100000ab, 0x40000127, 0x259bc154, 0x60000001, 0x20000f00, 0x60000002, 0x20005790, 0x60000002, 0x209dfbc0]),
+ (16, 2, 4, 0, -4, 0, 34) : ('16D', [0x300014b1, 0x100005e2, 0x400000ef, 0x2ba1ad6d, 0x60000001, 0x201ef000, 0x60000001, 0x20001e30]),
+ (16, 2, 0, 2, 2, 0, 4386) : ('16E', [0x30001244, 0x10000fd7, 0x40000588, 0x2c2ee954, 0x60000002, 0x20246a80, 0x60000002, 0x21e84783, 0x60000002]),
+ (16, 2, 0, 0, -2, 0, 290) : ('16F', [0x30000295, 0x1000050c, 0x4000009f, 0x2a1cf3d9, 0x60000002, 0x20071e80, 0x60000002, 0x20b0edd0, 0x60000001]),
+ (16, 2, 0, -2, 2, 0, 4386) : ('16G', [0x30000829, 0x10000605, 0x40000296, 0x29142fb5, 0x60000002, 0x202d1e00, 0x60000001, 0x20aa46b0, 0x60000001]),
+ (16, 0, 8, 0, 0, 0, 12322) : ('16H', [0x30001826, 0x10000145, 0x400006ec, 0x2397ca4f, 0x60000002, 0x20000b40, 0x60000002, 0x20001020, 0x60000002, 0x203492c0]),
+ (16, 0, 4, 2, 2, 0, 4386) : ('16I', [0x30000f02, 0x10000b5b, 0x4000032d, 0x21dfdf38, 0x60000002, 0x2023c580, 0x60000002, 0x228bc976, 0x60000001, 0x21f6bfc0]),
+ (16, 0, 4, 0, -2, 0, 290) : ('16J', [0x30000c4d, 0x100001ec, 0x40000188, 0x237338e1, 0x60000001, 0x2016e180, 0x60000001, 0x25249866, 0x60000002, 0x20a31100]),
+ (16, 0, 0, 0, 0, 0, 34) : ('16K', [0x30001932, 0x1000036e, 0x400001eb, 0x25e42a59, 0x60000002, 0x20159780, 0x60000001, 0x200008a0, 0x60000002, 0x20644100]),
+ (16, 0, 0, 0, 0, 0, 12322) : ('16L', [0x3000179f, 0x10000013, 0x400002bf, 0x22b06837, 0x60000002, 0x20159780, 0x60000002, 0x20000510, 0x60000001, 0x2063a740]),
+ (18, 3, 3, 0, 1, 0, 33) : ('18A', [0x30001d6e, 0x10000065, 0x400005a6, 0x255402a7, 0x60000001, 0x201ef000, 0x60000001, 0x20c6dcc1, 0x60000001]),
+ (18, 3, 3, -4, 9, 0, 12322) : ('18B', [0x300011db, 0x10000372, 0x400000d9, 0x2118634b, 0x60000001, 0x201ef000, 0x60000001, 0x20b0f894]),
+ (18, 3, -3, 1, 0, 0, 12322) : ('18C', [0x3000103b, 0x10000be4, 0x400006a9, 0x2669869f, 0x60000001, 0x20163c80, 0x60000002, 0x2000d2b6]),
+ (18, 2, 0, 2, 0, 0, 4386) : ('18D', [0x3000096d, 0x10000d73, 0x400004f6, 0x24fcf5f4, 0x60000002, 0x202d1e00, 0x60000001, 0x2010d34a]),
+ (18, 2, 0, -2, 0, 0, 4385) : ('18E', [0x3000029e, 0x100009fb, 0x400001e8, 0x2a3bf732, 0x60000001, 0x20284880, 0x60000001, 0x20b0f1b0, 0x60000002]),
+ (18, 1, 3, 2, 3, 0, 4385) : ('18F', [0x30001109, 0x1000030f, 0x40000667, 0x22e58e86, 0x60000001, 0x201ef000, 0x60000001, 0x251d6ae0, 0x60000001]),
+ (18, 1, 3, -2, 3, 0, 4386) : ('18G', [0x30001efe, 0x10000901, 0x4000037d, 0x2b225c6a, 0x60000002, 0x2027a380, 0x60000001, 0x25242f91, 0x60000002, 0x20072240]),
+ (18, 1, -3, 1, 0, 0, 4386) : ('18H', [0x30000cd5, 0x10000618, 0x4000028f, 0x287ae1a7, 0x60000002, 0x201da600, 0x60000002, 0x20009631, 0x60000002]),
+ (18, 1, -3, -1, 0, 0, 4385) : ('18I', [0x300003a2, 0x10000d22, 0x400002e0, 0x294d29f0, 0x60000002, 0x20246a80, 0x60000002, 0x20a3a012, 0x60000001]),
+ (18, 0, 0, 2, 0, 0, 12322) : ('18J', [0x3000109e, 0x100008c3, 0x400002f2, 0x285c4745, 0x60000002, 0x202d1e00, 0x60000001, 0x20c74183]),
+ (20, 4, 4, 0, -4, 0, 12322) : ('20A', [0x30000a47, 0x10000ca5, 0x4000000a, 0x245750eb, 0x60000001, 0x20284880, 0x60000001, 0x20b20e60, 0x60000001]),
+ (20, 3, -1, 0, 1, 0, 12322) : ('20B', [0x30001243, 0x10000bc7, 0x40000322, 0x2290f1a5, 0x60000002, 0x20154500, 0x60000001, 0x20000840, 0x60000002, 0x20012c00]),
+ (20, 2, 4, 0, 2, 0, 34) : ('20C', [0x30000a8e, 0x10000736, 0x400006ab, 0x205570c5, 0x60000002, 0x201548c0, 0x60000001, 0x20a2ca80, 0x60000002, 0x209f9fc0]),
+ (20, 2, 4, 0, -2, 0, 33) : ('20D', [0x30001430, 0x10000a6e, 0x400003cb, 0x2bb1dd4a, 0x60000002, 0x2027a380, 0x60000001, 0x20aa06d6]),
+ (20, 2, 2, 1, 0, 0, 4386) : ('20E', [0x30000475, 0x10000b4b, 0x40000388, 0x2cef3a3d, 0x60000002, 0x201e4b00, 0x60000001, 0x25b973d2, 0x60000002, 0x20aa2800]),
+ (20, 2, 2, -1, 0, 0, 4386) : ('20F', [0x3000173f, 0x1000036c, 0x40000795, 0x25d3b174, 0x60000002, 0x202d1e00, 0x60000001, 0x21fd81c5, 0x60000001]),
+ (20, 1, 3, 2, 1, 0, 290) : ('20G', [0x30000e78, 0x10000f97, 0x4000028d, 0x2bed8dd9, 0x60000002, 0x201d0100, 0x60000002, 0x21e94c24, 0x60000001]),
+ (20, 1, 3, 0, 1, 0, 4386) : ('20H', [0x30000581, 0x10000c4b, 0x400003f7, 0x23d46b13, 0x60000002, 0x201d0100, 0x60000002, 0x25249866, 0x60000002, 0x200ed300]),
+ (20, 1, 3, -2, 1, 0, 290) : ('20I', [0x30000711, 0x10000378, 0x400006be, 0x218b7f22, 0x60000001, 0x201548c0, 0x60000001, 0x20a2ca80, 0x60000002, 0x200891c0]),
+ (20, 1, -1, 0, 1, 0, 12322) : ('20J', [0x30001729, 0x10000bfd, 0x40000168, 0x297dd176, 0x60000002, 0x201da600, 0x60000002, 0x23358c94, 0x60000002, 0x200003c0]),
+ (20, 0, 6, 1, 0, 0, 12322) : ('20K', [0x30000d1d, 0x10000e67, 0x40000448, 0x2957e8cd, 0x60000001, 0x20163c80, 0x60000002, 0x228d0533, 0x60000002, 0x21eff780]),
+ (20, 0, 4, 4, 4, 0, 34) : ('20L', [0x30000b8f, 0x10000765, 0x4000011d, 0x21f97dd8, 0x60000001, 0x20163c80, 0x60000002, 0x21e8c35a, 0x60000001]),
+ (20, 0, 4, 0, 0, 0, 33) : ('20M', [0x300019a9, 0x10000a6f, 0x40000095, 0x29a38134, 0x60000002, 0x20000b40, 0x60000002, 0x20a2bf40, 0x60000002, 0x209ccfc0]),
+ (20, 0, 4, 0, -4, 0, 34) : ('20N', [0x300018f4, 0x10000097, 0x4000033b, 0x2647f59f, 0x60000002, 0x2027a380, 0x60000001, 0x2145e6e7, 0x60000002]),
+ (20, 0, 0, 0, -2, 0, 802) : ('20O', [0x30001199, 0x10000676, 0x40000569, 0x2797b732, 0x60000001, 0x200003c0, 0x60000002, 0x20005eb0, 0x60000002, 0x2016a580]),
+ (20, 0, -4, 4, 0, 0, 12322) : ('20P', [0x3000191b, 0x100004ae, 0x40000283, 0x2a81f09c, 0x60000002, 0x201e4b00, 0x60000001, 0x2016b667, 0x60000002]),
+ (20, 0, -4, 0, 0, 0, 34) : ('20Q', [0x30001baa, 0x1000037c, 0x40000701, 0x24c6bc4d, 0x60000002, 0x201548c0, 0x60000002, 0x20005b50, 0x60000001, 0x200a6680]),
+ (21, 2, 2, 1, 0, 0, 0) : ('21A', [0x30001c4c, 0x10000651, 0x40000535, 0x2256f8f5, 0x60000002, 0x201da600, 0x60000002, 0x20073952, 0x60000001]),
+ (21, 1, -1, -1, 0, 0, 0) : ('21B', [0x30000f0f, 0x10000430, 0x400004a4, 0x29d6eda3, 0x60000002, 0x2023c580, 0x60000002, 0x20b216b7, 0x60000002]),
+ (21, 0, 0, 2, 0, 0, 0) : ('21C', [0x30001f33, 0x100006d5, 0x400000b2, 0x252adb19, 0x60000002, 0x2027a380, 0x60000001, 0x228b18d2]),
+ (22, 2, 2, 0, 2, 0, 33) : ('22A', [0x30001ea4, 0x10000092, 0x40000019, 0x279b95e8, 0x60000001, 0x20000b40, 0x60000002, 0x20a2c6c0, 0x60000002, 0x209d4f40]),
+ (22, 2, 2, 0, -2, 0, 34) : ('22B', [0x30001037, 0x10000236, 0x40000753, 0x22fd2edf, 0x60000001, 0x201ef000, 0x60000001, 0x25174427, 0x60000002, 0x20005280]),
+ (22, 2, 2, -4, 6, 0, 12322) : ('22C', [0x30000813, 0x100006b1, 0x40000524, 0x21828cbb, 0x60000002, 0x202d1e00, 0x60000001, 0x200168d0, 0x60000002]),
+ (22, 0, 2, 0, 0, 0, 802) : ('22D', [0x30000a07, 0x10000661, 0x400002e5, 0x25d37a29, 0x60000002, 0x2023c580, 0x60000002, 0x20a2c348]),
+ (23, 1, 1, 2, 1, 0, 0) : ('23A', [0x30000f1f, 0x1000048c, 0x400000d3, 0x253eb742, 0x60000002, 0x20000780, 0x60000002, 0x20a2cab0, 0x60000001, 0x20130ec0]),
+ (24, 3, 1, 0, -1, 0, 12322) : ('24A', [0x30001a42, 0x10000915, 0x4000062f, 0x23f5596f, 0x60000002, 0x20154500, 0x60000002, 0x20000c30, 0x60000001, 0x200e4840]),
+ (24, 2, 2, 0, 0, 0, 34) : ('24B', [0x30001260, 0x10000903, 0x400004d1, 0x2648b83d, 0x60000002, 0x20163c80, 0x60000001, 0x214df991, 0x60000001]),
+ (24, 2, 2, 0, -4, 0, 12322) : ('24C', [0x300003f7, 0x10000947, 0x40000723, 0x23984b84, 0x60000002, 0x20246a80, 0x60000002, 0x2162ec85]),
+ (24, 2, 0, 1, 0, 0, 4386) : ('24D', [0x300009d9, 0x1000075a, 0x40000578, 0x211d9e8a, 0x60000002, 0x202d1e00, 0x60000001, 0x21e9b4a3, 0x60000001]),
+ (24, 2, 0, -1, 0, 0, 4386) : ('24E', [0x3000183c, 0x100008da, 0x40000028, 0x249712e6, 0x60000001, 0x20163c80, 0x60000002, 0x215b7528, 0x60000002]),
+ (24, 2, -2, 0, 2, 0, 12322) : ('24F', [0x30001f7b, 0x10000363, 0x4000037b, 0x2d9d7d35, 0x60000002, 0x20163c80, 0x60000001, 0x215b3003, 0x60000001]),
+ (24, 1, 5, 0, -1, 0, 12322) : ('24G', [0x30000bef, 0x10000481, 0x400003fb, 0x2c9bb7c8, 0x60000001, 0x20000f00, 0x60000002, 0x20005760, 0x60000002, 0x2034da00]),
+ (24, 1, 1, 2, 1, 0, 290) : ('24H', [0x300011d2, 0x10000bbc, 0x4000031d, 0x2caef865, 0x60000001, 0x2016e180, 0x60000002, 0x251d7260, 0x60000001, 0x20071700]),
+ (24, 1, 1, 0, 1, 0, 290) : ('24I', [0x30001f62, 0x10000380, 0x400007ef, 0x2c6e4087, 0x60000001, 0x20159780, 0x60000001, 0x20a2bfa0, 0x60000002, 0x200f3fc0]),
+ (24, 1, 1, 0, -1, 0, 4385) : ('24J', [0x30001328, 0x100000fd, 0x400003ed, 0x2e3c4dc4, 0x60000001, 0x2016e180, 0x60000002, 0x20ab8dd2, 0x60000001]),
+ (24, 1, 1, 0, -1, 0, 4386) : ('24K', [0x30001691, 0x10000d90, 0x4000025b, 0x2cc48b46, 0x60000002, 0x201da600, 0x60000002, 0x25c03116, 0x60000001, 0x200e8440]),
+ (24, 1, 1, 0, -1, 0, 12322) : ('24L', [0x30000d75, 0x10000004, 0x400002b8, 0x230d73ad, 0x60000002, 0x201548c0, 0x60000001, 0x20072300, 0x60000002, 0x204f59c0]),
+ (24, 1, 1, -2, 1, 0, 290) : ('24M', [0x3000125f, 0x10000669, 0x4000037c, 0x2b5e96b0, 0x60000001, 0x202dc300, 0x60000001, 0x228d9b91, 0x60000001, 0x2023c940]),
+ (24, 0, 6, 0, 0, 0, 12322) : ('24N', [0x30001c80, 0x10000de4, 0x4000068b, 0x2b7ad1d5, 0x60000001, 0x2016e180, 0x60000002, 0x22928a23, 0x60000001, 0x20071700]),
+ (24, 0, 4, 1, 0, 0, 4386) : ('24O', [0x30001c16, 0x10000b5e, 0x4000000e, 0x26c953a9, 0x60000002, 0x20154500, 0x60000001, 0x20a2c6c0, 0x60000002, 0x200f4740]),
+ (24, 0, 2, 2, 2, 0, 4386) : ('24P', [0x300010cb, 0x10000aab, 0x4000057e, 0x21f47faa, 0x60000001, 0x20154500, 0x60000001, 0x20a2c750, 0x60000002, 0x20242e80]),
+ (24, 0, 2, 0, 2, 0, 34) : ('24Q', [0x300004c1, 0x10000073, 0x4000033d, 0x24b93e89, 0x60000002, 0x2023c580, 0x60000002, 0x20aa1207]),
+ (24, 0, 2, 0, -2, 0, 34) : ('24R', [0x300016ab, 0x10000cab, 0x40000156, 0x251690fc, 0x60000002, 0x20246a80, 0x60000002, 0x20b8d33a]),
+ (24, 0, 2, 0, -2, 0, 290) : ('24S', [0x30000622, 0x100002e2, 0x400007fb, 0x2b261d7f, 0x60000001, 0x242dec00, 0x60000001, 0x2ab583b0, 0x60000001]),
+ (24, 0, 0, 2, 0, 0, 34) : ('24T', [0x30001534, 0x10000d57, 0x4000032a, 0x26ac3e70, 0x60000002, 0x201c5c00, 0x60000001, 0x20005370, 0x60000002, 0x202bee40]),
+ (24, 0, 0, 2, 0, 0, 12322) : ('24U', [0x30000c84, 0x10000380, 0x40000631, 0x26f4728f, 0x60000001, 0x2016e180, 0x60000002, 0x229418d7, 0x60000001, 0x200003c0]),
+ (24, 0, 0, 1, 0, 0, 4385) : ('24V', [0x30000d70, 0x10000d56, 0x40000255, 0x2b0ace15, 0x60000002, 0x202a8a00, 0x60000002, 0x21f6c4e4, 0x60000002]),
+ (24, 0, 0, 1, 0, 0, 12322) : ('24W', [0x300009d9, 0x10000786, 0x4000059a, 0x2241e4f1, 0x60000001, 0x201ef000, 0x60000001, 0x23d0a166, 0x60000001, 0x20bf6d00]),
+ (24, 0, 0, 0, 0, 0, 34) : ('24X', [0x300001c3, 0x100006e5, 0x40000498, 0x23ed008b, 0x60000001, 0x20163c80, 0x60000002, 0x20b103d4]),
+ (24, 0, 0, 0, 0, 0, 12322) : ('24Y', [0x30001f7f, 0x10000b7b, 0x4000007d, 0x24085ade, 0x60000002, 0x20000b40, 0x60000002, 0x20001050, 0x60000002, 0x202ccb80]),
+ (24, 0, -2, 2, 0, 0, 4386) : ('24Z', [0x3000135a, 0x100007f8, 0x400005c2, 0x2dc64a87, 0x60000002, 0x2023c580, 0x60000002, 0x215be121, 0x60000002]),
+ (24, 0, -2, 0, 0, 0, 34) : ('24AA', [0x30000aae, 0x1000062e, 0x40000033, 0x200bb701, 0x60000001, 0x20159780, 0x60000001, 0x20a2c750, 0x60000001, 0x209e4e40]),
+ (24, 0, -2, 0, 0, 0, 290) : ('24AB', [0x30000e62, 0x10000657, 0x4000037d, 0x2e8bc438, 0x60000001, 0x2016e180, 0x60000002, 0x251d7d92, 0x60000001, 0x20a36740]),
+ (26, 2, -2, 1, 0, 0, 12322) : ('26A', [0x300018a1, 0x10000a5a, 0x40000624, 0x20e03a33, 0x60000002, 0x200003c0, 0x60000001, 0x20072330, 0x60000001, 0x2000e4c0]),
+ (28, 3, 3, 0, -3, 0, 12322) : ('28A', [0x30000670, 0x10000f7f, 0x40000691, 0x2d48a130, 0x60000002, 0x202d1e00, 0x60000001, 0x2145a718]),
+ (28, 1, 3, 0, 1, 0, 33) : ('28B', [0x300006ab, 0x100008db, 0x400002b1, 0x279ddf62, 0x60000002, 0x20163c80, 0x60000001, 0x252490e2, 0x60000002, 0x20b80380]),
+ (28, 1, 3, 0, 1, 0, 34) : ('28C', [0x30001543, 0x1000075b, 0x40000474, 0x284b5a80, 0x60000002, 0x201e4b00, 0x60000001, 0x265c3643, 0x60000002, 0x20000b40]),
+ (28, 1, 3, 0, -3, 0, 34) : ('28D', [0x30001c19, 0x10000d6d, 0x40000274, 0x28520820, 0x60000002, 0x2027a380, 0x60000001, 0x25b92cd0, 0x60000001, 0x201c5c00]),
+ (28, 1, 3, 0, -3, 0, 12322) : ('28E', [0x3000050c, 0x100002d7, 0x40000051, 0x2cdd53c2, 0x60000001, 0x20159780, 0x60000002, 0x20071be0, 0x60000001, 0x20246e40]),
+ (28, 1, -1, 2, 1, 0, 4386) : ('28F', [0x30000f1e, 0x100006d0, 0x4000055b, 0x2e65f8db, 0x60000002, 0x202d1e00, 0x60000001, 0x25bfe5d4, 0x60000002, 0x200e31c0]),
+ (28, 1, -1, 0, -1, 0, 290) : ('28G', [0x3000108b, 0x1000078d, 0x4000076a, 0x299cfe73, 0x60000002, 0x202a8a00, 0x60000002, 0x25bfdaa1, 0x60000002, 0x20a2c240]),
+ (28, 1, -1, -2, 1, 0, 4386) : ('28H', [0x30000add, 0x1000037c, 0x40000416, 0x2977af1f, 0x60000002, 0x201548c0, 0x60000002, 0x20005b50, 0x60000001, 0x20a0de80]),
+ (28, 0, 4, 1, 0, 0, 12322) : ('28I', [0x30000d95, 0x10000622, 0x40000443, 0x26bef2c9, 0x60000002, 0x20246a80, 0x60000002, 0x2016ba26, 0x60000002]),
+ (30, 3, 3, -1, 0, 0, 12322) : ('30A', [0x30001ec0, 0x10000f3a, 0x4000067a, 0x295c535d, 0x60000002, 0x202a8a00, 0x60000002, 0x20b8b645]),
+ (30, 2, 2, 0, 0, 0, 33) : ('30B', [0x300013ce, 0x10000b34, 0x400000b3, 0x2be4abd6, 0x60000002, 0x20000f00, 0x60000001, 0x20164190]),
+ (30, 2, 2, -2, 2, 0, 12322) : ('30C', [0x30001f5e, 0x10000b5e, 0x40000307, 0x2e21f4d1, 0x60000001, 0x201ef000, 0x60000001, 0x215bca43]),
+ (30, 2, -2, 1, 0, 0, 12322) : ('30D', [0x300011c2, 0x10000d9b, 0x400004af, 0x2bbb6f46, 0x60000002, 0x201da600, 0x60000002, 0x20acd4d4, 0x60000001]),
+ (30, 1, 3, 1, 0, 0, 4385) : ('30E', [0x30001580, 0x100000b8, 0x40000634, 0x221c4861, 0x60000001, 0x200003c0, 0x60000002, 0x20a2bfd0, 0x60000002, 0x2047dd80]),
+ (30, 1, 3, -1, 0, 0, 4386) : ('30F', [0x300007ce, 0x100007de, 0x40000010, 0x252f5d48, 0x60000002, 0x2023c580, 0x60000002, 0x20b8a9fd, 0x60000001]),
+ (30, 1, 1, 2, 1, 0, 4385) : ('30G', [0x30000581, 0x100000de, 0x40000043, 0x27ed067c, 0x60000002, 0x201c5c00, 0x60000002, 0x20005b50, 0x60000001, 0x202b05c0]),
+ (30, 1, 1, 0, 3, 0, 33) : ('30H', [0x30000fe2, 0x1000094c, 0x40000089, 0x25b02b11, 0x60000002, 0x2027a380, 0x60000001, 0x20b9530c, 0x60000002]),
+ (30, 1, 1, 0, -1, 0, 34) : ('30I', [0x300007e4, 0x100007c7, 0x4000023e, 0x237ea202, 0x60000002, 0x201c5c00, 0x60000001, 0x20c64680]),
+ (30, 1, 1, -2, 1, 0, 4386) : ('30J', [0x30000c6b, 0x10000392, 0x40000142, 0x29a7e418, 0x60000002, 0x201d0100, 0x60000002, 0x251d8154, 0x60000001, 0x21e83f40]),
+ (30, 1, 1, -4, 3, 0, 12322) : ('30K', [0x3000018d, 0x10000e58, 0x40000235, 0x2ac9a1cb, 0x60000001, 0x20154500, 0x60000001, 0x20a2cae0, 0x60000001, 0x200f8700]),
+ (30, 0, 2, 2, 2, 0, 4385) : ('30L', [0x30000457, 0x10000c81, 0x400004e2, 0x22d3e0fc, 0x60000001, 0x20163c80, 0x60000002, 0x21547315]),
+ (30, 0, 2, 2, 2, 0, 4386) : ('30M', [0x30001d73, 0x10000cbb, 0x4000070a, 0x2606d9df, 0x60000002, 0x201da600, 0x60000002, 0x2007fc88, 0x60000001]),
+ (30, 0, 2, 0, 0, 0, 290) : ('30N', [0x30001ab4, 0x10000e5e, 0x40000487, 0x2b732e08, 0x60000002, 0x20163c80, 0x60000001, 0x20155896, 0x60000002]),
+ (30, 0, 0, 1, 0, 0, 12322) : ('30O', [0x3000180b, 0x10000bd7, 0x40000429, 0x2b0f8b3f, 0x60000002, 0x20163c80, 0x60000001, 0x20a2ce13, 0x60000002]),
+ (32, 2, 0, 0, 0, 0, 12322) : ('32A', [0x30001fbb, 0x10000cc9, 0x4000053a, 0x28be9181, 0x60000001, 0x201ef000, 0x60000001, 0x200070b3]),
+ (32, 0, 4, 0, 0, 0, 12322) : ('32B', [0x30001fee, 0x1000027a, 0x40000465, 0x28e3d553, 0x60000001, 0x2016e180, 0x60000001, 0x2516aa01, 0x60000002, 0x20a2c240]),
+ (33, 1, -1, -1, 0, 0, 0) : ('33A', [0x300010f2, 0x10000938, 0x400001b4, 0x26061310, 0x60000002, 0x201da600, 0x60000002, 0x21546c8b, 0x60000002]),
+ (35, 1, 1, 1, 0, 0, 0) : ('35A', [0x300016f7, 0x100000c1, 0x40000335, 0x28de9b9b, 0x60000001, 0x2016e180, 0x60000001, 0x21f0a29c, 0x60000001]),
+ (36, 3, 3, 0, -3, 0, 12322) : ('36A', [0x30000e97, 0x10000dda, 0x40000302, 0x2cb8be0e, 0x60000002, 0x202d1e00, 0x60000001, 0x2516a642, 0x60000002, 0x20b1e400]),
+ (36, 2, 0, 0, 0, 0, 12322) : ('36B', [0x30000280, 0x1000073e, 0x400001d5, 0x248769c8, 0x60000002, 0x2027a380, 0x60000001, 0x21fe9843]),
+ (36, 1, 3, 0, -1, 0, 33) : ('36C', [0x300007db, 0x10000475, 0x400007cc, 0x24269904, 0x60000002, 0x202a8a00, 0x60000002, 0x232e3995, 0x60000002, 0x200003c0]),
+ (36, 1, 1, 1, 0, 0, 4386) : ('36D', [0x30001d35, 0x10000e62, 0x400001f6, 0x2c26a105, 0x60000002, 0x201e4b00, 0x60000001, 0x20a9e555]),
+ (36, 1, 1, -1, 0, 0, 4386) : ('36E', [0x3000089e, 0x100001f8, 0x400007df, 0x25eb1e75, 0x60000002, 0x201c5c00, 0x60000001, 0x20071bb0, 0x60000002, 0x201f5540]),
+ (36, 0, 0, 0, 0, 0, 12322) : ('36F', [0x30000d46, 0x10000570, 0x40000034, 0x269f9457, 0x60000002, 0x202a8a00, 0x60000002, 0x2516b8f3, 0x60000001, 0x21e83f40]),
+ (39, 1, 1, 1, 0, 0, 0) : ('39A', [0x30001709, 0x10000d5a, 0x40000359, 0x20fd663d, 0x60000002, 0x201da600, 0x60000002, 0x252449c4, 0x60000001, 0x20a36380]),
+ (40, 1, 3, 0, -1, 0, 12322) : ('40A', [0x30001db2, 0x1000069a, 0x400003ae, 0x2e489924, 0x60000002, 0x20246a80, 0x60000002, 0x25bff125, 0x60000002, 0x20000f00]),
+ (40, 0, 4, 0, 0, 0, 12322) : ('40B', [0x3000009c, 0x10000a99, 0x40000734, 0x25c1deec, 0x60000002, 0x202d1e00, 0x60000001, 0x265c23a2, 0x60000001, 0x2153ab00]),
+ (40, 0, 2, 1, 0, 0, 4386) : ('40C', [0x30001ca9, 0x10000a0c, 0x4000055d, 0x24ec4bcd, 0x60000001, 0x20159780, 0x60000001, 0x20005ee0, 0x60000002, 0x200120c0]),
+ (40, 0, 0, 2, 2, 0, 34) : ('40D', [0x30000e39, 0x10000d0d, 0x400007d7, 0x251cdb17, 0x60000001, 0x20159780, 0x60000002, 0x200053d0, 0x60000001, 0x202bf5c0]),
+ (40, 0, 0, 0, 0, 0, 33) : ('40E', [0x30000808, 0x1000006c, 0x40000023, 0x207d95fc, 0x60000002, 0x20000f00, 0x60000002, 0x20a2c720, 0x60000002, 0x2026b740]),
+ (42, 2, 2, -1, 0, 0, 12322) : ('42A', [0x30000366, 0x10000037, 0x40000483, 0x21bea98e, 0x60000001, 0x20000b40, 0x60000002, 0x20a2bfa0, 0x60000002, 0x200e3d00]),
+ (42, 1, -1, 1, 0, 0, 12322) : ('42B', [0x30000b59, 0x10000472, 0x40000002, 0x2bed8c6b, 0x60000002, 0x201da600, 0x60000002, 0x228d9f65, 0x60000002, 0x20163c80]),
+ (42, 0, 0, 2, 0, 0, 12322) : ('42C', [0x30001159, 0x10000a74, 0x40000165, 0x259d8c0b, 0x60000002, 0x201da600, 0x60000002, 0x25b92180, 0x60000002, 0x20a2be80]),
+ (42, 0, 0, 0, 0, 0, 34) : ('42D', [0x3000093c, 0x1000003b, 0x40000644, 0x25fbdd5a, 0x60000002, 0x202b2f00, 0x60000002, 0x251dbd92, 0x60000002, 0x20072240]),
+ (44, 2, 2, 0, -2, 0, 12322) : ('44A', [0x30001b39, 0x1000023a, 0x4000039e, 0x2e55b108, 0x60000001, 0x201c5c00, 0x60000001, 0x20a2c6f0, 0x60000001, 0x20a12980]),
+ (44, 0, 2, 2, 0, 0, 34) : ('44B', [0x30001861, 0x10000f3c, 0x40000646, 0x245b0a5a, 0x60000002, 0x202b2f00, 0x60000002, 0x25b964f7, 0x60000001, 0x21ef5280]),
+ (46, 1, 1, 0, 1, 0, 33) : ('46A', [0x30000a05, 0x1000022d, 0x4000044f, 0x25d3f408, 0x60000002, 0x201da600, 0x60000002, 0x23d146db]),
+ (46, 1, 1, 0, -1, 0, 34) : ('46B', [0x30000e2f, 0x1000049d, 0x400005cc, 0x28251a8a, 0x60000002, 0x202d1e00, 0x60000001, 0x232e392b, 0x60000002]),
+ (46, 1, 1, -2, 1, 0, 12322) : ('46C', [0x30001050, 0x10000f84, 0x4000042b, 0x2c50c969, 0x60000001, 0x20284880, 0x60000001, 0x20006d90]),
+ (48, 0, 2, 0, 0, 0, 12322) : ('48A', [0x30000765, 0x10000e9e, 0x40000481, 0x225415a1, 0x60000001, 0x201ef000, 0x60000001, 0x201d3745, 0x60000001]),
+ (52, 0, 2, 1, 0, 0, 12322) : ('52A', [0x30001bf8, 0x10000ad0, 0x400004c8, 0x234594da, 0x60000001, 0x2016e180, 0x60000002, 0x21e87bf7, 0x60000002]),
+ (56, 1, -1, 0, 1, 0, 12322) : ('56A', [0x30000ba1, 0x10000432, 0x4000006f, 0x27f4de57, 0x60000001, 0x20163c80, 0x60000002, 0x216252f8, 0x60000001]),
+ (56, 0, 0, 1, 0, 0, 12322) : ('56B', [0x30001195, 0x1000046f, 0x4000072b, 0x2a8b5e1c, 0x60000002, 0x2023c580, 0x60000002, 0x214d1804, 0x60000001]),
+ (60, 2, 2, 0, -2, 0, 12322) : ('60A', [0x30001dbe, 0x100008e7, 0x40000267, 0x26db0571, 0x60000002, 0x202b2f00, 0x60000002, 0x20c63a70, 0x60000001]),
+ (60, 1, 1, 0, 1, 0, 33) : ('60B', [0x300005fc, 0x100008ac, 0x400003d4, 0x278fbd4e, 0x60000001, 0x20284880, 0x60000001, 0x20a60c60, 0x60000001]),
+ (60, 1, 1, 0, -1, 0, 34) : ('60C', [0x30001f18, 0x1000011b, 0x4000028c, 0x2e501cf5, 0x60000001, 0x20284880, 0x60000001, 0x229a8350, 0x60000001, 0x20a2be80]),
+ (60, 1, 1, 0, -1, 0, 12322) : ('60D', [0x3000099c, 0x10000322, 0x400001ca, 0x2477b653, 0x60000002, 0x201d0100, 0x60000002, 0x21fe97b1, 0x60000002]),
+ (60, 1, -1, 1, 0, 0, 4386) : ('60E', [0x30001bca, 0x10000dc4, 0x40000271, 0x2d62b05a, 0x60000002, 0x20159780, 0x60000001, 0x200004e0, 0x60000002, 0x200783c0]),
+ (60, 1, -1, -1, 0, 0, 4386) : ('60F', [0x300003d7, 0x10000f20, 0x40000011, 0x27e77ecd, 0x60000001, 0x2016e180, 0x60000002, 0x20156b67, 0x60000001]),
+ (60, 0, 2, 1, 0, 0, 12322) : ('60G', [0x30000623, 0x100004bd, 0x400001af, 0x222fbb14, 0x60000002, 0x20159780, 0x60000001, 0x20a2c390, 0x60000001, 0x201f4280]),
+ (60, 0, 2, 0, -2, 0, 12322) : ('60H', [0x300010f7, 0x10000561, 0x40000411, 0x288671ca, 0x60000002, 0x20246a80, 0x60000002, 0x200e3658]),
+ (60, 0, 0, 1, 0, 0, 12322) : ('60I', [0x30001b96, 0x10000142, 0x400000f9, 0x277e6345, 0x60000002, 0x201c5c00, 0x60000001, 0x20071f40, 0x60000002, 0x20024900]),
+ (66, 1, -1, 1, 0, 0, 12322) : ('66A', [0x30000396, 0x10000f41, 0x400001d6, 0x21dae402, 0x60000002, 0x202b2f00, 0x60000002, 0x265b7e37, 0x60000001, 0x20005640]),
+ (70, 1, 1, -1, 0, 0, 12322) : ('70A', [0x300016f8, 0x10000cd8, 0x4000055f, 0x2948f0bc, 0x60000001, 0x202dc300, 0x60000001, 0x200735a5, 0x60000002]),
+ (78, 1, 1, -1, 0, 0, 12322) : ('78A', [0x300011ca, 0x10000585, 0x400001b5, 0x2d6b9508, 0x60000002, 0x20000780, 0x60000002, 0x20a2c6c0, 0x60000001, 0x201dd300]),
+ (84, 0, 0, 0, 0, 0, 12322) : ('84A', [0x30000c18, 0x1000026a, 0x400001af, 0x28c38447, 0x60000002, 0x201e4b00, 0x60000001, 0x25b964f2, 0x60000002, 0x20b0f040]),
+ (84, 0, -2, 1, 0, 0, 12322) : ('84B', [0x30001977, 0x10000e12, 0x4000042a, 0x2174b24d, 0x60000002, 0x201d0100, 0x60000002, 0x229277e0, 0x60000002, 0x20005280]),
+ (88, 0, 2, 0, 0, 0, 12322) : ('88A', [0x300000b5, 0x10000341, 0x4000025c, 0x27548f64, 0x60000001, 0x202dc300, 0x60000001, 0x228c6b03, 0x60000001, 0x200003c0]),
+ (92, 1, 1, 0, -1, 0, 12322) : ('92A', [0x30001d79, 0x10000c7c, 0x40000117, 0x24e8ad52, 0x60000002, 0x201e4b00, 0x60000001, 0x25b912a4, 0x60000001, 0x20aa2bc0]),
+}
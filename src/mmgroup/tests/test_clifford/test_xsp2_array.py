@@ -0,0 +1,76 @@
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+import numpy as np
+import pytest
+
+from mmgroup import Xsp2_Co1, MM0
+from mmgroup.structures.xsp2_co1_array import Xsp2_Co1Array
+
+
+
+@pytest.mark.xsp2co1
+def test_xsp2_co1_array(n = 20):
+    a = Xsp2_Co1Array.rand(n)
+    b = Xsp2_Co1Array([Xsp2_Co1('r', 'G_x0') for i in range(n)])
+    g = Xsp2_Co1('r', 'G_x0')
+    ab, ag, a_inv, a3 = a * b, a * g, a**(-1), a**3
+    orders, subtypes = a.order(), a.subtype()
+    traces, chi = a.traces(), a.chi_G_x0()
+    for i in range(n):
+        assert ab[i] == a[i] * b[i]
+        assert ag[i] == a[i] * g
+        assert a_inv[i] == a[i]**(-1)
+        assert a3[i] == a[i]**3
+        assert orders[i] == a[i].order()
+        st = a[i].subtype
+        assert subtypes[i] == (st[0] << 4) + st[1]
+        assert tuple(chi[i]) == MM0(a[i]).chi_G_x0()
+    assert traces.shape == (n, 4)
+    assert (a * a_inv == Xsp2_Co1()).all()
+    assert (ab == ab.copy()).all()
+    assert not (a == b).any()
+    # Comparison must not change the data of the arrays. Here we
+    # store an unreduced vector v_g in the Leech lattice mod 3 in
+    # the data of the elements of the array by setting both bits
+    # of a zero coordinate of v_g.
+    data = a.data.copy()
+    v3 = data[:, 0]
+    zero = ~(v3 | (v3 >> np.uint64(24))) & np.uint64(0xffffff)
+    data[:, 0] |= (zero & (np.uint64(0) - zero)) * np.uint64(0x1000001)
+    data_copy = data.copy()
+    assert (Xsp2_Co1Array(data) == a).all()
+    assert (data == data_copy).all()
+    unit = Xsp2_Co1Array(3)
+    assert (unit.order() == 1).all()
+    unit[1] = g
+    assert unit[1] == g and unit[0] == Xsp2_Co1()
+
+
+def leech3_to_vector(v3):
+    v3 = int(v3)
+    return np.array([((v3 >> i) & 1) - ((v3 >> (i + 24)) & 1)
+        for i in range(24)], dtype = np.int32)
+
+def vector_to_leech3(v):
+    v3 = 0
+    for i, x in enumerate(np.array(v) % 3):
+        v3 |= (x == 1) << i | (x == 2) << (i + 24)
+    return v3
+
+@pytest.mark.xsp2co1
+def test_xsp2_co1_compiled(ntests = 5, n = 200):
+    for k in range(ntests):
+        g = Xsp2_Co1('r', 'G_x0') if k else Xsp2_Co1()
+        c = g.compile()
+        a2 = np.random.randint(0, 1 << 25, size = n, dtype = np.uint32)
+        assert list(c.op_leech2(a2)) == g.xsp_conjugate(a2)
+        a3 = np.random.randint(0, 1 << 48, size = n, dtype = np.uint64)
+        a3 &= ~(a3 >> 24) & 0xffffffffffff
+        a3[0] = 0x8000004   # the standard short vector STD_V3
+        m = g.leech_op.astype(np.int32)
+        img3 = c.op_leech3(a3)
+        assert img3[0] == g.short3
+        for x, y in zip(a3, img3):
+            v = 2 * (leech3_to_vector(x) @ m)   # since 1/8 = 2 (mod 3)
+            assert y == vector_to_leech3(v)
@@ -0,0 +1,100 @@
+"""Test array versions of C functions dealing with Leech lattice vectors
+
+In this script we test the functions in file gen_leech_array.c. Each
+of these functions applies a function dealing with vectors in the
+Leech lattice mod 2 or mod 3 to all entries of an array. We compare
+the results with the results of the corresponding scalar functions.
+"""
+
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+import numpy as np
+import pytest
+
+from mmgroup import MM0
+from mmgroup.generators import gen_leech2_type
+from mmgroup.generators import gen_leech2_subtype
+from mmgroup.generators import gen_leech2_type2
+from mmgroup.generators import gen_leech2_mul
+from mmgroup.generators import gen_leech2_scalprod
+from mmgroup.generators import gen_leech2to3_short
+from mmgroup.generators import gen_leech3to2_short
+from mmgroup.generators import gen_leech3to2_type3
+from mmgroup.generators import gen_leech3to2_type4
+from mmgroup.generators import gen_leech3_add
+from mmgroup.generators import gen_leech3_scalprod
+from mmgroup.generators import gen_leech3_op_vector_word
+from mmgroup.generators import gen_leech2_op_word
+from mmgroup.generators import gen_leech2_type_array
+from mmgroup.generators import gen_leech2_subtype_array
+from mmgroup.generators import gen_leech2_type2_array
+from mmgroup.generators import gen_leech2_mul_array
+from mmgroup.generators import gen_leech2_scalprod_array
+from mmgroup.generators import gen_leech2to3_short_array
+from mmgroup.generators import gen_leech3to2_short_array
+from mmgroup.generators import gen_leech3to2_type3_array
+from mmgroup.generators import gen_leech3to2_type4_array
+from mmgroup.generators import gen_leech3_add_array
+from mmgroup.generators import gen_leech3_scalprod_array
+from mmgroup.generators import gen_leech3_op_vector_word_many
+
+
+
+def rand_leech2(n):
+    return np.random.randint(0, 1 << 25, size = n, dtype = np.uint32)
+
+def rand_leech3(n):
+    a = np.random.randint(0, 1 << 48, size = n, dtype = np.uint64)
+    return a & ~(a >> 24)
+
+
+@pytest.mark.gen_xi
+def test_leech2_array(n = 1000):
+    a, b = rand_leech2(n), rand_leech2(n)
+    # Make sure that some vectors are short
+    for i in range(20):
+        g = MM0('r', 'G_x0').mmdata
+        a[i] = gen_leech2_op_word(0x200, g, len(g))
+    t = np.zeros(n, dtype = np.uint8)
+    assert gen_leech2_type_array(a, n, t) == n
+    assert list(t) == [gen_leech2_type(x) for x in a]
+    gen_leech2_subtype_array(a, n, t)
+    assert list(t) == [gen_leech2_subtype(x) for x in a]
+    count = gen_leech2_type2_array(a, n, t)
+    assert list(t) == [gen_leech2_type2(x) for x in a]
+    assert count == sum(gen_leech2_type(x) == 2 for x in a) > 0
+    c = np.zeros(n, dtype = np.uint32)
+    gen_leech2_mul_array(a, b, n, c)
+    assert list(c) == [gen_leech2_mul(x, y) for x, y in zip(a, b)]
+    gen_leech2_scalprod_array(a, b, n, t)
+    assert list(t) == [gen_leech2_scalprod(x, y) for x, y in zip(a, b)]
+    a3 = np.zeros(n, dtype = np.uint64)
+    gen_leech2to3_short_array(a, n, a3)
+    assert list(a3) == [gen_leech2to3_short(x) for x in a]
+    gen_leech3to2_short_array(a3, n, c)
+    assert list(c) == [gen_leech3to2_short(x) for x in a3]
+    # Output array may be equal to input array
+    c = a.copy()
+    gen_leech2_mul_array(c, b, n, c)
+    assert list(c) == [gen_leech2_mul(x, y) for x, y in zip(a, b)]
+
+
+@pytest.mark.gen_xi
+def test_leech3_array(n = 1000):
+    a, b = rand_leech3(n), rand_leech3(n)
+    c = np.zeros(n, dtype = np.uint32)
+    gen_leech3to2_type3_array(a, n, c)
+    assert list(c) == [gen_leech3to2_type3(x) for x in a]
+    gen_leech3to2_type4_array(a, n, c)
+    assert list(c) == [gen_leech3to2_type4(x) for x in a]
+    s = np.zeros(n, dtype = np.uint64)
+    gen_leech3_add_array(a, b, n, s)
+    assert list(s) == [gen_leech3_add(x, y) for x, y in zip(a, b)]
+    t = np.zeros(n, dtype = np.uint8)
+    gen_leech3_scalprod_array(a, b, n, t)
+    assert list(t) == [gen_leech3_scalprod(x, y) for x, y in zip(a, b)]
+    g = MM0('r', 'G_x0').mmdata
+    ref = [gen_leech3_op_vector_word(x, g, len(g)) for x in a]
+    assert gen_leech3_op_vector_word_many(a, n, g, len(g)) == n
+    assert list(a) == ref
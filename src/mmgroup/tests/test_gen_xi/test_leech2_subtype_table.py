@@ -0,0 +1,94 @@
+"""Test the optional table of subtypes of vectors in the Leech lattice
+
+Here we test the functions in module mmgroup.structures.leech2_subtypes.
+With the table installed, the C functions computing the (sub)type of
+a vector in the Leech lattice mod 2 must return the same results
+as without the table.
+"""
+
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+import os
+import numpy as np
+import pytest
+
+from mmgroup import MM0
+from mmgroup.generators import gen_leech2_type
+from mmgroup.generators import gen_leech2_subtype
+from mmgroup.generators import gen_leech2_type2
+from mmgroup.generators import gen_leech2_op_word
+from mmgroup.generators import gen_leech2_reduce_type4
+from mmgroup.generators import gen_leech2_set_subtype_table
+from mmgroup.structures.leech2_subtypes import TABLE_FILE_NAME
+from mmgroup.structures.leech2_subtypes import check_leech2_subtype_table
+from mmgroup.structures.leech2_subtypes import compute_leech2_subtype_table
+from mmgroup.structures.leech2_subtypes import install_leech2_subtype_table
+from mmgroup.structures.leech2_subtypes import uninstall_leech2_subtype_table
+
+
+
+def leech2_types(a):
+    return [(gen_leech2_subtype(v), gen_leech2_type(v), gen_leech2_type2(v))
+        for v in a]
+
+def make_testdata(n):
+    a = np.random.randint(0, 1 << 25, size = n, dtype = np.uint32)
+    # Make sure that all types occur
+    for i, v in enumerate([0, 0x200, 0x800000, 0x800200, 0x1000000]):
+        g = MM0('r', 'G_x0').mmdata
+        a[i] = gen_leech2_op_word(v, g, len(g))
+    return a
+
+
+@pytest.mark.gen_xi
+def test_leech2_subtype_table(tmp_path, n = 2000):
+    a = make_testdata(n)
+    ref = leech2_types(a)
+    try:
+        table = install_leech2_subtype_table(tmp_path)
+        path = os.path.join(tmp_path, TABLE_FILE_NAME)
+        assert os.path.getsize(path) == len(table) == 1 << 24
+        assert check_leech2_subtype_table(table)
+        assert leech2_types(a) == ref
+        # Computing a table does not uninstall the installed table
+        v, t = 0x123457, table[0x123457]
+        table[v] = 0xff
+        assert gen_leech2_subtype(v) == 0xff
+        assert compute_leech2_subtype_table()[v] == t
+        assert gen_leech2_subtype(v) == 0xff
+        table[v] = t
+        for v in a:
+            if gen_leech2_type(v) == 4:
+                g = np.zeros(8, dtype = np.uint32)
+                len_g = gen_leech2_reduce_type4(v, g)
+                assert 0 <= len_g <= 6
+                w = gen_leech2_op_word(v, g, len_g)
+                assert w & 0xffffff == 0x800000
+        uninstall_leech2_subtype_table()
+        # Now the table is mapped into memory from the file
+        table = install_leech2_subtype_table(tmp_path)
+        assert isinstance(table, np.memmap)
+        assert leech2_types(a) == ref
+        uninstall_leech2_subtype_table()
+        # A corrupted table is rejected and recomputed, even if the
+        # corrupted entry is not checked by the C function
+        bad = np.array(table)
+        bad[0x123457] = 0x20 if bad[0x123457] != 0x20 else 0x44
+        assert not check_leech2_subtype_table(bad)
+        bad.tofile(path)
+        table = install_leech2_subtype_table(tmp_path)
+        assert not isinstance(table, np.memmap)
+        assert check_leech2_subtype_table(table)
+        assert leech2_types(a) == ref
+        assert gen_leech2_subtype(0x123457) == table[0x123457]
+        # The recomputed table has been stored in the file
+        uninstall_leech2_subtype_table()
+        table = install_leech2_subtype_table(tmp_path)
+        assert isinstance(table, np.memmap)
+    finally:
+        uninstall_leech2_subtype_table()
+    assert leech2_types(a) == ref
+    # A table of wrong length is rejected by the C function
+    assert gen_leech2_set_subtype_table(bad, len(bad) - 1) < 0
+    assert leech2_types(a) == ref
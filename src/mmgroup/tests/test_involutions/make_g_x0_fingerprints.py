@@ -0,0 +1,232 @@
+r"""Compute a table of labels of fingerprints of elements of G_x0.
+
+Running this module creates the python file ``xsp2_co1_fingerprints.py``
+in module ``mmgroup.structures``. That file contains a dictionary
+``G_X0_FINGERPRINTS`` mapping fingerprints of elements of the
+group :math:`G_{x0}` to labels and to elements with that fingerprint.
+
+The fingerprint of an element :math:`g \in G_{x0}` is the tuple
+of invariants computed by C function ``xsp2co1_elem_fingerprint``.
+Conjugate elements have the same fingerprint; but elements with the
+same fingerprint need not be conjugate. So a label refers to a
+fingerprint only.
+
+We obtain the fingerprints by computing the fingerprints of many
+random elements of :math:`G_{x0}`, using class ``Xsp2_Co1Array``.
+Then we close the set of fingerprints found under taking powers
+and multiplying with elements of the normal subgroup :math:`Q_{x0}`
+of :math:`G_{x0}`, including the central element :math:`x_{-1}`.
+We repeat this with further random samples, until a round of
+random samples yields no new fingerprints. Since this procedure
+is based on random sampling, the table need not contain all
+fingerprints of elements of :math:`G_{x0}`. The fingerprints
+contained in an existing table are always kept in the new table,
+so that rerunning this module never removes a fingerprint from
+the table.
+
+For each order :math:`o` of an element of :math:`G_{x0}` we label
+the fingerprints of the elements of order :math:`o` with ``oA``,
+``oB``, ... In a new table we sort these fingerprints and assign
+the labels in that order. When regenerating an existing table, a
+fingerprint keeps its label, and a new fingerprint of elements
+of order :math:`o` obtains the first label of shape ``o...`` not
+used in the existing table. So the labels remain stable. Note that
+these labels are not standardized; they are not related to the
+labels of conjugacy classes in the ATLAS.
+"""
+
+import sys
+import os
+import re
+from random import randint
+from collections import defaultdict
+
+import numpy as np
+
+if __name__ == "__main__":
+    sys.path.append("../../../")
+
+from mmgroup import Xsp2_Co1
+from mmgroup.structures.xsp2_co1_array import Xsp2_Co1Array
+
+
+OUTPUT_FILE = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))),
+    "structures", "xsp2_co1_fingerprints.py")
+
+NSAMPLES = 200000
+
+NQ = 64
+
+DOC = r'''Table of labels of fingerprints of elements of the group G_x0
+
+Dictionary G_X0_FINGERPRINTS maps a fingerprint of an element of G_x0
+to a pair (label, element). Here a fingerprint of an element g of G_x0
+is the tuple of invariants computed by C function
+``xsp2co1_elem_fingerprint``:
+
+   - Order o of g
+   - Character of g in the representations 24_x, 576_x, 4096_x, 98280_x
+   - Information about g computed by C function
+     ``xsp2co1_elem_involution_class``
+   - Information about g**(o/2) computed by C function
+     ``xsp2co1_elem_involution_class``; this is 0 if o is odd
+
+Conjugate elements have the same fingerprint; but elements with the
+same fingerprint need not be conjugate. The table has been obtained
+from random samples, so it need not contain all fingerprints.
+
+A label is a string as described in module
+``mmgroup.tests.test_involutions.make_g_x0_fingerprints``. An
+element with the given fingerprint is given as a word of generators
+of G_x0, as in attribute ``mmdata`` of class ``Xsp2_Co1``.
+'''
+
+
+def label(order, i):
+    s = ""
+    i += 1
+    while i:
+        i, r = divmod(i - 1, 26)
+        s = chr(ord("A") + r) + s
+    return str(order) + s
+
+
+def label_index(s):
+    """Inverse of function ``label``; return (order, i)"""
+    m = re.match(r"^([0-9]+)([A-Z]+)$", s)
+    order, letters = int(m.group(1)), m.group(2)
+    i = 0
+    for c in letters:
+        i = 26 * i + ord(c) - ord("A") + 1
+    return order, i - 1
+
+
+def fingerprints(a):
+    return [tuple(map(int, x)) for x in a.fingerprint()]
+
+
+def load_table(file = OUTPUT_FILE):
+    """Return the dictionary ``G_X0_FINGERPRINTS`` stored in ``file``
+
+    The function returns an empty dictionary if ``file`` does not
+    exist. Here we do not import module ``xsp2_co1_fingerprints``,
+    since the table may be created in a different location.
+    """
+    if not os.path.isfile(file):
+        return {}
+    d = {}
+    exec(open(file).read(), d)
+    return d["G_X0_FINGERPRINTS"]
+
+
+def add_fingerprints(table, a):
+    """Enter the elements of an array ``a`` into dict ``table``
+
+    Here ``table`` maps fingerprints to elements and ``a`` is an
+    instance of class ``Xsp2_Co1Array``. The function returns
+    the list of the elements with new fingerprints.
+    """
+    new = []
+    for i, fp in enumerate(fingerprints(a)):
+        if not fp in table:
+            table[fp] = a[i]
+            new.append(a[i])
+    return new
+
+
+def q_x0_elements(nq = NQ):
+    """Return a list of elements of the group Q_x0
+
+    The list contains the central element x_{-1}, the basis vectors
+    of Q_x0 and some random elements of Q_x0.
+    """
+    q = [0x1000000] + [1 << i for i in range(24)]
+    q += [randint(1, 0x1ffffff) for i in range(nq)]
+    return [Xsp2_Co1('q', x) for x in q]
+
+
+def close_fingerprints(table, pending):
+    """Close dict ``table`` under powers and multiplication with Q_x0
+
+    Here ``pending`` is the list of the elements in ``table`` that
+    have not yet been processed.
+    """
+    while len(pending):
+        new = []
+        for g in pending:
+            o = g.order()
+            new += [g**e for e in range(2, o) if o % e == 0]
+            new += [g * q for q in q_x0_elements()]
+        pending = add_fingerprints(table, Xsp2_Co1Array(new))
+
+
+def find_fingerprints(nsamples = NSAMPLES, verbose = 0, old_table = {}):
+    """Return dictionary mapping fingerprints to elements
+
+    The elements given in the dictionary ``old_table`` are also
+    entered into the returned dictionary.
+    """
+    table = {}
+    old = [Xsp2_Co1('a', g) for _, g in old_table.values()]
+    pending = add_fingerprints(table, Xsp2_Co1Array(old)) if old else []
+    while True:
+        n_old = len(table)
+        pending += add_fingerprints(table, Xsp2_Co1Array.rand(nsamples))
+        close_fingerprints(table, pending)
+        pending = []
+        if verbose:
+            print("%d fingerprints found" % len(table))
+        if len(table) == n_old:
+            return table
+
+
+def sort_key(fp):
+    return (fp[0],) + tuple(-x for x in fp[1:5]) + fp[5:]
+
+
+def make_labels(fps, old_table = {}):
+    """Return dictionary mapping fingerprints to labels
+
+    Here ``fps`` is the sorted list of the fingerprints to be labelled.
+    A fingerprint in the dictionary ``old_table`` keeps its label.
+    Other fingerprints of elements of order o obtain the labels ``oA``,
+    ``oB``, ... in the given order, omitting labels already used.
+    """
+    labels, next_index = {}, defaultdict(int)
+    for fp, (old_label, _) in old_table.items():
+        order, i = label_index(old_label)
+        labels[fp] = old_label
+        next_index[order] = max(next_index[order], i + 1)
+    for fp in fps:
+        if not fp in labels:
+            labels[fp] = label(fp[0], next_index[fp[0]])
+            next_index[fp[0]] += 1
+    return labels
+
+
+def write_fingerprints(file = OUTPUT_FILE, nsamples = NSAMPLES,
+        verbose = 0):
+    old_table = load_table(file)
+    table = find_fingerprints(nsamples, verbose, old_table)
+    fps = sorted(table, key = sort_key)
+    labels = make_labels(fps, old_table)
+    f = open(file, "wt")
+    print("# This file has been created automatically, do not change!!!",
+          file = f)
+    print("# It has been created by executing module", file = f)
+    print("# mmgroup.tests.test_involutions.make_g_x0_fingerprints.\n",
+          file = f)
+    print('r"""' + DOC + '"""\n', file = f)
+    print("G_X0_FINGERPRINTS = {", file = f)
+    for fp in fps:
+        atoms = ", ".join("0x%x" % x for x in table[fp].mmdata)
+        print(" %s : (%r, [%s])," % (fp, labels[fp], atoms), file = f)
+    print("}", file = f)
+    f.close()
+    if verbose:
+        print("Table of fingerprints written to file", file)
+
+
+if __name__ == "__main__":
+    write_fingerprints(verbose = 1)
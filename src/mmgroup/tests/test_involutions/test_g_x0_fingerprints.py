@@ -0,0 +1,32 @@
+from __future__ import absolute_import, division, print_function
+from __future__ import  unicode_literals
+
+import pytest
+
+from mmgroup import Xsp2_Co1, Xsp2_Co1Array
+from mmgroup.structures.xsp2_co1_fingerprints import G_X0_FINGERPRINTS
+
+
+
+@pytest.mark.involution
+def test_g_x0_fingerprints(ntests = 20):
+    all_labels = [label for label, _ in G_X0_FINGERPRINTS.values()]
+    assert len(set(all_labels)) == len(all_labels)
+    for i, (fp, (label, rep)) in enumerate(G_X0_FINGERPRINTS.items()):
+        if i % 20 == 0:
+            g = Xsp2_Co1('a', rep)
+            assert g.fingerprint() == fp
+            assert g.fingerprint_label() == label
+            assert label.rstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ") == str(fp[0])
+            assert g.order() == fp[0]
+    a = Xsp2_Co1Array.rand(ntests)
+    h = Xsp2_Co1Array.rand(ntests)
+    labels = a.fingerprint_label()
+    conj = h**(-1) * a
+    conj *= h
+    assert conj.fingerprint_label() == labels
+    for i in range(ntests):
+        assert a[i].fingerprint_label() == labels[i]
+        # The label is None if and only if the fingerprint is unknown
+        known = a[i].fingerprint() in G_X0_FINGERPRINTS
+        assert (labels[i] is not None) == known
@@ -133,3 +133,97 @@ def test_random_io(verbose = 0):
              n += 1
 
 
+
+
+
+#########################################################################
+### Test vector addition and scalar multiplication
+#########################################################################
+
+
+@pytest.mark.mm_op_crt
+def test_add_scalar(verbose = 0):
+    k = 17
+    space =  MMV_CRT(k)
+    group = standard_mm_group
+    for i in range(10):
+        data1 = [(randint(-2, 2), "E", randint(0, 196883)) 
+            for j in range(5)]
+        data2 = [(randint(-2, 2), "E", randint(0, 196883)) 
+            for j in range(5)]
+        v1, v2 = space(data1), space(data2)
+        v3 = space(data1 + data2)
+        assert v1 + v2 == v3
+        assert v3 - v2 == v1
+        assert 3 * v1 == v1 + v1 + v1
+        assert -v1 + v1 == space(0)
+        g = group('r', 'G_x0')
+        assert (v1 + v2) * g == v1 * g + v2 * g
+        assert (v1 + v2).inorm == v3.inorm
+        for p in (7, 31, 127, 255):
+            assert (v3 % p) == (v1 % p) + (v2 % p)
+    v = space([(2, "A", 0, 0)])
+    with pytest.raises(ValueError):
+        v * 1000
+
+
+
+#########################################################################
+### Test parallel group operation
+#########################################################################
+
+
+@pytest.mark.mm_op_crt
+def test_parallel_op(verbose = 0):
+    import mmgroup.mm_crt_space as mm_crt_space
+    old_threads = mm_crt_space.threads_MMVectorCRT
+    space =  MMV_CRT(20)
+    group = standard_mm_group
+    try:
+        for i in range(5):
+            v = space([(1, "A", 2, 3), (-1, "B", 4, 5), (2, "T", 7, 3)])
+            g = group('r', 'G_x0') * group('r', 3)
+            mm_crt_space.threads_MMVectorCRT = 1
+            v1 = v * g
+            mm_crt_space.threads_MMVectorCRT = 4
+            v2 = v * g
+            assert v1 == v2
+            for p in (7, 31, 127, 255):
+                assert v2 % p == (v % p) * g
+        v = MMV_CRT(3)([(1, "A", 2, 3)])
+        g = group()
+        for j in range(3):
+            g *= group('r', 'G_x0') * group('t', 1)
+        for mm_crt_space.threads_MMVectorCRT in (1, 4):
+            with pytest.raises(ValueError):
+                v * g
+    finally:
+        mm_crt_space.threads_MMVectorCRT = old_threads
+
+
+
+#########################################################################
+### Test blockwise conversion to an array of integers
+#########################################################################
+
+
+@pytest.mark.mm_op_crt
+def test_as_int32(tmp_path, verbose = 0):
+    from mmgroup.mm_crt_space import compress_data
+    space =  MMV_CRT(20)
+    group = standard_mm_group
+    v = space([(1, "A", 2, 3), (-1, "B", 4, 5), (2, "T", 7, 3)])
+    v *= group('r', 'G_x0') * group('r', 3)
+    v.expanded = False
+    a, norm = v.as_int32(block_rows = 100)
+    assert not v.expanded
+    assert norm == v.inorm
+    assert (a == compress_data(v.data_int)).all()
+    for p in (7, 31, 127, 255):
+        assert ((a % p) == ((v % p) << 20).as_bytes()).all()
+    path = str(tmp_path / "v.bin")
+    m = np.memmap(path, dtype = np.int32, mode = 'w+', shape = (196884,))
+    _, norm1 = v.as_int32(m)
+    m.flush()
+    assert norm1 == norm
+    assert (np.fromfile(path, dtype = np.int32) == a).all()
@@ -438,3 +438,62 @@ def test_rand_op_tag_A(n_tests = 4, f_mul = None, verbose = 1):
 
 
 
+
+
+
+########################################################################
+# tests operation on several vectors
+########################################################################
+
+
+@pytest.mark.mm_op
+def test_op_word_many(n_tests = 2, verbose = 0):
+    print("Testing group operation on several vectors")
+    from mmgroup import MM0, MMV
+    for i in range(n_tests):
+        for p in PRIMES:
+            for w in [("r", 8), ("r", "G_x0"), ("r", "N_0"), ("t", "n")]:
+                g = MM0(*w)
+                vectors = [MMV(p)('R') for k in range(3)]
+                ref = [v * g for v in vectors]
+                space = vectors[0].space
+                res = space.imul_group_word_many(vectors, g)
+                assert res is vectors
+                for v, v_ref in zip(vectors, ref):
+                    assert v == v_ref
+    print("Test passed")
+
+
+
+########################################################################
+# tests operation with several threads
+########################################################################
+
+
+@pytest.mark.mm_op
+def test_op_num_threads(verbose = 0):
+    print("Testing group operation with several threads")
+    from mmgroup import MM0, MMV
+    from mmgroup.mm import mm_aux_set_num_threads
+    from mmgroup.mm import mm_aux_get_num_threads
+    from mmgroup.mm import mm_aux_have_openmp
+    old_threads = mm_aux_get_num_threads()
+    # Without OpenMP support there is just one thread
+    n_threads = 4 if mm_aux_have_openmp() else 1
+    if verbose:
+        print("Using %d threads" % n_threads)
+    try:
+        for p in PRIMES:
+            # Test operations pi, xy, t, xi, and a mixture of them
+            for w in [("r", 8), ("t", "n"), ("l", "n"), ("p", "r"),
+                    ("x", "r"), ("y", "r"), ("d", "r")]:
+                g = MM0(*w)
+                v = MMV(p)('R')
+                assert mm_aux_set_num_threads(1) == 1
+                v1 = v * g
+                assert mm_aux_set_num_threads(4) == n_threads
+                assert mm_aux_get_num_threads() == n_threads
+                assert v * g == v1
+    finally:
+        mm_aux_set_num_threads(old_threads)
+    print("Test passed")
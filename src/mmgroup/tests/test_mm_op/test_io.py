@@ -9,6 +9,7 @@ from random import randint
 import scipy
 from scipy import stats
 
+import os
 import pytest
 
 from mmgroup.mm_space import MMSpace, MMVector
@@ -328,3 +329,48 @@ def test_large_all(verbose = 0):
 
 
 
+
+
+#########################################################################
+### Test saving vectors to a file and loading vectors from a file
+#########################################################################
+
+
+@pytest.mark.mm_op
+def test_save_load(tmp_path, verbose = 0):
+    from mmgroup import MM0
+    for p in characteristics():
+        space = MMSpace()
+        vectors = [MMVector(p, "R") for i in range(3)]
+        path = str(tmp_path / ("v%d.mmv" % p))
+        space.save_vectors(path, vectors)
+        for mmap in (True, False):
+            loaded = space.load_vectors(path, mmap)
+            assert len(loaded) == len(vectors)
+            for v, w in zip(vectors, loaded):
+                assert v == w
+        g = MM0([("r", 8)])
+        v = vectors[0]
+        v.save(path)
+        w = MMVector.load(path)
+        assert w == v
+        assert w * g == v * g
+        w *= g
+        assert w == v * g
+        assert MMVector.load(path) == v
+        # Flip single bits in the parts of the vector with tags
+        # A, T, X, and Y; the checksum must detect all these errors.
+        offset = 8 * 9   # first entry of the vector after the header
+        size = os.path.getsize(path) - offset
+        for pos in [0, size // 4, size // 2, (3 * size) // 4, size - 1]:
+            with open(path, "r+b") as f:
+                f.seek(offset + pos)
+                b = f.read(1)
+                f.seek(offset + pos)
+                f.write(bytes([b[0] ^ 1]))
+            with pytest.raises(ValueError):
+                MMVector.load(path)
+            with open(path, "r+b") as f:
+                f.seek(offset + pos)
+                f.write(b)
+            assert MMVector.load(path) == v
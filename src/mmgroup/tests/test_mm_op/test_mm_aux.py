@@ -79,4 +79,40 @@ def test_mm_aux_hash(ntests = 5, verbose = 0):
 
 
 
-        
\ No newline at end of file
+        
+
+@pytest.mark.mm_op
+def test_mm_aux_hash_blocks(ntests = 5):
+    from mmgroup import MM0
+    for p, v1, v2 in hash_testdata(ntests):
+        h1, h2 = v1.block_hashes(), v2.block_hashes()
+        assert (h1 == h2).all()
+        assert v1.fingerprint(h1) == v2.fingerprint() 
+    for p in (3, 15, 255):
+        for i in range(ntests):
+            v = MMVector(p, 'R')
+            hashes = v.block_hashes()
+            g = MM0('r', 'G_x0')
+            res = v.ops.op_word_tag_A_hash(v.data, g.mmdata, len(g.mmdata),
+                  1, hashes)
+            assert res == 0
+            assert (v.block_hashes() == hashes).all()
+            # Function do_hash() in file mm_aux.c does not distinguish
+            # between all values of an entry; so we change several entries
+            for j in range(2, 24):
+                v['B', 1, j] = (v['B', 1, j] + 1) % p
+            hashes_B = v.block_hashes(hashes.copy(), "B")
+            assert (hashes_B != hashes).sum() == 1
+            assert hashes_B[1] != hashes[1]
+            assert (hashes_B == v.block_hashes()).all()
+            assert v.fingerprint(hashes_B) == v.fingerprint()
+            # Test hash-updating versions of the kernels for tags A, B, C
+            f, e, eps = [randint(0, 0x1fff) for j in range(3)]
+            pi = randint(0, 244823039)
+            for mode in (0, 1):
+                hashes = v.block_hashes()
+                v.ops.op_xy_tag_ABC_hash(v.data, f, e, eps, mode, hashes)
+                assert (v.block_hashes() == hashes).all()
+                v.ops.op_pi_tag_ABC_hash(v.data, eps & 0xfff, pi,
+                    mode, hashes)
+                assert (v.block_hashes() == hashes).all()
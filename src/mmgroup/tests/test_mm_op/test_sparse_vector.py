@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from mmgroup import MM0, MMV
+from mmgroup.mm_sparse_space import SparseMMVector, SparseMMV
+
+
+
+def norm(v):
+    """Return norm of vector v of type MMVector as an integer mod p"""
+    a = v.as_sparse()
+    values = (a & 0xff).astype(np.int64)
+    tags, i0, i1 = a >> 25, (a >> 14) & 0x7ff, (a >> 8) & 0x3f
+    factors = np.where((tags == 1) & (i0 != i1), 2, 1)
+    return int(np.sum(values * values * factors) % v.p)
+
+
+@pytest.mark.mm_op
+def test_sparse_vector():
+    for p in (3, 127):
+        V, SV = MMV(p), SparseMMV(p)
+        for i in range(10):
+            tags = [(t, 'r') for t in "ABCTXZYDT"]
+            v1, v2 = V(tags), V(tags[3:])
+            s1, s2 = SV(v1), SV(v2)
+            assert s1.as_mmvector() == v1
+            assert (s1 + 3 * s2).as_mmvector() == v1 + 3 * v2
+            assert (s1 - s1) == SV()
+            assert s1.dot(s1) == norm(v1)
+            assert (s1 + s2).dot(s1 + s2) == norm(v1 + v2)
+            assert s1['A', 3, 2] == v1['A', 3, 2]
+            assert s1['T', 5, 17] == v1['T', 5, 17]
+            for tag in "dpxytN":
+                g = MM0('r', 'N_0') if tag == "N" else MM0(tag, 'n')
+                assert (s1 * g).as_mmvector() == v1 * g
+            g = MM0('r', 'G_x0')
+            assert (s1 * g).as_mmvector() == v1 * g
+        s = SV('T', 7, 5)
+        assert len(s * MM0('t', 1)) == 64
+        assert len(s * MM0('r', 'N_x0')) == 1
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from mmgroup import MM0, MM
+from mmgroup.structures.construct_mm import MMWordWriter
+from mmgroup.structures.construct_mm import write_mm_words
+from mmgroup.structures.construct_mm import iter_read_mm_words
+from mmgroup.structures.construct_mm import iter_read_mm_word_blocks
+
+
+
+@pytest.mark.mmgroup
+def test_mm_words(tmp_path):
+    elements = [MM0('r', 'M') for i in range(10)] + [MM0()]
+    elements += [MM('r', 'G_x0') for i in range(10)]
+    path = str(tmp_path / "words.bin")
+    write_mm_words(path, elements[:5])
+    with MMWordWriter(path, append = True, block_size = 3) as writer:
+        writer.write_many(elements[5:])
+    blocks = list(iter_read_mm_word_blocks(path))
+    assert [len(offsets) - 1 for offsets, _ in blocks] == [5, 3, 3, 3, 3, 3, 1]
+    for group in (MM0, MM):
+        read = list(iter_read_mm_words(group, path))
+        assert len(read) == len(elements)
+        for g, h in zip(elements, read):
+            assert type(h) == group
+            assert (g.mmdata == h.mmdata).all()
+            assert MM0(g) == MM0(h)
+    f = io.BytesIO()
+    write_mm_words(f, elements)
+    f.seek(0)
+    assert len(list(iter_read_mm_words(MM0, f))) == len(elements)
+    f = io.BytesIO(f.getvalue()[:-4])
+    with pytest.raises(ValueError):
+        list(iter_read_mm_words(MM0, f))
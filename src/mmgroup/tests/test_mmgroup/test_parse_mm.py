@@ -0,0 +1,29 @@
+import pytest
+
+from mmgroup import MM0, MM
+from mmgroup.structures.construct_mm import fast_parse_mm_string
+
+
+
+@pytest.mark.mmgroup
+def test_fast_parse_mm_string():
+    for i in range(20):
+        for group in (MM0, MM):
+            g = group('r', 'M')
+            s = str(g)
+            a = fast_parse_mm_string(s)
+            assert a is not None
+            assert group('a', a) == g
+            assert group(s) == g
+    data = [
+        ("M<1>", []),
+        (" 1 ", []),
+        ("M0<x_1h * y_0x12*t_0*d_200>", [('x',1), ('y',0x12), ('d',200)]),
+        ("<p_123*l_5*t_1ch>", [('p',123), ('l',2), ('t',1)]),
+    ]
+    for s, tuples in data:
+        a = fast_parse_mm_string(s)
+        assert list(a) == list(MM0(tuples).mmdata)
+        assert MM0(s) == MM0(tuples)
+    for s in ["M<x_1_2>", "x_r", "p_999999999", "x_1**2", "Q<x_1>", "z_1"]:
+        assert fast_parse_mm_string(s) is None
@@ -0,0 +1,92 @@
+import gc
+import pickle
+import multiprocessing
+
+import pytest
+
+from mmgroup import MM0, MM, MMV, Xsp2_Co1
+from mmgroup.mm_space import SharedMMVectors
+
+
+
+@pytest.mark.mmgroup
+def test_pickle():
+    for protocol in (2, pickle.HIGHEST_PROTOCOL):
+        for i in range(5):
+            for group in (MM0, MM):
+                g = group('r', 'M')
+                g1 = pickle.loads(pickle.dumps(g, protocol))
+                assert type(g1) == type(g)
+                assert (g1.mmdata == g.mmdata).all()
+                assert g1.reduced == g.reduced
+                assert g1 == g
+            x = Xsp2_Co1('r', 'G_x0')
+            x1 = pickle.loads(pickle.dumps(x, protocol))
+            assert x1 == x
+            for p in (3, 15):
+                v = MMV(p)('R')
+                v1 = pickle.loads(pickle.dumps(v, protocol))
+                assert v1 == v
+                v1 *= g
+                assert v1 == v * g
+
+
+
+def _mul_shared(args):
+    shared, i, g = args
+    v = shared.vectors[i]
+    v *= g
+    del v
+    shared.close()
+    return i
+
+
+@pytest.mark.mmgroup
+def test_shared_vectors():
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("Start method 'fork' is not available")
+    vectors = [MMV(15)('R') for i in range(3)]
+    g = MM('r', 'M')
+    expected = [v * g for v in vectors]
+    with SharedMMVectors(vectors) as shared:
+        assert len(pickle.dumps(shared)) < 1000
+        with ctx.Pool(2) as pool:
+            args = [(shared, i, g) for i in range(len(vectors))]
+            assert pool.map(_mul_shared, args) == [0, 1, 2]
+        for v, w in zip(shared.vectors, expected):
+            assert v == w
+
+
+
+@pytest.mark.mmgroup
+def test_shared_vectors_lifetime():
+    w = MMV(15)('R')
+    # A vector keeps the shared memory alive after the container is gone
+    v = SharedMMVectors([w])[0]
+    gc.collect()
+    assert v == w
+    v *= MM('r', 'M')
+    v.hash()
+    v._shm.unlink()
+    del v
+    gc.collect()
+    # Shared memory cannot be closed while a vector is alive
+    shared = SharedMMVectors([w])
+    v = shared[0]
+    with pytest.raises(BufferError):
+        shared.close()
+    with pytest.raises(BufferError):
+        shared.unlink()
+    assert shared.vectors == []
+    del shared
+    gc.collect()
+    assert v == w
+    v.hash()
+    del v
+    gc.collect()
+    # The context manager does not fail if a vector is alive
+    with SharedMMVectors([w]) as shared:
+        v = shared[0]
+    assert v == w
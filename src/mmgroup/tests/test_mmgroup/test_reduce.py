@@ -146,6 +146,79 @@ def test_reduce(ncases = 10, verbose = 0):
 
 
 
+#####################################################################################
+# Test batched reduction in monster group
+#####################################################################################
+
+
+@pytest.mark.mmgroup 
+def test_reduce_many(ncases = 3):
+    from mmgroup.mm_reduce import mm_reduce_M_many
+    glist = [MM0()] + list(reduce_testcases(ncases))
+    # Test function mm_reduce_M_many with a short output buffer
+    a = np.concatenate([g.mmdata for g in glist[:4]])
+    ofs = np.cumsum([0] + [g.length for g in glist[:4]], dtype = np.uint32)
+    r, r_ofs = np.zeros(40, dtype = np.uint32), np.zeros(5, dtype = np.uint32)
+    res = mm_reduce_M_many(a, ofs, 4, 0, r, len(r), r_ofs)
+    assert 0 < res < 4
+    for i in range(res):
+        assert MM0('a', r[r_ofs[i]:r_ofs[i+1]]) == glist[i]
+    # Test method reduce_many of the monster group
+    mlist = [MM(g) for g in glist]
+    for g in mlist:
+        g.reduced = False
+    MM.group.reduce_many(mlist)
+    for g, g_ref in zip(mlist, glist):
+        assert g.reduced
+        assert (g.mmdata == MM(g_ref).reduce().mmdata).all()
+        assert MM0(g) == g_ref
+
+
+
+#####################################################################################
+# Test caches for reduced words and orders
+#####################################################################################
+
+
+@pytest.mark.mmgroup 
+def test_mm_cache(ncases = 3):
+    from mmgroup.structures import mm_cache
+    # Caches are disabled by default
+    assert mm_cache.LRUCache().maxsize == 0
+    old_sizes = {name: c.maxsize for name, c in mm_cache.CACHES.items()}
+    try:
+        mm_cache.set_cache_size(2)
+        mm_cache.clear_caches()
+        for g_ref in reduce_testcases(ncases):
+            g = MM(g_ref)
+            g1, g2 = g.copy(), g.copy()
+            g1.reduced = g2.reduced = False
+            g1.reduce()
+            info = mm_cache.cache_info()["reduce"]
+            assert info["misses"] >= 1
+            hits = info["hits"]
+            g2.reduce()
+            assert mm_cache.cache_info()["reduce"]["hits"] == hits + 1
+            assert (g1.mmdata == g2.mmdata).all()
+            assert MM0(g2) == g_ref
+            assert g1.order() == g2.order()
+            assert mm_cache.cache_info()["order"]["hits"] >= 1
+            o, h = g1.half_order()
+            assert g2.half_order() == (o, h)
+            assert mm_cache.cache_info()["half_order"]["hits"] >= 1
+        assert all(len(c) <= 2 for c in mm_cache.CACHES.values())
+        mm_cache.set_cache_size(0)
+        assert all(len(c) == 0 for c in mm_cache.CACHES.values())
+        g = MM(g_ref)
+        g.reduced = False
+        g.reduce()
+        assert mm_cache.cache_info()["reduce"]["size"] == 0
+    finally:
+        for name, size in old_sizes.items():
+            mm_cache.set_cache_size(size, name)
+
+
+
 #####################################################################################
 # Test fast reduction with function  mm_order_find_Gx0_via_v1_mod3
 #####################################################################################
@@ -94,6 +94,7 @@ def test_order(verbose = 0):
             print("computed order =",order)
             err = "Error in computation order of group element"
             raise ValueError(err)
+        assert g.copy().order(mode = 1) == order
         ho, g2 = g.copy().half_order()
         assert ho == order
         if order & 1:
@@ -105,6 +106,86 @@ def test_order(verbose = 0):
    
 
 
+@pytest.mark.orders
+def test_order_bsgs(ntests = 20, verbose = 0):
+    from mmgroup import MM
+    for n in range(ntests):
+        g = MM('r', 'M')
+        order = g.order()
+        if verbose:
+            print("Test", n + 1, ", order =", order)
+        assert g.order(mode = 1) == order
+        for max_order in (1, 15, 16, 17, 40, 119):
+            o = g.order(max_order, mode = 1)
+            assert o == order or o == 0 and order > max_order
+    with pytest.raises(ValueError):
+        MM('r', 'M').order(mode = 2)
+
+   
+
+
+########################################################################
+# Test computation of orders and reduction in a pool of threads
+########################################################################
+
+
+@pytest.mark.orders
+def test_order_threaded(verbose = 0):
+    from mmgroup import MM
+    from mmgroup.structures.mm_order import check_mm_order_threaded
+    from mmgroup.structures.mm_order import reduce_mm_threaded
+    testcases = list(order_testcases(MM0))
+    glist = [MM('a', g.mmdata) for g, _ in testcases]
+    for g in glist:
+        g.reduced = False
+    reduce_mm_threaded(glist, nthreads = 3)
+    for g, (g_ref, _) in zip(glist, testcases):
+        assert g.reduced 
+        assert MM0(g) == g_ref
+    orders = check_mm_order_threaded(glist, nthreads = 3)
+    assert orders == [o for _, o in testcases]
+    assert check_mm_order_threaded([]) == []
+
+
+@pytest.mark.orders
+def test_order_many(verbose = 0):
+    from mmgroup import MM
+    from mmgroup.structures.mm_order import check_mm_order_many
+    testcases = list(order_testcases(MM0))
+    ref_orders = [o for _, o in testcases]
+    for mode, nthreads in [(0, 1), (1, 1), (1, 3)]:
+        glist = [MM('a', g.mmdata) for g, _ in testcases]
+        orders = check_mm_order_many(glist, mode = mode, 
+            nthreads = nthreads)
+        assert orders == ref_orders
+    glist = [g.copy() for g, _ in testcases]
+    orders = check_mm_order_many(glist, max_order = 5)
+    for o, ref_o in zip(orders, ref_orders):
+        assert o == ref_o or o == 0 and ref_o > 5
+    assert check_mm_order_many([]) == []
+
+
+########################################################################
+# Test computations with an explicit workspace
+########################################################################
+
+
+@pytest.mark.orders
+def test_order_workspace(verbose = 0):
+    from mmgroup import MM, Workspace
+    from mmgroup.structures.mm_workspace import current_workspace
+    default_ws = current_workspace()
+    ws = Workspace()
+    with ws:
+        assert current_workspace() is ws
+        for g, ref_order in order_testcases(MM0):
+            assert g.order() == ref_order
+            g1 = MM('a', g.mmdata)
+            assert g1.order() == ref_order
+            assert g1 == g1 * MM('t', 3)
+    assert current_workspace() is default_ws
+
+
 ########################################################################
 # Test computation of equality of group elements
 ########################################################################
@@ -188,3 +269,46 @@ def test_equality(verbose = 0):
 
 
 
+
+
+
+@pytest.mark.orders
+def test_hash(verbose = 0):
+    from mmgroup import MM
+    for group in (MM0, MM):
+        for n, (g1, g2, ref_equal) in enumerate(equality_testcases(group)):
+            if ref_equal:
+                assert hash(g1) == hash(g2)
+            assert len(set([g1, g2, g1.copy()])) == 2 - ref_equal
+    g_list = [MM('r', 'M') for i in range(5)]
+    d = {g: i for i, g in enumerate(g_list)}
+    for i, g in enumerate(g_list):
+        h = MM('r', 'M')
+        assert d[(g * h) * h**-1] == i
+        assert hash(MM0('a', g.mmdata)) == hash((MM0('a', g.mmdata) * 
+            MM0(h)) * MM0(h)**-1)
+
+
+
+########################################################################
+# Test read-only views of the precomputed vectors
+########################################################################
+
+
+@pytest.mark.orders
+def test_order_vector_view():
+    from mmgroup.mm import mm_aux_mmv_size
+    from mmgroup.mm_reduce import mm_order_vector_view
+    from mmgroup.mm_reduce import mm_order_vector_v1_mod3_view
+    from mmgroup.mm_reduce import mm_order_load_vector_v1_mod3
+    ov = mm_order.get_order_vector()
+    a = mm_order_vector_view()
+    assert len(a) == mm_aux_mmv_size(15)
+    assert (a == ov.data[:len(a)]).all()
+    assert not a.flags.writeable
+    v1 = MMV(3)()
+    mm_order_load_vector_v1_mod3(v1.data)
+    b = mm_order_vector_v1_mod3_view()
+    assert len(b) == mm_aux_mmv_size(3)
+    assert (b == v1.data[:len(b)]).all()
+    assert not b.flags.writeable